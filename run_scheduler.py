@@ -25,6 +25,7 @@ Usage:
     python run_scheduler.py --weekly-report  # 주간 종합 리포트 즉시 발송
     python run_scheduler.py --waste-report   # 폐기 보고서 즉시 생성
     python run_scheduler.py --batch-expire   # 배치 만료 처리 즉시 실행
+    python run_scheduler.py --prediction-daemon  # 상주 예측 데몬 실행 (warm 캐시)
     python run_scheduler.py --collect-order-unit  # 전체 품목 발주단위 수집 즉시 실행
     python run_scheduler.py --fetch-detail       # 상품 상세 정보 일괄 수집 즉시 실행
     python run_scheduler.py --pending-sync         # 발주 pending 동기화 즉시 실행
@@ -214,6 +215,17 @@ def release_lock() -> None:
         print(f"[WARN] 락 파일 삭제 실패: {e}")
 
 
+def wait_sales_validations() -> None:
+    """종료 시 남은 판매 저장 후 검증 대기 (validation-batch, 상한 있음)"""
+    try:
+        from src.infrastructure.database.repos.sales_repo import wait_for_pending_validations
+        from src.settings.constants import SALES_VALIDATION_WAIT_TIMEOUT_SEC
+        if not wait_for_pending_validations(timeout=SALES_VALIDATION_WAIT_TIMEOUT_SEC):
+            logger.warning("[Scheduler] 저장 후 검증 대기 시간 초과 — 종료 진행")
+    except Exception as e:
+        logger.warning(f"[Scheduler] 저장 후 검증 대기 실패: {e}")
+
+
 # ── 멀티 매장 모드 설정 ──
 
 # 멀티 매장 모드 플래그 (기본: True — 두 점포 병렬 실행)
@@ -225,14 +237,40 @@ _DEFAULT_STORE = {"store_id": "46513", "store_name": "기본매장"}
 
 # MultiStoreRunner 인스턴스
 # stagger_seconds=5: 매장 간 5초 시차로 ChromeDriver 파일 잠금 충돌 방지
-_runner = MultiStoreRunner(max_workers=4, stagger_seconds=5)
+# prediction_processes: 발주 예측 단계만 프로세스 풀에서 실행 (GIL 회피)
+from src.settings.constants import PREDICTION_PROCESS_WORKERS
+_runner = MultiStoreRunner(
+    max_workers=4,
+    stagger_seconds=5,
+    prediction_processes=PREDICTION_PROCESS_WORKERS,
+)
 
 
 # ── 헬퍼 함수 ──
 
+def _with_dashboard_refresh(
+    task_fn: Callable[[Any], Dict[str, Any]],
+) -> Callable[[Any], Dict[str, Any]]:
+    """매장 작업 종료 후 홈 대시보드 스냅샷 갱신 (dashboard-snapshot)
+
+    작업 성공/실패와 무관하게 갱신하며, 갱신 실패는 작업 결과에 영향 없음.
+    """
+    def wrapped(ctx):
+        try:
+            return task_fn(ctx)
+        finally:
+            from src.application.services.dashboard_snapshot_service import (
+                refresh_dashboard_snapshot,
+            )
+            refresh_dashboard_snapshot(ctx.store_id)
+
+    return wrapped
+
+
 def _run_task(
     task_fn: Callable[[Any], Dict[str, Any]],
     task_name: str,
+    refresh_dashboard: bool = False,
 ) -> None:
     """멀티/단일 매장 모드에 따라 실행
 
@@ -245,6 +283,7 @@ def _run_task(
     Args:
         task_fn: StoreContext를 받는 작업 함수
         task_name: 작업 이름 (로깅용)
+        refresh_dashboard: 매장별 작업 후 홈 대시보드 스냅샷 갱신 (수집/발주/폐기 잡)
     """
     # Tracker 래핑 (피처 플래그 체크는 wrap_multistore_task 내부에서)
     try:
@@ -263,6 +302,9 @@ def _run_task(
     except Exception as e:
         logger.warning(f"[{task_name}] JobRunTracker 래핑 실패 (원본 실행): {e}")
 
+    if refresh_dashboard:
+        task_fn = _with_dashboard_refresh(task_fn)
+
     if _MULTI_STORE:
         _runner.run_parallel(task_fn=task_fn, task_name=task_name)
     else:
@@ -355,8 +397,9 @@ def job_wrapper_multi_store() -> None:
                 raise
 
         _runner.run_parallel(
-            task_fn=_run_daily_order,
+            task_fn=_with_dashboard_refresh(_run_daily_order),
             task_name="daily_order",
+            use_prediction_pool=True,
         )
 
         # ── 재시도 스케줄 등록 ──
@@ -426,6 +469,9 @@ def job_wrapper() -> None:
     job = DailyCollectionJob(store_id=_DEFAULT_STORE["store_id"])
     result = job.run_optimized(run_auto_order=True, use_improved_predictor=True)
 
+    from src.application.services.dashboard_snapshot_service import refresh_dashboard_snapshot
+    refresh_dashboard_snapshot(_DEFAULT_STORE["store_id"])
+
     if result.get("success"):
         logger.info("Job completed successfully")
         logger.info(f"  - Items collected: {result.get('total_items', 0)}")
@@ -527,13 +573,22 @@ def batch_expire_wrapper() -> None:
 
         batch_repo = InventoryBatchRepository()
         expired = batch_repo.check_and_expire_batches(store_id=ctx.store_id)
-        logger.info(f"[{ctx.store_id}] Expired batches (fallback): {len(expired)}")
+        consumed_count = sum(1 for b in expired if b.get('status') == 'consumed')
+        logger.info(f"[{ctx.store_id}] Expired batches (fallback): {len(expired)} "
+                    f"(폐기 {len(expired) - consumed_count}, 소비완료 {consumed_count})")
         for item in expired:
+            if item.get('status') == 'consumed':
+                continue
             logger.info(f"  - {item.get('item_cd', '')} {item.get('item_nm', '')}: "
                         f"잔여 {item.get('remaining_qty', 0)}개 폐기")
-        return {"success": True, "expired_count": len(expired)}
+        return {
+            "success": True,
+            "expired_count": len(expired),
+            "waste_count": len(expired) - consumed_count,
+            "consumed_count": consumed_count,
+        }
 
-    _run_task(expire_task, "BatchExpire")
+    _run_task(expire_task, "BatchExpire", refresh_dashboard=True)
 
 
 # ── 정밀 폐기 3단계 (10분전 수집 → 판정 → 10분후 수집+확정) ──
@@ -628,7 +683,10 @@ def expiry_pre_collect_wrapper(expiry_hour: int) -> Callable[[], None]:
 
             return {"success": True}
 
-        _run_task(collect_and_alert_task, f"ExpiryPreCollect+Alert({expiry_hour:02d}:00)")
+        _run_task(
+            collect_and_alert_task, f"ExpiryPreCollect+Alert({expiry_hour:02d}:00)",
+            refresh_dashboard=True,
+        )
 
     return wrapper
 
@@ -742,7 +800,10 @@ def expiry_confirm_wrapper(expiry_hour: int) -> Callable[[], None]:
 
             return {"success": True, "disposed": len(disposed), "not_disposed": len(not_disposed)}
 
-        _run_task(confirm_task, f"ExpiryConfirm+WasteSlip({expiry_hour:02d}:00)")
+        _run_task(
+            confirm_task, f"ExpiryConfirm+WasteSlip({expiry_hour:02d}:00)",
+            refresh_dashboard=True,
+        )
 
     return wrapper
 
@@ -899,7 +960,7 @@ def receiving_collect_wrapper(delivery_type: str) -> Callable[[], None]:
                 logger.error(f"[{ctx.store_id}] Receiving collect error: {e}")
                 return {"success": False, "error": str(e)}
 
-        _run_task(collect_task, f"ReceivingCollect({delivery_type})")
+        _run_task(collect_task, f"ReceivingCollect({delivery_type})", refresh_dashboard=True)
 
     return wrapper
 
@@ -943,7 +1004,7 @@ def delivery_confirm_wrapper(delivery_type: str) -> Callable[[], None]:
 
             return {"success": True}
 
-        _run_task(confirm_task, f"DeliveryConfirm({delivery_type})")
+        _run_task(confirm_task, f"DeliveryConfirm({delivery_type})", refresh_dashboard=True)
 
     return wrapper
 
@@ -988,7 +1049,7 @@ def waste_report_wrapper() -> None:
         # [M-3] 폐기 보고서 생성
         return WasteReportFlow(store_ctx=ctx).run()
 
-    _run_task(waste_task, "WasteReport")
+    _run_task(waste_task, "WasteReport", refresh_dashboard=True)
 
 
 def pre_alert_collection_wrapper(expiry_hour: int) -> Callable[[], None]:
@@ -1069,7 +1130,7 @@ def pre_alert_collection_wrapper(expiry_hour: int) -> Callable[[], None]:
 
             return {"success": True}
 
-        _run_task(pre_alert_task, f"Pre-alert({expiry_hour:02d}:00)")
+        _run_task(pre_alert_task, f"Pre-alert({expiry_hour:02d}:00)", refresh_dashboard=True)
 
     return wrapper
 
@@ -2060,8 +2121,9 @@ def run_scheduler(schedule_time: str = "07:00", multi_store: bool = True) -> Non
     if not acquire_lock():
         sys.exit(1)
 
-    # 프로그램 종료 시 락 파일 삭제
+    # 프로그램 종료 시 락 파일 삭제 (atexit 는 역순 실행 → 검증 대기 후 락 해제)
     atexit.register(release_lock)
+    atexit.register(wait_sales_validations)
 
     logger.info("=" * 60)
     logger.info("BGF Auto Sales Collector - Scheduler")
@@ -2386,6 +2448,11 @@ if __name__ == "__main__":
         action="store_true",
         help="Run batch expiry check immediately"
     )
+    parser.add_argument(
+        "--prediction-daemon",
+        action="store_true",
+        help="Run the persistent warm prediction daemon (local HTTP)"
+    )
     parser.add_argument(
         "--token-refresh",
         action="store_true",
@@ -2664,6 +2731,10 @@ if __name__ == "__main__":
         elif args.batch_expire:
             init_db()
             batch_expire_wrapper()
+        elif args.prediction_daemon:
+            init_db()
+            from src.application.scheduler.prediction_daemon import run_prediction_daemon
+            run_prediction_daemon([args.store] if args.store else None)
         elif args.expiry is not None:
             init_db()
             run_expiry_alert_now(args.expiry)
@@ -0,0 +1,74 @@
+"""
+raw SSV 보관소 정리 스크립트 (raw-ssv-archive)
+
+raw_hourly_sales_detail 의 기존 평문 응답(ssv_response)을 압축/중복제거 보관소
+(raw_ssv_blobs)로 이전하고 미참조 blob을 삭제합니다.
+
+사용:
+    # 전체 활성 매장
+    python scripts/compact_raw_ssv.py
+
+    # 특정 매장, 백필 데이터는 LZMA로 압축 후 VACUUM
+    python scripts/compact_raw_ssv.py --store 46513 --codec xz --vacuum
+"""
+
+import argparse
+import sys
+import os
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def main():
+    from src.infrastructure.database.raw_ssv_archive import CODEC_LZMA, CODEC_ZLIB_DICT
+
+    parser = argparse.ArgumentParser(
+        description="raw SSV 응답 압축/중복제거 보관소 이전"
+    )
+    parser.add_argument(
+        "--store", type=str, default=None,
+        help="매장 코드 (기본: 전체 활성 매장)"
+    )
+    parser.add_argument(
+        "--codec", choices=[CODEC_ZLIB_DICT, CODEC_LZMA], default=CODEC_ZLIB_DICT,
+        help="압축 코덱 (zd1: zlib+SSV 사전, xz: LZMA)"
+    )
+    parser.add_argument(
+        "--vacuum", action="store_true",
+        help="이전 후 VACUUM 으로 DB 파일 축소"
+    )
+    args = parser.parse_args()
+
+    from src.config.store_manager import get_active_store_ids
+    from src.infrastructure.database.repos.hourly_sales_detail_repo import (
+        HourlySalesDetailRepository,
+    )
+
+    store_ids = [args.store] if args.store else get_active_store_ids()
+    for store_id in store_ids:
+        repo = HourlySalesDetailRepository(store_id=store_id)
+        result = repo.compact_raw(codec=args.codec)
+        ratio = (
+            result["stored_bytes"] / result["raw_bytes"] * 100
+            if result["raw_bytes"] else 0.0
+        )
+        print(
+            f"[{store_id}] 이전 {result['migrated']}행, blob {result['blobs']}개 "
+            f"({result['raw_bytes']:,}B -> {result['stored_bytes']:,}B, {ratio:.1f}%), "
+            f"정리 {result['pruned']}개"
+        )
+        if args.vacuum:
+            conn = repo._get_conn()
+            try:
+                conn.execute("VACUUM")
+            finally:
+                conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+item_sales_stats 집계 테이블 재구축/검증 스크립트 (item-sales-stats)
+
+사용:
+    # 전체 활성 매장 재구축 (테이블 도입 직후 1회)
+    python scripts/item_sales_stats.py rebuild
+
+    # 특정 매장 검증 (daily_sales 재계산 결과와 비교, 불일치 시 exit 1)
+    python scripts/item_sales_stats.py verify --store 46513
+
+    # 검증 후 불일치가 있으면 재구축
+    python scripts/item_sales_stats.py verify --store 46513 --fix
+"""
+
+import argparse
+import sys
+import os
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="item_sales_stats 집계 테이블 재구축/검증"
+    )
+    parser.add_argument("command", choices=["rebuild", "verify"])
+    parser.add_argument(
+        "--store", type=str, default=None,
+        help="매장 코드 (기본: 전체 활성 매장)"
+    )
+    parser.add_argument(
+        "--fix", action="store_true",
+        help="verify: 불일치 매장 재구축"
+    )
+    parser.add_argument(
+        "--show", type=int, default=10,
+        help="verify: 매장별 출력할 불일치 건수"
+    )
+    args = parser.parse_args()
+
+    from src.config.store_manager import get_active_store_ids
+    from src.infrastructure.database.repos import ItemSalesStatsRepository
+
+    store_ids = [args.store] if args.store else get_active_store_ids()
+    failed = False
+    for store_id in store_ids:
+        repo = ItemSalesStatsRepository(store_id=store_id)
+        if args.command == "rebuild":
+            count = repo.rebuild(store_id)
+            print(f"[{store_id}] 재구축: {count}개 상품")
+            continue
+
+        mismatches = repo.verify(store_id)
+        if not mismatches:
+            print(f"[{store_id}] 일치")
+            continue
+        items = {m["item_cd"] for m in mismatches}
+        print(f"[{store_id}] 불일치: {len(items)}개 상품, {len(mismatches)}건")
+        for m in mismatches[:args.show]:
+            print(f"  {m['item_cd']} {m['field']}: stored={m['stored'][:60]} expected={m['expected'][:60]}")
+        if args.fix:
+            count = repo.rebuild(store_id)
+            print(f"[{store_id}] 재구축: {count}개 상품")
+        else:
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
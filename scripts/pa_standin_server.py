@@ -0,0 +1,250 @@
+"""PythonAnywhere Files/Webapps API 대역 서버 (cloud-delta-sync).
+
+CloudSyncer 가 쓰는 API 만 로컬 디렉토리 기준으로 흉내 냅니다.
+오프라인 테스트와 전체/델타 동기화 전송량 비교용입니다.
+
+- GET/POST/DELETE  /api/v0/user/<username>/files/path<remote_base>/<경로>
+  → root/<경로> 파일 조회/저장(multipart "content")/삭제
+- POST /api/v0/user/<username>/webapps/<domain>/reload/
+  → 실제 웹앱 기동처럼 root 기준 apply_pending_deltas() 실행
+- GET /api/sync/db-state?db=<경로>  (웹앱 API, X-Sync-Token 검사)
+  → root 기준 db_state()
+- Authorization: Token <api_token> 검사, 수신 바이트/요청 수 기록
+
+사용법:
+    with PythonAnywhereStandInServer(tmp_path / "remote", remote_base="/home/u/app") as server:
+        config["api_base"] = server.api_base
+        config["webapp_base"] = server.webapp_base
+        CloudSyncer(config_path).sync_all()
+
+    python scripts/pa_standin_server.py --root /tmp/remote --port 8766
+"""
+
+import argparse
+import json
+import sys
+import threading
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.infrastructure.database.page_delta import (  # noqa: E402
+    PageDeltaError,
+    apply_pending_deltas,
+    db_state,
+)
+from src.utils.logger import get_logger  # noqa: E402
+
+logger = get_logger(__name__)
+
+
+def parse_multipart_content(content_type: str, body: bytes) -> Optional[bytes]:
+    """multipart/form-data 의 "content" 필드 데이터"""
+    message = BytesParser(policy=default_policy).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("latin-1") + body
+    )
+    for part in message.iter_parts():
+        if part.get_param("name", header="content-disposition") == "content":
+            return part.get_payload(decode=True)
+    return None
+
+
+class PythonAnywhereStandInServer:
+    """PythonAnywhere API 대역 서버 (백그라운드 스레드)"""
+
+    def __init__(
+        self,
+        root: Path,
+        remote_base: str = "/home/testuser/myapp",
+        username: str = "testuser",
+        api_token: str = "test-token-12345",
+        sync_token: str = "test-sync-token",
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            root: 원격 remote_base 에 해당하는 로컬 디렉토리
+            remote_base: 설정의 remote_base
+            username, api_token: 허용할 계정/토큰
+            sync_token: 웹앱 /api/sync/db-state 토큰 (CLOUD_SYNC_TOKEN)
+            host, port: 바인드 주소 (port 0 이면 임의 포트)
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.remote_base = remote_base.rstrip("/")
+        self.username = username
+        self.api_token = api_token
+        self.sync_token = sync_token
+        self.bytes_received = 0
+        self.requests: List[str] = []
+        self.reloads: List[Dict[str, List[str]]] = []
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def api_base(self) -> str:
+        """설정 "api_base" 값 (PA_API_BASE 대체)"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api/v0/user"
+
+    @property
+    def webapp_base(self) -> str:
+        """설정 "webapp_base" 값 (https://<domain> 대체)"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "PythonAnywhereStandInServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="pa-standin", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "PythonAnywhereStandInServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _local_path(self, url_path: str) -> Optional[Path]:
+        """files/path URL → root 하위 로컬 경로 (범위 밖이면 None)"""
+        prefix = f"/api/v0/user/{self.username}/files/path{self.remote_base}/"
+        if not url_path.startswith(prefix):
+            return None
+        path = (self.root / unquote(url_path[len(prefix):])).resolve()
+        return path if self.root.resolve() in path.parents else None
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _authorized(self) -> bool:
+                with server._lock:
+                    server.requests.append(f"{self.command} {self.path}")
+                if self.headers.get("Authorization") == f"Token {server.api_token}":
+                    return True
+                self._send(401, b"Unauthorized")
+                return False
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                if url.path == "/api/sync/db-state":
+                    self._db_state(parse_qs(url.query).get("db", [""])[0])
+                    return
+                if not self._authorized():
+                    return
+                path = server._local_path(urlsplit(self.path).path)
+                if path is None or not path.is_file():
+                    self._send(404, b"Not Found")
+                else:
+                    self._send(200, path.read_bytes())
+
+            def do_DELETE(self):
+                if not self._authorized():
+                    return
+                path = server._local_path(urlsplit(self.path).path)
+                if path is None or not path.exists():
+                    self._send(404, b"Not Found")
+                else:
+                    path.unlink()
+                    self._send(204, b"")
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                with server._lock:
+                    server.bytes_received += length
+                if not self._authorized():
+                    return
+                url_path = urlsplit(self.path).path
+                if url_path.startswith(f"/api/v0/user/{server.username}/webapps/") \
+                        and url_path.endswith("/reload/"):
+                    # 웹앱 기동 시 create_app() 이 하는 델타 적용
+                    summary = apply_pending_deltas(server.root)
+                    with server._lock:
+                        server.reloads.append(summary)
+                    self._send(200, b'{"status": "OK"}')
+                    return
+
+                path = server._local_path(url_path)
+                content = parse_multipart_content(self.headers.get("Content-Type", ""), body)
+                if path is None or content is None:
+                    self._send(400, b"Bad Request")
+                    return
+                existed = path.exists()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(content)
+                self._send(200 if existed else 201, b"{}")
+
+            def _db_state(self, db_rel: str):
+                """웹앱 src/web/routes/api_sync.py 대역"""
+                with server._lock:
+                    server.requests.append(f"GET db-state {db_rel}")
+                if self.headers.get("X-Sync-Token") != server.sync_token:
+                    self._send(401, b"Unauthorized")
+                    return
+                try:
+                    state = db_state(server.root, db_rel)
+                except PageDeltaError as e:
+                    self._send(400, str(e).encode("utf-8"))
+                    return
+                self._send(200, json.dumps(state).encode("utf-8"))
+
+            def _send(self, status: int, payload: bytes):
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                if payload:
+                    self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                logger.debug(f"[PAStandIn] {self.address_string()} {format % args}")
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PythonAnywhere API 대역 서버")
+    parser.add_argument("--root", required=True, help="remote_base 에 해당하는 로컬 디렉토리")
+    parser.add_argument("--remote-base", default="/home/testuser/myapp")
+    parser.add_argument("--username", default="testuser")
+    parser.add_argument("--token", default="test-token-12345")
+    parser.add_argument("--sync-token", default="test-sync-token")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    server = PythonAnywhereStandInServer(
+        Path(args.root), args.remote_base, args.username, args.token, args.sync_token,
+        args.host, args.port,
+    )
+    print(f"PythonAnywhere stand-in: api_base={server.api_base} "
+          f"webapp_base={server.webapp_base} root={server.root}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
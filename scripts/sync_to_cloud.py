@@ -13,6 +13,16 @@
     from scripts.sync_to_cloud import CloudSyncer
     syncer = CloudSyncer()
     result = syncer.sync_all()
+
+동기화 모드 (config "sync_mode", cloud-delta-sync):
+    "full"  (기본) DB 파일 전체 업로드
+    "delta" 직전 동기화 매니페스트 대비 바뀐 SQLite 페이지만 data/sync_deltas/ 로 업로드.
+            원격 웹앱이 리로드 시 적용 (src/infrastructure/database/page_delta.py).
+            매니페스트 없음/페이지 크기 변경/원격 재동기화 요청 시 전체 업로드.
+            업로드 전 웹앱 /api/sync/db-state 로 원격 DB 해시를 확인해
+            직전 매니페스트와 다르면(웹앱 쓰기 등) 같은 실행에서 전체 업로드.
+            config "sync_token" = 웹앱 환경변수 CLOUD_SYNC_TOKEN 값
+            (없거나 확인 실패 시 항상 전체 업로드), "webapp_base" 기본 https://<domain>
 """
 
 import hashlib
@@ -22,7 +32,7 @@ import sys
 import time
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 
 # 프로젝트 루트 설정
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -36,6 +46,9 @@ PA_API_BASE = "https://www.pythonanywhere.com/api/v0/user"
 # 설정 파일 경로
 CONFIG_PATH = PROJECT_ROOT / "config" / "pythonanywhere.json"
 
+# 델타 동기화 매니페스트 디렉토리 (PROJECT_ROOT 상대, 원격에 마지막으로 반영된 페이지 해시)
+MANIFEST_DIR = "data/cloud_sync"
+
 # 재시도 설정
 MAX_RETRIES = 3
 RETRY_DELAYS = [10, 30, 60]  # 초 단위
@@ -108,7 +121,24 @@ class CloudSyncer:
     def _api_url(self, endpoint: str) -> str:
         """PythonAnywhere API URL 생성."""
         username = self.config["username"]
-        return f"{PA_API_BASE}/{username}/{endpoint}"
+        api_base = self.config.get("api_base", PA_API_BASE)
+        return f"{api_base}/{username}/{endpoint}"
+
+    def _remote_file_url(self, remote_path: str) -> str:
+        return self._api_url(f"files/path{self.config['remote_base']}/{remote_path}")
+
+    def remote_file_exists(self, remote_path: str) -> bool:
+        """원격 파일 존재 여부 (조회 실패 시 False).
+
+        Args:
+            remote_path: 원격 파일 경로 (remote_base 상대 경로)
+        """
+        try:
+            response = self._get_session().get(self._remote_file_url(remote_path), timeout=30)
+            return response.status_code == 200
+        except Exception as e:
+            logger.warning(f"[CloudSync] 원격 파일 조회 오류: {remote_path} - {e}")
+            return False
 
     def delete_remote_file(self, remote_path: str) -> bool:
         """원격 파일 삭제 (공간 확보용).
@@ -119,8 +149,7 @@ class CloudSyncer:
         Returns:
             삭제 성공 여부
         """
-        remote_full = f"{self.config['remote_base']}/{remote_path}"
-        api_url = self._api_url(f"files/path{remote_full}")
+        api_url = self._remote_file_url(remote_path)
 
         try:
             response = self._get_session().delete(api_url, timeout=30)
@@ -173,8 +202,6 @@ class CloudSyncer:
                 "error": f"파일 없음: {local_full}",
             }
 
-        remote_full = f"{self.config['remote_base']}/{remote_path}"
-        api_url = self._api_url(f"files/path{remote_full}")
         file_size_kb = local_full.stat().st_size // 1024
 
         # SHA256 무결성 해시 계산
@@ -188,31 +215,56 @@ class CloudSyncer:
             f"[SHA256: {file_hash[:16]}...]"
         )
 
+        def _post():
+            with open(local_full, "rb") as f:
+                return self._get_session().post(
+                    self._remote_file_url(remote_path),
+                    files={"content": f},
+                    timeout=UPLOAD_TIMEOUT,
+                )
+
+        result = self._post_with_retry(remote_path, _post)
+        if result["success"]:
+            logger.info(
+                f"[CloudSync] 완료: {remote_path} "
+                f"({file_size_kb:,}KB, {result['elapsed']:.1f}초, "
+                f"SHA256: {file_hash[:16]}...)"
+            )
+            result.update(size_kb=file_size_kb, sha256=file_hash)
+        return result
+
+    def upload_bytes(self, content: bytes, remote_path: str) -> Dict[str, Any]:
+        """메모리 데이터 업로드 (델타 파일용).
+
+        Returns:
+            {"success": True/False, "file": remote_path, "size_kb": int, "elapsed": float}
+        """
+        def _post():
+            return self._get_session().post(
+                self._remote_file_url(remote_path),
+                files={"content": (Path(remote_path).name, content)},
+                timeout=UPLOAD_TIMEOUT,
+            )
+
+        result = self._post_with_retry(remote_path, _post)
+        if result["success"]:
+            result["size_kb"] = len(content) // 1024
+        return result
+
+    def _post_with_retry(self, remote_path: str, post: Callable) -> Dict[str, Any]:
+        """업로드 요청 재시도 (MAX_RETRIES, RETRY_DELAYS)."""
         last_error = None
         for attempt in range(MAX_RETRIES):
             try:
                 start_time = time.time()
-                with open(local_full, "rb") as f:
-                    response = self._get_session().post(
-                        api_url,
-                        files={"content": f},
-                        timeout=UPLOAD_TIMEOUT,
-                    )
-
+                response = post()
                 elapsed = time.time() - start_time
 
                 if response.status_code in (200, 201):
-                    logger.info(
-                        f"[CloudSync] 완료: {remote_path} "
-                        f"({file_size_kb:,}KB, {elapsed:.1f}초, "
-                        f"SHA256: {file_hash[:16]}...)"
-                    )
                     return {
                         "success": True,
                         "file": remote_path,
-                        "size_kb": file_size_kb,
                         "elapsed": round(elapsed, 1),
-                        "sha256": file_hash,
                     }
                 else:
                     last_error = f"HTTP {response.status_code}: {response.text[:200]}"
@@ -240,6 +292,146 @@ class CloudSyncer:
             "error": last_error,
         }
 
+    # ── 델타 동기화 (cloud-delta-sync) ───────────────────────────────
+
+    def _manifest_path(self, remote_path: str) -> Path:
+        from src.infrastructure.database.page_delta import delta_key
+        return PROJECT_ROOT / MANIFEST_DIR / f"{delta_key(remote_path)}.json"
+
+    def _load_manifest(self, remote_path: str) -> Optional[Dict]:
+        path = self._manifest_path(remote_path)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"[CloudSync] 매니페스트 손상, 전체 업로드: {path.name} - {e}")
+            return None
+
+    def remote_db_sha256(self, remote_path: str) -> Optional[str]:
+        """웹앱이 보고하는 원격 DB SHA256 (토큰 없음/조회 실패 시 None).
+
+        Args:
+            remote_path: 원격 DB 경로 (remote_base 상대 경로)
+        """
+        token = self.config.get("sync_token")
+        if not token:
+            return None
+        webapp_base = self.config.get("webapp_base") or f"https://{self.config['domain']}"
+        try:
+            # PythonAnywhere API 토큰은 웹앱으로 보내지 않음
+            response = self._get_session().get(
+                f"{webapp_base.rstrip('/')}/api/sync/db-state",
+                params={"db": remote_path},
+                headers={"Authorization": None, "X-Sync-Token": token},
+                timeout=60,
+            )
+            if response.status_code != 200:
+                logger.warning(
+                    f"[CloudSync] 원격 DB 상태 조회 실패: {remote_path} "
+                    f"(HTTP {response.status_code})"
+                )
+                return None
+            return response.json().get("sha256")
+        except Exception as e:
+            logger.warning(f"[CloudSync] 원격 DB 상태 조회 오류: {remote_path} - {e}")
+            return None
+
+    def _save_manifest(self, remote_path: str, manifest: Dict) -> None:
+        path = self._manifest_path(remote_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def sync_file_delta(self, local_path: str, remote_path: str) -> Dict[str, Any]:
+        """DB 1개 델타 동기화.
+
+        스냅샷의 페이지 해시를 직전 매니페스트와 비교해 바뀐 페이지만
+        data/sync_deltas/ 로 업로드한다. 원격이 재동기화를 요청했거나,
+        보낼 변경이 있는데 원격 DB 해시가 매니페스트와 다르거나(확인 불가 포함),
+        비교 기준이 없으면 스냅샷 전체를 업로드한다.
+
+        Args:
+            local_path: 로컬 DB 경로 (프로젝트 루트 상대 경로)
+            remote_path: 원격 DB 경로 (remote_base 상대 경로)
+
+        Returns:
+            {"success", "file", "mode": "full"|"delta"|"unchanged",
+             "size_kb", "elapsed", "pages"(delta)}
+        """
+        from src.infrastructure.database import page_delta
+
+        local_full = PROJECT_ROOT / local_path
+        if not local_full.exists():
+            return {
+                "success": False,
+                "file": remote_path,
+                "error": f"파일 없음: {local_full}",
+            }
+
+        key = page_delta.delta_key(remote_path)
+        marker = f"{page_delta.DELTA_DIR}/{key}{page_delta.RESYNC_SUFFIX}"
+        snapshot = PROJECT_ROOT / MANIFEST_DIR / f"{key}.snapshot"
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            page_delta.snapshot_db(local_full, snapshot)
+            base = self._load_manifest(remote_path)
+            seq = (base or {}).get("seq", 0) + 1
+
+            delta = None
+            if base is not None and self.remote_file_exists(marker):
+                logger.info(f"[CloudSync] 원격 재동기화 요청: {remote_path} → 전체 업로드")
+                base = None
+            if base is not None:
+                try:
+                    delta, manifest = page_delta.build_delta(snapshot, base, remote_path)
+                except page_delta.PageDeltaError as e:
+                    logger.info(f"[CloudSync] {remote_path} 델타 불가 ({e}) → 전체 업로드")
+                    base = None
+                else:
+                    if delta is None:
+                        return {"success": True, "file": remote_path, "mode": "unchanged"}
+                    # 웹앱 쓰기 등으로 원격이 기준과 달라졌으면 델타 대신 전체 업로드
+                    remote_sha = self.remote_db_sha256(remote_path)
+                    if remote_sha != base.get("sha256"):
+                        logger.info(
+                            f"[CloudSync] 원격 DB 기준 불일치 "
+                            f"({(remote_sha or '확인 불가')[:12]}): {remote_path} → 전체 업로드"
+                        )
+                        base = None
+
+            if base is None:
+                manifest = page_delta.build_manifest(snapshot)
+                result = self.upload_file(str(snapshot.relative_to(PROJECT_ROOT)), remote_path)
+                result["file"] = remote_path
+                result["mode"] = "full"
+                if result["success"]:
+                    self.delete_remote_file(marker)
+            else:
+                delta_remote = f"{page_delta.DELTA_DIR}/{seq:08d}_{key}{page_delta.DELTA_SUFFIX}"
+                result = self.upload_bytes(delta, delta_remote)
+                result["file"] = remote_path
+                result["mode"] = "delta"
+                result["pages"] = len(manifest["hashes"]) - sum(
+                    1 for a, b in zip(manifest["hashes"], base["hashes"]) if a == b
+                )
+                logger.info(
+                    f"[CloudSync] 델타: {remote_path} {result['pages']}페이지 "
+                    f"({len(delta) // 1024:,}KB / 전체 {manifest['size'] // 1024:,}KB)"
+                )
+
+            if result["success"]:
+                manifest["seq"] = seq
+                self._save_manifest(remote_path, manifest)
+            return result
+        except Exception as e:
+            logger.warning(f"[CloudSync] 델타 동기화 실패: {remote_path} - {e}")
+            return {"success": False, "file": remote_path, "error": str(e)}
+        finally:
+            if snapshot.exists():
+                snapshot.unlink()
+
     def reload_webapp(self) -> Dict[str, Any]:
         """웹앱 리로드.
 
@@ -272,6 +464,7 @@ class CloudSyncer:
                 "success": True/False,
                 "uploaded": [{"file": ..., "size_kb": ..., "elapsed": ...}],
                 "failed": [{"file": ..., "error": ...}],
+                "unchanged": [{"file": ...}],  # delta 모드에서 변경 없는 DB
                 "reload": {"success": True/False},
                 "total_elapsed": float
             }
@@ -286,6 +479,8 @@ class CloudSyncer:
         start_time = time.time()
         uploaded = []
         failed = []
+        unchanged = []
+        delta_mode = self.config.get("sync_mode", "full") == "delta"
 
         # 동기화 대상 파일 목록
         sync_files = self.config.get("sync_files", [
@@ -293,15 +488,23 @@ class CloudSyncer:
             {"local": "data/stores/46513.db", "remote": "data/stores/46513.db"},
         ])
 
-        logger.info(f"[CloudSync] 동기화 시작: {len(sync_files)}개 파일")
+        logger.info(
+            f"[CloudSync] 동기화 시작: {len(sync_files)}개 파일 "
+            f"(mode={'delta' if delta_mode else 'full'})"
+        )
 
         # 파일 업로드
         for file_info in sync_files:
-            result = self.upload_file(file_info["local"], file_info["remote"])
-            if result["success"]:
-                uploaded.append(result)
+            if delta_mode:
+                result = self.sync_file_delta(file_info["local"], file_info["remote"])
             else:
+                result = self.upload_file(file_info["local"], file_info["remote"])
+            if not result["success"]:
                 failed.append(result)
+            elif result.get("mode") == "unchanged":
+                unchanged.append(result)
+            else:
+                uploaded.append(result)
 
         # 업로드된 파일이 있으면 웹앱 리로드
         reload_result = {"success": False, "skipped": True}
@@ -316,6 +519,7 @@ class CloudSyncer:
         logger.info(
             f"[CloudSync] 완료: "
             f"{len(uploaded)}개 성공 ({total_kb:,}KB), "
+            f"{len(unchanged)}개 변경 없음, "
             f"{len(failed)}개 실패, "
             f"리로드={'OK' if reload_result.get('success') else 'FAIL'}, "
             f"총 {total_elapsed}초"
@@ -325,6 +529,7 @@ class CloudSyncer:
             "success": overall_success,
             "uploaded": uploaded,
             "failed": failed,
+            "unchanged": unchanged,
             "reload": reload_result,
             "total_elapsed": total_elapsed,
         }
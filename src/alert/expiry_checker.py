@@ -37,6 +37,11 @@ from src.alert.delivery_utils import (
     calculate_remaining_hours,
     format_time_remaining
 )
+from src.alert.expiry_resolver import (
+    ExpiryBatchResolver,
+    date_only_expiry_hour,
+    parse_expiry_datetime,
+)
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -115,6 +120,14 @@ class ExpiryChecker:
             all_item_cds = [row['item_cd'] for row in rows if row['item_cd']]
             delivery_type_map = get_delivery_types_batch(all_item_cds, conn)
 
+            # 실제 유통기한/일평균 판매량 일괄 조회 (expiry-batch-resolve)
+            resolver = ExpiryBatchResolver(conn, self.store_id)
+            expiry_map = resolver.expiry_times(
+                {row['item_cd']: (row['mid_cd'], row['item_nm']) for row in rows},
+                delivery_types=delivery_type_map,
+            )
+            avg_sales_map = resolver.avg_daily_sales(all_item_cds, days=7)
+
             items = []
             for row in rows:
                 item_cd = row['item_cd']
@@ -128,8 +141,8 @@ class ExpiryChecker:
                     last_char = item_nm.strip()[-1] if item_nm else ""
                     delivery_type = "2차" if last_char == "2" else "1차"
 
-                # 실제 입고 기반 유통기한 조회 (inventory_batches → order_tracking → receiving_history)
-                actual_expiry = self._get_actual_expiry_time(item_cd, mid_cd, item_nm=item_nm)
+                # 실제 입고 기반 유통기한 (inventory_batches)
+                actual_expiry = expiry_map.get(item_cd)
 
                 if actual_expiry:
                     # 실제 입고 데이터 있음 - 실제 유통기한 사용
@@ -142,7 +155,7 @@ class ExpiryChecker:
                     )
 
                 # 시간당 평균 판매량 계산 (일평균 / 24)
-                avg_daily_sales = self._get_avg_daily_sales(item_cd, days=7)
+                avg_daily_sales = avg_sales_map.get(item_cd, 0.0)
                 avg_hourly_sales = avg_daily_sales / 24 if avg_daily_sales > 0 else 0
 
                 # 예상 소진 시간 계산
@@ -176,96 +189,21 @@ class ExpiryChecker:
 
     def _get_actual_expiry_time(self, item_cd: str, mid_cd: str, item_nm: str = '') -> Optional[datetime]:
         """
-        실제 입고 기반 유통기한 조회 (4단계 폴백)
+        실제 입고 기반 유통기한 조회 (단건, ExpiryBatchResolver.expiry_times 위임)
 
-        0순위: inventory_batches.expiry_date (입고 기반, date-only도 허용)
-        1순위: order_tracking.expiry_time
-        2순위: receiving_history + FOOD_EXPIRY_CONFIG 기반 정밀 계산
-        3순위: delivery_utils 계산 (호출자에서 처리)
+        inventory_batches.expiry_date (입고 기반, date-only도 허용)가 single source of truth.
+        배치가 없으면 None → delivery_utils 계산 폴백은 호출자에서 처리.
 
         Returns:
             유통기한 datetime 또는 None
         """
-        # FOOD_EXPIRY_CONFIG import (receiving_collector와 동일 상수 공유)
-        try:
-            from src.collectors.receiving_collector import FOOD_EXPIRY_CONFIG
-        except ImportError:
-            FOOD_EXPIRY_CONFIG = {}
-
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            store_filter = "AND store_id = ?" if self.store_id else ""
-            store_params = (self.store_id,) if self.store_id else ()
-
-            # 0순위: inventory_batches.expiry_date (입고 기반, 가장 정확)
-            cursor.execute(f"""
-                SELECT expiry_date, delivery_type FROM inventory_batches
-                WHERE item_cd = ?
-                  AND status = 'active'
-                  AND expiry_date IS NOT NULL
-                {store_filter}
-                ORDER BY receiving_date DESC
-                LIMIT 1
-            """, (item_cd,) + store_params)
-
-            batch_row = cursor.fetchone()
-            if batch_row and batch_row['expiry_date']:
-                exp_str = batch_row['expiry_date']
-                # datetime 형식 (YYYY-MM-DD HH:MM:SS 또는 YYYY-MM-DD HH:MM)
-                for fmt in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M'):
-                    try:
-                        return datetime.strptime(exp_str, fmt)
-                    except (ValueError, TypeError):
-                        continue
-                # date-only 형식 (YYYY-MM-DD) → shelf_life_hours 기반 시간 보충
-                try:
-                    exp_date = datetime.strptime(exp_str, '%Y-%m-%d')
-                    del_type = batch_row['delivery_type'] or get_delivery_type(item_nm or '', item_cd) or '1차'
-                    cat = ALERT_CATEGORIES.get(mid_cd, {})
-                    shelf_hours_map = cat.get('shelf_life_hours', {})
-                    if del_type in shelf_hours_map:
-                        arrival_hour = DELIVERY_CONFIG.get(del_type, {}).get('arrival_hour', 20)
-                        exp_hour = (arrival_hour + shelf_hours_map[del_type]) % 24
-                    else:
-                        from src.alert.delivery_utils import get_expiry_hour_for_delivery
-                        exp_hour = get_expiry_hour_for_delivery(del_type)
-                    return exp_date.replace(hour=exp_hour, minute=0, second=0)
-                except (ValueError, TypeError):
-                    pass
-
-            # inventory_batches에 없으면 None (delivery_utils 계산 폴백은 호출자에서 처리)
-            # [정리] 기존 1순위(order_tracking) + 2순위(receiving_history) 제거
-            # → inventory_batches가 single source of truth (delivery_match_flow에서 확정 생성)
-            return None
-
-        except Exception as e:
-            logger.warning(f"실제 유통기한 조회 실패 ({item_cd}): {e}")
-            return None
-        finally:
-            cursor.close()
+        resolver = ExpiryBatchResolver(self._get_connection(), self.store_id)
+        return resolver.expiry_times({item_cd: (mid_cd, item_nm)}).get(item_cd)
 
     def _get_avg_daily_sales(self, item_cd: str, days: int = 7) -> float:
         """일평균 판매량 조회 (전체 기간 기준, 판매 0일 포함)"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        store_filter = "AND store_id = ?" if self.store_id else ""
-        store_params = (self.store_id,) if self.store_id else ()
-        try:
-            cursor.execute(f"""
-                SELECT COALESCE(SUM(sale_qty), 0) as total_sales
-                FROM daily_sales
-                WHERE item_cd = ?
-                AND sales_date >= date('now', ?)
-                {store_filter}
-            """, (item_cd, f'-{days} days') + store_params)
-
-            row = cursor.fetchone()
-            total_sales = row['total_sales'] or 0.0
-            return total_sales / days
-        finally:
-            cursor.close()
+        resolver = ExpiryBatchResolver(self._get_connection(), self.store_id)
+        return resolver.avg_daily_sales([item_cd], days=days)[item_cd]
 
     def _get_shelf_life(self, item_cd: str, mid_cd: str) -> int:
         """유통기한 조회 (DB 또는 카테고리 기본값)"""
@@ -410,11 +348,10 @@ class ExpiryChecker:
         store_params = (self.store_id,) if self.store_id else ()
         common_prefix = "common." if self.store_id else ""
 
-        all_items = []
+        candidates = []
 
         for delivery_type, mid_cd_list, offset in mappings:
             # receiving_date 계산 (폐기일 + offset)
-            from datetime import timedelta
             target_dt = datetime.strptime(target_date, "%Y-%m-%d")
             recv_date = (target_dt + timedelta(days=offset)).strftime("%Y-%m-%d")
 
@@ -440,65 +377,68 @@ class ExpiryChecker:
                     ORDER BY p.mid_cd, p.item_nm
                 """, (delivery_type, *mid_cd_list, recv_date) + store_params)
 
-                rows = cursor.fetchall()
+                candidates.extend((delivery_type, row) for row in cursor.fetchall())
             except Exception as e:
                 logger.warning(f"receiving_history 조회 실패 (expiry_hour={expiry_hour}): {e}")
                 continue
 
-            for row in rows:
-                item_cd = row['item_cd']
-                mid_cd = row['mid_cd']
-                recv_qty = row['receiving_qty']
-
-                # daily_sales.stock_qty 교차검증
-                stock_qty, ds_date = self._get_latest_stock_with_date(cursor, item_cd)
-                if stock_qty is not None and stock_qty <= 0:
-                    if stock_qty < 0:
-                        logger.debug(
-                            f"[ExpiryAlert] {item_cd} 제외: "
-                            f"stock={stock_qty} (마이너스 재고)"
-                        )
-                    else:
-                        # stock=0: 판매완료 또는 미입고
-                        logger.debug(
-                            f"[ExpiryAlert] {item_cd} 제외: "
-                            f"stock=0, ds={ds_date} (재고 없음)"
-                        )
-                    continue
-                if stock_qty is None:
-                    continue  # daily_sales에 기록 없음 → 매장에 물리적으로 없는 상품
+        # 재고/배치 잔량 교차검증용 일괄 조회 (expiry-batch-resolve)
+        resolver = ExpiryBatchResolver(conn, self.store_id)
+        stock_map = resolver.latest_stock(row['item_cd'] for _, row in candidates)
+        remaining_map = resolver.batch_remaining(
+            (row['item_cd'], row['receiving_date']) for _, row in candidates
+        )
 
-                # inventory_batches FIFO 교차검증: 해당 입고일 배치가 이미 소진되었으면 제외
-                batch_remaining = self._get_batch_remaining_qty(
-                    cursor, item_cd, row['receiving_date']
-                )
-                if batch_remaining is not None and batch_remaining <= 0:
-                    continue  # 해당 배치 소진됨 → 현재 stock은 다른 배치 소속
+        all_items = []
+        for delivery_type, row in candidates:
+            item_cd = row['item_cd']
+            mid_cd = row['mid_cd']
+            recv_qty = row['receiving_qty']
 
-                # 폐기 시간 계산
-                from src.alert.delivery_utils import (
-                    get_arrival_time, get_expiry_time_for_delivery,
-                )
-                recv_dt = datetime.strptime(row['receiving_date'], "%Y-%m-%d")
-                # receiving_date = 도착일 (1차: order당일, 2차: order+1일)
-                # arrival_time 직접 구성
-                arrival_hour = DELIVERY_CONFIG.get(delivery_type, {}).get('arrival_hour', 7)
-                arrival_time = recv_dt.replace(hour=arrival_hour, minute=0, second=0)
-                expiry_time = get_expiry_time_for_delivery(
-                    delivery_type, mid_cd, arrival_time
-                )
+            # daily_sales.stock_qty 교차검증
+            stock_qty, ds_date = stock_map.get(item_cd, (None, None))
+            if stock_qty is not None and stock_qty <= 0:
+                if stock_qty < 0:
+                    logger.debug(
+                        f"[ExpiryAlert] {item_cd} 제외: "
+                        f"stock={stock_qty} (마이너스 재고)"
+                    )
+                else:
+                    # stock=0: 판매완료 또는 미입고
+                    logger.debug(
+                        f"[ExpiryAlert] {item_cd} 제외: "
+                        f"stock=0, ds={ds_date} (재고 없음)"
+                    )
+                continue
+            if stock_qty is None:
+                continue  # daily_sales에 기록 없음 → 매장에 물리적으로 없는 상품
+
+            # inventory_batches FIFO 교차검증: 해당 입고일 배치가 이미 소진되었으면 제외
+            batch_remaining = remaining_map.get((item_cd, row['receiving_date']))
+            if batch_remaining is not None and batch_remaining <= 0:
+                continue  # 해당 배치 소진됨 → 현재 stock은 다른 배치 소속
+
+            # 폐기 시간 계산
+            recv_dt = datetime.strptime(row['receiving_date'], "%Y-%m-%d")
+            # receiving_date = 도착일 (1차: order당일, 2차: order+1일)
+            # arrival_time 직접 구성
+            arrival_hour = DELIVERY_CONFIG.get(delivery_type, {}).get('arrival_hour', 7)
+            arrival_time = recv_dt.replace(hour=arrival_hour, minute=0, second=0)
+            expiry_time = get_expiry_time_for_delivery(
+                delivery_type, mid_cd, arrival_time
+            )
 
-                all_items.append({
-                    'item_cd': item_cd,
-                    'item_nm': row['item_nm'],
-                    'mid_cd': mid_cd,
-                    'category_name': ALERT_CATEGORIES.get(mid_cd, {}).get('name', '기타'),
-                    'remaining_qty': stock_qty if stock_qty is not None else recv_qty,
-                    'delivery_type': delivery_type,
-                    'expiry_time': expiry_time,
-                    'order_date': row['receiving_date'],
-                    'arrival_time': arrival_time.strftime("%Y-%m-%d %H:%M"),
-                })
+            all_items.append({
+                'item_cd': item_cd,
+                'item_nm': row['item_nm'],
+                'mid_cd': mid_cd,
+                'category_name': ALERT_CATEGORIES.get(mid_cd, {}).get('name', '기타'),
+                'remaining_qty': stock_qty if stock_qty is not None else recv_qty,
+                'delivery_type': delivery_type,
+                'expiry_time': expiry_time,
+                'order_date': row['receiving_date'],
+                'arrival_time': arrival_time.strftime("%Y-%m-%d %H:%M"),
+            })
 
         return all_items
 
@@ -508,28 +448,16 @@ class ExpiryChecker:
         return stock_qty
 
     def _get_latest_stock_with_date(self, cursor, item_cd: str) -> tuple:
-        """daily_sales에서 최신 stock_qty + sales_date 조회
+        """daily_sales에서 최신 stock_qty + sales_date 조회 (단건)
 
         Returns:
             (stock_qty, sales_date) — 미조회 시 (None, None)
         """
-        try:
-            store_filter = "AND store_id = ?" if self.store_id else ""
-            store_params = (self.store_id,) if self.store_id else ()
-            cursor.execute(f"""
-                SELECT stock_qty, sales_date FROM daily_sales
-                WHERE item_cd = ? {store_filter}
-                ORDER BY sales_date DESC LIMIT 1
-            """, (item_cd,) + store_params)
-            row = cursor.fetchone()
-            if row:
-                return row['stock_qty'], row['sales_date']
-            return None, None
-        except Exception:
-            return None, None
+        resolver = ExpiryBatchResolver(cursor.connection, self.store_id)
+        return resolver.latest_stock([item_cd]).get(item_cd, (None, None))
 
     def _get_batch_remaining_qty(self, cursor, item_cd: str, receiving_date: str) -> Optional[int]:
-        """inventory_batches에서 특정 입고일 배치의 잔량 조회
+        """inventory_batches에서 특정 입고일 배치의 잔량 조회 (단건)
 
         Args:
             cursor: DB 커서
@@ -537,24 +465,10 @@ class ExpiryChecker:
             receiving_date: 입고일 (YYYY-MM-DD)
 
         Returns:
-            remaining_qty (None = 배치 기록 없음)
+            remaining_qty (None = 배치 기록 없음 또는 조회 실패 → 기존 로직 유지)
         """
-        try:
-            store_filter = "AND store_id = ?" if self.store_id else ""
-            store_params = (self.store_id,) if self.store_id else ()
-            cursor.execute(f"""
-                SELECT SUM(remaining_qty) as total_remaining
-                FROM inventory_batches
-                WHERE item_cd = ?
-                  AND receiving_date = ?
-                  {store_filter}
-            """, (item_cd, receiving_date) + store_params)
-            row = cursor.fetchone()
-            if row and row['total_remaining'] is not None:
-                return row['total_remaining']
-            return None  # 배치 기록 없음 → 기존 로직 유지
-        except Exception:
-            return None  # 조회 실패 → 기존 로직 유지 (안전)
+        resolver = ExpiryBatchResolver(cursor.connection, self.store_id)
+        return resolver.batch_remaining([(item_cd, receiving_date)]).get((item_cd, receiving_date))
 
     def _get_batch_items_expiring_at(self, expiry_hour: int, target_date: str) -> List[Dict[str, Any]]:
         """inventory_batches에서 특정 폐기 시간 대상 조회 (입고 기반)"""
@@ -588,6 +502,9 @@ class ExpiryChecker:
             """, (time_pattern, date_only) + store_params)
 
             rows = cursor.fetchall()
+            stock_map = ExpiryBatchResolver(conn, self.store_id).latest_stock(
+                row['item_cd'] for row in rows
+            )
             result = []
 
             for row in rows:
@@ -600,7 +517,7 @@ class ExpiryChecker:
                 # 차감 로직이 없어 판매 완료된 배치(stock_qty=0)가 그대로 알림으로 튀어나옴.
                 # 46513 8801771304173 사건: 4/8 12시 판매됐으나 4/9 02시 오알림 발사.
                 # _get_receiving_items_expiring_at과 동일한 교차검증 적용.
-                stock_qty, _ = self._get_latest_stock_with_date(cursor, row['item_cd'])
+                stock_qty, _ = stock_map.get(row['item_cd'], (None, None))
                 if stock_qty is not None and stock_qty <= 0:
                     logger.debug(
                         f"[ExpiryAlert/batch] {row['item_cd']} 제외: "
@@ -609,13 +526,7 @@ class ExpiryChecker:
                     continue
 
                 # 시간 포함 여부에 따라 파싱
-                expiry_time = None
-                for fmt in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M'):
-                    try:
-                        expiry_time = datetime.strptime(exp_str, fmt)
-                        break
-                    except (ValueError, TypeError):
-                        continue
+                expiry_time = parse_expiry_datetime(exp_str)
 
                 if not expiry_time:
                     # date-only: shelf_life_hours 기반으로 정확한 폐기 시간 계산
@@ -628,19 +539,8 @@ class ExpiryChecker:
                             last_char = (row['item_nm'] or '').strip()[-1:] if row['item_nm'] else ''
                             del_type = '2차' if last_char == '2' else '1차'
 
-                        cat = ALERT_CATEGORIES.get(mid_cd, {})
-                        shelf_hours_map = cat.get('shelf_life_hours', {})
-
-                        if del_type in shelf_hours_map:
-                            # shelf_life_hours 기반: 도착시간 + N시간의 hour
-                            arrival_hour = DELIVERY_CONFIG.get(del_type, {}).get('arrival_hour', 20)
-                            shelf_hours = shelf_hours_map[del_type]
-                            exp_h = (arrival_hour + shelf_hours) % 24
-                        else:
-                            # shelf_life_hours 없는 카테고리: DELIVERY_CONFIG 폴백
-                            from src.alert.delivery_utils import get_expiry_hour_for_delivery
-                            exp_h = get_expiry_hour_for_delivery(del_type)
-
+                        # shelf_life_hours 기반: 도착시간 + N시간의 hour (없으면 DELIVERY_CONFIG)
+                        exp_h = date_only_expiry_hour(mid_cd, del_type)
                         if exp_h != expiry_hour:
                             continue  # 이 시간대 대상 아님
                         expiry_time = exp_date.replace(hour=exp_h)
@@ -698,6 +598,10 @@ class ExpiryChecker:
             """, store_params + store_params)
 
             candidates = cursor.fetchall()
+            # 최근 15일 입고 이력 일괄 조회 (expiry-batch-resolve)
+            arrivals_map = ExpiryBatchResolver(conn, self.store_id).recent_arrivals(
+                (row['item_cd'] for row in candidates), days=15
+            )
             items = []
 
             for row in candidates:
@@ -710,25 +614,13 @@ class ExpiryChecker:
                 if not expiration_days:
                     expiration_days = ALERT_CATEGORIES.get("012", {}).get("shelf_life_default", 3)
 
-                # 최근 입고 이력 조회 (buy_qty > 0)
-                store_filter_arrival = "AND store_id = ?" if self.store_id else ""
-                store_params_arrival = (self.store_id,) if self.store_id else ()
-
-                cursor.execute(f"""
-                    SELECT sales_date FROM daily_sales
-                    WHERE item_cd = ? AND buy_qty > 0
-                      AND sales_date >= date('now', '-15 days')
-                      {store_filter_arrival}
-                    ORDER BY sales_date DESC
-                """, (item_cd,) + store_params_arrival)
-
-                arrivals = cursor.fetchall()
+                # 최근 입고 이력 (buy_qty > 0, 최신순)
                 is_expiring_today = False
 
-                for arrival_row in arrivals:
+                for sales_date in arrivals_map.get(item_cd, []):
                     try:
                         # sales_date = 발주일, 도착은 익일(D+1)
-                        order_date = datetime.strptime(arrival_row['sales_date'], "%Y-%m-%d").date()
+                        order_date = datetime.strptime(sales_date, "%Y-%m-%d").date()
                         arrival_date = order_date + timedelta(days=1)
                         # B방식: arrival_date + expiration_days + 1
                         expiry_date = arrival_date + timedelta(days=expiration_days + 1)
@@ -0,0 +1,248 @@
+"""
+폐기 알림 일괄 조회기 (expiry-batch-resolve)
+
+ExpiryChecker 가 상품마다 날리던 단건 쿼리를 상품 목록 단위로 묶는다.
+- 실제 유통기한: inventory_batches 최신 active 배치 (ROW_NUMBER 1회)
+- 입고일 배치 잔량: inventory_batches GROUP BY (item_cd, receiving_date)
+- 최신 재고: daily_sales 최신 sales_date 행
+- 일평균 판매량 / 최근 입고일: daily_sales GROUP BY item_cd
+
+조회 실패 시 빈 결과를 돌려주므로 호출자는 기존 단건 조회의
+None 폴백과 같은 방식으로 처리하면 된다.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.alert.config import ALERT_CATEGORIES, DELIVERY_CONFIG
+from src.alert.delivery_utils import (
+    get_delivery_type,
+    get_delivery_types_batch,
+    get_expiry_hour_for_delivery,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# SQLite 바인드 변수 한도 내 IN 절 청크 크기
+_IN_CHUNK = 500
+
+_EXPIRY_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M')
+
+LATEST_BATCH_SQL = """
+    SELECT item_cd, expiry_date, delivery_type
+    FROM (
+        SELECT item_cd, expiry_date, delivery_type,
+               ROW_NUMBER() OVER (
+                   PARTITION BY item_cd ORDER BY receiving_date DESC
+               ) AS rn
+        FROM inventory_batches
+        WHERE item_cd IN ({placeholders})
+          AND status = 'active'
+          AND expiry_date IS NOT NULL
+          {store_filter}
+    ) t WHERE rn = 1
+"""
+
+BATCH_REMAINING_SQL = """
+    SELECT item_cd, receiving_date, SUM(remaining_qty) AS total_remaining
+    FROM inventory_batches
+    WHERE item_cd IN ({placeholders})
+      AND receiving_date IN ({date_placeholders})
+      {store_filter}
+    GROUP BY item_cd, receiving_date
+"""
+
+LATEST_STOCK_SQL = """
+    SELECT item_cd, stock_qty, sales_date
+    FROM (
+        SELECT item_cd, stock_qty, sales_date,
+               ROW_NUMBER() OVER (
+                   PARTITION BY item_cd ORDER BY sales_date DESC
+               ) AS rn
+        FROM daily_sales
+        WHERE item_cd IN ({placeholders})
+          {store_filter}
+    ) t WHERE rn = 1
+"""
+
+SALES_TOTAL_SQL = """
+    SELECT item_cd, COALESCE(SUM(sale_qty), 0) AS total_sales
+    FROM daily_sales
+    WHERE item_cd IN ({placeholders})
+      AND sales_date >= date('now', ?)
+      {store_filter}
+    GROUP BY item_cd
+"""
+
+RECENT_ARRIVALS_SQL = """
+    SELECT item_cd, sales_date FROM daily_sales
+    WHERE item_cd IN ({placeholders})
+      AND buy_qty > 0
+      AND sales_date >= date('now', ?)
+      {store_filter}
+    ORDER BY item_cd, sales_date DESC
+"""
+
+
+def parse_expiry_datetime(exp_str: Optional[str]) -> Optional[datetime]:
+    """시간 포함 expiry_date 파싱 (YYYY-MM-DD HH:MM[:SS], 날짜만이면 None)"""
+    for fmt in _EXPIRY_FORMATS:
+        try:
+            return datetime.strptime(exp_str, fmt)
+        except (ValueError, TypeError):
+            continue
+    return None
+
+
+def date_only_expiry_hour(mid_cd: str, delivery_type: str) -> int:
+    """date-only 배치의 폐기 시각(hour)
+
+    shelf_life_hours 카테고리는 도착시간 + N시간, 그 외는 DELIVERY_CONFIG 폐기시간.
+    """
+    shelf_hours_map = ALERT_CATEGORIES.get(mid_cd, {}).get('shelf_life_hours', {})
+    if delivery_type in shelf_hours_map:
+        arrival_hour = DELIVERY_CONFIG.get(delivery_type, {}).get('arrival_hour', 20)
+        return (arrival_hour + shelf_hours_map[delivery_type]) % 24
+    return get_expiry_hour_for_delivery(delivery_type)
+
+
+class ExpiryBatchResolver:
+    """상품 목록 단위 유통기한/재고/배치 잔량 조회 (연결 1개 재사용)"""
+
+    def __init__(self, conn: Any, store_id: Optional[str] = None) -> None:
+        """
+        Args:
+            conn: ExpiryChecker 의 store DB 연결
+            store_id: 매장코드 (지정 시 store_id 컬럼 필터)
+        """
+        self.conn = conn
+        self.store_id = store_id
+        self._store_filter = "AND store_id = ?" if store_id else ""
+        self._store_params = (store_id,) if store_id else ()
+
+    def _fetch(self, sql: str, item_cds: Iterable[str], params: Tuple = (),
+               **fmt: str) -> List[Any]:
+        """item_cd IN 청크 단위 조회 (params 는 item_cd 뒤, store_id 앞에 바인딩)"""
+        codes = list(dict.fromkeys(cd for cd in item_cds if cd))
+        rows: List[Any] = []
+        cursor = self.conn.cursor()
+        try:
+            for i in range(0, len(codes), _IN_CHUNK):
+                chunk = codes[i:i + _IN_CHUNK]
+                cursor.execute(
+                    sql.format(placeholders=','.join('?' * len(chunk)),
+                               store_filter=self._store_filter, **fmt),
+                    tuple(chunk) + params + self._store_params,
+                )
+                rows.extend(cursor.fetchall())
+        finally:
+            cursor.close()
+        return rows
+
+    def expiry_times(
+        self,
+        items: Dict[str, Tuple[str, str]],
+        delivery_types: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, datetime]:
+        """inventory_batches 기반 실제 유통기한
+
+        date-only 배치는 배치 delivery_type → order_tracking(delivery_types) →
+        상품명 끝자리 → '1차' 순으로 차수를 정해 폐기 시각을 보충한다.
+
+        Args:
+            items: {item_cd: (mid_cd, item_nm)}
+            delivery_types: get_delivery_types_batch 결과 (없으면 필요한 상품만 조회)
+
+        Returns:
+            {item_cd: 유통기한 datetime} (배치 없는 상품은 미포함)
+        """
+        try:
+            rows = self._fetch(LATEST_BATCH_SQL, items)
+        except Exception as e:
+            logger.warning(f"실제 유통기한 일괄 조회 실패 ({len(items)}건): {e}")
+            return {}
+
+        result: Dict[str, datetime] = {}
+        date_only = []
+        for item_cd, exp_str, batch_type in rows:
+            expiry = parse_expiry_datetime(exp_str)
+            if expiry:
+                result[item_cd] = expiry
+                continue
+            try:
+                date_only.append((item_cd, datetime.strptime(exp_str, '%Y-%m-%d'), batch_type))
+            except (ValueError, TypeError):
+                continue
+
+        if delivery_types is None:
+            untyped = [item_cd for item_cd, _, batch_type in date_only if not batch_type]
+            delivery_types = get_delivery_types_batch(untyped, self.conn) if untyped else {}
+
+        for item_cd, exp_date, batch_type in date_only:
+            mid_cd, item_nm = items[item_cd]
+            del_type = (batch_type or delivery_types.get(item_cd)
+                        or get_delivery_type(item_nm or '') or '1차')
+            result[item_cd] = exp_date.replace(
+                hour=date_only_expiry_hour(mid_cd, del_type), minute=0, second=0
+            )
+        return result
+
+    def batch_remaining(
+        self, keys: Iterable[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], int]:
+        """입고일 배치 잔량
+
+        Args:
+            keys: [(item_cd, receiving_date), ...]
+
+        Returns:
+            {(item_cd, receiving_date): SUM(remaining_qty)} (배치 기록 없으면 미포함)
+        """
+        keys = set(keys)
+        if not keys:
+            return {}
+        dates = sorted({recv_date for _, recv_date in keys})
+        try:
+            rows = self._fetch(
+                BATCH_REMAINING_SQL, (item_cd for item_cd, _ in keys), tuple(dates),
+                date_placeholders=','.join('?' * len(dates)),
+            )
+        except Exception as e:
+            logger.warning(f"배치 잔량 일괄 조회 실패 ({len(keys)}건): {e}")
+            return {}
+        return {
+            (item_cd, recv_date): total
+            for item_cd, recv_date, total in rows
+            if total is not None and (item_cd, recv_date) in keys
+        }
+
+    def latest_stock(self, item_cds: Iterable[str]) -> Dict[str, Tuple[Any, str]]:
+        """daily_sales 최신 stock_qty + sales_date
+
+        Returns:
+            {item_cd: (stock_qty, sales_date)} (기록 없거나 조회 실패 시 미포함)
+        """
+        try:
+            rows = self._fetch(LATEST_STOCK_SQL, item_cds)
+        except Exception as e:
+            logger.debug(f"최신 재고 일괄 조회 실패: {e}")
+            return {}
+        return {item_cd: (stock_qty, sales_date) for item_cd, stock_qty, sales_date in rows}
+
+    def avg_daily_sales(self, item_cds: Iterable[str], days: int = 7) -> Dict[str, float]:
+        """일평균 판매량 (전체 기간 기준, 판매 0일 포함 = SUM / days)"""
+        item_cds = list(item_cds)
+        totals = {
+            item_cd: total or 0.0
+            for item_cd, total in self._fetch(SALES_TOTAL_SQL, item_cds, (f'-{days} days',))
+        }
+        return {item_cd: totals.get(item_cd, 0) / days for item_cd in item_cds}
+
+    def recent_arrivals(self, item_cds: Iterable[str], days: int = 15) -> Dict[str, List[str]]:
+        """최근 입고(buy_qty > 0) sales_date 목록 (최신순)"""
+        result: Dict[str, List[str]] = defaultdict(list)
+        for item_cd, sales_date in self._fetch(RECENT_ARRIVALS_SQL, item_cds, (f'-{days} days',)):
+            result[item_cd].append(sales_date)
+        return result
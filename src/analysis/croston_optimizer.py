@@ -5,6 +5,12 @@ Croston/TSB alpha·beta 최적화 모듈 (C-1)
 간헐 수요(intermittent) 상품에 대해 24개 (alpha × beta) 조합을 그리드 서치하여
 상품별 최적 파라미터를 croston_params 테이블에 저장한다.
 
+벡터화 (croston-grid):
+    대상 상품 전체를 (상품 × 일) 행렬로 1회 로드하고, TSB 점화식을
+    (후보 × 상품) 상태 배열로 일 단위 1패스 계산 → holdout RMSE 의 argmin 으로
+    상품별 최적 조합 선택 → executemany 일괄 UPSERT.
+    _croston_tsb_forecast/_evaluate 는 상품 1개 기준 참조 구현 (결과 동일).
+
 base_predictor.py 연결:
     from src.analysis.croston_optimizer import get_croston_params
     alpha, beta = get_croston_params(store_id, item_cd)  # 없으면 (0.15, 0.10) 반환
@@ -16,9 +22,12 @@ DB:
 import json
 import sqlite3
 from datetime import datetime, timedelta
+from itertools import product
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -42,6 +51,28 @@ DEFAULT_BETA  = 0.10
 # 재최적화 주기 (일) — 마지막 최적화 이후 이 기간이 지나면 재실행
 REOPTIMIZE_INTERVAL_DAYS = 28
 
+# 간헐 수요 판매일 비율 범위 (밖이면 Croston 불필요 또는 데이터 과소)
+MIN_SELL_RATIO = 0.05
+MAX_SELL_RATIO = 0.40
+
+# 그리드 서치 1회에 계산할 상품 수 (상태 배열 = 후보 × 상품)
+GRID_CHUNK_ITEMS = 4096
+
+UPSERT_PARAMS_SQL = """
+    INSERT INTO croston_params
+        (item_cd, alpha, beta, rmse, data_days, sell_days,
+         optimized_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(item_cd) DO UPDATE SET
+        alpha        = excluded.alpha,
+        beta         = excluded.beta,
+        rmse         = excluded.rmse,
+        data_days    = excluded.data_days,
+        sell_days    = excluded.sell_days,
+        optimized_at = excluded.optimized_at,
+        updated_at   = excluded.updated_at
+"""
+
 
 # ── DB 유틸리티 ────────────────────────────────────────────────────
 
@@ -150,6 +181,102 @@ def _evaluate(
 
 # ── 핵심 최적화 로직 ───────────────────────────────────────────────
 
+def _grid_rmse(
+    demands: np.ndarray,
+    starts: np.ndarray,
+    alphas: np.ndarray,
+    betas: np.ndarray,
+    holdout_days: int = HOLDOUT_DAYS,
+) -> np.ndarray:
+    """
+    전 상품 × 전 후보 TSB holdout RMSE (일 단위 1패스).
+
+    Args:
+        demands: (상품 × 일) 수요 행렬, 오른쪽 정렬 (앞쪽 패딩 0)
+        starts: 상품별 첫 유효 열 인덱스 (패딩 길이)
+        alphas, betas: (후보,) 후보별 파라미터
+        holdout_days: 마지막 N열을 holdout 으로 평가
+
+    Returns:
+        (후보 × 상품) RMSE — _evaluate(train, holdout, alpha, beta) 와 동일 값
+    """
+    n_items, n_days = demands.shape
+    a = alphas[:, None]
+    b = betas[:, None]
+
+    # 초기값: 상품별 첫 번째 비영 값 또는 1.0, 수요 발생 확률 0.5
+    positive = demands > 0
+    has_demand = positive.any(axis=1)
+    first_nonzero = demands[np.arange(n_items), positive.argmax(axis=1)]
+    z = np.broadcast_to(np.where(has_demand, first_nonzero, 1.0), (len(alphas), n_items)).copy()
+    p = np.full_like(z, 0.5)
+
+    sq_err = np.zeros_like(z)
+    holdout_from = n_days - holdout_days
+    for t in range(n_days):
+        d = demands[:, t]
+        # 상품 시작 열(t == start)은 초기 상태로 예측만, 이후 열부터 TSB 업데이트
+        update = t > starts
+        sold = update & (d > 0)
+        z = np.where(sold, a * d + (1 - a) * z, z)
+        p = np.where(sold, b * 1 + (1 - b) * p, np.where(update, b * 0 + (1 - b) * p, p))
+        if t >= holdout_from:
+            sq_err += (z * p - d) ** 2
+    return np.sqrt(sq_err / holdout_days)
+
+
+def optimize_items(series: Dict[str, List[float]]) -> Dict[str, Optional[Dict]]:
+    """
+    여러 상품 그리드 서치 일괄 실행 (벡터화).
+
+    Args:
+        series: {item_cd: 날짜순 일별 수요}
+
+    Returns:
+        {item_cd: {alpha, beta, rmse, data_days, sell_days} 또는 None (데이터 부족/범위 외)}
+    """
+    results: Dict[str, Optional[Dict]] = {}
+    eligible = []
+    for item_cd, demands in series.items():
+        total_days = len(demands)
+        if total_days < MIN_TRAIN_DAYS + HOLDOUT_DAYS:
+            results[item_cd] = None
+            continue
+        sell_days = sum(1 for d in demands if d > 0)
+        # 간헐 수요 범위 확인 — 너무 자주 팔리면 Croston 쓸 필요 없고,
+        # 거의 안 팔리면 데이터가 너무 희박해 의미 없음
+        if not MIN_SELL_RATIO <= sell_days / total_days <= MAX_SELL_RATIO:
+            results[item_cd] = None
+            continue
+        eligible.append((item_cd, demands, sell_days))
+
+    grid = list(product(ALPHA_CANDIDATES, BETA_CANDIDATES))  # alpha 우선 순서 (동률 시 앞 후보)
+    alphas = np.array([g[0] for g in grid])
+    betas = np.array([g[1] for g in grid])
+
+    for offset in range(0, len(eligible), GRID_CHUNK_ITEMS):
+        chunk = eligible[offset:offset + GRID_CHUNK_ITEMS]
+        width = max(len(demands) for _, demands, _ in chunk)
+        matrix = np.zeros((len(chunk), width))
+        starts = np.empty(len(chunk), dtype=np.int64)
+        for row, (_, demands, _) in enumerate(chunk):
+            starts[row] = width - len(demands)
+            matrix[row, starts[row]:] = demands
+
+        rmse = _grid_rmse(matrix, starts, alphas, betas)
+        best = rmse.argmin(axis=0)
+        for row, (item_cd, demands, sell_days) in enumerate(chunk):
+            k = best[row]
+            results[item_cd] = {
+                "alpha":     float(alphas[k]),
+                "beta":      float(betas[k]),
+                "rmse":      round(float(rmse[k, row]), 4),
+                "data_days": len(demands),
+                "sell_days": sell_days,
+            }
+    return results
+
+
 def _optimize_item(
     item_cd: str,
     demands: List[float],
@@ -158,42 +285,7 @@ def _optimize_item(
     단일 상품에 대해 그리드 서치 실행.
     반환: {alpha, beta, rmse, data_days, sell_days} 또는 None (데이터 부족)
     """
-    total_days = len(demands)
-    if total_days < MIN_TRAIN_DAYS + HOLDOUT_DAYS:
-        return None
-
-    sell_days = sum(1 for d in demands if d > 0)
-    sell_ratio = sell_days / total_days if total_days > 0 else 0
-
-    # 간헐 수요 범위 확인 (0.05 ~ 0.40 사이)
-    # 너무 자주 팔리면 Croston 쓸 필요 없고,
-    # 거의 안 팔리면 데이터가 너무 희박해 의미 없음
-    if sell_ratio < 0.05 or sell_ratio > 0.40:
-        return None
-
-    # train / holdout 분리
-    train   = demands[:-HOLDOUT_DAYS]
-    holdout = demands[-HOLDOUT_DAYS:]
-
-    best_alpha = DEFAULT_ALPHA
-    best_beta  = DEFAULT_BETA
-    best_rmse  = float("inf")
-
-    for alpha in ALPHA_CANDIDATES:
-        for beta in BETA_CANDIDATES:
-            rmse = _evaluate(train, holdout, alpha, beta)
-            if rmse < best_rmse:
-                best_rmse  = rmse
-                best_alpha = alpha
-                best_beta  = beta
-
-    return {
-        "alpha":     best_alpha,
-        "beta":      best_beta,
-        "rmse":      round(best_rmse, 4),
-        "data_days": total_days,
-        "sell_days": sell_days,
-    }
+    return optimize_items({item_cd: demands})[item_cd]
 
 
 # ── 매장 단위 실행 ─────────────────────────────────────────────────
@@ -202,6 +294,9 @@ def run_optimization(store_id: str) -> Dict:
     """
     매장의 간헐 수요 상품 전체에 대해 Croston 파라미터 최적화 실행.
 
+    기존 파라미터 1회 + 대상 상품 판매 이력 1회 조회 후 optimize_items 로
+    일괄 계산하고, 변경분만 한 트랜잭션으로 UPSERT 한다.
+
     Args:
         store_id: 매장 코드
 
@@ -219,8 +314,9 @@ def run_optimization(store_id: str) -> Dict:
         logger.error(f"[Croston] DB 없음: {db_path}")
         return {"error": "db_not_found"}
 
-    now_str = datetime.now().isoformat()
-    cutoff  = (datetime.now() - timedelta(days=MAX_TRAIN_DAYS)).strftime("%Y-%m-%d")
+    now = datetime.now()
+    now_str = now.isoformat()
+    cutoff  = (now - timedelta(days=MAX_TRAIN_DAYS)).strftime("%Y-%m-%d")
 
     stats = {"total": 0, "optimized": 0, "skipped": 0, "unchanged": 0, "errors": 0}
 
@@ -250,103 +346,87 @@ def run_optimization(store_id: str) -> Dict:
         conn.row_factory = sqlite3.Row
         _ensure_table(conn)
 
-        # 판매 이력이 있는 상품 목록 (store DB)
-        all_item_rows = conn.execute("""
-            SELECT DISTINCT item_cd
+        # 판매 이력 (store DB, 상품별 날짜 순서) — 1회 조회
+        series: Dict[str, List[float]] = {}
+        for row in conn.execute("""
+            SELECT item_cd, COALESCE(sale_qty, 0) AS qty
             FROM daily_sales
             WHERE sales_date >= ?
-            ORDER BY item_cd
-        """, (cutoff,)).fetchall()
-        all_items = [row["item_cd"] for row in all_item_rows]
+            ORDER BY item_cd, sales_date ASC
+        """, (cutoff,)):
+            series.setdefault(row["item_cd"], []).append(float(row["qty"]))
 
         # intermittent_set 비어있으면 전체 허용 (common.db 조회 실패 폴백)
-        items = [i for i in all_items if i in intermittent_set] if intermittent_set else all_items
+        items = [i for i in series if i in intermittent_set] if intermittent_set else list(series)
 
         logger.info(
             f"[Croston] 대상 상품 {len(items)}개 (store={store_id}, "
             f"filter={'intermittent' if intermittent_set else 'all'})"
         )
 
+        existing = {
+            row["item_cd"]: row
+            for row in conn.execute(
+                "SELECT item_cd, optimized_at, alpha, beta FROM croston_params"
+            ).fetchall()
+        }
+
+        # 재최적화 필요 여부 확인
+        due = {}
         for item_cd in items:
             stats["total"] += 1
-            try:
-                # 재최적화 필요 여부 확인
-                existing = conn.execute(
-                    "SELECT optimized_at, alpha, beta FROM croston_params WHERE item_cd = ?",
-                    (item_cd,)
-                ).fetchone()
-
-                if existing:
-                    last_opt = datetime.fromisoformat(existing["optimized_at"])
-                    days_since = (datetime.now() - last_opt).days
-                    if days_since < REOPTIMIZE_INTERVAL_DAYS:
-                        stats["skipped"] += 1
-                        continue
-
-                # 판매 데이터 로딩 (날짜 순서)
-                sales_rows = conn.execute("""
-                    SELECT sales_date, COALESCE(sale_qty, 0) AS qty
-                    FROM daily_sales
-                    WHERE item_cd = ? AND sales_date >= ?
-                    ORDER BY sales_date ASC
-                """, (item_cd, cutoff)).fetchall()
-
-                if len(sales_rows) < MIN_TRAIN_DAYS + HOLDOUT_DAYS:
+            prev = existing.get(item_cd)
+            if prev:
+                try:
+                    days_since = (now - datetime.fromisoformat(prev["optimized_at"])).days
+                except (TypeError, ValueError):
+                    days_since = REOPTIMIZE_INTERVAL_DAYS
+                if days_since < REOPTIMIZE_INTERVAL_DAYS:
                     stats["skipped"] += 1
                     continue
-
-                demands = [float(row["qty"]) for row in sales_rows]
-
-                # 최적화 실행
-                result = _optimize_item(item_cd, demands)
-                if result is None:
-                    stats["skipped"] += 1
-                    continue
-
-                # 기존값과 동일하면 저장 생략
-                if (existing
-                        and existing["alpha"] == result["alpha"]
-                        and existing["beta"]  == result["beta"]):
-                    stats["unchanged"] += 1
-                    continue
-
-                # 저장 (UPSERT)
-                conn.execute("""
-                    INSERT INTO croston_params
-                        (item_cd, alpha, beta, rmse, data_days, sell_days,
-                         optimized_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(item_cd) DO UPDATE SET
-                        alpha        = excluded.alpha,
-                        beta         = excluded.beta,
-                        rmse         = excluded.rmse,
-                        data_days    = excluded.data_days,
-                        sell_days    = excluded.sell_days,
-                        optimized_at = excluded.optimized_at,
-                        updated_at   = excluded.updated_at
-                """, (
-                    item_cd,
-                    result["alpha"],
-                    result["beta"],
-                    result["rmse"],
-                    result["data_days"],
-                    result["sell_days"],
-                    now_str,
-                    now_str,
-                ))
-                conn.commit()
-
-                stats["optimized"] += 1
-                logger.debug(
-                    f"[Croston] {item_cd}: "
-                    f"alpha={result['alpha']} beta={result['beta']} "
-                    f"rmse={result['rmse']} "
-                    f"(sell_ratio={result['sell_days']}/{result['data_days']})"
-                )
-
-            except Exception as e:
-                stats["errors"] += 1
-                logger.warning(f"[Croston] {item_cd} 최적화 실패: {e}")
+            due[item_cd] = series[item_cd]
+
+        # 최적화 실행 (전 상품 × 전 후보 일괄)
+        upserts = []
+        for item_cd, result in optimize_items(due).items():
+            if result is None:
+                stats["skipped"] += 1
+                continue
+
+            # 기존값과 동일하면 저장 생략
+            prev = existing.get(item_cd)
+            if (prev
+                    and prev["alpha"] == result["alpha"]
+                    and prev["beta"]  == result["beta"]):
+                stats["unchanged"] += 1
+                continue
+
+            upserts.append((
+                item_cd,
+                result["alpha"],
+                result["beta"],
+                result["rmse"],
+                result["data_days"],
+                result["sell_days"],
+                now_str,
+                now_str,
+            ))
+            logger.debug(
+                f"[Croston] {item_cd}: "
+                f"alpha={result['alpha']} beta={result['beta']} "
+                f"rmse={result['rmse']} "
+                f"(sell_ratio={result['sell_days']}/{result['data_days']})"
+            )
+
+        # 저장 (UPSERT)
+        try:
+            conn.executemany(UPSERT_PARAMS_SQL, upserts)
+            conn.commit()
+            stats["optimized"] = len(upserts)
+        except Exception as e:
+            conn.rollback()
+            stats["errors"] = len(upserts)
+            logger.warning(f"[Croston] 파라미터 저장 실패 ({len(upserts)}건): {e}")
 
         conn.close()
 
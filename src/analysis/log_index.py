@@ -0,0 +1,419 @@
+"""
+로그 인덱스 (log-index)
+
+로그 파일을 증분 tail 하여 SQLite(FTS5) 인덱스에 적재한다.
+LogParser 의 검색/필터/세션/Phase 조회를 파일 재파싱 없이 인덱스에서 응답한다.
+
+- 파일별 바이트 오프셋 추적: 새로 추가된 라인만 parse_line
+  (개행 없는 마지막 줄은 임시 행으로 적재하고 다음 동기화 때 다시 읽음)
+- 로테이션 감지 (DailyFileHandler: bgf_auto.log → bgf_auto_YYYY-MM-DD.log):
+  파일 앞부분(head)이 바뀌면 로테이션된 파일에서 남은 꼬리를 마저 적재 후 새 파일부터 재시작
+- log_fts: message/module trigram FTS5 (부분 문자열 검색, 미지원 SQLite는 LIKE 폴백)
+- 가장 최근 로그 기준 retention_days 이전 행은 동기화 시 삭제
+
+Usage:
+    index = LogIndex(log_dir)
+    index.sync(["main"])
+    rows = index.search("main", "발주 실패", start_ts="2026-02-21 00:00:00")
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.analysis.log_parser import (
+    DATE_FMT,
+    LOG_FILES,
+    LogEntry,
+    parse_line,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_FILENAME = "log_index.db"
+HEAD_BYTES = 256          # 로테이션 감지용 파일 앞부분
+READ_CHUNK = 4 * 1024 * 1024
+RETENTION_DAYS = 35       # DailyFileHandler backupCount(30) + 여유
+MIN_FTS_CHARS = 3         # trigram 최소 길이 (미만은 LIKE)
+
+_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS log_files (
+        file_key TEXT PRIMARY KEY,
+        path TEXT NOT NULL,
+        offset INTEGER NOT NULL DEFAULT 0,
+        line_count INTEGER NOT NULL DEFAULT 0,
+        head BLOB,
+        pending_id INTEGER,
+        synced_at TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS log_entries (
+        id INTEGER PRIMARY KEY,
+        file_key TEXT NOT NULL,
+        line_number INTEGER NOT NULL,
+        ts TEXT NOT NULL,
+        level TEXT NOT NULL,
+        module TEXT NOT NULL,
+        session_id TEXT,
+        phase TEXT,
+        phase_name TEXT,
+        message TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_log_entries_file_ts ON log_entries(file_key, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_log_entries_level ON log_entries(file_key, level, ts)",
+    """CREATE INDEX IF NOT EXISTS idx_log_entries_phase ON log_entries(file_key, ts)
+        WHERE phase IS NOT NULL""",
+]
+
+_FTS_SCHEMA = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS log_fts USING fts5(
+        message, module, content='log_entries', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS log_entries_ai AFTER INSERT ON log_entries BEGIN
+        INSERT INTO log_fts(rowid, message, module) VALUES (new.id, new.message, new.module);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS log_entries_ad AFTER DELETE ON log_entries BEGIN
+        INSERT INTO log_fts(log_fts, rowid, message, module)
+        VALUES ('delete', old.id, old.message, old.module);
+    END""",
+]
+
+_INSERT_SQL = """
+    INSERT INTO log_entries
+    (file_key, line_number, ts, level, module, session_id, phase, phase_name, message)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_ENTRY_COLUMNS = "line_number, ts, level, module, session_id, phase, phase_name, message"
+
+# 인덱스 DB 경로별 동기화 락 (Flask 워커 스레드 간 중복 적재 방지)
+_SYNC_LOCKS: Dict[str, threading.Lock] = {}
+_SYNC_LOCKS_GUARD = threading.Lock()
+
+
+def _lock_for(path: Path) -> threading.Lock:
+    with _SYNC_LOCKS_GUARD:
+        return _SYNC_LOCKS.setdefault(str(path), threading.Lock())
+
+
+def row_to_entry(row: Sequence) -> LogEntry:
+    """log_entries 행 → LogEntry (raw_line은 logger 포맷으로 재구성)"""
+    line_number, ts, level, module, session_id, phase, phase_name, message = row
+    session_part = f"{session_id} | " if session_id else ""
+    return LogEntry(
+        timestamp=datetime.strptime(ts, DATE_FMT),
+        level=level,
+        module=module,
+        message=message,
+        raw_line=f"{ts} | {level:<8s} | {session_part}{module} | {message}",
+        line_number=line_number,
+        phase=phase,
+        phase_name=phase_name,
+        session_id=session_id,
+    )
+
+
+def _like_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class LogIndex:
+    """로그 파일 증분 인덱서 + 조회"""
+
+    def __init__(
+        self,
+        log_dir: Path,
+        index_path: Optional[Path] = None,
+        retention_days: int = RETENTION_DAYS,
+    ):
+        self.log_dir = Path(log_dir)
+        self.index_path = Path(index_path) if index_path else self.log_dir / INDEX_FILENAME
+        self.retention_days = retention_days
+        self.fts = False
+        self._lock = _lock_for(self.index_path)
+        self._init_schema()
+
+    # ── 연결/스키마 ──
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.index_path), timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_schema(self) -> None:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            for ddl in _SCHEMA:
+                conn.execute(ddl)
+            try:
+                for ddl in _FTS_SCHEMA:
+                    conn.execute(ddl)
+                self.fts = True
+            except sqlite3.OperationalError as e:
+                logger.info(f"[LogIndex] FTS5 trigram 미지원 → LIKE 검색: {e}")
+        finally:
+            conn.close()
+
+    # ── 동기화 ──
+
+    def sync(self, file_keys: Iterable[str]) -> int:
+        """로그 파일의 새 라인 적재
+
+        Returns:
+            새로 적재한 로그 라인 수
+        """
+        added = 0
+        with self._lock:
+            conn = self._connect()
+            try:
+                for key in file_keys:
+                    conn.execute("BEGIN IMMEDIATE")
+                    try:
+                        added += self._sync_file(conn, key)
+                        conn.execute("COMMIT")
+                    except Exception:
+                        conn.execute("ROLLBACK")
+                        raise
+                if added:
+                    self._prune(conn)
+            finally:
+                conn.close()
+        return added
+
+    def _sync_file(self, conn: sqlite3.Connection, key: str) -> int:
+        path = self.log_dir / LOG_FILES.get(key, key)
+        if not path.exists():
+            return 0
+        with open(path, "rb") as f:
+            head = f.read(HEAD_BYTES)
+        size = path.stat().st_size
+
+        row = conn.execute(
+            "SELECT offset, line_count, head, pending_id FROM log_files WHERE file_key = ?",
+            (key,),
+        ).fetchone()
+        offset, line_count, known_head, pending_id = (
+            (row[0], row[1], row[2] or b"", row[3]) if row else (0, 0, b"", None)
+        )
+        if pending_id is not None:
+            # 직전 동기화의 미완결 마지막 줄 → 삭제 후 offset 부터 다시 읽음
+            conn.execute("DELETE FROM log_entries WHERE id = ?", (pending_id,))
+
+        added = 0
+        if row and (size < offset or head[:len(known_head)] != known_head):
+            # 로테이션: 이전 파일의 미적재 꼬리 → 새 파일 처음부터
+            rotated = self._find_rotated(path, known_head, offset)
+            if rotated is not None:
+                added += self._ingest(conn, key, rotated, offset, line_count, final=True)[2]
+            offset, line_count = 0, 0
+
+        new_offset, new_line_count, count, pending_id = self._ingest(
+            conn, key, path, offset, line_count
+        )
+        added += count
+        conn.execute(
+            """INSERT INTO log_files
+               (file_key, path, offset, line_count, head, pending_id, synced_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(file_key) DO UPDATE SET
+                   path = excluded.path, offset = excluded.offset,
+                   line_count = excluded.line_count, head = excluded.head,
+                   pending_id = excluded.pending_id, synced_at = excluded.synced_at""",
+            (key, str(path), new_offset, new_line_count, head, pending_id,
+             datetime.now().strftime(DATE_FMT)),
+        )
+        return added
+
+    def _find_rotated(self, path: Path, known_head: bytes, offset: int) -> Optional[Path]:
+        """앞부분이 known_head 와 같은 로테이션 파일 (최근 것 우선)"""
+        candidates = sorted(
+            path.parent.glob(f"{path.stem}_*{path.suffix}"),
+            key=lambda p: p.stat().st_mtime, reverse=True,
+        )
+        for candidate in candidates:
+            try:
+                if candidate.stat().st_size < offset:
+                    continue
+                with open(candidate, "rb") as f:
+                    if f.read(len(known_head)) == known_head:
+                        return candidate
+            except OSError:
+                continue
+        return None
+
+    @staticmethod
+    def _row(key: str, line_number: int, raw: bytes) -> Optional[tuple]:
+        entry = parse_line(raw.decode("utf-8", errors="replace"), line_number)
+        if entry is None:
+            return None
+        return (
+            key, line_number, entry.timestamp.strftime(DATE_FMT),
+            entry.level, entry.module, entry.session_id,
+            entry.phase, entry.phase_name, entry.message,
+        )
+
+    def _ingest(
+        self, conn: sqlite3.Connection, key: str, path: Path, offset: int, line_count: int,
+        final: bool = False,
+    ) -> Tuple[int, int, int, Optional[int]]:
+        """offset 부터 적재
+
+        개행으로 끝나는 라인은 확정, 개행 없는 마지막 줄은 임시 행(pending)으로 적재하고
+        offset은 그 줄 시작에 둔다. final=True(로테이션된 파일)면 마지막 줄도 확정.
+
+        Returns:
+            (새 offset, 새 누적 라인 수, 적재한 로그 라인 수, 임시 행 id 또는 None)
+        """
+        added = 0
+        pending_id = None
+        with open(path, "rb") as f:
+            f.seek(offset)
+            pending = b""
+            while True:
+                chunk = f.read(READ_CHUNK)
+                if not chunk:
+                    break
+                data = pending + chunk
+                cut = data.rfind(b"\n")
+                if cut < 0:
+                    pending = data
+                    continue
+                pending = data[cut + 1:]
+                rows = []
+                for raw in data[:cut].split(b"\n"):
+                    line_count += 1
+                    row = self._row(key, line_count, raw)
+                    if row:
+                        rows.append(row)
+                conn.executemany(_INSERT_SQL, rows)
+                added += len(rows)
+                offset = f.tell() - len(pending)
+
+        if pending.strip():
+            row = self._row(key, line_count + 1, pending)
+            if final:
+                line_count += 1
+                offset += len(pending)
+            if row:
+                cursor = conn.execute(_INSERT_SQL, row)
+                added += 1
+                if not final:
+                    pending_id = cursor.lastrowid
+        return offset, line_count, added, pending_id
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """가장 최근 로그 기준 retention_days 이전 행 삭제"""
+        latest = conn.execute("SELECT MAX(ts) FROM log_entries").fetchone()[0]
+        if not latest:
+            return
+        cutoff = (
+            datetime.strptime(latest, DATE_FMT) - timedelta(days=self.retention_days)
+        ).strftime(DATE_FMT)
+        for (key,) in conn.execute("SELECT file_key FROM log_files").fetchall():
+            conn.execute(
+                "DELETE FROM log_entries WHERE file_key = ? AND ts < ?", (key, cutoff)
+            )
+
+    # ── 조회 ──
+
+    def query(self, sql: str, params: Sequence = ()) -> List[tuple]:
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _range_clause(start_ts: Optional[str], end_ts: Optional[str]) -> Tuple[str, list]:
+        clause, params = "", []
+        if start_ts:
+            clause += " AND ts >= ?"
+            params.append(start_ts)
+        if end_ts:
+            clause += " AND ts <= ?"
+            params.append(end_ts)
+        return clause, params
+
+    def entries(
+        self, key: str, start_ts: Optional[str] = None, end_ts: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[LogEntry]:
+        """기간 내 로그 (파일 순서)"""
+        clause, params = self._range_clause(start_ts, end_ts)
+        sql = (f"SELECT {_ENTRY_COLUMNS} FROM log_entries WHERE file_key = ?{clause} "
+               f"ORDER BY id" + (" LIMIT ?" if limit else ""))
+        return [row_to_entry(r) for r in self.query(
+            sql, [key] + params + ([limit] if limit else [])
+        )]
+
+    def by_level(
+        self, key: str, levels: Sequence[str], start_ts: Optional[str] = None,
+        end_ts: Optional[str] = None, limit: int = 200,
+    ) -> List[LogEntry]:
+        clause, params = self._range_clause(start_ts, end_ts)
+        placeholders = ",".join("?" * len(levels))
+        sql = (f"SELECT {_ENTRY_COLUMNS} FROM log_entries "
+               f"WHERE file_key = ? AND level IN ({placeholders}){clause} ORDER BY id LIMIT ?")
+        return [row_to_entry(r) for r in self.query(sql, [key, *levels] + params + [limit])]
+
+    def search(
+        self, key: str, keyword: str, start_ts: Optional[str] = None,
+        end_ts: Optional[str] = None, limit: Optional[int] = 100,
+    ) -> List[LogEntry]:
+        """message/module 부분 문자열 검색 (대소문자 무시)"""
+        clause, params = self._range_clause(start_ts, end_ts)
+        limit_sql = " LIMIT ?" if limit else ""
+        limit_params = [limit] if limit else []
+        if self.fts and len(keyword) >= MIN_FTS_CHARS:
+            phrase = '"' + keyword.replace('"', '""') + '"'
+            sql = (f"SELECT {_ENTRY_COLUMNS} FROM log_entries WHERE id IN "
+                   f"(SELECT rowid FROM log_fts WHERE log_fts MATCH ?) "
+                   f"AND file_key = ?{clause} ORDER BY id{limit_sql}")
+            args = [phrase, key] + params + limit_params
+        else:
+            pattern = f"%{_like_escape(keyword)}%"
+            sql = (f"SELECT {_ENTRY_COLUMNS} FROM log_entries WHERE file_key = ?{clause} "
+                   f"AND (message LIKE ? ESCAPE '\\' OR module LIKE ? ESCAPE '\\') "
+                   f"ORDER BY id{limit_sql}")
+            args = [key] + params + [pattern, pattern] + limit_params
+        return [row_to_entry(r) for r in self.query(sql, args)]
+
+    def match_any(
+        self, key: str, phrases: Sequence[str], start_ts: str, end_ts: str,
+    ) -> List[Tuple[int, str, str]]:
+        """phrases 중 하나를 포함하는 행 (id, ts, message) — 대소문자 무시, 호출자가 재확인"""
+        if self.fts:
+            expr = " OR ".join('"' + p.replace('"', '""') + '"' for p in phrases)
+            return self.query(
+                "SELECT id, ts, message FROM log_entries WHERE id IN "
+                "(SELECT rowid FROM log_fts WHERE log_fts MATCH ?) "
+                "AND file_key = ? AND ts >= ? AND ts <= ? ORDER BY id",
+                [expr, key, start_ts, end_ts],
+            )
+        likes = " OR ".join("message LIKE ? ESCAPE '\\'" for _ in phrases)
+        return self.query(
+            f"SELECT id, ts, message FROM log_entries "
+            f"WHERE file_key = ? AND ts >= ? AND ts <= ? AND ({likes}) ORDER BY id",
+            [key, start_ts, end_ts] + [f"%{_like_escape(p)}%" for p in phrases],
+        )
+
+    def id_bounds(self, key: str, start_ts: str, end_ts: str) -> Optional[Tuple[int, int]]:
+        """기간 내 첫/마지막 행 id"""
+        row = self.query(
+            "SELECT MIN(id), MAX(id) FROM log_entries WHERE file_key = ? AND ts >= ? AND ts <= ?",
+            (key, start_ts, end_ts),
+        )[0]
+        return (row[0], row[1]) if row[0] is not None else None
+
+    def file_state(self, key: str) -> Optional[Dict[str, object]]:
+        rows = self.query(
+            "SELECT path, offset, line_count, synced_at FROM log_files WHERE file_key = ?", (key,)
+        )
+        if not rows:
+            return None
+        path, offset, line_count, synced_at = rows[0]
+        return {"path": path, "offset": offset, "line_count": line_count, "synced_at": synced_at}
@@ -5,6 +5,9 @@ BGF 로그 분석 코어 모듈
 세션, Phase, 에러를 추출한다.
 메모리에 전체 파일을 로드하지 않고 줄 단위로 처리한다.
 
+조회(세션/Phase/레벨 필터/검색)는 log_index.LogIndex 에 증분 적재한 인덱스에서
+응답하고, 인덱스를 쓸 수 없으면 파일 스트리밍으로 폴백한다.
+
 Usage:
     from src.analysis.log_parser import LogParser
 
@@ -20,6 +23,10 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Generator, List, Optional, Dict, Any, Tuple
 
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 # ──────────────────────────────────────────────────────────────
 # 상수 (logger.py 와 동일한 경로 구조)
@@ -218,8 +225,25 @@ def stream_log_file(
 class LogParser:
     """로그 분석 메인 클래스"""
 
-    def __init__(self, log_dir: Optional[Path] = None):
+    def __init__(self, log_dir: Optional[Path] = None, use_index: bool = True):
         self.log_dir = log_dir or LOG_DIR
+        self.use_index = use_index
+        self._index = None
+
+    def _synced_index(self, file_keys: List[str]):
+        """새 라인까지 적재된 LogIndex (사용 불가 시 None → 파일 스트리밍)"""
+        if not self.use_index:
+            return None
+        try:
+            if self._index is None:
+                from src.analysis.log_index import LogIndex
+                self._index = LogIndex(self.log_dir)
+            self._index.sync(file_keys)
+            return self._index
+        except Exception as e:
+            logger.warning(f"[LogParser] 로그 인덱스 사용 불가, 파일 스트리밍: {e}")
+            self.use_index = False
+            return None
 
     # ── 세션 ──
 
@@ -262,6 +286,10 @@ class LogParser:
         log_file: str = "main",
     ) -> List[SessionInfo]:
         """특정 날짜의 모든 세션 목록"""
+        index = self._synced_index([log_file])
+        if index is not None:
+            return self._list_sessions_indexed(index, date, log_file)
+
         # 1단계: 세션 경계 감지
         all_entries: List[LogEntry] = []
         session_starts: List[int] = []  # all_entries 내 인덱스
@@ -295,6 +323,109 @@ class LogParser:
 
         return sessions
 
+    def _list_sessions_indexed(self, index, date: str, log_file: str) -> List[SessionInfo]:
+        """list_sessions 인덱스 버전 — 세션/Phase 경계 행만 조회 후 구간별 집계"""
+        start_ts, end_ts = f"{date} 00:00:00", f"{date} 23:59:59"
+        bounds = index.id_bounds(log_file, start_ts, end_ts)
+        if bounds is None:
+            return []
+
+        starts = [
+            row_id for row_id, _, message in index.match_any(
+                log_file, SESSION_START_MARKERS, start_ts, end_ts
+            )
+            if any(marker in message for marker in SESSION_START_MARKERS)
+        ]
+        if not starts:
+            return [self._build_session_indexed(index, log_file, bounds[0], bounds[1],
+                                                date, "00:00", start_ts, end_ts)]
+
+        sessions: List[SessionInfo] = []
+        for i, lo in enumerate(starts):
+            hi = starts[i + 1] - 1 if i + 1 < len(starts) else bounds[1]
+            sessions.append(self._build_session_indexed(
+                index, log_file, lo, hi, date, None, start_ts, end_ts
+            ))
+        return sessions
+
+    def _build_session_indexed(
+        self, index, log_file: str, lo: int, hi: int, date: str,
+        time_str: Optional[str], start_ts: str, end_ts: str,
+    ) -> SessionInfo:
+        """행 id 구간 [lo, hi] → SessionInfo (_build_session 과 동일 규칙)"""
+        scope = "file_key = ? AND id BETWEEN ? AND ? AND ts >= ? AND ts <= ?"
+        args = [log_file, lo, hi, start_ts, end_ts]
+
+        count, errors, warnings = index.query(
+            f"SELECT COUNT(*), SUM(level = 'ERROR'), SUM(level = 'WARNING') "
+            f"FROM log_entries WHERE {scope}", args,
+        )[0]
+        first = index.query(f"SELECT ts FROM log_entries WHERE {scope} ORDER BY id LIMIT 1", args)
+        last = index.query(f"SELECT ts FROM log_entries WHERE {scope} ORDER BY id DESC LIMIT 1", args)
+        if not count:
+            return SessionInfo(session_id=f"{date}_{time_str or '00:00'}")
+
+        start_time = datetime.strptime(first[0][0], DATE_FMT)
+        session = SessionInfo(session_id=f"{date}_{time_str or start_time.strftime('%H:%M')}")
+        session.start_time = start_time
+        session.end_time = datetime.strptime(last[0][0], DATE_FMT)
+        session.duration_seconds = (session.end_time - session.start_time).total_seconds()
+        session.log_count = count
+        session.total_errors = errors or 0
+        session.total_warnings = warnings or 0
+
+        for (message,) in index.query(
+            f"SELECT message FROM log_entries WHERE {scope} ORDER BY id LIMIT 20", args
+        ):
+            if "store=" in message:
+                sm = re.search(r"store[=:](\d+)", message)
+                if sm:
+                    session.store_id = sm.group(1)
+                    break
+
+        phase_rows = index.query(
+            f"SELECT id, ts, phase, phase_name FROM log_entries "
+            f"WHERE {scope} AND phase IS NOT NULL ORDER BY id", args,
+        )
+        for j, (p_lo, p_ts, phase_id, phase_name) in enumerate(phase_rows):
+            last_phase = j + 1 == len(phase_rows)
+            p_hi = hi if last_phase else phase_rows[j + 1][0] - 1
+            p_args = [log_file, p_lo, p_hi, start_ts, end_ts]
+            p_count, p_errors, p_warnings = index.query(
+                f"SELECT COUNT(*), SUM(level = 'ERROR'), SUM(level = 'WARNING') "
+                f"FROM log_entries WHERE {scope}", p_args,
+            )[0]
+            phase = PhaseInfo(
+                phase_id=phase_id,
+                phase_name=phase_name or KNOWN_PHASES.get(phase_id, ""),
+                start_time=datetime.strptime(p_ts, DATE_FMT),
+                end_time=(
+                    session.end_time if last_phase
+                    else datetime.strptime(phase_rows[j + 1][1], DATE_FMT)
+                ),
+                error_count=p_errors or 0,
+                warning_count=p_warnings or 0,
+                log_count=p_count,
+            )
+            phase.duration_seconds = (phase.end_time - phase.start_time).total_seconds()
+            if phase.error_count:
+                phase.key_messages = [
+                    m[:120] for (m,) in index.query(
+                        f"SELECT message FROM log_entries WHERE {scope} AND level = 'ERROR' "
+                        f"ORDER BY id LIMIT 3", p_args,
+                    )
+                ]
+            phase.status = f"{phase.error_count} ERRORS" if phase.error_count else "OK"
+            session.phases.append(phase)
+
+        if session.total_errors == 0:
+            session.overall_status = "SUCCESS"
+        elif session.total_errors <= 3:
+            session.overall_status = "PARTIAL"
+        else:
+            session.overall_status = "FAILED"
+        return session
+
     def _build_session(self, entries: List[LogEntry], date: str, time_str: str) -> SessionInfo:
         """엔트리 리스트로 SessionInfo 생성"""
         session = SessionInfo(session_id=f"{date}_{time_str}")
@@ -404,6 +535,33 @@ class LogParser:
         log_file: str = "main",
     ) -> List[LogEntry]:
         """특정 Phase의 전체 로그 라인 추출"""
+        index = self._synced_index([log_file])
+        if index is not None:
+            start_ts, end_ts = f"{date} 00:00:00", f"{date} 23:59:59"
+            scope = "file_key = ? AND ts >= ? AND ts <= ?"
+            first = index.query(
+                f"SELECT id FROM log_entries WHERE {scope} AND phase = ? ORDER BY id LIMIT 1",
+                [log_file, start_ts, end_ts, phase_id],
+            )
+            if not first:
+                return []
+            following = index.query(
+                f"SELECT id FROM log_entries WHERE {scope} AND phase IS NOT NULL "
+                f"AND phase != ? AND id > ? ORDER BY id LIMIT 1",
+                [log_file, start_ts, end_ts, phase_id, first[0][0]],
+            )
+            upper = following[0][0] - 1 if following else None
+            from src.analysis.log_index import row_to_entry
+            return [
+                row_to_entry(row) for row in index.query(
+                    f"SELECT line_number, ts, level, module, session_id, phase, phase_name, message "
+                    f"FROM log_entries WHERE {scope} AND id >= ?"
+                    + (" AND id <= ?" if upper is not None else "") + " ORDER BY id",
+                    [log_file, start_ts, end_ts, first[0][0]]
+                    + ([upper] if upper is not None else []),
+                )
+            ]
+
         sessions = self.list_sessions(date, log_file)
         if not sessions:
             return []
@@ -458,6 +616,17 @@ class LogParser:
         results: List[LogEntry] = []
         files = self._resolve_files(log_file)
 
+        index = self._synced_index(files)
+        if index is not None:
+            start_ts, end_ts = self._ts_range(sd, ed, last_hours)
+            for f in files:
+                results.extend(index.by_level(
+                    f, sorted(levels), start_ts, end_ts, max_results - len(results)
+                ))
+                if len(results) >= max_results:
+                    break
+            return results
+
         for f in files:
             for entry in stream_log_file(f, start_date=sd, end_date=ed, log_dir=self.log_dir):
                 if entry.level in levels:
@@ -498,6 +667,26 @@ class LogParser:
         results: List[LogEntry] = []
         files = self._resolve_files(log_file)
 
+        index = self._synced_index(files)
+        if index is not None:
+            start_ts, end_ts = self._ts_range(sd, ed, last_hours)
+            for f in files:
+                if regex:
+                    # 정규식은 인덱스로 좁힐 수 없음 → 기간 내 행 (파일 재파싱 없이) 필터
+                    candidates = index.entries(f, start_ts, end_ts)
+                elif case_sensitive:
+                    # FTS(대소문자 무시)로 후보 축소 후 정확히 재확인
+                    candidates = index.search(f, keyword, start_ts, end_ts, limit=None)
+                else:
+                    candidates = index.search(f, keyword, start_ts, end_ts,
+                                              limit=max_results - len(results))
+                for entry in candidates:
+                    if match_fn(entry.message) or match_fn(entry.module):
+                        results.append(entry)
+                        if len(results) >= max_results:
+                            return results
+            return results
+
         for f in files:
             for entry in stream_log_file(f, start_date=sd, end_date=ed, log_dir=self.log_dir):
                 if match_fn(entry.message) or match_fn(entry.module):
@@ -600,6 +789,18 @@ class LogParser:
             return start_dt.strftime("%Y-%m-%d"), now.strftime("%Y-%m-%d")
         return start_date, end_date
 
+    @staticmethod
+    def _ts_range(
+        start_date: Optional[str], end_date: Optional[str], last_hours: Optional[int],
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """날짜 범위 + 최근 N시간 → 인덱스 ts 범위 (문자열 비교)"""
+        start_ts = f"{start_date} 00:00:00" if start_date else None
+        if last_hours:
+            cutoff = (datetime.now() - timedelta(hours=last_hours)).strftime(DATE_FMT)
+            start_ts = max(start_ts, cutoff) if start_ts else cutoff
+        end_ts = f"{end_date} 23:59:59" if end_date else None
+        return start_ts, end_ts
+
     @staticmethod
     def _within_hours(ts: datetime, hours: int) -> bool:
         """타임스탬프가 최근 N시간 이내인지"""
@@ -6,6 +6,9 @@ ThreadPoolExecutor를 사용하여 모든 활성 매장에 대해 작업을 병
 
 매장 간 시차(stagger_seconds)를 두어 ChromeDriver 동시 기동 시
 파일 잠금 충돌을 방지합니다.
+
+prediction_processes > 0 이면 실행 동안 PredictionProcessPool을 띄워
+예측 단계만 프로세스로 분리합니다 (수집/발주 제출은 스레드 유지).
 """
 
 import time
@@ -30,21 +33,30 @@ class MultiStoreRunner:
         )
     """
 
-    def __init__(self, max_workers: int = 4, stagger_seconds: float = DEFAULT_STAGGER_SECONDS):
+    def __init__(
+        self,
+        max_workers: int = 4,
+        stagger_seconds: float = DEFAULT_STAGGER_SECONDS,
+        prediction_processes: int = 0,
+    ):
         """초기화
 
         Args:
             max_workers: 최대 병렬 워커 수
             stagger_seconds: 매장 간 시작 간격 (초). 첫 매장은 즉시 시작,
                 이후 매장은 이 간격만큼 지연 후 시작. 0이면 동시 시작.
+            prediction_processes: 예측 전용 프로세스 수. 0이면 예측도
+                매장 스레드에서 실행 (기존 동작).
         """
         self.max_workers = max_workers
         self.stagger_seconds = stagger_seconds
+        self.prediction_processes = prediction_processes
 
     def run_parallel(
         self,
         task_fn: Callable,
         task_name: str = "task",
+        use_prediction_pool: bool = False,
     ) -> List[Dict[str, Any]]:
         """모든 활성 매장에 대해 시차 병렬 실행
 
@@ -54,10 +66,32 @@ class MultiStoreRunner:
         Args:
             task_fn: StoreContext를 받는 작업 함수
             task_name: 작업 이름 (로깅용)
+            use_prediction_pool: True이고 prediction_processes > 0 이면
+                실행 동안 예측 프로세스 풀 활성화
 
         Returns:
             [{store_id, success, result, error}, ...]
         """
+        if use_prediction_pool and self.prediction_processes > 0:
+            from src.application.scheduler.prediction_pool import PredictionProcessPool
+            try:
+                pool = PredictionProcessPool(max_workers=self.prediction_processes)
+                pool.start()
+            except Exception as e:
+                logger.warning(f"[{task_name}] 예측 프로세스 풀 기동 실패 (스레드 예측): {e}")
+                return self._run_threads(task_fn, task_name)
+            try:
+                return self._run_threads(task_fn, task_name)
+            finally:
+                pool.shutdown()
+        return self._run_threads(task_fn, task_name)
+
+    def _run_threads(
+        self,
+        task_fn: Callable,
+        task_name: str,
+    ) -> List[Dict[str, Any]]:
+        """매장별 스레드 병렬 실행 (run_parallel 본체)"""
         from src.settings.store_context import StoreContext
 
         stores = StoreContext.get_all_active()
@@ -0,0 +1,631 @@
+"""
+PredictionDaemon -- 상주(warm) 예측 서비스
+
+스케줄 작업, 웹 예측 요청, 스크립트 실행이 매번 예측 스택을 다시 import하고
+ImprovedPredictor 생성 → MLPredictor.load_models(joblib) → PredictionCacheManager
+배치 캐시 로드를 처음부터 반복하던 것을, 하나의 상주 프로세스로 모은다.
+
+- 매장별 ImprovedPredictor / ML 모델 / 배치 캐시를 메모리에 유지 (warm 모드)
+- 요청마다 매장 DB의 PRAGMA data_version을 확인하고, 바뀐 경우에만 감시 테이블
+  지문(행수, MAX(rowid), MAX(갱신시각))을 비교하여 변경 테이블에 의존하는 캐시만 무효화
+  (daily_sales / realtime_inventory / promotions + 미입고 캐시용 order_tracking / receiving_history)
+- common.db 상품 마스터(products / product_details / mid_categories), 발주정지(stopped_items),
+  휴일(external_factors)이 바뀌면 캐시 전체 무효화
+- 날짜가 바뀌면 예측기 재생성, 모델 파일이 재학습되면 모델만 재로드
+- 127.0.0.1 HTTP (표준 라이브러리) — Windows 운영 환경에서도 동작
+- 결과는 prediction_pool의 컬럼 압축 포맷(pack_prediction_results)으로 반환
+
+Usage:
+    python run_scheduler.py --prediction-daemon
+
+    client = get_prediction_daemon_client()
+    if client is not None:
+        candidates = client.predict_candidates("46513", min_order_qty=1)
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.application.scheduler.prediction_pool import (
+    pack_prediction_results,
+    unpack_prediction_results,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = int(os.getenv("PREDICTION_DAEMON_PORT", "8765"))
+# 예측 요청 타임아웃 (전체 매장 예측 기준 여유 있게)
+DEFAULT_TIMEOUT = 600
+# 데몬 미기동 시 재확인 간격 (매 호출마다 연결 시도 방지)
+PROBE_INTERVAL_SEC = 30
+
+# 감시 테이블 → 갱신시각 컬럼 (UPDATE만으로 바뀌는 행 감지용)
+WATCHED_TABLES: Dict[str, Optional[str]] = {
+    "daily_sales": "collected_at",
+    "realtime_inventory": "queried_at",
+    "promotions": "COALESCE(updated_at, collected_at)",
+    "order_tracking": "updated_at",
+    "receiving_history": "created_at",
+}
+# common.db 감시 테이블 — 상품 마스터/small_cd 매핑/발주정지/휴일은 여러 캐시가
+# 암묵적으로 참조하므로 하나라도 바뀌면 해당 매장 캐시 전체를 무효화한다
+# (설정 감사 로그·대시보드 스냅샷 등 그 외 테이블 쓰기는 무시)
+COMMON_WATCHED_TABLES: Dict[str, Optional[str]] = {
+    "products": "updated_at",
+    "mid_categories": "updated_at",
+    "product_details": "updated_at",
+    "stopped_items": "last_detected_at",
+    "external_factors": "created_at",
+}
+
+_STORE_ID_PATTERN = re.compile(r'^[0-9]{4,6}$')
+
+
+class TableChangeWatcher:
+    """매장 DB 감시 테이블 변경 감지
+
+    PRAGMA data_version은 다른 커넥션이 커밋할 때만 바뀌므로 변경이 없으면
+    쿼리 1회로 끝난다. 바뀐 경우에만 테이블별 지문을 계산해 비교한다.
+    """
+
+    def __init__(self, db_path: str, tables: Optional[Dict[str, Optional[str]]] = None):
+        """
+        Args:
+            db_path: 매장 DB 경로
+            tables: {테이블명: 갱신시각 컬럼 식} (기본 WATCHED_TABLES)
+        """
+        self.db_path = str(db_path)
+        self.tables = dict(tables if tables is not None else WATCHED_TABLES)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
+        self._fingerprints: Dict[str, Optional[Tuple]] = {}
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        return self._conn
+
+    def _fingerprint(self, table: str, ts_expr: Optional[str]) -> Optional[Tuple]:
+        conn = self._get_conn()
+        queries = []
+        if ts_expr:
+            queries.append(f"SELECT COUNT(*), MAX(rowid), MAX({ts_expr}) FROM {table}")
+        queries.append(f"SELECT COUNT(*), MAX(rowid) FROM {table}")
+        for sql in queries:
+            try:
+                return tuple(conn.execute(sql).fetchone())
+            except sqlite3.OperationalError:
+                continue  # 컬럼/테이블 미존재 → 다음 식 또는 None
+        return None
+
+    def poll(self) -> List[str]:
+        """마지막 poll 이후 변경된 테이블 목록 (첫 호출은 기준점만 기록하고 [])"""
+        conn = self._get_conn()
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._data_version:
+            return []
+        first = self._data_version is None
+        self._data_version = version
+
+        changed = []
+        for table, ts_expr in self.tables.items():
+            fp = self._fingerprint(table, ts_expr)
+            if not first and self._fingerprints.get(table) != fp:
+                changed.append(table)
+            self._fingerprints[table] = fp
+        return changed
+
+    def close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+
+def _default_predictor_factory(store_id: str):
+    from src.prediction.improved_predictor import ImprovedPredictor
+    return ImprovedPredictor(store_id=store_id)
+
+
+def _default_db_path(store_id: str) -> str:
+    from src.infrastructure.database.connection import DBRouter
+    return str(DBRouter.get_store_db_path(store_id))
+
+
+def _default_common_db_path() -> str:
+    from src.infrastructure.database.connection import DBRouter
+    return str(DBRouter.get_common_db_path())
+
+
+class WarmStorePredictor:
+    """매장 1개의 warm 예측기 (요청은 매장 락으로 직렬화)"""
+
+    def __init__(
+        self,
+        store_id: str,
+        predictor_factory: Optional[Callable[[str], Any]] = None,
+        db_path: Optional[str] = None,
+        common_db_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            store_id: 매장 코드
+            predictor_factory: store_id → ImprovedPredictor (테스트 주입용)
+            db_path: 변경 감시 대상 매장 DB 경로 (기본 DBRouter 매장 DB)
+            common_db_path: 변경 감시 대상 공통 DB 경로
+                (기본: db_path 미지정 시 DBRouter 공통 DB, 지정 시 감시 안 함)
+        """
+        self.store_id = store_id
+        self._factory = predictor_factory or _default_predictor_factory
+        self._watcher = TableChangeWatcher(db_path or _default_db_path(store_id))
+        if common_db_path is None and db_path is None:
+            common_db_path = _default_common_db_path()
+        self._common_watcher = (
+            TableChangeWatcher(common_db_path, COMMON_WATCHED_TABLES)
+            if common_db_path else None
+        )
+        self.lock = threading.Lock()
+        self._predictor = None
+        self._built_for: Optional[date] = None
+        self._model_sig: Optional[tuple] = None
+        self.stats: Dict[str, Any] = {
+            "requests": 0,
+            "rebuilds": 0,
+            "invalidations": 0,
+            "model_reloads": 0,
+            "last_invalidated": [],
+        }
+
+    # ── 준비/갱신 ──
+
+    def _build(self) -> None:
+        started = time.perf_counter()
+        predictor = self._factory(self.store_id)
+        predictor.enable_warm_caches()
+        ml = getattr(predictor, '_ml_predictor', None)
+        if ml is not None:
+            try:
+                ml.load_models()
+                ml.load_group_models()
+                self._model_sig = ml.model_signature()
+            except Exception as e:
+                logger.warning(f"[PredictionDaemon] {self.store_id} 모델 프리로드 실패 (지연 로드): {e}")
+        self._poll_changes()  # 변경 감지 기준점
+        self._predictor = predictor
+        self._built_for = date.today()
+        self.stats["rebuilds"] += 1
+        logger.info(
+            f"[PredictionDaemon] {self.store_id} 예측기 준비 "
+            f"({time.perf_counter() - started:.1f}s)"
+        )
+
+    def _refresh_models(self) -> None:
+        ml = getattr(self._predictor, '_ml_predictor', None)
+        if ml is None:
+            return
+        try:
+            sig = ml.model_signature()
+        except Exception:
+            return
+        if sig != self._model_sig:
+            ml.unload()
+            self._model_sig = sig
+            self.stats["model_reloads"] += 1
+            logger.info(f"[PredictionDaemon] {self.store_id} 모델 파일 변경 → 재로드")
+
+    def ensure_fresh(self) -> List[str]:
+        """날짜/데이터/모델 변경 반영 (매장 락 안에서 호출)
+
+        Returns:
+            무효화된 캐시 키 목록
+        """
+        if self._predictor is None or self._built_for != date.today():
+            self._build()
+            return []
+        self._refresh_models()
+        changed, common_changed = self._poll_changes()
+        if common_changed:
+            return self._invalidate(None)
+        if not changed:
+            return []
+        return self._invalidate(changed)
+
+    def _poll_changes(self) -> Tuple[List[str], List[str]]:
+        """(변경된 매장 DB 테이블, 변경된 공통 DB 테이블)"""
+        common_changed = (
+            self._common_watcher.poll() if self._common_watcher is not None else []
+        )
+        return self._watcher.poll(), common_changed
+
+    def _invalidate(self, tables: Optional[List[str]]) -> List[str]:
+        dropped = self._predictor.invalidate_warm_caches(tables)
+        self.stats["invalidations"] += 1
+        self.stats["last_invalidated"] = dropped
+        logger.info(
+            f"[PredictionDaemon] {self.store_id} 변경 테이블 {tables or '전체'} "
+            f"→ 캐시 무효화 {dropped}"
+        )
+        return dropped
+
+    def invalidate(self, tables: Optional[List[str]] = None) -> List[str]:
+        """명시적 무효화 (수집 직후 등) — 예측기 미준비 시 무시"""
+        with self.lock:
+            if self._predictor is None:
+                return []
+            return self._invalidate(tables)
+
+    # ── 예측 ──
+
+    def predict_candidates(
+        self,
+        target_date: Optional[datetime] = None,
+        min_order_qty: int = 1,
+        exclude_items: Optional[set] = None,
+        pending_cache: Optional[Dict[str, int]] = None,
+        stock_cache: Optional[Dict[str, int]] = None,
+    ) -> List[Any]:
+        """ImprovedPredictor.get_order_candidates (warm 캐시 사용)
+
+        요청별 pending/stock 캐시는 응답 후 해제하여 다음 요청에 남기지 않는다.
+        """
+        with self.lock:
+            self.ensure_fresh()
+            self.stats["requests"] += 1
+            predictor = self._predictor
+            try:
+                if pending_cache:
+                    predictor.set_pending_cache(pending_cache)
+                if stock_cache:
+                    predictor.set_stock_cache(stock_cache)
+                return predictor.get_order_candidates(
+                    target_date=target_date,
+                    min_order_qty=min_order_qty,
+                    exclude_items=exclude_items,
+                )
+            finally:
+                if pending_cache:
+                    predictor.clear_pending_cache()
+                if stock_cache:
+                    predictor.clear_stock_cache()
+
+    def predict_batch(
+        self,
+        item_codes: List[str],
+        target_date: Optional[datetime] = None,
+        pending_quantities: Optional[Dict[str, int]] = None,
+    ) -> List[Any]:
+        """ImprovedPredictor.predict_batch (warm 캐시 사용)"""
+        with self.lock:
+            self.ensure_fresh()
+            self.stats["requests"] += 1
+            return self._predictor.predict_batch(item_codes, target_date, pending_quantities)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "ready": self._predictor is not None,
+            "built_for": self._built_for.isoformat() if self._built_for else None,
+            **self.stats,
+        }
+
+    def close(self) -> None:
+        self._watcher.close()
+        if self._common_watcher is not None:
+            self._common_watcher.close()
+
+
+def _parse_target_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value)
+
+
+class _DaemonRequestHandler(BaseHTTPRequestHandler):
+    """PredictionDaemon HTTP 핸들러 (JSON 요청 → 압축 결과/JSON 응답)"""
+
+    server_version = "PredictionDaemon/1"
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler 시그니처
+        logger.debug(f"[PredictionDaemon] {self.address_string()} {format % args}")
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode("utf-8"),
+                   "application/json; charset=utf-8")
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length).decode("utf-8"))
+
+    def do_GET(self):
+        daemon: PredictionDaemon = self.server.daemon_ref
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok", "stores": daemon.status()})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        daemon: PredictionDaemon = self.server.daemon_ref
+        try:
+            body = self._read_json()
+        except ValueError:
+            self._send_json(400, {"error": "invalid json"})
+            return
+
+        store_id = body.get("store_id")
+        if store_id is not None:
+            store_id = str(store_id)
+            if not _STORE_ID_PATTERN.match(store_id):
+                self._send_json(400, {"error": "invalid store_id"})
+                return
+
+        try:
+            if self.path == "/invalidate":
+                result = daemon.invalidate(store_id, body.get("tables"))
+                self._send_json(200, {"invalidated": result})
+                return
+            if store_id is None:
+                self._send_json(400, {"error": "store_id required"})
+                return
+            store = daemon.get_store(store_id)
+            target_date = _parse_target_date(body.get("target_date"))
+            if self.path == "/predict/candidates":
+                exclude = body.get("exclude_items")
+                results = store.predict_candidates(
+                    target_date=target_date,
+                    min_order_qty=int(body.get("min_order_qty", 1)),
+                    exclude_items=set(exclude) if exclude else None,
+                    pending_cache=body.get("pending_cache"),
+                    stock_cache=body.get("stock_cache"),
+                )
+            elif self.path == "/predict/batch":
+                results = store.predict_batch(
+                    list(body.get("item_codes") or []),
+                    target_date=target_date,
+                    pending_quantities=body.get("pending_quantities"),
+                )
+            else:
+                self._send_json(404, {"error": "not found"})
+                return
+        except Exception as e:
+            logger.error(f"[PredictionDaemon] {self.path} 처리 실패 (store={store_id}): {e}")
+            self._send_json(500, {"error": str(e)})
+            return
+
+        self._send(200, pack_prediction_results(results), "application/octet-stream")
+
+
+class PredictionDaemon:
+    """매장별 warm 예측기를 보관하는 로컬 HTTP 예측 서비스"""
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        predictor_factory: Optional[Callable[[str], Any]] = None,
+        db_path_resolver: Optional[Callable[[str], str]] = None,
+    ):
+        """
+        Args:
+            host: 바인딩 주소 (로컬 전용)
+            port: 포트 (0이면 임의 포트)
+            predictor_factory: store_id → ImprovedPredictor (테스트 주입용)
+            db_path_resolver: store_id → 매장 DB 경로 (테스트 주입용)
+        """
+        self.host = host
+        self.port = port
+        self._factory = predictor_factory
+        self._db_path_resolver = db_path_resolver or _default_db_path
+        self._stores: Dict[str, WarmStorePredictor] = {}
+        self._stores_lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ── 매장 관리 ──
+
+    def get_store(self, store_id: str) -> WarmStorePredictor:
+        with self._stores_lock:
+            store = self._stores.get(store_id)
+            if store is None:
+                store = WarmStorePredictor(
+                    store_id,
+                    predictor_factory=self._factory,
+                    db_path=self._db_path_resolver(store_id),
+                )
+                self._stores[store_id] = store
+            return store
+
+    def warm_up(self, store_ids: List[str]) -> None:
+        """기동 시 매장 예측기/모델 미리 준비 (실패 매장은 첫 요청 때 재시도)"""
+        for store_id in store_ids:
+            store = self.get_store(store_id)
+            try:
+                with store.lock:
+                    store.ensure_fresh()
+            except Exception as e:
+                logger.warning(f"[PredictionDaemon] {store_id} 워밍업 실패: {e}")
+
+    def invalidate(self, store_id: Optional[str] = None, tables: Optional[List[str]] = None) -> Dict[str, List[str]]:
+        """매장(None=전체) 캐시 무효화 → {store_id: 무효화된 캐시 키}"""
+        with self._stores_lock:
+            targets = [s for sid, s in self._stores.items() if store_id in (None, sid)]
+        return {s.store_id: s.invalidate(tables) for s in targets}
+
+    def status(self) -> Dict[str, Any]:
+        with self._stores_lock:
+            stores = list(self._stores.values())
+        return {s.store_id: s.status() for s in stores}
+
+    # ── 서버 ──
+
+    def _make_server(self) -> ThreadingHTTPServer:
+        server = ThreadingHTTPServer((self.host, self.port), _DaemonRequestHandler)
+        server.daemon_threads = True
+        server.daemon_ref = self
+        self.port = server.server_address[1]
+        return server
+
+    def start(self) -> None:
+        """백그라운드 스레드에서 서비스 시작"""
+        if self._server is not None:
+            return
+        self._server = self._make_server()
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="prediction-daemon", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"[PredictionDaemon] 기동: http://{self.host}:{self.port}")
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 서비스 실행 (Ctrl+C까지 블로킹)"""
+        self._server = self._make_server()
+        logger.info(f"[PredictionDaemon] 기동: http://{self.host}:{self.port}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        if self._server is not None:
+            if self._thread is not None:
+                self._server.shutdown()
+                self._thread.join(timeout=5)
+                self._thread = None
+            self._server.server_close()
+            self._server = None
+        with self._stores_lock:
+            for store in self._stores.values():
+                store.close()
+            self._stores.clear()
+        logger.info("[PredictionDaemon] 종료")
+
+
+class PredictionDaemonClient:
+    """PredictionDaemon HTTP 클라이언트
+
+    predict_candidates()는 PredictionProcessPool.predict_candidates와 같은 시그니처로
+    PredictionResult 리스트를 반환한다.
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self.base_url = f"http://{host}:{port}"
+        self.timeout = timeout
+
+    def _post(self, path: str, payload: Dict[str, Any]) -> bytes:
+        req = urllib.request.Request(
+            self.base_url + path,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                return resp.read()
+        except urllib.error.HTTPError as e:
+            detail = e.read().decode("utf-8", errors="replace")
+            raise RuntimeError(f"PredictionDaemon {path} 실패 ({e.code}): {detail}") from e
+
+    def health(self, timeout: float = 1.0) -> Optional[Dict[str, Any]]:
+        """데몬 상태 (미기동/무응답이면 None)"""
+        try:
+            with urllib.request.urlopen(self.base_url + "/health", timeout=timeout) as resp:
+                return json.loads(resp.read().decode("utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def is_available(self) -> bool:
+        return self.health() is not None
+
+    def predict_candidates(
+        self,
+        store_id: str,
+        target_date: Optional[datetime] = None,
+        min_order_qty: int = 1,
+        exclude_items: Optional[set] = None,
+        pending_cache: Optional[Dict[str, int]] = None,
+        stock_cache: Optional[Dict[str, int]] = None,
+    ) -> List[Any]:
+        blob = self._post("/predict/candidates", {
+            "store_id": store_id,
+            "target_date": target_date.isoformat() if target_date else None,
+            "min_order_qty": min_order_qty,
+            "exclude_items": sorted(exclude_items) if exclude_items else None,
+            "pending_cache": dict(pending_cache) if pending_cache else None,
+            "stock_cache": dict(stock_cache) if stock_cache else None,
+        })
+        results = unpack_prediction_results(blob)
+        logger.info(f"[PredictionDaemon] {store_id} 예측 수신: {len(results)}건")
+        return results
+
+    def predict_batch(
+        self,
+        store_id: str,
+        item_codes: List[str],
+        target_date: Optional[datetime] = None,
+        pending_quantities: Optional[Dict[str, int]] = None,
+    ) -> List[Any]:
+        blob = self._post("/predict/batch", {
+            "store_id": store_id,
+            "item_codes": list(item_codes),
+            "target_date": target_date.isoformat() if target_date else None,
+            "pending_quantities": dict(pending_quantities) if pending_quantities else None,
+        })
+        return unpack_prediction_results(blob)
+
+    def invalidate(self, store_id: Optional[str] = None,
+                   tables: Optional[List[str]] = None) -> Dict[str, List[str]]:
+        blob = self._post("/invalidate", {"store_id": store_id, "tables": tables})
+        return json.loads(blob.decode("utf-8")).get("invalidated", {})
+
+
+_probe_lock = threading.Lock()
+_probe_state: Dict[str, Any] = {"expires": 0.0, "client": None}
+
+
+def get_prediction_daemon_client() -> Optional[PredictionDaemonClient]:
+    """기동 중인 예측 데몬 클라이언트 (없으면 None)
+
+    미기동 결과는 PROBE_INTERVAL_SEC 동안 캐시하여 호출마다 연결을 시도하지 않는다.
+    """
+    now = time.monotonic()
+    with _probe_lock:
+        if now < _probe_state["expires"]:
+            return _probe_state["client"]
+        client = PredictionDaemonClient()
+        if not client.is_available():
+            client = None
+        _probe_state["client"] = client
+        _probe_state["expires"] = now + PROBE_INTERVAL_SEC
+        return client
+
+
+def run_prediction_daemon(store_ids: Optional[List[str]] = None,
+                          host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    """예측 데몬 실행 (활성 매장 워밍업 후 블로킹)"""
+    if store_ids is None:
+        from src.settings.store_context import StoreContext
+        store_ids = [ctx.store_id for ctx in StoreContext.get_all_active()]
+    daemon = PredictionDaemon(host=host, port=port)
+    daemon.warm_up(store_ids)
+    daemon.serve_forever()
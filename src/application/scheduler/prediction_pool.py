@@ -0,0 +1,190 @@
+"""
+PredictionProcessPool -- 다매장 예측 전용 프로세스 풀
+
+MultiStoreRunner는 Selenium 수집/발주를 스레드로 병렬 실행하지만,
+예측 단계(ImprovedPredictor, 카테고리 전략, sklearn 추론)는 순수 Python
+CPU 작업이라 GIL 때문에 매장 수만큼 직렬화된다.
+
+이 모듈은 예측 단계만 별도 프로세스에서 실행한다.
+- 워커는 매장별 ImprovedPredictor를 직접 생성하여 자기 매장 DB만 연다
+- 결과는 컬럼 튜플 + pickle + zlib 로 압축 직렬화하여 부모로 반환
+- 수집/발주 제출(Selenium)은 기존처럼 매장 스레드에서 실행
+
+Usage:
+    with PredictionProcessPool(max_workers=4) as pool:
+        candidates = pool.predict_candidates("46513", min_order_qty=1)
+"""
+
+import multiprocessing
+import pickle
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 예측 결과 직렬화 포맷 버전 (필드 구성이 바뀌면 증가)
+_PACK_VERSION = 1
+
+_active_pool: Optional["PredictionProcessPool"] = None
+_active_lock = threading.Lock()
+
+
+def _result_fields() -> Tuple[str, ...]:
+    from src.prediction.improved_predictor import PredictionResult
+    return tuple(f.name for f in fields(PredictionResult))
+
+
+def pack_prediction_results(results: List[Any]) -> bytes:
+    """PredictionResult 리스트 → 압축 바이트
+
+    dataclass 인스턴스를 그대로 pickle하면 필드명이 행마다 반복되므로
+    (필드명 튜플, 값 튜플 리스트) 컬럼 형태로 변환 후 압축한다.
+    """
+    names = _result_fields()
+    rows = [tuple(getattr(r, n) for n in names) for r in results]
+    payload = pickle.dumps((_PACK_VERSION, names, rows), protocol=pickle.HIGHEST_PROTOCOL)
+    return zlib.compress(payload, 1)
+
+
+def unpack_prediction_results(blob: bytes) -> List[Any]:
+    """pack_prediction_results 역변환 → PredictionResult 리스트
+
+    워커/부모 간 PredictionResult 필드가 달라도 공통 필드만 복원한다.
+    """
+    from src.prediction.improved_predictor import PredictionResult
+
+    version, names, rows = pickle.loads(zlib.decompress(blob))
+    if version != _PACK_VERSION:
+        raise ValueError(f"지원하지 않는 예측 결과 포맷: v{version}")
+    known = set(_result_fields())
+    keep = [(i, n) for i, n in enumerate(names) if n in known]
+    return [PredictionResult(**{n: row[i] for i, n in keep}) for row in rows]
+
+
+def _predict_candidates_worker(
+    store_id: str,
+    target_date: Optional[datetime],
+    min_order_qty: int,
+    exclude_items: Optional[set],
+    pending_cache: Optional[Dict[str, int]],
+    stock_cache: Optional[Dict[str, int]],
+) -> bytes:
+    """워커 프로세스 진입점 — 매장 예측 후 압축 결과 반환"""
+    from src.prediction.improved_predictor import ImprovedPredictor
+
+    predictor = ImprovedPredictor(store_id=store_id)
+    if pending_cache:
+        predictor.set_pending_cache(pending_cache)
+    if stock_cache:
+        predictor.set_stock_cache(stock_cache)
+    results = predictor.get_order_candidates(
+        target_date=target_date,
+        min_order_qty=min_order_qty,
+        exclude_items=exclude_items,
+    )
+    return pack_prediction_results(results)
+
+
+class PredictionProcessPool:
+    """매장 예측 전용 프로세스 풀
+
+    with 블록 동안 전역 활성 풀로 등록되어,
+    AutoOrderSystem이 get_active_prediction_pool()로 찾아 사용한다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple = (),
+    ):
+        """
+        Args:
+            max_workers: 최대 워커 프로세스 수
+            initializer: 워커 프로세스 기동 시 1회 실행할 함수 (ProcessPoolExecutor 전달)
+            initargs: initializer 인자
+        """
+        self.max_workers = max_workers
+        self.initializer = initializer
+        self.initargs = initargs
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "PredictionProcessPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.shutdown()
+
+    def start(self) -> None:
+        """프로세스 풀 기동 + 활성 풀 등록
+
+        Windows 운영 환경과 동일하게 spawn 컨텍스트를 사용한다
+        (fork 시 부모의 SQLite 커넥션/드라이버 상태가 복제되는 문제 방지).
+        """
+        global _active_pool
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+        with _active_lock:
+            _active_pool = self
+        logger.info(f"[PredictionPool] 기동 (max_workers={self.max_workers})")
+
+    def shutdown(self) -> None:
+        """활성 풀 해제 + 프로세스 풀 종료"""
+        global _active_pool
+        with _active_lock:
+            if _active_pool is self:
+                _active_pool = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            logger.info("[PredictionPool] 종료")
+
+    def predict_candidates(
+        self,
+        store_id: str,
+        target_date: Optional[datetime] = None,
+        min_order_qty: int = 1,
+        exclude_items: Optional[set] = None,
+        pending_cache: Optional[Dict[str, int]] = None,
+        stock_cache: Optional[Dict[str, int]] = None,
+    ) -> List[Any]:
+        """ImprovedPredictor.get_order_candidates를 워커 프로세스에서 실행
+
+        호출 스레드는 결과가 돌아올 때까지 대기한다 (매장 스레드 기준 동기 호출).
+
+        Returns:
+            PredictionResult 리스트
+        """
+        if self._executor is None:
+            raise RuntimeError("PredictionProcessPool이 시작되지 않았습니다")
+        future = self._executor.submit(
+            _predict_candidates_worker,
+            store_id, target_date, min_order_qty,
+            set(exclude_items) if exclude_items else None,
+            dict(pending_cache) if pending_cache else None,
+            dict(stock_cache) if stock_cache else None,
+        )
+        blob = future.result()
+        results = unpack_prediction_results(blob)
+        logger.info(
+            f"[PredictionPool] {store_id} 예측 수신: {len(results)}건 "
+            f"({len(blob) / 1024:.0f}KB)"
+        )
+        return results
+
+
+def get_active_prediction_pool() -> Optional[PredictionProcessPool]:
+    """현재 활성화된 예측 프로세스 풀 (없으면 None)"""
+    return _active_pool
@@ -8,6 +8,7 @@ import statistics
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set, Tuple, Any
 
+from src.application.services.lifecycle_metrics import LifecycleMetricsEngine
 from src.infrastructure.database.connection import DBRouter
 from src.infrastructure.database.repos import (
     BeverageDecisionRepository,
@@ -45,6 +46,9 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 지표 엔진 판매 집계 로드 기간: 월별 4개월(120일) ⊇ 주별 8주, 직전 판단기간
+_METRICS_HISTORY_DAYS = 120
+
 
 class BeverageDecisionService:
     """음료 발주 유지/정지 판단 서비스"""
@@ -69,6 +73,9 @@ class BeverageDecisionService:
             logger.warning("[음료판단] 음료 상품 없음")
             return {"total_items": 0, "decisions": {}, "results": []}
 
+        # 행사/첫 입고일/판매 집계는 전체 상품 일괄 조회 (lifecycle-metrics)
+        self._set_metrics_engine(items, ref_date)
+
         # 2. 카테고리별 필터링
         target_set = set(target_categories) if target_categories else None
         results: List[Dict[str, Any]] = []
@@ -166,6 +173,7 @@ class BeverageDecisionService:
                 "is_rapid_decline_warning": is_warning,
                 "judgment_cycle": cycle.value,
             })
+        self._metrics = None
 
         # 8. 저장
         saved = self.decision_repo.save_decisions_batch(results)
@@ -314,22 +322,12 @@ class BeverageDecisionService:
 
     def _is_promo_protected(self, item_cd: str, ref_date: str) -> bool:
         """행사 종료 후 보호 기간 체크 (§4.0)"""
-        conn = DBRouter.get_store_connection(self.store_id)
+        last = self._metrics_engine().last_promotion(item_cd)
+        if not last:
+            return False
         try:
-            cursor = conn.execute("""
-                SELECT promo_type, MAX(sales_date) as last_promo_date
-                FROM daily_sales
-                WHERE item_cd = ? AND promo_type IS NOT NULL AND promo_type != ''
-                GROUP BY promo_type
-                ORDER BY last_promo_date DESC
-                LIMIT 1
-            """, (item_cd,))
-            row = cursor.fetchone()
-            if not row or not row[1]:
-                return False
-
-            promo_type = row[0]
-            last_promo_date = datetime.strptime(row[1], "%Y-%m-%d")
+            promo_type, last_date = last
+            last_promo_date = datetime.strptime(last_date, "%Y-%m-%d")
             ref = datetime.strptime(ref_date, "%Y-%m-%d")
 
             protection_weeks = PROMO_PROTECTION_WEEKS.get(promo_type, 0)
@@ -408,66 +406,37 @@ class BeverageDecisionService:
             ))
         return items
 
+    def _set_metrics_engine(self, items: List[BeverageItemContext], reference_date: str) -> None:
+        """음료 전체 상품 대상 지표 엔진 준비 (소분류/중분류 비교군 포함)"""
+        self._metrics = LifecycleMetricsEngine(
+            self.store_id,
+            [ctx.item_cd for ctx in items],
+            reference_date,
+            history_days=_METRICS_HISTORY_DAYS,
+        )
+        self._small_items: Dict[Tuple[str, str], List[str]] = {}
+        self._mid_items: Dict[str, List[str]] = {}
+        for ctx in items:
+            self._mid_items.setdefault(ctx.mid_cd, []).append(ctx.item_cd)
+            if ctx.small_nm:
+                self._small_items.setdefault((ctx.mid_cd, ctx.small_nm), []).append(ctx.item_cd)
+
+    def _metrics_engine(self, reference_date: Optional[str] = None) -> LifecycleMetricsEngine:
+        """run() 중이면 공유 엔진, 아니면 (또는 기준일이 다르면) 새로 준비"""
+        engine = getattr(self, "_metrics", None)
+        if engine is None or (reference_date and engine.reference_date != reference_date):
+            self._set_metrics_engine(
+                self._load_beverage_items(),
+                reference_date or datetime.now().strftime("%Y-%m-%d"),
+            )
+        return self._metrics
+
     def _resolve_first_receiving_date(
         self, item_cd: str,
     ) -> Tuple[Optional[str], FirstReceivingSource]:
-        """5소스 우선순위로 첫 입고일 판별 (디저트와 동일)"""
-        conn = DBRouter.get_store_connection(self.store_id)
-
-        # 1순위: detected_new_products
-        try:
-            cursor = conn.execute(
-                "SELECT first_receiving_date FROM detected_new_products "
-                "WHERE item_cd = ? ORDER BY first_receiving_date ASC LIMIT 1",
-                (item_cd,),
-            )
-            row = cursor.fetchone()
-            if row and row[0]:
-                return row[0], FirstReceivingSource.DETECTED
-        except Exception:
-            pass
-
-        # 2순위: 첫 판매일
-        try:
-            cursor = conn.execute(
-                "SELECT MIN(sales_date) FROM daily_sales "
-                "WHERE item_cd = ? AND sale_qty > 0",
-                (item_cd,),
-            )
-            row = cursor.fetchone()
-            if row and row[0]:
-                return row[0], FirstReceivingSource.DAILY_SALES_SOLD
-        except Exception:
-            pass
-
-        # 2-1순위: 첫 입고일
-        try:
-            cursor = conn.execute(
-                "SELECT MIN(sales_date) FROM daily_sales "
-                "WHERE item_cd = ? AND buy_qty > 0",
-                (item_cd,),
-            )
-            row = cursor.fetchone()
-            if row and row[0]:
-                return row[0], FirstReceivingSource.DAILY_SALES_BOUGHT
-        except Exception:
-            pass
-
-        # 3순위: products.created_at
-        try:
-            common_conn = DBRouter.get_connection(table="products")
-            cursor = common_conn.execute(
-                "SELECT created_at FROM products WHERE item_cd = ?",
-                (item_cd,),
-            )
-            row = cursor.fetchone()
-            if row and row[0]:
-                date_str = row[0][:10]
-                return date_str, FirstReceivingSource.PRODUCTS
-        except Exception:
-            pass
-
-        return None, FirstReceivingSource.NONE
+        """5소스 우선순위로 첫 입고일 판별 (디저트와 동일, 일괄등록 구분 없음)"""
+        first_date, source = self._metrics_engine().first_receiving(item_cd)
+        return first_date, FirstReceivingSource(source)
 
     def _get_judgment_period(
         self,
@@ -499,22 +468,12 @@ class BeverageDecisionService:
         reference_date: str,
     ) -> BeverageSalesMetrics:
         """판매 집계 + 매대효율지표 계산"""
-        conn = DBRouter.get_store_connection(self.store_id)
+        engine = self._metrics_engine(reference_date)
 
         # 현재 기간 집계
-        cursor = conn.execute("""
-            SELECT COALESCE(SUM(sale_qty), 0),
-                   COALESCE(SUM(disuse_qty), 0),
-                   COALESCE(SUM(ord_qty), 0)
-            FROM daily_sales
-            WHERE item_cd = ?
-              AND sales_date >= ? AND sales_date <= ?
-        """, (item_cd, period_start, period_end))
-
-        row = cursor.fetchone()
-        total_sale = row[0] if row else 0
-        total_disuse = row[1] if row else 0
-        total_order = row[2] if row else 0
+        total_sale, total_disuse, total_order = engine.period_totals(
+            item_cd, period_start, period_end
+        )
 
         sale_rate = calc_sale_rate(total_sale, total_disuse)
         sale_amount = total_sale * sell_price
@@ -528,12 +487,7 @@ class BeverageDecisionService:
         prev_start = (datetime.strptime(period_start, "%Y-%m-%d") -
                       timedelta(days=period_days)).strftime("%Y-%m-%d")
 
-        cursor = conn.execute("""
-            SELECT COALESCE(SUM(sale_qty), 0)
-            FROM daily_sales
-            WHERE item_cd = ? AND sales_date >= ? AND sales_date <= ?
-        """, (item_cd, prev_start, prev_end))
-        prev_sale = cursor.fetchone()[0]
+        prev_sale = engine.period_totals(item_cd, prev_start, prev_end)[0]
 
         trend_pct = 0.0
         if prev_sale > 0:
@@ -588,45 +542,24 @@ class BeverageDecisionService:
         Returns:
             (소분류 중위 판매량, 매대효율지표)
         """
-        conn = DBRouter.get_store_connection(self.store_id)
-        common_conn = DBRouter.get_connection(table="products")
+        engine = self._metrics_engine()
 
-        # 같은 소분류 상품 찾기
+        # 같은 소분류 상품 (소분류 없으면 중분류 전체)
         if small_nm:
-            cursor = common_conn.execute("""
-                SELECT p.item_cd FROM products p
-                JOIN product_details pd ON p.item_cd = pd.item_cd
-                WHERE pd.small_nm = ? AND p.mid_cd = ?
-            """, (small_nm, mid_cd))
+            peer_items = self._small_items.get((mid_cd, small_nm), [])
         else:
-            # 소분류 없으면 중분류 전체
-            cursor = common_conn.execute("""
-                SELECT item_cd FROM products WHERE mid_cd = ?
-            """, (mid_cd,))
-
-        peer_items = [r[0] for r in cursor.fetchall()]
+            peer_items = self._mid_items.get(mid_cd, [])
 
         if len(peer_items) <= 1:
             # 동일 소분류 1개뿐 → 중분류 폴백
-            cursor = common_conn.execute(
-                "SELECT item_cd FROM products WHERE mid_cd = ?", (mid_cd,),
-            )
-            peer_items = [r[0] for r in cursor.fetchall()]
+            peer_items = self._mid_items.get(mid_cd, [])
 
         if not peer_items:
             return 0.0, 0.0
 
-        # 각 상품의 기간 내 판매량
-        placeholders = ",".join("?" * len(peer_items))
-        cursor = conn.execute(f"""
-            SELECT item_cd, COALESCE(SUM(sale_qty), 0) as total_sale
-            FROM daily_sales
-            WHERE item_cd IN ({placeholders})
-              AND sales_date >= ? AND sales_date <= ?
-            GROUP BY item_cd
-        """, peer_items + [period_start, period_end])
-
-        peer_sales = [row[1] for row in cursor.fetchall()]
+        # 각 상품의 기간 내 판매량 (이력 있는 상품만)
+        sales = engine.period_sales(period_start, period_end)
+        peer_sales = [sales[c] for c in dict.fromkeys(peer_items) if c in sales]
 
         if not peer_sales:
             return 0.0, 0.0
@@ -647,77 +580,27 @@ class BeverageDecisionService:
         period_end: str,
     ) -> float:
         """소분류(또는 중분류) 평균 판매량"""
-        conn = DBRouter.get_store_connection(self.store_id)
-        common_conn = DBRouter.get_connection(table="products")
+        engine = self._metrics_engine()
 
         if small_nm:
-            cursor = common_conn.execute("""
-                SELECT p.item_cd FROM products p
-                JOIN product_details pd ON p.item_cd = pd.item_cd
-                WHERE pd.small_nm = ? AND p.mid_cd = ?
-            """, (small_nm, mid_cd))
+            same_items = self._small_items.get((mid_cd, small_nm), [])
         else:
-            cursor = common_conn.execute(
-                "SELECT item_cd FROM products WHERE mid_cd = ?", (mid_cd,),
-            )
+            same_items = self._mid_items.get(mid_cd, [])
 
-        same_items = [r[0] for r in cursor.fetchall()]
         if not same_items:
             return 0.0
-
-        placeholders = ",".join("?" * len(same_items))
-        cursor = conn.execute(f"""
-            SELECT COALESCE(SUM(sale_qty), 0), COUNT(DISTINCT item_cd)
-            FROM daily_sales
-            WHERE item_cd IN ({placeholders})
-              AND sales_date >= ? AND sales_date <= ?
-        """, same_items + [period_start, period_end])
-
-        row = cursor.fetchone()
-        total = row[0] if row else 0
-        item_count = row[1] if row else 0
-
-        if item_count == 0:
-            return 0.0
-        return round(total / item_count, 2)
+        return engine.average_sale(same_items, period_start, period_end)
 
     def _aggregate_weekly_rates(
         self, item_cd: str, reference_date: str, weeks: int = 8,
     ) -> List[float]:
         """최근 N주 각각의 판매율"""
-        conn = DBRouter.get_store_connection(self.store_id)
-        ref = datetime.strptime(reference_date, "%Y-%m-%d")
-        rates = []
-
-        for w in range(weeks):
-            end = ref - timedelta(days=7 * w)
-            start = end - timedelta(days=7)
-            cursor = conn.execute("""
-                SELECT COALESCE(SUM(sale_qty), 0), COALESCE(SUM(disuse_qty), 0)
-                FROM daily_sales
-                WHERE item_cd = ? AND sales_date > ? AND sales_date <= ?
-            """, (item_cd, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")))
-            row = cursor.fetchone()
-            rates.append(calc_sale_rate(row[0], row[1]))
-
-        return rates
+        windows = self._metrics_engine(reference_date).window_totals(item_cd, 7, weeks)
+        return [calc_sale_rate(sale, disuse) for sale, disuse, _ in windows]
 
     def _aggregate_monthly_qtys(
         self, item_cd: str, reference_date: str, months: int = 4,
     ) -> List[int]:
         """최근 N개월 각각의 판매수량"""
-        conn = DBRouter.get_store_connection(self.store_id)
-        ref = datetime.strptime(reference_date, "%Y-%m-%d")
-        qtys = []
-
-        for m in range(months):
-            end = ref - timedelta(days=30 * m)
-            start = end - timedelta(days=30)
-            cursor = conn.execute("""
-                SELECT COALESCE(SUM(sale_qty), 0)
-                FROM daily_sales
-                WHERE item_cd = ? AND sales_date > ? AND sales_date <= ?
-            """, (item_cd, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")))
-            qtys.append(cursor.fetchone()[0])
-
-        return qtys
+        windows = self._metrics_engine(reference_date).window_totals(item_cd, 30, months)
+        return [sale for sale, _, _ in windows]
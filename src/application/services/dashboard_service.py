@@ -25,6 +25,49 @@ _MID_CD_NAMES = {
 }
 
 
+def format_waste_risk_products(
+    items: List[Dict[str, Any]], now: Optional[datetime] = None, limit: int = 20
+) -> List[Dict[str, Any]]:
+    """폐기 위험 상품 → 점주 대시보드 표시용 (만료 시각 '오늘 HH:MM' / 'MM/DD HH:MM')"""
+    today = (now or datetime.now()).strftime("%Y-%m-%d")
+    result = []
+    for item in items[:limit]:
+        expiry_date = item.get("expiry_date", "")
+        # 만료 시간 포맷팅
+        expires_at = expiry_date
+        try:
+            if " " in expiry_date:
+                # %H:%M:%S 또는 %H:%M 두 포맷 모두 처리
+                for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
+                    try:
+                        dt = datetime.strptime(expiry_date, fmt)
+                        break
+                    except ValueError:
+                        continue
+                else:
+                    dt = None
+                if dt:
+                    if dt.strftime("%Y-%m-%d") == today:
+                        expires_at = "오늘 " + dt.strftime("%H:%M")
+                    else:
+                        expires_at = dt.strftime("%m/%d %H:%M")
+            else:
+                dt = datetime.strptime(expiry_date, "%Y-%m-%d")
+                if expiry_date == today:
+                    expires_at = "오늘"
+                else:
+                    expires_at = dt.strftime("%m/%d")
+        except Exception:
+            pass
+
+        result.append({
+            "name": item.get("item_nm", ""),
+            "expires_at": expires_at,
+            "quantity": item.get("remaining_qty", 0),
+        })
+    return result
+
+
 class DashboardService:
     """웹 대시보드 데이터 서비스
 
@@ -343,20 +386,22 @@ class DashboardService:
         finally:
             conn.close()
 
-        stage = "idle"
-        if script_task and script_task.get("process"):
-            proc = script_task["process"]
-            if proc.poll() is None:
-                stage = "running"
-
         return {
-            "stage": stage,
+            "stage": self.pipeline_stage(script_task),
             "last_collection": coll[0] if coll else None,
             "last_prediction": pred[0] if pred else None,
             "last_evaluation": eval_row[0] if eval_row else None,
             "last_order": ordr[0] if ordr else None,
         }
 
+    @staticmethod
+    def pipeline_stage(script_task=None) -> str:
+        """웹에서 실행한 스크립트 진행 여부 (running/idle)"""
+        if script_task and script_task.get("process"):
+            if script_task["process"].poll() is None:
+                return "running"
+        return "idle"
+
     def get_recent_events(self) -> List[Dict[str, Any]]:
         """최근 이벤트 10건"""
         conn = self._get_conn()
@@ -500,43 +545,239 @@ class DashboardService:
             return []
         return [r[1] for r in rows]
 
+    def get_sales_overview(self) -> Dict[str, Any]:
+        """오늘/어제 매출 + 이번달 순수익 (홈 요약용)
+
+        hourly_sales_detail.sale_amt 실제 매출 우선, 없으면 daily_sales qty*price 폴백.
+        """
+        today_sales = 0
+        today_sales_diff = 0
+        monthly_profit = 0
+        try:
+            conn = self._get_conn()
+            try:
+                today = datetime.now().strftime("%Y-%m-%d")
+                yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+                today_sales = self._sales_amount(conn, today)
+                yest_sales = self._sales_amount(conn, yesterday)
+                if yest_sales > 0:
+                    today_sales_diff = round(
+                        (today_sales - yest_sales) / yest_sales * 100, 1
+                    )
+
+                # 이번달 순수익 (hourly_sales_detail.sale_amt × margin_rate 기반)
+                row_month = conn.execute("""
+                    SELECT COALESCE(SUM(
+                        hsd.sale_amt * COALESCE(pd.margin_rate, 25) / 100.0
+                    ), 0)
+                    FROM hourly_sales_detail hsd
+                    LEFT JOIN product_details pd ON hsd.item_cd = pd.item_cd
+                    WHERE hsd.sales_date >= date('now', 'start of month')
+                """).fetchone()
+                monthly_profit = int(row_month[0]) if row_month else 0
+                if not monthly_profit:
+                    row_month = conn.execute("""
+                        SELECT COALESCE(SUM(
+                            ds.sale_qty * COALESCE(pd.sell_price, 0)
+                            * COALESCE(pd.margin_rate, 25) / 100.0
+                        ), 0)
+                        FROM daily_sales ds
+                        LEFT JOIN product_details pd ON ds.item_cd = pd.item_cd
+                        WHERE ds.sales_date >= date('now', 'start of month')
+                    """).fetchone()
+                    monthly_profit = int(row_month[0]) if row_month else 0
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning("홈 매출 쿼리 실패: %s", e)
+
+        return {
+            "today_sales": today_sales,
+            "today_sales_diff": today_sales_diff,
+            "monthly_profit": monthly_profit,
+        }
+
+    @staticmethod
+    def _sales_amount(conn: sqlite3.Connection, sales_date: str) -> float:
+        """일 매출액 (hourly_sales_detail 우선, 폴백: daily_sales qty*price)"""
+        row = conn.execute("""
+            SELECT COALESCE(SUM(sale_amt), 0)
+            FROM hourly_sales_detail
+            WHERE sales_date = ?
+        """, (sales_date,)).fetchone()
+        amount = row[0] if row else 0
+        if not amount:
+            row = conn.execute("""
+                SELECT COALESCE(SUM(ds.sale_qty * COALESCE(pd.sell_price, 0)), 0)
+                FROM daily_sales ds
+                LEFT JOIN product_details pd ON ds.item_cd = pd.item_cd
+                WHERE ds.sales_date = ?
+            """, (sales_date,)).fetchone()
+            amount = row[0] if row else 0
+        return amount
+
+    def get_weekly_analytics(self) -> Dict[str, Any]:
+        """이번주 현황 (7일 매출/발주/폐기 + 당일 시간대별 매출)"""
+        day_labels = ["월", "화", "수", "목", "금", "토", "일"]
+        daily_sales = []
+        days = []
+        date_range = ""
+        total_sales = 0
+        total_ordered = 0
+        total_waste = 0
+
+        try:
+            conn = self._get_conn()
+            try:
+                # 7일 매출 (hourly_sales_detail.sale_amt 실제 매출 우선, 폴백: qty*price)
+                sales_rows = conn.execute("""
+                    SELECT sales_date, COALESCE(SUM(sale_amt), 0)
+                    FROM hourly_sales_detail
+                    WHERE sales_date >= date('now', '-7 days')
+                    GROUP BY sales_date
+                    ORDER BY sales_date ASC
+                """).fetchall()
+                if not sales_rows:
+                    sales_rows = conn.execute("""
+                        SELECT ds.sales_date, COALESCE(SUM(ds.sale_qty * COALESCE(pd.sell_price, 0)), 0)
+                        FROM daily_sales ds
+                        LEFT JOIN product_details pd ON ds.item_cd = pd.item_cd
+                        WHERE ds.sales_date >= date('now', '-7 days')
+                        GROUP BY ds.sales_date
+                        ORDER BY ds.sales_date ASC
+                    """).fetchall()
+
+                for r in sales_rows:
+                    daily_sales.append(r[1])
+                    try:
+                        dt = datetime.strptime(r[0], "%Y-%m-%d")
+                        days.append(day_labels[dt.weekday()])
+                    except Exception:
+                        days.append("")
+
+                if sales_rows and len(sales_rows) >= 2:
+                    try:
+                        start = datetime.strptime(sales_rows[0][0], "%Y-%m-%d")
+                        end = datetime.strptime(sales_rows[-1][0], "%Y-%m-%d")
+                        date_range = "%d월 %d일 - %d월 %d일" % (
+                            start.month, start.day, end.month, end.day
+                        )
+                    except Exception:
+                        pass
+
+                total_sales = sum(daily_sales)
+
+                # 발주 건수
+                order_row = conn.execute("""
+                    SELECT COALESCE(SUM(order_qty), 0), COUNT(*)
+                    FROM order_tracking
+                    WHERE order_date >= date('now', '-7 days')
+                """).fetchone()
+                total_ordered = order_row[1] if order_row else 0
+
+                # 폐기 건수
+                waste_row = conn.execute("""
+                    SELECT COALESCE(SUM(disuse_qty), 0), COUNT(*)
+                    FROM daily_sales
+                    WHERE sales_date >= date('now', '-7 days')
+                      AND disuse_qty > 0
+                """).fetchone()
+                total_waste = waste_row[1] if waste_row else 0
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning("주간 분석 쿼리 실패: %s", e)
+
+        avg_daily = int(total_sales / len(daily_sales)) if daily_sales else 0
+
+        # 발주 적중률
+        order_accuracy = 0
+        if total_ordered > 0:
+            order_accuracy = round(
+                max(0, min(100, (1 - total_waste / max(total_ordered, 1)) * 100)), 1
+            )
+
+        # 시간대별 매출 (hourly_sales_detail 실제 매출, 당일)
+        hourly_data = []
+        try:
+            h_conn = self._get_conn()
+            try:
+                today_str = datetime.now().strftime("%Y-%m-%d")
+                h_rows = h_conn.execute("""
+                    SELECT hour, COALESCE(SUM(sale_amt), 0)
+                    FROM hourly_sales_detail
+                    WHERE sales_date = ?
+                    GROUP BY hour
+                    ORDER BY hour ASC
+                """, (today_str,)).fetchall()
+                hourly_map = {r[0]: r[1] for r in h_rows}
+                for h in range(24):
+                    hourly_data.append(hourly_map.get(h, 0))
+            finally:
+                h_conn.close()
+        except Exception as e:
+            logger.warning("시간대별 매출 조회 실패: %s", e)
+            hourly_data = [0] * 24
+
+        return {
+            "daily_sales": daily_sales,
+            "days": days,
+            "date_range": date_range,
+            "order_accuracy": order_accuracy,
+            "waste_saved": total_waste,
+            "waste_saved_diff": 0,
+            "total_sales": total_sales,
+            "avg_daily_sales": avg_daily,
+            "order_count": total_ordered,
+            "waste_count": total_waste,
+            "hourly_sales": hourly_data,
+        }
+
     def get_store_comparison(self) -> List[Dict[str, Any]]:
         """매장 간 비교 요약 (전체 매장 대상)
 
+        매장별 comparison 스냅샷(dashboard-snapshot)을 1회 조회로 읽고,
+        스냅샷이 없거나 오래된 매장만 즉시 계산해 갱신한다.
+
         Returns:
             [{"store_id", "store_name", "today_orders", "today_qty",
               "categories", "last_collection", "last_order"}, ...]
         """
+        from src.application.services.dashboard_snapshot_service import (
+            SECTION_COMPARISON,
+            DashboardSnapshotService,
+        )
         from src.settings.store_context import StoreContext
 
         stores = StoreContext.get_all_active()
+        snapshots = DashboardSnapshotService.load_fresh(
+            SECTION_COMPARISON, [ctx.store_id for ctx in stores]
+        )
         results = []
 
         for ctx in stores:
-            svc = DashboardService(store_id=ctx.store_id)
-            try:
-                summary = svc.get_today_summary()
-                pipeline = svc.get_pipeline_status()
-                results.append({
-                    "store_id": ctx.store_id,
-                    "store_name": ctx.store_name,
-                    "today_orders": summary.get("order_items", 0),
-                    "today_qty": summary.get("total_qty", 0),
-                    "categories": summary.get("categories", 0),
-                    "last_collection": pipeline.get("last_collection"),
-                    "last_order": pipeline.get("last_order"),
-                })
-            except Exception as e:
-                logger.warning(f"매장 비교 실패: {ctx.store_id}: {e}")
-                results.append({
-                    "store_id": ctx.store_id,
-                    "store_name": ctx.store_name,
-                    "today_orders": 0,
-                    "today_qty": 0,
-                    "categories": 0,
-                    "last_collection": None,
-                    "last_order": None,
-                    "error": str(e),
-                })
+            row = snapshots.get(ctx.store_id)
+            if row is None:
+                try:
+                    row = DashboardSnapshotService(ctx.store_id).get_data(SECTION_COMPARISON)
+                except Exception as e:
+                    logger.warning(f"매장 비교 실패: {ctx.store_id}: {e}")
+                    results.append({
+                        "store_id": ctx.store_id,
+                        "store_name": ctx.store_name,
+                        "today_orders": 0,
+                        "today_qty": 0,
+                        "categories": 0,
+                        "last_collection": None,
+                        "last_order": None,
+                        "error": str(e),
+                    })
+                    continue
+            results.append({
+                "store_id": ctx.store_id,
+                "store_name": ctx.store_name,
+                **row,
+            })
 
         return results
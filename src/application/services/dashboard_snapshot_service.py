@@ -0,0 +1,274 @@
+"""
+DashboardSnapshotService — 홈 대시보드 스냅샷 (dashboard-snapshot)
+
+수집/발주/폐기 잡 종료 시 DashboardService 집계를 섹션별 JSON 으로
+common.db dashboard_snapshots 에 기록합니다. /api/home/* 는 스냅샷 1행을
+읽어 ETag 와 함께 응답합니다. 스냅샷은 날짜가 바뀌거나 웹 쓰기로
+무효화될 때까지 유효하며, 유효한 스냅샷이 없으면 해당 섹션만 즉시 계산합니다.
+조회는 읽기 전용이라 계산 결과를 저장하지 않고 (원격 웹앱 common.db 를
+바꾸지 않도록) DASHBOARD_ONDEMAND_CACHE_TTL_SEC 동안 프로세스 메모리에만
+보관합니다. 웹 쓰기 경로는 invalidate_dashboard_snapshot() /
+refresh_dashboard_snapshot() 으로 스냅샷과 메모리 캐시를 무효화·갱신합니다.
+
+섹션:
+    status      /api/home/status (scheduler, pipeline.stage 는 요청 시 덧붙임)
+    summary     /api/home/summary
+    weekly      /api/home/analytics/weekly
+    waste_risk  /api/home/waste-risk-products
+    comparison  DashboardService.get_store_comparison 매장별 행
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.application.services.dashboard_service import (
+    DashboardService,
+    format_waste_risk_products,
+)
+from src.infrastructure.database.repos.dashboard_snapshot_repo import (
+    DashboardSnapshotRepository,
+    dump_payload,
+    payload_etag,
+)
+from src.settings.constants import DASHBOARD_ONDEMAND_CACHE_TTL_SEC
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SECTION_STATUS = "status"
+SECTION_SUMMARY = "summary"
+SECTION_WEEKLY = "weekly"
+SECTION_WASTE_RISK = "waste_risk"
+SECTION_COMPARISON = "comparison"
+
+SECTIONS = (
+    SECTION_STATUS,
+    SECTION_SUMMARY,
+    SECTION_WEEKLY,
+    SECTION_WASTE_RISK,
+    SECTION_COMPARISON,
+)
+
+# 유효 스냅샷이 없을 때 요청 시 계산한 섹션 {(cache_key, section): (만료 monotonic, row)}
+_ondemand_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, str]]] = {}
+_ondemand_lock = threading.Lock()
+
+
+def compute_section(cache_key: str, section: str, svc: DashboardService) -> Dict[str, str]:
+    """섹션 즉시 계산 (유효 스냅샷이 없을 때, TTL 동안 프로세스 메모리 캐시)
+
+    Args:
+        cache_key: 캐시 구분 키 (매장 코드, 단일 DB 조회는 DB 경로)
+
+    Returns:
+        {"payload": JSON 문자열, "etag", "generated_at"}
+    """
+    key = (cache_key, section)
+    now = time.monotonic()
+    with _ondemand_lock:
+        cached = _ondemand_cache.get(key)
+    if cached is not None and now < cached[0]:
+        return cached[1]
+
+    payload = dump_payload(build_sections(svc, [section])[section])
+    row = {
+        "payload": payload,
+        "etag": payload_etag(payload),
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    with _ondemand_lock:
+        _ondemand_cache[key] = (now + DASHBOARD_ONDEMAND_CACHE_TTL_SEC, row)
+    return row
+
+
+def clear_ondemand_cache(store_id: Optional[str] = None) -> None:
+    """요청 시 계산 캐시 비우기 (store_id 없으면 전 매장)"""
+    with _ondemand_lock:
+        if store_id is None:
+            _ondemand_cache.clear()
+            return
+        for key in [k for k in _ondemand_cache if k[0] == store_id]:
+            del _ondemand_cache[key]
+
+
+def build_sections(
+    svc: DashboardService, sections: Iterable[str] = SECTIONS
+) -> Dict[str, Any]:
+    """DashboardService 집계 → 섹션별 데이터
+
+    여러 섹션이 쓰는 최근 발주/폐기 위험/오늘 요약/파이프라인은 1회만 조회한다.
+    """
+    cached: Dict[str, Any] = {}
+
+    def shared(method: str) -> Any:
+        if method not in cached:
+            cached[method] = getattr(svc, method)()
+        return cached[method]
+
+    result: Dict[str, Any] = {}
+    for section in sections:
+        if section == SECTION_STATUS:
+            result[section] = {
+                "last_order": shared("get_last_order"),
+                "today_summary": shared("get_today_summary"),
+                "expiry_risk": shared("get_expiry_risk"),
+                "pipeline": shared("get_pipeline_status"),
+                "recent_events": svc.get_recent_events(),
+                "fail_reasons": svc.get_fail_reasons(),
+                "order_trend_7d": svc.get_order_trend_7d(),
+                "sales_trend_7d": svc.get_sales_trend_7d(),
+                "waste_trend_7d": svc.get_waste_trend_7d(),
+            }
+        elif section == SECTION_SUMMARY:
+            result[section] = _build_summary(
+                shared("get_last_order"), shared("get_expiry_risk"), svc.get_sales_overview()
+            )
+        elif section == SECTION_WEEKLY:
+            result[section] = svc.get_weekly_analytics()
+        elif section == SECTION_WASTE_RISK:
+            result[section] = format_waste_risk_products(
+                _expiry_items(shared("get_expiry_risk"))
+            )
+        elif section == SECTION_COMPARISON:
+            today, pipeline = shared("get_today_summary"), shared("get_pipeline_status")
+            result[section] = {
+                "today_orders": today.get("order_items", 0),
+                "today_qty": today.get("total_qty", 0),
+                "categories": today.get("categories", 0),
+                "last_collection": pipeline.get("last_collection"),
+                "last_order": pipeline.get("last_order"),
+            }
+        else:
+            raise ValueError(f"알 수 없는 대시보드 섹션: {section}")
+    return result
+
+
+def _expiry_items(expiry: Any) -> list:
+    return expiry.get("items", []) if isinstance(expiry, dict) else []
+
+
+def _build_summary(
+    last_order: Dict[str, Any], expiry: Any, sales: Dict[str, Any]
+) -> Dict[str, Any]:
+    """점주용 홈 요약 (발주핏 v2 대시보드)"""
+    if last_order.get("success_count", 0) > 0 and last_order.get("fail_count", 0) == 0:
+        order_status = "completed"
+    elif last_order.get("fail_count", 0) > 0:
+        order_status = "failed"
+    else:
+        order_status = "pending"
+
+    return {
+        "order_status": order_status,
+        "order_time": last_order.get("time", "07:00"),
+        "today_sales": sales["today_sales"],
+        "today_sales_diff": sales["today_sales_diff"],
+        "waste_risk_count": len(_expiry_items(expiry)),
+        "monthly_profit": sales["monthly_profit"],
+        "order_success": last_order.get("success_count", 0),
+        "order_fail": last_order.get("fail_count", 0),
+    }
+
+
+def is_stale(generated_at: Optional[str], now: Optional[datetime] = None) -> bool:
+    """스냅샷 만료 여부 (다른 날짜에 생성됨 — 같은 날 변경은 잡 갱신/웹 쓰기 무효화로 반영)"""
+    if not generated_at:
+        return True
+    try:
+        generated = datetime.fromisoformat(generated_at)
+    except ValueError:
+        return True
+    return generated.date() != (now or datetime.now()).date()
+
+
+class DashboardSnapshotService:
+    """매장별 홈 대시보드 스냅샷 생성/조회
+
+    Usage:
+        DashboardSnapshotService("46513").refresh()        # 잡 종료 시
+        row = DashboardSnapshotService("46513").get("summary")  # 읽기 전용
+        row["payload"], row["etag"]
+    """
+
+    def __init__(
+        self,
+        store_id: str,
+        repo: Optional[DashboardSnapshotRepository] = None,
+        service: Optional[DashboardService] = None,
+    ):
+        self.store_id = store_id
+        self.repo = repo or DashboardSnapshotRepository()
+        self.service = service or DashboardService(store_id=store_id)
+
+    def refresh(self, sections: Iterable[str] = SECTIONS) -> Dict[str, str]:
+        """섹션 재계산 후 저장
+
+        Returns:
+            {section: etag}
+        """
+        data = build_sections(self.service, sections)
+        return self.repo.save_sections(self.store_id, data)
+
+    def get(self, section: str) -> Dict[str, str]:
+        """스냅샷 조회 (읽기 전용 — 없거나 만료 시 해당 섹션만 계산, 저장 안 함)
+
+        계산 결과는 DASHBOARD_ONDEMAND_CACHE_TTL_SEC 동안 프로세스 메모리에 보관한다.
+
+        Returns:
+            {"payload": JSON 문자열, "etag", "generated_at"}
+        """
+        row = self.repo.get(self.store_id, section)
+        if row is not None and not is_stale(row["generated_at"]):
+            return row
+
+        return compute_section(self.store_id, section, self.service)
+
+    def get_data(self, section: str) -> Any:
+        return json.loads(self.get(section)["payload"])
+
+    @staticmethod
+    def load_fresh(
+        section: str,
+        store_ids: Iterable[str],
+        repo: Optional[DashboardSnapshotRepository] = None,
+    ) -> Dict[str, Any]:
+        """여러 매장의 유효한 스냅샷 데이터 (1회 조회, 만료/누락 매장 제외)"""
+        repo = repo or DashboardSnapshotRepository()
+        try:
+            rows = repo.get_for_stores(section, store_ids)
+        except Exception as e:
+            logger.warning(f"[DashboardSnapshot] {section} 일괄 조회 실패: {e}")
+            return {}
+        return {
+            store_id: json.loads(row["payload"])
+            for store_id, row in rows.items()
+            if not is_stale(row["generated_at"])
+        }
+
+
+def refresh_dashboard_snapshot(store_id: str) -> bool:
+    """스케줄러 잡 종료 후 호출 — 실패해도 잡 결과에 영향 없음"""
+    clear_ondemand_cache(store_id)
+    try:
+        DashboardSnapshotService(store_id).refresh()
+        return True
+    except Exception as e:
+        logger.warning(f"[DashboardSnapshot] {store_id} 스냅샷 갱신 실패 (무시): {e}")
+        return False
+
+
+def invalidate_dashboard_snapshot(store_id: Optional[str] = None) -> bool:
+    """웹 쓰기 경로에서 호출 — 스냅샷 삭제 (store_id 없으면 전 매장)
+
+    다음 조회부터 다음 잡 갱신 전까지 해당 매장은 요청 시 계산된다.
+    """
+    clear_ondemand_cache(store_id)
+    try:
+        DashboardSnapshotRepository().delete(store_id)
+        return True
+    except Exception as e:
+        logger.warning(f"[DashboardSnapshot] {store_id or '전체'} 스냅샷 무효화 실패 (무시): {e}")
+        return False
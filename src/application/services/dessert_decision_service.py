@@ -7,6 +7,7 @@ DessertDecisionService -- 디저트 발주 유지/정지 판단 오케스트레
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set, Tuple, Any
 
+from src.application.services.lifecycle_metrics import LifecycleMetricsEngine
 from src.infrastructure.database.connection import DBRouter, attach_common_with_views
 from src.infrastructure.database.repos import (
     DessertDecisionRepository,
@@ -46,6 +47,9 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 지표 엔진 판매 집계 로드 기간: 월별 3개월(90일) ⊇ 주별 8주, 직전 판단기간
+_METRICS_HISTORY_DAYS = 90
+
 
 class DessertDecisionService:
     """디저트 발주 유지/정지 판단 서비스"""
@@ -75,6 +79,9 @@ class DessertDecisionService:
             logger.warning("[디저트판단] mid_cd='014' 상품 없음")
             return {"total_items": 0, "decisions": {}, "results": []}
 
+        # 첫 입고일/행사/판매 집계는 전체 상품 일괄 조회 (lifecycle-metrics)
+        self._set_metrics_engine(items, ref_date)
+
         # 2. 카테고리별 필터링
         target_set = set(target_categories) if target_categories else None
         results: List[Dict[str, Any]] = []
@@ -172,6 +179,7 @@ class DessertDecisionService:
                 "is_rapid_decline_warning": is_warning,
                 "judgment_cycle": cycle.value,
             })
+        self._metrics = None
 
         # 7. 저장
         saved = self.decision_repo.save_decisions_batch(results)
@@ -506,6 +514,31 @@ class DessertDecisionService:
             ))
         return items
 
+    def _set_metrics_engine(self, items: List[DessertItemContext], reference_date: str) -> None:
+        """디저트 전체 상품 대상 지표 엔진 준비 (카테고리 평균 비교군 포함)"""
+        self._metrics = LifecycleMetricsEngine(
+            self.store_id,
+            [ctx.item_cd for ctx in items],
+            reference_date,
+            buy_mid_cd="014",
+            bulk_registration_dates=DESSERT_BULK_REGISTRATION_DATES,
+            history_days=_METRICS_HISTORY_DAYS,
+        )
+        self._category_items: Dict[DessertCategory, List[str]] = {}
+        for ctx in items:
+            category = classify_dessert_category(ctx.small_nm, ctx.expiration_days)
+            self._category_items.setdefault(category, []).append(ctx.item_cd)
+
+    def _metrics_engine(self, reference_date: Optional[str] = None) -> LifecycleMetricsEngine:
+        """run() 중이면 공유 엔진, 아니면 (또는 기준일이 다르면) 새로 준비"""
+        engine = getattr(self, "_metrics", None)
+        if engine is None or (reference_date and engine.reference_date != reference_date):
+            self._set_metrics_engine(
+                self._load_dessert_items(),
+                reference_date or datetime.now().strftime("%Y-%m-%d"),
+            )
+        return self._metrics
+
     def _resolve_first_receiving_date(
         self, item_cd: str,
     ) -> Tuple[Optional[str], FirstReceivingSource]:
@@ -515,97 +548,18 @@ class DessertDecisionService:
             1.   detected_new_products.first_receiving_date → DETECTED
             2.   MIN(sales_date) WHERE sale_qty > 0         → DAILY_SALES_SOLD
             2-1. MIN(sales_date) WHERE buy_qty > 0          → DAILY_SALES_BOUGHT
+                 (입고는 됐으나 판매가 한 번도 없는 상품, mid_cd='014' 한정)
             3.   products.created_at (bulk date detection)  → PRODUCTS / PRODUCTS_BULK
             4.   Fallback                                   → (None, NONE)
-        """
-        conn = DBRouter.get_store_connection(self.store_id)
-
-        # 1순위: detected_new_products
-        try:
-            cursor = conn.execute(
-                "SELECT first_receiving_date FROM detected_new_products "
-                "WHERE item_cd = ? ORDER BY first_receiving_date ASC LIMIT 1",
-                (item_cd,)
-            )
-            row = cursor.fetchone()
-            if row and row[0]:
-                return row[0], FirstReceivingSource.DETECTED
-        except Exception:
-            pass
 
-        # 2순위: 첫 판매일 (sale_qty > 0)
-        try:
-            cursor = conn.execute(
-                "SELECT MIN(sales_date) FROM daily_sales "
-                "WHERE item_cd = ? AND sale_qty > 0",
-                (item_cd,)
-            )
-            row = cursor.fetchone()
-            if row and row[0]:
-                return row[0], FirstReceivingSource.DAILY_SALES_SOLD
-        except Exception:
-            pass
-
-        # 2-1순위: 첫 입고일 (buy_qty > 0, 판매 없는 상품만 여기 도달)
-        try:
-            first_buy = self._query_first_buy_date(item_cd)
-            if first_buy:
-                return first_buy, FirstReceivingSource.DAILY_SALES_BOUGHT
-        except Exception:
-            pass
-
-        # 3순위: products.created_at (일괄등록 감지)
-        try:
-            common_conn = DBRouter.get_connection(table="products")
-            cursor = common_conn.execute(
-                "SELECT created_at FROM products WHERE item_cd = ?",
-                (item_cd,)
-            )
-            row = cursor.fetchone()
-            if row and row[0]:
-                date_str = row[0][:10]  # ISO datetime → date
-                if date_str in DESSERT_BULK_REGISTRATION_DATES:
-                    return date_str, FirstReceivingSource.PRODUCTS_BULK
-                return date_str, FirstReceivingSource.PRODUCTS
-        except Exception:
-            pass
-
-        return None, FirstReceivingSource.NONE
-
-    def _query_first_buy_date(self, item_cd: str) -> Optional[str]:
-        """daily_sales에서 buy_qty > 0인 최초 날짜 조회.
-
-        이 메서드는 2순위(sale_qty > 0)에서 잡히지 않은 상품만 대상으로 호출됨.
-        즉, "입고는 됐으나 판매가 한 번도 없는 상품"의 첫 입고일 추정용.
-        편의점에서는 입고 당일 판매가 흔하므로 이 케이스에 해당하는 상품은 소수.
+        소스별 조회는 LifecycleMetricsEngine 이 전체 상품을 한 번에 수행.
         """
-        conn = DBRouter.get_store_connection(self.store_id)
-        cursor = conn.execute(
-            "SELECT MIN(sales_date) FROM daily_sales "
-            "WHERE item_cd = ? AND mid_cd = '014' AND buy_qty > 0",
-            (item_cd,)
-        )
-        row = cursor.fetchone()
-        return row[0] if row and row[0] else None
+        first_date, source = self._metrics_engine().first_receiving(item_cd)
+        return first_date, FirstReceivingSource(source)
 
     def _has_active_promotion(self, item_cd: str) -> bool:
         """promotions 테이블에서 현재 활성 행사가 있는지 확인"""
-        try:
-            from src.infrastructure.database.connection import DBRouter
-            conn = DBRouter.get_store_connection(self.store_id)
-            cursor = conn.cursor()
-            today = datetime.now().strftime("%Y-%m-%d")
-            row = cursor.execute(
-                """
-                SELECT 1 FROM promotions
-                WHERE item_cd = ? AND start_date <= ? AND end_date >= ?
-                LIMIT 1
-                """,
-                (item_cd, today, today),
-            ).fetchone()
-            return row is not None
-        except Exception:
-            return False
+        return self._metrics_engine().has_active_promotion(item_cd)
 
     def _get_judgment_period(
         self,
@@ -636,29 +590,18 @@ class DessertDecisionService:
         reference_date: str,
     ) -> DessertSalesMetrics:
         """daily_sales에서 판단 기간의 판매/폐기 집계"""
-        conn = DBRouter.get_store_connection(self.store_id)
+        engine = self._metrics_engine(reference_date)
 
         # 현재 기간 집계
-        cursor = conn.execute("""
-            SELECT COALESCE(SUM(sale_qty), 0),
-                   COALESCE(SUM(disuse_qty), 0),
-                   COALESCE(SUM(ord_qty), 0)
-            FROM daily_sales
-            WHERE item_cd = ?
-              AND sales_date >= ? AND sales_date <= ?
-        """, (item_cd, period_start, period_end))
-
-        row = cursor.fetchone()
-        total_sale = row[0] if row else 0
-        total_disuse = row[1] if row else 0
-        total_order = row[2] if row else 0
+        total_sale, total_disuse, total_order = engine.period_totals(
+            item_cd, period_start, period_end
+        )
 
         sale_rate = calc_sale_rate(total_sale, total_disuse)
         sale_amount = total_sale * sell_price
         disuse_amount = total_disuse * sell_price
 
         # 이전 기간 (추세 계산)
-        ref = datetime.strptime(reference_date, "%Y-%m-%d")
         period_days = (datetime.strptime(period_end, "%Y-%m-%d") -
                        datetime.strptime(period_start, "%Y-%m-%d")).days
         prev_end = (datetime.strptime(period_start, "%Y-%m-%d") -
@@ -666,13 +609,7 @@ class DessertDecisionService:
         prev_start = (datetime.strptime(period_start, "%Y-%m-%d") -
                       timedelta(days=period_days)).strftime("%Y-%m-%d")
 
-        cursor = conn.execute("""
-            SELECT COALESCE(SUM(sale_qty), 0)
-            FROM daily_sales
-            WHERE item_cd = ? AND sales_date >= ? AND sales_date <= ?
-        """, (item_cd, prev_start, prev_end))
-        prev_row = cursor.fetchone()
-        prev_sale = prev_row[0] if prev_row else 0
+        prev_sale = engine.period_totals(item_cd, prev_start, prev_end)[0]
 
         trend_pct = 0.0
         if prev_sale > 0:
@@ -711,43 +648,12 @@ class DessertDecisionService:
         period_start: str,
         period_end: str,
     ) -> float:
-        """같은 카테고리 상품들의 평균 판매수량"""
-        conn = DBRouter.get_store_connection(self.store_id)
-
-        # 먼저 같은 카테고리 상품 목록 필요 → common.db에서 mid_cd='014' 전체 로드
-        common_conn = DBRouter.get_connection(table="products")
-        cursor = common_conn.execute("""
-            SELECT p.item_cd, pd.small_nm, pd.expiration_days
-            FROM products p
-            LEFT JOIN product_details pd ON p.item_cd = pd.item_cd
-            WHERE p.mid_cd = '014'
-        """)
-
-        same_cat_items = []
-        for row in cursor.fetchall():
-            cat = classify_dessert_category(row[1], row[2])
-            if cat == category:
-                same_cat_items.append(row[0])
-
+        """같은 카테고리 상품들의 평균 판매수량 (기간 내 판매 이력이 있는 상품 기준)"""
+        engine = self._metrics_engine()
+        same_cat_items = self._category_items.get(category, [])
         if not same_cat_items:
             return 0.0
-
-        # 같은 카테고리 상품들의 기간 내 판매합계
-        placeholders = ",".join("?" * len(same_cat_items))
-        cursor = conn.execute(f"""
-            SELECT COALESCE(SUM(sale_qty), 0), COUNT(DISTINCT item_cd)
-            FROM daily_sales
-            WHERE item_cd IN ({placeholders})
-              AND sales_date >= ? AND sales_date <= ?
-        """, same_cat_items + [period_start, period_end])
-
-        row = cursor.fetchone()
-        total = row[0] if row else 0
-        item_count = row[1] if row else 0
-
-        if item_count == 0:
-            return 0.0
-        return round(total / item_count, 2)
+        return engine.average_sale(same_cat_items, period_start, period_end)
 
     def _aggregate_weekly_rates(
         self,
@@ -756,28 +662,8 @@ class DessertDecisionService:
         weeks: int = 8,
     ) -> List[float]:
         """최근 N주 각각의 판매율 (인덱스 0 = 가장 최신 주)"""
-        conn = DBRouter.get_store_connection(self.store_id)
-        ref = datetime.strptime(reference_date, "%Y-%m-%d")
-        rates = []
-
-        for w in range(weeks):
-            end = ref - timedelta(days=7 * w)
-            start = end - timedelta(days=7)
-
-            cursor = conn.execute("""
-                SELECT COALESCE(SUM(sale_qty), 0),
-                       COALESCE(SUM(disuse_qty), 0)
-                FROM daily_sales
-                WHERE item_cd = ?
-                  AND sales_date > ? AND sales_date <= ?
-            """, (item_cd, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")))
-
-            row = cursor.fetchone()
-            sale = row[0] if row else 0
-            disuse = row[1] if row else 0
-            rates.append(calc_sale_rate(sale, disuse))
-
-        return rates
+        windows = self._metrics_engine(reference_date).window_totals(item_cd, 7, weeks)
+        return [calc_sale_rate(sale, disuse) for sale, disuse, _ in windows]
 
     def _aggregate_monthly_qtys(
         self,
@@ -786,22 +672,5 @@ class DessertDecisionService:
         months: int = 3,
     ) -> List[int]:
         """최근 N개월 각각의 판매수량 (인덱스 0 = 가장 최신 월)"""
-        conn = DBRouter.get_store_connection(self.store_id)
-        ref = datetime.strptime(reference_date, "%Y-%m-%d")
-        qtys = []
-
-        for m in range(months):
-            end = ref - timedelta(days=30 * m)
-            start = end - timedelta(days=30)
-
-            cursor = conn.execute("""
-                SELECT COALESCE(SUM(sale_qty), 0)
-                FROM daily_sales
-                WHERE item_cd = ?
-                  AND sales_date > ? AND sales_date <= ?
-            """, (item_cd, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")))
-
-            row = cursor.fetchone()
-            qtys.append(row[0] if row else 0)
-
-        return qtys
+        windows = self._metrics_engine(reference_date).window_totals(item_cd, 30, months)
+        return [sale for sale, _, _ in windows]
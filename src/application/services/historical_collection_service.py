@@ -189,6 +189,7 @@ def _make_save_callback(store_id: str):
             sales_date=date_str,
             store_id=store_id,
             collected_at=datetime.now().isoformat(),
+            bulk=True,
         )
         return stats
 
@@ -0,0 +1,344 @@
+"""
+LifecycleMetricsEngine -- 디저트/음료 판단 공용 상품 집합 지표 (lifecycle-metrics)
+
+Decision 서비스는 상품마다 첫 입고일(4소스)·행사·기간/주별/월별 집계를
+각각 쿼리했다 (상품당 20회 안팎). 엔진은 대상 상품 집합 전체를 종류별로
+GROUP BY 쿼리 1회(500개 청크)씩 읽어 두고 상품별 값은 메모리에서 계산한다.
+
+- 첫 입고일: detected_new_products / daily_sales(첫 판매·첫 입고) / products.created_at
+- 행사: promotions 활성 여부, daily_sales 행사유형별 마지막 행사일
+- 판매 집계: (item_cd, sales_date) 일별 합계 → 누적합 + 이진탐색으로
+  임의 기간·주별·월별 합계 (조건·경계는 기존 단건 쿼리와 동일한 문자열 비교)
+
+각 부분은 처음 필요할 때 한 번만 로드하며, 집합 밖 상품은 이력 없음으로 취급한다.
+"""
+
+import sqlite3
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.infrastructure.database.connection import DBRouter
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_IN_CHUNK = 500
+
+# 판단 기간 최대 30일 + 직전 기간 30일, 월별 4개월(120일)까지 포함
+DEFAULT_HISTORY_DAYS = 120
+
+# detected_new_products: ORDER BY first_receiving_date ASC LIMIT 1 과 동일 (NULL 이 먼저)
+_DETECTED_SQL = """
+    SELECT item_cd,
+           CASE WHEN COUNT(*) > COUNT(first_receiving_date) THEN NULL
+                ELSE MIN(first_receiving_date) END
+    FROM detected_new_products
+    WHERE item_cd IN ({placeholders})
+    GROUP BY item_cd
+"""
+
+_FIRST_SALES_SQL = """
+    SELECT item_cd,
+           MIN(CASE WHEN sale_qty > 0 THEN sales_date END),
+           MIN(CASE WHEN buy_qty > 0 {buy_filter} THEN sales_date END)
+    FROM daily_sales
+    WHERE item_cd IN ({placeholders})
+    GROUP BY item_cd
+"""
+
+_CREATED_AT_SQL = """
+    SELECT item_cd, created_at FROM products WHERE item_cd IN ({placeholders})
+"""
+
+_ACTIVE_PROMO_SQL = """
+    SELECT DISTINCT item_cd FROM promotions
+    WHERE item_cd IN ({placeholders}) AND start_date <= ? AND end_date >= ?
+"""
+
+_LAST_PROMO_SQL = """
+    SELECT item_cd, promo_type, MAX(sales_date)
+    FROM daily_sales
+    WHERE item_cd IN ({placeholders}) AND promo_type IS NOT NULL AND promo_type != ''
+    GROUP BY item_cd, promo_type
+"""
+
+_DAILY_SQL = """
+    SELECT item_cd, sales_date, SUM(sale_qty), SUM(disuse_qty), SUM(ord_qty)
+    FROM daily_sales
+    WHERE item_cd IN ({placeholders}) AND sales_date >= ? AND sales_date <= ?
+    GROUP BY item_cd, sales_date
+    ORDER BY item_cd, sales_date
+"""
+
+
+class _DailySeries:
+    """상품 1개의 일별 합계 (날짜 오름차순) + 누적합"""
+
+    __slots__ = ("dates", "sale", "disuse", "order")
+
+    def __init__(self, rows: List[Tuple[str, int, int, int]]):
+        self.dates = [r[0] for r in rows]
+        self.sale = [0] + list(accumulate(r[1] or 0 for r in rows))
+        self.disuse = [0] + list(accumulate(r[2] or 0 for r in rows))
+        self.order = [0] + list(accumulate(r[3] or 0 for r in rows))
+
+    def span(self, lo: int, hi: int) -> Tuple[int, int, int]:
+        return (
+            self.sale[hi] - self.sale[lo],
+            self.disuse[hi] - self.disuse[lo],
+            self.order[hi] - self.order[lo],
+        )
+
+
+class LifecycleMetricsEngine:
+    """상품 집합 단위 첫 입고일·행사·판매 지표"""
+
+    def __init__(
+        self,
+        store_id: str,
+        item_cds: Iterable[str],
+        reference_date: str,
+        buy_mid_cd: Optional[str] = None,
+        bulk_registration_dates: Iterable[str] = (),
+        history_days: int = DEFAULT_HISTORY_DAYS,
+    ):
+        """
+        Args:
+            store_id: 매장 코드
+            item_cds: 대상 상품 (카테고리 전체 — 평균/중위값 비교군 포함)
+            reference_date: 기준일 YYYY-MM-DD (판매 집계 상한)
+            buy_mid_cd: 첫 입고일(buy_qty > 0) 조회 시 mid_cd 조건 (None 이면 없음)
+            bulk_registration_dates: products.created_at 일괄등록일 → products_bulk
+            history_days: 판매 집계 로드 기간 (기준일 포함 이전 N일)
+        """
+        self.store_id = store_id
+        self.item_cds = list(dict.fromkeys(item_cds))
+        self.reference_date = reference_date
+        self.buy_mid_cd = buy_mid_cd
+        self.bulk_registration_dates = frozenset(bulk_registration_dates)
+        self.history_start = (
+            datetime.strptime(reference_date, "%Y-%m-%d") - timedelta(days=history_days)
+        ).strftime("%Y-%m-%d")
+
+        self._first_receiving: Optional[Dict[str, Tuple[Optional[str], str]]] = None
+        self._active_promos: Optional[Set[str]] = None
+        self._last_promos: Optional[Dict[str, Tuple[str, str]]] = None
+        self._daily: Optional[Dict[str, _DailySeries]] = None
+        self._period_sales: Dict[Tuple[str, str], Dict[str, int]] = {}
+
+    # =========================================================================
+    # 첫 입고일
+    # =========================================================================
+
+    def first_receiving(self, item_cd: str) -> Tuple[Optional[str], str]:
+        """우선순위별 첫 입고일
+
+        Returns:
+            (날짜 또는 None, FirstReceivingSource 값)
+            detected_new_products → daily_sales_sold → daily_sales_bought
+            → products / products_bulk → none
+        """
+        if self._first_receiving is None:
+            self._first_receiving = self._load_first_receiving()
+        return self._first_receiving.get(item_cd, (None, "none"))
+
+    def _load_first_receiving(self) -> Dict[str, Tuple[Optional[str], str]]:
+        detected: Dict[str, str] = {}
+        sold: Dict[str, str] = {}
+        bought: Dict[str, str] = {}
+        created: Dict[str, str] = {}
+
+        conn = DBRouter.get_store_connection(self.store_id)
+        try:
+            try:
+                for item_cd, first_date in self._fetch(conn, _DETECTED_SQL):
+                    if first_date:
+                        detected[item_cd] = first_date
+            except sqlite3.Error as e:
+                logger.debug(f"[생애주기지표] detected_new_products 조회 실패: {e}")
+
+            buy_filter, extra = "", ()
+            if self.buy_mid_cd:
+                buy_filter, extra = "AND mid_cd = ?", (self.buy_mid_cd,)
+            try:
+                sql = _FIRST_SALES_SQL.replace("{buy_filter}", buy_filter)
+                for item_cd, first_sold, first_bought in self._fetch(conn, sql, extra, prefix=True):
+                    if first_sold:
+                        sold[item_cd] = first_sold
+                    if first_bought:
+                        bought[item_cd] = first_bought
+            except sqlite3.Error as e:
+                logger.debug(f"[생애주기지표] 첫 판매/입고일 조회 실패: {e}")
+        finally:
+            conn.close()
+
+        try:
+            common_conn = DBRouter.get_connection(table="products")
+            try:
+                for item_cd, created_at in self._fetch(common_conn, _CREATED_AT_SQL):
+                    if created_at:
+                        created[item_cd] = created_at[:10]
+            finally:
+                common_conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"[생애주기지표] products.created_at 조회 실패: {e}")
+
+        result: Dict[str, Tuple[Optional[str], str]] = {}
+        for item_cd in self.item_cds:
+            if item_cd in detected:
+                result[item_cd] = (detected[item_cd], "detected_new_products")
+            elif item_cd in sold:
+                result[item_cd] = (sold[item_cd], "daily_sales_sold")
+            elif item_cd in bought:
+                result[item_cd] = (bought[item_cd], "daily_sales_bought")
+            elif item_cd in created:
+                date_str = created[item_cd]
+                source = (
+                    "products_bulk" if date_str in self.bulk_registration_dates
+                    else "products"
+                )
+                result[item_cd] = (date_str, source)
+        return result
+
+    # =========================================================================
+    # 행사
+    # =========================================================================
+
+    def has_active_promotion(self, item_cd: str) -> bool:
+        """promotions 기준 오늘 진행 중인 행사 여부"""
+        if self._active_promos is None:
+            today = datetime.now().strftime("%Y-%m-%d")
+            self._active_promos = set()
+            try:
+                conn = DBRouter.get_store_connection(self.store_id)
+                try:
+                    self._active_promos = {
+                        row[0] for row in self._fetch(conn, _ACTIVE_PROMO_SQL, (today, today))
+                    }
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                logger.debug(f"[생애주기지표] promotions 조회 실패: {e}")
+        return item_cd in self._active_promos
+
+    def last_promotion(self, item_cd: str) -> Optional[Tuple[str, str]]:
+        """daily_sales 기준 가장 최근 행사 (행사유형, 마지막 행사일)"""
+        if self._last_promos is None:
+            self._last_promos = {}
+            try:
+                conn = DBRouter.get_store_connection(self.store_id)
+                try:
+                    # 마지막 행사일이 같으면 행사유형이 큰 쪽 (기존 ORDER BY ... DESC LIMIT 1 결과와 동일)
+                    for item_cd_, promo_type, last_date in self._fetch(conn, _LAST_PROMO_SQL):
+                        current = self._last_promos.get(item_cd_)
+                        if last_date and (
+                            current is None or (last_date, promo_type) > (current[1], current[0])
+                        ):
+                            self._last_promos[item_cd_] = (promo_type, last_date)
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                logger.debug(f"[생애주기지표] 행사 이력 조회 실패: {e}")
+        return self._last_promos.get(item_cd)
+
+    # =========================================================================
+    # 판매 집계
+    # =========================================================================
+
+    def period_totals(self, item_cd: str, start: str, end: str) -> Tuple[int, int, int]:
+        """start <= sales_date <= end 구간 (판매, 폐기, 발주) 합계"""
+        series = self._series(item_cd, start)
+        if series is None:
+            return 0, 0, 0
+        return series.span(bisect_left(series.dates, start), bisect_right(series.dates, end))
+
+    def window_totals(
+        self, item_cd: str, days: int, count: int,
+    ) -> List[Tuple[int, int, int]]:
+        """기준일부터 거꾸로 days 일 단위 구간 count 개의 (판매, 폐기, 발주) 합계
+
+        구간 i: (기준일 - days*(i+1), 기준일 - days*i]  (인덱스 0 = 가장 최근)
+        """
+        ref = datetime.strptime(self.reference_date, "%Y-%m-%d")
+        bounds = [
+            (ref - timedelta(days=days * (i + 1))).strftime("%Y-%m-%d")
+            for i in range(-1, count)
+        ]
+        series = self._series(item_cd, bounds[-1])
+        if series is None:
+            return [(0, 0, 0)] * count
+        return [
+            series.span(
+                bisect_right(series.dates, bounds[i + 1]),
+                bisect_right(series.dates, bounds[i]),
+            )
+            for i in range(count)
+        ]
+
+    def period_sales(self, start: str, end: str) -> Dict[str, int]:
+        """구간 내 판매 이력(행)이 있는 상품별 판매 합계 (비교군 평균/중위값용)"""
+        key = (start, end)
+        if key not in self._period_sales:
+            self._check_range(start)
+            sales: Dict[str, int] = {}
+            for item_cd, series in self._load_daily().items():
+                lo = bisect_left(series.dates, start)
+                hi = bisect_right(series.dates, end)
+                if hi > lo:
+                    sales[item_cd] = series.sale[hi] - series.sale[lo]
+            self._period_sales[key] = sales
+        return self._period_sales[key]
+
+    def average_sale(self, item_cds: Sequence[str], start: str, end: str) -> float:
+        """비교군 상품 중 구간 이력이 있는 상품의 평균 판매량 (소수 2자리)"""
+        sales = self.period_sales(start, end)
+        hits = [sales[c] for c in dict.fromkeys(item_cds) if c in sales]
+        if not hits:
+            return 0.0
+        return round(sum(hits) / len(hits), 2)
+
+    def _series(self, item_cd: str, start: str) -> Optional[_DailySeries]:
+        self._check_range(start)
+        return self._load_daily().get(item_cd)
+
+    def _check_range(self, start: str) -> None:
+        if start < self.history_start:
+            raise ValueError(
+                f"집계 구간 {start} 이 로드 기간({self.history_start}~) 밖입니다"
+            )
+
+    def _load_daily(self) -> Dict[str, _DailySeries]:
+        if self._daily is None:
+            rows: Dict[str, List[Tuple[str, int, int, int]]] = {}
+            conn = DBRouter.get_store_connection(self.store_id)
+            try:
+                for item_cd, sales_date, sale, disuse, order in self._fetch(
+                    conn, _DAILY_SQL, (self.history_start, self.reference_date)
+                ):
+                    rows.setdefault(item_cd, []).append((sales_date, sale, disuse, order))
+            finally:
+                conn.close()
+            self._daily = {item_cd: _DailySeries(r) for item_cd, r in rows.items()}
+            logger.debug(
+                f"[생애주기지표] 일별 집계 로드 store={self.store_id} "
+                f"상품={len(self.item_cds)} 이력상품={len(self._daily)}"
+            )
+        return self._daily
+
+    def _fetch(
+        self, conn: sqlite3.Connection, sql: str, params: tuple = (), prefix: bool = False,
+    ) -> List[tuple]:
+        """item_cd IN (...) 쿼리를 500개 청크로 실행
+
+        Args:
+            params: IN 목록 뒤(기본) 또는 앞(prefix=True)에 붙는 파라미터
+        """
+        rows: List[tuple] = []
+        for i in range(0, len(self.item_cds), _IN_CHUNK):
+            chunk = self.item_cds[i:i + _IN_CHUNK]
+            chunk_sql = sql.replace("{placeholders}", ",".join("?" * len(chunk)))
+            args = (tuple(params) + tuple(chunk)) if prefix else (tuple(chunk) + tuple(params))
+            rows.extend(tuple(r) for r in conn.execute(chunk_sql, args).fetchall())
+        return rows
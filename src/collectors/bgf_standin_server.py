@@ -0,0 +1,256 @@
+"""
+BGF 스토어 SSV 대역 서버 (ssv-http-client)
+
+data/captures/*.json 에 저장된 실제 캡처 응답을 경로별로 재생하는 로컬 HTTP 서버.
+SsvHttpClient / Direct 페처의 처리량 벤치마크와 오프라인 테스트용입니다.
+
+- 경로별 캡처가 여러 개면 요청 body 파라미터(strMidCd 등)가 가장 많이 일치하는 캡처,
+  일치 정보가 없으면 순환 재생
+- route()로 경로별 고정 응답 또는 body → 응답 함수 등록 (캡처에 없는 /stbj030 등)
+- latency_ms: 응답 지연 주입, inject_failures(n): 다음 n건 503 응답 (재시도 검증)
+- HTTP/1.1 keep-alive, 연결/요청 수와 마지막 수신 쿠키 기록
+
+Usage:
+    with BgfStandInServer(latency_ms=20) as server:
+        client = SsvHttpClient(server.base_url, cookies={'JSESSIONID': 'x'})
+        client.post('/stmb011/selDetailSearch', body)
+
+    python -m src.collectors.bgf_standin_server --port 8765
+"""
+
+import argparse
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from src.collectors.ssv_parser import RS
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CAPTURES_DIR = Path(__file__).parent.parent.parent / "data" / "captures"
+
+Responder = Union[str, Callable[[str], str]]
+
+
+def parse_ssv_params(body: str) -> Dict[str, str]:
+    """SSV 요청 body의 key=value 파라미터 추출 (Dataset 정의 이전 레코드만)"""
+    params = {}
+    for record in body.split(RS):
+        if record.startswith('Dataset:'):
+            break
+        key, sep, value = record.partition('=')
+        if sep and key and ':' not in key:
+            params[key] = value
+    return params
+
+
+def load_capture_fixtures(
+    captures_dir: Union[str, Path] = CAPTURES_DIR,
+) -> Dict[str, List[Tuple[Dict[str, str], str]]]:
+    """
+    캡처 JSON에서 POST 응답 추출
+
+    캡처 파일마다 구조가 달라(phase별 리스트, captures 리스트 등) url 키를 가진
+    객체를 재귀 탐색합니다. 같은 요청이 여러 리스트에 중복 저장된 경우 1회만 사용.
+
+    Returns:
+        {path: [(body 파라미터, 응답 텍스트), ...]}
+    """
+    fixtures: Dict[str, List[Tuple[Dict[str, str], str]]] = {}
+    seen = set()
+
+    def walk(node: Any) -> None:
+        if isinstance(node, dict):
+            if 'url' in node:
+                text = node.get('responsePreview') or node.get('respPreview') or ''
+                body = node.get('bodyPreview') or ''
+                if node.get('method', 'POST').upper() != 'POST' or not text:
+                    return
+                path = urlsplit(node['url']).path
+                if (path, body, text) in seen:
+                    return
+                seen.add((path, body, text))
+                fixtures.setdefault(path, []).append((parse_ssv_params(body), text))
+                return
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    for file in sorted(Path(captures_dir).glob('*.json')):
+        try:
+            walk(json.loads(file.read_text(encoding='utf-8')))
+        except (OSError, ValueError) as e:
+            logger.warning(f"[StandIn] 캡처 로드 실패 {file.name}: {e}")
+    return fixtures
+
+
+class BgfStandInServer:
+    """캡처 기반 SSV 대역 서버 (백그라운드 스레드)"""
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        captures_dir: Union[str, Path, None] = CAPTURES_DIR,
+        latency_ms: float = 0.0,
+    ):
+        """
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 임의 포트)
+            captures_dir: 캡처 디렉토리 (None이면 캡처 미사용, route()만)
+            latency_ms: 응답마다 주입할 지연
+        """
+        self.latency_ms = latency_ms
+        self.fixtures = load_capture_fixtures(captures_dir) if captures_dir else {}
+        self.routes: Dict[str, Responder] = {}
+        self.request_count = 0
+        self.connection_count = 0
+        self.last_cookies: Dict[str, str] = {}
+        self._fail_remaining = 0
+        self._cycles: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def route(self, path: str, responder: Responder) -> None:
+        """경로별 응답 등록 (문자열 또는 body → 응답 텍스트 함수). 캡처보다 우선"""
+        self.routes[path] = responder
+
+    def inject_failures(self, count: int) -> None:
+        """다음 count건 요청에 503 응답"""
+        with self._lock:
+            self._fail_remaining = count
+
+    def start(self) -> 'BgfStandInServer':
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name='bgf-standin', daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> 'BgfStandInServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def respond(self, path: str, body: str) -> Optional[str]:
+        """경로/body에 대한 응답 텍스트 (없으면 None → 404)"""
+        responder = self.routes.get(path)
+        if responder is not None:
+            return responder(body) if callable(responder) else responder
+
+        captures = self.fixtures.get(path)
+        if not captures:
+            return None
+        params = parse_ssv_params(body)
+        best, best_score = None, 0
+        for capture_params, text in captures:
+            score = sum(
+                1 for key, value in capture_params.items()
+                if key.startswith('str') and params.get(key) == value
+            )
+            if score > best_score:
+                best, best_score = text, score
+        if best is not None:
+            return best
+        with self._lock:
+            cycle = self._cycles.setdefault(path, itertools.cycle(captures))
+            return next(cycle)[1]
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 delayed ACK 지연 방지
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connection_count += 1
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length).decode('utf-8', errors='replace')
+                with server._lock:
+                    server.request_count += 1
+                    fail = server._fail_remaining > 0
+                    if fail:
+                        server._fail_remaining -= 1
+                    cookie = self.headers.get('Cookie')
+                    if cookie:
+                        server.last_cookies = dict(
+                            part.strip().split('=', 1)
+                            for part in cookie.split(';') if '=' in part
+                        )
+                if server.latency_ms > 0:
+                    time.sleep(server.latency_ms / 1000)
+
+                if fail:
+                    self._send(503, 'Service Unavailable')
+                    return
+                text = server.respond(urlsplit(self.path).path, body)
+                if text is None:
+                    self._send(404, 'Not Found')
+                else:
+                    self._send(200, text)
+
+            def _send(self, status: int, text: str):
+                payload = text.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/plain;charset=UTF-8')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                logger.debug(f"[StandIn] {self.address_string()} {format % args}")
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BGF SSV 대역 서버 (캡처 재생)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--captures', default=str(CAPTURES_DIR))
+    args = parser.parse_args()
+
+    server = BgfStandInServer(args.host, args.port, args.captures, args.latency_ms)
+    paths = ', '.join(f"{p}({len(c)})" for p, c in sorted(server.fixtures.items()))
+    print(f"BGF stand-in server: {server.base_url}")
+    print(f"  captures: {paths}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
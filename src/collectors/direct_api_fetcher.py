@@ -5,56 +5,50 @@ Selenium UI 조작 없이 /stbj030/selSearch 엔드포인트에 직접 HTTP 요
 dsItem, dsOrderSale, gdList 데이터를 조회합니다.
 
 로그인된 Selenium 브라우저 내에서 fetch()를 실행하여 쿠키/세션을 자동 공유합니다.
+http_client(SsvHttpClient)가 설정되면 배치 조회는 브라우저 대신 Python 측에서
+세션 쿠키로 직접 호출합니다 (ssv-http-client). 검증 요청이 응답을 못 받거나
+배치 전량이 실패하면 http_client 를 해제하고 브라우저 JS fetch 로 전환합니다.
 """
 
 import json
+import re
 import time
-from typing import Any, Callable, Dict, List, Optional
-
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from src.collectors.ssv_parser import (  # noqa: F401 - RS/US 재노출
+    RS,
+    US,
+    SsvDataset,
+    parse_ssv,
+)
+from src.collectors.ssv_http_client import SsvHttpClient
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# SSV 구분자
-RS = '\u001e'  # Record Separator
-US = '\u001f'  # Unit Separator
+SEARCH_PATH = '/stbj030/selSearch'
 
 
 def parse_ssv_dataset(ssv_text: str, dataset_marker: str) -> Optional[Dict[str, Any]]:
     """
     SSV 텍스트에서 특정 데이터셋의 컬럼 헤더와 데이터 행을 파싱
 
+    응답 전체를 여러 데이터셋으로 나눠야 하면 parse_ssv()를 한 번 호출해
+    SsvResponse.find()를 사용하세요 (마커마다 재분할하지 않음).
+
     Args:
         ssv_text: 전체 SSV 응답 텍스트
         dataset_marker: 데이터셋 식별용 컬럼명 (예: 'ITEM_NM' for dsItem)
 
     Returns:
-        {'columns': [...], 'rows': [[...]]} 또는 None
+        SsvDataset ({'columns': [...], 'rows': [(...)]} 형태로도 접근 가능) 또는 None
     """
     if not ssv_text:
         return None
+    return parse_ssv(ssv_text).find(dataset_marker)
 
-    records = ssv_text.split(RS)
-    for i, record in enumerate(records):
-        if '_RowType_' in record and dataset_marker in record:
-            cols_raw = record.split(US)
-            columns = [c.split(':')[0] for c in cols_raw]
-
-            rows = []
-            # 이후 레코드들이 데이터 행 (빈 레코드나 다음 헤더를 만나면 중지)
-            for j in range(i + 1, len(records)):
-                row_text = records[j].strip()
-                if not row_text or '_RowType_' in row_text:
-                    break
-                vals = row_text.split(US)
-                rows.append(vals)
-
-            return {'columns': columns, 'rows': rows}
 
-    return None
-
-
-def ssv_row_to_dict(columns: List[str], row: List[str]) -> Dict[str, str]:
+def ssv_row_to_dict(columns: List[str], row: Sequence[str]) -> Dict[str, str]:
     """SSV 컬럼/행을 딕셔너리로 변환"""
     result = {}
     for idx, col in enumerate(columns):
@@ -62,44 +56,54 @@ def ssv_row_to_dict(columns: List[str], row: List[str]) -> Dict[str, str]:
     return result
 
 
-def parse_full_ssv_response(ssv_text: str) -> Dict[str, Any]:
+def parse_full_ssv_response(ssv_text: str) -> Dict[str, SsvDataset]:
     """
-    /stbj030/selSearch SSV 응답 전체를 파싱하여 모든 데이터셋 추출
+    /stbj030/selSearch SSV 응답 전체를 파싱하여 모든 데이터셋 추출 (단일 패스)
 
     Returns:
         {
-            'dsItem': {'columns': [...], 'rows': [...]},
-            'dsOrderSale': {'columns': [...], 'rows': [...]},
-            'gdList': {'columns': [...], 'rows': [...]},
-            'dsWeek': {'columns': [...], 'rows': [...]},
+            'dsItem': SsvDataset,
+            'dsOrderSale': SsvDataset,
+            'gdList': SsvDataset,
+            'dsWeek': SsvDataset,
         }
+        (각 SsvDataset은 ds['columns'], ds['rows']로도 접근 가능)
     """
     result = {}
+    response = parse_ssv(ssv_text)
+    if not response:
+        return result
 
     # dsItem: ITEM_NM, NOW_QTY, ORD_UNIT_QTY, EXPIRE_DAY
-    ds_item = parse_ssv_dataset(ssv_text, 'ITEM_NM')
+    ds_item = response.find('ITEM_NM')
     if ds_item:
         result['dsItem'] = ds_item
 
     # dsOrderSale: ORD_QTY, BUY_QTY, SALE_QTY, DISUSE_QTY
-    ds_order_sale = parse_ssv_dataset(ssv_text, 'ORD_QTY')
+    ds_order_sale = response.find('ORD_QTY')
     if ds_order_sale:
         result['dsOrderSale'] = ds_order_sale
 
     # gdList: MONTH_EVT, NEXT_MONTH_EVT, CUT_ITEM_YN, HQ_MAEGA_SET, PROFIT_RATE
-    ds_gdlist = parse_ssv_dataset(ssv_text, 'MONTH_EVT')
+    ds_gdlist = response.find('MONTH_EVT')
     if ds_gdlist:
         result['gdList'] = ds_gdlist
 
-    # dsWeek: ORD_YMD (날짜 목록)
-    ds_week = parse_ssv_dataset(ssv_text, 'ORD_YMD')
-    if ds_week and 'ORD_QTY' not in (ds_week.get('columns') or []):
-        # ORD_YMD가 있지만 ORD_QTY가 없는 데이터셋이 dsWeek
+    # dsWeek: ORD_YMD만 있고 ORD_QTY가 없는 데이터셋 (날짜 목록)
+    ds_week = response.find('ORD_YMD', exclude='ORD_QTY')
+    if ds_week:
         result['dsWeek'] = ds_week
 
     return result
 
 
+def _as_dataset(ds: Any) -> Optional[SsvDataset]:
+    """SsvDataset 또는 레거시 {'columns', 'rows'} 딕셔너리 → SsvDataset"""
+    if ds is None or isinstance(ds, SsvDataset):
+        return ds
+    return SsvDataset.from_legacy(ds)
+
+
 def extract_item_data(parsed: Dict[str, Any], item_cd: str) -> Dict[str, Any]:
     """
     파싱된 SSV 데이터를 collect_for_item() 호환 형식으로 변환
@@ -129,56 +133,58 @@ def extract_item_data(parsed: Dict[str, Any], item_cd: str) -> Dict[str, Any]:
     }
 
     # dsItem 추출
-    ds_item = parsed.get('dsItem')
-    if ds_item and ds_item['rows']:
-        row = ssv_row_to_dict(ds_item['columns'], ds_item['rows'][0])
-        result['item_cd'] = row.get('ITEM_CD', item_cd)
-        result['item_nm'] = row.get('ITEM_NM', '')
-        result['current_stock'] = _safe_int(row.get('NOW_QTY', '0'))
+    ds_item = _as_dataset(parsed.get('dsItem'))
+    if ds_item and ds_item.rows:
+        result['item_cd'] = ds_item.value(0, 'ITEM_CD', item_cd)
+        result['item_nm'] = ds_item.value(0, 'ITEM_NM')
+        result['current_stock'] = _safe_int(ds_item.value(0, 'NOW_QTY', '0'))
         # ORD_UNIT_QTY: 빈값/0이면 None 유지 (1로 폴백하면 입수 불일치 과발주)
-        _raw_unit = _safe_int(row.get('ORD_UNIT_QTY'))
+        _raw_unit = _safe_int(ds_item.value(0, 'ORD_UNIT_QTY', None))
         result['order_unit_qty'] = _raw_unit if _raw_unit and _raw_unit > 0 else None
-        result['expiration_days'] = _safe_int(row.get('EXPIRE_DAY', '')) or None
+        result['expiration_days'] = _safe_int(ds_item.value(0, 'EXPIRE_DAY')) or None
         result['success'] = True
-    elif ds_item and not ds_item['rows']:
+    elif ds_item is not None and not ds_item.rows:
         # CUT/미취급 상품: 헤더만 있고 행이 없음 (HTTP 200이지만 발주 불가)
         result['success'] = True
         result['is_empty_response'] = True
         result['is_cut_item'] = True
 
-    # dsOrderSale 추출 (발주/입고/판매/폐기 이력)
-    ds_order_sale = parsed.get('dsOrderSale')
+    # dsOrderSale 추출 (발주/입고/판매/폐기 이력) - 컬럼 단위 변환
+    ds_order_sale = _as_dataset(parsed.get('dsOrderSale'))
     if ds_order_sale:
-        for row_vals in ds_order_sale['rows']:
-            row = ssv_row_to_dict(ds_order_sale['columns'], row_vals)
-            result['history'].append({
-                'date': row.get('ORD_YMD', ''),
-                'item_cd': row.get('ITEM_CD', item_cd),
-                'ord_qty': _safe_int(row.get('ORD_QTY', '0')),
-                'buy_qty': _safe_int(row.get('BUY_QTY', '0')),
-                'sale_qty': _safe_int(row.get('SALE_QTY', '0')),
-                'disuse_qty': _safe_int(row.get('DISUSE_QTY', '0')),
-            })
+        dates = ds_order_sale.strings('ORD_YMD')
+        item_cds = ds_order_sale.strings('ITEM_CD', item_cd)
+        ord_qty = ds_order_sale.ints('ORD_QTY')
+        buy_qty = ds_order_sale.ints('BUY_QTY')
+        sale_qty = ds_order_sale.ints('SALE_QTY')
+        disuse_qty = ds_order_sale.ints('DISUSE_QTY')
+        result['history'] = [
+            {
+                'date': dates[i],
+                'item_cd': item_cds[i],
+                'ord_qty': ord_qty[i],
+                'buy_qty': buy_qty[i],
+                'sale_qty': sale_qty[i],
+                'disuse_qty': disuse_qty[i],
+            }
+            for i in range(len(ds_order_sale.rows))
+        ]
 
     # gdList 추출 (행사, CUT, 매가, 이익율)
-    ds_gdlist = parsed.get('gdList')
-    if ds_gdlist and ds_gdlist['rows']:
+    ds_gdlist = _as_dataset(parsed.get('gdList'))
+    if ds_gdlist and ds_gdlist.rows:
         # 마지막 행 사용 (Selenium 버전과 동일)
-        last_row = ssv_row_to_dict(ds_gdlist['columns'], ds_gdlist['rows'][-1])
-        result['current_month_promo'] = _clean_text(last_row.get('MONTH_EVT', ''))
-        result['next_month_promo'] = _clean_text(last_row.get('NEXT_MONTH_EVT', ''))
-        result['is_cut_item'] = last_row.get('CUT_ITEM_YN', '0') == '1'
-        result['sell_price'] = last_row.get('HQ_MAEGA_SET', '')
-        result['margin_rate'] = last_row.get('PROFIT_RATE', '')
+        last = len(ds_gdlist.rows) - 1
+        result['current_month_promo'] = _clean_text(ds_gdlist.value(last, 'MONTH_EVT'))
+        result['next_month_promo'] = _clean_text(ds_gdlist.value(last, 'NEXT_MONTH_EVT'))
+        result['is_cut_item'] = ds_gdlist.value(last, 'CUT_ITEM_YN', '0') == '1'
+        result['sell_price'] = ds_gdlist.value(last, 'HQ_MAEGA_SET')
+        result['margin_rate'] = ds_gdlist.value(last, 'PROFIT_RATE')
 
     # dsWeek 추출 (날짜 목록)
-    ds_week = parsed.get('dsWeek')
+    ds_week = _as_dataset(parsed.get('dsWeek'))
     if ds_week:
-        for row_vals in ds_week['rows']:
-            row = ssv_row_to_dict(ds_week['columns'], row_vals)
-            date_val = row.get('ORD_YMD', '')
-            if date_val:
-                result['week_dates'].append(date_val)
+        result['week_dates'] = [d for d in ds_week.strings('ORD_YMD') if d]
 
     return result
 
@@ -197,9 +203,9 @@ def extract_dsitem_all_columns(ssv_text: str) -> Optional[Dict[str, str]]:
         {'STORE_CD': '46513', 'ITEM_NM': '오뚜기)스파게티컵', ...} 또는 None
     """
     ds = parse_ssv_dataset(ssv_text, 'ITEM_NM')
-    if not ds or not ds['rows']:
+    if not ds or not ds.rows:
         return None
-    row_dict = ssv_row_to_dict(ds['columns'], ds['rows'][0])
+    row_dict = ds.first_dict()
     # _RowType_ 제외 (addRow가 자동 설정)
     row_dict.pop('_RowType_', None)
     return row_dict
@@ -230,18 +236,35 @@ class DirectApiFetcher:
     /stbj030/selSearch 엔드포인트에 직접 요청을 보냅니다.
     """
 
-    def __init__(self, driver: Any, concurrency: int = 5, timeout_ms: int = 8000):
+    def __init__(
+        self,
+        driver: Any,
+        concurrency: int = 5,
+        timeout_ms: int = 8000,
+        http_client: Optional[SsvHttpClient] = None,
+    ):
         """
         Args:
             driver: 로그인된 Selenium WebDriver
             concurrency: 동시 요청 수 (서버 부하 방지)
             timeout_ms: 개별 요청 타임아웃 (밀리초)
+            http_client: 배치 조회용 HTTP 클라이언트 (None이면 브라우저 JS fetch)
         """
         self.driver = driver
         self.concurrency = concurrency
         self.timeout_ms = timeout_ms
+        self.http_client = http_client
         self._request_template: Optional[str] = None
 
+    def _build_body(self, item_cd: str) -> str:
+        """템플릿의 첫 strItemCd 값 교체 (JS template.replace와 동일)"""
+        return re.sub(
+            r'strItemCd=[^\x1e]*',
+            lambda _: f'strItemCd={item_cd}',
+            self._request_template,
+            count=1,
+        )
+
     def capture_request_template(self) -> bool:
         """
         브라우저에서 /stbj030/selSearch 요청 템플릿을 캡처
@@ -451,23 +474,35 @@ class DirectApiFetcher:
             return False
 
         try:
-            probe = self.driver.execute_script("""
-                var body = arguments[0].replace(/strItemCd=[^\\u001e]*/, 'strItemCd=' + arguments[1]);
-                try {
-                    var resp = await fetch('/stbj030/selSearch', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'text/plain;charset=UTF-8' },
-                        body: body,
-                        signal: AbortSignal.timeout(arguments[2])
-                    });
-                    var text = await resp.text();
-                    return { status: resp.status, ok: resp.ok, len: text.length,
-                             hasItem: text.indexOf('ITEM_NM') > -1,
-                             snippet: text.substring(0, 200) };
-                } catch(e) {
-                    return { status: 0, ok: false, error: e.message };
-                }
-            """, self._request_template, sample_item_cd, self.timeout_ms)
+            probe = None
+            if self.http_client:
+                probe = self._probe_http(sample_item_cd)
+                if not probe.get('status'):
+                    # 응답 자체를 못 받음 = 템플릿 문제가 아닌 HTTP 경로 문제
+                    logger.warning(
+                        f"[DirectAPI] HTTP 검증 요청 실패 ({probe.get('error')}) "
+                        f"→ 브라우저 JS fetch 전환"
+                    )
+                    self.http_client = None
+                    probe = None
+            if probe is None:
+                probe = self.driver.execute_script("""
+                    var body = arguments[0].replace(/strItemCd=[^\\u001e]*/, 'strItemCd=' + arguments[1]);
+                    try {
+                        var resp = await fetch('/stbj030/selSearch', {
+                            method: 'POST',
+                            headers: { 'Content-Type': 'text/plain;charset=UTF-8' },
+                            body: body,
+                            signal: AbortSignal.timeout(arguments[2])
+                        });
+                        var text = await resp.text();
+                        return { status: resp.status, ok: resp.ok, len: text.length,
+                                 hasItem: text.indexOf('ITEM_NM') > -1,
+                                 snippet: text.substring(0, 200) };
+                    } catch(e) {
+                        return { status: 0, ok: false, error: e.message };
+                    }
+                """, self._request_template, sample_item_cd, self.timeout_ms)
 
             if not probe:
                 logger.warning("[DirectAPI] 템플릿 검증: probe 응답 없음")
@@ -503,6 +538,15 @@ class DirectApiFetcher:
             logger.warning(f"[DirectAPI] 템플릿 검증 예외: {e}")
             return False
 
+    def _probe_http(self, sample_item_cd: str) -> Dict[str, Any]:
+        """HTTP 클라이언트로 검증 요청 (JS probe와 같은 형식 반환)"""
+        r = self.http_client.post(SEARCH_PATH, self._build_body(sample_item_cd))
+        return {
+            'status': r.status, 'ok': r.ok, 'len': len(r.text),
+            'hasItem': 'ITEM_NM' in r.text, 'snippet': r.text[:200],
+            'error': r.error,
+        }
+
     def fetch_items_batch(
         self,
         item_codes: List[str],
@@ -537,9 +581,76 @@ class DirectApiFetcher:
             self._request_template = None
             return {}
 
-        logger.info(f"[DirectAPI] 배치 조회 시작: {total}개 상품 (concurrency={self.concurrency})")
+        logger.info(
+            f"[DirectAPI] 배치 조회 시작: {total}개 상품 (concurrency={self.concurrency}, "
+            f"{'http' if self.http_client else 'js'})"
+        )
         start_time = time.time()
 
+        # SSV 응답 파싱 (Python 측) + 실패유형 진단
+        results = {}
+        counts = {'success': 0, 'js_error': 0, 'parse_error': 0}
+        sample_logged = False
+
+        def handle(entry: Dict[str, Any]) -> None:
+            nonlocal sample_logged
+            barcode = entry.get('barcode', '')
+            if entry.get('ok') and entry.get('text'):
+                parsed = parse_full_ssv_response(entry['text'])
+                item_data = extract_item_data(parsed, barcode)
+                if item_data.get('success'):
+                    results[barcode] = item_data
+                    counts['success'] += 1
+                else:
+                    counts['parse_error'] += 1
+                    if not sample_logged:
+                        resp_text = entry.get('text', '')
+                        logger.warning(
+                            f"[DirectAPI] SSV 파싱 실패 샘플 (HTTP {entry.get('status', '?')}): "
+                            f"barcode={barcode}, len={len(resp_text)}, "
+                            f"datasets={list(parsed.keys()) if parsed else 'empty'}, "
+                            f"snippet={resp_text[:200]}"
+                        )
+                        sample_logged = True
+            else:
+                counts['js_error'] += 1
+                if not sample_logged:
+                    logger.warning(
+                        f"[DirectAPI] JS fetch 실패 샘플: "
+                        f"barcode={barcode}, status={entry.get('status', '?')}, "
+                        f"error={entry.get('error', 'N/A')}"
+                    )
+                    sample_logged = True
+
+            processed = sum(counts.values())
+            if on_progress and processed % 50 == 0:
+                on_progress(processed, total)
+
+        if self.http_client:
+            # Python HTTP 클라이언트: 응답 도착 즉시 파싱 (JSON 브리지 일괄 반환 없음)
+            try:
+                self.http_client.post_many(
+                    ((cd, SEARCH_PATH, self._build_body(cd)) for cd in item_codes),
+                    on_result=lambda r: handle({
+                        'barcode': r.key, 'ok': r.ok, 'text': r.text,
+                        'status': r.status, 'error': r.error,
+                    }),
+                    delay_ms=delay_ms,
+                )
+            except Exception as e:
+                logger.error(f"[DirectAPI] HTTP 배치 조회 실패: {e}")
+            if counts['success'] or counts['parse_error']:
+                return self._log_batch_done(results, counts, total, start_time)
+            # 응답을 하나도 못 받음 (HTTP 경로 자체 문제) → 같은 배치를 브라우저 JS fetch 로
+            logger.warning(
+                f"[DirectAPI] HTTP 배치 전량 실패 ({counts['js_error']}/{total}) "
+                f"→ 브라우저 JS fetch 폴백"
+            )
+            self.http_client = None
+            results.clear()
+            counts.update(success=0, js_error=0, parse_error=0)
+            sample_logged = False
+
         # 브라우저 내에서 배치 처리 (JS async/await + concurrency 제한)
         try:
             raw_results = self.driver.execute_script("""
@@ -595,54 +706,28 @@ class DirectApiFetcher:
             logger.error(f"[DirectAPI] 배치 조회 JS 실행 실패: {e}")
             return {}
 
-        elapsed = time.time() - start_time
-
-        # SSV 응답 파싱 (Python 측) + 실패유형 진단
-        results = {}
-        success_count = 0
-        js_error_count = 0    # JS fetch 자체 실패 (네트워크, 타임아웃, HTTP 에러)
-        parse_error_count = 0  # fetch 성공했으나 SSV에 dsItem 없음
-        sample_logged = False
-
         for entry in (raw_results or []):
-            barcode = entry.get('barcode', '')
-            if entry.get('ok') and entry.get('text'):
-                parsed = parse_full_ssv_response(entry['text'])
-                item_data = extract_item_data(parsed, barcode)
-                if item_data.get('success'):
-                    results[barcode] = item_data
-                    success_count += 1
-                else:
-                    parse_error_count += 1
-                    if not sample_logged:
-                        resp_text = entry.get('text', '')
-                        logger.warning(
-                            f"[DirectAPI] SSV 파싱 실패 샘플 (HTTP {entry.get('status', '?')}): "
-                            f"barcode={barcode}, len={len(resp_text)}, "
-                            f"datasets={list(parsed.keys()) if parsed else 'empty'}, "
-                            f"snippet={resp_text[:200]}"
-                        )
-                        sample_logged = True
-            else:
-                js_error_count += 1
-                if not sample_logged:
-                    logger.warning(
-                        f"[DirectAPI] JS fetch 실패 샘플: "
-                        f"barcode={barcode}, status={entry.get('status', '?')}, "
-                        f"error={entry.get('error', 'N/A')}"
-                    )
-                    sample_logged = True
+            handle(entry)
 
-            processed = success_count + js_error_count + parse_error_count
-            if on_progress and processed % 50 == 0:
-                on_progress(processed, total)
+        return self._log_batch_done(results, counts, total, start_time)
 
+    @staticmethod
+    def _log_batch_done(
+        results: Dict[str, Dict[str, Any]],
+        counts: Dict[str, int],
+        total: int,
+        start_time: float,
+    ) -> Dict[str, Dict[str, Any]]:
+        """배치 완료 로그 (성공/실패유형/처리량)"""
+        elapsed = time.time() - start_time
+        js_error_count = counts['js_error']
+        parse_error_count = counts['parse_error']
         rate = total / elapsed if elapsed > 0 else 0
         error_detail = ""
         if js_error_count > 0 or parse_error_count > 0:
             error_detail = f" (JS에러={js_error_count}, SSV파싱실패={parse_error_count})"
         logger.info(
-            f"[DirectAPI] 배치 조회 완료: {success_count}/{total}건 성공, "
+            f"[DirectAPI] 배치 조회 완료: {counts['success']}/{total}건 성공, "
             f"{js_error_count + parse_error_count}건 실패{error_detail}, "
             f"{elapsed:.1f}초 ({rate:.0f}건/초)"
         )
@@ -16,19 +16,18 @@ Selenium UI 조작(날짜 콤보 변경, 전표 row 선택 등) 없이
 import time
 from typing import Any, Callable, Dict, List, Optional
 
-from src.collectors.direct_api_fetcher import (
-    parse_ssv_dataset,
-    ssv_row_to_dict,
-    _safe_int,
+from src.collectors.direct_api_fetcher import _safe_int
+from src.collectors.ssv_parser import (  # noqa: F401 - RS/US 재노출
+    RS,
+    US,
+    SsvDataset,
+    find_dataset,
+    parse_ssv,
 )
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# SSV 구분자
-RS = '\u001e'
-US = '\u001f'
-
 
 # ═══════════════════════════════════════════════════════════════════
 # 공유 XHR 인터셉터 (Direct API 템플릿 캡처용)
@@ -156,49 +155,16 @@ def replace_ssv_column(body: str, col_name: str, new_value: str) -> str:
     return RS.join(records)
 
 
-def parse_all_datasets(ssv_text: str) -> Dict[str, Dict[str, Any]]:
+def parse_all_datasets(ssv_text: str) -> Dict[str, SsvDataset]:
     """
-    SSV 응답에서 모든 데이터셋을 파싱
+    SSV 응답에서 모든 데이터셋을 파싱 (단일 패스)
 
     Returns:
-        {dataset_name: {'columns': [...], 'rows': [[...], ...]}}
+        {dataset_name: SsvDataset}  (ds['columns'], ds['rows']로도 접근 가능)
     """
     if not ssv_text:
         return {}
-
-    result = {}
-    records = ssv_text.split(RS)
-    i = 0
-
-    while i < len(records):
-        record = records[i]
-
-        # Dataset:이름 마커 찾기
-        if record.startswith('Dataset:'):
-            ds_name = record.split(':')[1].strip()
-
-            # 다음 레코드가 컬럼 헤더
-            if i + 1 < len(records) and '_RowType_' in records[i + 1]:
-                cols_raw = records[i + 1].split(US)
-                columns = [c.split(':')[0] for c in cols_raw]
-
-                rows = []
-                j = i + 2
-                while j < len(records):
-                    row_text = records[j].strip()
-                    if not row_text or row_text.startswith('Dataset:') or '_RowType_' in row_text:
-                        break
-                    vals = row_text.split(US)
-                    rows.append(vals)
-                    j += 1
-
-                result[ds_name] = {'columns': columns, 'rows': rows}
-                i = j
-                continue
-
-        i += 1
-
-    return result
+    return parse_ssv(ssv_text).named()
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -211,18 +177,18 @@ RECEIVING_ENDPOINT_SEARCH = '/stgj010/search'
 
 def parse_receiving_chit_list(ssv_text: str) -> List[Dict[str, str]]:
     """searchChitListPopup SSV → dsListPopup 전표 목록"""
-    ds = parse_ssv_dataset(ssv_text, 'NAP_PLAN_YMD')
+    ds = find_dataset(ssv_text, 'NAP_PLAN_YMD')
     if not ds:
         return []
-    return [ssv_row_to_dict(ds['columns'], row) for row in ds['rows']]
+    return ds.dicts()
 
 
 def parse_receiving_items(ssv_text: str) -> List[Dict[str, str]]:
     """search SSV → dsList 상품 목록"""
-    ds = parse_ssv_dataset(ssv_text, 'ITEM_CD')
+    ds = find_dataset(ssv_text, 'ITEM_CD')
     if not ds:
         return []
-    return [ssv_row_to_dict(ds['columns'], row) for row in ds['rows']]
+    return ds.dicts()
 
 
 class DirectReceivingFetcher:
@@ -479,10 +445,10 @@ WASTE_SLIP_ENDPOINT = '/stgj020/search'
 
 def parse_waste_slip_list(ssv_text: str) -> List[Dict[str, str]]:
     """stgj020/search SSV → dsList 폐기 전표 목록"""
-    ds = parse_ssv_dataset(ssv_text, 'CHIT_FLAG')
+    ds = find_dataset(ssv_text, 'CHIT_FLAG')
     if not ds:
         return []
-    return [ssv_row_to_dict(ds['columns'], row) for row in ds['rows']]
+    return ds.dicts()
 
 
 class DirectWasteSlipFetcher:
@@ -635,27 +601,17 @@ def parse_order_status_result(ssv_text: str) -> Dict[str, Any]:
     # dsResult
     ds_result = datasets.get('dsResult')
     if ds_result:
-        result['dsResult'] = [
-            ssv_row_to_dict(ds_result['columns'], row)
-            for row in ds_result['rows']
-        ]
+        result['dsResult'] = ds_result.dicts()
 
     # dsOrderSale
     ds_order_sale = datasets.get('dsOrderSale')
     if ds_order_sale:
-        result['dsOrderSale'] = [
-            ssv_row_to_dict(ds_order_sale['columns'], row)
-            for row in ds_order_sale['rows']
-        ]
+        result['dsOrderSale'] = ds_order_sale.dicts()
 
     # dsWeek
     ds_week = datasets.get('dsWeek')
     if ds_week:
-        for row_vals in ds_week['rows']:
-            row = ssv_row_to_dict(ds_week['columns'], row_vals)
-            ymd = row.get('ORD_YMD', '')
-            if ymd:
-                result['dsWeek'].append(ymd)
+        result['dsWeek'] = [ymd for ymd in ds_week.strings('ORD_YMD') if ymd]
 
     return result
 
@@ -809,9 +765,8 @@ def parse_waste_slip_detail(ssv_text: str) -> List[Dict[str, str]]:
     for t in range(5):
         ds_name = f'dsListType{t}'
         ds = datasets.get(ds_name)
-        if ds and ds.get('rows'):
-            for row in ds['rows']:
-                item = ssv_row_to_dict(ds['columns'], row)
+        if ds and ds.rows:
+            for item in ds.iter_dicts():
                 item['_dsType'] = str(t)
                 all_items.append(item)
 
@@ -17,56 +17,54 @@ Selenium 팝업 조작 없이 /stbjz00/selItemDetailSearch, /stbjz00/selItemDeta
     3. /stbjz00/selItemDetailSale   → dsOrderSale (90일 이력)
 """
 
+import re
 import time
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 
 from src.collectors.direct_api_fetcher import (
-    parse_ssv_dataset,
-    ssv_row_to_dict,
     _safe_int,
     _clean_text,
 )
+from src.collectors.ssv_http_client import SsvHttpClient
+from src.collectors.ssv_parser import RS, US, find_dataset  # noqa: F401 - RS/US 재노출
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# SSV 구분자
-RS = '\u001e'  # Record Separator
-US = '\u001f'  # Unit Separator
-
 # API 엔드포인트
 ENDPOINT_DETAIL = '/stbjz00/selItemDetailSearch'
 ENDPOINT_ORD = '/stbjz00/selItemDetailOrd'
 ENDPOINT_SALE = '/stbjz00/selItemDetailSale'
 
 
+def _replace_param(body: str, key: str, value: str) -> str:
+    """SSV body의 첫 key=값 교체 (JS replaceParam과 동일)"""
+    return re.sub(key + r'=[^\x1e]*', lambda _: f'{key}={value}', body, count=1)
+
+
 # ═══════════════════════════════════════════════════════════════════
 # SSV 응답 파싱
 # ═══════════════════════════════════════════════════════════════════
 
 def parse_popup_detail(ssv_text: str) -> Optional[Dict[str, str]]:
     """selItemDetailSearch SSV 응답 → dsItemDetail 첫 행 딕셔너리"""
-    ds = parse_ssv_dataset(ssv_text, 'ITEM_NM')
-    if ds and ds['rows']:
-        return ssv_row_to_dict(ds['columns'], ds['rows'][0])
-    return None
+    ds = find_dataset(ssv_text, 'ITEM_NM')
+    return ds.first_dict() if ds else None
 
 
 def parse_popup_ord(ssv_text: str) -> Optional[Dict[str, str]]:
     """selItemDetailOrd SSV 응답 → dsItemDetailOrd 첫 행 딕셔너리"""
-    ds = parse_ssv_dataset(ssv_text, 'ORD_ADAY')
-    if ds and ds['rows']:
-        return ssv_row_to_dict(ds['columns'], ds['rows'][0])
-    return None
+    ds = find_dataset(ssv_text, 'ORD_ADAY')
+    return ds.first_dict() if ds else None
 
 
 def parse_popup_sale(ssv_text: str) -> List[Dict[str, str]]:
     """selItemDetailSale SSV 응답 → dsOrderSale 전체 행 리스트"""
-    ds = parse_ssv_dataset(ssv_text, 'ORD_QTY')
+    ds = find_dataset(ssv_text, 'ORD_QTY')
     if not ds:
         return []
-    return [ssv_row_to_dict(ds['columns'], row) for row in ds['rows']]
+    return ds.dicts()
 
 
 def extract_product_detail(
@@ -252,10 +250,12 @@ class DirectPopupFetcher:
         driver: Any,
         concurrency: int = 5,
         timeout_ms: int = 8000,
+        http_client: Optional[SsvHttpClient] = None,
     ):
         self.driver = driver
         self.concurrency = concurrency
         self.timeout_ms = timeout_ms
+        self.http_client = http_client  # 설정 시 배치 조회를 Python HTTP로 (ssv-http-client)
         self._detail_template: Optional[str] = None
         self._ord_template: Optional[str] = None
         self._ord_ymd: Optional[str] = None
@@ -443,6 +443,16 @@ class DirectPopupFetcher:
         )
         start_time = time.time()
 
+        if self.http_client:
+            results = self._fetch_batch_http(
+                item_codes, ord_ymd, include_ord, on_progress, delay_ms, start_time
+            )
+            if results is not None:
+                return results
+            # 응답을 하나도 못 받음 (HTTP 경로 자체 문제) → 브라우저 JS fetch 로 전환
+            logger.warning("[PopupAPI] HTTP 배치 전량 실패 → 브라우저 JS fetch 폴백")
+            self.http_client = None
+
         try:
             raw_results = self.driver.execute_script("""
                 var detailTmpl = arguments[0];
@@ -560,6 +570,75 @@ class DirectPopupFetcher:
 
         return results
 
+    def _fetch_batch_http(
+        self,
+        item_codes: List[str],
+        ord_ymd: str,
+        include_ord: bool,
+        on_progress: Optional[Callable[[int, int], None]],
+        delay_ms: int,
+        start_time: float,
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        HTTP 클라이언트 배치 조회
+
+        1단계 selItemDetailSearch (도착 즉시 파싱) → 2단계 상세 성공 상품만 selItemDetailOrd.
+        JS 경로와 같이 ord는 상세 조회 이후에만 요청합니다.
+
+        Returns:
+            {item_cd: {'detail', 'ord'}}, 상세 정상 응답을 하나도 못 받았으면
+            None (호출자가 JS fetch 폴백)
+        """
+        total = len(item_codes)
+        results: Dict[str, Dict[str, Any]] = {}
+        counts = {'success': 0, 'error': 0, 'responded': 0}
+
+        def body_for(template: str, item_cd: str) -> str:
+            body = _replace_param(template, 'strItemCd', item_cd)
+            return _replace_param(body, 'strOrdYmd', ord_ymd)
+
+        def handle_detail(result) -> None:
+            counts['responded'] += result.ok
+            detail_row = parse_popup_detail(result.text) if result.ok and result.text else None
+            if detail_row:
+                results[result.key] = {'detail': detail_row, 'ord': None}
+                counts['success'] += 1
+            else:
+                counts['error'] += 1
+            processed = counts['success'] + counts['error']
+            if on_progress and processed % 50 == 0:
+                on_progress(processed, total)
+
+        def handle_ord(result) -> None:
+            if result.ok and result.text:
+                results[result.key]['ord'] = parse_popup_ord(result.text)
+
+        try:
+            self.http_client.post_many(
+                ((cd, ENDPOINT_DETAIL, body_for(self._detail_template, cd)) for cd in item_codes),
+                on_result=handle_detail,
+                delay_ms=delay_ms,
+            )
+            if include_ord and self._ord_template and results:
+                self.http_client.post_many(
+                    ((cd, ENDPOINT_ORD, body_for(self._ord_template, cd)) for cd in list(results)),
+                    on_result=handle_ord,
+                    delay_ms=delay_ms,
+                )
+        except Exception as e:
+            logger.error(f"[PopupAPI] HTTP 배치 실패: {e}")
+            return results if counts['responded'] else None
+        if not counts['responded']:
+            return None
+
+        elapsed = time.time() - start_time
+        rate = total / elapsed if elapsed > 0 else 0
+        logger.info(
+            f"[PopupAPI] HTTP 배치 완료: {counts['success']}/{total}건 성공, "
+            f"{counts['error']}건 실패, {elapsed:.1f}초 ({rate:.0f}건/초)"
+        )
+        return results
+
     # ──────────────────────────────────────────
     # 고수준 래퍼 (collector 통합용)
     # ──────────────────────────────────────────
@@ -10,15 +10,12 @@ Selenium UI 조작 없이 /stmb011/selSearch, /stmb011/selDetailSearch 엔드포
 import time
 from typing import Any, Callable, Dict, List, Optional
 
-from src.collectors.direct_api_fetcher import parse_ssv_dataset, ssv_row_to_dict
+from src.collectors.ssv_http_client import SsvHttpClient
+from src.collectors.ssv_parser import RS, US, find_dataset  # noqa: F401 - RS/US 재노출
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# SSV 구분자
-RS = '\u001e'  # Record Separator
-US = '\u001f'  # Unit Separator
-
 
 def parse_sales_list_response(ssv_text: str) -> List[Dict[str, Any]]:
     """
@@ -27,22 +24,27 @@ def parse_sales_list_response(ssv_text: str) -> List[Dict[str, Any]]:
     Returns:
         [{MID_CD, MID_NM, SALE_QTY, SALE_AMT, RATE}, ...]
     """
-    ds = parse_ssv_dataset(ssv_text, 'MID_CD')
+    ds = find_dataset(ssv_text, 'MID_CD')
     if not ds:
         return []
 
-    categories = []
-    for row_vals in ds['rows']:
-        row = ssv_row_to_dict(ds['columns'], row_vals)
-        categories.append({
-            'MID_CD': row.get('MID_CD', ''),
-            'MID_NM': row.get('MID_NM', ''),
-            'SALE_QTY': _safe_int(row.get('SALE_QTY', '0')),
-            'SALE_AMT': _safe_int(row.get('SALE_AMT', '0')),
-            'RATE': row.get('RATE', '0'),
-        })
-
-    return categories
+    # 컬럼 단위 변환 (행마다 dict를 만들지 않음)
+    mid_cds = ds.strings('MID_CD')
+    mid_nms = ds.strings('MID_NM')
+    sale_qty = ds.ints('SALE_QTY')
+    sale_amt = ds.ints('SALE_AMT')
+    rates = ds.strings('RATE', '0')
+
+    return [
+        {
+            'MID_CD': mid_cds[i],
+            'MID_NM': mid_nms[i],
+            'SALE_QTY': sale_qty[i],
+            'SALE_AMT': sale_amt[i],
+            'RATE': rates[i],
+        }
+        for i in range(len(ds))
+    ]
 
 
 def parse_sales_detail_response(ssv_text: str, mid_cd: str, mid_nm: str) -> List[Dict[str, Any]]:
@@ -52,26 +54,33 @@ def parse_sales_detail_response(ssv_text: str, mid_cd: str, mid_nm: str) -> List
     Returns:
         [{MID_CD, MID_NM, ITEM_CD, ITEM_NM, SALE_QTY, ORD_QTY, BUY_QTY, DISUSE_QTY, STOCK_QTY}, ...]
     """
-    ds = parse_ssv_dataset(ssv_text, 'ITEM_CD')
+    ds = find_dataset(ssv_text, 'ITEM_CD')
     if not ds:
         return []
 
-    items = []
-    for row_vals in ds['rows']:
-        row = ssv_row_to_dict(ds['columns'], row_vals)
-        items.append({
+    # 컬럼 단위 변환 (행마다 dict를 만들지 않음)
+    item_cds = ds.strings('ITEM_CD')
+    item_nms = ds.strings('ITEM_NM')
+    sale_qty = ds.ints('SALE_QTY')
+    ord_qty = ds.ints('ORD_QTY')
+    buy_qty = ds.ints('BUY_QTY')
+    disuse_qty = ds.ints('DISUSE_QTY')
+    stock_qty = ds.ints('STOCK_QTY')
+
+    return [
+        {
             'MID_CD': mid_cd,
             'MID_NM': mid_nm,
-            'ITEM_CD': row.get('ITEM_CD', ''),
-            'ITEM_NM': row.get('ITEM_NM', ''),
-            'SALE_QTY': _safe_int(row.get('SALE_QTY', '0')),
-            'ORD_QTY': _safe_int(row.get('ORD_QTY', '0')),
-            'BUY_QTY': _safe_int(row.get('BUY_QTY', '0')),
-            'DISUSE_QTY': _safe_int(row.get('DISUSE_QTY', '0')),
-            'STOCK_QTY': _safe_int(row.get('STOCK_QTY', '0')),
-        })
-
-    return items
+            'ITEM_CD': item_cds[i],
+            'ITEM_NM': item_nms[i],
+            'SALE_QTY': sale_qty[i],
+            'ORD_QTY': ord_qty[i],
+            'BUY_QTY': buy_qty[i],
+            'DISUSE_QTY': disuse_qty[i],
+            'STOCK_QTY': stock_qty[i],
+        }
+        for i in range(len(ds))
+    ]
 
 
 def _safe_int(val: Any) -> int:
@@ -92,16 +101,24 @@ class DirectSalesFetcher:
     /stmb011/selSearch, /stmb011/selDetailSearch에 직접 요청을 보냅니다.
     """
 
-    def __init__(self, driver: Any, concurrency: int = 5, timeout_ms: int = 5000):
+    def __init__(
+        self,
+        driver: Any,
+        concurrency: int = 5,
+        timeout_ms: int = 5000,
+        http_client: Optional[SsvHttpClient] = None,
+    ):
         """
         Args:
             driver: 로그인된 Selenium WebDriver
             concurrency: 동시 요청 수 (서버 부하 방지)
             timeout_ms: 개별 요청 타임아웃 (밀리초)
+            http_client: 상세 배치 조회용 HTTP 클라이언트 (None이면 브라우저 JS fetch)
         """
         self.driver = driver
         self.concurrency = concurrency
         self.timeout_ms = timeout_ms
+        self.http_client = http_client
         self._search_template: Optional[str] = None
         self._detail_template: Optional[str] = None
 
@@ -338,6 +355,16 @@ class DirectSalesFetcher:
         )
         start_time = time.time()
 
+        if self.http_client:
+            items = self._fetch_details_http(
+                base_body, mid_codes, mid_nm_map, on_progress, delay_ms, start_time
+            )
+            if items is not None:
+                return items
+            # 응답을 하나도 못 받음 (HTTP 경로 자체 문제) → 브라우저 JS fetch 로 전환
+            logger.warning("[DirectSales] HTTP 배치 전량 실패 → 브라우저 JS fetch 폴백")
+            self.http_client = None
+
         try:
             raw_results = self.driver.execute_script("""
                 var baseBody = arguments[0];
@@ -421,6 +448,63 @@ class DirectSalesFetcher:
 
         return all_items
 
+    def _fetch_details_http(
+        self,
+        base_body: str,
+        mid_codes: List[str],
+        mid_nm_map: Dict[str, str],
+        on_progress: Optional[Callable[[int, int], None]],
+        delay_ms: int,
+        start_time: float,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """HTTP 클라이언트로 상세 배치 조회 (응답 도착 즉시 파싱)
+
+        Returns:
+            상품 목록, 정상 응답을 하나도 못 받았으면 None (호출자가 JS fetch 폴백)
+        """
+        total = len(mid_codes)
+        all_items: List[Dict[str, Any]] = []
+        counts = {'success': 0, 'error': 0, 'responded': 0}
+
+        def handle(result) -> None:
+            mid_cd = result.key
+            counts['responded'] += result.ok
+            if result.ok and result.text:
+                all_items.extend(
+                    parse_sales_detail_response(result.text, mid_cd, mid_nm_map.get(mid_cd, ''))
+                )
+                counts['success'] += 1
+            else:
+                counts['error'] += 1
+                logger.warning(f"[DirectSales] {mid_cd} 실패: {result.error or 'unknown'}")
+            processed = counts['success'] + counts['error']
+            if on_progress and processed % 10 == 0:
+                on_progress(processed, total)
+
+        try:
+            self.http_client.post_many(
+                (
+                    (mid_cd, '/stmb011/selDetailSearch',
+                     _replace_ssv_param(base_body, 'strMidCd', mid_cd))
+                    for mid_cd in mid_codes
+                ),
+                on_result=handle,
+                delay_ms=delay_ms,
+            )
+        except Exception as e:
+            logger.error(f"[DirectSales] HTTP 배치 조회 실패: {e}")
+        if not counts['responded']:
+            return None
+
+        elapsed = time.time() - start_time
+        rate = total / elapsed if elapsed > 0 else 0
+        logger.info(
+            f"[DirectSales] HTTP 배치 조회 완료: {counts['success']}/{total}건 성공, "
+            f"{counts['error']}건 실패, {len(all_items)}개 상품, "
+            f"{elapsed:.1f}초 ({rate:.0f}건/초)"
+        )
+        return all_items
+
     def collect_all(
         self,
         date_str: str,
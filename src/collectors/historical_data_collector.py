@@ -319,7 +319,8 @@ class HistoricalDataCollector:
             sales_data=formatted_data,
             sales_date=date_str,
             store_id=self.store_id,
-            collected_at=datetime.now().isoformat()
+            collected_at=datetime.now().isoformat(),
+            bulk=True,
         )
 
         return stats
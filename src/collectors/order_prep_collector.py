@@ -147,6 +147,7 @@ class OrderPrepCollector:
         if not driver:
             return None
         try:
+            from src.collectors.ssv_http_client import http_client_for_driver
             from src.settings.constants import (
                 DIRECT_API_CONCURRENCY, DIRECT_API_TIMEOUT_MS,
             )
@@ -154,6 +155,9 @@ class OrderPrepCollector:
                 driver,
                 concurrency=DIRECT_API_CONCURRENCY,
                 timeout_ms=DIRECT_API_TIMEOUT_MS,
+                http_client=http_client_for_driver(
+                    driver, DIRECT_API_CONCURRENCY, DIRECT_API_TIMEOUT_MS
+                ),
             )
         except Exception:
             return DirectApiFetcher(driver)
@@ -126,9 +126,11 @@ class ProductDetailBatchCollector:
         """
         try:
             from src.collectors.direct_popup_fetcher import DirectPopupFetcher
+            from src.collectors.ssv_http_client import http_client_for_driver
 
             fetcher = DirectPopupFetcher(
-                self.driver, concurrency=5, timeout_ms=8000
+                self.driver, concurrency=5, timeout_ms=8000,
+                http_client=http_client_for_driver(self.driver, 5, 8000),
             )
 
             # 캡처된 템플릿 확인
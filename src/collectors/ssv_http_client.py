@@ -0,0 +1,418 @@
+"""
+SSV HTTP 클라이언트 - 브라우저 없이 넥사크로 SSV 엔드포인트 직접 호출 (ssv-http-client)
+
+Direct 페처들은 driver.execute_script() 안의 JS fetch()로 요청을 보내고
+수천 건의 SSV 응답 텍스트를 WebDriver JSON 브리지로 한 번에 돌려받습니다.
+이 모듈은 로그인된 드라이버에서 세션 쿠키만 가져와 Python 측에서 직접 호출합니다.
+
+- asyncio 스트림 기반 keep-alive 연결 풀 (배치 1회 동안 연결 재사용)
+- concurrency 개 worker로 동시 요청 수 제한 (JS worker pool과 동일 의미)
+- 요청별 재시도 (연결 오류/타임아웃/5xx·429 → 지수 백오프)
+- 응답 형식 오류(상태줄/길이/압축/인코딩)도 해당 요청의 실패 HttpResult 로 기록
+  (배치 전체 중단 없음 → 호출자가 전량 실패 시 JS fetch 로 폴백)
+- on_result 콜백: 응답이 도착하는 즉시 호출 → 나머지 요청 대기 중에 파싱
+- Set-Cookie 갱신 반영 (세션 쿠키 회전)
+
+표준 라이브러리만 사용합니다 (aiohttp 등 추가 의존성 없음).
+
+Usage:
+    client = SsvHttpClient.from_driver(driver, concurrency=5)
+    results = client.post_many(
+        [(item_cd, '/stbj030/selSearch', body) for item_cd, body in bodies],
+        on_result=lambda r: handle(r.key, r.text),
+    )
+"""
+
+import asyncio
+import gzip
+import socket
+import ssl
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 재시도 대상 HTTP 상태 (그 외 4xx는 즉시 실패)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+DEFAULT_HEADERS = {
+    'Content-Type': 'text/plain;charset=UTF-8',
+    'Accept': '*/*',
+    'Accept-Encoding': 'gzip, deflate',
+}
+
+
+@dataclass
+class HttpResult:
+    """단일 요청 결과 (JS 배치의 {ok, text, status, error} 엔트리에 대응)"""
+    key: Any
+    status: int = 0
+    text: str = ''
+    error: Optional[str] = None
+    attempts: int = 0
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and 200 <= self.status < 300
+
+
+class _RetryableError(Exception):
+    """재시도 가능한 HTTP 상태 응답"""
+
+
+# 요청 1건의 실패로 처리할 예외 (배치 전체로 전파하지 않음)
+# - 연결/타임아웃: OSError, EOFError, TimeoutError, IncompleteReadError
+# - 응답 형식 오류: 상태줄/Content-Length/청크 크기 ValueError, 압축 해제 zlib.error,
+#   디코딩 UnicodeDecodeError(ValueError), 알 수 없는 charset LookupError
+_REQUEST_ERRORS = (
+    _RetryableError, OSError, EOFError, asyncio.TimeoutError,
+    asyncio.IncompleteReadError, ValueError, LookupError, zlib.error,
+)
+
+
+class _Connection:
+    """keep-alive HTTP/1.1 연결 1개"""
+
+    __slots__ = ('reader', 'writer')
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+class SsvHttpClient:
+    """
+    넥사크로 SSV POST 요청을 Python 측에서 직접 보내는 클라이언트
+
+    연결 풀은 post_many() 1회(= 배치 1회) 동안 유지되며, 배치가 끝나면 닫힙니다.
+    쿠키는 인스턴스에 보관되어 배치 간에 공유됩니다.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        cookies: Optional[Dict[str, str]] = None,
+        concurrency: int = 5,
+        timeout_ms: int = 8000,
+        retries: int = 2,
+        backoff_ms: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Args:
+            base_url: 스킴+호스트 (예: https://store.bgfretail.com)
+            cookies: 세션 쿠키 {name: value}
+            concurrency: 동시 요청 수 (= 최대 연결 수)
+            timeout_ms: 요청 1회 타임아웃 (밀리초, 연결~응답 본문 수신까지)
+            retries: 요청별 최대 재시도 횟수 (총 시도 = retries + 1)
+            backoff_ms: 재시도 대기 기본값 (시도마다 2배)
+            headers: 추가/덮어쓸 요청 헤더
+        """
+        parts = urlsplit(base_url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"지원하지 않는 base_url: {base_url}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port or (443 if self.scheme == 'https' else 80)
+        self.base_url = f"{self.scheme}://{parts.netloc}"
+        self.cookies: Dict[str, str] = dict(cookies or {})
+        self.concurrency = max(1, int(concurrency))
+        self.timeout_ms = timeout_ms
+        self.retries = max(0, int(retries))
+        self.backoff_ms = backoff_ms
+        self.headers = dict(DEFAULT_HEADERS)
+        self.headers.setdefault('Origin', self.base_url)
+        self.headers.setdefault('Referer', self.base_url + '/')
+        if headers:
+            self.headers.update(headers)
+        self._ssl_context = ssl.create_default_context() if self.scheme == 'https' else None
+
+    @classmethod
+    def from_driver(cls, driver: Any, **kwargs) -> 'SsvHttpClient':
+        """
+        로그인된 Selenium 드라이버의 현재 origin/쿠키/User-Agent로 생성
+
+        Args:
+            driver: 로그인된 WebDriver
+            **kwargs: __init__ 인자 (concurrency, timeout_ms, retries 등)
+        """
+        cookies = {c['name']: c['value'] for c in (driver.get_cookies() or [])}
+        headers = dict(kwargs.pop('headers', None) or {})
+        try:
+            user_agent = driver.execute_script("return navigator.userAgent;")
+            if user_agent:
+                headers.setdefault('User-Agent', user_agent)
+        except Exception as e:
+            logger.debug(f"[SsvHttp] User-Agent 조회 실패: {e}")
+        return cls(driver.current_url, cookies=cookies, headers=headers, **kwargs)
+
+    # ──────────────────────────────────────────
+    # 공개 API (동기)
+    # ──────────────────────────────────────────
+
+    def post(self, path: str, body: str) -> HttpResult:
+        """단일 POST 요청"""
+        return self.post_many([(path, path, body)])[0]
+
+    def post_many(
+        self,
+        requests: Iterable[Tuple[Any, str, str]],
+        on_result: Optional[Callable[[HttpResult], None]] = None,
+        delay_ms: int = 0,
+    ) -> List[HttpResult]:
+        """
+        여러 POST 요청을 동시성 제한 하에 실행
+
+        Args:
+            requests: [(key, path, body), ...] — key는 결과 식별용 (상품코드 등)
+            on_result: 요청 1건 완료 시 즉시 호출되는 콜백 (스트리밍 파싱용).
+                콜백 예외는 로깅 후 무시 (배치 중단 없음)
+            delay_ms: worker별 요청 간 딜레이 (서버 부하 방지)
+
+        Returns:
+            HttpResult 목록 (완료 순서)
+        """
+        jobs = list(requests)
+        if not jobs:
+            return []
+        coro = self._run(jobs, on_result, delay_ms)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # 이미 이벤트 루프가 도는 스레드에서 호출된 경우 → 별도 스레드에서 실행
+        box: Dict[str, Any] = {}
+
+        def runner():
+            try:
+                box['result'] = asyncio.run(coro)
+            except BaseException as e:  # pragma: no cover - 전달 후 재발생
+                box['error'] = e
+
+        thread = threading.Thread(target=runner, name='ssv-http-client')
+        thread.start()
+        thread.join()
+        if 'error' in box:
+            raise box['error']
+        return box['result']
+
+    # ──────────────────────────────────────────
+    # asyncio 내부 구현
+    # ──────────────────────────────────────────
+
+    async def _run(
+        self,
+        jobs: List[Tuple[Any, str, str]],
+        on_result: Optional[Callable[[HttpResult], None]],
+        delay_ms: int,
+    ) -> List[HttpResult]:
+        idle: List[_Connection] = []
+        results: List[HttpResult] = []
+        queue = iter(jobs)
+
+        async def worker():
+            for key, path, body in queue:
+                try:
+                    result = await self._request_with_retry(idle, key, path, body)
+                except Exception as e:
+                    # 예상 밖 예외도 해당 요청 실패로만 기록 (gather 로 배치 전체가 깨지지 않게)
+                    logger.warning(f"[SsvHttp] 요청 처리 예외 ({key}): {type(e).__name__}: {e}")
+                    result = HttpResult(key=key, error=f"{type(e).__name__}: {e}")
+                results.append(result)
+                if on_result:
+                    try:
+                        on_result(result)
+                    except Exception as e:
+                        logger.warning(f"[SsvHttp] 결과 처리 콜백 실패 ({key}): {e}")
+                if delay_ms > 0:
+                    await asyncio.sleep(delay_ms / 1000)
+
+        try:
+            await asyncio.gather(
+                *(worker() for _ in range(min(self.concurrency, len(jobs))))
+            )
+        finally:
+            for conn in idle:
+                conn.close()
+        return results
+
+    async def _request_with_retry(
+        self, idle: List[_Connection], key: Any, path: str, body: str,
+    ) -> HttpResult:
+        payload = body.encode('utf-8')
+        start = time.perf_counter()
+        result = HttpResult(key=key)
+
+        for attempt in range(self.retries + 1):
+            result.attempts = attempt + 1
+            conn = idle.pop() if idle else None
+            try:
+                if conn is None:
+                    conn = await asyncio.wait_for(
+                        self._open(), timeout=self.timeout_ms / 1000
+                    )
+                status, text, keep_alive = await asyncio.wait_for(
+                    self._exchange(conn, path, payload),
+                    timeout=self.timeout_ms / 1000,
+                )
+                if keep_alive:
+                    idle.append(conn)
+                else:
+                    conn.close()
+                result.status, result.text = status, text
+                if status in RETRY_STATUSES:
+                    raise _RetryableError(f"HTTP {status}")
+                result.error = None if 200 <= status < 300 else f"HTTP {status}"
+                break
+            except _REQUEST_ERRORS as e:
+                # 응답 형식 오류 후에는 스트림 위치를 알 수 없으므로 연결도 버린다
+                if conn is not None and not isinstance(e, _RetryableError):
+                    conn.close()
+                if isinstance(e, (ValueError, LookupError, zlib.error)):
+                    result.status = 0
+                    result.error = f"응답 형식 오류 {type(e).__name__}: {e}"
+                else:
+                    result.error = str(e) or type(e).__name__
+                if attempt < self.retries:
+                    await asyncio.sleep(self.backoff_ms * (2 ** attempt) / 1000)
+
+        result.elapsed_ms = (time.perf_counter() - start) * 1000
+        return result
+
+    async def _open(self) -> _Connection:
+        reader, writer = await asyncio.open_connection(
+            self.host, self.port, ssl=self._ssl_context,
+            server_hostname=self.host if self._ssl_context else None,
+        )
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return _Connection(reader, writer)
+
+    async def _exchange(
+        self, conn: _Connection, path: str, payload: bytes,
+    ) -> Tuple[int, str, bool]:
+        """요청 전송 + 응답 수신 → (status, text, keep_alive)"""
+        lines = [
+            f"POST {path} HTTP/1.1",
+            f"Host: {self.host}" + ('' if self.port in (80, 443) else f":{self.port}"),
+            f"Content-Length: {len(payload)}",
+            "Connection: keep-alive",
+        ]
+        lines.extend(f"{k}: {v}" for k, v in self.headers.items())
+        if self.cookies:
+            lines.append(
+                "Cookie: " + '; '.join(f"{k}={v}" for k, v in self.cookies.items())
+            )
+        conn.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + payload)
+        await conn.writer.drain()
+
+        reader = conn.reader
+        status_line = await reader.readline()
+        if not status_line:
+            # keep-alive 연결이 서버 측에서 닫힘 → 새 연결로 재시도
+            raise ConnectionResetError("connection closed by server")
+        version, status = status_line.decode('latin-1').split(None, 2)[:2]
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            name, value = name.strip().lower(), value.strip()
+            if name == 'set-cookie':
+                self._store_cookie(value)
+            else:
+                headers[name] = value
+
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            raw = await self._read_chunked(reader)
+        elif 'content-length' in headers:
+            raw = await reader.readexactly(int(headers['content-length']))
+        else:
+            raw = await reader.read()
+            headers['connection'] = 'close'
+
+        encoding = headers.get('content-encoding', '').lower()
+        if encoding == 'gzip':
+            raw = gzip.decompress(raw)
+        elif encoding == 'deflate':
+            raw = zlib.decompress(raw)
+
+        charset = 'utf-8'
+        for part in headers.get('content-type', '').split(';'):
+            if part.strip().lower().startswith('charset='):
+                charset = part.split('=', 1)[1].strip() or charset
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' and (
+            version.upper() != 'HTTP/1.0' or connection == 'keep-alive'
+        )
+        return int(status), raw.decode(charset, errors='replace'), keep_alive
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+        chunks = []
+        while True:
+            size_line = await reader.readline()
+            if not size_line:
+                raise asyncio.IncompleteReadError(b''.join(chunks), None)
+            size = int(size_line.split(b';', 1)[0].strip(), 16)
+            if size == 0:
+                # trailer 헤더 소비
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                return b''.join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    def _store_cookie(self, header_value: str) -> None:
+        """Set-Cookie 헤더의 name=value 반영 (속성은 무시)"""
+        pair = header_value.split(';', 1)[0]
+        name, sep, value = pair.partition('=')
+        if sep and name.strip():
+            self.cookies[name.strip()] = value.strip()
+
+
+def http_client_for_driver(
+    driver: Any, concurrency: int = 5, timeout_ms: int = 8000,
+) -> Optional[SsvHttpClient]:
+    """
+    설정(DIRECT_API_HTTP_CLIENT)이 켜져 있으면 드라이버 세션으로 클라이언트 생성
+
+    Returns:
+        SsvHttpClient 또는 None (비활성/생성 실패 → 브라우저 JS fetch 유지)
+    """
+    from src.settings.constants import DIRECT_API_HTTP_CLIENT, DIRECT_API_HTTP_RETRIES
+
+    if not DIRECT_API_HTTP_CLIENT or driver is None:
+        return None
+    try:
+        client = SsvHttpClient.from_driver(
+            driver,
+            concurrency=concurrency,
+            timeout_ms=timeout_ms,
+            retries=DIRECT_API_HTTP_RETRIES,
+        )
+        logger.info(
+            f"[SsvHttp] HTTP 클라이언트 활성화: {client.base_url} (쿠키 {len(client.cookies)}개)"
+        )
+        return client
+    except Exception as e:
+        logger.warning(f"[SsvHttp] HTTP 클라이언트 생성 실패, JS fetch 유지: {e}")
+        return None
@@ -0,0 +1,311 @@
+"""
+SSV Parser - 넥사크로 SSV 응답 단일 패스 토크나이저 (single-pass-ssv)
+
+direct_api_fetcher / direct_frame_fetcher / direct_popup_fetcher /
+direct_sales_fetcher 가 공유하는 SSV 파서입니다.
+
+기존 parse_ssv_dataset()은 데이터셋 마커마다 응답 전체를 RS로 다시 분할했고
+(parse_full_ssv_response는 4회), 모듈마다 조금씩 다른 변형을 갖고 있었습니다.
+parse_ssv()는 응답을 한 번만 훑어 모든 데이터셋을 반환합니다.
+
+- 행은 per-row dict 대신 tuple로 보관 (필요 시 dicts()/first_dict()로 변환)
+- 컬럼 헤더의 ':INT' / ':STRING(256)' / ':bigdecimal(5)' 타입 접미사를 보존
+- column()/ints()/floats()는 array 기반 타입 컬럼을 반환
+
+SSV 구조:
+    SSV:UTF-8 RS ErrorCode:string=0 RS
+    Dataset:dsItem RS
+    _RowType_ US ITEM_CD:STRING(256) US NOW_QTY:INT(256) RS
+    N US 8801... US 10 RS
+    ...
+"""
+
+from array import array
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# SSV 구분자
+RS = '\u001e'  # Record Separator
+US = '\u001f'  # Unit Separator
+
+ROW_TYPE_COLUMN = '_RowType_'
+DATASET_PREFIX = 'Dataset:'
+
+# 넥사크로 컬럼 타입 → array typecode
+_INT_TYPES = frozenset({'INT', 'LONG', 'BIGINT'})
+_FLOAT_TYPES = frozenset({'FLOAT', 'DOUBLE', 'DECIMAL', 'BIGDECIMAL'})
+
+
+def _to_int(val: str) -> int:
+    """SSV 값 → int (빈값/비정상 → 0, '3.0' 허용)"""
+    try:
+        return int(val)
+    except (ValueError, TypeError):
+        pass
+    try:
+        return int(float(val))
+    except (ValueError, TypeError, OverflowError):
+        return 0
+
+
+def _to_float(val: str) -> float:
+    """SSV 값 → float (빈값/비정상 → 0.0)"""
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _parse_column_spec(spec: str) -> Tuple[str, str]:
+    """'SALE_QTY:INT(256)' → ('SALE_QTY', 'INT')"""
+    name, _, type_part = spec.partition(':')
+    col_type = type_part.split('(', 1)[0].strip().upper() if type_part else 'STRING'
+    return name, col_type or 'STRING'
+
+
+class SsvDataset:
+    """
+    SSV 데이터셋 1개 (헤더 + tuple 행)
+
+    Attributes:
+        name: 'Dataset:이름' 마커의 이름 (마커 없이 헤더만 온 경우 None)
+        columns: 컬럼명 목록 (_RowType_ 포함, 타입 접미사 제거)
+        types: 컬럼 타입 목록 ('STRING', 'INT', 'BIGDECIMAL', ...)
+        rows: 행 tuple 목록 (값은 원본 문자열)
+        header: 원본 헤더 레코드 (마커 부분 문자열 검색용)
+    """
+
+    __slots__ = ('name', 'columns', 'types', 'rows', 'header', '_index')
+
+    def __init__(
+        self,
+        name: Optional[str],
+        columns: List[str],
+        types: List[str],
+        rows: Optional[List[Tuple[str, ...]]] = None,
+        header: str = '',
+    ):
+        self.name = name
+        self.columns = columns
+        self.types = types
+        self.rows = rows if rows is not None else []
+        self.header = header or US.join(columns)
+        self._index: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_legacy(cls, ds: Dict[str, Any], name: Optional[str] = None) -> 'SsvDataset':
+        """{'columns': [...], 'rows': [[...]]} 형식 → SsvDataset"""
+        columns = list(ds.get('columns') or [])
+        rows = [tuple(r) for r in (ds.get('rows') or [])]
+        return cls(name, columns, ['STRING'] * len(columns), rows)
+
+    # ── 레거시 호환 ({'columns', 'rows'} 딕셔너리처럼 접근) ──
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'columns':
+            return self.columns
+        if key == 'rows':
+            return self.rows
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __bool__(self) -> bool:
+        # 헤더만 있고 행이 없는 데이터셋(CUT/미취급 응답)도 '존재'로 취급
+        return True
+
+    def __repr__(self) -> str:
+        return f"SsvDataset(name={self.name!r}, columns={len(self.columns)}, rows={len(self.rows)})"
+
+    # ── 컬럼 접근 ──
+
+    def index(self, column: str) -> int:
+        """컬럼 인덱스 (없으면 -1)"""
+        if self._index is None:
+            self._index = {}
+            for i, col in enumerate(self.columns):
+                self._index.setdefault(col, i)
+        return self._index.get(column, -1)
+
+    def has_column(self, column: str) -> bool:
+        return self.index(column) >= 0
+
+    def column_type(self, column: str) -> Optional[str]:
+        idx = self.index(column)
+        return self.types[idx] if idx >= 0 else None
+
+    def strings(self, column: str, default: str = '') -> List[str]:
+        """문자열 컬럼 (짧은 행/미존재 컬럼 → default)"""
+        idx = self.index(column)
+        if idx < 0:
+            return [default] * len(self.rows)
+        try:
+            return list(map(itemgetter(idx), self.rows))
+        except IndexError:
+            # 끝 컬럼이 잘린 행이 섞인 경우에만 행별 길이 확인
+            return [r[idx] if idx < len(r) else default for r in self.rows]
+
+    def ints(self, column: str) -> array:
+        """정수 컬럼 (array('q'), 빈값/비정상 → 0)"""
+        values = self.strings(column)
+        try:
+            return array('q', map(int, values))
+        except (ValueError, OverflowError):
+            return array('q', map(_to_int, values))
+
+    def floats(self, column: str) -> array:
+        """실수 컬럼 (array('d'), 빈값/비정상 → 0.0)"""
+        values = self.strings(column)
+        try:
+            return array('d', map(float, values))
+        except ValueError:
+            return array('d', map(_to_float, values))
+
+    def column(self, column: str) -> Sequence[Any]:
+        """헤더 타입 접미사에 따른 타입 컬럼 (INT → array('q'), BIGDECIMAL 등 → array('d'))"""
+        col_type = self.column_type(column)
+        if col_type in _INT_TYPES:
+            return self.ints(column)
+        if col_type in _FLOAT_TYPES:
+            return self.floats(column)
+        return self.strings(column)
+
+    def value(self, row_idx: int, column: str, default: str = '') -> str:
+        """단일 셀 값"""
+        idx = self.index(column)
+        if idx < 0 or row_idx >= len(self.rows):
+            return default
+        row = self.rows[row_idx]
+        return row[idx] if idx < len(row) else default
+
+    # ── dict 변환 (레거시 반환 형식이 필요한 곳에서만) ──
+
+    def row_dict(self, row: Sequence[str]) -> Dict[str, str]:
+        n = len(row)
+        return {col: (row[i] if i < n else '') for i, col in enumerate(self.columns)}
+
+    def dicts(self) -> List[Dict[str, str]]:
+        return [self.row_dict(r) for r in self.rows]
+
+    def iter_dicts(self) -> Iterator[Dict[str, str]]:
+        for r in self.rows:
+            yield self.row_dict(r)
+
+    def first_dict(self) -> Optional[Dict[str, str]]:
+        return self.row_dict(self.rows[0]) if self.rows else None
+
+    def last_dict(self) -> Optional[Dict[str, str]]:
+        return self.row_dict(self.rows[-1]) if self.rows else None
+
+    def to_legacy(self) -> Dict[str, Any]:
+        """{'columns': [...], 'rows': [[...]]} 형식"""
+        return {'columns': self.columns, 'rows': [list(r) for r in self.rows]}
+
+
+class SsvResponse:
+    """
+    SSV 응답 전체 파싱 결과
+
+    Attributes:
+        datasets: 응답 순서대로의 SsvDataset 목록
+        variables: 'ErrorCode:string=0' 형태의 변수 {'ErrorCode': '0', ...}
+    """
+
+    __slots__ = ('datasets', 'variables', '_by_name')
+
+    def __init__(self, datasets: List[SsvDataset], variables: Dict[str, str]):
+        self.datasets = datasets
+        self.variables = variables
+        self._by_name: Dict[str, SsvDataset] = {}
+        for ds in datasets:
+            if ds.name:
+                self._by_name[ds.name] = ds
+
+    def __bool__(self) -> bool:
+        return bool(self.datasets)
+
+    def dataset(self, name: str) -> Optional[SsvDataset]:
+        """이름으로 데이터셋 조회 ('Dataset:이름' 마커 기준)"""
+        return self._by_name.get(name)
+
+    def named(self) -> Dict[str, SsvDataset]:
+        """이름 있는 데이터셋 {name: SsvDataset} (중복 이름은 마지막)"""
+        return dict(self._by_name)
+
+    def find(self, marker: str, exclude: Optional[str] = None) -> Optional[SsvDataset]:
+        """
+        헤더에 marker 문자열을 포함하는 첫 데이터셋
+
+        기존 parse_ssv_dataset(ssv_text, marker)의 탐색 규칙(헤더 레코드 부분 문자열)과
+        동일합니다. exclude가 주어지면 그 문자열을 포함하는 헤더는 건너뜁니다.
+        """
+        for ds in self.datasets:
+            if marker in ds.header and not (exclude and exclude in ds.header):
+                return ds
+        return None
+
+
+def parse_ssv(ssv_text: Optional[str]) -> SsvResponse:
+    """
+    SSV 응답을 한 번만 훑어 모든 데이터셋/변수를 파싱
+
+    규칙:
+        - 'Dataset:이름' 레코드 → 다음 헤더의 데이터셋 이름
+        - '_RowType_'를 포함하는 레코드 → 컬럼 헤더 (새 데이터셋 시작)
+        - 헤더 이후 레코드 → 데이터 행 (빈 레코드/다음 Dataset/다음 헤더에서 종료)
+        - 데이터셋 밖의 'KEY:type=value' 레코드 → variables
+    """
+    datasets: List[SsvDataset] = []
+    variables: Dict[str, str] = {}
+    if not ssv_text:
+        return SsvResponse(datasets, variables)
+
+    pending_name: Optional[str] = None
+    rows: Optional[List[Tuple[str, ...]]] = None  # 현재 데이터셋 행 버퍼
+
+    for record in ssv_text.split(RS):
+        if ROW_TYPE_COLUMN in record:
+            specs = record.split(US)
+            columns = []
+            types = []
+            for spec in specs:
+                name, col_type = _parse_column_spec(spec)
+                columns.append(name)
+                types.append(col_type)
+            ds = SsvDataset(pending_name, columns, types, [], record)
+            datasets.append(ds)
+            rows = ds.rows
+            pending_name = None
+            continue
+
+        if record.startswith(DATASET_PREFIX):
+            pending_name = record[len(DATASET_PREFIX):].split(':', 1)[0].strip()
+            rows = None
+            continue
+
+        if rows is not None:
+            row_text = record.strip()
+            if not row_text:
+                rows = None
+                continue
+            rows.append(tuple(row_text.split(US)))
+            continue
+
+        # 데이터셋 밖: 변수 레코드 (SSV:UTF-8, ErrorCode:string=0 등)
+        key_part, sep, val = record.partition('=')
+        if sep:
+            variables[key_part.split(':', 1)[0].strip()] = val
+
+    return SsvResponse(datasets, variables)
+
+
+def find_dataset(ssv_text: Optional[str], marker: str) -> Optional[SsvDataset]:
+    """헤더에 marker를 포함하는 첫 데이터셋 (parse_ssv().find() 단축)"""
+    return parse_ssv(ssv_text).find(marker)
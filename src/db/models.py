@@ -2000,6 +2000,45 @@ CREATE INDEX IF NOT EXISTS idx_product_details_large ON product_details(large_cd
 CREATE INDEX IF NOT EXISTS idx_product_details_small ON product_details(small_cd);
 CREATE INDEX IF NOT EXISTS idx_pd_demand_pattern ON product_details(demand_pattern);
     """,
+
+    79: """
+-- v79: item_sales_stats — 상품별 판매 집계 (item-sales-stats)
+-- 7/14/30/60일 판매합·품절일·판매일, 마지막 판매일, 데이터 기간을 daily_sales 범위 스캔 없이 1행 조회.
+-- SalesRepository.save_daily_sales 가 같은 트랜잭션에서 증분 갱신, scripts/item_sales_stats.py 로 재구축/검증.
+CREATE TABLE IF NOT EXISTS item_sales_stats (
+    store_id TEXT NOT NULL,
+    item_cd TEXT NOT NULL,
+    first_date TEXT,
+    last_date TEXT,
+    last_sale_date TEXT,
+    record_days INTEGER DEFAULT 0,
+    sale_ring TEXT,
+    stock_ring TEXT,
+    updated_at TEXT,
+    PRIMARY KEY (store_id, item_cd)
+);
+    """,
+
+    80: """
+-- v80: dashboard_snapshots — 매장별 홈 대시보드 스냅샷 (common.db, dashboard-snapshot)
+-- 수집/발주/폐기 잡 종료 시 섹션별 JSON 을 기록, /api/home/* 는 1행 조회 + ETag 로 응답.
+CREATE TABLE IF NOT EXISTS dashboard_snapshots (
+    store_id TEXT NOT NULL,
+    section TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    etag TEXT NOT NULL,
+    generated_at TEXT NOT NULL,
+    PRIMARY KEY (store_id, section)
+);
+    """,
+
+    81: """
+-- v81: prediction_logs.stage_trace_z — stage_trace 압축 BLOB 전용 컬럼
+-- stage_trace(TEXT) 는 구 JSON 텍스트만 유지, 이미 적재된 BLOB 은 새 컬럼으로 이관.
+ALTER TABLE prediction_logs ADD COLUMN stage_trace_z BLOB;
+UPDATE prediction_logs SET stage_trace_z = stage_trace, stage_trace = NULL
+WHERE typeof(stage_trace) = 'blob';
+    """,
 }
 
 
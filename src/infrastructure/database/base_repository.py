@@ -28,7 +28,9 @@ class BaseRepository:
             db_type = "store"  # 매장별 DB 사용
 
         repo = SalesRepository(store_id="46513")
-        conn = repo._get_conn()  # → data/stores/46513.db
+        conn = repo._get_conn()  # → data/stores/46513.db (풀 커넥션)
+        ...
+        conn.close()             # → 실제 종료 대신 스레드 풀로 반환
     """
 
     # 서브클래스에서 오버라이드
@@ -59,16 +61,14 @@ class BaseRepository:
         if self._db_path:
             return get_connection(self._db_path)
 
-        # DB 타입에 따라 라우팅
+        # DB 타입에 따라 라우팅 (스레드별 풀: ATTACH/VIEW/PRAGMA 준비 완료 커넥션)
         if self.db_type == "common":
-            return DBRouter.get_common_connection()
+            return DBRouter.get_pooled_connection()
         elif self.db_type == "store":
             if not self.store_id:
                 # store_id 없이 매장 DB 접근 시 기존 단일 DB 사용 (호환)
                 return get_connection()
-            conn = DBRouter.get_store_connection(self.store_id)
-            from src.infrastructure.database.connection import attach_common_with_views
-            return attach_common_with_views(conn, self.store_id)
+            return DBRouter.get_pooled_connection(self.store_id)
         else:
             # legacy: 기존 단일 DB
             return get_connection()
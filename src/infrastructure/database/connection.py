@@ -6,9 +6,13 @@ DB 커넥션 라우터
 - 매장별 DB (stores/{store_id}.db): daily_sales, order_tracking 등
 """
 
+import os
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from src.utils.logger import get_logger
 
@@ -54,6 +58,7 @@ STORE_TABLES = frozenset({
     'app_settings',
     'dessert_decisions',
     'user_order_tendency',
+    'item_sales_stats',
 })
 
 
@@ -144,6 +149,20 @@ class DBRouter:
         # 기본: 공통 DB
         return DBRouter.get_common_connection()
 
+    @staticmethod
+    def get_pooled_connection(store_id: Optional[str] = None) -> sqlite3.Connection:
+        """스레드별 풀에서 커넥션 대여 (close() 시 풀로 반환)
+
+        store_id 지정 시 매장 DB + common ATTACH + temp VIEW가 준비된 커넥션,
+        None이면 공통 DB 커넥션을 반환한다.
+        """
+        return _pool.acquire(store_id)
+
+    @staticmethod
+    def close_pooled_connections() -> int:
+        """현재 스레드의 유휴 풀 커넥션 전부 종료 (스레드/작업 종료 시 호출)"""
+        return _pool.close_thread_connections()
+
     @staticmethod
     def is_common_table(table: str) -> bool:
         """공통 테이블 여부 확인"""
@@ -284,3 +303,196 @@ def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
     conn = sqlite3.connect(str(db_path), timeout=10)
     conn.row_factory = sqlite3.Row
     return conn
+
+
+# ── 커넥션 풀 (connection-pool) ──
+#
+# BaseRepository._get_conn()이 호출될 때마다 connect + PRAGMA database_list +
+# ATTACH + sqlite_master 조회 + temp VIEW 생성이 반복되던 것을
+# 스레드별 유휴 커넥션 재사용으로 대체한다.
+# sqlite3 커넥션은 기본적으로 생성 스레드에서만 사용 가능하므로 풀도 스레드별로 둔다.
+
+POOL_MAX_IDLE_PER_KEY = 4         # (DB, ATTACH 대상)별 유휴 커넥션 상한
+POOL_MAX_IDLE_PER_THREAD = 16     # 스레드당 유휴 커넥션 총 상한 (LRU 정리)
+POOL_MAX_AGE_SECONDS = 600        # 커넥션 재생성 주기
+POOL_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA busy_timeout=10000",
+    "PRAGMA cache_size=-16000",       # 16MB
+    "PRAGMA mmap_size=268435456",     # 256MB
+)
+
+
+class PooledConnection(sqlite3.Connection):
+    """close() 호출 시 실제로 닫지 않고 풀로 반환되는 커넥션
+
+    sqlite3.Connection 서브클래스이므로 pandas.read_sql, isinstance 검사,
+    with 문 등 기존 사용처와 그대로 호환된다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool: Optional["ConnectionPool"] = None
+        self._pool_key: Optional[Tuple[str, str]] = None
+        self._pool_file_id: Optional[Tuple[int, int]] = None
+        self._pool_created_at = time.monotonic()
+        self._pool_thread_id = threading.get_ident()
+        self._pool_idle = False
+
+    def close(self) -> None:
+        pool = self._pool
+        if pool is None:
+            super().close()
+            return
+        pool.release(self)
+
+    def close_physical(self) -> None:
+        """풀과 무관하게 실제로 커넥션 종료"""
+        self._pool = None
+        try:
+            super().close()
+        except Exception:
+            pass
+
+
+def _file_id(path: str) -> Optional[Tuple[int, int]]:
+    """DB 파일 식별자 (삭제 후 재생성 감지용)"""
+    try:
+        st = os.stat(path)
+        return (st.st_dev, st.st_ino)
+    except OSError:
+        return None
+
+
+class ConnectionPool:
+    """스레드별 SQLite 커넥션 풀
+
+    - 생성 시 1회: PRAGMA(WAL/busy_timeout/cache_size/mmap_size) + common ATTACH + temp VIEW
+    - 대여 시: 수명/파일 교체/`SELECT 1` 검증 후 재사용
+    - 반환 시: 미완료 트랜잭션 rollback, row_factory/isolation_level 초기화
+    """
+
+    def __init__(
+        self,
+        max_idle_per_key: int = POOL_MAX_IDLE_PER_KEY,
+        max_idle_per_thread: int = POOL_MAX_IDLE_PER_THREAD,
+        max_age_seconds: float = POOL_MAX_AGE_SECONDS,
+    ):
+        self.max_idle_per_key = max_idle_per_key
+        self.max_idle_per_thread = max_idle_per_thread
+        self.max_age_seconds = max_age_seconds
+        self._local = threading.local()
+
+    def _idle(self) -> "OrderedDict[Tuple[str, str], list]":
+        idle = getattr(self._local, "idle", None)
+        if idle is None:
+            idle = OrderedDict()
+            self._local.idle = idle
+        return idle
+
+    @staticmethod
+    def _resolve(store_id: Optional[str]) -> Tuple[str, str]:
+        """풀 키: (메인 DB 경로, ATTACH할 common 경로 — 공통 DB 자체면 "")"""
+        common_path = str(DBRouter.get_common_db_path())
+        if store_id:
+            return str(DBRouter.get_store_db_path(store_id)), common_path
+        return common_path, ""
+
+    def acquire(self, store_id: Optional[str] = None) -> sqlite3.Connection:
+        """커넥션 대여 (유휴 커넥션이 없거나 무효하면 새로 생성)"""
+        key = self._resolve(store_id)
+        db_path = key[0]
+        idle = self._idle()
+        bucket = idle.get(key)
+        while bucket:
+            conn = bucket.pop()
+            if self._is_valid(conn, db_path):
+                conn._pool_idle = False
+                idle.move_to_end(key)
+                return conn
+            conn.close_physical()
+        return self._open(key, store_id)
+
+    def _open(self, key: Tuple[str, str], store_id: Optional[str]) -> PooledConnection:
+        db_path, common_path = key
+        conn = sqlite3.connect(db_path, timeout=10, factory=PooledConnection)
+        conn.row_factory = sqlite3.Row
+        for pragma in POOL_PRAGMAS:
+            try:
+                conn.execute(pragma)
+            except sqlite3.Error:
+                pass  # 읽기 전용/잠금 상황에서는 기본값 유지
+        if common_path:
+            attach_common_with_views(conn, store_id)
+        conn._pool = self
+        conn._pool_key = key
+        conn._pool_file_id = _file_id(db_path)
+        return conn
+
+    def _is_valid(self, conn: PooledConnection, db_path: str) -> bool:
+        if time.monotonic() - conn._pool_created_at > self.max_age_seconds:
+            return False
+        if conn._pool_file_id != _file_id(db_path):
+            return False
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def release(self, conn: PooledConnection) -> None:
+        """커넥션 반환 (close() 호출 시)"""
+        if conn._pool_idle:
+            return  # 이중 close
+        if conn._pool_thread_id != threading.get_ident():
+            conn.close_physical()
+            return
+        try:
+            if conn.in_transaction:
+                conn.rollback()  # 일반 close()와 동일하게 미커밋 변경 폐기
+            conn.row_factory = sqlite3.Row
+            conn.isolation_level = ""
+        except sqlite3.Error:
+            conn.close_physical()
+            return
+
+        idle = self._idle()
+        bucket = idle.setdefault(conn._pool_key, [])
+        if len(bucket) >= self.max_idle_per_key:
+            conn.close_physical()
+            return
+        conn._pool_idle = True
+        bucket.append(conn)
+        idle.move_to_end(conn._pool_key)
+
+        # 스레드 전체 상한 초과 시 가장 오래 안 쓴 키부터 정리
+        total = sum(len(b) for b in idle.values())
+        while total > self.max_idle_per_thread and idle:
+            old_key, old_bucket = next(iter(idle.items()))
+            if old_bucket:
+                old_bucket.pop(0).close_physical()
+                total -= 1
+            if not old_bucket:
+                idle.pop(old_key, None)
+
+    def close_thread_connections(self) -> int:
+        """현재 스레드의 유휴 커넥션 전부 종료
+
+        Returns:
+            종료한 커넥션 수
+        """
+        idle = self._idle()
+        closed = 0
+        for bucket in idle.values():
+            for conn in bucket:
+                conn.close_physical()
+                closed += 1
+        idle.clear()
+        return closed
+
+    def idle_count(self) -> int:
+        """현재 스레드의 유휴 커넥션 수"""
+        return sum(len(b) for b in self._idle().values())
+
+
+_pool = ConnectionPool()
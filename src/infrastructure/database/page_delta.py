@@ -0,0 +1,361 @@
+"""
+SQLite 페이지 단위 델타 (cloud-delta-sync)
+
+클라우드 동기화에서 DB 전체 대신 바뀐 페이지만 전송하기 위한 모듈.
+
+로컬 (scripts/sync_to_cloud.py):
+    1. snapshot_db(): backup API 로 일관된 스냅샷 생성 (WAL 미반영분 포함)
+    2. build_delta(): 직전 동기화 매니페스트(페이지 해시 목록)와 비교해
+       바뀐 페이지만 담은 델타 생성 → data/sync_deltas/ 로 업로드
+원격 (웹앱 기동 시 apply_pending_deltas):
+    3. apply_delta(): 원격 DB 가 델타의 기준(base_sha256)과 같은지 확인 후
+       페이지 덮어쓰기 → 결과 SHA256 이 target_sha256 과 같을 때만 교체
+    4. 기준 불일치 등으로 적용 불가 → <db>.resync 표식 기록,
+       다음 동기화에서 로컬이 전체 업로드로 복구
+원격 웹앱도 common.db 에 쓰므로 (설정 감사 로그, 대시보드 스냅샷 등)
+로컬은 델타 업로드 전에 db_state() (웹앱 /api/sync/db-state) 로 원격 해시를
+확인하고, 직전 매니페스트와 다르면 같은 실행에서 전체 업로드한다.
+
+웹앱 워커마다 create_app() 이 apply_pending_deltas() 를 호출하므로
+델타 디렉토리의 .apply.lock 파일 잠금으로 한 번에 한 프로세스만 적용한다.
+
+델타 형식:
+    DELTA_MAGIC + 헤더 길이(4바이트 BE) + 헤더 JSON
+    + zlib(바뀐 페이지 데이터를 pages 순서대로 이어붙인 것)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import struct
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DELTA_MAGIC = b"BGFPD1"
+DELTA_SUFFIX = ".delta"
+RESYNC_SUFFIX = ".resync"
+
+# 원격 프로젝트 루트 기준 델타 업로드 디렉토리
+DELTA_DIR = "data/sync_deltas"
+
+# 델타 적용 프로세스 간 잠금 파일 (DELTA_DIR 안)
+APPLY_LOCK_NAME = ".apply.lock"
+
+PathLike = Union[str, Path]
+
+
+class PageDeltaError(Exception):
+    """델타 생성/적용 오류"""
+    pass
+
+
+def delta_key(db_relpath: str) -> str:
+    """DB 상대 경로 → 델타/표식 파일명 접두어 (data/stores/46513.db → data__stores__46513.db)"""
+    return db_relpath.strip("/").replace("/", "__")
+
+
+def snapshot_db(src: PathLike, dest: PathLike) -> None:
+    """온라인 backup API 로 일관된 스냅샷 생성 (페이지 배치는 원본과 동일)"""
+    dest = Path(dest)
+    if dest.exists():
+        dest.unlink()
+    source = sqlite3.connect(str(src))
+    target = sqlite3.connect(str(dest))
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+
+def read_page_size(path: PathLike) -> int:
+    """DB 헤더(offset 16)의 페이지 크기"""
+    with open(path, "rb") as f:
+        header = f.read(18)
+    if len(header) < 18 or not header.startswith(b"SQLite format 3\x00"):
+        raise PageDeltaError(f"SQLite DB 아님: {path}")
+    size = struct.unpack(">H", header[16:18])[0]
+    return 65536 if size == 1 else size
+
+
+def _page_digest(page: bytes) -> str:
+    return hashlib.blake2b(page, digest_size=8).hexdigest()
+
+
+def build_manifest(path: PathLike) -> Dict:
+    """DB 파일 매니페스트 (페이지 크기, 페이지별 해시, 전체 SHA256, 크기)"""
+    page_size = read_page_size(path)
+    hashes: List[str] = []
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for page in iter(lambda: f.read(page_size), b""):
+            hashes.append(_page_digest(page))
+            sha256.update(page)
+    return {
+        "page_size": page_size,
+        "size": os.path.getsize(path),
+        "sha256": sha256.hexdigest(),
+        "hashes": hashes,
+    }
+
+
+def build_delta(
+    path: PathLike, base: Dict, db_relpath: str
+) -> Tuple[Optional[bytes], Dict]:
+    """
+    매니페스트 대비 바뀐 페이지 델타 생성.
+
+    Args:
+        path: 로컬 스냅샷 경로
+        base: 직전 동기화 매니페스트 (원격 DB 상태)
+        db_relpath: 원격 프로젝트 루트 기준 DB 경로
+
+    Returns:
+        (델타 바이트 또는 None(변경 없음), 새 매니페스트)
+
+    Raises:
+        PageDeltaError: 페이지 크기 변경 (VACUUM 등) → 전체 업로드 필요
+    """
+    manifest = build_manifest(path)
+    if manifest["page_size"] != base.get("page_size"):
+        raise PageDeltaError(
+            f"페이지 크기 변경 {base.get('page_size')} → {manifest['page_size']}"
+        )
+    if manifest["sha256"] == base.get("sha256"):
+        return None, manifest
+
+    base_hashes = base.get("hashes", [])
+    page_size = manifest["page_size"]
+    changed = [
+        i for i, digest in enumerate(manifest["hashes"])
+        if i >= len(base_hashes) or base_hashes[i] != digest
+    ]
+    comp = zlib.compressobj(6)
+    body = []
+    with open(path, "rb") as f:
+        for i in changed:
+            f.seek(i * page_size)
+            body.append(comp.compress(f.read(page_size)))
+    body.append(comp.flush())
+
+    header = json.dumps({
+        "db": db_relpath,
+        "page_size": page_size,
+        "pages": changed,
+        "size": manifest["size"],
+        "base_sha256": base.get("sha256"),
+        "target_sha256": manifest["sha256"],
+    }).encode("utf-8")
+    delta = DELTA_MAGIC + struct.pack(">I", len(header)) + header + b"".join(body)
+    return delta, manifest
+
+
+def read_delta(delta: bytes) -> Tuple[Dict, bytes]:
+    """델타 → (헤더, 페이지 데이터)"""
+    if not delta.startswith(DELTA_MAGIC):
+        raise PageDeltaError("델타 형식 아님")
+    offset = len(DELTA_MAGIC)
+    (header_len,) = struct.unpack(">I", delta[offset:offset + 4])
+    offset += 4
+    try:
+        header = json.loads(delta[offset:offset + header_len].decode("utf-8"))
+        pages = zlib.decompress(delta[offset + header_len:])
+    except (ValueError, zlib.error) as e:
+        raise PageDeltaError(f"델타 손상: {e}") from e
+    expected = len(header["pages"]) * header["page_size"]
+    if len(pages) > expected or (expected and len(pages) <= expected - header["page_size"]):
+        raise PageDeltaError("델타 페이지 데이터 크기 불일치")
+    return header, pages
+
+
+def _file_sha256(path: Path) -> Optional[str]:
+    if not path.exists():
+        return None
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def checkpoint_wal(db_path: Path) -> bool:
+    """
+    WAL 내용을 DB 파일에 반영 (TRUNCATE 체크포인트).
+
+    원격 웹앱 쓰기가 WAL 에만 있으면 파일 해시에 잡히지 않고,
+    델타 적용 시 WAL 을 지우면서 유실되므로 해시 전에 반드시 호출한다.
+
+    Returns:
+        True: 미반영 WAL 없음 / False: 체크포인트 실패 (쓰기 중 등)
+    """
+    wal = db_path.with_name(db_path.name + "-wal")
+    if not db_path.exists() or not wal.exists():
+        return True
+    try:
+        conn = sqlite3.connect(str(db_path), timeout=5)
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"[PageDelta] WAL 체크포인트 실패 {db_path.name}: {e}")
+    return not wal.exists() or wal.stat().st_size == 0
+
+
+def _resolve_db(root: Path, db_rel: str) -> Path:
+    """원격 루트 기준 DB 경로 (루트 밖이면 PageDeltaError)"""
+    db_path = (root / db_rel).resolve()
+    if root not in db_path.parents:
+        raise PageDeltaError(f"허용되지 않는 경로: {db_rel}")
+    return db_path
+
+
+def db_state(root: PathLike, db_rel: str) -> Dict:
+    """
+    원격 DB 현재 상태 (로컬이 델타 업로드 전 기준 확인용).
+
+    Returns:
+        {"db", "sha256", "size"} — 파일 없거나 WAL 미반영이면 sha256 None
+
+    Raises:
+        PageDeltaError: 루트 밖 경로 / .db 아닌 파일
+    """
+    root = Path(root).resolve()
+    db_path = _resolve_db(root, db_rel)
+    if db_path.suffix != ".db":
+        raise PageDeltaError(f"DB 파일 아님: {db_rel}")
+    settled = checkpoint_wal(db_path)
+    return {
+        "db": db_rel,
+        "sha256": _file_sha256(db_path) if settled else None,
+        "size": db_path.stat().st_size if db_path.exists() else 0,
+    }
+
+
+@contextmanager
+def _apply_lock(delta_dir: Path) -> Iterator[None]:
+    """델타 적용 프로세스 간 배타 잠금 (웹앱 워커 동시 기동 대비)"""
+    with open(delta_dir / APPLY_LOCK_NAME, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def apply_delta(db_path: PathLike, delta: bytes) -> str:
+    """
+    델타를 DB 파일에 적용 (임시 사본에 쓰고 검증 후 교체).
+
+    Returns:
+        "applied" | "already" (이미 target 상태)
+
+    Raises:
+        PageDeltaError: 기준 불일치, 결과 해시 불일치, WAL 미반영
+    """
+    db_path = Path(db_path)
+    header, pages = read_delta(delta)
+    if not checkpoint_wal(db_path):
+        raise PageDeltaError(f"WAL 미반영 쓰기 남음: {db_path.name}")
+    current = _file_sha256(db_path)
+    if current == header["target_sha256"]:
+        return "already"
+    if current != header["base_sha256"]:
+        raise PageDeltaError(
+            f"기준 불일치 {db_path.name}: "
+            f"{(current or 'missing')[:12]} != {str(header['base_sha256'])[:12]}"
+        )
+
+    page_size = header["page_size"]
+    tmp = db_path.with_name(f"{db_path.name}.delta-tmp.{os.getpid()}")
+    with open(db_path, "rb") as src, open(tmp, "wb") as dst:
+        for chunk in iter(lambda: src.read(1 << 20), b""):
+            dst.write(chunk)
+    try:
+        with open(tmp, "r+b") as f:
+            for n, index in enumerate(header["pages"]):
+                f.seek(index * page_size)
+                f.write(pages[n * page_size:(n + 1) * page_size])
+            f.truncate(header["size"])
+        if _file_sha256(tmp) != header["target_sha256"]:
+            raise PageDeltaError(f"적용 결과 해시 불일치: {db_path.name}")
+        # 이전 상태의 WAL/SHM 이 남아 있으면 새 파일과 섞이므로 제거
+        for suffix in ("-wal", "-shm"):
+            side = db_path.with_name(db_path.name + suffix)
+            if side.exists():
+                side.unlink()
+        os.replace(tmp, db_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return "applied"
+
+
+def apply_pending_deltas(root: PathLike) -> Dict[str, List[str]]:
+    """
+    root/DELTA_DIR 의 델타를 순서대로 적용 (웹앱 기동 시 호출).
+
+    적용했거나 이미 반영된 델타는 삭제. 적용 불가 DB 는 남은 델타를 버리고
+    <key>.resync 표식을 남겨 로컬이 다음 동기화에서 전체 업로드하도록 한다.
+    여러 워커가 동시에 호출하면 잠금을 먼저 잡은 쪽이 적용하고,
+    나머지는 남은 델타가 없어 빈 결과를 돌려준다.
+
+    Returns:
+        {"applied": [...], "resync": [...]} — DB 상대 경로
+    """
+    root = Path(root).resolve()
+    delta_dir = root / DELTA_DIR
+    summary: Dict[str, List[str]] = {"applied": [], "resync": []}
+    if not delta_dir.is_dir():
+        return summary
+
+    with _apply_lock(delta_dir):
+        failed: set = set()
+        for delta_file in sorted(delta_dir.glob(f"*{DELTA_SUFFIX}")):
+            try:
+                delta = delta_file.read_bytes()
+                header, _ = read_delta(delta)
+                db_rel = header["db"]
+            except FileNotFoundError:
+                continue
+            except (OSError, PageDeltaError, KeyError) as e:
+                logger.warning(f"[PageDelta] 델타 해석 실패 {delta_file.name}: {e}")
+                delta_file.unlink(missing_ok=True)
+                continue
+
+            if db_rel not in failed:
+                try:
+                    status = apply_delta(_resolve_db(root, db_rel), delta)
+                    summary["applied"].append(db_rel)
+                    logger.info(f"[PageDelta] {db_rel} {status} ({delta_file.name})")
+                except (OSError, PageDeltaError) as e:
+                    logger.warning(f"[PageDelta] {db_rel} 적용 실패 → 전체 재동기화 요청: {e}")
+                    failed.add(db_rel)
+                    (delta_dir / f"{delta_key(db_rel)}{RESYNC_SUFFIX}").write_text(
+                        str(e), encoding="utf-8"
+                    )
+                    summary["resync"].append(db_rel)
+            delta_file.unlink(missing_ok=True)
+    return summary
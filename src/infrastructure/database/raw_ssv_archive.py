@@ -0,0 +1,203 @@
+"""
+RawSsvArchive -- SSV 원본 응답 압축/중복제거 보관소 (raw-ssv-archive)
+
+API 원본 응답(SSV 텍스트)을 매장 DB의 raw_ssv_blobs 테이블에 보관합니다.
+
+- 내용 해시(sha1) 기준 중복 제거: 같은 응답(판매 없는 시간대, 재수집 등)은 1건만 저장
+- blob마다 압축: zlib + SSV 공용 사전(zd1, 기본) 또는 LZMA(xz, 대용량 백필용)
+  SSV 헤더(ErrorCode/Dataset/컬럼 정의)는 응답마다 반복되므로 공용 사전으로 작은 응답도 압축됨
+- 읽기 시 지연 해제: RawSsvRef.text 최초 접근 시에만 압축 해제
+
+raw 테이블은 텍스트 대신 blob_hash 만 참조합니다 (예: raw_hourly_sales_detail).
+
+Usage:
+    blob_hash = RawSsvArchive.put(cursor, ssv_text, now)
+    ref = RawSsvArchive.get(conn, blob_hash)
+    ref.text  # 이 시점에 압축 해제
+"""
+
+import hashlib
+import lzma
+import sqlite3
+import zlib
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+RS = "\x1e"
+US = "\x1f"
+
+CODEC_ZLIB_DICT = "zd1"  # zlib + SSV_ZDICT (사전 변경 시 새 코덱 ID 부여)
+CODEC_LZMA = "xz"
+CODEC_PLAIN = "raw"
+
+RAW_SSV_BLOBS_DDL = """
+CREATE TABLE IF NOT EXISTS raw_ssv_blobs (
+    blob_hash TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    raw_size INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    created_at TEXT NOT NULL
+)
+"""
+
+_INSERT_BLOB_SQL = """
+    INSERT OR IGNORE INTO raw_ssv_blobs (blob_hash, codec, raw_size, data, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+# zlib 공용 사전: 자주 나오는 토큰일수록 뒤쪽에 배치 (zlib 권장)
+SSV_ZDICT = (
+    f"{US}MONTH_EVT:string(256){US}ORD_ITEM:string(256){US}RATE:bigdecimal(0)"
+    f"{US}G_RECT_AMT:bigdecimal(0){US}RECT_AMT:bigdecimal(0)"
+    f"{US}ORD_QTY:bigdecimal(0){US}BUY_QTY:bigdecimal(0){US}DISUSE_QTY:bigdecimal(0)"
+    f"{US}STOCK_QTY:bigdecimal(0){US}MID_CD:string(256){US}MID_NM:string(256)"
+    f"{US}ORD_UNIT_QTY:bigdecimal(0){US}EXPIRE_DAY:bigdecimal(0){US}NOW_QTY:bigdecimal(0)"
+    f"Dataset:dsItem{RS}Dataset:dsDetail{RS}Dataset:dsList{RS}"
+    f"xm_tid:string={RS}"
+    f"_RowType_{US}ITEM_CD:string(256){US}ITEM_NM:string(256){US}SALE_QTY:bigdecimal(0)"
+    f"SSV:UTF-8{RS}ErrorCode:string=0{RS}ErrorMsg:string={RS}"
+).encode("utf-8")
+
+
+def content_hash(text: str) -> str:
+    """응답 텍스트 내용 해시 (중복 제거 키)"""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def compress_ssv(text: str, codec: str = CODEC_ZLIB_DICT) -> Tuple[str, bytes]:
+    """
+    SSV 텍스트 압축
+
+    Returns:
+        (실제 사용 코덱, 압축 바이트) — 압축 이득이 없으면 CODEC_PLAIN
+    """
+    raw = text.encode("utf-8")
+    if codec == CODEC_ZLIB_DICT:
+        compressor = zlib.compressobj(level=6, zdict=SSV_ZDICT)
+        data = compressor.compress(raw) + compressor.flush()
+    elif codec == CODEC_LZMA:
+        data = lzma.compress(raw, preset=6)
+    else:
+        return CODEC_PLAIN, raw
+    if len(data) >= len(raw):
+        return CODEC_PLAIN, raw
+    return codec, data
+
+
+def decompress_ssv(codec: str, data: bytes) -> str:
+    """압축 해제 (코덱별)"""
+    if codec == CODEC_ZLIB_DICT:
+        decompressor = zlib.decompressobj(zdict=SSV_ZDICT)
+        raw = decompressor.decompress(data) + decompressor.flush()
+    elif codec == CODEC_LZMA:
+        raw = lzma.decompress(data)
+    elif codec == CODEC_PLAIN:
+        raw = data
+    else:
+        raise ValueError(f"알 수 없는 raw SSV 코덱: {codec}")
+    return bytes(raw).decode("utf-8")
+
+
+class RawSsvRef:
+    """보관된 응답 1건 (text 최초 접근 시 압축 해제)"""
+
+    __slots__ = ("blob_hash", "codec", "raw_size", "_data", "_text")
+
+    def __init__(self, blob_hash: str, codec: str, raw_size: int, data: bytes):
+        self.blob_hash = blob_hash
+        self.codec = codec
+        self.raw_size = raw_size
+        self._data = data
+        self._text: Optional[str] = None
+
+    @property
+    def stored_size(self) -> int:
+        return len(self._data)
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = decompress_ssv(self.codec, self._data)
+        return self._text
+
+    def __repr__(self) -> str:
+        return (
+            f"RawSsvRef({self.blob_hash[:10]}, {self.codec}, "
+            f"{self.raw_size}B -> {self.stored_size}B)"
+        )
+
+
+class RawSsvArchive:
+    """raw_ssv_blobs 접근 (호출자의 커서/트랜잭션 사용)"""
+
+    @staticmethod
+    def ensure_table(cursor: sqlite3.Cursor) -> None:
+        cursor.execute(RAW_SSV_BLOBS_DDL)
+
+    @staticmethod
+    def put(
+        cursor: sqlite3.Cursor,
+        text: str,
+        now: str,
+        codec: str = CODEC_ZLIB_DICT,
+    ) -> str:
+        """
+        응답 보관 (이미 있는 내용이면 압축 없이 해시만 반환)
+
+        Returns:
+            blob_hash
+        """
+        blob_hash = content_hash(text)
+        exists = cursor.execute(
+            "SELECT 1 FROM raw_ssv_blobs WHERE blob_hash = ?", (blob_hash,)
+        ).fetchone()
+        if exists is None:
+            used_codec, data = compress_ssv(text, codec)
+            cursor.execute(
+                _INSERT_BLOB_SQL,
+                (blob_hash, used_codec, len(text.encode("utf-8")), data, now),
+            )
+        return blob_hash
+
+    @staticmethod
+    def get(conn: sqlite3.Connection, blob_hash: Optional[str]) -> Optional[RawSsvRef]:
+        """blob 조회 (압축 해제는 RawSsvRef.text 접근 시)"""
+        if not blob_hash:
+            return None
+        row = conn.execute(
+            "SELECT blob_hash, codec, raw_size, data FROM raw_ssv_blobs WHERE blob_hash = ?",
+            (blob_hash,),
+        ).fetchone()
+        return RawSsvRef(*row) if row else None
+
+    @staticmethod
+    def prune(cursor: sqlite3.Cursor, referenced: Iterable[Tuple[str, str]]) -> int:
+        """
+        어느 raw 테이블도 참조하지 않는 blob 삭제
+
+        Args:
+            referenced: [(테이블명, blob_hash 컬럼명), ...]
+
+        Returns:
+            삭제된 blob 수
+        """
+        subqueries = " UNION ".join(
+            f"SELECT {column} FROM {table} WHERE {column} IS NOT NULL"
+            for table, column in referenced
+        )
+        if not subqueries:
+            return 0
+        cursor.execute(f"DELETE FROM raw_ssv_blobs WHERE blob_hash NOT IN ({subqueries})")
+        return cursor.rowcount
+
+    @staticmethod
+    def stats(conn: sqlite3.Connection) -> Dict[str, int]:
+        """보관 현황 {blobs, raw_bytes, stored_bytes}"""
+        row = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(LENGTH(data)), 0) "
+            "FROM raw_ssv_blobs"
+        ).fetchone()
+        return {"blobs": row[0], "raw_bytes": row[1], "stored_bytes": row[2]}
@@ -11,6 +11,7 @@ Usage:
 
 # --- Store-scoped repositories (매장별 DB) ---
 from .sales_repo import SalesRepository
+from .item_sales_stats_repo import ItemSalesStatsRepository
 from .order_repo import OrderRepository
 from .prediction_repo import PredictionRepository
 from .order_tracking_repo import OrderTrackingRepository
@@ -41,6 +42,7 @@ from .np_3day_tracking_repo import NewProduct3DayTrackingRepository as NP3DayTra
 
 # --- Common DB repositories (공통 DB) ---
 from .ai_summary_repo import AISummaryRepository
+from .dashboard_snapshot_repo import DashboardSnapshotRepository
 from .product_detail_repo import ProductDetailRepository
 from .external_factor_repo import ExternalFactorRepository
 from .app_settings_repo import AppSettingsRepository
@@ -55,6 +57,7 @@ from .order_analysis_repo import OrderAnalysisRepository
 __all__ = [
     # Store-scoped
     "SalesRepository",
+    "ItemSalesStatsRepository",
     "OrderRepository",
     "PredictionRepository",
     "OrderTrackingRepository",
@@ -90,6 +93,7 @@ __all__ = [
     "StoppedItemRepository",
     "DashboardUserRepository",
     "SignupRequestRepository",
+    "DashboardSnapshotRepository",
     # Analysis
     "OrderAnalysisRepository",
 ]
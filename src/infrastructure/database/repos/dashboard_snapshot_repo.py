@@ -0,0 +1,168 @@
+"""
+DashboardSnapshotRepository — 홈 대시보드 스냅샷 저장소 (dashboard-snapshot)
+
+공용 DB(common.db)의 dashboard_snapshots 테이블.
+매장/섹션별 JSON 1행 + 내용 해시(ETag). 수집/발주/폐기 잡 종료 시 갱신,
+웹 쓰기 경로(설정 저장, 스크립트 실행)에서 무효화.
+조회는 테이블 생성도 하지 않는 읽기 전용 (원격 웹앱 common.db 보호).
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from src.infrastructure.database.base_repository import BaseRepository
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DASHBOARD_SNAPSHOTS_DDL = """
+CREATE TABLE IF NOT EXISTS dashboard_snapshots (
+    store_id     TEXT NOT NULL,
+    section      TEXT NOT NULL,
+    payload      TEXT NOT NULL,
+    etag         TEXT NOT NULL,
+    generated_at TEXT NOT NULL,
+    PRIMARY KEY (store_id, section)
+)
+"""
+
+UPSERT_SNAPSHOT_SQL = """
+INSERT INTO dashboard_snapshots (store_id, section, payload, etag, generated_at)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(store_id, section) DO UPDATE SET
+    payload = excluded.payload,
+    etag = excluded.etag,
+    generated_at = excluded.generated_at
+"""
+
+
+def dump_payload(data: Any) -> str:
+    """스냅샷 JSON 직렬화 (키 정렬 → 같은 내용이면 같은 문자열)"""
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def payload_etag(payload: str) -> str:
+    """JSON 문자열의 내용 해시 (ETag 값, 따옴표 제외)"""
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:20]
+
+
+class DashboardSnapshotRepository(BaseRepository):
+    """dashboard_snapshots 테이블 CRUD (db_type="common")"""
+
+    db_type = "common"
+
+    # 테이블 보장을 마친 DB (마이그레이션 전 common.db 대비, DB당 1회)
+    _ensured_dbs: set = set()
+
+    def _conn(self):
+        conn = self._get_conn()
+        key = str(self._db_path or "common")
+        if key not in self._ensured_dbs:
+            conn.execute(DASHBOARD_SNAPSHOTS_DDL)
+            conn.commit()
+            self._ensured_dbs.add(key)
+        return conn
+
+    def save_sections(
+        self,
+        store_id: str,
+        sections: Dict[str, Any],
+        generated_at: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """섹션별 스냅샷 저장 (UPSERT)
+
+        Args:
+            store_id: 매장 코드
+            sections: {section: JSON 직렬화 가능한 데이터}
+            generated_at: 생성 시각 (기본: 현재)
+
+        Returns:
+            {section: etag}
+        """
+        generated_at = generated_at or datetime.now().isoformat(timespec="seconds")
+        rows = []
+        etags = {}
+        for section, data in sections.items():
+            payload = dump_payload(data)
+            etags[section] = payload_etag(payload)
+            rows.append((store_id, section, payload, etags[section], generated_at))
+
+        conn = self._conn()
+        try:
+            conn.executemany(UPSERT_SNAPSHOT_SQL, rows)
+            conn.commit()
+        finally:
+            conn.close()
+        return etags
+
+    def delete(self, store_id: Optional[str] = None) -> int:
+        """스냅샷 무효화 (store_id 없으면 전 매장)
+
+        Returns:
+            삭제 행 수 (테이블 없으면 0)
+        """
+        sql = "DELETE FROM dashboard_snapshots"
+        params: tuple = ()
+        if store_id:
+            sql += " WHERE store_id = ?"
+            params = (store_id,)
+        conn = self._get_conn()
+        try:
+            cursor = conn.execute(sql, params)
+            conn.commit()
+            return cursor.rowcount
+        except sqlite3.OperationalError as e:
+            if "no such table" in str(e):
+                return 0
+            raise
+        finally:
+            conn.close()
+
+    def _select(self, sql: str, params: Iterable[Any]) -> list:
+        """읽기 전용 조회 (테이블 없으면 빈 결과, DDL 실행 안 함)"""
+        conn = self._get_conn()
+        try:
+            return conn.execute(sql, list(params)).fetchall()
+        except sqlite3.OperationalError as e:
+            if "no such table" in str(e):
+                return []
+            raise
+        finally:
+            conn.close()
+
+    def get(self, store_id: str, section: str) -> Optional[Dict[str, str]]:
+        """스냅샷 1건 (payload 는 JSON 문자열 그대로)"""
+        rows = self._select(
+            "SELECT payload, etag, generated_at FROM dashboard_snapshots "
+            "WHERE store_id = ? AND section = ?",
+            (store_id, section),
+        )
+        row = rows[0] if rows else None
+        if not row:
+            return None
+        return {"payload": row[0], "etag": row[1], "generated_at": row[2]}
+
+    def get_for_stores(
+        self, section: str, store_ids: Iterable[str]
+    ) -> Dict[str, Dict[str, str]]:
+        """여러 매장의 같은 섹션 스냅샷 (1회 조회)
+
+        Returns:
+            {store_id: {"payload", "etag", "generated_at"}}
+        """
+        store_ids = list(store_ids)
+        if not store_ids:
+            return {}
+        placeholders = ",".join("?" * len(store_ids))
+        rows = self._select(
+            f"SELECT store_id, payload, etag, generated_at FROM dashboard_snapshots "
+            f"WHERE section = ? AND store_id IN ({placeholders})",
+            [section] + store_ids,
+        )
+        return {
+            r[0]: {"payload": r[1], "etag": r[2], "generated_at": r[3]}
+            for r in rows
+        }
@@ -5,7 +5,7 @@ STMB010 팝업의 `/stmb010/selPrdT3` API에서 수집한
 시간대별 + 품목별 매출 상세 데이터를 관리합니다.
 
 구조:
-- raw_hourly_sales_detail: API 응답 원본 보존
+- raw_hourly_sales_detail: API 응답 원본 참조 (blob_hash → raw_ssv_blobs, 압축/중복제거)
 - hourly_sales_detail: 가공 후 분석용 테이블
 
 용도:
@@ -15,9 +15,16 @@ STMB010 팝업의 `/stmb010/selPrdT3` API에서 수집한
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from src.infrastructure.database.base_repository import BaseRepository
+from src.infrastructure.database.raw_ssv_archive import (
+    CODEC_PLAIN,
+    CODEC_ZLIB_DICT,
+    RAW_SSV_BLOBS_DDL,
+    RawSsvArchive,
+    RawSsvRef,
+)
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -36,6 +43,7 @@ class HourlySalesDetailRepository(BaseRepository):
         ssv_response TEXT,
         item_count INTEGER DEFAULT 0,
         collected_at TEXT NOT NULL,
+        blob_hash TEXT,
         UNIQUE(sales_date, hour)
     );
 
@@ -65,8 +73,17 @@ class HourlySalesDetailRepository(BaseRepository):
         ON raw_hourly_sales_detail(sales_date);
     """
 
-    def ensure_table(self) -> None:
-        """테이블이 없으면 생성"""
+    # DDL 실행 완료된 DB (프로세스 단위 캐시, 매 save/get마다 DDL 반복 방지)
+    _ensured_dbs: Set[str] = set()
+
+    def _db_key(self) -> str:
+        return str(self._db_path) if self._db_path else f"store:{self.store_id}"
+
+    def ensure_table(self, force: bool = False) -> None:
+        """테이블이 없으면 생성 (DB별 1회)"""
+        key = self._db_key()
+        if not force and key in self._ensured_dbs:
+            return
         conn = self._get_conn()
         try:
             cursor = conn.cursor()
@@ -74,22 +91,34 @@ class HourlySalesDetailRepository(BaseRepository):
                 stmt = stmt.strip()
                 if stmt:
                     cursor.execute(stmt)
+            cursor.execute(RAW_SSV_BLOBS_DDL)
+            # 기존 DB: blob_hash 컬럼 추가 (raw-ssv-archive)
+            columns = {r[1] for r in cursor.execute(
+                "PRAGMA table_info(raw_hourly_sales_detail)"
+            ).fetchall()}
+            if "blob_hash" not in columns:
+                cursor.execute(
+                    "ALTER TABLE raw_hourly_sales_detail ADD COLUMN blob_hash TEXT"
+                )
             conn.commit()
         finally:
             conn.close()
+        self._ensured_dbs.add(key)
 
     def save_raw(self, sales_date: str, hour: int, ssv_response: str,
-                 item_count: int) -> None:
-        """API 원본 응답 저장 (UPSERT)"""
+                 item_count: int, codec: str = CODEC_ZLIB_DICT) -> None:
+        """API 원본 응답 저장 (UPSERT, 압축/중복제거 보관소에 저장 후 해시 참조)"""
         self.ensure_table()
         conn = self._get_conn()
         now = self._now()
         try:
-            conn.execute("""
+            cursor = conn.cursor()
+            blob_hash = RawSsvArchive.put(cursor, ssv_response or "", now, codec)
+            cursor.execute("""
                 INSERT OR REPLACE INTO raw_hourly_sales_detail
-                (sales_date, hour, ssv_response, item_count, collected_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (sales_date, hour, ssv_response, item_count, now))
+                (sales_date, hour, ssv_response, item_count, collected_at, blob_hash)
+                VALUES (?, ?, NULL, ?, ?, ?)
+            """, (sales_date, hour, item_count, now, blob_hash))
             conn.commit()
         except Exception as e:
             logger.error(f"[HSD] raw 저장 실패 {sales_date} H{hour:02d}: {e}")
@@ -97,6 +126,69 @@ class HourlySalesDetailRepository(BaseRepository):
         finally:
             conn.close()
 
+    def get_raw(self, sales_date: str, hour: int) -> Optional[str]:
+        """API 원본 응답 조회 (없으면 None)"""
+        ref = self.get_raw_ref(sales_date, hour)
+        return ref.text if ref is not None else None
+
+    def get_raw_ref(self, sales_date: str, hour: int) -> Optional[RawSsvRef]:
+        """API 원본 응답 참조 (압축 해제는 .text 접근 시)"""
+        self.ensure_table()
+        conn = self._get_conn()
+        try:
+            row = conn.execute("""
+                SELECT blob_hash, ssv_response FROM raw_hourly_sales_detail
+                WHERE sales_date = ? AND hour = ?
+            """, (sales_date, hour)).fetchone()
+            if row is None:
+                return None
+            blob_hash, legacy_text = row
+            if blob_hash:
+                return RawSsvArchive.get(conn, blob_hash)
+            if legacy_text is None:
+                return None
+            # 보관소 도입 전 행: 평문 그대로
+            data = legacy_text.encode("utf-8")
+            return RawSsvRef("", CODEC_PLAIN, len(data), data)
+        finally:
+            conn.close()
+
+    def compact_raw(self, codec: str = CODEC_ZLIB_DICT) -> Dict[str, int]:
+        """
+        보관소 도입 전 평문 행(ssv_response)을 보관소로 이전 + 미참조 blob 정리
+
+        Returns:
+            {'migrated': 이전 행 수, 'pruned': 삭제 blob 수, 'blobs': ..., 'raw_bytes': ..., 'stored_bytes': ...}
+        """
+        self.ensure_table()
+        conn = self._get_conn()
+        now = self._now()
+        try:
+            cursor = conn.cursor()
+            rows = cursor.execute("""
+                SELECT id, ssv_response FROM raw_hourly_sales_detail
+                WHERE blob_hash IS NULL AND ssv_response IS NOT NULL
+            """).fetchall()
+            updates = [
+                (RawSsvArchive.put(cursor, text, now, codec), row_id)
+                for row_id, text in rows
+            ]
+            cursor.executemany("""
+                UPDATE raw_hourly_sales_detail
+                SET blob_hash = ?, ssv_response = NULL
+                WHERE id = ?
+            """, updates)
+            pruned = RawSsvArchive.prune(
+                cursor, [("raw_hourly_sales_detail", "blob_hash")]
+            )
+            conn.commit()
+            result = {"migrated": len(updates), "pruned": pruned}
+            result.update(RawSsvArchive.stats(conn))
+        finally:
+            conn.close()
+        logger.info(f"[HSD] raw 보관소 정리: {result}")
+        return result
+
     def save_detail(self, sales_date: str, hour: int,
                     items: List[Dict]) -> int:
         """가공된 품목별 상세 저장 (UPSERT)
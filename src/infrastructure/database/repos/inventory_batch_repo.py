@@ -19,6 +19,71 @@ from src.settings.constants import (
 
 logger = get_logger(__name__)
 
+# IN (...) 절 파라미터 청크 (SQLite 변수 상한 대응)
+_IN_CHUNK = 500
+
+_UPDATE_BATCH_REMAINING_SQL = """
+    UPDATE inventory_batches
+    SET remaining_qty = ?, status = ?, updated_at = ?
+    WHERE id = ?
+"""
+
+
+def _plan_fifo_consumption(
+    rows: List[tuple], to_consume: Dict[Any, int]
+) -> Dict[str, Any]:
+    """FIFO 차감 계획 (batch-fifo-engine, DB 접근 없음)
+
+    rows는 키(상품) 단위로 연속되고 키 안에서는 FIFO 순서로 정렬된
+    (batch_id, key, remaining_qty) 목록. 키별 누적합으로 한 번에 계산한다:
+        deduct_i = clamp(to_consume - 누적잔량_(i-1), 0, remaining_i)
+
+    Args:
+        rows: [(batch_id, key, remaining_qty), ...]
+        to_consume: {key: 차감할 수량}
+
+    Returns:
+        {
+            "updates": [(batch_id, new_remaining), ...]  차감 발생 배치만,
+            "consumed_qty": {key: 실제 차감 수량},
+            "consumed_batches": 전량 소진된 배치 수,
+            "totals_after": {key: 차감 후 잔량 합계} (전체 키),
+        }
+    """
+    updates: List[tuple] = []
+    consumed_qty: Dict[Any, int] = {}
+    totals_after: Dict[Any, int] = {}
+    consumed_batches = 0
+
+    current_key = object()
+    target = 0
+    cumulative = 0
+    for batch_id, key, remaining in rows:
+        remaining = int(remaining or 0)
+        if key != current_key:
+            current_key = key
+            target = int(to_consume.get(key, 0) or 0)
+            cumulative = 0
+            totals_after.setdefault(key, 0)
+
+        deduct = min(remaining, target - cumulative) if target > cumulative else 0
+        cumulative += remaining
+        new_remaining = remaining - deduct
+        totals_after[key] += new_remaining
+
+        if deduct > 0:
+            updates.append((batch_id, new_remaining))
+            consumed_qty[key] = consumed_qty.get(key, 0) + deduct
+            if new_remaining == 0:
+                consumed_batches += 1
+
+    return {
+        "updates": updates,
+        "consumed_qty": consumed_qty,
+        "consumed_batches": consumed_batches,
+        "totals_after": totals_after,
+    }
+
 
 class InventoryBatchRepository(BaseRepository):
     """재고 배치 추적 저장소 (FIFO 폐기 관리)
@@ -216,45 +281,152 @@ class InventoryBatchRepository(BaseRepository):
         Returns:
             실제 차감된 수량
         """
-        now = self._now()
-        remaining_to_consume = qty
         sf, sp = self._store_filter(None, store_id)
 
         # 오래된 배치부터 차감 (FIFO)
         cursor.execute(
             f"""
-            SELECT id, remaining_qty
+            SELECT id, item_cd, remaining_qty
             FROM inventory_batches
             WHERE item_cd = ? AND status = ? AND remaining_qty > 0 {sf}
             ORDER BY receiving_date ASC, id ASC
             """,
             (item_cd, BATCH_STATUS_ACTIVE) + sp
         )
+        plan = _plan_fifo_consumption(
+            [tuple(r) for r in cursor.fetchall()], {item_cd: qty}
+        )
+        self._write_fifo_updates(cursor, plan["updates"], self._now())
+        return plan["consumed_qty"].get(item_cd, 0)
 
-        for row in cursor.fetchall():
-            if remaining_to_consume <= 0:
-                break
+    def _load_active_batches(
+        self,
+        cursor: sqlite3.Cursor,
+        store_id: str,
+        item_cds: Optional[List[str]] = None,
+        near_expiry_last: bool = False,
+    ) -> List[tuple]:
+        """매장의 active 배치를 (item_cd, FIFO 순서)로 일괄 로드 (batch-fifo-engine)
 
-            batch_id = row['id']
-            batch_remaining = row['remaining_qty']
-            deduct = min(batch_remaining, remaining_to_consume)
-            new_remaining = batch_remaining - deduct
+        Args:
+            store_id: 매장 코드
+            item_cds: 대상 상품 (None이면 매장 전체)
+            near_expiry_last: True면 만료 1일 미만 배치를 상품 내 후순위로 정렬
 
-            # 전량 소진 시 상태 변경
-            new_status = BATCH_STATUS_CONSUMED if new_remaining == 0 else BATCH_STATUS_ACTIVE
+        Returns:
+            [(batch_id, item_cd, remaining_qty), ...] — _plan_fifo_consumption 입력 형식
+        """
+        order = "item_cd ASC, "
+        if near_expiry_last:
+            order += (
+                "CASE WHEN expiry_date IS NOT NULL "
+                "AND julianday(expiry_date) - julianday('now') < 1.0 "
+                "THEN 1 ELSE 0 END, "
+            )
+        order += "receiving_date ASC, id ASC"
+        base_sql = (
+            "SELECT id, item_cd, remaining_qty FROM inventory_batches "
+            "WHERE store_id = ? AND status = ? AND remaining_qty > 0"
+        )
 
+        if item_cds is None:
             cursor.execute(
-                """
-                UPDATE inventory_batches
-                SET remaining_qty = ?, status = ?, updated_at = ?
-                WHERE id = ?
+                f"{base_sql} ORDER BY {order}", (store_id, BATCH_STATUS_ACTIVE)
+            )
+            return [tuple(r) for r in cursor.fetchall()]
+
+        rows: List[tuple] = []
+        codes = sorted(set(item_cds))
+        for i in range(0, len(codes), _IN_CHUNK):
+            chunk = codes[i:i + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"{base_sql} AND item_cd IN ({placeholders}) ORDER BY {order}",
+                (store_id, BATCH_STATUS_ACTIVE, *chunk),
+            )
+            rows.extend(tuple(r) for r in cursor.fetchall())
+        return rows
+
+    def _write_fifo_updates(
+        self, cursor: sqlite3.Cursor, updates: List[tuple], now: str
+    ) -> None:
+        """FIFO 차감 결과 일괄 반영 (remaining=0 → consumed)"""
+        if not updates:
+            return
+        cursor.executemany(
+            _UPDATE_BATCH_REMAINING_SQL,
+            [
+                (new_remaining,
+                 BATCH_STATUS_CONSUMED if new_remaining == 0 else BATCH_STATUS_ACTIVE,
+                 now, batch_id)
+                for batch_id, new_remaining in updates
+            ],
+        )
+
+    def _latest_stock_map(
+        self, cursor: sqlite3.Cursor, store_id: str, item_cds: List[str]
+    ) -> Dict[str, int]:
+        """상품별 daily_sales 최신 stock_qty 일괄 조회"""
+        stock_map: Dict[str, int] = {}
+        codes = sorted(set(item_cds))
+        for i in range(0, len(codes), _IN_CHUNK):
+            chunk = codes[i:i + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"""
+                SELECT ds.item_cd, ds.stock_qty
+                FROM daily_sales ds
+                INNER JOIN (
+                    SELECT item_cd, MAX(sales_date) as max_date
+                    FROM daily_sales
+                    WHERE store_id = ? AND item_cd IN ({placeholders})
+                    GROUP BY item_cd
+                ) latest
+                  ON ds.item_cd = latest.item_cd
+                 AND ds.sales_date = latest.max_date
+                WHERE ds.store_id = ?
                 """,
-                (new_remaining, new_status, now, batch_id)
+                (store_id, *chunk, store_id),
             )
+            for row in cursor.fetchall():
+                stock_map[row[0]] = int(row[1] or 0)
+        return stock_map
+
+    def consume_fifo_bulk(
+        self, to_consume: Dict[str, int], store_id: Optional[str] = None
+    ) -> Dict[str, int]:
+        """여러 상품 FIFO 일괄 차감 (batch-fifo-engine)
+
+        active 배치를 1회 로드 → 누적합으로 차감 계획 → executemany 1회로 반영.
 
-            remaining_to_consume -= deduct
+        Args:
+            to_consume: {item_cd: 차감할 수량}
+            store_id: 매장 코드 (None이면 self.store_id)
 
-        return qty - remaining_to_consume
+        Returns:
+            {"items": 차감 상품수, "consumed_qty": 총 차감 수량,
+             "updated": 갱신 배치수, "consumed": 전량 소진 배치수}
+        """
+        store_id = store_id or self.store_id
+        targets = {k: v for k, v in to_consume.items() if v and v > 0}
+        if not targets:
+            return {"items": 0, "consumed_qty": 0, "updated": 0, "consumed": 0}
+
+        conn = self._get_conn()
+        try:
+            cursor = conn.cursor()
+            rows = self._load_active_batches(cursor, store_id, list(targets))
+            plan = _plan_fifo_consumption(rows, targets)
+            self._write_fifo_updates(cursor, plan["updates"], self._now())
+            conn.commit()
+            return {
+                "items": len(plan["consumed_qty"]),
+                "consumed_qty": sum(plan["consumed_qty"].values()),
+                "updated": len(plan["updates"]),
+                "consumed": plan["consumed_batches"],
+            }
+        finally:
+            conn.close()
 
     def check_and_expire_batches(self, target_date: Optional[str] = None, store_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """만료된 배치 상태 업데이트 + realtime_inventory 재고 차감
@@ -325,15 +497,23 @@ class InventoryBatchRepository(BaseRepository):
 
                 # expired 배치: status=expired (remaining_qty > 0 = 실제 폐기량)
                 if actual_expired:
-                    for b in actual_expired:
-                        cursor.execute(
-                            """
-                            UPDATE inventory_batches
-                            SET status = ?, remaining_qty = ?, updated_at = ?
-                            WHERE id = ?
-                            """,
+                    cursor.executemany(
+                        """
+                        UPDATE inventory_batches
+                        SET status = ?, remaining_qty = ?, updated_at = ?
+                        WHERE id = ?
+                        """,
+                        [
                             (BATCH_STATUS_EXPIRED, b['remaining_qty'], now, b['id'])
-                        )
+                            for b in actual_expired
+                        ],
+                    )
+
+                # 호출측 집계용 최종 상태 표시 (consumed / expired)
+                for b in consumed_batches:
+                    b['status'] = BATCH_STATUS_CONSUMED
+                for b in actual_expired:
+                    b['status'] = BATCH_STATUS_EXPIRED
 
                 # 상품별 만료 수량 합산 → realtime_inventory.stock_qty 차감
                 # (consumed 배치는 이미 판매된 것이므로 RI 차감 불필요, expired만 차감)
@@ -342,21 +522,22 @@ class InventoryBatchRepository(BaseRepository):
                     key = (b.get('store_id', ''), b['item_cd'])
                     expired_by_item[key] = expired_by_item.get(key, 0) + b['remaining_qty']
 
-                for (batch_store_id, item_cd), expired_qty in expired_by_item.items():
-                    cursor.execute(
+                if expired_by_item:
+                    cursor.executemany(
                         """
                         UPDATE realtime_inventory
                         SET stock_qty = MAX(0, stock_qty - ?),
                             queried_at = ?
                         WHERE store_id = ? AND item_cd = ?
                         """,
-                        (expired_qty, now, batch_store_id, item_cd)
+                        [
+                            (expired_qty, now, batch_store_id, item_cd)
+                            for (batch_store_id, item_cd), expired_qty in expired_by_item.items()
+                        ],
+                    )
+                    logger.debug(
+                        f"realtime_inventory 재고 차감: {len(expired_by_item)}개 상품 (만료)"
                     )
-                    if cursor.rowcount > 0:
-                        logger.debug(
-                            f"realtime_inventory 재고 차감: {item_cd} "
-                            f"-{expired_qty}개 (만료, store={batch_store_id})"
-                        )
 
                 conn.commit()
 
@@ -386,91 +567,51 @@ class InventoryBatchRepository(BaseRepository):
         2. daily_sales 최신 stock_qty 조회
         3. batch_total > stock_qty → 초과분을 FIFO 차감 (oldest first = 만료 배치 우선)
         4. expiring_batches dict를 in-place 수정 (remaining_qty 갱신)
+
+        매장별로 active 배치/최신 재고를 한 번에 로드하고 _plan_fifo_consumption으로
+        계산한 뒤, 비만료 배치 갱신은 executemany 1회로 반영한다 (batch-fifo-engine).
         """
-        # 만료 대상 상품별 그룹화
-        items_by_store = {}  # {(store_id, item_cd): [batch_dicts]}
+        # 만료 대상 매장별 상품 그룹화
+        items_by_store: Dict[str, set] = {}
+        expiring_id_map = {}
         for b in expiring_batches:
-            key = (b.get('store_id', ''), b['item_cd'])
-            items_by_store.setdefault(key, []).append(b)
-
-        for (batch_store_id, item_cd), batches in items_by_store.items():
-            # 해당 상품의 전체 active 배치 합계 (만료 대상 포함)
-            cursor.execute(
-                """
-                SELECT COALESCE(SUM(remaining_qty), 0)
-                FROM inventory_batches
-                WHERE item_cd = ? AND store_id = ? AND status = ?
-                  AND remaining_qty > 0
-                """,
-                (item_cd, batch_store_id, BATCH_STATUS_ACTIVE),
-            )
-            batch_total = int(cursor.fetchone()[0] or 0)
-
-            # daily_sales 최신 stock_qty
-            cursor.execute(
-                """
-                SELECT ds.stock_qty
-                FROM daily_sales ds
-                INNER JOIN (
-                    SELECT MAX(sales_date) as max_date
-                    FROM daily_sales
-                    WHERE store_id = ? AND item_cd = ?
-                ) latest ON ds.sales_date = latest.max_date
-                WHERE ds.store_id = ? AND ds.item_cd = ?
-                """,
-                (batch_store_id, item_cd, batch_store_id, item_cd),
-            )
-            row = cursor.fetchone()
-            stock_qty = int(row[0] or 0) if row else 0
-
-            if batch_total <= stock_qty:
-                continue  # 배치 합계 <= 재고 → 소비 차감 불필요
-
-            # 초과분 = 소비된 수량 → FIFO 차감 (oldest first)
-            to_consume = batch_total - stock_qty
-
-            # 해당 상품의 전체 active 배치를 oldest-first로 조회
-            cursor.execute(
-                """
-                SELECT id, remaining_qty
-                FROM inventory_batches
-                WHERE item_cd = ? AND store_id = ? AND status = ?
-                  AND remaining_qty > 0
-                ORDER BY receiving_date ASC, id ASC
-                """,
-                (item_cd, batch_store_id, BATCH_STATUS_ACTIVE),
-            )
-            all_active = [dict(r) for r in cursor.fetchall()]
-
-            # 만료 배치 id → dict 매핑 (in-place 수정용)
-            expiring_id_map = {b['id']: b for b in batches}
-
-            remain = to_consume
-            for ab in all_active:
-                if remain <= 0:
-                    break
-                b_remaining = int(ab['remaining_qty'] or 0)
-                deduct = min(b_remaining, remain)
-                new_remaining = b_remaining - deduct
-                remain -= deduct
-
-                # 만료 대상 배치면 in-place 수정
-                if ab['id'] in expiring_id_map:
-                    expiring_id_map[ab['id']]['remaining_qty'] = new_remaining
+            batch_store_id = b.get('store_id', '')
+            expiring_id_map[b['id']] = b
+            if not batch_store_id:
+                continue  # store_id 없는 배치는 매칭 대상 아님 (기존 동작 유지)
+            items_by_store.setdefault(batch_store_id, set()).add(b['item_cd'])
+
+        non_expiring_updates: List[tuple] = []
+        for batch_store_id, item_cds in items_by_store.items():
+            rows = self._load_active_batches(cursor, batch_store_id, list(item_cds))
+            if not rows:
+                continue
+
+            batch_totals: Dict[str, int] = {}
+            for _, item_cd, remaining in rows:
+                batch_totals[item_cd] = batch_totals.get(item_cd, 0) + int(remaining or 0)
+
+            stock_map = self._latest_stock_map(cursor, batch_store_id, list(batch_totals))
+
+            # 초과분 = 소비된 수량 (배치 합계 <= 재고면 차감 불필요)
+            to_consume = {
+                item_cd: total - stock_map.get(item_cd, 0)
+                for item_cd, total in batch_totals.items()
+                if total > stock_map.get(item_cd, 0)
+            }
+            if not to_consume:
+                continue
+
+            plan = _plan_fifo_consumption(rows, to_consume)
+            for batch_id, new_remaining in plan["updates"]:
+                if batch_id in expiring_id_map:
+                    # 만료 대상 배치면 in-place 수정 (상태는 호출측에서 확정)
+                    expiring_id_map[batch_id]['remaining_qty'] = new_remaining
                 else:
                     # 비만료 active 배치도 DB 업데이트 (FIFO 정합성)
-                    new_status = (
-                        BATCH_STATUS_CONSUMED if new_remaining == 0
-                        else BATCH_STATUS_ACTIVE
-                    )
-                    cursor.execute(
-                        """
-                        UPDATE inventory_batches
-                        SET remaining_qty = ?, status = ?, updated_at = ?
-                        WHERE id = ?
-                        """,
-                        (new_remaining, new_status, now, ab['id']),
-                    )
+                    non_expiring_updates.append((batch_id, new_remaining))
+
+        self._write_fifo_updates(cursor, non_expiring_updates, now)
 
     def fix_expired_batch_remaining_qty(self, store_id: str, days: int = 28) -> Dict[str, Any]:
         """기존 expired 배치의 remaining_qty를 소비량 기준으로 보정 (일회성 데이터 수정)
@@ -1057,50 +1198,19 @@ class InventoryBatchRepository(BaseRepository):
             cursor = conn.cursor()
             now = self._now()
 
-            # 1) 상품별 active 배치 합계 조회
-            cursor.execute(
-                """
-                SELECT item_cd, SUM(remaining_qty) as batch_total
-                FROM inventory_batches
-                WHERE store_id = ? AND status = ? AND remaining_qty > 0
-                GROUP BY item_cd
-                """,
-                (store_id, BATCH_STATUS_ACTIVE),
-            )
-            batch_totals = {
-                row["item_cd"]: int(row["batch_total"] or 0)
-                for row in cursor.fetchall()
-            }
+            # 1) 매장 active 배치 일괄 로드 (상품별 FIFO 순서, 만료 임박 후순위)
+            rows = self._load_active_batches(cursor, store_id, near_expiry_last=True)
+            batch_totals: Dict[str, int] = {}
+            for _, item_cd, remaining in rows:
+                batch_totals[item_cd] = batch_totals.get(item_cd, 0) + int(remaining or 0)
 
             if not batch_totals:
                 return {"checked": 0, "adjusted": 0, "consumed": 0}
 
             # 2) 해당 상품들의 최신 stock_qty 조회 (daily_sales 기준)
-            placeholders = ",".join("?" * len(batch_totals))
-            cursor.execute(
-                f"""
-                SELECT ds.item_cd, ds.stock_qty
-                FROM daily_sales ds
-                INNER JOIN (
-                    SELECT item_cd, MAX(sales_date) as max_date
-                    FROM daily_sales
-                    WHERE store_id = ? AND item_cd IN ({placeholders})
-                    GROUP BY item_cd
-                ) latest
-                  ON ds.item_cd = latest.item_cd
-                 AND ds.sales_date = latest.max_date
-                WHERE ds.store_id = ?
-                """,
-                (store_id, *batch_totals.keys(), store_id),
-            )
-            stock_map = {
-                row["item_cd"]: int(row["stock_qty"] or 0)
-                for row in cursor.fetchall()
-            }
+            stock_map = self._latest_stock_map(cursor, store_id, list(batch_totals))
 
             checked = len(batch_totals)
-            adjusted = 0
-            consumed_count = 0
             protected_skipped = 0  # batch-sync-zero-sales-guard
 
             # 3) 상품별 FIFO 보정 (batch-sale-time-consume: 보정 전용)
@@ -1108,61 +1218,18 @@ class InventoryBatchRepository(BaseRepository):
             # 허용 오차 TOLERANCE 이내면 스킵하여 과잉/과소 차감 방지.
             BATCH_SYNC_TOLERANCE = 2
 
+            # batch_total > stock_qty -> 초과분 FIFO 차감 (정합/허용 오차 이내는 제외)
+            to_consume = {}
             for item_cd, batch_total in batch_totals.items():
-                stock_qty = stock_map.get(item_cd, 0)
-
-                if batch_total <= stock_qty:
-                    continue  # 정합 -- 보정 불필요
-
-                # batch_total > stock_qty -> 초과분 FIFO 차감
-                to_consume = batch_total - stock_qty
-
-                # 허용 오차 이내면 스킵 (FR-01.5가 주도 차감하므로 작은 오차 허용)
-                if to_consume <= BATCH_SYNC_TOLERANCE:
-                    continue
-                    to_consume = normal_qty
-
-                adjusted += 1
+                excess = batch_total - stock_map.get(item_cd, 0)
+                if excess > BATCH_SYNC_TOLERANCE:
+                    to_consume[item_cd] = excess
+            adjusted = len(to_consume)
 
-                # 만료 임박 배치가 마지막에 차감되도록 정렬 (FIFO 우선, 임박 후순위)
-                cursor.execute(
-                    """
-                    SELECT id, remaining_qty
-                    FROM inventory_batches
-                    WHERE item_cd = ? AND store_id = ? AND status = ?
-                      AND remaining_qty > 0
-                    ORDER BY
-                        CASE WHEN expiry_date IS NOT NULL
-                             AND julianday(expiry_date) - julianday('now') < 1.0
-                             THEN 1 ELSE 0 END,
-                        receiving_date ASC, id ASC
-                    """,
-                    (item_cd, store_id, BATCH_STATUS_ACTIVE),
-                )
-                remain = to_consume
-                for batch_row in cursor.fetchall():
-                    if remain <= 0:
-                        break
-                    b_id = batch_row["id"]
-                    b_remaining = int(batch_row["remaining_qty"] or 0)
-                    deduct = min(b_remaining, remain)
-                    new_remaining = b_remaining - deduct
-                    new_status = (
-                        BATCH_STATUS_CONSUMED
-                        if new_remaining == 0
-                        else BATCH_STATUS_ACTIVE
-                    )
-                    cursor.execute(
-                        """
-                        UPDATE inventory_batches
-                        SET remaining_qty = ?, status = ?, updated_at = ?
-                        WHERE id = ?
-                        """,
-                        (new_remaining, new_status, now, b_id),
-                    )
-                    remain -= deduct
-                    if new_status == BATCH_STATUS_CONSUMED:
-                        consumed_count += 1
+            # 전 상품 차감 계획을 누적합 1회로 계산 → executemany 1회 반영 (batch-fifo-engine)
+            plan = _plan_fifo_consumption(rows, to_consume)
+            self._write_fifo_updates(cursor, plan["updates"], now)
+            consumed_count = plan["consumed_batches"]
 
             conn.commit()
 
@@ -1177,19 +1244,11 @@ class InventoryBatchRepository(BaseRepository):
             # 4) 푸드 유령재고 정리: active 배치 없는데 RI > 0인 푸드 상품 → stock_qty = 0
             # [원본 보존] 기존에는 active 배치 없는 상품을 의도적으로 skip했음 (비푸드 보호)
             # 푸드 카테고리(001~005, 012)만 정리, 비푸드는 기존대로 건드리지 않음
-            # FIFO 보정 후 batch_totals 재계산 (보정 중 consumed된 배치 반영)
-            cursor.execute(
-                """
-                SELECT item_cd, SUM(remaining_qty) as batch_total
-                FROM inventory_batches
-                WHERE store_id = ? AND status = ? AND remaining_qty > 0
-                GROUP BY item_cd
-                """,
-                (store_id, BATCH_STATUS_ACTIVE),
-            )
+            # FIFO 보정 후 잔량 합계 (보정 중 consumed된 배치 반영, 재조회 없이 계획에서 산출)
             batch_totals_after = {
-                row["item_cd"]: int(row["batch_total"] or 0)
-                for row in cursor.fetchall()
+                item_cd: total
+                for item_cd, total in plan["totals_after"].items()
+                if total > 0
             }
             ghost_cleared = self._clear_ghost_stock(
                 cursor, store_id, batch_totals_after, now
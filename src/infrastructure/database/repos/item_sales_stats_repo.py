@@ -0,0 +1,376 @@
+"""
+ItemSalesStatsRepository -- 상품별 판매 집계 테이블 (item-sales-stats)
+
+daily_sales를 매번 30~90일 범위 스캔해 다시 계산하던 통계
+(N일 판매합/기록일/판매일/품절일, 마지막 판매일, 데이터 기간)를
+item_sales_stats 1행으로 유지합니다.
+
+- SalesRepository.save_daily_sales 가 저장한 하루치를 같은 트랜잭션에서 증분 반영
+- 마지막 기록일(last_date) 기준 최근 RING_DAYS일을 링 버퍼 컬럼 2개로 보관
+  (sale_ring: 판매량, stock_ring: 재고 상태 코드) → 임의 N일(≤90) 윈도우를 1행에서 계산
+- 증분으로 정확히 갱신할 수 없는 경우(집계행 없음, 마지막 판매일 취소)는 해당 상품만 재계산
+- rebuild()/verify(): 전체 재구축 및 daily_sales 대비 검증 (scripts/item_sales_stats.py)
+
+윈도우 의미는 기존 쿼리의 `sales_date >= date(기준일, '-N days')`와 동일합니다
+(상한 없음, 기준일 포함 N+1개 달력일).
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.infrastructure.database.base_repository import BaseRepository
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+RING_DAYS = 91  # 최근 90일 + 기준일
+
+# stock_ring 일자별 재고 상태 코드
+NO_RECORD = '-'
+STOCKOUT = '0'      # stock_qty = 0
+IN_STOCK = '+'      # stock_qty > 0
+UNKNOWN = '?'       # stock_qty NULL/음수
+
+_CHUNK = 500
+
+_SELECT_STATS_SQL = """
+    SELECT item_cd, first_date, last_date, last_sale_date, record_days,
+           sale_ring, stock_ring
+    FROM item_sales_stats
+    WHERE store_id = ? AND item_cd IN ({placeholders})
+"""
+
+_UPSERT_STATS_SQL = """
+    INSERT INTO item_sales_stats
+    (store_id, item_cd, first_date, last_date, last_sale_date, record_days,
+     sale_ring, stock_ring, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(store_id, item_cd) DO UPDATE SET
+        first_date = excluded.first_date,
+        last_date = excluded.last_date,
+        last_sale_date = excluded.last_sale_date,
+        record_days = excluded.record_days,
+        sale_ring = excluded.sale_ring,
+        stock_ring = excluded.stock_ring,
+        updated_at = excluded.updated_at
+"""
+
+# 재구축: 상품별 스칼라 집계 + 마지막 기록일 기준 링 범위 행
+_BUILD_SCALAR_SQL = """
+    SELECT item_cd, MIN(sales_date), MAX(sales_date),
+           MAX(CASE WHEN sale_qty > 0 THEN sales_date END), COUNT(*)
+    FROM daily_sales
+    WHERE store_id = ? {item_filter}
+    GROUP BY item_cd
+"""
+
+_BUILD_RING_SQL = """
+    SELECT ds.item_cd, ds.sales_date, ds.sale_qty, ds.stock_qty
+    FROM daily_sales ds
+    JOIN (
+        SELECT item_cd, MAX(sales_date) AS last_date
+        FROM daily_sales
+        WHERE store_id = ? {item_filter}
+        GROUP BY item_cd
+    ) m ON m.item_cd = ds.item_cd
+    WHERE ds.store_id = ?
+    AND ds.sales_date >= date(m.last_date, '-{back} days')
+"""
+
+
+class SalesWindow(NamedTuple):
+    """N일 윈도우 집계 (기존 CASE WHEN 집계 컬럼과 1:1)"""
+    record_days: int          # COUNT(*)
+    sale_qty: int             # SUM(sale_qty)
+    sell_days: int            # sale_qty > 0
+    stockout_days: int        # stock_qty = 0
+    available_days: int       # stock_qty > 0
+    available_sell_days: int  # stock_qty > 0 AND sale_qty > 0
+
+
+def _stock_code(stock_qty: Optional[int]) -> str:
+    if stock_qty is None or stock_qty < 0:
+        return UNKNOWN
+    return IN_STOCK if stock_qty > 0 else STOCKOUT
+
+
+def _to_date(value: str) -> date:
+    return datetime.strptime(value[:10], "%Y-%m-%d").date()
+
+
+@dataclass
+class ItemSalesStats:
+    """상품 1개의 집계 행 (링 버퍼 디코딩 상태)"""
+    item_cd: str
+    first_date: str
+    last_date: str
+    last_sale_date: Optional[str]
+    record_days: int
+    sales: List[Optional[int]]  # 오래된 → 최신 (마지막 = last_date), None = 기록 없음
+    stock: List[str]            # 같은 위치의 재고 상태 코드
+
+    @property
+    def data_span_days(self) -> int:
+        """첫 기록일 ~ 마지막 기록일 달력일 수"""
+        return (_to_date(self.last_date) - _to_date(self.first_date)).days + 1
+
+    @property
+    def ring_start(self) -> date:
+        return _to_date(self.last_date) - timedelta(days=RING_DAYS - 1)
+
+    def covers(self, days: int, ref_date: str) -> bool:
+        """링이 윈도우 시작 이후 기록을 모두 담고 있는지"""
+        start = _to_date(ref_date) - timedelta(days=days)
+        ring_start = self.ring_start
+        return start >= ring_start or _to_date(self.first_date) >= ring_start
+
+    def window(self, days: int, ref_date: str) -> SalesWindow:
+        """sales_date >= ref_date - days 범위 집계 (covers() 확인 후 사용)"""
+        start = _to_date(ref_date) - timedelta(days=days)
+        offset = max(0, (start - self.ring_start).days)
+        record = sale = sell = stockout = available = available_sell = 0
+        for qty, code in zip(self.sales[offset:], self.stock[offset:]):
+            if code == NO_RECORD:
+                continue
+            record += 1
+            sale += qty or 0
+            sold = (qty or 0) > 0
+            sell += sold
+            if code == STOCKOUT:
+                stockout += 1
+            elif code == IN_STOCK:
+                available += 1
+                available_sell += sold
+        return SalesWindow(record, sale, sell, stockout, available, available_sell)
+
+    def encode(self) -> Tuple[str, str]:
+        return (
+            ','.join('' if v is None else str(v) for v in self.sales),
+            ''.join(self.stock),
+        )
+
+    @classmethod
+    def decode(cls, row: Sequence) -> Optional['ItemSalesStats']:
+        item_cd, first_date, last_date, last_sale_date, record_days, sale_ring, stock_ring = row
+        if not first_date or not last_date or sale_ring is None or stock_ring is None:
+            return None
+        sales = [int(v) if v else None for v in sale_ring.split(',')]
+        if len(sales) != RING_DAYS or len(stock_ring) != RING_DAYS:
+            return None
+        return cls(item_cd, first_date, last_date, last_sale_date,
+                   record_days or 0, sales, list(stock_ring))
+
+    def apply(self, sales_date: str, sale_qty: int, stock_qty: Optional[int], is_new: bool) -> None:
+        """하루치 기록 반영 (신규/갱신)"""
+        if is_new:
+            self.record_days += 1
+        self.first_date = min(self.first_date, sales_date)
+        if sale_qty > 0 and (not self.last_sale_date or sales_date > self.last_sale_date):
+            self.last_sale_date = sales_date
+
+        if sales_date > self.last_date:
+            shift = min((_to_date(sales_date) - _to_date(self.last_date)).days, RING_DAYS)
+            self.sales = self.sales[shift:] + [None] * shift
+            self.stock = self.stock[shift:] + [NO_RECORD] * shift
+            self.last_date = sales_date
+        pos = RING_DAYS - 1 - (_to_date(self.last_date) - _to_date(sales_date)).days
+        if pos >= 0:
+            self.sales[pos] = sale_qty
+            self.stock[pos] = _stock_code(stock_qty)
+
+
+def load_item_sales_stats(
+    conn: sqlite3.Connection, item_codes: Iterable[str], store_id: str,
+) -> Dict[str, ItemSalesStats]:
+    """집계 행 일괄 조회 (테이블 없으면 빈 dict → 호출자가 daily_sales 스캔 폴백)"""
+    codes = list(dict.fromkeys(item_codes))
+    result: Dict[str, ItemSalesStats] = {}
+    try:
+        for i in range(0, len(codes), _CHUNK):
+            chunk = codes[i:i + _CHUNK]
+            rows = conn.execute(
+                _SELECT_STATS_SQL.format(placeholders=','.join('?' * len(chunk))),
+                [store_id] + chunk,
+            ).fetchall()
+            for row in rows:
+                stats = ItemSalesStats.decode(tuple(row))
+                if stats:
+                    result[stats.item_cd] = stats
+    except sqlite3.OperationalError as e:
+        logger.debug(f"[ItemSalesStats] 조회 불가 (스캔 폴백): {e}")
+        return {}
+    return result
+
+
+def build_item_sales_stats(
+    conn: sqlite3.Connection, store_id: str, item_codes: Optional[List[str]] = None,
+) -> Dict[str, ItemSalesStats]:
+    """daily_sales에서 집계 행을 새로 계산 (저장하지 않음)"""
+    chunks = (
+        [item_codes[i:i + _CHUNK] for i in range(0, len(item_codes), _CHUNK)]
+        if item_codes is not None else [None]
+    )
+    result: Dict[str, ItemSalesStats] = {}
+    for chunk in chunks:
+        if chunk is not None and not chunk:
+            continue
+        item_filter = (
+            f"AND item_cd IN ({','.join('?' * len(chunk))})" if chunk else ""
+        )
+        params = [store_id] + (chunk or [])
+        for item_cd, first, last, last_sale, count in conn.execute(
+            _BUILD_SCALAR_SQL.format(item_filter=item_filter), params
+        ).fetchall():
+            result[item_cd] = ItemSalesStats(
+                item_cd, first, last, last_sale, count,
+                [None] * RING_DAYS, [NO_RECORD] * RING_DAYS,
+            )
+        for item_cd, sales_date, sale_qty, stock_qty in conn.execute(
+            _BUILD_RING_SQL.format(item_filter=item_filter, back=RING_DAYS - 1),
+            params + [store_id],
+        ).fetchall():
+            stats = result[item_cd]
+            pos = RING_DAYS - 1 - (_to_date(stats.last_date) - _to_date(sales_date)).days
+            stats.sales[pos] = sale_qty or 0
+            stats.stock[pos] = _stock_code(stock_qty)
+    return result
+
+
+def _upsert(cursor: sqlite3.Cursor, store_id: str, stats: Iterable[ItemSalesStats], now: str) -> int:
+    rows = [
+        (store_id, s.item_cd, s.first_date, s.last_date, s.last_sale_date,
+         s.record_days, *s.encode(), now)
+        for s in stats
+    ]
+    cursor.executemany(_UPSERT_STATS_SQL, rows)
+    return len(rows)
+
+
+class ItemSalesStatsRepository(BaseRepository):
+    """상품별 판매 집계 저장소 (매장 DB)"""
+    db_type = "store"
+
+    @staticmethod
+    def apply_sales(
+        cursor: sqlite3.Cursor,
+        store_id: str,
+        sales_date: str,
+        rows: Iterable[Tuple[str, int, Optional[int], Optional[int]]],
+        now: Optional[str] = None,
+    ) -> int:
+        """
+        daily_sales 저장 직후 같은 커서(트랜잭션)에서 집계 증분 반영
+
+        Args:
+            cursor: daily_sales를 기록한 커서 (미커밋 변경이 보이는 연결)
+            store_id: 매장 코드
+            sales_date: 판매 일자 (YYYY-MM-DD)
+            rows: [(item_cd, sale_qty, stock_qty, 이전 sale_qty 또는 None(신규)), ...]
+            now: 갱신 시각
+
+        Returns:
+            갱신된 집계 행 수 (테이블이 없으면 0)
+        """
+        # 같은 상품이 여러 번 오면 마지막 값 저장, 이전 값은 첫 번째(저장 전 스냅샷) 기준
+        staged: Dict[str, Tuple[int, Optional[int], Optional[int]]] = {}
+        for item_cd, sale, stock, prev in rows:
+            if item_cd in staged:
+                prev = staged[item_cd][2]
+            staged[item_cd] = (sale or 0, stock, prev)
+        if not staged:
+            return 0
+        now = now or datetime.now().isoformat()
+        existing = load_item_sales_stats(cursor.connection, staged, store_id)
+        if not existing and not _table_exists(cursor):
+            return 0
+
+        updated: List[ItemSalesStats] = []
+        rebuild: List[str] = []
+        for item_cd, (sale, stock, prev) in staged.items():
+            stats = existing.get(item_cd)
+            # 집계행 없음(신규 상품/테이블 도입 전 이력) 또는 마지막 판매일 취소 → 재계산
+            if stats is None or (
+                prev is not None and prev > 0 and sale <= 0
+                and sales_date == stats.last_sale_date
+            ):
+                rebuild.append(item_cd)
+                continue
+            stats.apply(sales_date, sale, stock, is_new=prev is None)
+            updated.append(stats)
+
+        if rebuild:
+            updated.extend(build_item_sales_stats(cursor.connection, store_id, rebuild).values())
+        return _upsert(cursor, store_id, updated, now)
+
+    def rebuild(self, store_id: Optional[str] = None) -> int:
+        """매장 전체 집계 재구축 (기존 행 삭제 후 daily_sales에서 재계산)"""
+        sid = store_id or self.store_id
+        conn = self._get_conn()
+        try:
+            cursor = conn.cursor()
+            stats = build_item_sales_stats(conn, sid)
+            cursor.execute("DELETE FROM item_sales_stats WHERE store_id = ?", (sid,))
+            count = _upsert(cursor, sid, stats.values(), self._now())
+            conn.commit()
+            logger.info(f"[ItemSalesStats] 재구축 완료: store={sid}, {count}개 상품")
+            return count
+        finally:
+            conn.close()
+
+    def verify(self, store_id: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        저장된 집계와 daily_sales 재계산 결과 비교
+
+        Returns:
+            불일치 목록 [{item_cd, field, stored, expected}, ...] (빈 리스트 = 일치)
+        """
+        sid = store_id or self.store_id
+        conn = self._get_conn()
+        try:
+            expected = build_item_sales_stats(conn, sid)
+            stored_codes = [
+                r[0] for r in conn.execute(
+                    "SELECT item_cd FROM item_sales_stats WHERE store_id = ?", (sid,)
+                ).fetchall()
+            ]
+            stored = load_item_sales_stats(conn, stored_codes, sid)
+        finally:
+            conn.close()
+
+        mismatches = []
+        for item_cd in sorted(set(expected) | set(stored_codes)):
+            want, have = expected.get(item_cd), stored.get(item_cd)
+            if want is None or have is None:
+                mismatches.append({
+                    "item_cd": item_cd, "field": "row",
+                    "stored": "present" if have else "missing",
+                    "expected": "present" if want else "missing",
+                })
+                continue
+            for field in ("first_date", "last_date", "last_sale_date", "record_days",
+                          "sales", "stock"):
+                if getattr(have, field) != getattr(want, field):
+                    mismatches.append({
+                        "item_cd": item_cd, "field": field,
+                        "stored": str(getattr(have, field)),
+                        "expected": str(getattr(want, field)),
+                    })
+        return mismatches
+
+    def get_stats(
+        self, item_codes: List[str], store_id: Optional[str] = None,
+    ) -> Dict[str, ItemSalesStats]:
+        """상품별 집계 조회"""
+        conn = self._get_conn()
+        try:
+            return load_item_sales_stats(conn, item_codes, store_id or self.store_id)
+        finally:
+            conn.close()
+
+
+def _table_exists(cursor: sqlite3.Cursor) -> bool:
+    return cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'item_sales_stats'"
+    ).fetchone() is not None
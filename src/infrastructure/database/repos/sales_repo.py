@@ -8,22 +8,109 @@ order_tracking, inventory_batches, product_details 테이블 관련 CRUD.
 """
 
 import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
 from src.infrastructure.database.base_repository import BaseRepository
 from src.infrastructure.database.connection import DBRouter
+from src.infrastructure.database.repos.item_sales_stats_repo import ItemSalesStatsRepository
 from src.utils.logger import get_logger
 from src.settings.constants import (
     BATCH_STATUS_ACTIVE,
     BATCH_STATUS_CONSUMED,
     BATCH_STATUS_EXPIRED,
     DEFAULT_STORE_ID,
+    SALES_VALIDATION_ASYNC,
 )
 
 logger = get_logger(__name__)
 
+# 저장 후 검증 백그라운드 실행기 (validation-batch) — 단일 워커로 저장 순서대로 검증
+_validation_executor: Optional[ThreadPoolExecutor] = None
+_validation_futures: List[Future] = []
+_validation_lock = threading.Lock()
+
+
+def _submit_validation(fn, *args) -> Future:
+    global _validation_executor
+    with _validation_lock:
+        if _validation_executor is None:
+            _validation_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="sales-validation"
+            )
+        future = _validation_executor.submit(fn, *args)
+        _validation_futures[:] = [f for f in _validation_futures if not f.done()]
+        _validation_futures.append(future)
+        return future
+
+
+def wait_for_pending_validations(timeout: Optional[float] = None) -> bool:
+    """백그라운드 저장 후 검증 완료 대기
+
+    DailyCollectionJob.run_optimized 종료 시와 스케줄러 프로세스 종료(atexit) 시
+    SALES_VALIDATION_WAIT_TIMEOUT_SEC 상한으로 호출된다.
+
+    Returns:
+        timeout 안에 모두 끝났으면 True
+    """
+    with _validation_lock:
+        pending = list(_validation_futures)
+    _, not_done = wait(pending, timeout=timeout)
+    return not not_done
+
+# 중분류/상품 마스터 upsert (common.db) — 단건/일괄 저장 공용
+_UPSERT_MID_CATEGORY_SQL = """
+    INSERT INTO mid_categories (mid_cd, mid_nm, created_at, updated_at)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(mid_cd) DO UPDATE SET
+        mid_nm = excluded.mid_nm,
+        updated_at = excluded.updated_at
+"""
+
+_UPSERT_PRODUCT_SQL = """
+    INSERT INTO products (item_cd, item_nm, mid_cd, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(item_cd) DO UPDATE SET
+        item_nm = excluded.item_nm,
+        mid_cd = excluded.mid_cd,
+        updated_at = excluded.updated_at
+"""
+
+# realtime_inventory: 신규 상품만 INSERT, 기존 상품은 item_nm만 갱신 (stock_qty 보호)
+_UPSERT_REALTIME_INVENTORY_SQL = """
+    INSERT INTO realtime_inventory
+    (store_id, item_cd, item_nm, stock_qty, pending_qty, order_unit_qty,
+     is_available, is_cut_item, queried_at, created_at)
+    VALUES (?, ?, ?, ?, 0, 1, 1, 0, ?, ?)
+    ON CONFLICT(store_id, item_cd) DO UPDATE SET
+        item_nm = COALESCE(excluded.item_nm, realtime_inventory.item_nm)
+"""
+
+# daily_sales 일괄 저장 (bulk-daily-sales)
+# UNIQUE 제약이 DB마다 (sales_date, item_cd) / (store_id, sales_date, item_cd)로 달라
+# ON CONFLICT 대상 대신 저장 전 스냅샷으로 UPDATE/INSERT 배치를 나눈다.
+_UPDATE_DAILY_SALE_SQL = """
+    UPDATE daily_sales SET
+        collected_at = ?,
+        mid_cd = ?,
+        sale_qty = ?,
+        ord_qty = ?,
+        buy_qty = ?,
+        disuse_qty = ?,
+        stock_qty = ?
+    WHERE store_id = ? AND sales_date = ? AND item_cd = ?
+"""
+
+_INSERT_DAILY_SALE_SQL = """
+    INSERT INTO daily_sales
+    (store_id, collected_at, sales_date, item_cd, mid_cd, sale_qty,
+     ord_qty, buy_qty, disuse_qty, stock_qty, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class SalesRepository(BaseRepository):
     """판매 데이터 저장소"""
@@ -35,7 +122,8 @@ class SalesRepository(BaseRepository):
         sales_date: str,
         store_id: str = DEFAULT_STORE_ID,
         collected_at: Optional[str] = None,
-        enable_validation: bool = True
+        enable_validation: bool = True,
+        bulk: bool = False
     ) -> Dict[str, int]:
         """
         일별 판매 데이터 저장
@@ -46,6 +134,7 @@ class SalesRepository(BaseRepository):
             store_id: 매장 코드
             collected_at: 수집 시점 (기본: 현재 시간)
             enable_validation: 검증 활성화 여부 (기본값: True)
+            bulk: True면 executemany 일괄 upsert 경로 사용 (과거 데이터 백필 등 대량 저장용)
 
         Returns:
             {"total": 총 건수, "new": 신규, "updated": 업데이트}
@@ -53,6 +142,11 @@ class SalesRepository(BaseRepository):
         if collected_at is None:
             collected_at = self._now()
 
+        if bulk:
+            return self._save_daily_sales_bulk(
+                sales_data, sales_date, store_id, collected_at, enable_validation
+            )
+
         conn = self._get_conn()
         cursor = conn.cursor()
 
@@ -62,8 +156,16 @@ class SalesRepository(BaseRepository):
 
         stats = {"total": 0, "new": 0, "updated": 0}
         now = self._now()
+        stats_rows = []
 
         try:
+            # 저장 전 해당 일자 판매량 (item_sales_stats 증분용: None = 신규 행)
+            cursor.execute(
+                "SELECT item_cd, sale_qty FROM daily_sales WHERE store_id = ? AND sales_date = ?",
+                (store_id, sales_date)
+            )
+            day_snapshot = {row[0]: row[1] or 0 for row in cursor.fetchall()}
+
             for item in sales_data:
                 item_cd = item.get("ITEM_CD", "")
                 mid_cd = item.get("MID_CD", "")
@@ -104,6 +206,12 @@ class SalesRepository(BaseRepository):
                     stats["new"] += 1
                 else:
                     stats["updated"] += 1
+                stats_rows.append((
+                    item_cd, self._to_int(item.get("SALE_QTY")),
+                    self._to_int(item.get("STOCK_QTY")), day_snapshot.get(item_cd),
+                ))
+
+            self._apply_item_sales_stats(cursor, store_id, sales_date, stats_rows, now)
 
             # 공통 DB 커밋 (mid_categories, products)
             if common_conn is not conn:
@@ -126,18 +234,172 @@ class SalesRepository(BaseRepository):
 
         return stats
 
+    def _save_daily_sales_bulk(
+        self,
+        sales_data: List[Dict[str, Any]],
+        sales_date: str,
+        store_id: str,
+        collected_at: str,
+        enable_validation: bool
+    ) -> Dict[str, int]:
+        """일별 판매 데이터 일괄 저장 (bulk-daily-sales)
+
+        하루치 행을 스테이징한 뒤 mid_categories / products / realtime_inventory는
+        INSERT ... ON CONFLICT DO UPDATE, daily_sales는 UPDATE/INSERT executemany로 저장한다.
+        결과는 상품별 순차 upsert(save_daily_sales 기본 경로)와 동일하다.
+
+        - 중분류/상품 upsert는 코드 기준 중복 제거 (마지막 값 우선 = 순차 upsert 최종 상태)
+        - 신규/업데이트 건수와 판매/입고 증분은 저장 전 해당 일자 스냅샷 1회 조회로 계산
+        - 폐기 추적 파이프라인은 판매/입고 증분이 있는 상품에만 실행
+          (FR-02 보정은 허용 오차 이내에서 차감량 0 → 증분 없는 상품은 쓰기 없음)
+        """
+        now = self._now()
+
+        # 1) 스테이징: 유효 행만, item_cd 중복 시 마지막 값 우선
+        staged: Dict[str, tuple] = {}
+        mid_names: Dict[str, str] = {}
+        total = 0
+        for item in sales_data:
+            item_cd = item.get("ITEM_CD", "")
+            mid_cd = item.get("MID_CD", "")
+            if not item_cd or not mid_cd:
+                continue
+            total += 1
+            mid_names[mid_cd] = item.get("MID_NM", "")
+            staged[item_cd] = (
+                mid_cd,
+                item.get("ITEM_NM", ""),
+                self._to_int(item.get("SALE_QTY")),
+                self._to_int(item.get("ORD_QTY")),
+                self._to_int(item.get("BUY_QTY")),
+                self._to_int(item.get("DISUSE_QTY")),
+                self._to_int(item.get("STOCK_QTY")),
+            )
+
+        stats = {"total": total, "new": 0, "updated": 0}
+
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        common_conn = DBRouter.get_common_connection() if not self._db_path else conn
+        common_cursor = common_conn.cursor() if common_conn is not conn else cursor
+
+        try:
+            if staged:
+                # 2) 저장 전 스냅샷 (신규/업데이트 판정 + 증분 계산용)
+                cursor.execute(
+                    "SELECT item_cd, sale_qty, buy_qty FROM daily_sales "
+                    "WHERE store_id = ? AND sales_date = ?",
+                    (store_id, sales_date)
+                )
+                existing = {row[0]: (row[1] or 0, row[2] or 0) for row in cursor.fetchall()}
+
+                new_count = sum(1 for item_cd in staged if item_cd not in existing)
+                stats["new"] = new_count
+                stats["updated"] = total - new_count
+
+                # 3) 마스터 (common.db)
+                common_cursor.executemany(
+                    _UPSERT_MID_CATEGORY_SQL,
+                    [(mid_cd, mid_nm, now, now) for mid_cd, mid_nm in mid_names.items()]
+                )
+                common_cursor.executemany(
+                    _UPSERT_PRODUCT_SQL,
+                    [(item_cd, row[1], row[0], now, now) for item_cd, row in staged.items()]
+                )
+
+                # 4) 일별 판매 + 실시간 재고 (store DB)
+                cursor.executemany(
+                    _UPDATE_DAILY_SALE_SQL,
+                    [
+                        (collected_at, row[0], row[2], row[3], row[4], row[5], row[6],
+                         store_id, sales_date, item_cd)
+                        for item_cd, row in staged.items() if item_cd in existing
+                    ]
+                )
+                cursor.executemany(
+                    _INSERT_DAILY_SALE_SQL,
+                    [
+                        (store_id, collected_at, sales_date, item_cd, row[0],
+                         row[2], row[3], row[4], row[5], row[6], now)
+                        for item_cd, row in staged.items() if item_cd not in existing
+                    ]
+                )
+                cursor.executemany(
+                    _UPSERT_REALTIME_INVENTORY_SQL,
+                    [
+                        (store_id, item_cd, row[1], row[6], now, now)
+                        for item_cd, row in staged.items()
+                    ]
+                )
+
+                # 5) 폐기 추적 (증분 있는 상품만)
+                for item_cd, row in staged.items():
+                    prev_sale, prev_buy = existing.get(item_cd, (0, 0))
+                    sale_qty_diff = row[2] - prev_sale
+                    buy_qty_diff = row[4] - prev_buy
+                    if sale_qty_diff <= 0 and buy_qty_diff <= 0:
+                        continue
+                    self._apply_waste_tracking(
+                        cursor,
+                        sales_date=sales_date,
+                        item_cd=item_cd,
+                        mid_cd=row[0],
+                        sale_qty_diff=sale_qty_diff,
+                        buy_qty_diff=buy_qty_diff,
+                        stock_qty=row[6],
+                        now=now,
+                        store_id=store_id,
+                        item_nm=row[1],
+                        common_cursor=common_cursor,
+                    )
+
+                # 6) 상품별 판매 집계 증분 (item-sales-stats)
+                self._apply_item_sales_stats(
+                    cursor, store_id, sales_date,
+                    [
+                        (item_cd, row[2], row[6],
+                         existing[item_cd][0] if item_cd in existing else None)
+                        for item_cd, row in staged.items()
+                    ],
+                    now,
+                )
+
+            if common_conn is not conn:
+                common_conn.commit()
+            conn.commit()
+
+            if enable_validation:
+                self._validate_saved_data(sales_data, sales_date, store_id)
+
+        except Exception as e:
+            if common_conn is not conn:
+                common_conn.rollback()
+            conn.rollback()
+            raise e
+        finally:
+            if common_conn is not conn:
+                common_conn.close()
+            conn.close()
+
+        return stats
+
+    @staticmethod
+    def _apply_item_sales_stats(
+        cursor: sqlite3.Cursor, store_id: str, sales_date: str,
+        rows: List[tuple], now: str
+    ) -> None:
+        """item_sales_stats 증분 반영 — 실패해도 판매 저장은 유지 (verify/rebuild로 복구)"""
+        try:
+            ItemSalesStatsRepository.apply_sales(cursor, store_id, sales_date, rows, now)
+        except Exception as e:
+            logger.warning(f"[ItemSalesStats] 증분 갱신 실패 ({sales_date}): {e}")
+
     def _upsert_mid_category(
         self, cursor: sqlite3.Cursor, mid_cd: str, mid_nm: str, now: str
     ):
         """중분류 마스터 upsert"""
         cursor.execute(
-            """
-            INSERT INTO mid_categories (mid_cd, mid_nm, created_at, updated_at)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(mid_cd) DO UPDATE SET
-                mid_nm = excluded.mid_nm,
-                updated_at = excluded.updated_at
-            """,
+            _UPSERT_MID_CATEGORY_SQL,
             (mid_cd, mid_nm, now, now)
         )
 
@@ -147,14 +409,7 @@ class SalesRepository(BaseRepository):
     ):
         """상품 마스터 upsert"""
         cursor.execute(
-            """
-            INSERT INTO products (item_cd, item_nm, mid_cd, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(item_cd) DO UPDATE SET
-                item_nm = excluded.item_nm,
-                mid_cd = excluded.mid_cd,
-                updated_at = excluded.updated_at
-            """,
+            _UPSERT_PRODUCT_SQL,
             (item_cd, item_nm, mid_cd, now, now)
         )
 
@@ -219,22 +474,45 @@ class SalesRepository(BaseRepository):
         #       → 기존 CUT 상태가 판매수집으로 리셋되지 않음
 
         cursor.execute(
-            """
-            INSERT INTO realtime_inventory
-            (store_id, item_cd, item_nm, stock_qty, pending_qty, order_unit_qty,
-             is_available, is_cut_item, queried_at, created_at)
-            VALUES (?, ?, ?, ?, 0, 1, 1, 0, ?, ?)
-            ON CONFLICT(store_id, item_cd) DO UPDATE SET
-                item_nm = COALESCE(excluded.item_nm, realtime_inventory.item_nm)
-            """,
+            _UPSERT_REALTIME_INVENTORY_SQL,
             (store_id, item_cd, item_nm, stock_qty, now, now)
         )
 
         # === 폐기 추적 파이프라인 (FR-01, FR-02, FR-03) ===
-        try:
-            sale_qty_diff = sale_qty - prev_sale_qty
-            buy_qty_diff = buy_qty - prev_buy_qty
+        self._apply_waste_tracking(
+            cursor,
+            sales_date=sales_date,
+            item_cd=item_cd,
+            mid_cd=mid_cd,
+            sale_qty_diff=sale_qty - prev_sale_qty,
+            buy_qty_diff=buy_qty - prev_buy_qty,
+            stock_qty=stock_qty,
+            now=now,
+            store_id=store_id,
+            item_nm=item_nm,
+            common_cursor=common_cursor,
+        )
+
+        return is_new
+
+    def _apply_waste_tracking(
+        self, cursor: sqlite3.Cursor, sales_date: str, item_cd: str,
+        mid_cd: str, sale_qty_diff: int, buy_qty_diff: int, stock_qty: int,
+        now: str, store_id: str = DEFAULT_STORE_ID,
+        item_nm: Optional[str] = None,
+        common_cursor: Optional[sqlite3.Cursor] = None
+    ) -> None:
+        """폐기 추적 파이프라인 (FR-01, FR-01.5, FR-03, FR-02)
+
+        daily_sales 저장 직후 판매/입고 증분을 order_tracking, inventory_batches에 반영한다.
+        실패해도 판매 데이터 저장 플로우는 유지 (경고 로그만 남김).
 
+        Args:
+            sale_qty_diff: 기존 저장값 대비 판매수량 증분
+            buy_qty_diff: 기존 저장값 대비 입고수량 증분
+            common_cursor: common.db 커서 (product_details 조회용)
+        """
+        try:
             # FR-01: order_tracking.remaining_qty FIFO 차감 (판매 증분)
             if sale_qty_diff > 0:
                 cursor.execute(
@@ -403,8 +681,6 @@ class SalesRepository(BaseRepository):
             # 폐기 추적 실패해도 기존 판매 데이터 저장 플로우는 유지
             logger.warning(f"폐기 추적 파이프라인 오류 ({item_cd}): {e}")
 
-        return is_new
-
     def log_collection(
         self, collected_at: str, sales_date: str, stats: Dict[str, int],
         status: str, error_message: Optional[str] = None, duration: Optional[float] = None
@@ -871,6 +1147,9 @@ class SalesRepository(BaseRepository):
                     (sid, sales_date, item_cd, mid_cd,
                      slip_qty, now, now),
                 )
+                self._apply_item_sales_stats(
+                    cursor, sid, sales_date, [(item_cd, 0, 0, None)], now
+                )
                 conn.commit()
                 return "inserted"
         finally:
@@ -884,11 +1163,32 @@ class SalesRepository(BaseRepository):
     ):
         """저장된 데이터 검증 후크
 
+        커밋 이후 호출된다. SALES_VALIDATION_ASYNC 이면 백그라운드 워커에서
+        검증해 수집 흐름을 막지 않는다. 남은 검증은 잡 종료 시
+        wait_for_pending_validations 로 대기한다.
+
         Args:
             sales_data: 저장된 판매 데이터
             sales_date: 판매 일자
             store_id: 점포 ID
         """
+        if SALES_VALIDATION_ASYNC:
+            try:
+                _submit_validation(
+                    self._run_validation, list(sales_data), sales_date, store_id
+                )
+                return
+            except RuntimeError as e:  # 인터프리터 종료 중 등 → 동기 실행
+                logger.debug(f"검증 백그라운드 제출 실패, 동기 실행: {e}")
+        self._run_validation(sales_data, sales_date, store_id)
+
+    def _run_validation(
+        self,
+        sales_data: List[Dict[str, Any]],
+        sales_date: str,
+        store_id: str
+    ):
+        """저장 후 검증 실행 + 결과 기록 (실패해도 저장 결과에 영향 없음)"""
         try:
             from src.validation.data_validator import DataValidator
             from src.infrastructure.database.repos import ValidationRepository
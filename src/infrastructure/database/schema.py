@@ -256,6 +256,15 @@ COMMON_INDEXES = [
     """CREATE UNIQUE INDEX IF NOT EXISTS idx_job_runs_missed_unique
        ON job_runs(job_name, COALESCE(store_id, ''), scheduled_for)
        WHERE status = 'missed'""",
+    # v80: dashboard_snapshots 홈 대시보드 스냅샷 (dashboard-snapshot)
+    """CREATE TABLE IF NOT EXISTS dashboard_snapshots (
+        store_id     TEXT NOT NULL,
+        section      TEXT NOT NULL,
+        payload      TEXT NOT NULL,
+        etag         TEXT NOT NULL,
+        generated_at TEXT NOT NULL,
+        PRIMARY KEY (store_id, section)
+    )""",
 ]
 
 
@@ -383,7 +392,8 @@ STORE_SCHEMA = [
         ml_order_qty INTEGER,
         ml_weight_used REAL,
         association_boost REAL,
-        stage_trace TEXT
+        stage_trace TEXT,
+        stage_trace_z BLOB
     )""",
 
     # eval_outcomes
@@ -1053,6 +1063,20 @@ STORE_SCHEMA = [
         confirmed_at TEXT NOT NULL,
         UNIQUE(store_id, order_date, item_cd)
     )""",
+    # item_sales_stats (v79: 상품별 판매 집계 — daily_sales 저장 시 증분 갱신)
+    # sale_ring/stock_ring: last_date 기준 최근 91일 판매량/재고상태 링 버퍼
+    """CREATE TABLE IF NOT EXISTS item_sales_stats (
+        store_id TEXT NOT NULL,
+        item_cd TEXT NOT NULL,
+        first_date TEXT,
+        last_date TEXT,
+        last_sale_date TEXT,
+        record_days INTEGER DEFAULT 0,
+        sale_ring TEXT,
+        stock_ring TEXT,
+        updated_at TEXT,
+        PRIMARY KEY (store_id, item_cd)
+    )""",
 ]
 
 STORE_INDEXES = [
@@ -1256,6 +1280,8 @@ _STORE_COLUMN_PATCHES = [
     # stage_trace(파이프라인 단계별 중간값 JSON, food-underprediction-secondary B안)
     "ALTER TABLE prediction_logs ADD COLUMN association_boost REAL",
     "ALTER TABLE prediction_logs ADD COLUMN stage_trace TEXT",
+    # v81: stage_trace 압축 BLOB 전용 컬럼 (stage_trace TEXT 는 구 JSON 만 유지)
+    "ALTER TABLE prediction_logs ADD COLUMN stage_trace_z BLOB",
     # v56: 신제품 안착 판정 컬럼
     "ALTER TABLE detected_new_products ADD COLUMN analysis_window_days INTEGER",
     "ALTER TABLE detected_new_products ADD COLUMN extension_count INTEGER DEFAULT 0",
@@ -1558,11 +1584,34 @@ def _fix_order_fail_reasons_unique(cursor) -> None:
         logger.warning(f"order_fail_reasons UNIQUE 보정 실패 (무시): {e}")
 
 
+def _has_column(cursor, table: str, column: str) -> bool:
+    """테이블에 컬럼이 있는지 (테이블이 없으면 False)"""
+    return any(row[1] == column for row in cursor.execute(f"PRAGMA table_info({table})"))
+
+
+def _move_stage_trace_blobs(cursor) -> None:
+    """stage_trace(TEXT) 에 들어간 압축 BLOB 을 stage_trace_z 로 이관 (v81)
+
+    stage_trace 를 JSON 텍스트로 읽는 조회가 깨지지 않도록 TEXT 컬럼에는
+    구 JSON 만 남긴다.
+    """
+    try:
+        cursor.execute(
+            "UPDATE prediction_logs SET stage_trace_z = stage_trace, stage_trace = NULL "
+            "WHERE typeof(stage_trace) = 'blob'"
+        )
+        if cursor.rowcount > 0:
+            logger.info(f"prediction_logs stage_trace BLOB 이관: {cursor.rowcount}건")
+    except sqlite3.OperationalError as e:
+        logger.warning(f"prediction_logs stage_trace BLOB 이관 실패 (무시): {e}")
+
+
 def _apply_store_column_patches(cursor) -> None:
     """기존 매장 DB 테이블에 누락된 컬럼을 안전하게 추가.
 
     이미 존재하는 컬럼은 'duplicate column name' 에러를 무시한다.
     """
+    had_trace_z = _has_column(cursor, "prediction_logs", "stage_trace_z")
     for stmt in _STORE_COLUMN_PATCHES:
         try:
             cursor.execute(stmt)
@@ -1573,6 +1622,9 @@ def _apply_store_column_patches(cursor) -> None:
                 pass  # 테이블 자체가 없으면 CREATE TABLE에서 이미 포함됨
             else:
                 logger.warning(f"Store DB 컬럼 보정 실패 (무시): {stmt} → {e}")
+    # v81: stage_trace_z 컬럼이 이번에 추가됐을 때만 BLOB 이관 (1회)
+    if not had_trace_z:
+        _move_stage_trace_blobs(cursor)
     # UNIQUE 제약 보정
     _fix_promotions_unique(cursor)
     _fix_calibration_unique(cursor)
@@ -1083,6 +1083,54 @@ class AutoOrderSystem:
             logger.warning(f"[SiteBudget] site 발주 조회 실패 (폴백: 빈 dict): {e}")
             return {}
 
+    def _predict_order_candidates(
+        self,
+        target_date: Optional[datetime],
+        min_order_qty: int,
+        exclude_items: Optional[set],
+    ) -> List[PredictionResult]:
+        """발주 후보 예측
+
+        다매장 예측 프로세스 풀이 활성화되어 있으면 워커 프로세스에서,
+        상주 예측 데몬이 떠 있으면 데몬의 warm 예측기로 예측한다.
+        풀/데몬 호출이 실패하면 (BrokenProcessPool, 직렬화 오류, 워커 예외,
+        데몬 타임아웃 등) 프로세스 내 예측기로 폴백한다.
+        프로세스 내 예측까지 실패한 경우에만 빈 목록을 반환한다.
+        """
+        try:
+            from src.application.scheduler.prediction_pool import get_active_prediction_pool
+            from src.application.scheduler.prediction_daemon import get_prediction_daemon_client
+            remote = get_active_prediction_pool() or get_prediction_daemon_client()
+        except Exception as e:
+            logger.warning(f"예측 풀/데몬 조회 실패 (직접 예측): {e}")
+            remote = None
+
+        if remote is not None:
+            try:
+                return remote.predict_candidates(
+                    self.store_id,
+                    target_date=target_date,
+                    min_order_qty=min_order_qty,
+                    exclude_items=exclude_items,
+                    pending_cache=getattr(self, '_pending_cache', None),
+                    stock_cache=getattr(self, '_last_stock_data', None),
+                )
+            except Exception as e:
+                logger.warning(
+                    f"{type(remote).__name__} 예측 실패 (직접 예측으로 폴백): "
+                    f"{type(e).__name__}: {e}"
+                )
+
+        try:
+            return self.improved_predictor.get_order_candidates(
+                target_date=target_date,
+                min_order_qty=min_order_qty,
+                exclude_items=exclude_items,
+            )
+        except Exception as e:
+            logger.warning(f"예측 엔진 발주 후보 생성 실패 (빈 목록으로 계속): {e}")
+            return []
+
     def get_recommendations(
         self,
         min_order_qty: int = 1,
@@ -1146,15 +1194,9 @@ class AutoOrderSystem:
                 logger.warning(f"사전 발주 평가 실패 (원본 플로우 유지): {e}")
 
             # 발주 대상 추출 (스킵 상품 제외)
-            try:
-                candidates = self.improved_predictor.get_order_candidates(
-                    target_date=target_date,
-                    min_order_qty=min_order_qty,
-                    exclude_items=skip_codes if skip_codes else None
-                )
-            except Exception as e:
-                logger.warning(f"예측 엔진 발주 후보 생성 실패 (빈 목록으로 계속): {e}")
-                candidates = []
+            candidates = self._predict_order_candidates(
+                target_date, min_order_qty, skip_codes if skip_codes else None
+            )
 
             # PASS 상품 발주량 억제 (과잉발주 보정)
             if ENABLE_PASS_SUPPRESSION and eval_results:
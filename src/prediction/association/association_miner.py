@@ -6,7 +6,10 @@ AssociationMiner — 일별 판매 동시발생 패턴 분석
 "같은 날 평균 이상으로 팔린 상품 쌍"의 패턴을 분석한다.
 
 - mid 레벨 (중분류, ~30개): 통계적으로 안정적, 전체 카테고리 쌍 분석
-- item 레벨 (상품, 고빈도만): 일평균 ≥ 1.0인 상품만 (노이즈 방지)
+- item 레벨 (상품): 판매일 ≥ min_item_sale_days인 전체 SKU (노이즈 방지)
+
+규칙 계산은 (일 × 엔티티) 판매 행렬 + "평균 이상" 불리언 행렬을 1회 구성한 뒤
+동시발생 수(A.T @ A)와 상관계수(표준화 행렬 곱)를 블록 단위 행렬곱으로 구한다.
 
 Usage:
     miner = AssociationMiner(store_id="46513")
@@ -106,7 +109,8 @@ DEFAULT_MINING_PARAMS = {
     "min_support": 0.05,         # 최소 지지도 (5%)
     "min_confidence": 0.4,       # 최소 신뢰도 (40%)
     "min_lift": 1.2,             # 최소 리프트
-    "min_item_daily_avg": 1.0,   # item 레벨 최소 일평균
+    "min_item_daily_avg": 0.0,   # item 레벨 최소 일평균 (0=전체 SKU, 행렬 엔진)
+    "min_item_sale_days": 7,     # item 레벨 최소 판매일수 (희소 상품 우연 동시발생 방지)
     "min_data_days": 14,         # 최소 데이터 일수
     "max_rules_per_item": 5,     # item_b당 최대 규칙 수
     "mid_level_enabled": True,
@@ -118,6 +122,10 @@ DEFAULT_MINING_PARAMS = {
 # 채굴 엔진
 # =====================================================================
 
+# 규칙 계산 시 한 번에 처리할 후행(B) 엔티티 수 (엔티티 × 블록 행렬)
+_RULE_BLOCK_SIZE = 1024
+
+
 class AssociationMiner:
     """일별 판매 동시발생 패턴 채굴기"""
 
@@ -217,26 +225,28 @@ class AssociationMiner:
         return self._compute_rules(dict(mid_daily), rule_level="mid")
 
     # -----------------------------------------------------------------
-    # 상품 레벨 채굴 (고빈도만)
+    # 상품 레벨 채굴
     # -----------------------------------------------------------------
 
     def _mine_item_level(self, daily_data: Dict) -> List[AssociationRule]:
-        """상품 레벨 연관 분석 (고빈도 상품만)"""
+        """상품 레벨 연관 분석 (최소 일평균/판매일수 충족 상품)"""
         item_daily: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
         for date_str, items in daily_data.items():
             for item_cd, qty in items.items():
                 item_daily[item_cd][date_str] = qty
 
-        # 고빈도 필터
+        # 일평균/판매일수 필터
         total_days = len(daily_data)
         min_avg = self.params["min_item_daily_avg"]
+        min_sale_days = self.params["min_item_sale_days"]
         high_volume = {
             item: dict(sales)
             for item, sales in item_daily.items()
             if sum(sales.values()) / max(total_days, 1) >= min_avg
+            and len(sales) >= min_sale_days
         }
 
-        logger.debug(f"[연관분석] 고빈도 상품: {len(high_volume)}개 / 전체 {len(item_daily)}개")
+        logger.debug(f"[연관분석] 대상 상품: {len(high_volume)}개 / 전체 {len(item_daily)}개")
         return self._compute_rules(high_volume, rule_level="item")
 
     # -----------------------------------------------------------------
@@ -269,79 +279,69 @@ class AssociationMiner:
         if total_days < self.params["min_data_days"]:
             return []
 
-        # 각 entity의 평균 및 "above average" 날짜 집합
-        entity_avg: Dict[str, float] = {}
-        entity_above: Dict[str, set] = {}
+        # (일 × 엔티티) 판매 행렬 + "above average" 불리언 행렬
+        date_idx = {d: i for i, d in enumerate(all_dates)}
+        sales = np.zeros((total_days, len(entities)))
+        for j, entity in enumerate(entities):
+            for d, qty in entity_daily[entity].items():
+                sales[date_idx[d], j] = qty
+
+        avg = sales.sum(axis=0) / total_days
+        above = (sales > avg).astype(np.float32)
+        above_cnt = above.sum(axis=0, dtype=np.float64)
 
-        for entity, date_sales in entity_daily.items():
-            values = [date_sales.get(d, 0) for d in all_dates]
-            avg = sum(values) / total_days
-            entity_avg[entity] = avg
-            entity_above[entity] = {d for d in all_dates if date_sales.get(d, 0) > avg}
+        # 상관계수용 표준화 행렬 (표준편차 0 → 상관 0)
+        std = sales.std(axis=0)
+        has_std = std > 0
+        z = np.zeros_like(sales)
+        z[:, has_std] = (sales[:, has_std] - sales[:, has_std].mean(axis=0)) / std[has_std]
 
-        # 모든 (A, B) 쌍에 대해 규칙 계산
         min_support = self.params["min_support"]
         min_confidence = self.params["min_confidence"]
         min_lift = self.params["min_lift"]
         max_per_item = self.params["max_rules_per_item"]
 
-        rules_by_b: Dict[str, List[AssociationRule]] = defaultdict(list)
-
-        for a in entities:
-            a_above = entity_above[a]
-            if not a_above:
+        p = above_cnt / total_days
+        valid_a = above_cnt > 0
+        final_rules: List[AssociationRule] = []
+
+        # 후행(B) 열 블록 단위 계산 (엔티티 수² 행렬 메모리 제한)
+        for start in range(0, len(entities), _RULE_BLOCK_SIZE):
+            cols = slice(start, min(start + _RULE_BLOCK_SIZE, len(entities)))
+            both = np.rint(above.T @ above[:, cols]).astype(np.float64)  # (A, B) 동시 above 일수
+            with np.errstate(divide="ignore", invalid="ignore"):
+                support = both / total_days
+                confidence = np.where(valid_a[:, None], both / above_cnt[:, None], 0.0)
+                lift = np.where(p[cols] > 0, confidence / p[cols], 0.0)
+
+            mask = (
+                valid_a[:, None]
+                & (above_cnt[cols] > 0)[None, :]
+                & (support >= min_support)
+                & (confidence >= min_confidence)
+                & (lift >= min_lift)
+            )
+            block_ids = np.arange(cols.start, cols.stop)
+            mask[block_ids, np.arange(len(block_ids))] = False  # A == B 제외
+            if not mask.any():
                 continue
-            p_a = len(a_above) / total_days
-
-            for b in entities:
-                if a == b:
-                    continue
-                b_above = entity_above[b]
-                if not b_above:
-                    continue
-                p_b = len(b_above) / total_days
-
-                # Support
-                both_above = a_above & b_above
-                support = len(both_above) / total_days
-                if support < min_support:
-                    continue
-
-                # Confidence
-                confidence = len(both_above) / len(a_above)
-                if confidence < min_confidence:
-                    continue
-
-                # Lift
-                lift = confidence / p_b if p_b > 0 else 0
-                if lift < min_lift:
-                    continue
-
-                # Pearson correlation
-                corr = 0.0
-                try:
-                    a_series = np.array([entity_daily[a].get(d, 0) for d in all_dates])
-                    b_series = np.array([entity_daily[b].get(d, 0) for d in all_dates])
-                    if np.std(a_series) > 0 and np.std(b_series) > 0:
-                        corr = float(np.corrcoef(a_series, b_series)[0, 1])
-                except Exception:
-                    pass
-
-                rule = AssociationRule(
-                    item_a=a, item_b=b, rule_level=rule_level,
-                    support=round(support, 4),
-                    confidence=round(confidence, 4),
-                    lift=round(lift, 4),
-                    correlation=round(corr, 4),
-                    sample_days=total_days,
-                )
-                rules_by_b[b].append(rule)
 
-        # B별 상위 N개만 유지
-        final_rules = []
-        for b, b_rules in rules_by_b.items():
-            sorted_rules = sorted(b_rules, key=lambda r: r.lift, reverse=True)
-            final_rules.extend(sorted_rules[:max_per_item])
+            corr = np.clip(z.T @ z[:, cols] / total_days, -1.0, 1.0)
+
+            for col in np.flatnonzero(mask.any(axis=0)):
+                a_ids = np.flatnonzero(mask[:, col])
+                lifts = np.round(lift[a_ids, col], 4)
+                # lift 내림차순, 동률은 A 순서 유지 (stable)
+                for a in a_ids[np.argsort(-lifts, kind="stable")[:max_per_item]]:
+                    final_rules.append(AssociationRule(
+                        item_a=entities[a], item_b=entities[block_ids[col]],
+                        rule_level=rule_level,
+                        support=round(float(support[a, col]), 4),
+                        confidence=round(float(confidence[a, col]), 4),
+                        lift=round(float(lift[a, col]), 4),
+                        correlation=round(float(corr[a, col]), 4),
+                        sample_days=total_days,
+                    ))
 
         return final_rules
 
@@ -357,18 +357,20 @@ class AssociationMiner:
         conn = sqlite3.connect(self._db_path, timeout=30)
         try:
             now = datetime.now().isoformat()
-            for rule in rules:
-                conn.execute("""
-                    INSERT OR REPLACE INTO association_rules
-                    (item_a, item_b, rule_level, support, confidence, lift,
-                     correlation, sample_days, computed_at, store_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+            conn.executemany("""
+                INSERT OR REPLACE INTO association_rules
+                (item_a, item_b, rule_level, support, confidence, lift,
+                 correlation, sample_days, computed_at, store_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
                     rule.item_a, rule.item_b, rule.rule_level,
                     rule.support, rule.confidence, rule.lift,
                     rule.correlation, rule.sample_days,
                     now, self.store_id,
-                ))
+                )
+                for rule in rules
+            ])
             conn.commit()
             return len(rules)
         finally:
@@ -11,8 +11,11 @@ import sqlite3
 from datetime import datetime
 from typing import Optional, Dict, List, Tuple, Callable, Set
 
+import numpy as np
+
 from src.utils.logger import get_logger
 from .prediction_config import PREDICTION_PARAMS
+from .sales_matrix import SalesMatrix
 
 logger = get_logger(__name__)
 
@@ -42,11 +45,18 @@ class BasePredictor:
         self._feature_calculator = feature_calculator
         self.store_id = store_id
         self._holiday_context_fn = holiday_context_fn
+        # predict_batch 중 매트릭스에서 일괄 계산한 WMA {item_cd: (wma, days, mid_cd)}
+        self._wma_batch: Dict[str, Tuple[float, int, Optional[str]]] = {}
 
     def _get_connection(self, timeout: int = 30) -> sqlite3.Connection:
         """DB 연결 (PredictionDataProvider로 위임)"""
         return self._data._get_connection(timeout)
 
+    def _batch_matrix(self) -> Optional[SalesMatrix]:
+        """predict_batch 중 로드된 판매 매트릭스 (없으면 None)"""
+        matrix = getattr(self._data, '_sales_matrix', None)
+        return matrix if isinstance(matrix, SalesMatrix) else None
+
     # =========================================================================
     # 메인 진입점
     # =========================================================================
@@ -120,11 +130,16 @@ class BasePredictor:
              sell_day_ratio, intermittent_adjusted)
         """
         # 판매 이력 조회 + WMA (행사 기간 가중치 감쇄 포함)
+        # predict_batch 중에는 load_wma_batch()가 매트릭스로 미리 계산한 값 사용
         history = self._data.get_sales_history(item_cd, PREDICTION_PARAMS["moving_avg_days"])
-        wma_prediction, _wma_days = self.calculate_weighted_average(
-            history, clean_outliers=True, mid_cd=product["mid_cd"],
-            item_cd=item_cd
-        )
+        batch_wma = getattr(self, '_wma_batch', {}).get(item_cd)
+        if batch_wma is not None and batch_wma[2] == product["mid_cd"]:
+            wma_prediction, _wma_days = batch_wma[0], batch_wma[1]
+        else:
+            wma_prediction, _wma_days = self.calculate_weighted_average(
+                history, clean_outliers=True, mid_cd=product["mid_cd"],
+                item_cd=item_cd
+            )
         data_days = self._data._get_data_span_days(item_cd)
 
         # 콜드스타트 보정: 데이터 7일 미만 신규 상품은 일평균으로 WMA 보정
@@ -240,6 +255,12 @@ class BasePredictor:
 
     def _get_daily_sales_history(self, item_cd: str, days: int = 60) -> list:
         """일별 판매량 리스트 (오래된것->최신 순)"""
+        matrix = self._batch_matrix()
+        if matrix is not None:
+            cached = matrix.daily_sales_history(item_cd, days)
+            if cached is not None:
+                return cached
+
         conn = self._get_connection()
         cursor = conn.cursor()
         try:
@@ -428,6 +449,186 @@ class BasePredictor:
             return weighted_sum / total_weight, original_count
         return 0.0, 0
 
+    def load_wma_batch(self, item_codes: List[str]) -> None:
+        """predict_batch 후보 전체의 WMA를 판매 매트릭스에서 한 번에 계산
+
+        결과는 calculate_weighted_average(clean_outliers=True)와 같으며,
+        매트릭스/상품 정보가 없는 상품은 제외되어 _compute_wma가 개별 계산한다.
+        """
+        self._wma_batch = {}
+        matrix = self._batch_matrix()
+        if matrix is None:
+            return
+        window = matrix.recent_window(PREDICTION_PARAMS["moving_avg_days"])
+        if window is None:
+            return
+        dates, sale, stock = window
+
+        codes, mids, rows = [], [], []
+        for item_cd in dict.fromkeys(item_codes):
+            if item_cd not in matrix:
+                continue
+            product = self._data.get_product_info(item_cd)
+            if not product:
+                continue
+            codes.append(item_cd)
+            mids.append(product.get("mid_cd"))
+            rows.append(matrix.index[item_cd])
+        if not codes:
+            return
+
+        try:
+            averages, days = self.calculate_weighted_averages(
+                dates, sale[rows], stock[rows], mids, codes
+            )
+        except Exception as e:
+            logger.warning(f"[WMA] 배치 계산 실패 (개별 계산 폴백): {e}")
+            return
+        self._wma_batch = {
+            item_cd: (float(averages[k]), int(days[k]), mids[k])
+            for k, item_cd in enumerate(codes)
+        }
+
+    def clear_wma_batch(self) -> None:
+        """predict_batch 종료 시 일괄 WMA 해제"""
+        self._wma_batch = {}
+
+    def calculate_weighted_averages(
+        self,
+        dates: List[str],
+        sale: np.ndarray,
+        stock: np.ndarray,
+        mid_cds: List[Optional[str]],
+        item_codes: List[str],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        가중 이동평균 일괄 계산 (items × days, columnar-predict-batch)
+
+        calculate_weighted_average(clean_outliers=True)를 행마다 호출한 결과와
+        같은 값을 배열 연산으로 계산한다 (합산 순서 동일).
+
+        Args:
+            dates: 열 날짜 (최신 순)
+            sale: 판매량 (정수값 float64)
+            stock: 재고량 (미수집 NaN)
+            mid_cds: 행별 중분류 코드
+            item_codes: 행별 상품코드 (행사 기간 조회용)
+
+        Returns:
+            (평균값 배열, 사용된 데이터 일수 배열)
+        """
+        from .utils.outlier_handler import clean_sales_data, clean_sales_matrix, get_outlier_config
+
+        n_rows, n = sale.shape
+        sales = sale.astype(np.float64, copy=True)
+        if n == 0:
+            return np.zeros(n_rows), np.zeros(n_rows, dtype=np.int64)
+
+        # stock_qty<0 sentinel → 미수집(NaN)
+        stock = np.where(stock < 0, np.nan, stock)
+
+        # 품절일 imputation
+        stockout_cfg = PREDICTION_PARAMS.get("stockout_filter", {})
+        if stockout_cfg.get("enabled", False):
+            fresh_food_mids = set(
+                PREDICTION_PARAMS.get("category_floor", {}).get(
+                    "target_mid_cds", ["001", "002", "003", "004", "005"]
+                )
+            )
+            include_none = np.array([mid in fresh_food_mids for mid in mid_cds], dtype=bool)
+            known = ~np.isnan(stock)
+            available = known & (np.nan_to_num(stock, nan=0.0) > 0)
+            stockout = (known & (np.nan_to_num(stock, nan=-1.0) == 0)) | (
+                ~known & include_none[:, None]
+            )
+            has_available = available.any(axis=1)
+            has_stockout = stockout.any(axis=1)
+
+            # 비품절일 평균으로 품절일 대체
+            imputed = has_available & has_stockout
+            avg_available = np.where(available, sales, 0.0).sum(axis=1) / np.maximum(
+                available.sum(axis=1), 1
+            )
+            sales = np.where(imputed[:, None] & stockout, avg_available[:, None], sales)
+
+            # 윈도우 전체 품절: 품절일 판매 흔적 평균으로 0일만 대체
+            signal = stockout & (sales > 0)
+            chronic = has_stockout & ~has_available & signal.any(axis=1)
+            avg_signal = np.where(signal, sales, 0.0).sum(axis=1) / np.maximum(
+                signal.sum(axis=1), 1
+            )
+            sales = np.where(
+                chronic[:, None] & stockout & (sales == 0), avg_signal[:, None], sales
+            )
+
+        # 이상치 처리 (카테고리별 IQR 배수, 최소 5일)
+        if n >= 5:
+            configs = [get_outlier_config(mid or "") for mid in mid_cds]
+            vector_rows = [
+                k for k, cfg in enumerate(configs)
+                if cfg["method"] == "iqr" and cfg["strategy"] == "cap"
+            ]
+            cleaned = sales.copy()
+            if vector_rows:
+                multipliers = np.array(
+                    [configs[k].get("multiplier", 1.5) for k in vector_rows], dtype=np.float64
+                )
+                cleaned[vector_rows] = clean_sales_matrix(sales[vector_rows], multipliers)
+            # iqr+cap 외 설정은 기존 스칼라 정제
+            for k in sorted(set(range(n_rows)) - set(vector_rows)):
+                cleaned[k] = clean_sales_data(
+                    sales[k].tolist(), mid_cd=mid_cds[k], handle_zeros=True
+                ).cleaned_data
+            sales = cleaned
+
+        # 날짜별 가중치: 최근 3일 + 4~7일 균등 분할
+        weights = PREDICTION_PARAMS["weights"]
+        base_weights = np.array(
+            [weights["day_1"], weights["day_2"], weights["day_3"]][:n]
+            + [weights["day_4_7"] / max(n - 3, 1)] * max(n - 3, 0),
+            dtype=np.float64,
+        )
+        col_weights = np.broadcast_to(base_weights, (n_rows, n))
+
+        # 연휴일 가중치 감소 (날짜 공통 → 1회 조회)
+        holiday_wma_cfg = PREDICTION_PARAMS.get("holiday_wma_correction", {})
+        if holiday_wma_cfg.get("enabled", False) and self._holiday_context_fn:
+            holiday_weight_factor = holiday_wma_cfg.get("holiday_weight_factor", 0.3)
+            holiday_cols = np.zeros(n, dtype=bool)
+            for j, d in enumerate(dates):
+                try:
+                    holiday_cols[j] = bool(self._holiday_context_fn(d).get("in_period", False))
+                except Exception:
+                    pass
+            col_weights = col_weights * np.where(holiday_cols, holiday_weight_factor, 1.0)
+
+        # 행사일 가중치 감소 (행사 기간 있는 상품만 마스크)
+        promo_wma_cfg = PREDICTION_PARAMS.get("promo_wma_correction", {})
+        if promo_wma_cfg.get("enabled", True):
+            promo_weight_factor = promo_wma_cfg.get("promo_weight_factor", 0.25)
+            promo_mask = np.zeros((n_rows, n), dtype=bool)
+            for k, item_cd in enumerate(item_codes):
+                try:
+                    promo_dates = self._data.get_promo_dates_in_range(item_cd, dates)
+                except Exception:
+                    continue
+                if promo_dates:
+                    promo_mask[k] = [d in promo_dates for d in dates]
+            if promo_mask.any():
+                col_weights = col_weights * np.where(promo_mask, promo_weight_factor, 1.0)
+
+        # 열 순서대로 누적 (스칼라 루프와 같은 합산 순서)
+        weighted_sum = np.zeros(n_rows)
+        total_weight = np.zeros(n_rows)
+        for j in range(n):
+            weighted_sum = weighted_sum + sales[:, j] * col_weights[:, j]
+            total_weight = total_weight + col_weights[:, j]
+
+        positive = total_weight > 0
+        averages = np.where(positive, weighted_sum / np.where(positive, total_weight, 1.0), 0.0)
+        days = np.where(positive, n, 0)
+        return averages, days
+
     # =========================================================================
     # 판매일 비율 계산
     # =========================================================================
@@ -485,6 +686,12 @@ class BasePredictor:
         Returns:
             가용일 중 판매일 비율 (0.0 ~ 1.0). 가용일=0이면 1.0 반환
         """
+        matrix = self._batch_matrix()
+        if matrix is not None:
+            cached = matrix.available_sell_ratio(item_cd, PREDICTION_PARAMS["moving_avg_days"])
+            if cached is not None:
+                return cached
+
         conn = self._get_connection()
         cursor = conn.cursor()
         try:
@@ -4,7 +4,9 @@
 주 1회 실행 (Phase 1.57, 일요일 23:00):
 1. 최근 7일 eval_outcomes + daily_sales 성과 지표 수집
 2. 현재 파라미터 -> 탐색 공간 구성 (ParamSpec 기반)
-3. GP/TPE surrogate 기반 목적함수 최소화 (30 trials)
+3. GP/TPE surrogate 기반 목적함수 최소화
+   - 리플레이 가능: 최근 N일 실데이터 재현 목적함수 (ReplaySimulator, 80 trials, 병렬 평가)
+   - 불가(데이터 부족 등): 감도 행렬 선형 추정 (30 trials)
 4. damping 적용 후 eval_params.json + food_waste_calibration 반영
 5. DB에 최적화 이력 저장
 6. 적용 후 3일 모니터링 -> 성과 하락 시 자동 롤백
@@ -34,6 +36,13 @@ ROLLBACK_MONITOR_DAYS = 3       # 롤백 모니터링 기간
 ROLLBACK_THRESHOLD = 0.10       # 성과 하락 10% 이상이면 롤백
 EVAL_LOOKBACK_DAYS = 7          # 목적함수 평가 기간
 
+# 리플레이 목적함수 (bayesian-replay)
+REPLAY_ENABLED = True
+REPLAY_LOOKBACK_DAYS = 14       # 재현 기간 (eval_outcomes 검증 완료분)
+REPLAY_N_TRIALS = 80            # 리플레이 시 GP 시행 횟수
+REPLAY_WORKERS = 4              # 병렬 평가 프로세스 수 (1이면 순차)
+TARGET_FOOD_WASTE_RATE = 0.18   # 폐기율 목표 (가중평균)
+
 # 목적함수 가중치 (기본값)
 DEFAULT_OBJECTIVE_WEIGHTS = {
     "accuracy_error": 0.35,     # alpha: 예측 정확도 (1 - accuracy@1)
@@ -91,6 +100,9 @@ class BayesianParameterOptimizer:
         self._skopt = None
         self._optuna = None
 
+        # 리플레이 시뮬레이터 (optimize 실행 중에만 설정)
+        self._simulator = None
+
     # --- Repository Lazy Loading ---
 
     @property
@@ -175,9 +187,11 @@ class BayesianParameterOptimizer:
                 success=False, error_message="Insufficient data for optimization"
             )
 
-        # 3) 탐색 공간 구성
+        # 3) 탐색 공간 구성 (리플레이 가능하면 리플레이가 읽는 파라미터만)
+        self._simulator = self._build_replay_simulator()
         search_space, param_names = self._build_search_space()
         if not search_space:
+            self._simulator = None
             return OptimizationResult(
                 success=False, error_message="No unlocked parameters"
             )
@@ -185,15 +199,23 @@ class BayesianParameterOptimizer:
         # 4) 현재 파라미터 스냅샷
         params_before = self._snapshot_params(param_names)
 
-        # 5) 최적화 실행
-        if algo == "skopt":
-            best_params, best_obj, best_trial = self._optimize_skopt(
-                search_space, param_names, metrics_before
-            )
-        else:
-            best_params, best_obj, best_trial = self._optimize_optuna(
-                search_space, param_names, metrics_before
-            )
+        # 5) 최적화 실행 (리플레이 가능하면 실데이터 재현 목적함수)
+        n_trials = REPLAY_N_TRIALS if self._simulator is not None else N_TRIALS
+        try:
+            if self._simulator is not None:
+                self._simulator.start_pool(REPLAY_WORKERS)
+            if algo == "skopt":
+                best_params, best_obj, best_trial = self._optimize_skopt(
+                    search_space, param_names, metrics_before, n_trials
+                )
+            else:
+                best_params, best_obj, best_trial = self._optimize_optuna(
+                    search_space, param_names, metrics_before, n_trials
+                )
+        finally:
+            if self._simulator is not None:
+                self._simulator.close()
+                self._simulator = None
 
         # 6) damping 적용
         damped_params = self._apply_with_damping(param_names, best_params)
@@ -223,7 +245,7 @@ class BayesianParameterOptimizer:
             params_after=json.dumps(params_after),
             params_delta=json.dumps(params_delta),
             algorithm=algo,
-            n_trials=N_TRIALS,
+            n_trials=n_trials,
             best_trial=best_trial,
             eval_period_start=eval_start,
             eval_period_end=eval_end,
@@ -241,7 +263,7 @@ class BayesianParameterOptimizer:
             params_before=params_before,
             params_after=params_after,
             params_delta=params_delta,
-            n_trials=N_TRIALS,
+            n_trials=n_trials,
             best_trial=best_trial,
             metrics_before=metrics_before,
             eval_period_start=eval_start,
@@ -336,12 +358,19 @@ class BayesianParameterOptimizer:
 
         locked=True인 파라미터는 제외한다.
         weight_trend는 유도 파라미터이므로 제외 (1.0 - sum of others).
+        리플레이 목적함수 사용 시 리플레이가 읽지 않는 파라미터
+        (target_accuracy, calibration_*)는 목적함수에 영향이 없으므로 제외하여
+        현재값을 유지한다.
 
         Returns:
             (dimensions_list, param_names_list)
         """
         dimensions = []
         param_names = []
+        replay_params = None
+        if self._simulator is not None:
+            from src.prediction.replay_simulator import REPLAY_EVAL_PARAMS
+            replay_params = REPLAY_EVAL_PARAMS
 
         # A. eval_params (EvalConfig)
         for name in self.config._param_names():
@@ -355,6 +384,9 @@ class BayesianParameterOptimizer:
             if name == "weight_trend":
                 continue
 
+            if replay_params is not None and name not in replay_params:
+                continue
+
             dim = self._spec_to_dimension(name, spec)
             if dim is not None:
                 dimensions.append(dim)
@@ -442,11 +474,10 @@ class BayesianParameterOptimizer:
 
         # 2) 폐기율 계산 (FOOD 카테고리 전체)
         waste_rate = self._calculate_food_waste_rate(start_date, end_date)
-        target_waste = 0.18  # 가중평균 목표
 
         return {
             "accuracy_error": 1.0 - accuracy_rate,
-            "waste_rate_error": max(0, waste_rate - target_waste),
+            "waste_rate_error": max(0, waste_rate - TARGET_FOOD_WASTE_RATE),
             "stockout_rate": stockout_rate,
             "over_order_ratio": over_order_ratio,
             "sample_count": total_verified,
@@ -516,18 +547,69 @@ class BayesianParameterOptimizer:
     ) -> float:
         """GP surrogate가 호출하는 목적함수
 
-        실제 예측 파이프라인을 실행하지 않고, 히스토리 기반으로 추정한다:
-        - 파라미터 변화량에 따른 지표 변화를 선형 근사
-        - 감도(sensitivity) 행렬 사용
+        리플레이 시뮬레이터가 있으면 최근 N일 데이터를 후보 파라미터로 재현한
+        실제 성과 지표를 사용한다. 없으면 감도 행렬 선형 근사로 추정한다.
 
         Returns:
             목적함수 값 (낮을수록 좋음)
         """
+        if self._simulator is not None:
+            return self._calculate_objective(
+                self._simulator.evaluate(dict(zip(param_names, param_values)))
+            )
         estimated_metrics = self._estimate_metrics(
             param_values, param_names, baseline_metrics
         )
         return self._calculate_objective(estimated_metrics)
 
+    def _objective_many(
+        self,
+        param_values_list: List[List[float]],
+        param_names: List[str],
+        baseline_metrics: Dict[str, float],
+    ) -> List[float]:
+        """후보 여러 개 평가 (리플레이 프로세스 풀 병렬)"""
+        if self._simulator is None:
+            return [
+                self._objective(values, param_names, baseline_metrics)
+                for values in param_values_list
+            ]
+        metrics_list = self._simulator.evaluate_many(
+            [dict(zip(param_names, values)) for values in param_values_list]
+        )
+        return [self._calculate_objective(m) for m in metrics_list]
+
+    def _build_replay_simulator(self):
+        """최근 REPLAY_LOOKBACK_DAYS일 리플레이 시뮬레이터 생성
+
+        Returns:
+            ReplaySimulator 또는 None (비활성/로드 실패/데이터 부족 → 감도 추정 사용)
+        """
+        if not REPLAY_ENABLED:
+            return None
+        try:
+            from src.prediction.replay_simulator import ReplayDataset, ReplaySimulator
+
+            conn = self.sales_repo._get_conn()
+            try:
+                dataset = ReplayDataset.load(
+                    conn, self.store_id, REPLAY_LOOKBACK_DAYS,
+                    history_days=int(max(31, self.config.daily_avg_days.max_val + 1)),
+                )
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning(f"[Bayesian] 리플레이 데이터 로드 실패 -> 감도 추정 사용: {e}")
+            return None
+
+        if len(dataset) < MIN_EVAL_DAYS * 5:
+            logger.info(f"[Bayesian] 리플레이 데이터 부족({len(dataset)}건) -> 감도 추정 사용")
+            return None
+        logger.info(
+            f"[Bayesian] 리플레이 목적함수: {len(dataset)}건 / {REPLAY_LOOKBACK_DAYS}일"
+        )
+        return ReplaySimulator(dataset, self.config)
+
     def _estimate_metrics(
         self,
         param_values: List[float],
@@ -596,12 +678,21 @@ class BayesianParameterOptimizer:
         dimensions: List,
         param_names: List[str],
         baseline_metrics: Dict[str, float],
+        n_trials: int = N_TRIALS,
     ) -> Tuple[List[float], float, int]:
         """scikit-optimize GP 기반 최적화
 
+        리플레이 병렬 평가가 가능하면 ask(n_points) → 프로세스 풀 평가 → tell로
+        워커 수만큼 후보를 한 번에 평가한다.
+
         Returns:
             (best_param_values, best_objective, best_trial_index)
         """
+        if self._simulator is not None and self._simulator.workers > 1:
+            return self._optimize_skopt_batched(
+                dimensions, param_names, baseline_metrics, n_trials
+            )
+
         from skopt import gp_minimize
 
         def objective_fn(params):
@@ -614,7 +705,7 @@ class BayesianParameterOptimizer:
             func=objective_fn,
             dimensions=dimensions,
             x0=x0,
-            n_calls=N_TRIALS,
+            n_calls=n_trials,
             n_random_starts=5,
             random_state=42,
             verbose=False,
@@ -628,14 +719,61 @@ class BayesianParameterOptimizer:
 
         return list(result.x), result.fun, best_idx
 
+    def _optimize_skopt_batched(
+        self,
+        dimensions: List,
+        param_names: List[str],
+        baseline_metrics: Dict[str, float],
+        n_trials: int,
+    ) -> Tuple[List[float], float, int]:
+        """scikit-optimize ask/tell 배치 최적화 (리플레이 병렬 평가)
+
+        Returns:
+            (best_param_values, best_objective, best_trial_index)
+        """
+        from skopt import Optimizer
+
+        optimizer = Optimizer(
+            dimensions, base_estimator="GP", n_initial_points=5, random_state=42
+        )
+        # 현재값을 첫 시행으로 사용 (warm start)
+        xs = [[self._get_current_param_value(n) for n in param_names]]
+        ys = self._objective_many(xs, param_names, baseline_metrics)
+        optimizer.tell(xs, ys)
+        while len(xs) < n_trials:
+            batch = optimizer.ask(
+                n_points=min(self._simulator.workers, n_trials - len(xs))
+            )
+            batch_ys = self._objective_many(batch, param_names, baseline_metrics)
+            optimizer.tell(batch, batch_ys)
+            xs.extend(batch)
+            ys.extend(batch_ys)
+
+        best_idx = min(range(len(ys)), key=ys.__getitem__)
+        return list(xs[best_idx]), ys[best_idx], best_idx + 1
+
+    @staticmethod
+    def _suggest_params(trial, search_space: List) -> List[float]:
+        """optuna trial → 파라미터 값 리스트"""
+        params = []
+        for name, low, high in search_space:
+            if isinstance(low, int) and isinstance(high, int):
+                params.append(trial.suggest_int(name, low, high))
+            else:
+                params.append(trial.suggest_float(name, low, high))
+        return params
+
     def _optimize_optuna(
         self,
         search_space: List,
         param_names: List[str],
         baseline_metrics: Dict[str, float],
+        n_trials: int = N_TRIALS,
     ) -> Tuple[List[float], float, int]:
         """optuna TPE 기반 최적화 (폴백)
 
+        리플레이 병렬 평가가 가능하면 ask/tell로 워커 수만큼 묶어 평가한다.
+
         Returns:
             (best_param_values, best_objective, best_trial_number)
         """
@@ -643,17 +781,26 @@ class BayesianParameterOptimizer:
 
         optuna.logging.set_verbosity(optuna.logging.WARNING)
 
-        def objective_fn(trial):
-            params = []
-            for name, low, high in search_space:
-                if isinstance(low, int) and isinstance(high, int):
-                    params.append(trial.suggest_int(name, low, high))
-                else:
-                    params.append(trial.suggest_float(name, low, high))
-            return self._objective(params, param_names, baseline_metrics)
-
         study = optuna.create_study(direction="minimize")
-        study.optimize(objective_fn, n_trials=N_TRIALS, show_progress_bar=False)
+        if self._simulator is not None and self._simulator.workers > 1:
+            done = 0
+            while done < n_trials:
+                trials = [
+                    study.ask()
+                    for _ in range(min(self._simulator.workers, n_trials - done))
+                ]
+                values = [self._suggest_params(t, search_space) for t in trials]
+                for trial, y in zip(
+                    trials, self._objective_many(values, param_names, baseline_metrics)
+                ):
+                    study.tell(trial, y)
+                done += len(trials)
+        else:
+            def objective_fn(trial):
+                params = self._suggest_params(trial, search_space)
+                return self._objective(params, param_names, baseline_metrics)
+
+            study.optimize(objective_fn, n_trials=n_trials, show_progress_bar=False)
 
         best = study.best_trial
         best_params = [best.params[n] for n, _, _ in search_space]
@@ -17,6 +17,7 @@ from typing import Optional, Tuple
 
 from src.utils.logger import get_logger
 from src.prediction.categories._db import get_conn
+from src.prediction.product_attributes import lookup_expiration_days
 
 logger = get_logger(__name__)
 
@@ -146,6 +147,13 @@ def _get_dessert_expiration_days(item_cd: str, db_path: Optional[str] = None) ->
     Returns:
         (유통기한_일수, 데이터소스)
     """
+    # predict_batch 속성 스토어 (product-attribute-store, db_path 지정 시 DB 직접 조회)
+    cached = lookup_expiration_days(item_cd) if db_path is None else None
+    if cached is not None:
+        if cached[0] is not None:
+            return cached
+        return DESSERT_EXPIRY_SAFETY_CONFIG["fallback_expiry_days"], "fallback"
+
     try:
         conn = get_conn(db_path=db_path)  # product_details → common DB
         try:
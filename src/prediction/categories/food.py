@@ -17,6 +17,7 @@ from typing import Any, Optional, Tuple, Dict
 
 from src.utils.logger import get_logger
 from src.prediction.categories._db import get_conn
+from src.prediction.product_attributes import lookup_expiration_days
 from src.settings.constants import (
     DISUSE_COEF_FLOOR, DISUSE_COEF_MULTIPLIER,
     DISUSE_MIN_BATCH_COUNT, DISUSE_IB_LOOKBACK_DAYS,
@@ -387,6 +388,15 @@ def get_food_expiration_days(item_cd: str, mid_cd: str, db_path: Optional[str] =
     Returns:
         (유통기한_일수, 데이터소스)
     """
+    # 0. predict_batch 속성 스토어 (product-attribute-store)
+    #    product_details가 common.db 고정이므로 db_path와 무관하게 사용
+    cached = lookup_expiration_days(item_cd)
+    if cached is not None:
+        if cached[0] is not None:
+            return cached
+        fallback_days = FOOD_EXPIRY_FALLBACK.get(mid_cd, FOOD_EXPIRY_FALLBACK['default'])
+        return fallback_days, "fallback"
+
     # product_details는 common.db에만 존재 → 항상 common DB 사용
     try:
         from src.infrastructure.database.connection import DBRouter
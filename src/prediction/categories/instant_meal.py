@@ -16,6 +16,7 @@ from typing import Optional, Tuple
 
 from src.utils.logger import get_logger
 from src.prediction.categories._db import get_conn
+from src.prediction.product_attributes import lookup_expiration_days
 
 logger = get_logger(__name__)
 
@@ -244,6 +245,13 @@ def _get_expiration_days(item_cd: str, db_path: str = None) -> Tuple[Optional[in
     Returns:
         (유통기한_일수, 데이터소스) - 정보 없으면 (None, 'fallback')
     """
+    # predict_batch 속성 스토어 (product-attribute-store, db_path 지정 시 DB 직접 조회)
+    cached = lookup_expiration_days(item_cd) if db_path is None else None
+    if cached is not None:
+        if cached[0] is not None:
+            return cached
+        return None, "fallback"
+
     try:
         conn = get_conn(db_path=db_path)  # product_details → common DB
         cursor = conn.cursor()
@@ -18,6 +18,7 @@ from typing import Optional, Tuple, List
 
 from src.utils.logger import get_logger
 from src.prediction.categories._db import get_conn
+from src.prediction.product_attributes import lookup_expiration_days
 
 logger = get_logger(__name__)
 
@@ -276,6 +277,14 @@ def _get_expiration_days(item_cd: str, mid_cd: str, db_path: str = None) -> Tupl
     Returns:
         (유통기한_일수, 데이터소스) 튜플. 데이터소스는 'db' 또는 'fallback'
     """
+    # 0. predict_batch 속성 스토어 (product-attribute-store, db_path 지정 시 DB 직접 조회)
+    cached = lookup_expiration_days(item_cd) if db_path is None else None
+    if cached is not None:
+        if cached[0] is not None:
+            return cached
+        fallback_days = PERISHABLE_EXPIRY_FALLBACK.get(mid_cd, PERISHABLE_EXPIRY_FALLBACK["default"])
+        return fallback_days, "fallback"
+
     # 1. DB에서 조회 (product_details.expiration_days — common DB)
     try:
         conn = get_conn(db_path=db_path)
@@ -6,10 +6,15 @@ TSB(Teunter-Syntetos-Babai) 변형:
 - 구식 상품의 확률 자연 감쇄 (0판매 기간이 길수록 prob → 0)
 
 사용 대상: DemandPattern.INTERMITTENT (sell_day_ratio 15~39%)
+
+predict_batch(): 여러 상품 이력을 (상품 × 일) 행렬로 묶어 일 단위 1패스로
+동일한 TSB 점화식을 계산 (predict() 와 결과 동일, croston-grid).
 """
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 from src.utils.logger import get_logger
 
@@ -116,6 +121,85 @@ class CrostonPredictor:
             method="tsb"
         )
 
+    def predict_batch(
+        self,
+        histories: Sequence[List[int]],
+        alphas: Optional[Union[float, Sequence[float]]] = None,
+        betas: Optional[Union[float, Sequence[float]]] = None,
+    ) -> List[CrostonResult]:
+        """여러 상품 일괄 예측 (벡터화)
+
+        Args:
+            histories: 상품별 일별 판매량 리스트 (오래된것→최신 순, 길이 무관)
+            alphas: 상품별 alpha (None 이면 self.alpha)
+            betas: 상품별 beta (None 이면 self.beta)
+
+        Returns:
+            histories 순서의 CrostonResult 리스트 (predict() 와 동일 값)
+        """
+        n = len(histories)
+        if n == 0:
+            return []
+        alpha = np.broadcast_to(
+            np.asarray(self.alpha if alphas is None else alphas, dtype=float), (n,)
+        )
+        beta = np.broadcast_to(
+            np.asarray(self.beta if betas is None else betas, dtype=float), (n,)
+        )
+
+        results: List[Optional[CrostonResult]] = [None] * n
+        rows = []
+        for i, history in enumerate(histories):
+            points = sum(1 for v in history if v > 0)
+            if points < MIN_HISTORY_POINTS:
+                # 빈 이력/fallback 은 단건 경로 (합계/평균만 계산)
+                results[i] = CrostonPredictor(float(alpha[i]), float(beta[i])).predict(history)
+            else:
+                rows.append(i)
+        if not rows:
+            return results
+
+        lengths = np.array([len(histories[i]) for i in rows])
+        matrix = np.zeros((len(rows), lengths.max()))
+        for r, i in enumerate(rows):
+            matrix[r, :lengths[r]] = histories[i]
+        a = alpha[rows]
+        b = beta[rows]
+
+        positive = matrix > 0
+        n_points = positive.sum(axis=1)
+        first = positive.argmax(axis=1)
+        last = matrix.shape[1] - 1 - positive[:, ::-1].argmax(axis=1)
+        second = np.where(
+            positive & (np.arange(matrix.shape[1]) > first[:, None]), 1, 0
+        ).argmax(axis=1)
+
+        # TSB 초기값 (첫 판매량, 첫 두 판매 간격의 역수)
+        z = matrix[np.arange(len(rows)), first].copy()
+        prob = 1.0 / np.maximum(second - first, 1)
+
+        for t in range(matrix.shape[1]):
+            # 첫 판매 이후 판매일: 크기/확률 스무딩
+            sold = positive[:, t] & (t > first)
+            z = np.where(sold, a * matrix[:, t] + (1 - a) * z, z)
+            prob = np.where(sold, b * 1.0 + (1 - b) * prob, prob)
+            # 마지막 판매 이후 0판매 기간: 확률 감쇄
+            prob = np.where((t > last) & (t < lengths), (1 - b) * prob, prob)
+
+        for r, i in enumerate(rows):
+            zi = float(z[r])
+            pi = float(prob[r])
+            forecast = max(zi * pi, FORECAST_FLOOR)
+            intervals = (int(last[r]) - int(first[r])) / (int(n_points[r]) - 1)
+            results[i] = CrostonResult(
+                forecast=round(forecast, 3),
+                demand_size=round(zi, 3),
+                demand_probability=round(min(pi, 1.0), 4),
+                intervals_estimate=round(intervals, 1),
+                method="tsb"
+            )
+        return results
+
     def predict_with_safety(self, history: List[int], order_interval: int = 2) -> Tuple[float, float]:
         """예측값 + 안전재고 반환
 
@@ -127,7 +211,11 @@ class CrostonPredictor:
             (daily_forecast, safety_stock)
         """
         result = self.predict(history)
+        return result.forecast, self.safety_stock(result, order_interval)
 
+    @staticmethod
+    def safety_stock(result: CrostonResult, order_interval: int = 2) -> float:
+        """예측 결과 기반 안전재고 (수요 크기 50% 와 발주 간격 수요 30% 중 큰 값)"""
         if result.demand_probability > 0:
             safety_stock = result.demand_size * 0.5
         else:
@@ -136,4 +224,4 @@ class CrostonPredictor:
         period_demand = result.forecast * order_interval
         safety_stock = max(safety_stock, period_demand * 0.3)
 
-        return result.forecast, round(safety_stock, 2)
+        return round(safety_stock, 2)
@@ -13,9 +13,11 @@ from typing import Optional, Dict, List, Tuple
 
 from src.utils.logger import get_logger
 from src.infrastructure.database.repos import RealtimeInventoryRepository
+from src.infrastructure.database.repos.item_sales_stats_repo import load_item_sales_stats
 from src.settings.constants import DEFAULT_STORE_ID
 
 from .categories import FOOD_ANALYSIS_DAYS
+from .sales_matrix import SalesMatrix, SALES_MATRIX_DAYS
 
 logger = get_logger(__name__)
 
@@ -61,6 +63,8 @@ class PredictionDataProvider:
         self._stock_cache: Dict[str, int] = {}    # 실시간 재고 캐시 (BGF 시스템에서 조회)
         self._promo_cache: Optional[Dict[str, list]] = None  # 행사 기간 캐시
         self._persistent_conn = None
+        self._sales_matrix: Optional[SalesMatrix] = None  # predict_batch 판매 매트릭스
+        self._product_cache: Optional[Dict[str, Optional[Dict[str, object]]]] = None  # 상품 정보 배치 캐시
 
     def _get_connection(self, timeout: int = 30) -> sqlite3.Connection:
         if self._persistent_conn is not None:
@@ -86,6 +90,49 @@ class PredictionDataProvider:
                 pass
             self._persistent_conn = None
 
+    # ------------------------------------------------------------------
+    # predict_batch 배치 캐시 (columnar-predict-batch)
+    # ------------------------------------------------------------------
+
+    def load_batch_caches(self, item_codes: List[str], days: int = SALES_MATRIX_DAYS) -> None:
+        """후보 SKU 전체의 판매 매트릭스 + 상품 정보를 일괄 로드
+
+        로드 이후 get_sales_history / _get_data_span_days / get_product_info는
+        SKU별 쿼리 대신 캐시를 사용한다. 실패 시 기존 개별 쿼리로 동작한다.
+        """
+        conn = self._get_connection()
+        try:
+            try:
+                self._sales_matrix = SalesMatrix.load(conn, self.store_id, item_codes, days)
+            except Exception as e:
+                logger.warning(f"판매 매트릭스 로드 실패 (개별 쿼리 폴백): {e}")
+                self._sales_matrix = None
+            try:
+                self._product_cache = self._load_product_info_batch(conn, item_codes)
+            except Exception as e:
+                logger.warning(f"상품 정보 배치 로드 실패 (개별 쿼리 폴백): {e}")
+                self._product_cache = None
+        finally:
+            conn.close()
+
+    def clear_batch_caches(self) -> None:
+        """predict_batch 종료 시 배치 캐시 해제"""
+        self._sales_matrix = None
+        self._product_cache = None
+
+    def batch_cache_state(self) -> tuple:
+        """현재 배치 캐시 (판매 매트릭스, 상품 정보) — warm 캐시 보관용"""
+        return self._sales_matrix, self._product_cache
+
+    def restore_batch_caches(self, state: tuple) -> None:
+        """batch_cache_state()로 보관한 배치 캐시 복원 (warm-prediction-daemon)"""
+        self._sales_matrix, self._product_cache = state
+
+    @property
+    def sales_matrix(self) -> Optional[SalesMatrix]:
+        """현재 로드된 판매 매트릭스 (없으면 None)"""
+        return self._sales_matrix
+
     def get_sales_history(
         self,
         item_cd: str,
@@ -107,6 +154,11 @@ class PredictionDataProvider:
         Returns:
             [(날짜, 판매량, 재고량|None), ...] 리스트 (최신 순)
         """
+        if self._sales_matrix is not None:
+            cached = self._sales_matrix.sales_history(item_cd, days)
+            if cached is not None:
+                return cached
+
         conn = self._get_connection()
         try:
             cursor = conn.cursor()
@@ -146,8 +198,18 @@ class PredictionDataProvider:
         Returns:
             달력일 수 (데이터 없으면 0)
         """
+        if self._sales_matrix is not None:
+            cached = self._sales_matrix.data_span_days(item_cd)
+            if cached is not None:
+                return cached
+
         conn = self._get_connection()
         try:
+            # 집계 테이블 1행 조회 (item-sales-stats), 없으면 daily_sales 스캔
+            item_stats = load_item_sales_stats(conn, [item_cd], self.store_id).get(item_cd)
+            if item_stats is not None:
+                return item_stats.data_span_days
+
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT CAST(
@@ -164,6 +226,48 @@ class PredictionDataProvider:
         finally:
             conn.close()
 
+    _PRODUCT_INFO_SQL = """
+        SELECT
+            p.item_cd,
+            p.item_nm,
+            p.mid_cd,
+            pd.expiration_days,
+            pd.order_unit_qty,
+            pd.sell_price,
+            pd.margin_rate,
+            pd.lead_time_days,
+            pd.orderable_day,
+            pd.large_cd
+        FROM products p
+        LEFT JOIN product_details pd ON p.item_cd = pd.item_cd
+    """
+
+    @staticmethod
+    def _product_row_to_dict(row) -> Dict[str, object]:
+        return {
+            "item_cd": row[0],
+            "item_nm": row[1],
+            "mid_cd": row[2],
+            "expiration_days": row[3] if row[3] is not None else 365,  # 없으면 1년으로
+            "order_unit_qty": row[4] if row[4] not in (None, 0) else 1,
+            "sell_price": row[5],
+            "margin_rate": row[6],
+            "lead_time_days": row[7] if row[7] is not None and row[7] > 0 else 1,
+            "orderable_day": row[8] if row[8] else "일월화수목금토",
+            "large_cd": row[9],
+        }
+
+    def _load_product_info_batch(
+        self, conn: sqlite3.Connection, item_codes: List[str]
+    ) -> Dict[str, Optional[Dict[str, object]]]:
+        """대상 SKU 상품 정보 일괄 조회 (미등록 상품은 None으로 캐시)"""
+        wanted = set(item_codes)
+        cache: Dict[str, Optional[Dict[str, object]]] = {cd: None for cd in wanted}
+        for row in conn.execute(self._PRODUCT_INFO_SQL).fetchall():
+            if row[0] in wanted and cache[row[0]] is None:
+                cache[row[0]] = self._product_row_to_dict(row)
+        return cache
+
     def get_product_info(self, item_cd: str) -> Optional[Dict[str, object]]:
         """상품 정보 조회
 
@@ -173,42 +277,17 @@ class PredictionDataProvider:
         Returns:
             상품 정보 딕셔너리 또는 None
         """
+        if self._product_cache is not None and item_cd in self._product_cache:
+            cached = self._product_cache[item_cd]
+            return dict(cached) if cached is not None else None
+
         conn = self._get_connection()
         try:
             cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT
-                    p.item_cd,
-                    p.item_nm,
-                    p.mid_cd,
-                    pd.expiration_days,
-                    pd.order_unit_qty,
-                    pd.sell_price,
-                    pd.margin_rate,
-                    pd.lead_time_days,
-                    pd.orderable_day,
-                    pd.large_cd
-                FROM products p
-                LEFT JOIN product_details pd ON p.item_cd = pd.item_cd
-                WHERE p.item_cd = ?
-            """, (item_cd,))
-
+            cursor.execute(self._PRODUCT_INFO_SQL + " WHERE p.item_cd = ?", (item_cd,))
             row = cursor.fetchone()
-
             if row:
-                return {
-                    "item_cd": row[0],
-                    "item_nm": row[1],
-                    "mid_cd": row[2],
-                    "expiration_days": row[3] if row[3] is not None else 365,  # 없으면 1년으로
-                    "order_unit_qty": row[4] if row[4] not in (None, 0) else 1,
-                    "sell_price": row[5],
-                    "margin_rate": row[6],
-                    "lead_time_days": row[7] if row[7] is not None and row[7] > 0 else 1,
-                    "orderable_day": row[8] if row[8] else "일월화수목금토",
-                    "large_cd": row[9],
-                }
+                return self._product_row_to_dict(row)
             return None
         finally:
             conn.close()
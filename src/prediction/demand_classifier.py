@@ -247,8 +247,28 @@ class DemandClassifier:
         if not item_cds:
             return {}
         from src.infrastructure.database.connection import DBRouter
+        from src.infrastructure.database.repos.item_sales_stats_repo import load_item_sales_stats
         conn = DBRouter.get_store_connection(self.store_id)
         try:
+            # 집계 테이블 우선 (item-sales-stats), 윈도우를 덮지 못하는 상품만 스캔
+            results = {}
+            covered = set()
+            ref_date = conn.execute("SELECT date('now')").fetchone()[0]
+            for icd, item_stats in load_item_sales_stats(conn, item_cds, self.store_id).items():
+                if not item_stats.covers(ANALYSIS_WINDOW_DAYS, ref_date):
+                    continue
+                covered.add(icd)
+                window = item_stats.window(ANALYSIS_WINDOW_DAYS, ref_date)
+                if window.record_days:
+                    results[icd] = {
+                        "total_days": window.record_days,
+                        "available_days": window.available_days,
+                        "sell_days": window.available_sell_days,
+                    }
+            item_cds = [icd for icd in item_cds if icd not in covered]
+            if not item_cds:
+                return results
+
             cursor = conn.cursor()
             placeholders = ",".join(["?"] * len(item_cds))
             cursor.execute(f"""
@@ -263,7 +283,6 @@ class DemandClassifier:
                 GROUP BY item_cd
             """, (*item_cds,))
 
-            results = {}
             for row in cursor.fetchall():
                 results[row[0]] = {
                     "total_days": row[1] or 0,
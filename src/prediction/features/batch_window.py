@@ -0,0 +1,97 @@
+"""
+Feature 계산기 배치 윈도우 공용 함수
+
+Lag/Rolling calculate_batch가 후보 SKU 전체의 판매 윈도우와 행사 기간을
+쿼리 1회씩으로 읽어 items × days 배열로 다룰 때 사용한다.
+
+- 날짜 열은 'YYYY-MM-DD' 문자열 오름차순 → 문자열 비교(SQL BETWEEN)와 동일한
+  bisect로 행사 기간을 열 범위로 변환한다.
+
+feature-batch-window
+"""
+
+import sqlite3
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+def load_sales_window(
+    conn: sqlite3.Connection,
+    store_id: str,
+    index: Dict[str, int],
+    day_strs: List[str],
+    contiguous: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """daily_sales를 items × days 배열로 로드
+
+    Args:
+        conn: 매장 DB 커넥션
+        store_id: 점포 코드
+        index: {item_cd: 행 번호}
+        day_strs: 열 날짜 (오름차순 'YYYY-MM-DD')
+        contiguous: True면 day_strs가 연속 구간 → 범위 쿼리, False면 IN 쿼리
+
+    Returns:
+        (sale, present) — sale: float64 (레코드 없음 0, NULL NaN), present: bool
+    """
+    col = {ds: i for i, ds in enumerate(day_strs)}
+    if contiguous:
+        rows = conn.execute("""
+            SELECT item_cd, sales_date, sale_qty
+            FROM daily_sales
+            WHERE store_id = ? AND sales_date >= ? AND sales_date <= ?
+        """, (store_id, day_strs[0], day_strs[-1])).fetchall()
+    else:
+        placeholders = ",".join("?" * len(day_strs))
+        rows = conn.execute(f"""
+            SELECT item_cd, sales_date, sale_qty
+            FROM daily_sales
+            WHERE store_id = ? AND sales_date IN ({placeholders})
+        """, [store_id] + list(day_strs)).fetchall()
+
+    sale = np.zeros((len(index), len(day_strs)), dtype=np.float64)
+    present = np.zeros((len(index), len(day_strs)), dtype=bool)
+    for item_cd, sales_date, sale_qty in rows:
+        r = index.get(item_cd)
+        c = col.get(sales_date)
+        if r is None or c is None:
+            continue
+        sale[r, c] = np.nan if sale_qty is None else sale_qty
+        present[r, c] = True
+    return sale, present
+
+
+def load_promo_mask(
+    conn: sqlite3.Connection,
+    index: Dict[str, int],
+    day_strs: List[str],
+) -> Optional[np.ndarray]:
+    """활성 행사 기간 마스크 (items × days)
+
+    조건은 기존 SKU별 조회와 동일: promotions.is_active = 1 AND
+    start_date <= sales_date <= end_date (문자열 비교).
+
+    Returns:
+        bool 배열, promotions 조회 실패(테이블 미존재 등) 시 None
+    """
+    try:
+        rows = conn.execute("""
+            SELECT item_cd, start_date, end_date
+            FROM promotions
+            WHERE is_active = 1 AND end_date >= ?
+        """, (day_strs[0],)).fetchall()
+    except sqlite3.Error:
+        return None
+
+    mask = np.zeros((len(index), len(day_strs)), dtype=bool)
+    for item_cd, start, end in rows:
+        r = index.get(item_cd)
+        if r is None or start is None or end is None:
+            continue
+        lo = bisect_left(day_strs, start)
+        hi = bisect_right(day_strs, end)
+        if lo < hi:
+            mask[r, lo:hi] = True
+    return mask
@@ -417,6 +417,8 @@ class FeatureCalculator:
         """
         여러 상품의 Features 일괄 계산
 
+        Lag/Rolling 계산기의 배치 경로(쿼리 1회씩)로 미리 계산한 뒤 결합한다.
+
         Args:
             item_codes: 상품코드 리스트
             target_date: 예측 대상 날짜
@@ -425,11 +427,36 @@ class FeatureCalculator:
         Returns:
             {item_cd: FeatureResult} 딕셔너리
         """
-        result = {}
-        for item_cd in item_codes:
-            result[item_cd] = self.calculate(item_cd, target_date, base_safety_days)
+        if target_date is None:
+            target_date = datetime.now() + timedelta(days=1)
+        self.load_batch(item_codes, target_date)
+        try:
+            result = {}
+            for item_cd in item_codes:
+                result[item_cd] = self.calculate(item_cd, target_date, base_safety_days)
+        finally:
+            self.clear_batch()
         return result
 
+    def load_batch(
+        self,
+        item_codes: List[str],
+        target_date: Optional[datetime] = None
+    ) -> None:
+        """Lag/Rolling Features 일괄 로드 → 이후 calculate()의 SKU별 쿼리 대체
+
+        predict_batch가 후보 SKU 전체에 대해 1회 호출한다 (feature-batch-window).
+        """
+        if target_date is None:
+            target_date = datetime.now() + timedelta(days=1)
+        self.lag_calculator.load_batch(item_codes, target_date)
+        self.rolling_calculator.load_batch(item_codes, target_date)
+
+    def clear_batch(self) -> None:
+        """load_batch 결과 해제"""
+        self.lag_calculator.clear_batch()
+        self.rolling_calculator.clear_batch()
+
 
 # =============================================================================
 # 테스트/데모
@@ -15,6 +15,10 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Tuple
 from pathlib import Path
 
+import numpy as np
+
+from .batch_window import load_promo_mask, load_sales_window
+
 
 @dataclass
 class LagFeatures:
@@ -67,6 +71,9 @@ class LagFeatureCalculator:
         self.db_path = str(db_path)
         self.store_id = store_id
         self._persistent_conn = None
+        # predict_batch 배치 결과 (feature-batch-window)
+        self._batch_target: Optional[str] = None
+        self._batch_results: Dict[str, LagFeatures] = {}
 
     def _get_connection(self, timeout: int = 30) -> sqlite3.Connection:
         if self._persistent_conn is not None:
@@ -110,11 +117,17 @@ class LagFeatureCalculator:
         if target_date is None:
             target_date = datetime.now() + timedelta(days=1)
 
+        target_str = target_date.strftime("%Y-%m-%d")
+
+        # load_batch로 미리 계산된 결과 (기본 lag 구성만)
+        if lags is None and getattr(self, '_batch_target', None) == target_str:
+            cached = self._batch_results.get(item_cd)
+            if cached is not None:
+                return cached
+
         if lags is None:
             lags = self.DEFAULT_LAGS
 
-        target_str = target_date.strftime("%Y-%m-%d")
-
         # Lag 값 조회
         lag_values = self._get_lag_values(item_cd, target_date, lags)
 
@@ -124,6 +137,19 @@ class LagFeatureCalculator:
         # 전주 대비 변화율 계산
         wow_change = self._calculate_week_over_week_change(item_cd, target_date)
 
+        return self._build_features(
+            item_cd, target_str, lag_values, same_weekday_avg, wow_change
+        )
+
+    @staticmethod
+    def _build_features(
+        item_cd: str,
+        target_str: str,
+        lag_values: Dict[int, Optional[int]],
+        same_weekday_avg: Optional[float],
+        wow_change: Optional[float],
+    ) -> LagFeatures:
+        """lag 값/동요일 평균/전주 대비 → LagFeatures (데이터 품질 판정 포함)"""
         # 사용 가능한 lag 수 계산
         available_count = sum(1 for v in lag_values.values() if v is not None)
 
@@ -316,6 +342,11 @@ class LagFeatureCalculator:
         """
         여러 상품의 Lag Features 일괄 계산
 
+        필요한 날짜(lag 일자 + 동요일 4주)만 daily_sales 쿼리 1회,
+        행사 기간 쿼리 1회로 items × dates 배열을 만들어 열 슬라이싱으로 계산한다.
+        결과는 SKU별 calculate()와 동일하다.
+        store_id가 없으면(여러 매장 혼재 가능) SKU별로 계산한다.
+
         Args:
             item_codes: 상품코드 리스트
             target_date: 예측 대상 날짜
@@ -323,11 +354,96 @@ class LagFeatureCalculator:
         Returns:
             {item_cd: LagFeatures} 딕셔너리
         """
+        if target_date is None:
+            target_date = datetime.now() + timedelta(days=1)
+        codes = list(dict.fromkeys(item_codes))
+        if not self.store_id or not codes:
+            return {item_cd: self.calculate(item_cd, target_date) for item_cd in codes}
+
+        target_str = target_date.strftime("%Y-%m-%d")
+        lag_dates = {
+            lag: (target_date - timedelta(days=lag)).strftime("%Y-%m-%d")
+            for lag in self.DEFAULT_LAGS
+        }
+        weekday_dates = [
+            (target_date - timedelta(weeks=i)).strftime("%Y-%m-%d") for i in range(1, 5)
+        ]
+        day_strs = sorted(set(lag_dates.values()) | set(weekday_dates))
+        col = {ds: i for i, ds in enumerate(day_strs)}
+        index = {cd: i for i, cd in enumerate(codes)}
+
+        conn = self._get_connection()
+        try:
+            sale, present = load_sales_window(
+                conn, self.store_id, index, day_strs, contiguous=False
+            )
+            promo = load_promo_mask(conn, index, day_strs)
+        finally:
+            conn.close()
+        valid = present & ~np.isnan(sale)
+
+        # 동일 요일 평균: 행사 제외 → 없으면 전체(행사 포함) 폴백
+        wd_cols = [col[ds] for ds in weekday_dates]
+        wd_sale = sale[:, wd_cols]
+        wd_valid = valid[:, wd_cols]
+        all_cnt = wd_valid.sum(axis=1)
+        all_sum = np.where(wd_valid, wd_sale, 0.0).sum(axis=1)
+        if promo is not None:
+            np_valid = wd_valid & ~promo[:, wd_cols]
+            np_cnt = np_valid.sum(axis=1)
+            np_sum = np.where(np_valid, wd_sale, 0.0).sum(axis=1)
+        else:
+            np_cnt = np.zeros(len(codes), dtype=np.int64)
+            np_sum = np_cnt
+
+        c7 = col[weekday_dates[0]]
+        c14 = col[weekday_dates[1]]
         result = {}
-        for item_cd in item_codes:
-            result[item_cd] = self.calculate(item_cd, target_date)
+        for item_cd, r in index.items():
+            lag_values = {
+                lag: int(sale[r, col[ds]]) if valid[r, col[ds]] else None
+                for lag, ds in lag_dates.items()
+            }
+
+            if np_cnt[r] > 0:
+                same_weekday_avg = round(float(np_sum[r]) / int(np_cnt[r]), 2)
+            elif all_cnt[r] > 0:
+                same_weekday_avg = round(float(all_sum[r]) / int(all_cnt[r]), 2)
+            else:
+                same_weekday_avg = None
+
+            # 전주 대비 변화율 (지난주/2주 전 동일 요일 모두 있을 때)
+            wow_change = None
+            if valid[r, c7] and valid[r, c14]:
+                this_week_qty = int(sale[r, c7])
+                last_week_qty = int(sale[r, c14])
+                if last_week_qty == 0:
+                    wow_change = 1.0 if this_week_qty > 0 else 0.0
+                else:
+                    wow_change = round((this_week_qty - last_week_qty) / last_week_qty, 3)
+
+            result[item_cd] = self._build_features(
+                item_cd, target_str, lag_values, same_weekday_avg, wow_change
+            )
         return result
 
+    def load_batch(
+        self,
+        item_codes: List[str],
+        target_date: Optional[datetime] = None
+    ) -> None:
+        """calculate_batch 결과를 보관 → 이후 calculate()가 SKU별 쿼리 대신 사용"""
+        if target_date is None:
+            target_date = datetime.now() + timedelta(days=1)
+        self.clear_batch()
+        self._batch_results = self.calculate_batch(item_codes, target_date)
+        self._batch_target = target_date.strftime("%Y-%m-%d")
+
+    def clear_batch(self) -> None:
+        """predict_batch 종료 시 배치 결과 해제"""
+        self._batch_target = None
+        self._batch_results = {}
+
     def get_lag_series(
         self,
         item_cd: str,
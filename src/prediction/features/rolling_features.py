@@ -16,6 +16,10 @@ from dataclasses import dataclass, field
 from typing import Any, Optional, List, Dict, Tuple
 from pathlib import Path
 
+import numpy as np
+
+from .batch_window import load_promo_mask, load_sales_window
+
 
 class _NoCloseConnection:
     """close() 호출을 무시하는 커넥션 래퍼 (persistent 모드용)"""
@@ -88,6 +92,9 @@ class RollingFeatureCalculator:
         self.db_path = str(db_path)
         self.store_id = store_id
         self._persistent_conn = None
+        # predict_batch 배치 결과 (feature-batch-window)
+        self._batch_target: Optional[str] = None
+        self._batch_results: Dict[str, RollingFeatures] = {}
 
     def _get_connection(self, timeout: int = 30) -> sqlite3.Connection:
         if self._persistent_conn is not None:
@@ -128,11 +135,17 @@ class RollingFeatureCalculator:
         if target_date is None:
             target_date = datetime.now() + timedelta(days=1)
 
+        target_str = target_date.strftime("%Y-%m-%d")
+
+        # load_batch로 미리 계산된 결과 (기본 윈도우 구성만)
+        if windows is None and getattr(self, '_batch_target', None) == target_str:
+            cached = self._batch_results.get(item_cd)
+            if cached is not None:
+                return cached
+
         if windows is None:
             windows = self.DEFAULT_WINDOWS
 
-        target_str = target_date.strftime("%Y-%m-%d")
-
         # 판매 이력 조회 (최대 윈도우 + 여유분)
         max_window = max(windows)
         sales_data = self._get_sales_data(item_cd, target_date, max_window + 7)
@@ -156,6 +169,18 @@ class RollingFeatureCalculator:
         ewm_7 = self._calculate_ewm(sales, span=7)
         ewm_14 = self._calculate_ewm(sales, span=14)
 
+        return self._build_features(item_cd, target_str, stats, ewm_7, ewm_14, len(sales))
+
+    def _build_features(
+        self,
+        item_cd: str,
+        target_str: str,
+        stats: Dict[int, Dict[str, Any]],
+        ewm_7: Optional[float],
+        ewm_14: Optional[float],
+        data_days: int,
+    ) -> RollingFeatures:
+        """윈도우 통계/EWM → RollingFeatures (변동성/트렌드 포함)"""
         # 변동성 계수 (28일 기준)
         cv = None
         if stats.get(28) and stats[28]['mean'] and stats[28]['mean'] > 0:
@@ -195,7 +220,7 @@ class RollingFeatureCalculator:
             is_trending_up=is_up,
             is_trending_down=is_down,
             # 데이터 품질
-            data_days=len(sales),
+            data_days=data_days,
         )
 
     def _get_sales_data(
@@ -437,6 +462,13 @@ class RollingFeatureCalculator:
         """
         여러 상품의 Rolling Features 일괄 계산
 
+        조회 구간(최대 윈도우 + 7일) daily_sales 범위 쿼리 1회, 행사 기간 쿼리 1회로
+        items × days 배열과 행사 마스크를 만든 뒤 0판매일 보간/행사일 imputation,
+        윈도우 통계, EWM을 배열 연산으로 계산한다.
+        합계/편차 제곱합/EWM은 SKU별 계산과 같은 순서(최신 → 과거)로 누적하므로
+        결과는 calculate()와 동일하다.
+        store_id가 없으면(여러 매장 혼재 가능) SKU별로 계산한다.
+
         Args:
             item_codes: 상품코드 리스트
             target_date: 예측 대상 날짜
@@ -444,11 +476,127 @@ class RollingFeatureCalculator:
         Returns:
             {item_cd: RollingFeatures} 딕셔너리
         """
+        if target_date is None:
+            target_date = datetime.now() + timedelta(days=1)
+        codes = list(dict.fromkeys(item_codes))
+        if not self.store_id or not codes:
+            return {item_cd: self.calculate(item_cd, target_date) for item_cd in codes}
+
+        target_str = target_date.strftime("%Y-%m-%d")
+        windows = self.DEFAULT_WINDOWS
+        days = max(windows) + 7
+        day_strs = [
+            (target_date - timedelta(days=days - i)).strftime("%Y-%m-%d")
+            for i in range(days)
+        ]
+        index = {cd: i for i, cd in enumerate(codes)}
+
+        conn = self._get_connection()
+        try:
+            sale, present = load_sales_window(
+                conn, self.store_id, index, day_strs, contiguous=True
+            )
+            promo = load_promo_mask(conn, index, day_strs)
+        finally:
+            conn.close()
+
+        n_items = len(codes)
+        cols = np.arange(days)
+        has_data = present.any(axis=1)
+        first = np.where(has_data, present.argmax(axis=1), 0)
+        last = np.where(has_data, days - 1 - present[:, ::-1].argmax(axis=1), -1)
+        length = last - first + 1  # 첫 기록 ~ 마지막 기록 (0판매일 보간 구간)
+        inside = (cols >= first[:, None]) & (cols <= last[:, None])
+
+        # 행사일 imputation: 구간 내 비행사일 평균(반올림)으로 대체
+        qty = sale
+        if promo is not None:
+            promo_in = promo & inside
+            non_promo = inside & ~promo
+            np_cnt = non_promo.sum(axis=1)
+            np_sum = np.where(non_promo, qty, 0.0).sum(axis=1)
+            replace = promo_in & (np_cnt > 0)[:, None]
+            np_avg = np.round(np_sum / np.maximum(np_cnt, 1))
+            qty = np.where(replace, np_avg[:, None], qty)
+
+        # 최신 순 행렬: S[:, k] = 마지막 기록일 - k일 (k < length)
+        back = last[:, None] - cols[None, :]
+        valid = back >= first[:, None]
+        series = np.where(valid, np.take_along_axis(qty, np.clip(back, 0, days - 1), axis=1), 0.0)
+
+        stats_cols = {}
+        for window in windows:
+            n = np.minimum(length, window)
+            total = np.where(cols[:window] < n[:, None], series[:, :window], 0.0).sum(axis=1)
+            mean = total / np.maximum(n, 1)
+            sq_sum = np.zeros(n_items)
+            for k in range(window):
+                dev = series[:, k] - mean
+                sq_sum = np.where(k < n, sq_sum + dev ** 2, sq_sum)
+            std = np.where(n > 1, np.sqrt(sq_sum / np.maximum(n - 1, 1)), 0.0)
+            in_window = valid[:, :window]
+            w_min = np.where(in_window, series[:, :window], np.inf).min(axis=1)
+            w_max = np.where(in_window, series[:, :window], -np.inf).max(axis=1)
+            stats_cols[window] = (mean, std, w_min, w_max)
+
+        ewm_cols = {span: self._ewm_batch(series, length, span) for span in (7, 14)}
+
         result = {}
-        for item_cd in item_codes:
-            result[item_cd] = self.calculate(item_cd, target_date)
+        for item_cd, r in index.items():
+            if not has_data[r]:
+                result[item_cd] = RollingFeatures(
+                    item_cd=item_cd, target_date=target_str, data_days=0
+                )
+                continue
+            if np.isnan(sale[r, first[r]:last[r] + 1]).any():
+                # NULL 판매량 → 기존 SKU별 경로와 동일하게 처리
+                result[item_cd] = self.calculate(item_cd, target_date)
+                continue
+            stats = {
+                window: {
+                    'mean': round(float(mean[r]), 2),
+                    'std': round(float(std[r]), 2),
+                    'min': int(w_min[r]),
+                    'max': int(w_max[r]),
+                }
+                for window, (mean, std, w_min, w_max) in stats_cols.items()
+            }
+            result[item_cd] = self._build_features(
+                item_cd, target_str, stats,
+                round(float(ewm_cols[7][r]), 2),
+                round(float(ewm_cols[14][r]), 2),
+                int(length[r]),
+            )
         return result
 
+    @staticmethod
+    def _ewm_batch(series: np.ndarray, length: np.ndarray, span: int) -> np.ndarray:
+        """최신 순 행렬의 EWM (_calculate_ewm과 동일: 최근 span*2일, 과거 → 최신)"""
+        alpha = 2 / (span + 1)
+        m = np.minimum(length, span * 2)
+        ewm = np.zeros(series.shape[0])
+        for k in range(min(span * 2, series.shape[1]) - 1, -1, -1):
+            x = series[:, k]
+            ewm = np.where(k == m - 1, x, np.where(k < m - 1, alpha * x + (1 - alpha) * ewm, ewm))
+        return ewm
+
+    def load_batch(
+        self,
+        item_codes: List[str],
+        target_date: Optional[datetime] = None
+    ) -> None:
+        """calculate_batch 결과를 보관 → 이후 calculate()가 SKU별 쿼리 대신 사용"""
+        if target_date is None:
+            target_date = datetime.now() + timedelta(days=1)
+        self.clear_batch()
+        self._batch_results = self.calculate_batch(item_codes, target_date)
+        self._batch_target = target_date.strftime("%Y-%m-%d")
+
+    def clear_batch(self) -> None:
+        """predict_batch 종료 시 배치 결과 해제"""
+        self._batch_target = None
+        self._batch_results = {}
+
 
 # =============================================================================
 # 테스트/데모
@@ -8,8 +8,10 @@ BGF 자동발주 - 개선된 규칙 기반 예측기
 - [v9] 행사 정보 기반 발주량 조정 지원
 """
 
+import functools
 import json
 import sqlite3
+import time
 from datetime import date, datetime, timedelta
 from typing import Any, Optional, Dict, List, Tuple
 from dataclasses import dataclass
@@ -139,6 +141,14 @@ from .prediction_config import (
 # 비용 최적화
 from .cost_optimizer import CostOptimizer
 
+# 상품 속성 일괄 스토어 (product-attribute-store)
+from .product_attributes import (
+    ProductAttributeStore,
+    activate_attribute_store,
+    deactivate_attribute_store,
+    get_active_attribute_store,
+)
+
 # surplus 취소 시 최소 재고 일수 (이하이면 취소 안 함)
 SURPLUS_MIN_DAYS_COVER = 1.0
 
@@ -249,6 +259,146 @@ class PredictionResult:
     snapshot_stages: Optional[Dict[str, Any]] = None
 
 
+def _warm_enabled(predictor) -> bool:
+    """warm 캐시 모드 여부 (__init__ 우회/Mock 예측기에서는 항상 False)"""
+    cm = getattr(predictor, '__dict__', {}).get('_cache')
+    return getattr(cm, 'warm_enabled', False) is True
+
+
+def _warm_load(predictor, key: str, loader, item_codes: Optional[List[str]] = None):
+    """warm 모드면 PredictionCacheManager.warm()으로, 아니면 매번 로드 (warm-prediction-daemon)"""
+    if _warm_enabled(predictor):
+        return predictor._cache.warm(key, loader, item_codes)
+    return loader()
+
+
+def _load_attribute_store(predictor, item_codes: List[str]) -> Optional[ProductAttributeStore]:
+    """predict_batch 후보 SKU의 product_details 속성 일괄 로드 (product-attribute-store)
+
+    실패 시 None → 카테고리 Strategy가 기존 SKU별 조회로 폴백
+    """
+    try:
+        return _warm_load(
+            predictor,
+            "product_attributes",
+            lambda: ProductAttributeStore.load(item_codes=item_codes),
+            item_codes,
+        )
+    except Exception as e:
+        logger.warning(f"상품 속성 스토어 로드 실패 (SKU별 조회 폴백): {e}")
+        return None
+
+
+# 예측 중 SKU 단위로 덮어쓰는 인스턴스 상태 (2-pass 재개 시 복원 대상)
+_ITEM_SCOPED_ATTRS = ("_stage_upstream", "_last_wma_raw")
+
+
+def _finish_ml_steps(predictor, steps, request):
+    """남은 ML 요청을 SKU별 predict_dual로 즉시 응답하며 steps 완료 (ml-batch-inference)
+
+    predict_dual 예외는 yield 지점으로 되던져 기존 try/except(규칙 기반 유지)가 처리한다.
+    """
+    try:
+        while True:
+            try:
+                ml_pred = predictor._ml_predictor.predict_dual(*request)
+            except Exception as e:
+                request = steps.throw(e)
+            else:
+                request = steps.send(ml_pred)
+    except StopIteration as stop:
+        return stop.value
+
+
+def _run_ml_steps(predictor, steps):
+    """ML 요청을 즉시 응답하는 단건 실행 (predict/_apply_ml_ensemble 기존 동작)"""
+    try:
+        request = next(steps)
+    except StopIteration as stop:
+        return stop.value
+    return _finish_ml_steps(predictor, steps, request)
+
+
+def _ml_suspendable(steps_fn):
+    """ML 요청을 yield하는 제너레이터 메서드 → 일반 메서드 (ml-batch-inference)
+
+    호출 시 ML 요청을 predict_dual로 즉시 응답해 기존과 같은 값을 반환한다.
+    제너레이터 원본은 .steps로 노출되어 상위 단계가 yield from으로 이어 붙이고,
+    predict_batch는 ML 요청 지점에서 SKU들을 멈춰 모아 일괄 추론한다.
+    """
+    @functools.wraps(steps_fn)
+    def run(self, *args, **kwargs):
+        return _run_ml_steps(self, steps_fn(self, *args, **kwargs))
+    run.steps = steps_fn
+    return run
+
+
+def _ml_batch_enabled(predictor) -> bool:
+    """predict_batch에서 ML 배치 추론 2-pass 사용 여부 (Mock/서브클래스 predict는 제외)"""
+    from src.settings.constants import ML_BATCH_INFERENCE_ENABLED
+    if not ML_BATCH_INFERENCE_ENABLED:
+        return False
+    if getattr(type(predictor), 'predict', None) is not ImprovedPredictor.predict:
+        return False
+    ml = getattr(predictor, '__dict__', {}).get('_ml_predictor')
+    return ml is not None and hasattr(ml, 'predict_dual_batch')
+
+
+def _predict_items_two_pass(predictor, item_codes, target_date, pending_quantities,
+                            steps_fn=None):
+    """ML 배치 추론 2-pass (ml-batch-inference)
+
+    1) SKU별 파이프라인을 ML 앙상블 단계까지 실행하고 피처를 모은다
+    2) predict_dual_batch로 카테고리 그룹/small_cd 모델당 predict 1회
+    3) 멈춘 파이프라인에 ML 예측값을 넣어 나머지 단계를 실행한다
+    SKU별 predict_dual과 같은 모델·같은 피처라 결과는 동일하다.
+
+    Returns:
+        item_codes 순서의 PredictionResult/None 리스트
+    """
+    steps_fn = steps_fn or ImprovedPredictor.predict.steps
+    outcomes: List[Optional[PredictionResult]] = [None] * len(item_codes)
+    suspended = []  # (위치, steps, ML 요청, SKU 상태)
+    for pos, item_cd in enumerate(item_codes):
+        steps = steps_fn(predictor, item_cd, target_date, pending_quantities.get(item_cd))
+        try:
+            request = next(steps)
+        except StopIteration as stop:
+            outcomes[pos] = stop.value
+            continue
+        state = {attr: predictor.__dict__.get(attr) for attr in _ITEM_SCOPED_ATTRS}
+        suspended.append((pos, steps, request, state))
+
+    if not suspended:
+        return outcomes
+
+    ml_preds = None
+    started = time.perf_counter()
+    try:
+        ml_preds = predictor._ml_predictor.predict_dual_batch(
+            [(idx, *request) for idx, (_, _, request, _) in enumerate(suspended)]
+        )
+        logger.debug(
+            f"[ML배치] {len(suspended)}건 일괄 추론 "
+            f"({(time.perf_counter() - started) * 1000:.0f}ms)"
+        )
+    except Exception as e:
+        logger.warning(f"[ML배치] 일괄 추론 실패 → SKU별 추론: {e}")
+
+    for idx, (pos, steps, request, state) in enumerate(suspended):
+        predictor.__dict__.update(state)
+        if ml_preds is None:
+            outcomes[pos] = _finish_ml_steps(predictor, steps, request)
+            continue
+        try:
+            request = steps.send(ml_preds.get(idx))
+        except StopIteration as stop:
+            outcomes[pos] = stop.value
+        else:
+            outcomes[pos] = _finish_ml_steps(predictor, steps, request)
+    return outcomes
+
+
 class ImprovedPredictor:
     """개선된 규칙 기반 예측기"""
 
@@ -362,6 +512,9 @@ class ImprovedPredictor:
         # 수요 패턴 분류 캐시 (prediction-redesign)
         self._demand_pattern_cache: Dict = {}
 
+        # intermittent 상품 Croston 일괄 예측 캐시 (croston-grid)
+        self._croston_batch_cache: Dict = {}
+
         # order_tracking 미입고 교차검증 캐시 (None=미로드, {}=로드완료+비어있음)
         self._ot_pending_cache: Optional[Dict[str, int]] = None
 
@@ -372,6 +525,10 @@ class ImprovedPredictor:
         self._holiday_ctx_memo: Dict[str, Dict] = {}
         self._temperature_memo: Dict[str, Optional[float]] = {}
         self._temp_delta_memo: Dict[str, Optional[float]] = {}
+        # (날짜, mid_cd)별 연휴/기온 계수 메모 — 배치 내 중분류당 1회 계산 (columnar-predict-batch)
+        self._coef_memo: Dict[Tuple[str, str, str], float] = {}
+        # (날짜, mid_cd)별 날짜 단위 계수 묶음 — predict_batch 중에만 dict (columnar-predict-batch)
+        self._date_coef_memo: Optional[Dict[Tuple[str, str], tuple]] = None
 
     def __getattr__(self, name):
         """Lazy 속성 생성 — __init__ 우회 테스트 호환 (god-class-decomposition)"""
@@ -402,7 +559,7 @@ class ImprovedPredictor:
             cm = PredictionCacheManager(_data, self.__dict__.get('store_id'), self.__dict__.get('db_path'))
             self._cache = cm
             return cm
-        if name in ('_holiday_ctx_memo', '_temperature_memo', '_temp_delta_memo'):
+        if name in ('_holiday_ctx_memo', '_temperature_memo', '_temp_delta_memo', '_coef_memo'):
             self.__dict__[name] = {}
             return {}
         raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'")
@@ -853,6 +1010,7 @@ class ImprovedPredictor:
             mid_cd=mid_cd, item_cd=item_cd
         )
 
+    @_ml_suspendable
     def predict(
         self,
         item_cd: str,
@@ -921,7 +1079,8 @@ class ImprovedPredictor:
         )
 
         # 5. 카테고리별 안전재고 계산 + 발주량 산출
-        result_ctx = self._compute_safety_and_order(
+        result_ctx = yield from self._compute_safety_and_order.steps(
+            self,
             item_cd, product, target_date, weekday, mid_cd,
             base_prediction, adjusted_prediction, weekday_coef,
             current_stock, pending_qty, data_days,
@@ -1102,9 +1261,10 @@ class ImprovedPredictor:
         """Croston/TSB 기반 간헐수요 예측 (Facade: self. 메서드 호출 유지)"""
         from src.prediction.croston_predictor import CrostonPredictor
 
-        history = self._get_daily_sales_history(item_cd, days=60)
-        predictor = CrostonPredictor()
-        result = predictor.predict(history)
+        result = getattr(self, '_croston_batch_cache', {}).get(item_cd)
+        if result is None:
+            history = self._get_daily_sales_history(item_cd, days=60)
+            result = CrostonPredictor().predict(history)
 
         data_days = self._get_data_span_days(item_cd)
         sell_day_ratio = pattern_result.sell_day_ratio if pattern_result else 0.25
@@ -1144,25 +1304,31 @@ class ImprovedPredictor:
         self._last_wma_raw = getattr(self._base, '_last_wma_raw', result[0])
         return result
 
-    def _apply_all_coefficients(self, base_prediction, item_cd, product, target_date,
-                                sqlite_weekday, feat_result):
-        """연휴/기온/요일/계절/연관/트렌드 계수 일괄 적용
+    def _date_level_coefficients(self, target_date, target_date_str, mid_cd,
+                                 sqlite_weekday, _temp):
+        """날짜·중분류 단위 계수 묶음 (연휴/기온·강수·하늘·미세먼지/푸드 교차/요일/계절)
 
-        prediction-redesign: 비면제 카테고리는 덧셈(additive) 방식,
-        면제 카테고리(food/dessert)와 캐시 미로드 시 기존 곱셈(multiplicative) 방식 유지.
+        상품과 무관하게 (날짜, mid_cd)로 결정되므로 predict_batch 중에는
+        _date_coef_memo에 중분류당 1회만 계산한다 (columnar-predict-batch).
 
         Returns:
-            (base_prediction, adjusted_prediction, weekday_coef, assoc_boost)
+            (holiday_coef, weather_coef, food_wx_coef, food_precip_coef,
+             weekday_coef, weekday_source, seasonal_coef)
         """
-        from src.prediction.demand_classifier import DEMAND_PATTERN_EXEMPT_MIDS
-
-        mid_cd = product["mid_cd"]
-        target_date_str = target_date.strftime("%Y-%m-%d")
-        _temp = self._get_temperature_for_date(target_date_str)
-
-        # -- 공통: 계수값 계산 --
-        holiday_coef = self._get_holiday_coefficient(target_date_str, mid_cd)
-        weather_coef = self._get_weather_coefficient(target_date_str, mid_cd)
+        _date_memo = getattr(self, '_date_coef_memo', None)
+        _bkey = (target_date_str, mid_cd)
+        if _date_memo is not None and _bkey in _date_memo:
+            return _date_memo[_bkey]
+
+        _memo = self._coef_memo
+        _hkey = ("holiday", target_date_str, mid_cd)
+        if _hkey not in _memo:
+            _memo[_hkey] = self._get_holiday_coefficient(target_date_str, mid_cd)
+        holiday_coef = _memo[_hkey]
+        _wkey = ("weather", target_date_str, mid_cd)
+        if _wkey not in _memo:
+            _memo[_wkey] = self._get_weather_coefficient(target_date_str, mid_cd)
+        weather_coef = _memo[_wkey]
 
         # 강수 계수 (기온 계수에 곱하기 병합)
         precip_coef = self._coef.get_precipitation_coefficient(target_date_str, mid_cd)
@@ -1203,6 +1369,34 @@ class ImprovedPredictor:
 
         seasonal_coef = get_seasonal_coefficient(mid_cd, target_date.month)
 
+        bundle = (holiday_coef, weather_coef, food_wx_coef, food_precip_coef,
+                  weekday_coef, weekday_source, seasonal_coef)
+        if _date_memo is not None:
+            _date_memo[_bkey] = bundle
+        return bundle
+
+    def _apply_all_coefficients(self, base_prediction, item_cd, product, target_date,
+                                sqlite_weekday, feat_result):
+        """연휴/기온/요일/계절/연관/트렌드 계수 일괄 적용
+
+        prediction-redesign: 비면제 카테고리는 덧셈(additive) 방식,
+        면제 카테고리(food/dessert)와 캐시 미로드 시 기존 곱셈(multiplicative) 방식 유지.
+
+        Returns:
+            (base_prediction, adjusted_prediction, weekday_coef, assoc_boost)
+        """
+        from src.prediction.demand_classifier import DEMAND_PATTERN_EXEMPT_MIDS
+
+        mid_cd = product["mid_cd"]
+        target_date_str = target_date.strftime("%Y-%m-%d")
+        _temp = self._get_temperature_for_date(target_date_str)
+
+        # -- 공통: 날짜·중분류 단위 계수 (predict_batch 중 중분류당 1회) --
+        (holiday_coef, weather_coef, food_wx_coef, food_precip_coef,
+         weekday_coef, weekday_source, seasonal_coef) = self._date_level_coefficients(
+            target_date, target_date_str, mid_cd, sqlite_weekday, _temp
+        )
+
         assoc_boost = 1.0
         if self._association_adjuster:
             try:
@@ -1266,6 +1460,7 @@ class ImprovedPredictor:
             ot_pending_cache=getattr(self, '_ot_pending_cache', None),
         )
 
+    @_ml_suspendable
     def _compute_safety_and_order(
         self, item_cd, product, target_date, weekday, mid_cd,
         base_prediction, adjusted_prediction, weekday_coef,
@@ -1327,12 +1522,15 @@ class ImprovedPredictor:
                 )
             else:
                 # intermittent: Croston safety stock
-                history = self._get_daily_sales_history(item_cd, days=60)
-                _croston = CrostonPredictor()
-                _, croston_safety = _croston.predict_with_safety(
-                    history,
-                    order_interval=max(2, int(1.0 / max(pattern_result.sell_day_ratio, 0.01)))
-                )
+                _order_interval = max(2, int(1.0 / max(pattern_result.sell_day_ratio, 0.01)))
+                _croston_result = getattr(self, '_croston_batch_cache', {}).get(item_cd)
+                if _croston_result is not None:
+                    croston_safety = CrostonPredictor.safety_stock(_croston_result, _order_interval)
+                else:
+                    history = self._get_daily_sales_history(item_cd, days=60)
+                    _, croston_safety = CrostonPredictor().predict_with_safety(
+                        history, order_interval=_order_interval
+                    )
                 safety_stock = croston_safety
                 logger.info(
                     f"[PRED][3-Safety] {product['item_nm']}: "
@@ -1652,18 +1850,23 @@ class ImprovedPredictor:
             if pattern_result:
                 _slow_pattern_name = pattern_result.pattern.value
             elif not self._demand_pattern_cache:
-                try:
-                    from src.infrastructure.database.connection import DBRouter
-                    _pd_conn = DBRouter.get_connection(table="product_details")
-                    _pd_row = _pd_conn.execute(
-                        "SELECT demand_pattern FROM product_details WHERE item_cd = ?",
-                        (item_cd,)
-                    ).fetchone()
-                    if _pd_row and _pd_row[0]:
-                        _slow_pattern_name = _pd_row[0]
-                    _pd_conn.close()
-                except Exception:
-                    pass
+                _attr_store = get_active_attribute_store()
+                if _attr_store is not None and item_cd in _attr_store:
+                    # predict_batch 속성 스토어 (product-attribute-store)
+                    _slow_pattern_name = _attr_store.get(item_cd, "demand_pattern")
+                else:
+                    try:
+                        from src.infrastructure.database.connection import DBRouter
+                        _pd_conn = DBRouter.get_connection(table="product_details")
+                        _pd_row = _pd_conn.execute(
+                            "SELECT demand_pattern FROM product_details WHERE item_cd = ?",
+                            (item_cd,)
+                        ).fetchone()
+                        if _pd_row and _pd_row[0]:
+                            _slow_pattern_name = _pd_row[0]
+                        _pd_conn.close()
+                    except Exception:
+                        pass
 
             if _slow_pattern_name == "slow":
                 _is_slow_override = True
@@ -1872,7 +2075,7 @@ class ImprovedPredictor:
         result = self._stage_rop(result, ctx, proposal, pipe)
         # Phase B
         result = self._stage_promo(result, ctx, proposal, pipe)
-        result = self._stage_ml(result, ctx, proposal, pipe)
+        result = yield from self._stage_ml.steps(self, result, ctx, proposal, pipe)
         result = self._stage_new_product(result, ctx, proposal, pipe)
         result = self._stage_diff(result, ctx, proposal, pipe)
         result = self._stage_promo_floor(result, ctx, proposal, pipe)
@@ -2135,10 +2338,12 @@ class ImprovedPredictor:
         ctx["_promo_result_obj"] = promo_result
         return result.with_qty(order_qty, "after_promo")
 
+    @_ml_suspendable
     def _stage_ml(self, result, ctx, proposal, pipe):
         """Stage 4: ML 앙상블"""
         order_qty = result.qty
-        order_qty, model_type = self._apply_ml_ensemble(
+        order_qty, model_type = yield from self._apply_ml_ensemble.steps(
+            self,
             pipe["item_cd"], pipe["product"], pipe["mid_cd"], order_qty,
             pipe["data_days"], pipe["target_date"],
             pipe["effective_stock_for_need"], pipe["pending_qty"],
@@ -2691,12 +2896,16 @@ class ImprovedPredictor:
             skipped=_skipped,
         )
 
+    @_ml_suspendable
     def _apply_ml_ensemble(self, item_cd, product, mid_cd, order_qty,
                            data_days, target_date,
                            current_stock, pending_qty, safety_stock,
                            feat_result, ctx=None):
         """ML 앙상블 (규칙 기반과 ML 예측의 가중 평균)
 
+        피처 생성 후 ML 요청 (features, mid_cd, small_cd, data_days)를 yield하고
+        predict_dual 결과를 받아 규칙 발주량과 블렌딩한다 (ml-batch-inference).
+
         Returns:
             (order_qty, model_type)
         """
@@ -2822,9 +3031,7 @@ class ImprovedPredictor:
             )
 
             if features is not None:
-                ml_pred = self._ml_predictor.predict_dual(
-                    features, mid_cd, _small_cd, data_days
-                )
+                ml_pred = yield (features, mid_cd, _small_cd, data_days)
                 if ml_pred is not None:
                     rule_order = order_qty
 
@@ -3339,16 +3546,57 @@ class ImprovedPredictor:
                 reason=_applied_reason, stage=_applied_stage,
             )
 
+    # =========================================================================
+    # warm 캐시 (warm-prediction-daemon)
+    # =========================================================================
+
+    def enable_warm_caches(self) -> None:
+        """predict_batch 간 배치 캐시 유지 (상주 예측 데몬 전용)
+
+        이후 predict_batch는 캐시를 다시 로드하지 않고 재사용하며,
+        데이터 변경 시 invalidate_warm_caches()로 해당 캐시만 버린다.
+        """
+        self._cache.enable_warm()
+
+    def invalidate_warm_caches(self, tables: Optional[List[str]] = None) -> List[str]:
+        """변경된 테이블에 의존하는 캐시 무효화
+
+        Args:
+            tables: 변경된 테이블명 (None이면 전체)
+
+        Returns:
+            무효화된 캐시 키 목록
+        """
+        dropped = self._cache.invalidate(tables)
+        changed = set(tables) if tables is not None else None
+        _data = getattr(self, '_data', None)
+        if _data is not None and (changed is None or 'promotions' in changed):
+            _data._promo_cache = None
+            dropped.append("promo_periods")
+        if _data is not None and (changed is None or 'realtime_inventory' in changed):
+            _data.clear_stock_cache()
+            _data.clear_pending_cache()
+            dropped.append("inventory")
+        if _data is not None and 'batch_caches' in dropped:
+            _data.clear_batch_caches()
+        if changed is None or 'daily_sales' in changed:
+            self._bias_cache = {}
+        return dropped
+
     def _load_receiving_stats_cache(self) -> None:
         """입고 패턴 통계 배치 캐시 → PredictionCacheManager에 위임"""
         from .prediction_cache import PredictionCacheManager
         cm = PredictionCacheManager(None, getattr(self, 'store_id', None))
-        self._receiving_stats_cache = cm.load_receiving_stats()
+        self._receiving_stats_cache = _warm_load(self, "receiving_stats", cm.load_receiving_stats)
 
     def _load_group_context_caches(self) -> None:
         """그룹 컨텍스트 캐시 프리로드 → PredictionCacheManager에 위임"""
-        peer, smap, lifecycle = self._cache.load_group_contexts(
-            ml_predictor=getattr(self, '_ml_predictor', None)
+        peer, smap, lifecycle = _warm_load(
+            self,
+            "group_contexts",
+            lambda: self._cache.load_group_contexts(
+                ml_predictor=getattr(self, '_ml_predictor', None)
+            ),
         )
         self._smallcd_peer_cache = peer
         self._item_smallcd_map = smap
@@ -3356,17 +3604,51 @@ class ImprovedPredictor:
 
     def _load_food_coef_cache(self, item_codes: list) -> None:
         """푸드 요일 계수 배치 캐시 → PredictionCacheManager에 위임"""
-        self._food_weekday_cache = self._cache.load_food_weekday(
-            item_codes, get_connection_fn=self._get_connection
+        self._food_weekday_cache = _warm_load(
+            self,
+            "food_weekday",
+            lambda: self._cache.load_food_weekday(
+                item_codes, get_connection_fn=self._get_connection
+            ),
+            item_codes,
         )
 
     def _load_ot_pending_cache(self) -> None:
         """order_tracking 미입고 교차검증 캐시 → PredictionCacheManager에 위임"""
-        self._ot_pending_cache = self._cache.load_ot_pending()
+        self._ot_pending_cache = _warm_load(self, "ot_pending", self._cache.load_ot_pending)
 
     def _load_demand_pattern_cache(self, item_codes: List[str]) -> None:
         """수요 패턴 분류 배치 캐시 → PredictionCacheManager에 위임"""
-        self._demand_pattern_cache = self._cache.load_demand_patterns(item_codes)
+        self._demand_pattern_cache = _warm_load(
+            self,
+            "demand_patterns",
+            lambda: self._cache.load_demand_patterns(item_codes),
+            item_codes,
+        )
+
+    def _load_croston_batch_cache(self, item_codes: List[str]) -> None:
+        """intermittent 상품 Croston/TSB 일괄 예측 (croston-grid)
+
+        상품별 predict() 대신 60일 이력을 모아 predict_batch() 1회로 계산.
+        판매 매트릭스 배치 캐시 로드 이후 호출해야 이력 조회가 캐시에서 처리된다.
+        """
+        self._croston_batch_cache = {}
+        targets = [
+            cd for cd in item_codes
+            if cd in self._demand_pattern_cache
+            and self._demand_pattern_cache[cd].pattern.value == "intermittent"
+        ]
+        if not targets:
+            return
+        try:
+            from src.prediction.croston_predictor import CrostonPredictor
+            histories = [self._get_daily_sales_history(cd, days=60) for cd in targets]
+            results = CrostonPredictor().predict_batch(histories)
+            self._croston_batch_cache = dict(zip(targets, results))
+            logger.debug(f"Croston 일괄 예측 캐시: {len(self._croston_batch_cache)}건")
+        except Exception as e:
+            logger.warning(f"Croston 일괄 예측 실패 (개별 폴백): {e}")
+            self._croston_batch_cache = {}
 
     def predict_batch(
         self,
@@ -3394,6 +3676,8 @@ class ImprovedPredictor:
         self._holiday_ctx_memo = {}
         self._temperature_memo = {}
         self._temp_delta_memo = {}
+        self._coef_memo = {}
+        self._date_coef_memo = {}
 
         # 입고 패턴 배치 캐시 프리로드 (DB 쿼리 2회)
         self._load_receiving_stats_cache()
@@ -3427,7 +3711,12 @@ class ImprovedPredictor:
             try:
                 from src.prediction.ml.data_pipeline import MLDataPipeline
                 pipeline = MLDataPipeline(self.db_path, store_id=self.store_id)
-                self._daily_stats_cache = pipeline.get_batch_daily_stats(item_codes, days=90)
+                self._daily_stats_cache = _warm_load(
+                    self,
+                    "daily_stats",
+                    lambda: pipeline.get_batch_daily_stats(item_codes, days=90),
+                    item_codes,
+                )
                 logger.debug(f"ML 일별 통계 배치 캐시: {len(self._daily_stats_cache)}건")
             except Exception as e:
                 logger.warning(f"ML 배치 캐시 프리로드 실패 (개별 폴백): {e}")
@@ -3436,6 +3725,25 @@ class ImprovedPredictor:
         _data = getattr(self, '_data', None)
         if _data and hasattr(_data, 'open_persistent_connection'):
             _data.open_persistent_connection()
+
+        # 판매 매트릭스(items × days) + 상품 정보 일괄 로드 (SKU별 쿼리 → 2~3 쿼리)
+        # warm 모드에서는 이전 로드 결과를 복원하고 종료 시 해제하지 않는다
+        warm = _warm_enabled(self)
+        if _data and hasattr(_data, 'load_batch_caches'):
+            if warm:
+                def _load_batch_state():
+                    _data.load_batch_caches(item_codes)
+                    return _data.batch_cache_state()
+                _data.restore_batch_caches(
+                    self._cache.warm("batch_caches", _load_batch_state, item_codes)
+                )
+            else:
+                _data.load_batch_caches(item_codes)
+
+        # 후보 전체 WMA 일괄 계산 (매트릭스 배열 연산, 없으면 SKU별 계산)
+        _base = self._base
+        if hasattr(_base, 'load_wma_batch'):
+            _base.load_wma_batch(item_codes)
         _promo_adj = getattr(self, '_promo_adjuster', None)
         promo_mgr = getattr(_promo_adj, 'promo_manager', None) if _promo_adj else None
         if promo_mgr and hasattr(promo_mgr, 'open_persistent_connection'):
@@ -3448,13 +3756,45 @@ class ImprovedPredictor:
         if lag_calc and hasattr(lag_calc, 'open_persistent_connection'):
             lag_calc.open_persistent_connection()
 
+        # Lag/Rolling Features 일괄 로드 → SKU별 daily_sales/promotions 조회 대체
+        if _feat_calc and hasattr(_feat_calc, 'load_batch'):
+            try:
+                _feat_calc.load_batch(
+                    item_codes, target_date or datetime.now() + timedelta(days=1)
+                )
+            except Exception as e:
+                logger.warning(f"[FEATURE] 배치 로드 실패, SKU별 계산으로 진행: {e}")
+
+        # 상품 속성(유통기한 등) 일괄 로드 → 카테고리 Strategy SKU별 common.db 조회 대체
+        attr_token = activate_attribute_store(_load_attribute_store(self, item_codes))
+
+        # intermittent 상품 Croston 일괄 예측 (croston-grid)
+        self._load_croston_batch_cache(item_codes)
+
         try:
-            for item_cd in item_codes:
-                pending = pending_quantities.get(item_cd, None)
-                result = self.predict(item_cd, target_date, pending)
-                if result:
-                    results.append(result)
+            if _ml_batch_enabled(self):
+                # ML 배치 추론: 피처 수집 → 모델당 predict 1회 → 블렌딩 재개 (ml-batch-inference)
+                results = [
+                    r for r in _predict_items_two_pass(
+                        self, item_codes, target_date, pending_quantities
+                    ) if r
+                ]
+            else:
+                for item_cd in item_codes:
+                    pending = pending_quantities.get(item_cd, None)
+                    result = self.predict(item_cd, target_date, pending)
+                    if result:
+                        results.append(result)
         finally:
+            deactivate_attribute_store(attr_token)
+            self._croston_batch_cache = {}
+            self._date_coef_memo = None
+            if hasattr(_base, 'clear_wma_batch'):
+                _base.clear_wma_batch()
+            if _feat_calc and hasattr(_feat_calc, 'clear_batch'):
+                _feat_calc.clear_batch()
+            if _data and hasattr(_data, 'clear_batch_caches') and not warm:
+                _data.clear_batch_caches()
             if _data and hasattr(_data, 'close_persistent_connection'):
                 _data.close_persistent_connection()
             if promo_mgr and hasattr(promo_mgr, 'close_persistent_connection'):
@@ -413,48 +413,104 @@ class MLFeatureBuilder:
             finally:
                 conn.close()
 
-            if not rows:
-                return {}
-
-            # 시간대별 집계
-            slots = {"morning": 0, "lunch": 0, "evening": 0, "night": 0}
-            total = 0
-            for hour, qty in rows:
-                total += qty
-                if 6 <= hour < 11:
-                    slots["morning"] += qty
-                elif 11 <= hour < 14:
-                    slots["lunch"] += qty
-                elif 17 <= hour < 21:
-                    slots["evening"] += qty
-                else:
-                    slots["night"] += qty
+            return MLFeatureBuilder._hourly_ratios_from_rows(rows)
+        except Exception:
+            return {}
 
-            if total == 0:
-                return {}
+    @staticmethod
+    def _hourly_ratios_from_rows(rows) -> dict:
+        """(hour, qty) 행 → 시간대별 판매 비중 dict (데이터 없으면 {})"""
+        if not rows:
+            return {}
 
-            # 피크 슬롯 (0=아침/1=점심/2=저녁/3=야간)
-            slot_names = ["morning", "lunch", "evening", "night"]
-            peak_slot = slot_names.index(
-                max(slots, key=slots.get)
-            )
+        # 시간대별 집계
+        slots = {"morning": 0, "lunch": 0, "evening": 0, "night": 0}
+        total = 0
+        for hour, qty in rows:
+            total += qty
+            if 6 <= hour < 11:
+                slots["morning"] += qty
+            elif 11 <= hour < 14:
+                slots["lunch"] += qty
+            elif 17 <= hour < 21:
+                slots["evening"] += qty
+            else:
+                slots["night"] += qty
 
-            # 변동계수 (시간대별 수요 집중도)
-            slot_vals = list(slots.values())
-            _mean = np.mean(slot_vals)
-            hour_cv = (np.std(slot_vals) / _mean) if _mean > 0 else 0.5
-
-            return {
-                "morning_ratio": round(slots["morning"] / total, 4),
-                "lunch_ratio": round(slots["lunch"] / total, 4),
-                "evening_ratio": round(slots["evening"] / total, 4),
-                "night_ratio": round(slots["night"] / total, 4),
-                "peak_hour_slot": float(peak_slot),
-                "hour_cv": round(float(hour_cv), 4),
-            }
-        except Exception:
+        if total == 0:
             return {}
 
+        # 피크 슬롯 (0=아침/1=점심/2=저녁/3=야간)
+        slot_names = ["morning", "lunch", "evening", "night"]
+        peak_slot = slot_names.index(
+            max(slots, key=slots.get)
+        )
+
+        # 변동계수 (시간대별 수요 집중도)
+        slot_vals = list(slots.values())
+        _mean = np.mean(slot_vals)
+        hour_cv = (np.std(slot_vals) / _mean) if _mean > 0 else 0.5
+
+        return {
+            "morning_ratio": round(slots["morning"] / total, 4),
+            "lunch_ratio": round(slots["lunch"] / total, 4),
+            "evening_ratio": round(slots["evening"] / total, 4),
+            "night_ratio": round(slots["night"] / total, 4),
+            "peak_hour_slot": float(peak_slot),
+            "hour_cv": round(float(hour_cv), 4),
+        }
+
+    @staticmethod
+    def calc_hourly_ratios_batch(
+        store_id: str, base_dates: Dict[str, str], days: int = 14
+    ) -> Dict[str, dict]:
+        """calc_hourly_ratios의 배치 버전 (columnar-feature-matrix)
+
+        상품별 기준일이 같은 묶음마다 1회 쿼리 (학습 시 대부분 동일 기준일).
+
+        Args:
+            store_id: 매장 ID
+            base_dates: {item_cd: 기준 날짜(YYYY-MM-DD)}
+            days: 조회 기간 (일)
+
+        Returns:
+            {item_cd: calc_hourly_ratios와 동일한 dict} (데이터 없는 상품은 {})
+        """
+        result: Dict[str, dict] = {item_cd: {} for item_cd in base_dates}
+        by_date: Dict[str, List[str]] = {}
+        for item_cd, base_date in base_dates.items():
+            by_date.setdefault(base_date, []).append(item_cd)
+
+        try:
+            from src.infrastructure.database.connection import DBRouter
+            conn = DBRouter.get_store_connection(store_id)
+            try:
+                for base_date, codes in by_date.items():
+                    for i in range(0, len(codes), 500):
+                        chunk = codes[i:i + 500]
+                        placeholders = ",".join("?" * len(chunk))
+                        rows = conn.execute(f"""
+                            SELECT item_cd, hour, SUM(sale_qty) as qty
+                            FROM hourly_sales_detail
+                            WHERE item_cd IN ({placeholders})
+                              AND sales_date >= date(?, ?)
+                              AND sales_date < ?
+                            GROUP BY item_cd, hour
+                        """, (*chunk, base_date, f"-{days} days", base_date)).fetchall()
+                        grouped: Dict[str, list] = {}
+                        for item_cd, hour, qty in rows:
+                            grouped.setdefault(item_cd, []).append((hour, qty))
+                        for item_cd, item_rows in grouped.items():
+                            try:
+                                result[item_cd] = MLFeatureBuilder._hourly_ratios_from_rows(item_rows)
+                            except Exception:
+                                pass  # 단건 조회와 동일하게 {} 유지
+            finally:
+                conn.close()
+        except Exception:
+            pass
+        return result
+
     @staticmethod
     def build_batch_features(
         items_data: List[Dict[str, Any]],
@@ -0,0 +1,522 @@
+"""
+ML 학습용 컬럼형 Feature 행렬 빌더 (columnar-feature-matrix)
+
+MLTrainer가 (상품 × 날짜) 샘플마다 dict를 만들고
+MLFeatureBuilder.build_features()를 한 행씩 호출하던 것을,
+상품별 판매 배열 + NumPy 슬라이딩 윈도우로 한 번에 계산한다.
+
+- 판매 이력: MLDataPipeline.get_batch_daily_stats() 1회 쿼리
+- 날짜 피처(요일/월/공휴일/날씨): DateFeatureTable에서 날짜 인덱스로 gather
+- 결과 컬럼 순서/정규화는 build_features()와 동일 (MLFeatureBuilder.FEATURE_NAMES)
+- 그룹 단위: GroupSalesArrays (그룹 공유 판매 배열, 샘플 = (상품 인덱스, 일 오프셋))
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.prediction.prediction_config import PREDICTION_PARAMS
+from .feature_builder import MLFeatureBuilder
+
+# 이력 윈도우 (daily_avg_31 기준 최대 31일)
+_HISTORY_WINDOW = 31
+
+# 학습 샘플 시작 인덱스 (최소 7일의 이전 데이터를 feature로 사용)
+_SAMPLE_START = 7
+
+_SKY_CODES = {"맑음": 0, "구름많음": 1, "흐림": 2, "안개": 3, "황사": 4}
+_PAYDAYS = (10, 11, 12, 25, 26, 27)
+
+
+@dataclass
+class FeatureMatrix:
+    """학습 샘플 행렬 (X: float32[n, F], y: float32[n], dates/item_codes: 길이 n)"""
+
+    X: np.ndarray
+    y: np.ndarray
+    dates: np.ndarray
+    item_codes: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return int(self.y.shape[0])
+
+    @classmethod
+    def empty(cls) -> "FeatureMatrix":
+        return cls(
+            X=np.empty((0, len(MLFeatureBuilder.FEATURE_NAMES)), dtype=np.float32),
+            y=np.empty(0, dtype=np.float32),
+            dates=np.empty(0, dtype="<U10"),
+        )
+
+    @classmethod
+    def concat(cls, parts: Iterable["FeatureMatrix"]) -> "FeatureMatrix":
+        """행 방향 결합 (입력 순서 유지)"""
+        parts = [p for p in parts if len(p)]
+        if not parts:
+            return cls.empty()
+        if len(parts) == 1:
+            return parts[0]
+        codes: List[str] = []
+        for p in parts:
+            codes.extend(p.item_codes)
+        return cls(
+            X=np.vstack([p.X for p in parts]),
+            y=np.concatenate([p.y for p in parts]),
+            dates=np.concatenate([p.dates for p in parts]),
+            item_codes=codes,
+        )
+
+
+@dataclass
+class GroupSalesArrays:
+    """그룹 공유 일별 판매 배열 (lean-training-samples)
+
+    그룹 내 상품 이력을 하나의 NumPy 배열로 이어 붙이고
+    상품 k의 이력은 offsets[k]:offsets[k+1] 구간으로 참조한다.
+    학습 샘플은 (상품 인덱스, 일 오프셋) 쌍으로만 표현되어
+    샘플마다 이력 리스트를 복사하지 않는다.
+    """
+
+    item_codes: List[str]
+    offsets: np.ndarray       # int64[K+1]
+    dates: np.ndarray         # datetime64[D][N]
+    sale: np.ndarray          # float64[N] (None → 0)
+    stock: np.ndarray         # float64[N] (None → 0)
+    stock_known: np.ndarray   # bool[N] (stock_qty 수집 여부)
+
+    def __len__(self) -> int:
+        return len(self.item_codes)
+
+    @classmethod
+    def from_histories(
+        cls, histories: Mapping[str, Sequence[Dict[str, Any]]], item_codes: Iterable[str]
+    ) -> "GroupSalesArrays":
+        """{item_cd: 일별 판매 rows} → 공유 배열 (item_codes 순서, 이력 없는 상품 제외)"""
+        codes = [cd for cd in item_codes if cd in histories]
+        lengths = [len(histories[cd]) for cd in codes]
+        offsets = np.zeros(len(codes) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        total = int(offsets[-1])
+        dates = np.empty(total, dtype="datetime64[D]")
+        sale = np.empty(total)
+        stock = np.empty(total)
+        stock_known = np.empty(total, dtype=bool)
+        for k, cd in enumerate(codes):
+            b, e = offsets[k], offsets[k + 1]
+            rows = histories[cd]
+            dates[b:e] = [d["sales_date"] for d in rows]
+            sale[b:e] = [float(d.get("sale_qty", 0) or 0) for d in rows]
+            raw_stock = [d.get("stock_qty") for d in rows]
+            stock_known[b:e] = [v is not None for v in raw_stock]
+            stock[b:e] = [float(v or 0) for v in raw_stock]
+        return cls(codes, offsets, dates, sale, stock, stock_known)
+
+    def item(self, k: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """상품 k 이력 뷰 (sale, stock, stock_known, dates) — 복사 없음"""
+        b, e = self.offsets[k], self.offsets[k + 1]
+        return self.sale[b:e], self.stock[b:e], self.stock_known[b:e], self.dates[b:e]
+
+    def span(self) -> Optional[Tuple[str, str]]:
+        """(최초일, 최종일), 이력 없으면 None"""
+        if not len(self.dates):
+            return None
+        return str(self.dates.min()), str(self.dates.max())
+
+    def sample_index(self, start: int = _SAMPLE_START) -> Tuple[np.ndarray, np.ndarray]:
+        """학습 샘플 (상품 인덱스, 일 오프셋) — 상품 순서, 오프셋 오름차순
+
+        상품 k의 샘플은 start ≤ day < 이력 길이 (target = day, history = [:day]).
+        """
+        counts = np.maximum(np.diff(self.offsets) - start, 0)
+        item_idx = np.repeat(np.arange(len(counts), dtype=np.int32), counts)
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        day = (np.arange(len(item_idx)) - first + start).astype(np.int32)
+        return item_idx, day
+
+
+def _is_true(value: Any, truthy: Tuple[str, ...]) -> bool:
+    return str(value).lower() in truthy
+
+
+class DateFeatureTable:
+    """날짜별 피처 테이블 (external_factors 1회 파싱)
+
+    MLTrainer의 샘플 루프에서 날짜마다 반복하던
+    기온/전일 대비 기온/공휴일/연휴 맥락/강수/하늘/미세먼지/급여일 해석을
+    날짜당 1회로 줄인다. 해석 규칙은 행 단위 참조 구현
+    (tests/ml_training_reference.py)과 동일.
+    """
+
+    def __init__(self, weather_data: Dict[str, Dict[str, Any]], start: str, end: str):
+        """
+        Args:
+            weather_data: {날짜: {factor_key: factor_value}} (get_external_factors 결과)
+            start: 테이블 시작일 (YYYY-MM-DD, 포함)
+            end: 테이블 종료일 (YYYY-MM-DD, 포함)
+        """
+        self.base = np.datetime64(start, "D")
+        dates = np.arange(self.base, np.datetime64(end, "D") + 1)
+        n = len(dates)
+        date_strs = dates.astype(str)
+
+        self.temp_norm = np.full(n, -2.0)        # None → -2.0 sentinel
+        self.temp_present = np.zeros(n, dtype=bool)
+        self.temp_delta_norm = np.zeros(n)
+        self.is_holiday = np.zeros(n)
+        self.holiday_period = np.zeros(n)
+        self.is_pre_holiday = np.zeros(n)
+        self.is_post_holiday = np.zeros(n)
+        self.rain_level = np.zeros(n)
+        self.sky = np.zeros(n)
+        self.pm25_level = np.zeros(n)
+
+        temps: List[Optional[float]] = []
+        for ds in date_strs:
+            temp = None
+            raw = weather_data.get(ds, {}).get("temperature")
+            if raw is not None:
+                try:
+                    temp = float(raw)
+                except (ValueError, TypeError):
+                    pass
+            temps.append(temp)
+        # 테이블 시작일 전일 기온 (temperature_delta 계산용)
+        prev_ds = str(self.base - 1)
+        prev_temp = weather_data.get(prev_ds, {}).get("temperature")
+
+        for k, ds in enumerate(date_strs):
+            f = weather_data.get(ds, {})
+            temp = temps[k]
+            if temp is not None:
+                self.temp_present[k] = True
+                self.temp_norm[k] = (temp - 15.0) / 15.0
+                prev_raw = temps[k - 1] if k > 0 else prev_temp
+                if prev_raw is not None:
+                    try:
+                        self.temp_delta_norm[k] = (temp - float(prev_raw)) / 15.0
+                    except (ValueError, TypeError):
+                        pass
+            self.is_holiday[k] = 1.0 if _is_true(f.get("is_holiday", "false"), ("true", "1", "yes")) else 0.0
+            self.holiday_period[k] = float(int(f.get("holiday_period_days", "0") or "0")) / 7.0
+            self.is_pre_holiday[k] = 1.0 if _is_true(f.get("is_pre_holiday", "false"), ("true", "1")) else 0.0
+            self.is_post_holiday[k] = 1.0 if _is_true(f.get("is_post_holiday", "false"), ("true", "1")) else 0.0
+
+            rain_qty, sky_nm, pm25 = 0.0, "", 0.0
+            try:
+                rain_qty = float(f.get("rain_qty", 0) or 0)
+                sky_nm = str(f.get("weather_cd_nm", "") or "")
+                pm25 = float(f.get("pm25", 0) or 0)
+            except (ValueError, TypeError):
+                pass
+            self.rain_level[k] = 0 if rain_qty < 0.1 else 1 if rain_qty < 2 else 2 if rain_qty < 15 else 3
+            self.sky[k] = _SKY_CODES.get(sky_nm, 0)
+            self.pm25_level[k] = 0 if pm25 < 16 else 1 if pm25 < 36 else 2 if pm25 < 76 else 3
+
+        day_num = dates.astype("int64")
+        self.weekday = (day_num + 3) % 7  # 1970-01-01 = 목요일(3)
+        month0 = dates.astype("datetime64[M]").astype("int64") % 12
+        self.weekday_sin = np.sin(2 * np.pi * self.weekday / 7)
+        self.weekday_cos = np.cos(2 * np.pi * self.weekday / 7)
+        self.month_sin = np.sin(2 * np.pi * month0 / 12)
+        self.month_cos = np.cos(2 * np.pi * month0 / 12)
+        day_of_month = (dates - dates.astype("datetime64[M]")).astype("int64") + 1
+        self.is_payday = np.isin(day_of_month, _PAYDAYS).astype(float)
+
+    def index(self, dates: np.ndarray) -> np.ndarray:
+        """datetime64[D] 배열 → 테이블 인덱스"""
+        return (dates - self.base).astype("int64")
+
+
+def _non_stockout_avg(sale: np.ndarray, avail: np.ndarray, min_days: int) -> Optional[float]:
+    """비품절 평균 (최근 14일 → 30일 폴백), 부족하면 None"""
+    for window in (14, 30):
+        mask = avail[-window:]
+        if int(mask.sum()) >= min_days:
+            return float(sale[-window:][mask].sum() / mask.sum())
+    return None
+
+
+def _rolling_sum(values: np.ndarray, start: int, window: int) -> np.ndarray:
+    """샘플 i(start..n-1)별 values[max(0, i-window):i] 합계"""
+    csum = np.concatenate(([0.0], np.cumsum(values, dtype=float)))
+    idx = np.arange(start, len(values))
+    return csum[idx] - csum[np.maximum(0, idx - window)]
+
+
+def build_item_feature_matrix(
+    daily_sales: Sequence[Dict[str, Any]],
+    date_table: DateFeatureTable,
+    *,
+    item_cd: str = "",
+    meta: Optional[Dict[str, Any]] = None,
+    promo_ranges: Sequence[Tuple[str, str]] = (),
+    receiving_stats: Optional[Dict[str, float]] = None,
+    hourly_ratios: Optional[Dict[str, float]] = None,
+    data_days: int = 0,
+    smallcd_peer_avg: float = 0.0,
+    lifecycle_stage: float = 1.0,
+    with_lags: bool = True,
+    with_temperature_delta: bool = True,
+    with_holiday_context: bool = True,
+) -> FeatureMatrix:
+    """상품 1개의 일별 판매 이력 → 학습 샘플 행렬
+
+    샘플 i (7 ≤ i < n)는 daily_sales[i]를 target, daily_sales[:i]를 history로 하며,
+    MLTrainer의 샘플 dict + build_features() 결과와 동일한 값을 만든다.
+
+    Args:
+        daily_sales: 날짜 오름차순 일별 판매 (_fill_missing_dates 보간 완료)
+        date_table: 날짜 피처 테이블 (daily_sales 기간을 포함해야 함)
+        with_lags: lag_7/lag_28/week_over_week 사용 여부 (그룹 모델은 False)
+        with_temperature_delta: 전일 대비 기온 사용 여부 (그룹 모델은 False)
+        with_holiday_context: 연휴 길이/전날/다음날 사용 여부 (그룹 모델은 False)
+
+    Returns:
+        FeatureMatrix (샘플 없으면 빈 행렬)
+    """
+    if len(daily_sales) <= _SAMPLE_START:
+        return FeatureMatrix.empty()
+    arrays = GroupSalesArrays.from_histories({item_cd: daily_sales}, [item_cd])
+    return _item_feature_matrix(
+        *arrays.item(0),
+        date_table,
+        item_cd=item_cd,
+        meta=meta,
+        promo_ranges=promo_ranges,
+        receiving_stats=receiving_stats,
+        hourly_ratios=hourly_ratios,
+        data_days=data_days,
+        smallcd_peer_avg=smallcd_peer_avg,
+        lifecycle_stage=lifecycle_stage,
+        with_lags=with_lags,
+        with_temperature_delta=with_temperature_delta,
+        with_holiday_context=with_holiday_context,
+    )
+
+
+def build_group_feature_matrix(
+    arrays: GroupSalesArrays,
+    date_table: DateFeatureTable,
+    contexts: Sequence[Dict[str, Any]],
+    **options: bool,
+) -> FeatureMatrix:
+    """그룹 공유 판매 배열 → 그룹 학습 행렬 (상품 순서대로 행 배치)
+
+    sample_index()로 전체 샘플 수를 먼저 구해 X/y를 한 번만 할당하고
+    상품별 블록을 채우므로, 상품별 행렬을 모아 concat 하는 중간 복사가 없다.
+
+    Args:
+        arrays: 그룹 공유 판매 배열
+        date_table: 날짜 피처 테이블 (arrays 기간 포함)
+        contexts: 상품 k별 build_item_feature_matrix 키워드 (meta, promo_ranges 등)
+        **options: with_lags / with_temperature_delta / with_holiday_context
+
+    Returns:
+        FeatureMatrix (샘플 없으면 빈 행렬)
+    """
+    item_idx, _ = arrays.sample_index()
+    total = len(item_idx)
+    if not total:
+        return FeatureMatrix.empty()
+    bounds = np.searchsorted(item_idx, np.arange(len(arrays) + 1))
+
+    X = np.empty((total, len(MLFeatureBuilder.FEATURE_NAMES)), dtype=np.float32)
+    y = np.empty(total, dtype=np.float32)
+    dates = np.empty(total, dtype="<U10")
+    item_codes: List[str] = []
+    for k, item_cd in enumerate(arrays.item_codes):
+        b, e = int(bounds[k]), int(bounds[k + 1])
+        if b == e:
+            continue
+        part = _item_feature_matrix(
+            *arrays.item(k), date_table, item_cd=item_cd, **contexts[k], **options
+        )
+        X[b:e], y[b:e], dates[b:e] = part.X, part.y, part.dates
+        item_codes.extend(part.item_codes)
+    return FeatureMatrix(X=X, y=y, dates=dates, item_codes=item_codes)
+
+
+def _item_feature_matrix(
+    sale: np.ndarray,
+    stock: np.ndarray,
+    stock_known: np.ndarray,
+    dates: np.ndarray,
+    date_table: DateFeatureTable,
+    *,
+    item_cd: str = "",
+    meta: Optional[Dict[str, Any]] = None,
+    promo_ranges: Sequence[Tuple[str, str]] = (),
+    receiving_stats: Optional[Dict[str, float]] = None,
+    hourly_ratios: Optional[Dict[str, float]] = None,
+    data_days: int = 0,
+    smallcd_peer_avg: float = 0.0,
+    lifecycle_stage: float = 1.0,
+    with_lags: bool = True,
+    with_temperature_delta: bool = True,
+    with_holiday_context: bool = True,
+) -> FeatureMatrix:
+    """상품 1개 판매 배열 → 학습 샘플 행렬 (build_item_feature_matrix 본체)"""
+    n = len(sale)
+    if n <= _SAMPLE_START:
+        return FeatureMatrix.empty()
+
+    meta = meta or {}
+    so_cfg = PREDICTION_PARAMS.get("ml_stockout_filter", {})
+    so_enabled = so_cfg.get("enabled", False)
+    so_min_days = so_cfg.get("min_available_days", 3)
+
+    avail = stock_known & (stock > 0)
+    zero_stockout = stock_known & (stock == 0) & (sale == 0)
+
+    start = _SAMPLE_START
+    m = n - start
+    t_idx = date_table.index(dates[start:])
+
+    # ── history 윈도우 (build_features 품절일 imputation: 샘플별 history 기준) ──
+    padded = np.concatenate((np.full(_HISTORY_WINDOW, np.nan), sale))
+    hist = sliding_window_view(padded, _HISTORY_WINDOW)[start:n].copy()
+    if so_enabled:
+        cnt14 = _rolling_sum(avail, start, 14)
+        cnt30 = _rolling_sum(avail, start, 30)
+        sale_avail = np.where(avail, sale, 0.0)
+        sum14 = _rolling_sum(sale_avail, start, 14)
+        sum30 = _rolling_sum(sale_avail, start, 30)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            hist_avg = np.where(
+                cnt14 >= so_min_days, sum14 / cnt14,
+                np.where(cnt30 >= so_min_days, sum30 / cnt30, np.nan),
+            )
+        zpad = np.concatenate((np.zeros(_HISTORY_WINDOW, dtype=bool), zero_stockout))
+        zwin = sliding_window_view(zpad, _HISTORY_WINDOW)[start:n]
+        replace = zwin & ~np.isnan(hist_avg)[:, None]
+        hist = np.where(replace, hist_avg[:, None], hist)
+
+    daily_avg_7 = np.nanmean(hist[:, -7:], axis=1)
+    daily_avg_14 = np.nanmean(hist[:, -14:], axis=1)
+    daily_avg_31 = np.nanmean(hist, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        trend_score = np.where(daily_avg_31 > 0, daily_avg_7 / daily_avg_31, 1.0)
+        cv = np.where(daily_avg_14 > 0, np.nanstd(hist[:, -14:], axis=1) / daily_avg_14, 0.0)
+
+    # ── 상품 단위 비품절 평균 (Y/lag imputation, 전체 이력 기준) ──
+    item_avg = _non_stockout_avg(sale, avail, so_min_days) if so_enabled else None
+
+    def _imputed(values: np.ndarray, zero_mask: np.ndarray) -> np.ndarray:
+        if item_avg is None:
+            return values
+        return np.where(zero_mask, item_avg, values)
+
+    y = _imputed(sale[start:], zero_stockout[start:])
+
+    # ── Lag Features (날짜 기준 조회, 결측=정보없음) ──
+    norm_lag_7 = np.zeros(m)
+    norm_lag_28 = np.zeros(m)
+    norm_wow = np.zeros(m)
+    if with_lags:
+        target_dates = dates[start:]
+
+        def _lookup(offset: int) -> Tuple[np.ndarray, np.ndarray]:
+            want = target_dates - offset
+            pos = np.minimum(np.searchsorted(dates, want), n - 1)
+            found = dates[pos] == want
+            return _imputed(sale[pos], zero_stockout[pos]), found
+
+        lag7, has7 = _lookup(7)
+        lag28, has28 = _lookup(28)
+        lag14, has14 = _lookup(14)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            norm_lag_7 = np.where(
+                has7, np.where(daily_avg_7 > 0, lag7 / daily_avg_7, lag7), 0.0
+            )
+            norm_lag_28 = np.where(
+                has28, np.where(daily_avg_31 > 0, lag28 / daily_avg_31, lag28), 0.0
+            )
+            wow = np.where(
+                lag14 > 0, np.round((lag7 - lag14) / lag14, 3),
+                np.where(lag7 > 0, 1.0, 0.0),
+            )
+        norm_wow = np.where(has7 & has14, np.clip(wow, -1.0, 3.0), 0.0)
+
+    # ── 행사 여부 ──
+    target_strs = dates[start:].astype(str)
+    promo = np.zeros(m, dtype=bool)
+    for s, e in promo_ranges:
+        promo |= (target_strs >= s) & (target_strs <= e)
+
+    # ── 상품 단위 상수 피처 ──
+    expiration_days = meta.get("expiration_days", 0)
+    norm_expiry = np.log1p(float(expiration_days)) if expiration_days > 0 else 0.0
+    recv = receiving_stats or {}
+    lt_avg = float(recv.get("lead_time_avg", 0.0))
+    lt_std = float(recv.get("lead_time_std", 0.0))
+    lt_cv = (lt_std / max(lt_avg, 0.001)) if lt_avg > 0 else 0.25
+    with np.errstate(invalid="ignore", divide="ignore"):
+        relative_position = (
+            np.minimum(daily_avg_7 / float(smallcd_peer_avg), 3.0)
+            if smallcd_peer_avg > 0 else np.zeros(m)
+        )
+
+    dt = date_table
+    weekday = dt.weekday[t_idx]
+    is_weekend = (weekday >= 5).astype(float)
+    temp_norm = dt.temp_norm[t_idx]
+    zeros = np.zeros(m)
+
+    def _const(value: float) -> np.ndarray:
+        return np.full(m, float(value))
+
+    columns = [
+        daily_avg_7,
+        daily_avg_14,
+        daily_avg_31,
+        stock[start - 1:n - 1],                      # 전일 마감 재고 (None → 0)
+        zeros,                                       # pending_qty
+        trend_score,
+        cv,
+        dt.weekday_sin[t_idx],
+        dt.weekday_cos[t_idx],
+        dt.month_sin[t_idx],
+        dt.month_cos[t_idx],
+        is_weekend,
+        dt.is_holiday[t_idx],
+        promo.astype(float),
+        _const(norm_expiry),
+        _const(meta.get("disuse_rate", 0.0)),
+        _const(float(meta.get("margin_rate", 0.0)) / 100.0),
+        temp_norm,
+        dt.temp_delta_norm[t_idx] if with_temperature_delta else zeros,
+        norm_lag_7,
+        norm_lag_28,
+        norm_wow,
+        zeros,                                       # association_score
+        dt.holiday_period[t_idx] if with_holiday_context else zeros,
+        dt.is_pre_holiday[t_idx] if with_holiday_context else zeros,
+        dt.is_post_holiday[t_idx] if with_holiday_context else zeros,
+        _const(min(lt_avg / 3.0, 1.0)),
+        _const(min(lt_cv / 2.0, 1.0)),
+        _const(recv.get("short_delivery_rate", 0.0)),
+        _const(float(recv.get("delivery_frequency", 0)) / 14.0),
+        _const(min(float(recv.get("pending_age_days", 0)) / 5.0, 1.0)),
+        _const(min(float(data_days) / 60.0, 1.0)),
+        _const(min(float(smallcd_peer_avg) / 10.0, 1.0)),
+        relative_position,
+        _const(lifecycle_stage),
+        dt.rain_level[t_idx],
+        dt.sky[t_idx],
+        dt.is_payday[t_idx],
+        dt.pm25_level[t_idx],
+        *(_const(v) for v in MLFeatureBuilder._hourly_feature_values(hourly_ratios)),
+        (weekday == 4).astype(float),
+        ((weekday == 4) | (weekday == 5)).astype(float),
+        np.where(dt.temp_present[t_idx], temp_norm, 0.0) * is_weekend,
+    ]
+    X = np.column_stack(columns).astype(np.float32)
+
+    return FeatureMatrix(
+        X=X,
+        y=y.astype(np.float32),
+        dates=target_strs,
+        item_codes=[item_cd] * m,
+    )
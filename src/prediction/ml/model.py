@@ -162,6 +162,28 @@ class MLPredictor:
         logger.debug("로드된 ML 모델 없음")
         return False
 
+    def model_signature(self) -> tuple:
+        """모델 파일 (이름, 수정시각, 크기) 목록 — 재학습 감지용 (warm-prediction-daemon)"""
+        dirs = [self.model_dir]
+        if self.model_dir != MODEL_BASE_DIR:
+            dirs.append(MODEL_BASE_DIR)
+        sig = []
+        for target_dir in dirs:
+            for path in sorted(target_dir.glob("*.joblib")) + [target_dir / "model_meta.json"]:
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                sig.append((str(path), st.st_mtime_ns, st.st_size))
+        return tuple(sig)
+
+    def unload(self) -> None:
+        """로드된 모델 해제 — 다음 load_models()/load_group_models()에서 다시 로드"""
+        self.models = {}
+        self.group_models = {}
+        self._loaded = False
+        self._group_loaded = False
+
     def save_model(
         self,
         group_name: str,
@@ -9,14 +9,20 @@ import json
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 
 from src.utils.logger import get_logger
-from src.prediction.prediction_config import PREDICTION_PARAMS
 from .data_pipeline import MLDataPipeline
 from .feature_builder import MLFeatureBuilder, get_category_group, CATEGORY_GROUPS
+from .feature_matrix import (
+    DateFeatureTable,
+    FeatureMatrix,
+    GroupSalesArrays,
+    build_group_feature_matrix,
+    build_item_feature_matrix,
+)
 from .model import MLPredictor
 
 logger = get_logger(__name__)
@@ -44,6 +50,70 @@ GROUP_QUANTILE_ALPHA = {
 }
 
 
+def _load_training_caches(
+    pipeline: MLDataPipeline,
+    store_id: Optional[str],
+    item_codes: List[str],
+    days: int,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]],
+           Dict[str, List[Tuple[str, str]]], Dict[str, Dict[str, float]]]:
+    """학습 공통 캐시 일괄 로드 (상품 메타, 기간 내 외부요인, 행사 기간, 입고패턴)
+
+    Returns:
+        (item_meta, weather_data, promo_cache, receiving_stats_cache)
+    """
+    # 상품별 메타정보 일괄 조회 (유통기한, 이익률, 폐기율)
+    item_meta = pipeline.get_items_meta(item_codes)
+
+    # 기간 내 기온 데이터 조회
+    end_date = datetime.now().strftime("%Y-%m-%d")
+    start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    weather_data = pipeline.get_external_factors(start_date, end_date)
+
+    # 행사 데이터 일괄 캐시 {item_cd: [(start_date, end_date), ...]}
+    promo_cache: Dict[str, List[Tuple[str, str]]] = {}
+    try:
+        _conn = pipeline._get_conn()
+        try:
+            _cur = _conn.cursor()
+            _cur.execute(
+                "SELECT item_cd, start_date, end_date FROM promotions WHERE is_active = 1"
+            )
+            for _r in _cur.fetchall():
+                promo_cache.setdefault(_r[0], []).append((_r[1], _r[2]))
+        finally:
+            _conn.close()
+    except Exception:
+        logger.debug("DB 테이블 미존재, False 폴백", exc_info=True)
+        pass  # 테이블 미존재 등 → 전부 False 폴백
+
+    # 입고 패턴 통계 배치 캐시 (receiving-pattern)
+    receiving_stats_cache: Dict[str, Dict[str, float]] = {}
+    try:
+        from src.infrastructure.database.repos.receiving_repo import ReceivingRepository
+        from src.infrastructure.database.repos.order_tracking_repo import OrderTrackingRepository
+
+        recv_repo = ReceivingRepository(store_id=store_id)
+        ot_repo = OrderTrackingRepository(store_id=store_id)
+
+        pattern_stats = recv_repo.get_receiving_pattern_stats_batch(
+            store_id=store_id, days=days
+        )
+        pending_ages = ot_repo.get_pending_age_batch(store_id=store_id)
+
+        all_items = set(pattern_stats.keys()) | set(pending_ages.keys())
+        for _item_cd in all_items:
+            stats = dict(pattern_stats.get(_item_cd, {}))
+            stats["pending_age_days"] = pending_ages.get(_item_cd, 0)
+            receiving_stats_cache[_item_cd] = stats
+
+        logger.info(f"[학습] 입고패턴 캐시: {len(receiving_stats_cache)}개 상품")
+    except Exception as e:
+        logger.debug(f"[학습] 입고패턴 캐시 로드 실패 (무시): {e}")
+
+    return item_meta, weather_data, promo_cache, receiving_stats_cache
+
+
 class MLTrainer:
     """ML 모델 학습기
 
@@ -57,282 +127,109 @@ class MLTrainer:
         self.pipeline = MLDataPipeline(db_path=db_path, store_id=store_id)
         self.predictor = MLPredictor(store_id=store_id)
 
-    def _prepare_training_data(
-        self, days: int = 90
-    ) -> Dict[str, List[Dict[str, Any]]]:
+    def _load_item_histories(
+        self, items: List[Dict[str, Any]], days: int, min_len: int
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, dict], Optional[Tuple[str, str]]]:
+        """상품 일별 판매(1회 쿼리) + 시간대 Feature(기준일별 1회 쿼리) 일괄 로드
+
+        Returns:
+            (histories, hourly_ratios, (최초일, 최종일)) — 이력 min_len일 미만 상품 제외
         """
-        학습 데이터 준비 (카테고리 그룹별)
+        batch = self.pipeline.get_batch_daily_stats([i["item_cd"] for i in items], days)
+        histories = {
+            item_cd: rows for item_cd, rows in batch.items() if len(rows) >= min_len
+        }
+        if not histories:
+            return {}, {}, None
+
+        hourly = MLFeatureBuilder.calc_hourly_ratios_batch(
+            store_id=self.store_id or "",
+            base_dates={item_cd: rows[-1]["sales_date"] for item_cd, rows in histories.items()},
+            days=14,
+        )
+        first = min(rows[0]["sales_date"] for rows in histories.values())
+        last = max(rows[-1]["sales_date"] for rows in histories.values())
+        return histories, hourly, (first, last)
+
+    def _iter_feature_matrices(self, days: int = 90) -> Iterator[Tuple[str, FeatureMatrix]]:
+        """
+        학습 Feature 행렬을 카테고리 그룹 단위로 스트리밍 (lean-training-samples)
+
+        그룹마다 이력 조회 → GroupSalesArrays 변환(rows dict 해제) → 행렬 생성 순으로
+        처리하므로, 피크 메모리는 전체 상품이 아닌 가장 큰 그룹 하나에 비례한다.
+        값은 샘플마다 build_features()를 부르던 행 단위 루프와 동일
+        (tests/ml_training_reference.py 참조 구현과 열 단위 비교).
 
         Args:
             days: 학습 데이터 기간
 
-        Returns:
-            {group_name: [{daily_sales, target_date, mid_cd, actual_sale_qty, ...}, ...]}
+        Yields:
+            (group_name, FeatureMatrix) — CATEGORY_GROUPS 순서, 모든 그룹 포함
         """
-        # 활성 상품 목록
         active_items = self.pipeline.get_active_items(min_days=14)
         if not active_items:
             logger.warning("활성 상품 없음. 학습 데이터 없음.")
-            return {}
+            return
 
         logger.info(f"학습 대상 상품: {len(active_items)}개")
 
-        # 상품별 메타정보 일괄 조회 (유통기한, 이익률, 폐기율)
-        item_meta = self.pipeline.get_items_meta([i["item_cd"] for i in active_items])
-
-        # 기간 내 기온 데이터 조회
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-        weather_data = self.pipeline.get_external_factors(start_date, end_date)
-
-        # 그룹별 학습 데이터 분류
-        group_data: Dict[str, List[Dict[str, Any]]] = {
-            group: [] for group in CATEGORY_GROUPS
-        }
-
-        # ML 품절일 imputation 설정
-        _ml_so_cfg = PREDICTION_PARAMS.get("ml_stockout_filter", {})
-        ml_stockout_enabled = _ml_so_cfg.get("enabled", False)
-        ml_stockout_min_days = _ml_so_cfg.get("min_available_days", 3)
-
-        # 행사 데이터 일괄 캐시 {item_cd: [(start_date, end_date), ...]}
-        promo_cache: Dict[str, List[Tuple[str, str]]] = {}
-        try:
-            _conn = self.pipeline._get_conn()
-            try:
-                _cur = _conn.cursor()
-                _cur.execute(
-                    "SELECT item_cd, start_date, end_date FROM promotions WHERE is_active = 1"
-                )
-                for _r in _cur.fetchall():
-                    promo_cache.setdefault(_r[0], []).append((_r[1], _r[2]))
-            finally:
-                _conn.close()
-        except Exception:
-            logger.debug("DB 테이블 미존재, False 폴백", exc_info=True)
-            pass  # 테이블 미존재 등 → 전부 False 폴백
-
-        # 입고 패턴 통계 배치 캐시 (receiving-pattern)
-        receiving_stats_cache: Dict[str, Dict[str, float]] = {}
-        try:
-            from src.infrastructure.database.repos.receiving_repo import ReceivingRepository
-            from src.infrastructure.database.repos.order_tracking_repo import OrderTrackingRepository
-
-            recv_repo = ReceivingRepository(store_id=self.store_id)
-            ot_repo = OrderTrackingRepository(store_id=self.store_id)
-
-            pattern_stats = recv_repo.get_receiving_pattern_stats_batch(
-                store_id=self.store_id, days=days
-            )
-            pending_ages = ot_repo.get_pending_age_batch(store_id=self.store_id)
-
-            all_items = set(pattern_stats.keys()) | set(pending_ages.keys())
-            for _item_cd in all_items:
-                stats = dict(pattern_stats.get(_item_cd, {}))
-                stats["pending_age_days"] = pending_ages.get(_item_cd, 0)
-                receiving_stats_cache[_item_cd] = stats
-
-            logger.info(f"[학습] 입고패턴 캐시: {len(receiving_stats_cache)}개 상품")
-        except Exception as e:
-            logger.debug(f"[학습] 입고패턴 캐시 로드 실패 (무시): {e}")
-
-        # 시간대 Feature 캐시 (item_cd별 1회 조회)
-        _hourly_cache: Dict[str, dict] = {}
-
+        caches = _load_training_caches(
+            self.pipeline, self.store_id, [i["item_cd"] for i in active_items], days
+        )
+        group_items: Dict[str, List[Dict[str, Any]]] = {group: [] for group in CATEGORY_GROUPS}
         for item_info in active_items:
-            item_cd = item_info["item_cd"]
-            mid_cd = item_info["mid_cd"]
-            group = get_category_group(mid_cd)
-
-            # 일별 판매 데이터 조회
-            daily_sales = self.pipeline.get_item_daily_stats(item_cd, days)
-            if len(daily_sales) < 14:
-                continue
-
-            # 시간대 Feature 조회 (캐시: item_cd별 1회)
-            if item_cd not in _hourly_cache:
-                _hourly_cache[item_cd] = MLFeatureBuilder.calc_hourly_ratios(
-                    store_id=self.store_id or "",
-                    item_cd=item_cd,
-                    base_date=daily_sales[-1]["sales_date"],
-                    days=14,
-                )
-
-            # 상품 메타정보
-            meta = item_meta.get(item_cd, {})
-
-            # A0: 품절일 imputation용 비품절 평균 (최근 14일 → 30일 폴백)
-            _non_stockout_avg = None
-            if ml_stockout_enabled:
-                _avail_14 = [
-                    (d.get("sale_qty", 0) or 0)
-                    for d in daily_sales[-14:]
-                    if d.get("stock_qty") is not None and d.get("stock_qty", 0) > 0
-                ]
-                if len(_avail_14) >= ml_stockout_min_days:
-                    _non_stockout_avg = sum(_avail_14) / len(_avail_14)
-                else:
-                    _avail_30 = [
-                        (d.get("sale_qty", 0) or 0)
-                        for d in daily_sales[-30:]
-                        if d.get("stock_qty") is not None and d.get("stock_qty", 0) > 0
-                    ]
-                    if len(_avail_30) >= ml_stockout_min_days:
-                        _non_stockout_avg = sum(_avail_30) / len(_avail_30)
-
-            # 학습 샘플 생성: 7일 이전까지의 각 날짜를 target으로
-            # (최소 7일의 이전 데이터를 feature로 사용)
-            # Lag 계산을 위한 판매량 인덱싱 (날짜→인덱스 맵)
-            date_to_idx = {row["sales_date"]: idx for idx, row in enumerate(daily_sales)}
-
-            for i in range(7, len(daily_sales)):
-                target_row = daily_sales[i]
-                history = daily_sales[:i]
-
-                # 해당 날짜의 외부 요인 조회 (기온, 공휴일 등)
-                target_date_str = target_row["sales_date"]
-                day_factors = weather_data.get(target_date_str, {})
-                temp_str = day_factors.get("temperature")
-                temp_val = None
-                if temp_str is not None:
-                    try:
-                        temp_val = float(temp_str)
-                    except (ValueError, TypeError):
-                        pass
-
-                # 전일 기온 → 기온 변화량 계산
-                temp_delta_val = None
-                if temp_val is not None:
-                    prev_date_str = (datetime.strptime(target_date_str, "%Y-%m-%d") - timedelta(days=1)).strftime("%Y-%m-%d")
-                    prev_factors = weather_data.get(prev_date_str, {})
-                    prev_temp_str = prev_factors.get("temperature")
-                    if prev_temp_str is not None:
-                        try:
-                            temp_delta_val = temp_val - float(prev_temp_str)
-                        except (ValueError, TypeError):
-                            pass
-
-                # 공휴일 여부
-                holiday_str = day_factors.get("is_holiday", "false")
-                is_holiday = holiday_str.lower() in ("true", "1", "yes")
-
-                # 연휴 맥락 (2026-02-18 추가)
-                holiday_period = int(day_factors.get("holiday_period_days", "0") or "0")
-                pre_holiday = day_factors.get("is_pre_holiday", "false").lower() in ("true", "1")
-                post_holiday = day_factors.get("is_post_holiday", "false").lower() in ("true", "1")
-
-                # Lag Features 계산 (학습 시점 기준)
-                lag_7_val = None
-                lag_28_val = None
-                wow_val = None
-                try:
-                    target_dt = datetime.strptime(target_date_str, "%Y-%m-%d")
-                    # lag_7: 7일 전 판매량 (A2: 품절일 imputation)
-                    lag7_date = (target_dt - timedelta(days=7)).strftime("%Y-%m-%d")
-                    if lag7_date in date_to_idx:
-                        _lag7_row = daily_sales[date_to_idx[lag7_date]]
-                        _lag7_sale = _lag7_row.get("sale_qty", 0) or 0
-                        _lag7_stock = _lag7_row.get("stock_qty")
-                        if (_non_stockout_avg is not None
-                                and _lag7_stock is not None and _lag7_stock == 0
-                                and _lag7_sale == 0):
-                            lag_7_val = _non_stockout_avg
-                        else:
-                            lag_7_val = _lag7_sale
-                    # lag_28: 28일 전 판매량 (A2: 품절일 imputation)
-                    lag28_date = (target_dt - timedelta(days=28)).strftime("%Y-%m-%d")
-                    if lag28_date in date_to_idx:
-                        _lag28_row = daily_sales[date_to_idx[lag28_date]]
-                        _lag28_sale = _lag28_row.get("sale_qty", 0) or 0
-                        _lag28_stock = _lag28_row.get("stock_qty")
-                        if (_non_stockout_avg is not None
-                                and _lag28_stock is not None and _lag28_stock == 0
-                                and _lag28_sale == 0):
-                            lag_28_val = _non_stockout_avg
-                        else:
-                            lag_28_val = _lag28_sale
-                    # week_over_week: (7일전 - 14일전) / 14일전 (A2: 품절일 imputation)
-                    lag14_date = (target_dt - timedelta(days=14)).strftime("%Y-%m-%d")
-                    if lag7_date in date_to_idx and lag14_date in date_to_idx:
-                        _r7 = daily_sales[date_to_idx[lag7_date]]
-                        _r14 = daily_sales[date_to_idx[lag14_date]]
-                        qty_7 = _r7.get("sale_qty", 0) or 0
-                        qty_14 = _r14.get("sale_qty", 0) or 0
-                        if _non_stockout_avg is not None:
-                            if (_r7.get("stock_qty") is not None and _r7["stock_qty"] == 0 and qty_7 == 0):
-                                qty_7 = _non_stockout_avg
-                            if (_r14.get("stock_qty") is not None and _r14["stock_qty"] == 0 and qty_14 == 0):
-                                qty_14 = _non_stockout_avg
-                        if qty_14 > 0:
-                            wow_val = round((qty_7 - qty_14) / qty_14, 3)
-                        elif qty_7 > 0:
-                            wow_val = 1.0
-                        else:
-                            wow_val = 0.0
-                except (ValueError, KeyError):
-                    pass
-
-                # A1: Y값 품절일 imputation
-                _target_sale_qty = target_row.get("sale_qty", 0) or 0
-                _target_stock = target_row.get("stock_qty")
-                if (_non_stockout_avg is not None
-                        and _target_stock is not None and _target_stock == 0
-                        and _target_sale_qty == 0):
-                    _target_sale_qty = _non_stockout_avg
-
-                # 외부 환경 피처 (35→39 확장)
-                _rain_qty_train = 0.0
-                _sky_nm_train = ""
-                _pm25_train = 0.0
-                try:
-                    _rain_qty_train = float(day_factors.get("rain_qty", 0) or 0)
-                    _sky_nm_train = str(day_factors.get("weather_cd_nm", "") or "")
-                    _pm25_train = float(day_factors.get("pm25", 0) or 0)
-                except (ValueError, TypeError):
-                    pass
-                _target_dt_day = datetime.strptime(target_date_str, "%Y-%m-%d").day
-                _is_payday_train = 1 if _target_dt_day in (10, 11, 12, 25, 26, 27) else 0
-
-                sample = {
-                    "item_cd": item_cd,
-                    "daily_sales": history,
-                    "target_date": target_date_str,
-                    "mid_cd": mid_cd,
-                    "actual_sale_qty": _target_sale_qty,
-                    "stock_qty": daily_sales[i - 1].get("stock_qty", 0) or 0,  # 전일 마감 재고 (leakage 제거)
-                    "pending_qty": 0,
-                    "promo_active": any(
-                        s <= target_date_str <= e for s, e in promo_cache.get(item_cd, [])
-                    ),
-                    "expiration_days": meta.get("expiration_days", 0),
-                    "disuse_rate": meta.get("disuse_rate", 0.0),
-                    "margin_rate": meta.get("margin_rate", 0.0),
-                    "temperature": temp_val,
-                    "temperature_delta": temp_delta_val,
-                    "lag_7": lag_7_val,
-                    "lag_28": lag_28_val,
-                    "week_over_week": wow_val,
-                    "is_holiday": is_holiday,
-                    "holiday_period_days": holiday_period,
-                    "is_pre_holiday": pre_holiday,
-                    "is_post_holiday": post_holiday,
-                    "receiving_stats": receiving_stats_cache.get(item_cd),
-                    "large_cd": meta.get("large_cd"),
-                    "rain_qty": _rain_qty_train,
-                    "sky_nm": _sky_nm_train,
-                    "is_payday": _is_payday_train,
-                    "pm25": _pm25_train,
-                    "hourly_ratios": _hourly_cache.get(item_cd, {}),
-                }
+            group_items[get_category_group(item_info["mid_cd"])].append(item_info)
+
+        for group, items in group_items.items():
+            # 호출자가 이전 그룹 행렬을 놓으면 바로 해제되도록 로컬에 보관하지 않음
+            yield group, self._build_group_feature_matrix(items, days, *caches)
+
+    def _build_group_feature_matrix(
+        self,
+        items: List[Dict[str, Any]],
+        days: int,
+        item_meta: Dict[str, Dict[str, Any]],
+        weather_data: Dict[str, Dict[str, Any]],
+        promo_cache: Dict[str, List[Tuple[str, str]]],
+        receiving_stats_cache: Dict[str, Dict[str, float]],
+    ) -> FeatureMatrix:
+        """그룹 상품 → 학습 행렬 (이력은 공유 판매 배열로만 보관)"""
+        if not items:
+            return FeatureMatrix.empty()
+        histories, hourly, span = self._load_item_histories(items, days, min_len=14)
+        if span is None:
+            return FeatureMatrix.empty()
+        arrays = GroupSalesArrays.from_histories(histories, [i["item_cd"] for i in items])
+        del histories
+
+        contexts = [
+            {
+                "meta": item_meta.get(item_cd, {}),
+                "promo_ranges": promo_cache.get(item_cd, []),
+                "receiving_stats": receiving_stats_cache.get(item_cd),
+                "hourly_ratios": hourly.get(item_cd, {}),
+            }
+            for item_cd in arrays.item_codes
+        ]
+        fm = build_group_feature_matrix(arrays, DateFeatureTable(weather_data, *span), contexts)
+        if len(fm):
+            logger.info(f"  {get_category_group(items[0]['mid_cd'])}: {len(fm)}개 샘플")
+        return fm
+
+    def _prepare_feature_matrices(self, days: int = 90) -> Dict[str, FeatureMatrix]:
+        """
+        학습 Feature 행렬 준비 (카테고리 그룹별, columnar-feature-matrix)
 
-                group_data[group].append(sample)
+        전체 그룹을 한 번에 메모리에 올린다. 학습 본 경로(train_all_groups)는
+        _iter_feature_matrices()로 그룹 단위 스트리밍한다.
 
-        # 결과 요약
-        for group, samples in group_data.items():
-            if samples:
-                logger.info(f"  {group}: {len(samples)}개 샘플")
+        Args:
+            days: 학습 데이터 기간
 
-        return group_data
+        Returns:
+            {group_name: FeatureMatrix} (모든 CATEGORY_GROUPS 키 포함, 활성 상품 없으면 {})
+        """
+        return dict(self._iter_feature_matrices(days))
 
     # 성능 보호 게이트 임계값 (MAE 악화 허용 비율)
     PERFORMANCE_GATE_THRESHOLD = 0.2  # 20%
@@ -411,9 +308,7 @@ class MLTrainer:
             학습 결과 {group: {success, samples, metrics}}
         """
         try:
-            from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-            from sklearn.model_selection import train_test_split
-            from sklearn.metrics import mean_absolute_error, mean_squared_error
+            import sklearn  # noqa: F401  (_fit_group_ensemble에서 사용)
         except ImportError:
             logger.warning("scikit-learn 미설치. pip install scikit-learn")
             return {"error": "scikit-learn not installed"}
@@ -424,219 +319,186 @@ class MLTrainer:
         logger.info(f"ML 모델 학습 시작 [{mode_label}]{store_label}: {datetime.now().isoformat()}")
         logger.info("=" * 60)
 
-        # 학습 데이터 준비
-        group_data = self._prepare_training_data(days)
+        # 그룹 단위 스트리밍 학습 (lean-training-samples): 그룹 행렬은 학습 후 바로 해제
         results = {}
+        for group_name, fm in self._iter_feature_matrices(days):
+            results[group_name] = self._fit_group_ensemble(group_name, fm, incremental)
+            del fm
 
-        for group_name, samples in group_data.items():
-            if len(samples) < MIN_TRAINING_SAMPLES:
-                logger.info(f"[{group_name}] 샘플 부족 ({len(samples)} < {MIN_TRAINING_SAMPLES}). 스킵.")
-                results[group_name] = {
-                    "success": False,
-                    "reason": f"insufficient_samples ({len(samples)})",
-                }
-                continue
-
-            logger.info(f"[{group_name}] 학습 시작: {len(samples)}개 샘플")
-
-            # Feature 배열 생성 + 날짜 추적 (시계열 분할용)
-            X_list, y_list, valid_dates = [], [], []
-            for s in samples:
-                feat = MLFeatureBuilder.build_features(
-                    daily_sales=s.get("daily_sales", []),
-                    target_date=s.get("target_date", ""),
-                    mid_cd=s.get("mid_cd", ""),
-                    stock_qty=s.get("stock_qty", 0),
-                    pending_qty=s.get("pending_qty", 0),
-                    promo_active=s.get("promo_active", False),
-                    expiration_days=s.get("expiration_days", 0),
-                    disuse_rate=s.get("disuse_rate", 0.0),
-                    margin_rate=s.get("margin_rate", 0.0),
-                    temperature=s.get("temperature"),
-                    temperature_delta=s.get("temperature_delta"),
-                    lag_7=s.get("lag_7"),
-                    lag_28=s.get("lag_28"),
-                    week_over_week=s.get("week_over_week"),
-                    is_holiday=s.get("is_holiday", False),
-                    association_score=s.get("association_score", 0.0),
-                    holiday_period_days=s.get("holiday_period_days", 0),
-                    is_pre_holiday=s.get("is_pre_holiday", False),
-                    is_post_holiday=s.get("is_post_holiday", False),
-                    receiving_stats=s.get("receiving_stats"),
-                    large_cd=s.get("large_cd"),
-                    rain_qty=s.get("rain_qty", 0.0),
-                    sky_nm=s.get("sky_nm", ""),
-                    is_payday=s.get("is_payday", 0),
-                    pm25=s.get("pm25", 0.0),
-                    hourly_ratios=s.get("hourly_ratios"),
-                )
-                if feat is not None:
-                    X_list.append(feat)
-                    y_list.append(float(s.get("actual_sale_qty", 0)))
-                    valid_dates.append(s["target_date"])
+        logger.info("=" * 60)
+        logger.info("ML 모델 학습 완료")
+        success_count = sum(1 for r in results.values() if r.get("success"))
+        logger.info(f"성공: {success_count}/{len(results)} 그룹")
+        logger.info("=" * 60)
 
-            if len(X_list) < MIN_TRAINING_SAMPLES:
-                results[group_name] = {
-                    "success": False,
-                    "reason": "feature_build_failed",
-                }
-                continue
+        # 그룹 모델 학습 (food-ml-dual-model)
+        try:
+            group_days = GROUP_TRAINING_DAYS.get("food_group", days)
+            group_results = self.train_group_models(days=group_days)
+            results["_group_models"] = group_results
+        except Exception as e:
+            logger.warning(f"그룹 모델 학습 실패 (무시): {e}")
+            results["_group_models"] = {"error": str(e)}
 
-            X = np.vstack(X_list)
-            y = np.array(y_list, dtype=np.float32)
+        # 학습 지표 DB 저장
+        self._save_training_metrics(results)
 
-            # 날짜 기준 시계열 분할 (시계열 leakage 방지)
-            unique_dates = sorted(set(valid_dates))
-            cutoff_idx = max(1, int(len(unique_dates) * 0.8))
-            cutoff_date = unique_dates[cutoff_idx - 1]
+        return results
 
-            train_mask = np.array([d <= cutoff_date for d in valid_dates])
-            test_mask = ~train_mask
+    def _fit_group_ensemble(
+        self, group_name: str, fm: FeatureMatrix, incremental: bool
+    ) -> Dict[str, Any]:
+        """카테고리 그룹 1개 앙상블 학습/평가/저장
 
-            if test_mask.sum() < 5:
-                # 폴백: 마지막 20% 인덱스 (날짜 cutoff로 test가 너무 적으면)
-                split = max(1, int(len(X) * 0.8))
-                X_train, X_test = X[:split], X[split:]
-                y_train, y_test = y[:split], y[split:]
-            else:
-                X_train, X_test = X[train_mask], X[test_mask]
-                y_train, y_test = y[train_mask], y[test_mask]
+        Returns:
+            학습 결과 {success, samples, metrics...}
+        """
+        from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+        from sklearn.metrics import mean_absolute_error, mean_squared_error
 
-            # 앙상블: RandomForest + GradientBoosting (비대칭 손실)
-            try:
-                # 카테고리별 비대칭 alpha 결정
-                alpha = GROUP_QUANTILE_ALPHA.get(group_name, 0.5)
+        if len(fm) < MIN_TRAINING_SAMPLES:
+            logger.info(f"[{group_name}] 샘플 부족 ({len(fm)} < {MIN_TRAINING_SAMPLES}). 스킵.")
+            return {
+                "success": False,
+                "reason": f"insufficient_samples ({len(fm)})",
+            }
 
-                rf = RandomForestRegressor(
-                    n_estimators=100,
-                    max_depth=10,
-                    min_samples_leaf=5,
-                    random_state=42,
-                    n_jobs=-1,
-                )
-                rf.fit(X_train, y_train)
+        logger.info(f"[{group_name}] 학습 시작: {len(fm)}개 샘플")
 
-                # GradientBoosting: quantile 손실로 비대칭 학습
-                gb = GradientBoostingRegressor(
-                    n_estimators=100,
-                    max_depth=5,
-                    learning_rate=0.1,
-                    min_samples_leaf=5,
-                    random_state=42,
-                    loss="quantile",
-                    alpha=alpha,
-                )
-                gb.fit(X_train, y_train)
+        # Feature 행렬 + 날짜 (시계열 분할용)
+        X, y, valid_dates = fm.X, fm.y, fm.dates
 
-                # 앙상블 모델 래퍼
-                ensemble = _EnsembleModel(rf, gb)
+        # 날짜 기준 시계열 분할 (시계열 leakage 방지)
+        unique_dates = np.unique(valid_dates)
+        cutoff_idx = max(1, int(len(unique_dates) * 0.8))
+        cutoff_date = unique_dates[cutoff_idx - 1]
 
-                # 테스트 성능 평가 (MAE + 비대칭 Pinball Loss)
-                y_pred = ensemble.predict(X_test)
-                mae = mean_absolute_error(y_test, y_pred)
-                rmse = np.sqrt(mean_squared_error(y_test, y_pred))
-                mean_y = np.mean(y_test)
-                mape = (mae / mean_y * 100) if mean_y > 0 else 0
-
-                # Pinball Loss (비대칭 손실 지표)
-                errors = y_test - y_pred
-                pinball = np.mean(np.where(errors >= 0, alpha * errors, (alpha - 1) * errors))
-
-                # Accuracy@N 메트릭 (ml-improvement Phase E)
-                # 편의점 저판매량에서 ±1/2개 이내 정확도가 실질적 지표
-                accuracy_at_1 = float(np.mean(np.abs(y_test - y_pred) <= 1.0))
-                accuracy_at_2 = float(np.mean(np.abs(y_test - y_pred) <= 2.0))
-
-                logger.info(
-                    f"  MAE: {mae:.2f}, RMSE: {rmse:.2f}, "
-                    f"MAPE: {mape:.1f}%, Pinball(α={alpha}): {pinball:.3f}, "
-                    f"Acc@1: {accuracy_at_1:.1%}, Acc@2: {accuracy_at_2:.1%}, "
-                    f"Mean: {mean_y:.2f}"
-                )
+        train_mask = valid_dates <= cutoff_date
+        test_mask = ~train_mask
 
-                # Feature Importance 기록
-                avg_imp: Dict[str, float] = {}
-                try:
-                    feat_names = MLFeatureBuilder.FEATURE_NAMES
-                    rf_imp = dict(zip(feat_names, rf.feature_importances_.tolist()))
-                    gb_imp = dict(zip(feat_names, gb.feature_importances_.tolist()))
-                    avg_imp = {n: round((rf_imp[n] + gb_imp[n]) / 2, 4) for n in feat_names}
-                    top5 = sorted(avg_imp.items(), key=lambda x: -x[1])[:5]
-                    logger.info(f"  Feature Top5: {[(n, f'{v:.4f}') for n, v in top5]}")
-                except Exception:
-                    logger.debug("Feature Top5 로깅 실패, 학습 결과 영향 없음", exc_info=True)
-
-                # 성능 보호 게이트 (증분학습 시)
-                # ml-improvement Phase E: MAE 20% 악화 OR Accuracy@1 5%p 하락 시 롤백
-                if incremental and not self._check_performance_gate(
-                    group_name, mae, accuracy_at_1=accuracy_at_1
-                ):
-                    self._rollback_model(group_name)
-                    results[group_name] = {
-                        "success": False,
-                        "gated": True,
-                        "reason": "performance_gate_failed",
-                        "samples": len(X),
-                        "mae": round(float(mae), 2),
-                        "accuracy_at_1": round(float(accuracy_at_1), 3),
-                    }
-                    continue
+        if test_mask.sum() < 5:
+            # 폴백: 마지막 20% 인덱스 (날짜 cutoff로 test가 너무 적으면)
+            split = max(1, int(len(X) * 0.8))
+            X_train, X_test = X[:split], X[split:]
+            y_train, y_test = y[:split], y[split:]
+        else:
+            X_train, X_test = X[train_mask], X[test_mask]
+            y_train, y_test = y[train_mask], y[test_mask]
 
-                # 모델 저장 (이전 모델 백업 + 메타데이터 기록)
-                save_metrics = {
-                    "mae": round(float(mae), 2),
-                    "rmse": round(float(rmse), 2),
-                    "mape": round(float(mape), 1),
-                    "pinball_loss": round(float(pinball), 3),
-                    "accuracy_at_1": round(float(accuracy_at_1), 3),
-                    "accuracy_at_2": round(float(accuracy_at_2), 3),
-                    "samples": len(X),
-                    "train_size": len(X_train),
-                    "test_size": len(X_test),
-                }
-                self.predictor.save_model(group_name, ensemble, metrics=save_metrics)
+        # 앙상블: RandomForest + GradientBoosting (비대칭 손실)
+        try:
+            # 카테고리별 비대칭 alpha 결정
+            alpha = GROUP_QUANTILE_ALPHA.get(group_name, 0.5)
+
+            rf = RandomForestRegressor(
+                n_estimators=100,
+                max_depth=10,
+                min_samples_leaf=5,
+                random_state=42,
+                n_jobs=-1,
+            )
+            rf.fit(X_train, y_train)
+
+            # GradientBoosting: quantile 손실로 비대칭 학습
+            gb = GradientBoostingRegressor(
+                n_estimators=100,
+                max_depth=5,
+                learning_rate=0.1,
+                min_samples_leaf=5,
+                random_state=42,
+                loss="quantile",
+                alpha=alpha,
+            )
+            gb.fit(X_train, y_train)
+
+            # 앙상블 모델 래퍼
+            ensemble = _EnsembleModel(rf, gb)
+
+            # 테스트 성능 평가 (MAE + 비대칭 Pinball Loss)
+            y_pred = ensemble.predict(X_test)
+            mae = mean_absolute_error(y_test, y_pred)
+            rmse = np.sqrt(mean_squared_error(y_test, y_pred))
+            mean_y = np.mean(y_test)
+            mape = (mae / mean_y * 100) if mean_y > 0 else 0
+
+            # Pinball Loss (비대칭 손실 지표)
+            errors = y_test - y_pred
+            pinball = np.mean(np.where(errors >= 0, alpha * errors, (alpha - 1) * errors))
+
+            # Accuracy@N 메트릭 (ml-improvement Phase E)
+            # 편의점 저판매량에서 ±1/2개 이내 정확도가 실질적 지표
+            accuracy_at_1 = float(np.mean(np.abs(y_test - y_pred) <= 1.0))
+            accuracy_at_2 = float(np.mean(np.abs(y_test - y_pred) <= 2.0))
+
+            logger.info(
+                f"  MAE: {mae:.2f}, RMSE: {rmse:.2f}, "
+                f"MAPE: {mape:.1f}%, Pinball(α={alpha}): {pinball:.3f}, "
+                f"Acc@1: {accuracy_at_1:.1%}, Acc@2: {accuracy_at_2:.1%}, "
+                f"Mean: {mean_y:.2f}"
+            )
 
-                results[group_name] = {
-                    "success": True,
+            # Feature Importance 기록
+            avg_imp: Dict[str, float] = {}
+            try:
+                feat_names = MLFeatureBuilder.FEATURE_NAMES
+                rf_imp = dict(zip(feat_names, rf.feature_importances_.tolist()))
+                gb_imp = dict(zip(feat_names, gb.feature_importances_.tolist()))
+                avg_imp = {n: round((rf_imp[n] + gb_imp[n]) / 2, 4) for n in feat_names}
+                top5 = sorted(avg_imp.items(), key=lambda x: -x[1])[:5]
+                logger.info(f"  Feature Top5: {[(n, f'{v:.4f}') for n, v in top5]}")
+            except Exception:
+                logger.debug("Feature Top5 로깅 실패, 학습 결과 영향 없음", exc_info=True)
+
+            # 성능 보호 게이트 (증분학습 시)
+            # ml-improvement Phase E: MAE 20% 악화 OR Accuracy@1 5%p 하락 시 롤백
+            if incremental and not self._check_performance_gate(
+                group_name, mae, accuracy_at_1=accuracy_at_1
+            ):
+                self._rollback_model(group_name)
+                return {
+                    "success": False,
+                    "gated": True,
+                    "reason": "performance_gate_failed",
                     "samples": len(X),
-                    "train_size": len(X_train),
-                    "test_size": len(X_test),
                     "mae": round(float(mae), 2),
-                    "rmse": round(float(rmse), 2),
-                    "mape": round(float(mape), 1),
-                    "pinball_loss": round(float(pinball), 3),
                     "accuracy_at_1": round(float(accuracy_at_1), 3),
-                    "accuracy_at_2": round(float(accuracy_at_2), 3),
-                    "quantile_alpha": alpha,
-                    "feature_importance": avg_imp,
                 }
 
-            except Exception as e:
-                logger.warning(f"  [{group_name}] 학습 실패: {e}")
-                results[group_name] = {
-                    "success": False,
-                    "reason": str(e),
-                }
-
-        logger.info("=" * 60)
-        logger.info("ML 모델 학습 완료")
-        success_count = sum(1 for r in results.values() if r.get("success"))
-        logger.info(f"성공: {success_count}/{len(results)} 그룹")
-        logger.info("=" * 60)
+            # 모델 저장 (이전 모델 백업 + 메타데이터 기록)
+            save_metrics = {
+                "mae": round(float(mae), 2),
+                "rmse": round(float(rmse), 2),
+                "mape": round(float(mape), 1),
+                "pinball_loss": round(float(pinball), 3),
+                "accuracy_at_1": round(float(accuracy_at_1), 3),
+                "accuracy_at_2": round(float(accuracy_at_2), 3),
+                "samples": len(X),
+                "train_size": len(X_train),
+                "test_size": len(X_test),
+            }
+            self.predictor.save_model(group_name, ensemble, metrics=save_metrics)
+
+            return {
+                "success": True,
+                "samples": len(X),
+                "train_size": len(X_train),
+                "test_size": len(X_test),
+                "mae": round(float(mae), 2),
+                "rmse": round(float(rmse), 2),
+                "mape": round(float(mape), 1),
+                "pinball_loss": round(float(pinball), 3),
+                "accuracy_at_1": round(float(accuracy_at_1), 3),
+                "accuracy_at_2": round(float(accuracy_at_2), 3),
+                "quantile_alpha": alpha,
+                "feature_importance": avg_imp,
+            }
 
-        # 그룹 모델 학습 (food-ml-dual-model)
-        try:
-            group_days = GROUP_TRAINING_DAYS.get("food_group", days)
-            group_results = self.train_group_models(days=group_days)
-            results["_group_models"] = group_results
         except Exception as e:
-            logger.warning(f"그룹 모델 학습 실패 (무시): {e}")
-            results["_group_models"] = {"error": str(e)}
-
-        # 학습 지표 DB 저장
-        self._save_training_metrics(results)
-
-        return results
+            logger.warning(f"  [{group_name}] 학습 실패: {e}")
+            return {
+                "success": False,
+                "reason": str(e),
+            }
 
     def train_group_models(self, days: int = 30) -> Dict[str, Any]:
         """small_cd 기반 그룹 모델 학습 (food_group 전용)
@@ -678,178 +540,64 @@ class MLTrainer:
         start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
         weather_data = self.pipeline.get_external_factors(start_date, end_date)
 
-        # small_cd별로 학습 데이터 그룹화
-        smallcd_data: Dict[str, List[Dict]] = {}
-        # 시간대 Feature 캐시 (그룹 모델용)
-        _grp_hourly_cache: Dict[str, dict] = {}
+        # small_cd별로 학습 Feature 행렬 그룹화 (columnar-feature-matrix)
+        smallcd_parts: Dict[str, List[FeatureMatrix]] = {}
+        histories, hourly, span = self._load_item_histories(food_items, days, min_len=3)
+        date_table = DateFeatureTable(weather_data, *span) if span is not None else None
 
         for item_info in food_items:
             item_cd = item_info["item_cd"]
             mid_cd = item_info["mid_cd"]
+            daily_sales = histories.get(item_cd)
+            if daily_sales is None:
+                continue
             small_cd = item_smallcd.get(item_cd, "")
             if not small_cd:
                 small_cd = f"mid_{mid_cd}"  # small_cd 없으면 mid_cd 그룹
 
-            daily_sales = self.pipeline.get_item_daily_stats(item_cd, days)
-            if len(daily_sales) < 3:
-                continue
-
-            # 시간대 Feature 조회 (캐시: item_cd별 1회)
-            if item_cd not in _grp_hourly_cache:
-                _grp_hourly_cache[item_cd] = MLFeatureBuilder.calc_hourly_ratios(
-                    store_id=self.store_id or "",
+            smallcd_parts.setdefault(small_cd, []).append(
+                build_item_feature_matrix(
+                    daily_sales,
+                    date_table,
                     item_cd=item_cd,
-                    base_date=daily_sales[-1]["sales_date"],
-                    days=14,
+                    meta=item_meta.get(item_cd, {}),
+                    hourly_ratios=hourly.get(item_cd, {}),
+                    data_days=item_info.get("data_days", len(daily_sales)),
+                    smallcd_peer_avg=peer_avgs.get(item_smallcd.get(item_cd, ""), 0.0),
+                    lifecycle_stage=lifecycle_stages.get(item_cd, 1.0),
+                    with_lags=False,
+                    with_temperature_delta=False,
+                    with_holiday_context=False,
                 )
-
-            meta = item_meta.get(item_cd, {})
-            _peer_avg = peer_avgs.get(item_smallcd.get(item_cd, ""), 0.0)
-            _lifecycle = lifecycle_stages.get(item_cd, 1.0)
-            _data_days = item_info.get("data_days", len(daily_sales))
-
-            # A3: 품절일 imputation용 비품절 평균 (최근 14일 → 30일 폴백)
-            _grp_non_stockout_avg = None
-            _grp_ml_so_cfg = PREDICTION_PARAMS.get("ml_stockout_filter", {})
-            if _grp_ml_so_cfg.get("enabled", False):
-                _grp_min_days = _grp_ml_so_cfg.get("min_available_days", 3)
-                _grp_avail_14 = [
-                    (d.get("sale_qty", 0) or 0)
-                    for d in daily_sales[-14:]
-                    if d.get("stock_qty") is not None and d.get("stock_qty", 0) > 0
-                ]
-                if len(_grp_avail_14) >= _grp_min_days:
-                    _grp_non_stockout_avg = sum(_grp_avail_14) / len(_grp_avail_14)
-                else:
-                    _grp_avail_30 = [
-                        (d.get("sale_qty", 0) or 0)
-                        for d in daily_sales[-30:]
-                        if d.get("stock_qty") is not None and d.get("stock_qty", 0) > 0
-                    ]
-                    if len(_grp_avail_30) >= _grp_min_days:
-                        _grp_non_stockout_avg = sum(_grp_avail_30) / len(_grp_avail_30)
-
-            for i in range(min(7, len(daily_sales)), len(daily_sales)):
-                target_row = daily_sales[i]
-                history = daily_sales[:i]
-                target_date_str = target_row["sales_date"]
-
-                day_factors = weather_data.get(target_date_str, {})
-                temp_val = None
-                temp_str = day_factors.get("temperature")
-                if temp_str:
-                    try:
-                        temp_val = float(temp_str)
-                    except (ValueError, TypeError):
-                        pass
-
-                is_holiday = day_factors.get("is_holiday", "false").lower() in ("true", "1")
-
-                # A3: Y값 품절일 imputation
-                _grp_target_sale = target_row.get("sale_qty", 0) or 0
-                _grp_target_stock = target_row.get("stock_qty")
-                if (_grp_non_stockout_avg is not None
-                        and _grp_target_stock is not None and _grp_target_stock == 0
-                        and _grp_target_sale == 0):
-                    _grp_target_sale = _grp_non_stockout_avg
-
-                # 외부 환경 피처 (35→39 확장)
-                _grp_rain_qty = 0.0
-                _grp_sky_nm = ""
-                _grp_pm25 = 0.0
-                try:
-                    _grp_rain_qty = float(day_factors.get("rain_qty", 0) or 0)
-                    _grp_sky_nm = str(day_factors.get("weather_cd_nm", "") or "")
-                    _grp_pm25 = float(day_factors.get("pm25", 0) or 0)
-                except (ValueError, TypeError):
-                    pass
-                _grp_target_day = datetime.strptime(target_date_str, "%Y-%m-%d").day
-                _grp_is_payday = 1 if _grp_target_day in (10, 11, 12, 25, 26, 27) else 0
-
-                sample = {
-                    "item_cd": item_cd,
-                    "daily_sales": history,
-                    "target_date": target_date_str,
-                    "mid_cd": mid_cd,
-                    "actual_sale_qty": _grp_target_sale,
-                    "stock_qty": daily_sales[i - 1].get("stock_qty", 0) or 0,
-                    "pending_qty": 0,
-                    "promo_active": False,
-                    "expiration_days": meta.get("expiration_days", 0),
-                    "disuse_rate": meta.get("disuse_rate", 0.0),
-                    "margin_rate": meta.get("margin_rate", 0.0),
-                    "temperature": temp_val,
-                    "temperature_delta": None,
-                    "is_holiday": is_holiday,
-                    "large_cd": meta.get("large_cd"),
-                    "data_days": _data_days,
-                    "smallcd_peer_avg": _peer_avg,
-                    "lifecycle_stage": _lifecycle,
-                    "rain_qty": _grp_rain_qty,
-                    "sky_nm": _grp_sky_nm,
-                    "is_payday": _grp_is_payday,
-                    "pm25": _grp_pm25,
-                    "hourly_ratios": _grp_hourly_cache.get(item_cd, {}),
-                }
-                smallcd_data.setdefault(small_cd, []).append(sample)
+            )
+        smallcd_data = {key: FeatureMatrix.concat(parts) for key, parts in smallcd_parts.items()}
 
         # small_cd별 학습
         results: Dict[str, Any] = {}
         alpha = GROUP_QUANTILE_ALPHA.get("food_group", 0.45)
 
         # 샘플 부족 small_cd → mid_cd로 합치기
-        mid_fallback: Dict[str, List[Dict]] = {}
+        mid_fallback: Dict[str, List[FeatureMatrix]] = {}
         trainable_keys: List[str] = []
 
-        for key, samples in smallcd_data.items():
-            if len(samples) >= GROUP_MIN_SAMPLES:
+        for key, fm in smallcd_data.items():
+            if len(fm) >= GROUP_MIN_SAMPLES:
                 trainable_keys.append(key)
             else:
                 # mid_cd 폴백으로 합침
                 mid_key = f"mid_{key[:3]}" if not key.startswith("mid_") else key
-                mid_fallback.setdefault(mid_key, []).extend(samples)
+                mid_fallback.setdefault(mid_key, []).append(fm)
 
         # mid_cd 폴백도 trainable에 추가
-        for mid_key, samples in mid_fallback.items():
-            if len(samples) >= GROUP_MIN_SAMPLES:
-                smallcd_data[mid_key] = samples
+        for mid_key, parts in mid_fallback.items():
+            merged = FeatureMatrix.concat(parts)
+            if len(merged) >= GROUP_MIN_SAMPLES:
+                smallcd_data[mid_key] = merged
                 trainable_keys.append(mid_key)
 
         for key in trainable_keys:
-            samples = smallcd_data[key]
-            # Feature 배열 생성
-            X_list, y_list = [], []
-            for s in samples:
-                feat = MLFeatureBuilder.build_features(
-                    daily_sales=s.get("daily_sales", []),
-                    target_date=s.get("target_date", ""),
-                    mid_cd=s.get("mid_cd", ""),
-                    stock_qty=s.get("stock_qty", 0),
-                    pending_qty=0,
-                    expiration_days=s.get("expiration_days", 0),
-                    disuse_rate=s.get("disuse_rate", 0.0),
-                    margin_rate=s.get("margin_rate", 0.0),
-                    temperature=s.get("temperature"),
-                    is_holiday=s.get("is_holiday", False),
-                    large_cd=s.get("large_cd"),
-                    data_days=s.get("data_days", 0),
-                    smallcd_peer_avg=s.get("smallcd_peer_avg", 0.0),
-                    lifecycle_stage=s.get("lifecycle_stage", 1.0),
-                    rain_qty=s.get("rain_qty", 0.0),
-                    sky_nm=s.get("sky_nm", ""),
-                    is_payday=s.get("is_payday", 0),
-                    pm25=s.get("pm25", 0.0),
-                    hourly_ratios=s.get("hourly_ratios"),
-                )
-                if feat is not None:
-                    X_list.append(feat)
-                    y_list.append(float(s.get("actual_sale_qty", 0)))
-
-            if len(X_list) < GROUP_MIN_SAMPLES:
-                continue
-
-            X = np.vstack(X_list)
-            y = np.array(y_list, dtype=np.float32)
+            fm = smallcd_data[key]
+            X, y = fm.X, fm.y
 
             # 80/20 분할
             split = max(1, int(len(X) * 0.8))
@@ -16,6 +16,7 @@ from typing import Dict, List, Optional, Tuple
 
 from src.utils.logger import get_logger
 from src.infrastructure.database.base_repository import BaseRepository
+from src.infrastructure.database.repos.item_sales_stats_repo import load_item_sales_stats
 from src.prediction.eval_config import EvalConfig
 from src.prediction.cost_optimizer import CostOptimizer
 from src.settings.constants import (
@@ -54,6 +55,107 @@ DECISION_LABELS = {
 }
 
 
+def decide_by_matrix(
+    current_stock: float,
+    exposure_days: float,
+    popularity_level: str,
+    stockout_frequency: float,
+    th_urgent: float,
+    th_normal: float,
+    th_sufficient: float,
+    stockout_threshold: float,
+    daily_avg: float = 0.0,
+    mid_cd: str = "",
+    sell_day_ratio: float = 1.0,
+    last_order_date: Optional[str] = None,
+) -> Tuple[EvalDecision, str]:
+    """결정 매트릭스 (PreOrderEvaluator._make_decision / ReplaySimulator 공용)
+
+    매장 상태(비용최적화 SKIP 오프셋, CUT 미확인 의심 상품)는 반영하지 않는다.
+    호출자가 임계값 보정 / FORCE 다운그레이드로 처리한다.
+
+    Args:
+        popularity_level: "high" / "medium" / "low"
+        th_urgent, th_normal, th_sufficient: 노출일 임계값
+        stockout_threshold: 품절빈도 상승 임계값
+
+    Returns:
+        (결정, 사유)
+    """
+    # 현재 품절
+    if current_stock <= 0:
+        # 기존: 일평균 극소 → NORMAL 다운그레이드
+        if ENABLE_FORCE_DOWNGRADE and daily_avg < FORCE_MIN_DAILY_AVG:
+            return EvalDecision.NORMAL_ORDER, f"품절+일평균{daily_avg:.2f}<{FORCE_MIN_DAILY_AVG}"
+
+        # 간헐수요 + 유통기한1일 → PASS (폐기 사이클 방지)
+        if ENABLE_FORCE_INTERMITTENT_SUPPRESSION and mid_cd:
+            expiry_days = CATEGORY_EXPIRY_DAYS.get(mid_cd)
+            if (expiry_days is not None
+                    and expiry_days <= FORCE_INTERMITTENT_MAX_EXPIRY
+                    and sell_day_ratio < FORCE_INTERMITTENT_SELL_RATIO):
+                sell_pct = int(sell_day_ratio * 100)
+                reason_parts = f"품절+간헐수요(빈도{sell_pct}%)+유통{expiry_days}일"
+                # 최근 발주 체크 (사유에 추가 정보)
+                if last_order_date:
+                    try:
+                        from datetime import date as _date
+                        days_since = (_date.today() - _date.fromisoformat(last_order_date)).days
+                        if days_since <= FORCE_INTERMITTENT_COOLDOWN_DAYS:
+                            reason_parts += f"+최근발주{days_since}일전"
+                    except (ValueError, TypeError):
+                        pass
+                return EvalDecision.PASS, reason_parts + "->PASS"
+
+        return EvalDecision.FORCE_ORDER, "현재 품절"
+
+    # 기본 결정 매트릭스 (config 임계값 사용)
+    if exposure_days < th_urgent:
+        if popularity_level in ("high", "medium"):
+            decision = EvalDecision.URGENT_ORDER
+            reason = f"노출<{th_urgent}일+{popularity_level}인기"
+        else:
+            decision = EvalDecision.NORMAL_ORDER
+            reason = f"노출<{th_urgent}일+저인기"
+    elif exposure_days < th_normal:
+        if popularity_level in ("high", "medium"):
+            decision = EvalDecision.NORMAL_ORDER
+            reason = f"노출<{th_normal}일+{popularity_level}인기"
+        else:
+            decision = EvalDecision.PASS
+            reason = f"노출<{th_normal}일+저인기"
+    elif exposure_days >= th_sufficient:
+        if popularity_level == "low":
+            decision = EvalDecision.SKIP
+            reason = "재고충분+저인기"
+        else:
+            decision = EvalDecision.PASS
+            reason = f"재고충분+{popularity_level}인기"
+    else:
+        # th_normal <= exposure_days < th_sufficient
+        decision = EvalDecision.PASS
+        reason = f"노출{exposure_days:.1f}일"
+
+    # 품절빈도 높고 노출<th_normal이면 1단계 상승
+    if stockout_frequency >= stockout_threshold and exposure_days < th_normal:
+        upgrade_map = {
+            EvalDecision.PASS: EvalDecision.NORMAL_ORDER,
+            EvalDecision.NORMAL_ORDER: EvalDecision.URGENT_ORDER,
+        }
+        if decision in upgrade_map:
+            decision = upgrade_map[decision]
+            reason += f"+품절빈도{stockout_frequency:.0%}"
+
+    # 담배(072,073) SKIP 방지: 보루 전략이 독자적으로 URGENT/NORMAL 판정하므로
+    # PreOrderEvaluator가 SKIP하면 보루 재고 부족 시 발주 누락 발생
+    # → PASS로 전환하여 담배 안전재고 플로우에 위임
+    if decision == EvalDecision.SKIP and mid_cd in ("072", "073"):
+        decision = EvalDecision.PASS
+        reason += "→담배PASS(보루전략위임)"
+
+    return decision, reason
+
+
 @dataclass
 class PreOrderEvalResult:
     """사전 발주 평가 결과"""
@@ -551,6 +653,8 @@ class PreOrderEvaluator(BaseRepository):
         - 확인된 품절일(stock_qty=0 레코드)은 공급 부재이므로 분모에서 제외
         - (달력일 - 품절일) < 3이면 달력일 전체로 폴백
         stockout_freq/sell_day_ratio는 고정 30일 달력 윈도우 기준.
+        매장 지정 시 item_sales_stats 1행에서 계산하고, 집계가 없거나 윈도우를
+        덮지 못하는 상품만 daily_sales를 스캔합니다.
 
         Returns:
             {item_cd: {"daily_avg": float, "stockout_freq": float, "sell_day_ratio": float}, ...}
@@ -561,10 +665,30 @@ class PreOrderEvaluator(BaseRepository):
         max_days = max(days, stockout_days_window)
 
         result = {}
+        # 집계 테이블 우선 (item-sales-stats): 링 버퍼가 윈도우를 덮는 상품만, 나머지는 스캔
+        if self.store_id:
+            ref_date = conn.execute("SELECT date('now')").fetchone()[0]
+            for item_cd, item_stats in load_item_sales_stats(conn, item_codes, self.store_id).items():
+                if not item_stats.covers(max_days, ref_date):
+                    continue
+                window = item_stats.window(days, ref_date)
+                window_30 = item_stats.window(stockout_days_window, ref_date)
+                calendar_available = days - window.stockout_days
+                if calendar_available < 3:
+                    calendar_available = days
+                result[item_cd] = {
+                    "daily_avg": window.sale_qty / calendar_available if calendar_available > 0 else 0.0,
+                    "stockout_freq": (
+                        window_30.stockout_days / window_30.record_days
+                        if window_30.record_days > 0 else 0.0
+                    ),
+                    "sell_day_ratio": window_30.sell_days / 30,
+                }
+
         cursor = conn.cursor()
         store_filter = "AND store_id = ?" if self.store_id else ""
         store_params = [self.store_id] if self.store_id else []
-        for chunk in self._chunked(item_codes):
+        for chunk in self._chunked([c for c in item_codes if c not in result]):
             placeholders = ",".join("?" * len(chunk))
             cursor.execute(
                 f"""
@@ -971,81 +1095,19 @@ class PreOrderEvaluator(BaseRepository):
                 th_sufficient += cost_info.skip_offset
                 th_sufficient = max(th_sufficient, th_normal + 0.1)
 
-        # 현재 품절
-        if current_stock <= 0:
-            # 기존: 일평균 극소 → NORMAL 다운그레이드
-            if ENABLE_FORCE_DOWNGRADE and daily_avg < FORCE_MIN_DAILY_AVG:
-                return EvalDecision.NORMAL_ORDER, f"품절+일평균{daily_avg:.2f}<{FORCE_MIN_DAILY_AVG}"
-
-            # 간헐수요 + 유통기한1일 → PASS (폐기 사이클 방지)
-            if ENABLE_FORCE_INTERMITTENT_SUPPRESSION and mid_cd:
-                expiry_days = CATEGORY_EXPIRY_DAYS.get(mid_cd)
-                if (expiry_days is not None
-                        and expiry_days <= FORCE_INTERMITTENT_MAX_EXPIRY
-                        and sell_day_ratio < FORCE_INTERMITTENT_SELL_RATIO):
-                    sell_pct = int(sell_day_ratio * 100)
-                    reason_parts = f"품절+간헐수요(빈도{sell_pct}%)+유통{expiry_days}일"
-                    # 최근 발주 체크 (사유에 추가 정보)
-                    if last_order_date:
-                        try:
-                            from datetime import date as _date
-                            days_since = (_date.today() - _date.fromisoformat(last_order_date)).days
-                            if days_since <= FORCE_INTERMITTENT_COOLDOWN_DAYS:
-                                reason_parts += f"+최근발주{days_since}일전"
-                        except (ValueError, TypeError):
-                            pass
-                    return EvalDecision.PASS, reason_parts + "->PASS"
-
-            # CUT 미확인 의심 상품: 조회 오래됨 + 재고0 → FORCE 대신 NORMAL
-            if hasattr(self, '_stale_cut_suspects') and item_cd and item_cd in self._stale_cut_suspects:
-                from src.settings.constants import CUT_STATUS_STALE_DAYS
-                return EvalDecision.NORMAL_ORDER, f"품절+CUT미확인(조회>{CUT_STATUS_STALE_DAYS}일)"
-
-            return EvalDecision.FORCE_ORDER, "현재 품절"
+        decision, reason = decide_by_matrix(
+            current_stock, exposure_days, popularity_level, stockout_frequency,
+            th_urgent, th_normal, th_sufficient, stockout_threshold,
+            daily_avg=daily_avg, mid_cd=mid_cd, sell_day_ratio=sell_day_ratio,
+            last_order_date=last_order_date,
+        )
 
-        # 기본 결정 매트릭스 (config 임계값 사용)
-        if exposure_days < th_urgent:
-            if popularity_level in ("high", "medium"):
-                decision = EvalDecision.URGENT_ORDER
-                reason = f"노출<{th_urgent}일+{popularity_level}인기"
-            else:
-                decision = EvalDecision.NORMAL_ORDER
-                reason = f"노출<{th_urgent}일+저인기"
-        elif exposure_days < th_normal:
-            if popularity_level in ("high", "medium"):
-                decision = EvalDecision.NORMAL_ORDER
-                reason = f"노출<{th_normal}일+{popularity_level}인기"
-            else:
-                decision = EvalDecision.PASS
-                reason = f"노출<{th_normal}일+저인기"
-        elif exposure_days >= th_sufficient:
-            if popularity_level == "low":
-                decision = EvalDecision.SKIP
-                reason = "재고충분+저인기"
-            else:
-                decision = EvalDecision.PASS
-                reason = f"재고충분+{popularity_level}인기"
-        else:
-            # th_normal <= exposure_days < th_sufficient
-            decision = EvalDecision.PASS
-            reason = f"노출{exposure_days:.1f}일"
-
-        # 품절빈도 높고 노출<th_normal이면 1단계 상승
-        if stockout_frequency >= stockout_threshold and exposure_days < th_normal:
-            upgrade_map = {
-                EvalDecision.PASS: EvalDecision.NORMAL_ORDER,
-                EvalDecision.NORMAL_ORDER: EvalDecision.URGENT_ORDER,
-            }
-            if decision in upgrade_map:
-                decision = upgrade_map[decision]
-                reason += f"+품절빈도{stockout_frequency:.0%}"
-
-        # 담배(072,073) SKIP 방지: 보루 전략이 독자적으로 URGENT/NORMAL 판정하므로
-        # PreOrderEvaluator가 SKIP하면 보루 재고 부족 시 발주 누락 발생
-        # → PASS로 전환하여 담배 안전재고 플로우에 위임
-        if decision == EvalDecision.SKIP and mid_cd in ("072", "073"):
-            decision = EvalDecision.PASS
-            reason += "→담배PASS(보루전략위임)"
+        # CUT 미확인 의심 상품: 조회 오래됨 + 재고0 → FORCE 대신 NORMAL
+        if (decision == EvalDecision.FORCE_ORDER
+                and hasattr(self, '_stale_cut_suspects')
+                and item_cd and item_cd in self._stale_cut_suspects):
+            from src.settings.constants import CUT_STATUS_STALE_DAYS
+            return EvalDecision.NORMAL_ORDER, f"품절+CUT미확인(조회>{CUT_STATUS_STALE_DAYS}일)"
 
         return decision, reason
 
@@ -5,15 +5,32 @@ ImprovedPredictor에서 추출된 단일 책임 클래스.
 predict_batch에서 사용하는 7개 배치 캐시를 일괄 로드/관리한다.
 
 god-class-decomposition PDCA Step 4
+
+warm 모드 (warm-prediction-daemon):
+    상주 예측 데몬은 enable_warm() 후 warm()으로 캐시를 predict_batch 간에 유지하고,
+    원본 테이블이 바뀐 캐시만 invalidate(tables)로 버린다.
 """
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple
 from collections import Counter
 
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 배치 캐시별 원본 테이블 (warm-prediction-daemon)
+# 테이블이 변경되면 해당 캐시만 무효화한다.
+CACHE_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    "receiving_stats": ("receiving_history", "order_tracking"),
+    "ot_pending": ("order_tracking",),
+    "demand_patterns": ("daily_sales",),
+    "food_weekday": ("daily_sales",),
+    "group_contexts": ("daily_sales",),
+    "daily_stats": ("daily_sales",),
+    "batch_caches": ("daily_sales", "product_details"),
+    "product_attributes": ("product_details",),
+}
+
 
 class PredictionCacheManager:
     """배치 캐시 통합 관리
@@ -32,6 +49,62 @@ class PredictionCacheManager:
         self._data = data_provider
         self.store_id = store_id
         self.db_path = db_path
+        # warm 캐시 {key: (상품코드 frozenset|None, 값)} — None이면 warm 모드 비활성
+        self._warm: Optional[Dict[str, Tuple[Optional[frozenset], Any]]] = None
+
+    # ------------------------------------------------------------------
+    # warm 모드 (warm-prediction-daemon)
+    # ------------------------------------------------------------------
+
+    @property
+    def warm_enabled(self) -> bool:
+        return self._warm is not None
+
+    def enable_warm(self) -> None:
+        """predict_batch 간 캐시 유지 활성화 (상주 데몬 전용)"""
+        if self._warm is None:
+            self._warm = {}
+
+    def warm(self, key: str, loader: Callable[[], Any], item_codes: Optional[Iterable[str]] = None) -> Any:
+        """warm 캐시 조회, 없으면 loader() 결과를 저장 후 반환
+
+        item_codes가 주어지면 이전 로드 대상이 이번 대상을 모두 포함할 때만 재사용한다
+        (캐시는 상품별 조회이므로 상위 집합이면 그대로 쓸 수 있음).
+        """
+        if self._warm is None:
+            return loader()
+        wanted = frozenset(item_codes) if item_codes is not None else None
+        entry = self._warm.get(key)
+        if entry is not None:
+            loaded_for, value = entry
+            if wanted is None or (loaded_for is not None and wanted <= loaded_for):
+                return value
+        value = loader()
+        self._warm[key] = (wanted, value)
+        return value
+
+    def invalidate(self, tables: Optional[Iterable[str]] = None) -> List[str]:
+        """변경된 테이블에 의존하는 warm 캐시 제거
+
+        Args:
+            tables: 변경된 테이블명 (None이면 전체 제거)
+
+        Returns:
+            제거된 캐시 키 목록
+        """
+        if not self._warm:
+            return []
+        if tables is None:
+            dropped = list(self._warm)
+        else:
+            changed = set(tables)
+            dropped = [
+                key for key in self._warm
+                if changed.intersection(CACHE_DEPENDENCIES.get(key, ()))
+            ]
+        for key in dropped:
+            del self._warm[key]
+        return dropped
 
     def load_new_products(self, existing_cache: dict = None) -> dict:
         """신제품 모니터링 캐시 로딩 (small_cd 포함)
@@ -3,11 +3,16 @@
 
 PredictionLogger: prediction_logs 테이블에 예측 결과 저장, 정확도 계산
 - improved_predictor.py에서 분리 (Phase 6-1)
+- 일괄 저장: 컬럼 집합은 프로세스당 DB 1회 조회, 행 튜플 → executemany 1회
+- stage_trace: 압축 BLOB 은 stage_trace_z 컬럼에 저장, stage_trace(TEXT)는 구 JSON 전용
+  (읽기는 get_stage_traces → decode_stage_trace 단일 경로)
 """
 
+import json
 import sqlite3
+import zlib
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from src.utils.logger import get_logger
 
@@ -28,6 +33,108 @@ def _is_stage_trace_target(mid_cd) -> bool:
     return mid_cd in _STAGE_TRACE_TARGET_MIDS
 
 
+# ── stage_trace 압축 인코딩 ─────────────────────────────────────────
+# BLOB = 버전 1바이트 + zlib(공백 없는 JSON, 사전 _STAGE_TRACE_ZDICT_V1)
+# 행마다 반복되는 단계 키 이름을 사전(zdict)으로 미리 알려줘 짧은 JSON 도 압축된다.
+# V1 사전은 기존 BLOB 해석에 필요하므로 변경 금지 (키 추가 시 새 버전 + 새 사전).
+_STAGE_TRACE_V1 = b"\x01"
+_STAGE_TRACE_ZDICT_V1 = (
+    b'"stage_io":[{"stage":"in":"out":"reads":null},"shadow":{}'
+    b'"base_wma":"wma_blended":"coef_mul":"rule_floor":"ml_blend":"final_cap":'
+    b'"food_5stage":{"after_manual_deduct":"raw_need_qty":"final":'
+    b'"after_round":"after_cap":"after_sub":"after_promo_floor":"after_diff":'
+    b'"after_ml":"after_promo":"after_rop":{"after_rule":'
+)
+_STAGE_TRACE_LEVEL = 9
+
+
+def encode_stage_trace(snapshot: Dict[str, Any]) -> bytes:
+    """snapshot_stages dict → 압축 BLOB"""
+    raw = json.dumps(snapshot, ensure_ascii=False, separators=(",", ":"), default=str)
+    comp = zlib.compressobj(_STAGE_TRACE_LEVEL, zdict=_STAGE_TRACE_ZDICT_V1)
+    return _STAGE_TRACE_V1 + comp.compress(raw.encode("utf-8")) + comp.flush()
+
+
+def decode_stage_trace(value: Union[bytes, str, None]) -> Optional[Dict[str, Any]]:
+    """stage_trace 컬럼 값 → dict
+
+    압축 BLOB(encode_stage_trace)과 이전 버전이 남긴 JSON 텍스트를 모두 해석한다.
+    값이 없거나 해석할 수 없으면 None.
+    """
+    if value is None:
+        return None
+    try:
+        if isinstance(value, (bytes, memoryview)):
+            value = bytes(value)
+            if value[:1] != _STAGE_TRACE_V1:
+                return None
+            decomp = zlib.decompressobj(zdict=_STAGE_TRACE_ZDICT_V1)
+            value = (decomp.decompress(value[1:]) + decomp.flush()).decode("utf-8")
+        return json.loads(value) if value else None
+    except (zlib.error, ValueError) as e:
+        logger.debug(f"stage_trace 해석 실패: {e}")
+        return None
+
+
+# ── prediction_logs 컬럼 ↔ 값 추출기 ──────────────────────────────────
+# getter(logger, result, ctx) — ctx: 배치 공통값 (prediction_date, created_at)
+# 실제 INSERT 컬럼은 DB 에 존재하는 컬럼만 골라 순서대로 사용 (구 스키마 호환)
+
+def _row_context(now: datetime) -> Dict[str, str]:
+    return {"prediction_date": now.strftime("%Y-%m-%d"), "created_at": now.isoformat()}
+
+
+def _stage_trace_value(result) -> Optional[bytes]:
+    snapshot = getattr(result, 'snapshot_stages', None)
+    if snapshot and _is_stage_trace_target(result.mid_cd):
+        return encode_stage_trace(snapshot)
+    return None
+
+
+_LOG_FIELDS: Tuple[Tuple[str, Callable], ...] = (
+    ("prediction_date", lambda lg, r, ctx: ctx["prediction_date"]),
+    ("item_cd", lambda lg, r, ctx: r.item_cd),
+    ("mid_cd", lambda lg, r, ctx: r.mid_cd),
+    ("target_date", lambda lg, r, ctx: r.target_date),
+    ("predicted_qty", lambda lg, r, ctx: r.predicted_qty),
+    ("adjusted_qty", lambda lg, r, ctx: r.adjusted_qty),
+    ("weekday_coef", lambda lg, r, ctx: r.weekday_coef),
+    ("confidence", lambda lg, r, ctx: r.confidence),
+    ("current_stock", lambda lg, r, ctx: r.current_stock),
+    ("safety_stock", lambda lg, r, ctx: r.safety_stock),
+    ("order_qty", lambda lg, r, ctx: r.order_qty),
+    ("model_type", lambda lg, r, ctx: r.model_type),
+    ("store_id", lambda lg, r, ctx: lg.store_id),
+    ("stock_source", lambda lg, r, ctx: getattr(r, 'stock_source', '')),
+    ("pending_source", lambda lg, r, ctx: getattr(r, 'pending_source', '')),
+    ("is_stock_stale", lambda lg, r, ctx: 1 if getattr(r, 'is_stock_stale', False) else 0),
+    # ML 가중치 인프라 (v55)
+    ("rule_order_qty", lambda lg, r, ctx: getattr(r, 'rule_order_qty', None)),
+    ("ml_order_qty", lambda lg, r, ctx: getattr(r, 'ml_order_qty', None)),
+    ("ml_weight_used", lambda lg, r, ctx: getattr(r, 'ml_weight_used', None)),
+    ("association_boost", lambda lg, r, ctx: getattr(r, 'association_boost', 1.0)),
+    # stage_trace_z: 파이프라인 단계별 중간값 (food mid 한정 — B안, 압축 BLOB)
+    # stage_trace(TEXT) 에는 더 이상 쓰지 않는다 (JSON 텍스트를 기대하는 조회 보호)
+    ("stage_trace_z", lambda lg, r, ctx: _stage_trace_value(r)),
+    ("created_at", lambda lg, r, ctx: ctx["created_at"]),
+)
+
+# weekday_coef 이전 스키마: predicted_qty 자리에 보정 후 수량 기록
+_LEGACY_LOG_FIELDS: Tuple[Tuple[str, Callable], ...] = (
+    ("prediction_date", lambda lg, r, ctx: ctx["prediction_date"]),
+    ("item_cd", lambda lg, r, ctx: r.item_cd),
+    ("mid_cd", lambda lg, r, ctx: r.mid_cd),
+    ("target_date", lambda lg, r, ctx: r.target_date),
+    ("predicted_qty", lambda lg, r, ctx: r.adjusted_qty),
+    ("model_type", lambda lg, r, ctx: r.model_type),
+    ("store_id", lambda lg, r, ctx: lg.store_id),
+    ("created_at", lambda lg, r, ctx: ctx["created_at"]),
+)
+
+# DB 경로별 prediction_logs 컬럼 집합 (프로세스 수명 동안 유지)
+_LOG_COLUMNS_CACHE: Dict[str, frozenset] = {}
+
+
 class PredictionLogger:
     """예측 로그 관리"""
 
@@ -43,6 +150,33 @@ class PredictionLogger:
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _columns(self, conn: sqlite3.Connection) -> frozenset:
+        """prediction_logs 컬럼 집합 (프로세스당 DB 1회 PRAGMA)"""
+        columns = _LOG_COLUMNS_CACHE.get(self.db_path)
+        if columns is None:
+            columns = frozenset(
+                col[1] for col in conn.execute("PRAGMA table_info(prediction_logs)").fetchall()
+            )
+            if columns:
+                _LOG_COLUMNS_CACHE[self.db_path] = columns
+        return columns
+
+    def _prepare_insert(self, conn: sqlite3.Connection) -> Tuple[str, List[Tuple[str, Callable]]]:
+        """현재 스키마에 맞는 INSERT 문 + 컬럼별 값 추출기"""
+        columns = self._columns(conn)
+        if 'weekday_coef' in columns:
+            spec = [(col, getter) for col, getter in _LOG_FIELDS if col in columns]
+        else:
+            spec = list(_LEGACY_LOG_FIELDS)  # 기존 스키마 호환
+        sql = (
+            f"INSERT INTO prediction_logs ({', '.join(col for col, _ in spec)}) "
+            f"VALUES ({', '.join('?' * len(spec))})"
+        )
+        return sql, spec
+
+    def _build_row(self, spec: List[Tuple[str, Callable]], result, ctx: Dict) -> Tuple:
+        return tuple(getter(self, result, ctx) for _, getter in spec)
+
     def log_prediction(self, result) -> None:
         """예측 결과 로그 저장
 
@@ -51,214 +185,8 @@ class PredictionLogger:
         """
         conn = self._get_connection(timeout=30)
         try:
-            cursor = conn.cursor()
-
-            now = datetime.now()
-            prediction_date = now.strftime("%Y-%m-%d")  # 예측 수행일
-
-            # ML 가중치 인프라 (v55)
-            _rule_oq = getattr(result, 'rule_order_qty', None)
-            _ml_oq = getattr(result, 'ml_order_qty', None)
-            _ml_w = getattr(result, 'ml_weight_used', None)
-
-            # 테이블에 새 컬럼이 있는지 확인
-            cursor.execute("PRAGMA table_info(prediction_logs)")
-            columns = [col[1] for col in cursor.fetchall()]
-
-            has_stock_source = 'stock_source' in columns
-            has_ml_weight = 'rule_order_qty' in columns
-
-            if 'weekday_coef' in columns:
-                if has_stock_source:
-                    # stage_trace: 파이프라인 단계별 중간값 JSON (food mid 한정 — B안)
-                    import json as _json
-                    _snapshot = getattr(result, 'snapshot_stages', None)
-                    _stage_trace = (
-                        _json.dumps(_snapshot, ensure_ascii=False)
-                        if _snapshot and _is_stage_trace_target(result.mid_cd)
-                        else None
-                    )
-                    _has_stage_trace = 'stage_trace' in columns
-
-                    if has_ml_weight:
-                        if _has_stage_trace and _stage_trace:
-                            cursor.execute("""
-                                INSERT INTO prediction_logs (
-                                    prediction_date, item_cd, mid_cd, target_date,
-                                    predicted_qty, adjusted_qty,
-                                    weekday_coef, confidence, current_stock, safety_stock,
-                                    order_qty, model_type, store_id,
-                                    stock_source, pending_source, is_stock_stale,
-                                    rule_order_qty, ml_order_qty, ml_weight_used,
-                                    association_boost, stage_trace,
-                                    created_at
-                                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """, (
-                                prediction_date,
-                                result.item_cd,
-                                result.mid_cd,
-                                result.target_date,
-                                result.predicted_qty,
-                                result.adjusted_qty,
-                                result.weekday_coef,
-                                result.confidence,
-                                result.current_stock,
-                                result.safety_stock,
-                                result.order_qty,
-                                result.model_type,
-                                self.store_id,
-                                getattr(result, 'stock_source', ''),
-                                getattr(result, 'pending_source', ''),
-                                1 if getattr(result, 'is_stock_stale', False) else 0,
-                                _rule_oq,
-                                _ml_oq,
-                                _ml_w,
-                                getattr(result, 'association_boost', 1.0),
-                                _stage_trace,
-                                now.isoformat()
-                            ))
-                        else:
-                            cursor.execute("""
-                                INSERT INTO prediction_logs (
-                                    prediction_date, item_cd, mid_cd, target_date,
-                                    predicted_qty, adjusted_qty,
-                                    weekday_coef, confidence, current_stock, safety_stock,
-                                    order_qty, model_type, store_id,
-                                    stock_source, pending_source, is_stock_stale,
-                                    rule_order_qty, ml_order_qty, ml_weight_used,
-                                    association_boost,
-                                    created_at
-                                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """, (
-                                prediction_date,
-                                result.item_cd,
-                                result.mid_cd,
-                                result.target_date,
-                                result.predicted_qty,
-                                result.adjusted_qty,
-                                result.weekday_coef,
-                                result.confidence,
-                                result.current_stock,
-                                result.safety_stock,
-                                result.order_qty,
-                                result.model_type,
-                                self.store_id,
-                                getattr(result, 'stock_source', ''),
-                                getattr(result, 'pending_source', ''),
-                                1 if getattr(result, 'is_stock_stale', False) else 0,
-                                _rule_oq,
-                                _ml_oq,
-                                _ml_w,
-                                getattr(result, 'association_boost', 1.0),
-                                now.isoformat()
-                            ))
-                    else:
-                        cursor.execute("""
-                            INSERT INTO prediction_logs (
-                                prediction_date, item_cd, mid_cd, target_date,
-                                predicted_qty, adjusted_qty,
-                                weekday_coef, confidence, current_stock, safety_stock,
-                                order_qty, model_type, store_id,
-                                stock_source, pending_source, is_stock_stale,
-                                association_boost,
-                                created_at
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            prediction_date,
-                            result.item_cd,
-                            result.mid_cd,
-                            result.target_date,
-                            result.predicted_qty,
-                            result.adjusted_qty,
-                            result.weekday_coef,
-                            result.confidence,
-                            result.current_stock,
-                            result.safety_stock,
-                            result.order_qty,
-                            result.model_type,
-                            self.store_id,
-                            getattr(result, 'stock_source', ''),
-                            getattr(result, 'pending_source', ''),
-                            1 if getattr(result, 'is_stock_stale', False) else 0,
-                            getattr(result, 'association_boost', 1.0),
-                            now.isoformat()
-                        ))
-                else:
-                    # stock_source 없지만 ml_weight 컬럼은 있을 수 있음
-                    if has_ml_weight:
-                        cursor.execute("""
-                            INSERT INTO prediction_logs (
-                                prediction_date, item_cd, mid_cd, target_date,
-                                predicted_qty, adjusted_qty,
-                                weekday_coef, confidence, current_stock, safety_stock,
-                                order_qty, model_type, store_id,
-                                rule_order_qty, ml_order_qty, ml_weight_used,
-                                association_boost, created_at
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            prediction_date,
-                            result.item_cd,
-                            result.mid_cd,
-                            result.target_date,
-                            result.predicted_qty,
-                            result.adjusted_qty,
-                            result.weekday_coef,
-                            result.confidence,
-                            result.current_stock,
-                            result.safety_stock,
-                            result.order_qty,
-                            result.model_type,
-                            self.store_id,
-                            _rule_oq,
-                            _ml_oq,
-                            _ml_w,
-                            getattr(result, 'association_boost', 1.0),
-                            now.isoformat()
-                        ))
-                    else:
-                        cursor.execute("""
-                            INSERT INTO prediction_logs (
-                                prediction_date, item_cd, mid_cd, target_date,
-                                predicted_qty, adjusted_qty,
-                                weekday_coef, confidence, current_stock, safety_stock,
-                                order_qty, model_type, store_id,
-                                association_boost, created_at
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            prediction_date,
-                            result.item_cd,
-                            result.mid_cd,
-                            result.target_date,
-                            result.predicted_qty,
-                            result.adjusted_qty,
-                            result.weekday_coef,
-                            result.confidence,
-                            result.current_stock,
-                            result.safety_stock,
-                            result.order_qty,
-                            result.model_type,
-                            self.store_id,
-                            getattr(result, 'association_boost', 1.0),
-                            now.isoformat()
-                        ))
-            else:
-                # 기존 스키마 호환
-                cursor.execute("""
-                    INSERT INTO prediction_logs (
-                        prediction_date, item_cd, mid_cd, target_date,
-                        predicted_qty, model_type, store_id, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    prediction_date,
-                    result.item_cd,
-                    result.mid_cd,
-                    result.target_date,
-                    result.adjusted_qty,
-                    result.model_type,
-                    self.store_id,
-                    now.isoformat()
-                ))
-
+            sql, spec = self._prepare_insert(conn)
+            conn.execute(sql, self._build_row(spec, result, _row_context(datetime.now())))
             conn.commit()
         finally:
             conn.close()
@@ -266,6 +194,9 @@ class PredictionLogger:
     def log_predictions_batch(self, results: List) -> int:
         """여러 예측 결과를 한 번에 저장 (배치 처리)
 
+        행 튜플을 모두 만든 뒤 executemany 1회로 적재한다.
+        일괄 INSERT 실패 시에만 건별 INSERT 로 재시도해 실패 건만 건너뛴다.
+
         Args:
             results: PredictionResult 리스트
 
@@ -277,231 +208,74 @@ class PredictionLogger:
 
         conn = self._get_connection(timeout=60)
         try:
-            cursor = conn.cursor()
-
-            now = datetime.now()
-            prediction_date = now.strftime("%Y-%m-%d")
-
-            # 테이블에 새 컬럼이 있는지 확인
-            cursor.execute("PRAGMA table_info(prediction_logs)")
-            columns = [col[1] for col in cursor.fetchall()]
-
-            has_stock_source = 'stock_source' in columns
-
-            has_ml_weight = 'rule_order_qty' in columns
-            # food-underprediction-secondary B안: 배치 경로(운영 hot path) stage_trace 적재
-            has_stage_trace = 'stage_trace' in columns
-            import json as _json_batch
-
-            saved_count = 0
-            if 'weekday_coef' in columns:
-                for result in results:
+            sql, spec = self._prepare_insert(conn)
+            ctx = _row_context(datetime.now())
+
+            rows = []
+            for result in results:
+                try:
+                    rows.append((result, self._build_row(spec, result, ctx)))
+                except Exception as e:
+                    logger.warning(f"예측 로그 저장 실패 ({getattr(result, 'item_cd', '?')}): {e}")
+
+            try:
+                conn.executemany(sql, [row for _, row in rows])
+                saved_count = len(rows)
+            except sqlite3.Error as e:
+                logger.warning(f"예측 로그 일괄 저장 실패, 건별 재시도: {e}")
+                conn.rollback()
+                saved_count = 0
+                for result, row in rows:
                     try:
-                        _rule_oq = getattr(result, 'rule_order_qty', None)
-                        _ml_oq = getattr(result, 'ml_order_qty', None)
-                        _ml_w = getattr(result, 'ml_weight_used', None)
-                        # stage_trace JSON: food mid 한정으로만 직렬화
-                        _snapshot_b = getattr(result, 'snapshot_stages', None)
-                        _stage_trace_b = (
-                            _json_batch.dumps(_snapshot_b, ensure_ascii=False)
-                            if _snapshot_b and _is_stage_trace_target(result.mid_cd)
-                            else None
-                        )
-
-                        if has_stock_source:
-                            if has_ml_weight:
-                                if has_stage_trace and _stage_trace_b:
-                                    # food mid + stage_trace 컬럼 존재 → 22컬럼 INSERT
-                                    cursor.execute("""
-                                        INSERT INTO prediction_logs (
-                                            prediction_date, item_cd, mid_cd, target_date,
-                                            predicted_qty, adjusted_qty,
-                                            weekday_coef, confidence, current_stock, safety_stock,
-                                            order_qty, model_type, store_id,
-                                            stock_source, pending_source, is_stock_stale,
-                                            rule_order_qty, ml_order_qty, ml_weight_used,
-                                            association_boost, stage_trace,
-                                            created_at
-                                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                                    """, (
-                                        prediction_date,
-                                        result.item_cd,
-                                        result.mid_cd,
-                                        result.target_date,
-                                        result.predicted_qty,
-                                        result.adjusted_qty,
-                                        result.weekday_coef,
-                                        result.confidence,
-                                        result.current_stock,
-                                        result.safety_stock,
-                                        result.order_qty,
-                                        result.model_type,
-                                        self.store_id,
-                                        getattr(result, 'stock_source', ''),
-                                        getattr(result, 'pending_source', ''),
-                                        1 if getattr(result, 'is_stock_stale', False) else 0,
-                                        _rule_oq,
-                                        _ml_oq,
-                                        _ml_w,
-                                        getattr(result, 'association_boost', 1.0),
-                                        _stage_trace_b,
-                                        now.isoformat()
-                                    ))
-                                    saved_count += 1
-                                    continue
-                                cursor.execute("""
-                                    INSERT INTO prediction_logs (
-                                        prediction_date, item_cd, mid_cd, target_date,
-                                        predicted_qty, adjusted_qty,
-                                        weekday_coef, confidence, current_stock, safety_stock,
-                                        order_qty, model_type, store_id,
-                                        stock_source, pending_source, is_stock_stale,
-                                        rule_order_qty, ml_order_qty, ml_weight_used,
-                                        association_boost,
-                                        created_at
-                                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                                """, (
-                                    prediction_date,
-                                    result.item_cd,
-                                    result.mid_cd,
-                                    result.target_date,
-                                    result.predicted_qty,
-                                    result.adjusted_qty,
-                                    result.weekday_coef,
-                                    result.confidence,
-                                    result.current_stock,
-                                    result.safety_stock,
-                                    result.order_qty,
-                                    result.model_type,
-                                    self.store_id,
-                                    getattr(result, 'stock_source', ''),
-                                    getattr(result, 'pending_source', ''),
-                                    1 if getattr(result, 'is_stock_stale', False) else 0,
-                                    _rule_oq,
-                                    _ml_oq,
-                                    _ml_w,
-                                    getattr(result, 'association_boost', 1.0),
-                                    now.isoformat()
-                                ))
-                            else:
-                                cursor.execute("""
-                                    INSERT INTO prediction_logs (
-                                        prediction_date, item_cd, mid_cd, target_date,
-                                        predicted_qty, adjusted_qty,
-                                        weekday_coef, confidence, current_stock, safety_stock,
-                                        order_qty, model_type, store_id,
-                                        stock_source, pending_source, is_stock_stale,
-                                        association_boost,
-                                        created_at
-                                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                                """, (
-                                    prediction_date,
-                                    result.item_cd,
-                                    result.mid_cd,
-                                    result.target_date,
-                                    result.predicted_qty,
-                                    result.adjusted_qty,
-                                    result.weekday_coef,
-                                    result.confidence,
-                                    result.current_stock,
-                                    result.safety_stock,
-                                    result.order_qty,
-                                    result.model_type,
-                                    self.store_id,
-                                    getattr(result, 'stock_source', ''),
-                                    getattr(result, 'pending_source', ''),
-                                    1 if getattr(result, 'is_stock_stale', False) else 0,
-                                    getattr(result, 'association_boost', 1.0),
-                                    now.isoformat()
-                                ))
-                        else:
-                            # stock_source 없지만 ml_weight 컬럼은 있을 수 있음
-                            if has_ml_weight:
-                                cursor.execute("""
-                                    INSERT INTO prediction_logs (
-                                        prediction_date, item_cd, mid_cd, target_date,
-                                        predicted_qty, adjusted_qty,
-                                        weekday_coef, confidence, current_stock, safety_stock,
-                                        order_qty, model_type, store_id,
-                                        rule_order_qty, ml_order_qty, ml_weight_used,
-                                        association_boost, created_at
-                                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                                """, (
-                                    prediction_date,
-                                    result.item_cd,
-                                    result.mid_cd,
-                                    result.target_date,
-                                    result.predicted_qty,
-                                    result.adjusted_qty,
-                                    result.weekday_coef,
-                                    result.confidence,
-                                    result.current_stock,
-                                    result.safety_stock,
-                                    result.order_qty,
-                                    result.model_type,
-                                    self.store_id,
-                                    _rule_oq,
-                                    _ml_oq,
-                                    _ml_w,
-                                    getattr(result, 'association_boost', 1.0),
-                                    now.isoformat()
-                                ))
-                            else:
-                                cursor.execute("""
-                                    INSERT INTO prediction_logs (
-                                        prediction_date, item_cd, mid_cd, target_date,
-                                        predicted_qty, adjusted_qty,
-                                        weekday_coef, confidence, current_stock, safety_stock,
-                                        order_qty, model_type, store_id,
-                                        association_boost, created_at
-                                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                                """, (
-                                    prediction_date,
-                                    result.item_cd,
-                                    result.mid_cd,
-                                    result.target_date,
-                                    result.predicted_qty,
-                                    result.adjusted_qty,
-                                    result.weekday_coef,
-                                    result.confidence,
-                                    result.current_stock,
-                                    result.safety_stock,
-                                    result.order_qty,
-                                    result.model_type,
-                                    self.store_id,
-                                    getattr(result, 'association_boost', 1.0),
-                                    now.isoformat()
-                                ))
+                        conn.execute(sql, row)
                         saved_count += 1
-                    except Exception as e:
-                        logger.warning(f"예측 로그 저장 실패 ({result.item_cd}): {e}")
-            else:
-                for result in results:
-                    try:
-                        cursor.execute("""
-                            INSERT INTO prediction_logs (
-                                prediction_date, item_cd, mid_cd, target_date,
-                                predicted_qty, model_type, store_id, created_at
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            prediction_date,
-                            result.item_cd,
-                            result.mid_cd,
-                            result.target_date,
-                            result.adjusted_qty,
-                            result.model_type,
-                            self.store_id,
-                            now.isoformat()
-                        ))
-                        saved_count += 1
-                    except Exception as e:
-                        logger.warning(f"예측 로그 저장 실패 ({result.item_cd}): {e}")
+                    except sqlite3.Error as row_error:
+                        logger.warning(f"예측 로그 저장 실패 ({result.item_cd}): {row_error}")
 
             conn.commit()
             return saved_count
         finally:
             conn.close()
 
+    def get_stage_traces(
+        self, prediction_date: str, item_codes: Optional[List[str]] = None
+    ) -> Dict[str, Dict]:
+        """예측일의 stage_trace 복원
+
+        stage_trace_z(압축 BLOB) 우선, 없으면 stage_trace(구 JSON 텍스트)를
+        decode_stage_trace 로 해석한다.
+
+        Returns:
+            {item_cd: snapshot_stages dict} — 같은 상품이 여러 번이면 마지막 기록
+        """
+        from src.db.store_query import store_filter
+        sf, sp = store_filter(None, self.store_id)
+
+        conn = self._get_connection()
+        try:
+            trace_cols = [c for c in ("stage_trace_z", "stage_trace") if c in self._columns(conn)]
+            if not trace_cols:
+                return {}
+            trace_expr = f"COALESCE({', '.join(trace_cols)})" if len(trace_cols) > 1 else trace_cols[0]
+            query = (
+                f"SELECT item_cd, {trace_expr} AS stage_trace FROM prediction_logs "
+                f"WHERE prediction_date = ? AND {trace_expr} IS NOT NULL {sf}"
+            )
+            params: Tuple = (prediction_date,) + sp
+            if item_codes:
+                query += f" AND item_cd IN ({','.join('?' * len(item_codes))})"
+                params += tuple(item_codes)
+            rows = conn.execute(query + " ORDER BY id", params).fetchall()
+        finally:
+            conn.close()
+
+        traces = {}
+        for row in rows:
+            trace = decode_stage_trace(row["stage_trace"])
+            if trace is not None:
+                traces[row["item_cd"]] = trace
+        return traces
+
     def log_predictions_batch_if_needed(self, results: List) -> int:
         """오늘 날짜로 이미 기록이 있으면 스킵, 없으면 저장
 
@@ -0,0 +1,193 @@
+"""
+ProductAttributeStore — predict_batch용 상품 속성 스토어
+
+카테고리 Strategy(food/dessert/instant_meal/perishable 등)는 SKU마다
+common.db 커넥션을 열어 product_details 1행을 조회했다.
+predict_batch 시작 시 후보 SKU 전체의 속성을 쿼리 1회(500개 청크)로 읽어
+컬럼 배열로 보관하고, Strategy는 활성 스토어를 먼저 조회한다.
+
+- expiration_days / order_unit_qty : array('i') (NULL → -1)
+- margin_rate                      : array('d') (NULL → NaN)
+- small_cd / demand_pattern / orderable_day : list (NULL → None)
+
+활성 스토어는 ContextVar로 관리하므로 매장 스레드별로 독립적이며,
+활성 스토어가 없거나 대상 밖 SKU는 호출자가 기존 DB 조회로 폴백한다.
+
+product-attribute-store
+"""
+
+import math
+import sqlite3
+from array import array
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# product_details에서 읽는 속성 (컬럼이 없는 구 스키마는 NULL로 채움)
+ATTRIBUTE_COLUMNS = (
+    "expiration_days",
+    "order_unit_qty",
+    "small_cd",
+    "margin_rate",
+    "demand_pattern",
+    "orderable_day",
+)
+_INT_COLUMNS = ("expiration_days", "order_unit_qty")
+_FLOAT_COLUMNS = ("margin_rate",)
+
+_IN_CHUNK = 500
+
+_active_store: ContextVar[Optional["ProductAttributeStore"]] = ContextVar(
+    "product_attribute_store", default=None
+)
+
+
+class ProductAttributeStore:
+    """상품코드 → 속성 컬럼 배열 (읽기 전용)"""
+
+    __slots__ = ("index", "covered", "_columns")
+
+    def __init__(self, item_codes: List[str], columns: Dict[str, Any],
+                 covered: Optional[Iterable[str]] = None) -> None:
+        """
+        Args:
+            item_codes: 행 순서의 상품코드 (product_details에 존재하는 것만)
+            columns: {속성명: 행 순서 배열/리스트}
+            covered: 조회 대상이었던 상품코드 (미존재 포함, None이면 전체 로드)
+        """
+        self.index = {cd: i for i, cd in enumerate(item_codes)}
+        self.covered = frozenset(covered) if covered is not None else None
+        self._columns = columns
+
+    @classmethod
+    def load(cls, conn: Optional[sqlite3.Connection] = None,
+             item_codes: Optional[Iterable[str]] = None) -> "ProductAttributeStore":
+        """product_details에서 속성 일괄 로드
+
+        Args:
+            conn: common.db 커넥션 (None이면 DBRouter 공통 DB, 로드 후 닫음)
+            item_codes: 대상 상품코드 (None이면 전체)
+        """
+        own_conn = conn is None
+        if own_conn:
+            from src.infrastructure.database.connection import DBRouter
+            conn = DBRouter.get_common_connection()
+        try:
+            existing = {r[1] for r in conn.execute("PRAGMA table_info(product_details)")}
+            select = ", ".join(
+                col if col in existing else f"NULL AS {col}" for col in ATTRIBUTE_COLUMNS
+            )
+            base_sql = f"SELECT item_cd, {select} FROM product_details"
+            if item_codes is None:
+                rows = conn.execute(base_sql).fetchall()
+                covered = None
+            else:
+                wanted = list(dict.fromkeys(item_codes))
+                rows = []
+                for i in range(0, len(wanted), _IN_CHUNK):
+                    chunk = wanted[i:i + _IN_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows.extend(conn.execute(
+                        f"{base_sql} WHERE item_cd IN ({placeholders})", chunk
+                    ).fetchall())
+                covered = wanted
+        finally:
+            if own_conn:
+                conn.close()
+        return cls.from_rows(rows, covered)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple],
+                  covered: Optional[Iterable[str]] = None) -> "ProductAttributeStore":
+        """(item_cd, *ATTRIBUTE_COLUMNS) 행 → 스토어"""
+        item_codes: List[str] = []
+        columns: Dict[str, Any] = {}
+        for col in ATTRIBUTE_COLUMNS:
+            if col in _INT_COLUMNS:
+                columns[col] = array("i")
+            elif col in _FLOAT_COLUMNS:
+                columns[col] = array("d")
+            else:
+                columns[col] = []
+        seen = set()
+        for row in rows:
+            item_cd = row[0]
+            if item_cd in seen:
+                continue
+            seen.add(item_cd)
+            item_codes.append(item_cd)
+            for j, col in enumerate(ATTRIBUTE_COLUMNS, start=1):
+                val = row[j]
+                if col in _INT_COLUMNS:
+                    columns[col].append(int(val) if val is not None else -1)
+                elif col in _FLOAT_COLUMNS:
+                    columns[col].append(float(val) if val is not None else math.nan)
+                else:
+                    columns[col].append(val)
+        return cls(item_codes, columns, covered)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, item_cd: str) -> bool:
+        """스토어가 이 상품의 답을 갖고 있는지 (product_details 미존재도 '조회 완료')"""
+        if self.covered is None:
+            return True
+        return item_cd in self.covered
+
+    def get(self, item_cd: str, name: str, default: Any = None) -> Any:
+        """속성 값 (미존재 상품/NULL → default)"""
+        idx = self.index.get(item_cd)
+        if idx is None:
+            return default
+        val = self._columns[name][idx]
+        if name in _INT_COLUMNS:
+            return val if val != -1 else default
+        if name in _FLOAT_COLUMNS:
+            return default if math.isnan(val) else val
+        return val if val is not None else default
+
+    def row(self, item_cd: str) -> Optional[Dict[str, Any]]:
+        """상품 속성 dict (product_details 미존재 시 None)"""
+        if item_cd not in self.index:
+            return None
+        return {col: self.get(item_cd, col) for col in ATTRIBUTE_COLUMNS}
+
+    def expiration_days(self, item_cd: str) -> Optional[int]:
+        """유통기한 (NULL/0 이하 → None, Strategy의 DB 조회와 동일 규칙)"""
+        days = self.get(item_cd, "expiration_days")
+        return days if days is not None and days > 0 else None
+
+
+def get_active_attribute_store() -> Optional[ProductAttributeStore]:
+    """현재 스레드(컨텍스트)에서 활성화된 속성 스토어 (없으면 None)"""
+    return _active_store.get()
+
+
+def activate_attribute_store(store: Optional[ProductAttributeStore]):
+    """속성 스토어 활성화 → reset 토큰 반환 (deactivate_attribute_store로 해제)"""
+    return _active_store.set(store)
+
+
+def deactivate_attribute_store(token) -> None:
+    _active_store.reset(token)
+
+
+def lookup_expiration_days(item_cd: str) -> Optional[tuple]:
+    """활성 스토어에서 유통기한 조회
+
+    Returns:
+        None = 스토어 없음/대상 밖 → 호출자가 DB 조회
+        (days, "db") = 유효한 유통기한
+        (None, None) = 조회 완료했지만 값 없음 → 호출자 fallback
+    """
+    store = _active_store.get()
+    if store is None or item_cd not in store:
+        return None
+    days = store.expiration_days(item_cd)
+    if days is None:
+        return None, None
+    return days, "db"
@@ -0,0 +1,455 @@
+"""
+파라미터 리플레이 시뮬레이터 (bayesian-replay)
+
+BayesianParameterOptimizer 목적함수용 과거 재현 엔진.
+최근 N일 eval_outcomes(평가 시점 재고/미입고 + 검증된 실판매)와
+daily_sales(판매/재고 이력)를 1회 로드한 뒤, 후보 파라미터마다
+사전 평가(결정 매트릭스) → 발주량(일평균 × (1 + 안전재고일)) → 입수 배수 올림을
+다시 수행하고 실판매 대비 적중/폐기/품절을 재판정한다.
+
+- 결정 매트릭스는 PreOrderEvaluator와 같은 decide_by_matrix를 조합별 1회 호출
+- 파라미터 무관 중간 배열(판매/품절일/판매일 누적합, 30일 판매일비율·품절빈도,
+  트렌드, 입수·유통기한 그룹)은 데이터셋/시뮬레이터 생성 시 1회 계산
+- daily_avg_days별 일평균/정규화 배열은 최초 사용 시 계산 후 캐시
+- evaluate_many(): start_pool() 이후 프로세스 풀(spawn)로 후보를 병렬 평가
+  (워커 initializer가 시뮬레이터를 1회 수신 → 작업당 파라미터 dict만 전송)
+
+단순화:
+- 평가 행 단위 1일 재현 (시작 재고는 평가 시점 기록값, 일간 재고 이월 없음)
+- 품절일의 수요는 기록된 일평균(올림)과 실판매 중 큰 값으로 보정 (검열 수요)
+- 비푸드 안전재고일은 NON_FOOD_SAFETY_DAYS 고정
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.utils.logger import get_logger
+from src.prediction.bayesian_optimizer import TARGET_FOOD_WASTE_RATE
+from src.prediction.eval_config import EvalConfig
+from src.prediction.pre_order_evaluator import EvalDecision, decide_by_matrix
+from src.settings.constants import (
+    FOOD_CATEGORIES,
+    FOOD_MID_CODES,
+    FORCE_INTERMITTENT_SELL_RATIO,
+    FORCE_MIN_DAILY_AVG,
+)
+
+logger = get_logger(__name__)
+
+# 결정 코드 (EvalDecision 순서)
+FORCE, URGENT, NORMAL, PASS, SKIP = range(5)
+_DECISION_CODES = {decision: code for code, decision in enumerate(EvalDecision)}
+_POPULARITY_LEVELS = ("low", "medium", "high")
+
+# 리플레이 목적함수가 읽는 EvalConfig 파라미터 (그 외는 탐색 대상에서 제외)
+REPLAY_EVAL_PARAMS = frozenset({
+    "daily_avg_days",
+    "weight_daily_avg",
+    "weight_sell_day_ratio",
+    "weight_trend",
+    "popularity_high_percentile",
+    "popularity_low_percentile",
+    "exposure_urgent",
+    "exposure_normal",
+    "exposure_sufficient",
+    "stockout_freq_threshold",
+})
+
+NON_FOOD_SAFETY_DAYS = 1.0      # 비푸드 안전재고일 (리플레이 고정값)
+LOW_TURNOVER_THRESHOLD = 1.0    # NORMAL 판정: 고회전 기준 일평균
+TREND_WINDOW_DAYS = 7
+STATS_WINDOW_DAYS = 30          # 품절빈도/판매일비율/트렌드 기준 기간
+
+_OUTCOME_SQL = """
+    SELECT item_cd, eval_date, mid_cd, current_stock, pending_qty,
+           actual_sold_qty, was_stockout, daily_avg
+    FROM eval_outcomes
+    WHERE store_id = ? AND eval_date >= ? AND eval_date < ?
+      AND actual_sold_qty IS NOT NULL
+    ORDER BY eval_date, item_cd
+"""
+
+_SALES_SQL = """
+    SELECT item_cd, sales_date, sale_qty, stock_qty
+    FROM daily_sales
+    WHERE store_id = ? AND sales_date >= ? AND sales_date < ?
+"""
+
+
+class ReplayDataset:
+    """리플레이 입력 (파라미터 무관, 최적화 1회당 1회 로드)
+
+    평가 행(eval_outcomes 1건) 배열과 상품 × 날짜 누적합 배열로 구성된다.
+    누적합은 선행 0열 포함: cs[:, k] = 0..k-1일 합 → 구간 [e-d, e) 합 = cs[:, e] - cs[:, e-d]
+    """
+
+    def __init__(
+        self,
+        rows: List[tuple],
+        sales: List[tuple],
+        grid_start: datetime,
+        n_days: int,
+        attributes: Any = None,
+    ) -> None:
+        items = sorted({r[0] for r in rows})
+        index = {cd: i for i, cd in enumerate(items)}
+        self.item_codes = items
+
+        sale = np.zeros((len(items), n_days))
+        zero_stock = np.zeros((len(items), n_days))
+        has_record = np.zeros((len(items), n_days))
+        for item_cd, sales_date, sale_qty, stock_qty in sales:
+            r = index.get(item_cd)
+            if r is None:
+                continue
+            c = (datetime.strptime(sales_date, "%Y-%m-%d") - grid_start).days
+            if not 0 <= c < n_days:
+                continue
+            sale[r, c] = sale_qty or 0
+            zero_stock[r, c] = stock_qty == 0
+            has_record[r, c] = 1
+        pad = np.zeros((len(items), 1))
+        self.cs_sale = np.hstack([pad, np.cumsum(sale, axis=1)])
+        self.cs_zero = np.hstack([pad, np.cumsum(zero_stock, axis=1)])
+        self.cs_record = np.hstack([pad, np.cumsum(has_record, axis=1)])
+        self.cs_sold_days = np.hstack([pad, np.cumsum(sale > 0, axis=1)])
+
+        self.row_item = np.array([index[r[0]] for r in rows], dtype=np.int64)
+        eval_dates = [r[1] for r in rows]
+        self.row_col = np.array(
+            [(datetime.strptime(d, "%Y-%m-%d") - grid_start).days for d in eval_dates],
+            dtype=np.int64,
+        )
+        unique_dates = sorted(set(eval_dates))
+        date_pos = {d: i for i, d in enumerate(unique_dates)}
+        self.row_date = np.array([date_pos[d] for d in eval_dates], dtype=np.int64)
+        self.n_dates = len(unique_dates)
+
+        mids = [r[2] or "" for r in rows]
+        self.mid_codes = sorted(set(mids))
+        mid_pos = {m: i for i, m in enumerate(self.mid_codes)}
+        self.row_mid = np.array([mid_pos[m] for m in mids], dtype=np.int64)
+        self.stock = np.array([r[3] or 0 for r in rows], dtype=np.float64)
+        self.pending = np.array([r[4] or 0 for r in rows], dtype=np.float64)
+        self.actual_sold = np.array([r[5] or 0 for r in rows], dtype=np.float64)
+        self.was_stockout = np.array([bool(r[6]) for r in rows])
+        self.logged_avg = np.array([r[7] or 0.0 for r in rows], dtype=np.float64)
+        self.is_food = np.array([m in FOOD_CATEGORIES for m in mids])
+        self.is_waste_food = np.array([m in FOOD_MID_CODES for m in mids])
+
+        # 입수/유통기한 (product_details)
+        from src.prediction.categories.food import FOOD_EXPIRY_FALLBACK, get_food_expiry_group
+        units, shelf, groups = [], [], []
+        for (item_cd, *_), mid_cd in zip(rows, mids):
+            has_attr = attributes is not None
+            unit = attributes.get(item_cd, "order_unit_qty", 1) if has_attr else 1
+            units.append(max(int(unit or 1), 1))
+            days = attributes.expiration_days(item_cd) if has_attr else None
+            if days is None:
+                days = FOOD_EXPIRY_FALLBACK.get(mid_cd, 1)
+            shelf.append(days)
+            groups.append(get_food_expiry_group(days)[0] if mid_cd in FOOD_CATEGORIES else None)
+        self.order_unit = np.array(units, dtype=np.float64)
+        self.shelf_days = np.array(shelf, dtype=np.float64)
+        self.food_group = groups
+
+    def __len__(self) -> int:
+        return len(self.row_item)
+
+    def window_sum(self, cs: np.ndarray, days: int) -> np.ndarray:
+        """평가일 직전 days일 구간 합 (평가 행별)"""
+        return cs[self.row_item, self.row_col] - cs[self.row_item, self.row_col - days]
+
+    @classmethod
+    def load(
+        cls,
+        conn,
+        store_id: str,
+        days: int,
+        end_date: Optional[datetime] = None,
+        history_days: int = 31,
+        attributes: Any = None,
+    ) -> "ReplayDataset":
+        """매장 DB에서 리플레이 입력 로드 (eval_outcomes/daily_sales 쿼리 각 1회)
+
+        Args:
+            conn: 매장 DB 커넥션
+            store_id: 점포 코드
+            days: 리플레이 기간 (end_date 직전 N일)
+            end_date: 기간 끝 (제외, 기본: 오늘)
+            history_days: 평가일 이전 판매 이력 일수 (daily_avg_days 최대값 이상)
+            attributes: ProductAttributeStore (None이면 product_details에서 로드)
+        """
+        end = (end_date or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+        start = end - timedelta(days=days)
+        rows = conn.execute(
+            _OUTCOME_SQL, (store_id, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+        ).fetchall()
+        rows = [tuple(r) for r in rows]
+        grid_start = start - timedelta(days=history_days)
+        sales = [tuple(r) for r in conn.execute(
+            _SALES_SQL,
+            (store_id, grid_start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")),
+        ).fetchall()]
+
+        if attributes is None and rows:
+            try:
+                from src.prediction.product_attributes import ProductAttributeStore
+                attributes = ProductAttributeStore.load(item_codes={r[0] for r in rows})
+            except Exception as e:
+                logger.debug(f"[Replay] 상품 속성 로드 실패 → 입수 1/기본 유통기한: {e}")
+                attributes = None
+        return cls(rows, sales, grid_start, (end - grid_start).days, attributes)
+
+
+class ReplaySimulator:
+    """후보 파라미터 → 재현 성과 지표
+
+    Usage:
+        sim = ReplaySimulator(dataset, config)
+        metrics = sim.evaluate({"eval.exposure_urgent": 1.2, "food.short_safety_days": 0.6})
+        with sim.start_pool(4):
+            metrics_list = sim.evaluate_many([params_a, params_b, ...])
+    """
+
+    def __init__(self, dataset: ReplayDataset, config: EvalConfig) -> None:
+        from src.prediction.categories.food import FOOD_EXPIRY_SAFETY_CONFIG
+
+        self.dataset = dataset
+        self.base_params = {
+            f"eval.{name}": getattr(config, name).value for name in config._param_names()
+        }
+        self.group_safety = {
+            group: cfg.get("safety_days", 1.0)
+            for group, cfg in FOOD_EXPIRY_SAFETY_CONFIG.get("expiry_groups", {}).items()
+        }
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.workers = 1
+        self._avg_cache: Dict[int, tuple] = {}
+
+        # 파라미터 무관 지표 (30일 기준)
+        ds = dataset
+        sold_days = ds.window_sum(ds.cs_sold_days, STATS_WINDOW_DAYS)
+        records = ds.window_sum(ds.cs_record, STATS_WINDOW_DAYS)
+        zero_days = ds.window_sum(ds.cs_zero, STATS_WINDOW_DAYS)
+        self.sell_day_ratio = sold_days / STATS_WINDOW_DAYS
+        self.stockout_freq = np.where(records > 0, zero_days / np.maximum(records, 1), 0.0)
+
+        sold_7 = ds.window_sum(ds.cs_sold_days, TREND_WINDOW_DAYS)
+        sum_7 = ds.window_sum(ds.cs_sale, TREND_WINDOW_DAYS)
+        sum_30 = ds.window_sum(ds.cs_sale, STATS_WINDOW_DAYS)
+        avg_7 = np.where(sold_7 > 0, sum_7 / np.maximum(sold_7, 1), 0.0)
+        avg_30 = np.where(sold_days > 0, sum_30 / np.maximum(sold_days, 1), 0.0)
+        trend = np.where(avg_30 > 0, avg_7 / np.where(avg_30 > 0, avg_30, 1.0), 1.0)
+        self.norm_trend = np.clip(trend - 0.5, 0.0, 1.0)
+
+        # 검열 수요 보정 (품절일)
+        self.demand = np.where(
+            ds.was_stockout,
+            np.maximum(ds.actual_sold, np.ceil(ds.logged_avg)),
+            ds.actual_sold,
+        )
+        self._date_rows = [np.flatnonzero(ds.row_date == i) for i in range(ds.n_dates)]
+
+    # --- 프로세스 풀 ---
+
+    def start_pool(self, max_workers: int) -> "ReplaySimulator":
+        """병렬 평가용 프로세스 풀 기동 (with 블록 종료 시 close)"""
+        if max_workers > 1 and self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self,),
+            )
+            self.workers = max_workers
+        return self
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self.workers = 1
+
+    def __enter__(self) -> "ReplaySimulator":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state["_executor"] = None
+        state["workers"] = 1
+        return state
+
+    def evaluate_many(self, params_list: List[Dict[str, float]]) -> List[Dict[str, float]]:
+        """후보 여러 개 평가 (풀 기동 시 병렬, 순서 유지)"""
+        if self._executor is None or len(params_list) <= 1:
+            return [self.evaluate(p) for p in params_list]
+        return list(self._executor.map(_evaluate_worker, params_list))
+
+    # --- 평가 ---
+
+    def _daily_avg(self, days: int) -> tuple:
+        """daily_avg_days별 (일평균, 날짜 내 최대값 정규화) — 캐시"""
+        cached = self._avg_cache.get(days)
+        if cached is None:
+            ds = self.dataset
+            total = ds.window_sum(ds.cs_sale, days)
+            stockout_days = ds.window_sum(ds.cs_zero, days)
+            available = days - stockout_days
+            available = np.where(available < 3, days, available)
+            avg = total / available
+            date_max = np.zeros(ds.n_dates)
+            np.maximum.at(date_max, ds.row_date, avg)
+            row_max = date_max[ds.row_date]
+            norm = np.where(row_max > 0, np.minimum(avg / np.where(row_max > 0, row_max, 1.0), 1.0), 0.0)
+            cached = (avg, norm)
+            self._avg_cache[days] = cached
+        return cached
+
+    def _popularity_level(self, score: np.ndarray, params: Dict[str, float]) -> np.ndarray:
+        """평가일별 분포 적응형 임계값 → 0=low, 1=medium, 2=high"""
+        high_pct = params["eval.popularity_high_percentile"] / 100.0
+        low_pct = params["eval.popularity_low_percentile"] / 100.0
+        level = np.zeros(len(score), dtype=np.int64)
+        for rows in self._date_rows:
+            s = score[rows]
+            n = len(s)
+            if n < 10:
+                high_th, medium_th = 0.6, 0.3
+            else:
+                ordered = np.sort(s)
+                high_th = ordered[min(int(n * high_pct), n - 1)]
+                medium_th = ordered[min(int(n * low_pct), n - 1)]
+                if high_th - medium_th < 0.05:
+                    medium_th = max(0.0, high_th - 0.05)
+            level[rows] = np.where(s >= high_th, 2, np.where(s >= medium_th, 1, 0))
+        return level
+
+    def decide(self, params: Dict[str, float]) -> tuple:
+        """사전 평가 결정 (pre_order_evaluator.decide_by_matrix 공용)
+
+        결정은 (품절 여부, 노출일 임계값별 대소, 인기 등급, 품절빈도 상승, mid_cd,
+        일평균 다운그레이드, 간헐수요) 조합으로만 정해지므로 조합별 대표 행 1개만
+        decide_by_matrix로 판정한 뒤 같은 조합의 행에 펼친다.
+
+        Returns:
+            (결정 코드 배열, 일평균 배열)
+        """
+        ds = self.dataset
+        avg, norm_avg = self._daily_avg(int(params["eval.daily_avg_days"]))
+
+        w_avg = params["eval.weight_daily_avg"]
+        w_sdr = params["eval.weight_sell_day_ratio"]
+        w_trend = params["eval.weight_trend"]
+        total = w_avg + w_sdr + w_trend
+        if total <= 0:
+            w_avg, w_sdr, w_trend, total = 0.40, 0.35, 0.25, 1.0
+        score = (w_avg * norm_avg + w_sdr * self.sell_day_ratio + w_trend * self.norm_trend) / total
+        score = np.round(np.clip(score, 0.0, 1.0), 4)
+        level = self._popularity_level(score, params)
+
+        exposure = np.where(avg > 0, (ds.stock + ds.pending) / np.where(avg > 0, avg, 1.0), 999.0)
+        th_urgent = params["eval.exposure_urgent"]
+        th_normal = params["eval.exposure_normal"]
+        th_sufficient = params["eval.exposure_sufficient"]
+        th_stockout = params["eval.stockout_freq_threshold"]
+
+        keys = np.stack([
+            ds.stock <= 0, exposure < th_urgent, exposure < th_normal, exposure >= th_sufficient,
+            level, self.stockout_freq >= th_stockout, ds.row_mid,
+            avg < FORCE_MIN_DAILY_AVG, self.sell_day_ratio < FORCE_INTERMITTENT_SELL_RATIO,
+        ], axis=1).astype(np.int64)
+        _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+
+        codes = np.empty(len(first), dtype=np.int64)
+        for k, i in enumerate(first):
+            decision, _ = decide_by_matrix(
+                ds.stock[i], exposure[i], _POPULARITY_LEVELS[level[i]], self.stockout_freq[i],
+                th_urgent, th_normal, th_sufficient, th_stockout,
+                daily_avg=avg[i], mid_cd=ds.mid_codes[ds.row_mid[i]],
+                sell_day_ratio=self.sell_day_ratio[i],
+            )
+            codes[k] = _DECISION_CODES[decision]
+        return codes[inverse.reshape(-1)], avg
+
+    def evaluate(self, params: Dict[str, float]) -> Dict[str, float]:
+        """파라미터 1세트 재현 → 성과 지표 (_collect_metrics와 같은 키)
+
+        Args:
+            params: {"eval.<name>": 값, "food.<group>_safety_days": 값} (없는 키는 현재값)
+        """
+        merged = dict(self.base_params)
+        merged.update(params)
+        ds = self.dataset
+        decision, avg = self.decide(merged)
+
+        # 발주량: 일평균 × (1 + 안전재고일) - (재고 + 미입고) → 입수 배수 올림
+        group_safety = {
+            group: merged.get(f"food.{group}_safety_days", days)
+            for group, days in self.group_safety.items()
+        }
+        safety = np.array([
+            group_safety.get(g, NON_FOOD_SAFETY_DAYS) if g else NON_FOOD_SAFETY_DAYS
+            for g in ds.food_group
+        ])
+        need = avg * (1.0 + safety) - ds.stock - ds.pending
+        units = np.ceil(np.maximum(need, 0.0) / ds.order_unit)
+        units = np.where((decision == FORCE) | (decision == URGENT), np.maximum(units, 1), units)
+        order_qty = np.where(decision == SKIP, 0.0, units * ds.order_unit)
+
+        # 실판매 대비 재현
+        available = ds.stock + ds.pending + order_qty
+        sold = np.minimum(available, self.demand)
+        leftover = available - sold
+        stockout = leftover <= 0
+        sellable_later = ds.logged_avg * np.maximum(ds.shelf_days - 1, 0)
+        waste = np.where(ds.is_waste_food, np.maximum(leftover - sellable_later, 0.0), 0.0)
+
+        # 판정 (EvalCalibrator._judge_outcome 기준)
+        sold_any = sold > 0
+        normal_ok = np.where(
+            ds.is_food | (avg < LOW_TURNOVER_THRESHOLD), sold_any, sold_any | ~stockout
+        )
+        correct = np.select(
+            [decision == FORCE, decision == URGENT, decision == NORMAL],
+            [sold_any, stockout | sold_any, normal_ok],
+            default=~stockout,
+        )
+        over = ~correct & (
+            (decision == FORCE) | (decision == URGENT) | ((decision == NORMAL) & ~stockout)
+        )
+
+        n = max(len(ds), 1)
+        food_sold = float(sold[ds.is_waste_food].sum())
+        food_waste = float(waste.sum())
+        waste_rate = food_waste / (food_sold + food_waste) if food_sold + food_waste > 0 else 0.0
+        accuracy = float(correct.sum()) / n
+        return {
+            "accuracy_error": 1.0 - accuracy,
+            "waste_rate_error": max(0.0, waste_rate - TARGET_FOOD_WASTE_RATE),
+            "stockout_rate": float(stockout.sum()) / n,
+            "over_order_ratio": float(over.sum()) / n,
+            "sample_count": len(ds),
+            "accuracy_rate": accuracy,
+            "waste_rate": waste_rate,
+        }
+
+
+# 워커 프로세스 전역 (initializer가 1회 설정)
+_worker_simulator: Optional[ReplaySimulator] = None
+
+
+def _init_worker(simulator: ReplaySimulator) -> None:
+    global _worker_simulator
+    _worker_simulator = simulator
+
+
+def _evaluate_worker(params: Dict[str, float]) -> Dict[str, float]:
+    return _worker_simulator.evaluate(params)
@@ -0,0 +1,260 @@
+"""
+SalesMatrix — predict_batch용 items × days 판매 매트릭스
+
+ImprovedPredictor.predict_batch 시작 시 후보 SKU 전체의 daily_sales 윈도우를
+쿼리 1회로 읽어 NumPy 매트릭스(items × days)로 보관한다.
+SKU별 반복 쿼리(판매 이력, 데이터 기간, 가용일 판매비율, Croston 이력)를
+매트릭스 슬라이싱으로 대체한다. WMA는 recent_window()로 후보 전체를
+BasePredictor.calculate_weighted_averages에서 배열 연산으로 계산한다.
+
+- sale  : 판매량 (레코드 없음 → 0)
+- stock : 재고량 (레코드 없음/NULL → NaN)
+- present : daily_sales 레코드 존재 여부
+
+모든 조회는 기존 SQL과 동일한 결과를 반환하도록 구성되어 있으며,
+매트릭스 범위를 벗어나는 요청은 None을 반환해 호출자가 DB 폴백하도록 한다.
+
+columnar-predict-batch
+"""
+
+import sqlite3
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 매트릭스 기본 윈도우 (달력일). Croston 60일, ML 90일 조회를 모두 덮는다.
+SALES_MATRIX_DAYS = 90
+
+
+class SalesMatrix:
+    """items × days 판매/재고 매트릭스 (읽기 전용)"""
+
+    def __init__(
+        self,
+        item_codes: List[str],
+        start_date: date,
+        today: date,
+        sale: np.ndarray,
+        stock: np.ndarray,
+        present: np.ndarray,
+        span_days: Dict[str, int],
+    ) -> None:
+        """
+        Args:
+            item_codes: 행 순서의 상품코드 리스트
+            start_date: 0번 열의 날짜
+            today: SQLite date('now') 기준 오늘
+            sale: 판매량 매트릭스 (float64)
+            stock: 재고량 매트릭스 (float64, 미수집 NaN)
+            present: 레코드 존재 마스크 (bool)
+            span_days: {item_cd: 전체 기간 달력일수}
+        """
+        self.item_codes = item_codes
+        self.index = {cd: i for i, cd in enumerate(item_codes)}
+        self.start_date = start_date
+        self.today = today
+        self.sale = sale
+        self.stock = stock
+        self.present = present
+        self.span_days = span_days
+        self._dates = [
+            (start_date + timedelta(days=i)).strftime("%Y-%m-%d")
+            for i in range(sale.shape[1])
+        ]
+        self._sell_ratio_cache: Dict[int, np.ndarray] = {}
+
+    # =========================================================================
+    # 로드
+    # =========================================================================
+
+    @classmethod
+    def load(
+        cls,
+        conn: sqlite3.Connection,
+        store_id: str,
+        item_codes: Iterable[str],
+        days: int = SALES_MATRIX_DAYS,
+    ) -> "SalesMatrix":
+        """daily_sales 윈도우를 한 번에 로드하여 매트릭스 생성
+
+        IN 절 변수 제한을 피하기 위해 윈도우 전체를 읽고 Python에서 필터링한다.
+
+        Args:
+            conn: 매장 DB 커넥션
+            store_id: 점포 코드
+            item_codes: 대상 상품코드
+            days: 윈도우 달력일 수 (오늘 포함 date('now', -days) 이후)
+        """
+        codes = list(dict.fromkeys(item_codes))
+        index = {cd: i for i, cd in enumerate(codes)}
+
+        cursor = conn.cursor()
+        today_str, start_str = cursor.execute(
+            "SELECT date('now'), date('now', '-' || ? || ' days')", (days,)
+        ).fetchone()
+        today = datetime.strptime(today_str, "%Y-%m-%d").date()
+        start = datetime.strptime(start_str, "%Y-%m-%d").date()
+
+        cursor.execute("""
+            SELECT item_cd, sales_date, sale_qty, stock_qty
+            FROM daily_sales
+            WHERE store_id = ? AND sales_date >= ?
+        """, (store_id, start_str))
+        rows = [r for r in cursor.fetchall() if r[0] in index]
+
+        # 미래 일자 레코드가 있으면 열 범위를 확장 (date('now') 이후 포함 쿼리와 동일 결과)
+        end = today
+        for r in rows:
+            if r[1] > end.strftime("%Y-%m-%d"):
+                try:
+                    end = max(end, datetime.strptime(r[1], "%Y-%m-%d").date())
+                except ValueError:
+                    continue
+        n_days = (end - start).days + 1
+
+        sale = np.zeros((len(codes), n_days), dtype=np.float64)
+        stock = np.full((len(codes), n_days), np.nan, dtype=np.float64)
+        present = np.zeros((len(codes), n_days), dtype=bool)
+
+        for item_cd, sales_date, sale_qty, stock_qty in rows:
+            try:
+                col = (datetime.strptime(sales_date, "%Y-%m-%d").date() - start).days
+            except (TypeError, ValueError):
+                continue
+            row = index[item_cd]
+            sale[row, col] = sale_qty or 0
+            if stock_qty is not None:
+                stock[row, col] = stock_qty
+            present[row, col] = True
+
+        cursor.execute("""
+            SELECT item_cd,
+                   CAST(julianday(MAX(sales_date)) - julianday(MIN(sales_date)) + 1
+                        AS INTEGER) AS span_days
+            FROM daily_sales
+            WHERE store_id = ?
+            GROUP BY item_cd
+        """, (store_id,))
+        span_days = {r[0]: (r[1] or 0) for r in cursor.fetchall() if r[0] in index}
+
+        logger.debug(
+            f"[SalesMatrix] {len(codes)}개 상품 x {n_days}일 로드 "
+            f"(레코드 {len(rows)}건)"
+        )
+        return cls(codes, start, today, sale, stock, present, span_days)
+
+    # =========================================================================
+    # 조회 (기존 SQL과 동일 결과, 범위 밖이면 None)
+    # =========================================================================
+
+    def __contains__(self, item_cd: str) -> bool:
+        return item_cd in self.index
+
+    def _col(self, d: date) -> int:
+        return (d - self.start_date).days
+
+    def sales_history(
+        self, item_cd: str, days: int
+    ) -> Optional[List[Tuple[str, int, Optional[int]]]]:
+        """PredictionDataProvider.get_sales_history 대응
+
+        어제부터 과거 N일 (최신 순), 레코드 없는 날은 (날짜, 0, None).
+        """
+        row = self.index.get(item_cd)
+        if row is None or days < 1:
+            return None
+        first = self._col(self.today - timedelta(days=days))
+        last = self._col(self.today - timedelta(days=1))
+        if first < 0:
+            return None
+
+        sale = self.sale[row]
+        stock = self.stock[row]
+        result = []
+        for col in range(last, first - 1, -1):
+            stk = stock[col]
+            result.append((
+                self._dates[col],
+                int(sale[col]),
+                None if np.isnan(stk) else int(stk),
+            ))
+        return result
+
+    def recent_window(
+        self, days: int
+    ) -> Optional[Tuple[List[str], np.ndarray, np.ndarray]]:
+        """sales_history(days)와 같은 구간을 전체 상품 배열로 반환
+
+        Returns:
+            (날짜 리스트, 판매량, 재고량) — 열은 최신 순, 값은 sales_history와 같게
+            정수 절삭 (재고 미수집 NaN). 범위 밖이면 None.
+        """
+        if days < 1:
+            return None
+        first = self._col(self.today - timedelta(days=days))
+        last = self._col(self.today - timedelta(days=1))
+        if first < 0:
+            return None
+        cols = np.arange(last, first - 1, -1)
+        return (
+            [self._dates[col] for col in cols],
+            np.trunc(self.sale[:, cols]),
+            np.trunc(self.stock[:, cols]),
+        )
+
+    def daily_sales_history(self, item_cd: str, days: int) -> Optional[List[int]]:
+        """BasePredictor._get_daily_sales_history 대응 (레코드 있는 날만, 오래된 순)"""
+        row = self.index.get(item_cd)
+        if row is None:
+            return None
+        first = self._col(self.today - timedelta(days=days))
+        if first < 0:
+            return None
+        mask = self.present[row, first:]
+        return [int(v) for v in self.sale[row, first:][mask]]
+
+    def data_span_days(self, item_cd: str) -> Optional[int]:
+        """PredictionDataProvider._get_data_span_days 대응"""
+        if item_cd not in self.index:
+            return None
+        return self.span_days.get(item_cd, 0)
+
+    def available_sell_ratios(self, days: int) -> Optional[np.ndarray]:
+        """전체 상품의 가용일 중 판매일 비율 (벡터 연산, 가용일 0 → 1.0)
+
+        stock_qty > 0 인 날 중 sale_qty > 0 인 날의 비율.
+        BasePredictor._calculate_available_sell_ratio와 동일한 정의.
+        """
+        cached = self._sell_ratio_cache.get(days)
+        if cached is not None:
+            return cached
+        first = self._col(self.today - timedelta(days=days))
+        if first < 0:
+            return None
+        stock = self.stock[:, first:]
+        sale = self.sale[:, first:]
+        with np.errstate(invalid="ignore"):
+            available = np.nan_to_num(stock, nan=0.0) > 0
+        sell = available & (sale > 0)
+        available_days = available.sum(axis=1)
+        sell_days = sell.sum(axis=1)
+        ratios = np.ones(len(self.item_codes), dtype=np.float64)
+        nz = available_days > 0
+        ratios[nz] = np.minimum(sell_days[nz] / available_days[nz], 1.0)
+        self._sell_ratio_cache[days] = ratios
+        return ratios
+
+    def available_sell_ratio(self, item_cd: str, days: int) -> Optional[float]:
+        """단일 상품의 가용일 판매비율 (available_sell_ratios 캐시 조회)"""
+        row = self.index.get(item_cd)
+        if row is None:
+            return None
+        ratios = self.available_sell_ratios(days)
+        if ratios is None:
+            return None
+        return float(ratios[row])
@@ -15,6 +15,8 @@ from typing import Any, Dict, List, Tuple, Literal, Optional
 from dataclasses import dataclass
 import statistics
 
+import numpy as np
+
 
 # =============================================================================
 # 카테고리별 이상치 설정
@@ -385,6 +387,84 @@ def clean_sales_data(
     return result
 
 
+def _cap_iqr_outliers(cleaned: np.ndarray, multipliers: np.ndarray) -> np.ndarray:
+    """detect_outliers_iqr + cap 전략의 행 단위 배열 버전"""
+    n = cleaned.shape[1]
+    # 정렬 후 선형 보간 사분위수
+    sorted_sales = np.sort(cleaned, axis=1)
+    q1_idx = (n - 1) * 0.25
+    q3_idx = (n - 1) * 0.75
+    q1_lower, q3_lower = int(q1_idx), int(q3_idx)
+    q1_frac, q3_frac = q1_idx - q1_lower, q3_idx - q3_lower
+    q1 = (sorted_sales[:, q1_lower] * (1 - q1_frac)
+          + sorted_sales[:, min(q1_lower + 1, n - 1)] * q1_frac)
+    q3 = (sorted_sales[:, q3_lower] * (1 - q3_frac)
+          + sorted_sales[:, min(q3_lower + 1, n - 1)] * q3_frac)
+    iqr = q3 - q1
+    lower_bound = np.maximum(0.0, q1 - (multipliers * iqr))
+    upper_bound = q3 + (multipliers * iqr)
+    outlier = (cleaned < lower_bound[:, None]) | (cleaned > upper_bound[:, None])
+
+    # cap: stats의 round(…, 2) 경계를 int로 절삭 (이상치 있는 행만, 행당 스칼라 2개)
+    rows = np.flatnonzero(outlier.any(axis=1))
+    if rows.size:
+        lower = np.array([max(0, int(round(float(v), 2))) for v in lower_bound[rows]])
+        upper = np.array([int(round(float(v), 2)) for v in upper_bound[rows]])
+        block = cleaned[rows]
+        hit = outlier[rows]
+        below = hit & (block < lower[:, None])
+        above = hit & ~below & (block > upper[:, None])
+        cleaned[rows] = np.where(below, lower[:, None], np.where(above, upper[:, None], block))
+    return cleaned
+
+
+def clean_sales_matrix(
+    sales: np.ndarray,
+    multipliers: np.ndarray,
+    handle_zeros: bool = True
+) -> np.ndarray:
+    """
+    판매 매트릭스 행 단위 정제 (IQR 탐지 + cap 전략, columnar-predict-batch)
+
+    각 행에 clean_sales_data(method="iqr", strategy="cap")를 적용한 결과와
+    같은 값을 반환한다. 사분위수/상하한/중앙값 계산 순서를 그대로 따른다.
+
+    Args:
+        sales: 판매량 매트릭스 (items × days, float64)
+        multipliers: 행별 IQR 배수 (get_outlier_config(mid_cd)["multiplier"])
+        handle_zeros: 0 이상치 처리 여부
+
+    Returns:
+        정제된 판매량 매트릭스 (입력은 변경하지 않음)
+    """
+    cleaned = np.array(sales, dtype=np.float64)
+    n_rows, n = cleaned.shape
+    if n_rows == 0 or n == 0:
+        return cleaned
+
+    # IQR 탐지는 최소 5일 (clean_outliers min_data)
+    if n >= 5:
+        cleaned = _cap_iqr_outliers(cleaned, np.asarray(multipliers, dtype=np.float64))
+
+    if handle_zeros:
+        # is_zero_outlier: 0 비율이 30% 이하면 0을 양수값 중앙값(정수 절삭)으로 대체
+        zeros = cleaned == 0
+        zero_count = zeros.sum(axis=1)
+        positive = cleaned > 0
+        k = positive.sum(axis=1)
+        target = (zero_count > 0) & (zero_count / n <= 0.3) & (k > 0)
+        if target.any():
+            pos_sorted = np.sort(np.where(positive, cleaned, np.inf), axis=1)
+            half = k // 2
+            upper_mid = np.take_along_axis(pos_sorted, np.minimum(half, n - 1)[:, None], 1)[:, 0]
+            lower_mid = np.take_along_axis(pos_sorted, np.maximum(half - 1, 0)[:, None], 1)[:, 0]
+            median = np.where(k % 2 == 1, upper_mid, (lower_mid + upper_mid) / 2)
+            replacement = np.trunc(median)
+            cleaned = np.where(target[:, None] & zeros, replacement[:, None], cleaned)
+
+    return cleaned
+
+
 # =============================================================================
 # 테스트
 # =============================================================================
@@ -1203,10 +1203,14 @@ class SalesAnalyzer:
 
         try:
             from src.collectors.direct_sales_fetcher import DirectSalesFetcher
+            from src.collectors.ssv_http_client import http_client_for_driver
             self._direct_sales_fetcher = DirectSalesFetcher(
                 driver=self.driver,
                 concurrency=DIRECT_API_CONCURRENCY,
                 timeout_ms=DIRECT_API_TIMEOUT_MS,
+                http_client=http_client_for_driver(
+                    self.driver, DIRECT_API_CONCURRENCY, DIRECT_API_TIMEOUT_MS
+                ),
             )
             return True
         except Exception as e:
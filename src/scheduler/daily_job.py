@@ -19,6 +19,7 @@ logger = get_logger(__name__)
 from src.collectors.sales_collector import SalesCollector
 from src.collectors.calendar_collector import save_calendar_info
 from src.infrastructure.database.repos import SalesRepository, ExternalFactorRepository
+from src.infrastructure.database.repos.sales_repo import wait_for_pending_validations
 from src.notification.kakao_notifier import KakaoNotifier, DEFAULT_REST_API_KEY
 from src.analysis.daily_report import DailyReport
 from src.alert.expiry_checker import run_expiry_check_and_alert
@@ -34,6 +35,7 @@ from src.settings.constants import (
     LOG_SEPARATOR_WIDE, LOG_SEPARATOR_THIN,
     WEEKLY_REPORT_DAYS,
     DEFAULT_STORE_ID,
+    SALES_VALIDATION_WAIT_TIMEOUT_SEC,
 )
 from src.collectors.fail_reason_collector import FailReasonCollector
 from src.collectors.manual_order_detector import run_manual_order_detection
@@ -370,6 +372,12 @@ class DailyCollectionJob:
             }
 
         finally:
+            # 마지막 수집분의 저장 후 검증이 잡 종료 전에 끝나도록 대기 (validation-batch)
+            if not wait_for_pending_validations(timeout=SALES_VALIDATION_WAIT_TIMEOUT_SEC):
+                logger.warning(
+                    f"[{self.store_id}] 저장 후 검증 {SALES_VALIDATION_WAIT_TIMEOUT_SEC}s 내 "
+                    f"미완료 — 백그라운드에서 계속 진행"
+                )
             clear_session_id()
             if self.collector:
                 self.collector.close()
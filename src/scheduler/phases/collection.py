@@ -68,7 +68,8 @@ def run_collection_phases(ctx: Dict[str, Any], job: Any) -> Dict[str, Any]:
                     sales_data=data,
                     sales_date=date_str,
                     store_id=job.store_id,
-                    collected_at=datetime.now().isoformat()
+                    collected_at=datetime.now().isoformat(),
+                    bulk=True,
                 )
                 job.repository.log_collection(
                     collected_at=datetime.now().isoformat(),
@@ -252,7 +252,7 @@ BATCH_EXPIRY_ALERT_DAYS = 1             # 폐기 N일 전 알림
 
 # DB 스키마 버전
 # =====================================================================
-DB_SCHEMA_VERSION = 78  # v78: product_details PK 원복 (item_cd 단일) — v77 store_id 분리 철회
+DB_SCHEMA_VERSION = 81  # v81: prediction_logs.stage_trace_z 압축 BLOB 컬럼
 
 # =====================================================================
 # Order Unit Qty Integrity v2 (order-unit-qty-integrity-v2)
@@ -286,6 +286,22 @@ HEARTBEAT_INTERVAL_SEC = 60              # HeartbeatWriter 쓰기 주기
 HEARTBEAT_STALE_THRESHOLD_SEC = 600      # Watchdog이 "Scheduler Dead" 판정 임계 (10분)
 WATCHDOG_INTERVAL_MIN = 5                # Windows Task Scheduler 주기
 
+# =====================================================================
+# 홈 대시보드 스냅샷 (dashboard-snapshot)
+# =====================================================================
+DASHBOARD_ONDEMAND_CACHE_TTL_SEC = 30    # 유효 스냅샷이 없을 때 요청 시 계산 결과 프로세스 메모리 캐시 (저장 안 함)
+
+# =====================================================================
+# 판매 저장 후 데이터 검증 (validation-batch)
+# =====================================================================
+SALES_VALIDATION_ASYNC = True            # True: 커밋 후 백그라운드 스레드에서 검증 (수집 흐름 비차단)
+SALES_VALIDATION_WAIT_TIMEOUT_SEC = 60   # 잡 종료/스케줄러 종료 시 남은 검증 대기 상한 (초)
+
+# =====================================================================
+# 다매장 예측 프로세스 풀 (multi-store-process-prediction)
+# =====================================================================
+PREDICTION_PROCESS_WORKERS = 4           # 07:00 발주 예측 전용 프로세스 수 (0=스레드 내 예측)
+
 # =====================================================================
 # 소진율 곡선 설정 (Phase 1.06 / 3단계)
 # =====================================================================
@@ -377,6 +393,8 @@ USE_DIRECT_API = True                      # Direct API 사용 여부 (False →
 DIRECT_API_CONCURRENCY = 5                 # 동시 요청 수 (서버 부하 방지)
 DIRECT_API_TIMEOUT_MS = 5000               # 개별 요청 타임아웃 (밀리초)
 DIRECT_API_DELAY_MS = 30                   # 요청 간 딜레이 (밀리초)
+DIRECT_API_HTTP_CLIENT = False             # 배치 조회를 브라우저 JS 대신 Python HTTP 클라이언트로 (세션 쿠키 공유)
+DIRECT_API_HTTP_RETRIES = 2                # HTTP 클라이언트 요청별 재시도 횟수
 
 # =====================================================================
 # Direct API 발주 저장 설정 (direct-api-order)
@@ -436,6 +454,10 @@ DESSERT_PROMO_PROTECTION_ENABLED = True  # 프로모션 진행 중 상품 보호
 ROLLING_BIAS_ENABLED = True              # QW-1: 매장×카테고리 편향 자동보정
 BEVERAGE_TEMP_PRIORITY_ENABLED = True    # QW-3: 음료 기온 계수 강화 (25도+)
 
+# predict_batch ML 배치 추론 (ml-batch-inference)
+# True: 후보 전체 피처 수집 후 모델(그룹)당 predict 1회 / False: SKU별 predict_dual
+ML_BATCH_INFERENCE_ENABLED = True
+
 # 음료 기온 민감도 (QW-3)
 # mid_cd: {temp_range: multiplier} — 25도 이상 구간만 적용
 BEVERAGE_TEMP_SENSITIVITY = {
@@ -2,12 +2,19 @@
 데이터 품질 검증기
 
 수집된 판매 데이터의 품질을 검증하고 이상 데이터를 탐지합니다.
+
+일괄 검증 (validation-batch):
+    validate_sales_data 는 하루치 상품의 중복 수집 횟수와 최근 N일 판매량
+    건수/합/제곱합을 GROUP BY 쿼리 1회로 읽고, 3σ 이상치를 배열 연산으로 판정합니다.
+    detect_duplicate / detect_sales_anomaly 는 단건 조회용으로 유지합니다.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import re
 import statistics
 
+import numpy as np
+
 from src.validation.validation_result import ValidationResult, ValidationError, ValidationWarning
 from src.validation.validation_rules import ValidationRules
 from src.infrastructure.database.repos import SalesRepository
@@ -17,6 +24,39 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 판매일 중복 수집 횟수 + 최근 window 판매량 통계 (상품별 1행, 1회 스캔)
+DAY_STATS_SQL = """
+    SELECT item_cd,
+           COUNT(DISTINCT CASE WHEN sales_date = ? THEN collected_at END) AS collections,
+           SUM(CASE WHEN {window} THEN 1 ELSE 0 END) AS n,
+           SUM(CASE WHEN {window} THEN sale_qty ELSE 0 END) AS total,
+           SUM(CASE WHEN {window} THEN sale_qty * sale_qty ELSE 0 END) AS total_sq
+    FROM daily_sales
+    WHERE (sales_date = ? OR ({window})) {sf}
+    GROUP BY item_cd
+"""
+_WINDOW_COND = "sales_date >= date('now', ?) AND sale_qty > 0"
+
+
+def _to_qty(value: Any) -> int:
+    try:
+        return int(value) if value is not None else 0
+    except (ValueError, TypeError):
+        return 0
+
+
+def _anomaly_warning(sale_qty: Any, mean: float, stddev: float) -> Dict[str, Any]:
+    return {
+        'code': 'ANOMALY_3SIGMA',
+        'message': f'판매량 이상치 감지 (3σ 초과)',
+        'metadata': {
+            'value': sale_qty,
+            'mean': round(mean, 2),
+            'stddev': round(stddev, 2),
+            'threshold': round(3 * stddev, 2)
+        }
+    }
+
 
 class DataValidator:
     """데이터 품질 검증기
@@ -63,11 +103,30 @@ class DataValidator:
             store_id=store_id
         )
 
+        # 1~2. 형식/수량 검증 (DB 조회 없음) → 통과 상품만 일괄 통계 대상
+        checked = []
         for item in data:
             item_cd = item.get('item_cd') or item.get('ITEM_CD', '')
-
-            # 1. 상품코드 형식 검증
             if not self.validate_item_code(item_cd):
+                checked.append((item, item_cd, None))
+            else:
+                checked.append((item, item_cd, self.validate_quantities(item)))
+
+        candidates = [
+            (item_cd, item.get('sale_qty') or item.get('SALE_QTY', 0))
+            for item, item_cd, qty_errors in checked
+            if qty_errors == []
+        ]
+        check_duplicate = self.rules.get_rule('duplicate_detection.enabled', True)
+        collections, anomalies = {}, []
+        if candidates:
+            collections, window = self._load_day_stats(sales_date)
+            anomalies = self._detect_anomalies_batch(candidates, window)
+
+        index = 0
+        for item, item_cd, qty_errors in checked:
+            # 1. 상품코드 형식 검증
+            if qty_errors is None:
                 result.add_error(
                     error_code='INVALID_ITEM_CD',
                     error_message=f'상품코드 형식 오류: {item_cd}',
@@ -77,7 +136,6 @@ class DataValidator:
                 continue
 
             # 2. 수량 범위 검증
-            qty_errors = self.validate_quantities(item)
             if qty_errors:
                 for error in qty_errors:
                     result.add_error(
@@ -88,19 +146,19 @@ class DataValidator:
                     )
                 continue
 
+            anomaly = anomalies[index]
+            index += 1
+
             # 3. 중복 수집 검증
-            if self.rules.get_rule('duplicate_detection.enabled', True):
-                if self.detect_duplicate(sales_date, item_cd):
-                    result.add_error(
-                        error_code='DUPLICATE_COLLECTION',
-                        error_message=f'중복 수집 감지: {sales_date} / {item_cd}',
-                        affected_item=item_cd
-                    )
-                    continue
+            if check_duplicate and collections.get(item_cd, 0) > 1:
+                result.add_error(
+                    error_code='DUPLICATE_COLLECTION',
+                    error_message=f'중복 수집 감지: {sales_date} / {item_cd}',
+                    affected_item=item_cd
+                )
+                continue
 
             # 4. 이상치 탐지 (경고만, 치명적 아님)
-            sale_qty = item.get('sale_qty') or item.get('SALE_QTY', 0)
-            anomaly = self.detect_sales_anomaly(item_cd, sale_qty)
             if anomaly:
                 result.add_warning(
                     warning_code=anomaly['code'],
@@ -249,27 +307,81 @@ class DataValidator:
 
             # 3σ 초과 체크
             if stddev > 0 and abs(sale_qty - mean) > 3 * stddev:
-                return {
-                    'code': 'ANOMALY_3SIGMA',
-                    'message': f'판매량 이상치 감지 (3σ 초과)',
-                    'metadata': {
-                        'value': sale_qty,
-                        'mean': round(mean, 2),
-                        'stddev': round(stddev, 2),
-                        'threshold': round(3 * stddev, 2)
-                    }
-                }
+                return _anomaly_warning(sale_qty, mean, stddev)
 
             return None
         finally:
             conn.close()
 
+    def _load_day_stats(
+        self, sales_date: str
+    ) -> Tuple[Dict[str, int], Dict[str, Tuple[int, float, float]]]:
+        """판매일 전 상품의 중복 수집 횟수 + 최근 window 판매량 통계 (쿼리 1회)
+
+        Returns:
+            (collections, window)
+            - collections: {item_cd: 판매일 DISTINCT collected_at 수}
+            - window: {item_cd: (판매일수, 판매량 합, 판매량 제곱합)} — sale_qty > 0 인 날만
+        """
+        window_days = self.rules.get_rule('anomaly.window_days', 30)
+        window_param = f'-{window_days} days'
+        sf, sp = store_filter("", self.store_id)
+        sql = DAY_STATS_SQL.format(window=_WINDOW_COND, sf=sf)
+
+        conn = get_connection()
+        try:
+            rows = conn.execute(sql, (
+                sales_date,
+                window_param, window_param, window_param,
+                sales_date, window_param,
+            ) + sp).fetchall()
+        finally:
+            conn.close()
+
+        collections = {row[0]: row[1] for row in rows if row[1]}
+        window = {row[0]: (row[2], row[3], row[4]) for row in rows if row[2]}
+        return collections, window
+
+    def _detect_anomalies_batch(
+        self,
+        candidates: List[Tuple[str, Any]],
+        window: Dict[str, Tuple[int, float, float]],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """detect_sales_anomaly 일괄판 (3σ 판정 배열 연산)
+
+        Args:
+            candidates: [(item_cd, sale_qty)] — 반환 리스트와 같은 순서
+            window: _load_day_stats 의 window 통계
+
+        Returns:
+            candidates 순서의 경고 정보 또는 None
+        """
+        min_samples = self.rules.get_rule('anomaly.min_samples', 7)
+        stats = np.array(
+            [window.get(item_cd, (0, 0, 0)) for item_cd, _ in candidates], dtype=float
+        ).reshape(-1, 3)
+        n, total, total_sq = stats[:, 0], stats[:, 1], stats[:, 2]
+        qty = np.array([_to_qty(q) for _, q in candidates], dtype=float)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(n > 0, total / n, 0.0)
+            # 표본 분산 = (n·Σx² − (Σx)²) / (n(n−1))  (statistics.stdev 와 동일 정의)
+            var = np.where(n > 1, (n * total_sq - total * total) / (n * (n - 1)), 0.0)
+        stddev = np.sqrt(np.maximum(var, 0.0))
+        flagged = (n >= min_samples) & (stddev > 0) & (np.abs(qty - mean) > 3 * stddev)
+
+        return [
+            _anomaly_warning(_to_qty(candidates[i][1]), float(mean[i]), float(stddev[i]))
+            if flagged[i] else None
+            for i in range(len(candidates))
+        ]
+
     def validate_batch(
         self,
         dates: List[str],
         store_id: Optional[str] = None
     ) -> Dict[str, ValidationResult]:
-        """여러 날짜 일괄 검증
+        """여러 날짜 일괄 검증 (날짜당 통계 쿼리 1회)
 
         Args:
             dates: 검증할 날짜 리스트 (YYYY-MM-DD)
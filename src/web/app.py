@@ -27,6 +27,13 @@ if _root_path not in sys.path:
 
 def create_app() -> Flask:
     """Flask 앱 팩토리"""
+    # 클라우드 델타 동기화: 리로드 직후 DB 를 열기 전에 업로드된 페이지 델타 반영 (cloud-delta-sync)
+    try:
+        from src.infrastructure.database.page_delta import apply_pending_deltas
+        apply_pending_deltas(PROJECT_ROOT)
+    except Exception as e:
+        logger.warning(f"[PageDelta] 델타 적용 건너뜀: {e}")
+
     app = Flask(
         __name__,
         template_folder=str(Path(__file__).parent / "templates"),
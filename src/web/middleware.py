@@ -52,6 +52,7 @@ _PUBLIC_PREFIXES = (
     "/api/auth/login", "/api/auth/logout", "/api/auth/signup",
     "/api/onboarding/",        # 온보딩 전체 API (자체 _require_onboarding 인증 사용)
     "/onboarding",             # 온보딩 SPA 페이지 (Step 1 가입 포함)
+    "/api/sync/",              # 클라우드 동기화 상태 (자체 X-Sync-Token 인증)
     "/login", "/static/",
 )
 
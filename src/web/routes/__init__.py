@@ -23,6 +23,7 @@ def register_blueprints(app: Flask):
     from .api_category_decision import category_decision_bp
     from .api_integrity import integrity_bp
     from .api_association import association_bp
+    from .api_sync import sync_bp
     from .onboarding import onboarding_bp
 
     app.register_blueprint(pages_bp)
@@ -45,4 +46,5 @@ def register_blueprints(app: Flask):
     app.register_blueprint(category_decision_bp, url_prefix="/api/category-decision")
     app.register_blueprint(integrity_bp, url_prefix="/api/integrity")
     app.register_blueprint(association_bp, url_prefix="/api/association")
+    app.register_blueprint(sync_bp, url_prefix="/api/sync")
     app.register_blueprint(onboarding_bp)
@@ -1,18 +1,33 @@
 """홈 대시보드 REST API
 
 DashboardService를 통해 데이터를 제공합니다.
+status/summary/analytics/waste-risk/store-comparison 은 스케줄러 잡이 기록한
+매장별 스냅샷(dashboard-snapshot)을 읽고 ETag/If-None-Match 로 응답합니다.
 """
+import json
 import os
 import sqlite3
 import sys
 import subprocess
-import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
 from flask import Blueprint, jsonify, request, current_app, session
 
 from src.application.services.dashboard_service import DashboardService
+from src.application.services.dashboard_snapshot_service import (
+    SECTION_STATUS,
+    SECTION_SUMMARY,
+    SECTION_WASTE_RISK,
+    SECTION_WEEKLY,
+    DashboardSnapshotService,
+    build_sections,
+    compute_section,
+)
+from src.infrastructure.database.repos.dashboard_snapshot_repo import (
+    dump_payload,
+    payload_etag,
+)
 from src.infrastructure.database.connection import DBRouter
 from src.utils.logger import get_logger
 from src.web.routes.api_auth import admin_required, login_required
@@ -21,10 +36,6 @@ logger = get_logger(__name__)
 
 home_bp = Blueprint("home", __name__)
 
-# API 응답 캐시 (store_id별 TTL 기반)
-_status_cache = {}  # {cache_key: {"data": ..., "expires": ...}}
-_STATUS_CACHE_TTL = 5  # 초
-
 
 def _is_pid_running(pid):
     """PID가 실행 중인지 확인 (Windows/Unix 호환)"""
@@ -47,43 +58,25 @@ def _is_pid_running(pid):
 
 @home_bp.route("/status", methods=["GET"])
 def status():
-    """홈 대시보드 통합 데이터 (5초 캐시)"""
-    now = time.time()
+    """홈 대시보드 통합 데이터 (스냅샷 + 스케줄러/실행 상태)"""
     store_id = request.args.get('store_id')
-    cache_key = f"store:{store_id or 'all'}"
-
-    cached = _status_cache.get(cache_key)
-    if cached and cached["data"] is not None and now < cached["expires"]:
-        return jsonify(cached["data"])
-
-    project_root = current_app.config["PROJECT_ROOT"]
-    if store_id:
-        svc = DashboardService(store_id=store_id)
-    else:
-        db_path = current_app.config.get("DB_PATH")
-        svc = DashboardService(db_path=db_path)
-
+    payload, _ = _snapshot_section(store_id, SECTION_STATUS)
+    data = json.loads(payload)
+
+    # 요청 시점 상태 (SQL 없음): 스케줄러 락, 웹 스크립트 실행, 메모리 예측 캐시
+    data["scheduler"] = _get_scheduler_status(current_app.config["PROJECT_ROOT"])
+    data["pipeline"]["stage"] = DashboardService.pipeline_stage(
+        current_app.config.get("SCRIPT_TASK")
+    )
     pred_cache = current_app.config.get("LAST_PREDICTIONS", {})
     predictions = pred_cache.get(store_id) if store_id else None
+    if predictions:
+        data["today_summary"] = DashboardService(store_id=store_id).get_today_summary(
+            cached_predictions=predictions
+        )
 
-    data = {
-        "scheduler": _get_scheduler_status(project_root),
-        "last_order": svc.get_last_order(),
-        "today_summary": svc.get_today_summary(cached_predictions=predictions),
-        "expiry_risk": svc.get_expiry_risk(),
-        "pipeline": svc.get_pipeline_status(
-            script_task=current_app.config.get("SCRIPT_TASK")
-        ),
-        "recent_events": svc.get_recent_events(),
-        "fail_reasons": svc.get_fail_reasons(),
-        "order_trend_7d": svc.get_order_trend_7d(),
-        "sales_trend_7d": svc.get_sales_trend_7d(),
-        "waste_trend_7d": svc.get_waste_trend_7d(),
-    }
-
-    _status_cache[cache_key] = {"data": data, "expires": now + _STATUS_CACHE_TTL}
-
-    return jsonify(data)
+    payload = dump_payload(data)
+    return _conditional_json(payload, payload_etag(payload))
 
 
 @home_bp.route("/store-comparison", methods=["GET"])
@@ -91,7 +84,8 @@ def store_comparison():
     """매장 간 비교 요약 API"""
     svc = DashboardService()
     data = svc.get_store_comparison()
-    return jsonify({"stores": data, "count": len(data)})
+    payload = dump_payload({"stores": data, "count": len(data)})
+    return _conditional_json(payload, payload_etag(payload))
 
 
 @home_bp.route("/scheduler/start", methods=["POST"])
@@ -222,112 +216,7 @@ def summary():
     기존 /status 데이터를 간소화하여 반환합니다.
     """
     store_id = session.get("store_id") or request.args.get("store_id")
-    if store_id:
-        svc = DashboardService(store_id=store_id)
-    else:
-        db_path = current_app.config.get("DB_PATH")
-        svc = DashboardService(db_path=db_path)
-
-    project_root = current_app.config["PROJECT_ROOT"]
-    last_order = svc.get_last_order()
-
-    # 발주 상태 판정
-    if last_order.get("success_count", 0) > 0 and last_order.get("fail_count", 0) == 0:
-        order_status = "completed"
-    elif last_order.get("fail_count", 0) > 0:
-        order_status = "failed"
-    else:
-        sched = _get_scheduler_status(project_root)
-        order_status = "pending" if sched.get("running") else "pending"
-
-    # 매출 데이터 직접 쿼리 (hourly_sales_detail.sale_amt 실제 매출 우선, 폴백: qty*price)
-    today_sales = 0
-    today_sales_diff = 0
-    monthly_profit = 0
-    try:
-        conn = _get_summary_conn(store_id)
-        try:
-            today = datetime.now().strftime("%Y-%m-%d")
-            yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
-
-            # 오늘 매출 (hourly_sales_detail 우선)
-            row_today = conn.execute("""
-                SELECT COALESCE(SUM(sale_amt), 0)
-                FROM hourly_sales_detail
-                WHERE sales_date = ?
-            """, (today,)).fetchone()
-            today_sales = row_today[0] if row_today else 0
-            if not today_sales:
-                row_today = conn.execute("""
-                    SELECT COALESCE(SUM(ds.sale_qty * COALESCE(pd.sell_price, 0)), 0)
-                    FROM daily_sales ds
-                    LEFT JOIN product_details pd ON ds.item_cd = pd.item_cd
-                    WHERE ds.sales_date = ?
-                """, (today,)).fetchone()
-                today_sales = row_today[0] if row_today else 0
-
-            # 어제 매출 (hourly_sales_detail 우선)
-            row_yest = conn.execute("""
-                SELECT COALESCE(SUM(sale_amt), 0)
-                FROM hourly_sales_detail
-                WHERE sales_date = ?
-            """, (yesterday,)).fetchone()
-            yest_sales = row_yest[0] if row_yest else 0
-            if not yest_sales:
-                row_yest = conn.execute("""
-                    SELECT COALESCE(SUM(ds.sale_qty * COALESCE(pd.sell_price, 0)), 0)
-                    FROM daily_sales ds
-                    LEFT JOIN product_details pd ON ds.item_cd = pd.item_cd
-                    WHERE ds.sales_date = ?
-                """, (yesterday,)).fetchone()
-                yest_sales = row_yest[0] if row_yest else 0
-
-            if yest_sales > 0:
-                today_sales_diff = round(
-                    (today_sales - yest_sales) / yest_sales * 100, 1
-                )
-
-            # 이번달 순수익 (hourly_sales_detail.sale_amt × margin_rate 기반)
-            row_month = conn.execute("""
-                SELECT COALESCE(SUM(
-                    hsd.sale_amt * COALESCE(pd.margin_rate, 25) / 100.0
-                ), 0)
-                FROM hourly_sales_detail hsd
-                LEFT JOIN product_details pd ON hsd.item_cd = pd.item_cd
-                WHERE hsd.sales_date >= date('now', 'start of month')
-            """).fetchone()
-            monthly_profit = int(row_month[0]) if row_month else 0
-            if not monthly_profit:
-                row_month = conn.execute("""
-                    SELECT COALESCE(SUM(
-                        ds.sale_qty * COALESCE(pd.sell_price, 0)
-                        * COALESCE(pd.margin_rate, 25) / 100.0
-                    ), 0)
-                    FROM daily_sales ds
-                    LEFT JOIN product_details pd ON ds.item_cd = pd.item_cd
-                    WHERE ds.sales_date >= date('now', 'start of month')
-                """).fetchone()
-                monthly_profit = int(row_month[0]) if row_month else 0
-        finally:
-            conn.close()
-    except Exception as e:
-        logger.warning("홈 매출 쿼리 실패: %s", e)
-
-    # 폐기 위험
-    expiry = svc.get_expiry_risk()
-    expiry_items = expiry.get("items", []) if isinstance(expiry, dict) else []
-    waste_risk_count = len(expiry_items)
-
-    return jsonify({
-        "order_status": order_status,
-        "order_time": last_order.get("time", "07:00"),
-        "today_sales": today_sales,
-        "today_sales_diff": today_sales_diff,
-        "waste_risk_count": waste_risk_count,
-        "monthly_profit": monthly_profit,
-        "order_success": last_order.get("success_count", 0),
-        "order_fail": last_order.get("fail_count", 0),
-    })
+    return _conditional_json(*_snapshot_section(store_id, SECTION_SUMMARY))
 
 
 @home_bp.route("/waste-risk-products", methods=["GET"])
@@ -335,54 +224,7 @@ def summary():
 def waste_risk_products():
     """폐기 위험 상품 목록 (점주 대시보드용)"""
     store_id = session.get("store_id") or request.args.get("store_id")
-    if store_id:
-        svc = DashboardService(store_id=store_id)
-    else:
-        db_path = current_app.config.get("DB_PATH")
-        svc = DashboardService(db_path=db_path)
-
-    expiry = svc.get_expiry_risk()
-    items = expiry.get("items", []) if isinstance(expiry, dict) else []
-
-    result = []
-    for item in items[:20]:
-        expiry_date = item.get("expiry_date", "")
-        # 만료 시간 포맷팅
-        expires_at = expiry_date
-        try:
-            if " " in expiry_date:
-                # %H:%M:%S 또는 %H:%M 두 포맷 모두 처리
-                for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-                    try:
-                        dt = datetime.strptime(expiry_date, fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    dt = None
-                if dt:
-                    today = datetime.now().strftime("%Y-%m-%d")
-                    if dt.strftime("%Y-%m-%d") == today:
-                        expires_at = "오늘 " + dt.strftime("%H:%M")
-                    else:
-                        expires_at = dt.strftime("%m/%d %H:%M")
-            else:
-                dt = datetime.strptime(expiry_date, "%Y-%m-%d")
-                today = datetime.now().strftime("%Y-%m-%d")
-                if expiry_date == today:
-                    expires_at = "오늘"
-                else:
-                    expires_at = dt.strftime("%m/%d")
-        except Exception:
-            pass
-
-        result.append({
-            "name": item.get("item_nm", ""),
-            "expires_at": expires_at,
-            "quantity": item.get("remaining_qty", 0),
-        })
-
-    return jsonify(result)
+    return _conditional_json(*_snapshot_section(store_id, SECTION_WASTE_RISK))
 
 
 @home_bp.route("/profit-breakdown", methods=["GET"])
@@ -455,131 +297,44 @@ def profit_breakdown():
 def analytics_weekly():
     """이번주 현황 API (점주 대시보드용)"""
     store_id = session.get("store_id") or request.args.get("store_id")
-    if store_id:
-        svc = DashboardService(store_id=store_id)
-    else:
-        db_path = current_app.config.get("DB_PATH")
-        svc = DashboardService(db_path=db_path)
-
-    # 직접 쿼리: 날짜별 매출액 + 요일 라벨
-    day_labels = ["월", "화", "수", "목", "금", "토", "일"]
-    daily_sales = []
-    days = []
-    date_range = ""
-    total_sales = 0
-    total_ordered = 0
-    total_waste = 0
-
-    try:
-        conn = _get_summary_conn(store_id)
-        try:
-            # 7일 매출 (hourly_sales_detail.sale_amt 실제 매출 우선, 폴백: qty*price)
-            sales_rows = conn.execute("""
-                SELECT sales_date, COALESCE(SUM(sale_amt), 0)
-                FROM hourly_sales_detail
-                WHERE sales_date >= date('now', '-7 days')
-                GROUP BY sales_date
-                ORDER BY sales_date ASC
-            """).fetchall()
-            if not sales_rows:
-                sales_rows = conn.execute("""
-                    SELECT ds.sales_date, COALESCE(SUM(ds.sale_qty * COALESCE(pd.sell_price, 0)), 0)
-                    FROM daily_sales ds
-                    LEFT JOIN product_details pd ON ds.item_cd = pd.item_cd
-                    WHERE ds.sales_date >= date('now', '-7 days')
-                    GROUP BY ds.sales_date
-                    ORDER BY ds.sales_date ASC
-                """).fetchall()
+    return _conditional_json(*_snapshot_section(store_id, SECTION_WEEKLY))
 
-            for r in sales_rows:
-                daily_sales.append(r[1])
-                try:
-                    dt = datetime.strptime(r[0], "%Y-%m-%d")
-                    days.append(day_labels[dt.weekday()])
-                except Exception:
-                    days.append("")
-
-            if sales_rows and len(sales_rows) >= 2:
-                try:
-                    start = datetime.strptime(sales_rows[0][0], "%Y-%m-%d")
-                    end = datetime.strptime(sales_rows[-1][0], "%Y-%m-%d")
-                    date_range = "%d월 %d일 - %d월 %d일" % (
-                        start.month, start.day, end.month, end.day
-                    )
-                except Exception:
-                    pass
-
-            total_sales = sum(daily_sales)
-
-            # 발주 건수
-            order_row = conn.execute("""
-                SELECT COALESCE(SUM(order_qty), 0), COUNT(*)
-                FROM order_tracking
-                WHERE order_date >= date('now', '-7 days')
-            """).fetchone()
-            total_ordered = order_row[1] if order_row else 0
-
-            # 폐기 건수
-            waste_row = conn.execute("""
-                SELECT COALESCE(SUM(disuse_qty), 0), COUNT(*)
-                FROM daily_sales
-                WHERE sales_date >= date('now', '-7 days')
-                  AND disuse_qty > 0
-            """).fetchone()
-            total_waste = waste_row[1] if waste_row else 0
-        finally:
-            conn.close()
-    except Exception as e:
-        logger.warning("주간 분석 쿼리 실패: %s", e)
 
-    avg_daily = int(total_sales / len(daily_sales)) if daily_sales else 0
+def _snapshot_section(store_id, section):
+    """대시보드 섹션 (JSON 문자열, ETag)
 
-    # 발주 적중률
-    order_accuracy = 0
-    if total_ordered > 0:
-        order_accuracy = round(
-            max(0, min(100, (1 - total_waste / max(total_ordered, 1)) * 100)), 1
+    store_id 가 있으면 매장 스냅샷(없거나 만료 시 해당 섹션만 계산, 저장 안 함),
+    없으면(app.config["DB_PATH"] 단일 DB) 즉시 계산한다. 즉시 계산 결과는
+    짧은 TTL 동안 프로세스 메모리에 캐시된다.
+    """
+    if store_id:
+        try:
+            row = DashboardSnapshotService(store_id).get(section)
+            return row["payload"], row["etag"]
+        except Exception as e:
+            logger.warning(f"[DashboardSnapshot] {store_id}/{section} 스냅샷 조회 실패: {e}")
+        payload = dump_payload(
+            build_sections(DashboardService(store_id=store_id), [section])[section]
         )
+        return payload, payload_etag(payload)
 
-    # 시간대별 매출 (hourly_sales_detail 실제 매출, 당일)
-    hourly_data = []
-    try:
-        h_conn = _get_summary_conn(store_id)
-        try:
-            today_str = datetime.now().strftime("%Y-%m-%d")
-            h_rows = h_conn.execute("""
-                SELECT hour, COALESCE(SUM(sale_amt), 0)
-                FROM hourly_sales_detail
-                WHERE sales_date = ?
-                GROUP BY hour
-                ORDER BY hour ASC
-            """, (today_str,)).fetchall()
-            hourly_map = {r[0]: r[1] for r in h_rows}
-            for h in range(24):
-                hourly_data.append(hourly_map.get(h, 0))
-        finally:
-            h_conn.close()
-    except Exception as e:
-        logger.warning("시간대별 매출 조회 실패: %s", e)
-        hourly_data = [0] * 24
+    db_path = current_app.config.get("DB_PATH")
+    row = compute_section(f"db:{db_path}", section, DashboardService(db_path=db_path))
+    return row["payload"], row["etag"]
 
-    return jsonify({
-        "daily_sales": daily_sales,
-        "days": days,
-        "date_range": date_range,
-        "order_accuracy": order_accuracy,
-        "waste_saved": total_waste,
-        "waste_saved_diff": 0,
-        "total_sales": total_sales,
-        "avg_daily_sales": avg_daily,
-        "order_count": total_ordered,
-        "waste_count": total_waste,
-        "hourly_sales": hourly_data,
-    })
+
+def _conditional_json(payload, etag):
+    """JSON 응답 + ETag (If-None-Match 일치 시 304)"""
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(payload, mimetype="application/json")
+    response.set_etag(etag)
+    return response
 
 
 def _get_summary_conn(store_id):
-    """매장 DB 연결 반환 (summary/weekly API용)"""
+    """매장 DB 연결 반환 (profit-breakdown API용)"""
     if store_id:
         try:
             from src.infrastructure.database.connection import attach_common_with_views
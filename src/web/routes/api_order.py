@@ -15,6 +15,10 @@ from flask import Blueprint, request, jsonify, current_app, send_file
 
 from src.utils.logger import get_logger
 from src.settings.constants import DEFAULT_STORE_ID
+from src.application.services.dashboard_snapshot_service import (
+    invalidate_dashboard_snapshot,
+    refresh_dashboard_snapshot,
+)
 from src.infrastructure.database.connection import DBRouter
 from src.web.routes.api_auth import admin_required
 
@@ -60,6 +64,19 @@ def get_stores():
     return jsonify({"stores": stores})
 
 
+def _predict_candidates(store_id: str):
+    """발주 후보 예측 — 상주 예측 데몬이 있으면 warm 예측기 사용, 없으면 직접 예측"""
+    from src.application.scheduler.prediction_daemon import get_prediction_daemon_client
+    client = get_prediction_daemon_client()
+    if client is not None:
+        try:
+            return client.predict_candidates(store_id, min_order_qty=0)
+        except Exception as e:
+            logger.warning(f"예측 데몬 호출 실패 (직접 예측으로 폴백): {e}")
+    predictor = ImprovedPredictor(store_id=store_id)
+    return predictor.get_order_candidates(min_order_qty=0)
+
+
 @order_bp.route("/predict", methods=["POST"])
 @admin_required
 def predict():
@@ -69,8 +86,7 @@ def predict():
     store_id = request.args.get('store_id', DEFAULT_STORE_ID)
 
     try:
-        predictor = ImprovedPredictor(store_id=store_id)
-        candidates = predictor.get_order_candidates(min_order_qty=0)
+        candidates = _predict_candidates(store_id)
 
         # 자동발주 상품 제외 (DB 설정 반영, 매장별)
         settings_repo = AppSettingsRepository(store_id=store_id)
@@ -544,6 +560,10 @@ _SCRIPT_MAP = {
 }
 
 
+# 매장 데이터를 쓰는 모드 (종료 후 대시보드 스냅샷 갱신, dashboard-snapshot)
+_SNAPSHOT_REFRESH_MODES = {"dry-run", "full-test", "real-order"}
+
+
 def _read_output(pipe, output_list):
     """서브프로세스 stdout/stderr를 라인 단위로 읽어 리스트에 추가"""
     try:
@@ -555,6 +575,13 @@ def _read_output(pipe, output_list):
         logger.warning(f"발주 데이터 조회 실패: {e}")
 
 
+def _read_output_then_refresh(proc, output_list, store_id):
+    """출력 수집 후 프로세스 종료(중단 포함)를 기다려 대시보드 스냅샷 갱신"""
+    _read_output(proc.stdout, output_list)
+    proc.wait()
+    refresh_dashboard_snapshot(store_id)
+
+
 @order_bp.route("/run-script", methods=["POST"])
 @admin_required
 def run_script():
@@ -619,8 +646,17 @@ def run_script():
         logger.error(f"스크립트 실행 실패: {e}")
         return jsonify({"error": "스크립트 실행에 실패했습니다"}), 500
 
-    # stdout 읽기 스레드
-    reader = threading.Thread(target=_read_output, args=(proc.stdout, output_lines), daemon=True)
+    # stdout 읽기 스레드 (데이터를 쓰는 모드는 실행 중 스냅샷 무효화, 종료 후 갱신)
+    if mode in _SNAPSHOT_REFRESH_MODES:
+        invalidate_dashboard_snapshot(str(store_id))
+        reader = threading.Thread(
+            target=_read_output_then_refresh, args=(proc, output_lines, str(store_id)),
+            daemon=True,
+        )
+    else:
+        reader = threading.Thread(
+            target=_read_output, args=(proc.stdout, output_lines), daemon=True
+        )
     reader.start()
 
     current_app.config["SCRIPT_TASK"] = {
@@ -8,7 +8,6 @@ from flask import Blueprint, request, jsonify, current_app
 
 from src.utils.logger import get_logger
 from src.infrastructure.database.connection import DBRouter
-from src.prediction.improved_predictor import ImprovedPredictor
 from src.report.daily_order_report import DailyOrderReport
 from src.report.weekly_trend_report import WeeklyTrendReportHTML
 from src.report.category_detail_report import CategoryDetailReport
@@ -46,8 +45,8 @@ def _get_or_run_predictions(max_items: int = 0, store_id: str = None):
         # 레거시 호환: list가 직접 저장된 경우 (만료 없이 사용)
         return cache_entry
 
-    predictor = ImprovedPredictor(store_id=sid)
-    candidates = predictor.get_order_candidates(min_order_qty=0)
+    from src.web.routes.api_order import _predict_candidates
+    candidates = _predict_candidates(sid)
     if max_items and max_items > 0:
         candidates = candidates[:max_items]
 
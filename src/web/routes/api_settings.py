@@ -6,6 +6,8 @@ POST /api/settings/eval-params/reset -- 기본값 복원 (admin)
 GET  /api/settings/feature-flags     -- 기능 토글 목록
 POST /api/settings/feature-flags     -- 토글 전환 (admin)
 GET  /api/settings/audit-log         -- 변경 이력 조회
+
+설정 저장(POST 성공) 후에는 홈 대시보드 스냅샷을 전 매장 무효화한다 (dashboard-snapshot).
 """
 
 import json
@@ -15,6 +17,7 @@ from pathlib import Path
 
 from flask import Blueprint, jsonify, request, session
 
+from src.application.services.dashboard_snapshot_service import invalidate_dashboard_snapshot
 from src.utils.logger import get_logger
 from .api_auth import admin_required, login_required
 
@@ -114,6 +117,14 @@ def _log_audit(key: str, old_val, new_val, category: str):
         logger.warning(f"[설정] 감사 로그 기록 실패: {e}")
 
 
+@settings_bp.after_request
+def _invalidate_dashboard_after_save(response):
+    """설정 저장 성공 시 대시보드 스냅샷 무효화 (다음 잡 갱신 전까지 요청 시 계산)"""
+    if request.method == "POST" and response.status_code < 400:
+        invalidate_dashboard_snapshot()
+    return response
+
+
 # ── eval-params ──────────────────────────────────────────────
 
 @settings_bp.route("/eval-params")
@@ -0,0 +1,50 @@
+"""클라우드 동기화 상태 API (cloud-delta-sync).
+
+GET /api/sync/db-state?db=data/common.db  -- 원격 DB SHA256 (X-Sync-Token 인증)
+
+로컬 CloudSyncer 가 델타 업로드 전에 원격 DB 가 직전 동기화 상태 그대로인지
+확인한다. 웹앱 쓰기(설정 감사 로그, 대시보드 스냅샷 등)로 달라졌으면 로컬은
+같은 실행에서 전체 업로드로 전환한다.
+
+세션 인증 대신 환경변수 CLOUD_SYNC_TOKEN 과 같은 토큰을 요구하며,
+토큰이 설정되지 않은 서버에서는 404 로 비활성화된다.
+"""
+
+import hmac
+import os
+from pathlib import Path
+
+from flask import Blueprint, jsonify, request
+
+from src.infrastructure.database.page_delta import PageDeltaError, db_state
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+sync_bp = Blueprint("sync", __name__)
+
+# 프로젝트 루트
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
+SYNC_TOKEN_ENV = "CLOUD_SYNC_TOKEN"
+SYNC_TOKEN_HEADER = "X-Sync-Token"
+
+
+@sync_bp.route("/db-state", methods=["GET"])
+def get_db_state():
+    """원격 DB 상태 (WAL 체크포인트 후 SHA256)"""
+    expected = os.getenv(SYNC_TOKEN_ENV)
+    if not expected:
+        return jsonify({"error": "동기화 상태 API 비활성", "code": "DISABLED"}), 404
+    token = request.headers.get(SYNC_TOKEN_HEADER, "")
+    if not hmac.compare_digest(token.encode("utf-8"), expected.encode("utf-8")):
+        return jsonify({"error": "동기화 토큰 불일치", "code": "UNAUTHORIZED"}), 401
+
+    db_rel = request.args.get("db", "")
+    try:
+        return jsonify(db_state(PROJECT_ROOT, db_rel))
+    except PageDeltaError as e:
+        return jsonify({"error": str(e), "code": "INVALID_DB"}), 400
+    except OSError as e:
+        logger.warning(f"[SyncState] {db_rel} 상태 조회 실패: {e}")
+        return jsonify({"error": str(e)[:200], "code": "IO_ERROR"}), 500
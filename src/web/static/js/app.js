@@ -248,6 +248,9 @@ document.querySelectorAll('.analytics-tab-btn').forEach(function(tab) {
 });
 
 // === Fetch 헬퍼 ===
+// GET 응답 ETag 캐시: If-None-Match 재검증 → 304 이면 이전 응답 재사용
+var _etagCache = {};
+
 async function api(url, options) {
     options = options || {};
 
@@ -264,6 +267,10 @@ async function api(url, options) {
     };
     if (options.method) fetchOpts.method = options.method;
     if (options.body) fetchOpts.body = JSON.stringify(options.body);
+    var isGet = !options.method || options.method === 'GET';
+    if (isGet && _etagCache[url]) {
+        fetchOpts.headers['If-None-Match'] = _etagCache[url].etag;
+    }
     var res = await fetch(url, fetchOpts);
 
     // 401 -> 로그인 페이지로 이동
@@ -272,7 +279,15 @@ async function api(url, options) {
         throw new Error('Unauthorized');
     }
 
-    return res.json();
+    if (res.status === 304 && _etagCache[url]) {
+        return _etagCache[url].data;
+    }
+    var data = await res.json();
+    var etag = res.headers.get('ETag');
+    if (isGet && etag) {
+        _etagCache[url] = { etag: etag, data: data };
+    }
+    return data;
 }
 
 // === 숫자 포맷 ===
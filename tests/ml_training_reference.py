@@ -0,0 +1,254 @@
+"""MLTrainer 행 단위 학습 샘플 참조 구현 (columnar-feature-matrix)
+
+학습 본 경로(MLTrainer._prepare_feature_matrices)가 대체한 기존
+샘플 dict 생성 루프. 운영 코드에는 두지 않고 test_feature_matrix의
+행렬 경로 열 단위 비교에만 사용한다. 품절 imputation 검증은
+test_ml_stockout_filter가 학습 본 경로(_iter_feature_matrices)로 수행한다.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from src.prediction.ml.feature_builder import (
+    CATEGORY_GROUPS,
+    MLFeatureBuilder,
+    get_category_group,
+)
+from src.prediction.ml.trainer import _load_training_caches
+from src.prediction.prediction_config import PREDICTION_PARAMS
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def prepare_training_samples(trainer, days: int = 90) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    학습 데이터 준비 (카테고리 그룹별, 샘플 dict)
+
+    Args:
+        trainer: MLTrainer (pipeline, store_id 사용)
+        days: 학습 데이터 기간
+
+    Returns:
+        {group_name: [{daily_sales, target_date, mid_cd, actual_sale_qty, ...}, ...]}
+    """
+    # 활성 상품 목록
+    active_items = trainer.pipeline.get_active_items(min_days=14)
+    if not active_items:
+        logger.warning("활성 상품 없음. 학습 데이터 없음.")
+        return {}
+
+    logger.info(f"학습 대상 상품: {len(active_items)}개")
+
+    # 상품 메타/기온/행사/입고패턴 캐시
+    item_meta, weather_data, promo_cache, receiving_stats_cache = _load_training_caches(
+        trainer.pipeline, trainer.store_id, [i["item_cd"] for i in active_items], days
+    )
+
+    # 그룹별 학습 데이터 분류
+    group_data: Dict[str, List[Dict[str, Any]]] = {
+        group: [] for group in CATEGORY_GROUPS
+    }
+
+    # ML 품절일 imputation 설정
+    _ml_so_cfg = PREDICTION_PARAMS.get("ml_stockout_filter", {})
+    ml_stockout_enabled = _ml_so_cfg.get("enabled", False)
+    ml_stockout_min_days = _ml_so_cfg.get("min_available_days", 3)
+
+    # 시간대 Feature 캐시 (item_cd별 1회 조회)
+    _hourly_cache: Dict[str, dict] = {}
+
+    for item_info in active_items:
+        item_cd = item_info["item_cd"]
+        mid_cd = item_info["mid_cd"]
+        group = get_category_group(mid_cd)
+
+        # 일별 판매 데이터 조회
+        daily_sales = trainer.pipeline.get_item_daily_stats(item_cd, days)
+        if len(daily_sales) < 14:
+            continue
+
+        # 시간대 Feature 조회 (캐시: item_cd별 1회)
+        if item_cd not in _hourly_cache:
+            _hourly_cache[item_cd] = MLFeatureBuilder.calc_hourly_ratios(
+                store_id=trainer.store_id or "",
+                item_cd=item_cd,
+                base_date=daily_sales[-1]["sales_date"],
+                days=14,
+            )
+
+        # 상품 메타정보
+        meta = item_meta.get(item_cd, {})
+
+        # A0: 품절일 imputation용 비품절 평균 (최근 14일 → 30일 폴백)
+        _non_stockout_avg = None
+        if ml_stockout_enabled:
+            _avail_14 = [
+                (d.get("sale_qty", 0) or 0)
+                for d in daily_sales[-14:]
+                if d.get("stock_qty") is not None and d.get("stock_qty", 0) > 0
+            ]
+            if len(_avail_14) >= ml_stockout_min_days:
+                _non_stockout_avg = sum(_avail_14) / len(_avail_14)
+            else:
+                _avail_30 = [
+                    (d.get("sale_qty", 0) or 0)
+                    for d in daily_sales[-30:]
+                    if d.get("stock_qty") is not None and d.get("stock_qty", 0) > 0
+                ]
+                if len(_avail_30) >= ml_stockout_min_days:
+                    _non_stockout_avg = sum(_avail_30) / len(_avail_30)
+
+        # 학습 샘플 생성: 7일 이전까지의 각 날짜를 target으로
+        # (최소 7일의 이전 데이터를 feature로 사용)
+        # Lag 계산을 위한 판매량 인덱싱 (날짜→인덱스 맵)
+        date_to_idx = {row["sales_date"]: idx for idx, row in enumerate(daily_sales)}
+
+        for i in range(7, len(daily_sales)):
+            target_row = daily_sales[i]
+            history = daily_sales[:i]
+
+            # 해당 날짜의 외부 요인 조회 (기온, 공휴일 등)
+            target_date_str = target_row["sales_date"]
+            day_factors = weather_data.get(target_date_str, {})
+            temp_str = day_factors.get("temperature")
+            temp_val = None
+            if temp_str is not None:
+                try:
+                    temp_val = float(temp_str)
+                except (ValueError, TypeError):
+                    pass
+
+            # 전일 기온 → 기온 변화량 계산
+            temp_delta_val = None
+            if temp_val is not None:
+                prev_date_str = (datetime.strptime(target_date_str, "%Y-%m-%d") - timedelta(days=1)).strftime("%Y-%m-%d")
+                prev_factors = weather_data.get(prev_date_str, {})
+                prev_temp_str = prev_factors.get("temperature")
+                if prev_temp_str is not None:
+                    try:
+                        temp_delta_val = temp_val - float(prev_temp_str)
+                    except (ValueError, TypeError):
+                        pass
+
+            # 공휴일 여부
+            holiday_str = day_factors.get("is_holiday", "false")
+            is_holiday = holiday_str.lower() in ("true", "1", "yes")
+
+            # 연휴 맥락 (2026-02-18 추가)
+            holiday_period = int(day_factors.get("holiday_period_days", "0") or "0")
+            pre_holiday = day_factors.get("is_pre_holiday", "false").lower() in ("true", "1")
+            post_holiday = day_factors.get("is_post_holiday", "false").lower() in ("true", "1")
+
+            # Lag Features 계산 (학습 시점 기준)
+            lag_7_val = None
+            lag_28_val = None
+            wow_val = None
+            try:
+                target_dt = datetime.strptime(target_date_str, "%Y-%m-%d")
+                # lag_7: 7일 전 판매량 (A2: 품절일 imputation)
+                lag7_date = (target_dt - timedelta(days=7)).strftime("%Y-%m-%d")
+                if lag7_date in date_to_idx:
+                    _lag7_row = daily_sales[date_to_idx[lag7_date]]
+                    _lag7_sale = _lag7_row.get("sale_qty", 0) or 0
+                    _lag7_stock = _lag7_row.get("stock_qty")
+                    if (_non_stockout_avg is not None
+                            and _lag7_stock is not None and _lag7_stock == 0
+                            and _lag7_sale == 0):
+                        lag_7_val = _non_stockout_avg
+                    else:
+                        lag_7_val = _lag7_sale
+                # lag_28: 28일 전 판매량 (A2: 품절일 imputation)
+                lag28_date = (target_dt - timedelta(days=28)).strftime("%Y-%m-%d")
+                if lag28_date in date_to_idx:
+                    _lag28_row = daily_sales[date_to_idx[lag28_date]]
+                    _lag28_sale = _lag28_row.get("sale_qty", 0) or 0
+                    _lag28_stock = _lag28_row.get("stock_qty")
+                    if (_non_stockout_avg is not None
+                            and _lag28_stock is not None and _lag28_stock == 0
+                            and _lag28_sale == 0):
+                        lag_28_val = _non_stockout_avg
+                    else:
+                        lag_28_val = _lag28_sale
+                # week_over_week: (7일전 - 14일전) / 14일전 (A2: 품절일 imputation)
+                lag14_date = (target_dt - timedelta(days=14)).strftime("%Y-%m-%d")
+                if lag7_date in date_to_idx and lag14_date in date_to_idx:
+                    _r7 = daily_sales[date_to_idx[lag7_date]]
+                    _r14 = daily_sales[date_to_idx[lag14_date]]
+                    qty_7 = _r7.get("sale_qty", 0) or 0
+                    qty_14 = _r14.get("sale_qty", 0) or 0
+                    if _non_stockout_avg is not None:
+                        if (_r7.get("stock_qty") is not None and _r7["stock_qty"] == 0 and qty_7 == 0):
+                            qty_7 = _non_stockout_avg
+                        if (_r14.get("stock_qty") is not None and _r14["stock_qty"] == 0 and qty_14 == 0):
+                            qty_14 = _non_stockout_avg
+                    if qty_14 > 0:
+                        wow_val = round((qty_7 - qty_14) / qty_14, 3)
+                    elif qty_7 > 0:
+                        wow_val = 1.0
+                    else:
+                        wow_val = 0.0
+            except (ValueError, KeyError):
+                pass
+
+            # A1: Y값 품절일 imputation
+            _target_sale_qty = target_row.get("sale_qty", 0) or 0
+            _target_stock = target_row.get("stock_qty")
+            if (_non_stockout_avg is not None
+                    and _target_stock is not None and _target_stock == 0
+                    and _target_sale_qty == 0):
+                _target_sale_qty = _non_stockout_avg
+
+            # 외부 환경 피처 (35→39 확장)
+            _rain_qty_train = 0.0
+            _sky_nm_train = ""
+            _pm25_train = 0.0
+            try:
+                _rain_qty_train = float(day_factors.get("rain_qty", 0) or 0)
+                _sky_nm_train = str(day_factors.get("weather_cd_nm", "") or "")
+                _pm25_train = float(day_factors.get("pm25", 0) or 0)
+            except (ValueError, TypeError):
+                pass
+            _target_dt_day = datetime.strptime(target_date_str, "%Y-%m-%d").day
+            _is_payday_train = 1 if _target_dt_day in (10, 11, 12, 25, 26, 27) else 0
+
+            sample = {
+                "item_cd": item_cd,
+                "daily_sales": history,
+                "target_date": target_date_str,
+                "mid_cd": mid_cd,
+                "actual_sale_qty": _target_sale_qty,
+                "stock_qty": daily_sales[i - 1].get("stock_qty", 0) or 0,  # 전일 마감 재고 (leakage 제거)
+                "pending_qty": 0,
+                "promo_active": any(
+                    s <= target_date_str <= e for s, e in promo_cache.get(item_cd, [])
+                ),
+                "expiration_days": meta.get("expiration_days", 0),
+                "disuse_rate": meta.get("disuse_rate", 0.0),
+                "margin_rate": meta.get("margin_rate", 0.0),
+                "temperature": temp_val,
+                "temperature_delta": temp_delta_val,
+                "lag_7": lag_7_val,
+                "lag_28": lag_28_val,
+                "week_over_week": wow_val,
+                "is_holiday": is_holiday,
+                "holiday_period_days": holiday_period,
+                "is_pre_holiday": pre_holiday,
+                "is_post_holiday": post_holiday,
+                "receiving_stats": receiving_stats_cache.get(item_cd),
+                "large_cd": meta.get("large_cd"),
+                "rain_qty": _rain_qty_train,
+                "sky_nm": _sky_nm_train,
+                "is_payday": _is_payday_train,
+                "pm25": _pm25_train,
+                "hourly_ratios": _hourly_cache.get(item_cd, {}),
+            }
+
+            group_data[group].append(sample)
+
+    # 결과 요약
+    for group, samples in group_data.items():
+        if samples:
+            logger.info(f"  {group}: {len(samples)}개 샘플")
+
+    return group_data
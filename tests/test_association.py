@@ -524,3 +524,111 @@ class TestAssociationRule:
         r1 = AssociationRule("A", "B", "item", 0.1, 0.5, 1.5, 0.4, 60)
         r2 = AssociationRule("A", "B", "item", 0.1, 0.5, 1.5, 0.4, 60)
         assert r1 == r2
+
+
+# =====================================================================
+# 7. 행렬 엔진: 기존 쌍별 루프와 동일 결과
+# =====================================================================
+
+def _pairwise_reference_rules(entity_daily, params, rule_level):
+    """기존 _compute_rules (A, B 쌍별 집합 교집합 + np.corrcoef) 참조 구현"""
+    import numpy as np
+    from collections import defaultdict
+
+    entities = list(entity_daily)
+    all_dates = sorted({d for sales in entity_daily.values() for d in sales})
+    total_days = len(all_dates)
+    above = {}
+    for e, ds in entity_daily.items():
+        avg = sum(ds.get(d, 0) for d in all_dates) / total_days
+        above[e] = {d for d in all_dates if ds.get(d, 0) > avg}
+
+    rules_by_b = defaultdict(list)
+    for a in entities:
+        if not above[a]:
+            continue
+        for b in entities:
+            if a == b or not above[b]:
+                continue
+            both = above[a] & above[b]
+            support = len(both) / total_days
+            confidence = len(both) / len(above[a])
+            lift = confidence / (len(above[b]) / total_days)
+            if (support < params["min_support"] or confidence < params["min_confidence"]
+                    or lift < params["min_lift"]):
+                continue
+            a_s = np.array([entity_daily[a].get(d, 0) for d in all_dates])
+            b_s = np.array([entity_daily[b].get(d, 0) for d in all_dates])
+            corr = 0.0
+            if np.std(a_s) > 0 and np.std(b_s) > 0:
+                corr = float(np.corrcoef(a_s, b_s)[0, 1])
+            rules_by_b[b].append(AssociationRule(
+                a, b, rule_level, round(support, 4), round(confidence, 4),
+                round(lift, 4), round(corr, 4), total_days,
+            ))
+    result = []
+    for b_rules in rules_by_b.values():
+        result.extend(sorted(b_rules, key=lambda r: r.lift, reverse=True)[:params["max_rules_per_item"]])
+    return result
+
+
+class TestMatrixEngine:
+    """행렬 기반 _compute_rules == 쌍별 참조 구현"""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_pairwise_reference(self, association_db, seed):
+        import numpy as np
+
+        rng = np.random.default_rng(seed)
+        dates = [(datetime(2026, 1, 1) + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(45)]
+        driver = rng.random(45) > 0.5
+        entity_daily = {}
+        for k in range(40):
+            linked = k % 3 == 0
+            sales = {}
+            for i, d in enumerate(dates):
+                if rng.random() < 0.3:
+                    continue  # 미판매일 (dict 누락)
+                base = rng.integers(1, 5)
+                sales[d] = float(base + (6 if linked and driver[i] else 0))
+            entity_daily[f"E{k:02d}"] = sales
+        entity_daily["CONST"] = {d: 2.0 for d in dates}  # 표준편차 0
+
+        params = {"min_support": 0.05, "min_confidence": 0.3, "min_lift": 1.05,
+                  "max_rules_per_item": 4}
+        miner = AssociationMiner(store_id="46513", db_path=association_db, params=params)
+        got = miner._compute_rules(entity_daily, rule_level="item")
+        expected = _pairwise_reference_rules(entity_daily, miner.params, "item")
+
+        assert got  # 연결된 엔티티 간 규칙 존재
+        key = lambda r: (r.item_a, r.item_b)
+        assert sorted(got, key=key) == sorted(expected, key=key)
+
+    def test_block_boundaries(self, association_db, monkeypatch):
+        """후행 엔티티 블록 분할 결과 == 단일 블록"""
+        from src.prediction.association import association_miner as am
+
+        dates = [(datetime(2026, 1, 1) + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(30)]
+        entity_daily = {
+            f"E{k}": {d: float((i + k) % 4 + (3 if i % 2 else 0)) for i, d in enumerate(dates)}
+            for k in range(7)
+        }
+        params = {"min_support": 0.05, "min_confidence": 0.3, "min_lift": 1.0}
+        miner = AssociationMiner(store_id="46513", db_path=association_db, params=params)
+        whole = miner._compute_rules(entity_daily, rule_level="mid")
+        monkeypatch.setattr(am, "_RULE_BLOCK_SIZE", 2)
+        blocked = miner._compute_rules(entity_daily, rule_level="mid")
+        assert sorted(whole, key=lambda r: (r.item_a, r.item_b)) == \
+            sorted(blocked, key=lambda r: (r.item_a, r.item_b))
+
+    def test_item_level_min_sale_days(self, association_db):
+        """판매일수 미달 상품은 item 레벨에서 제외 (일평균 필터 기본 해제)"""
+        dates = [(datetime(2026, 1, 1) + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(30)]
+        daily_data = {d: {"HI": 5, "LO": 1} if i < 3 else {"HI": 5} for i, d in enumerate(dates)}
+        miner = AssociationMiner(store_id="46513", db_path=association_db)
+        with pytest.MonkeyPatch.context() as mp:
+            captured = {}
+            mp.setattr(miner, "_compute_rules",
+                       lambda entity_daily, rule_level: captured.update(entity_daily) or [])
+            miner._mine_item_level(daily_data)
+        assert set(captured) == {"HI"}
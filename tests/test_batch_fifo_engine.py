@@ -0,0 +1,231 @@
+"""
+배치 FIFO 일괄 차감 엔진 테스트 (batch-fifo-engine)
+
+- _plan_fifo_consumption: 누적합 기반 차감 계획 = 배치별 순차 차감 결과
+- consume_fifo_bulk: 여러 상품 1회 로드/1회 반영
+- check_and_expire_batches: 만료 전 소비 차감 + consumed/expired 상태 표시
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from src.infrastructure.database.repos.inventory_batch_repo import (
+    InventoryBatchRepository,
+    _plan_fifo_consumption,
+)
+from src.settings.constants import (
+    BATCH_STATUS_ACTIVE,
+    BATCH_STATUS_CONSUMED,
+    BATCH_STATUS_EXPIRED,
+)
+
+STORE_ID = "99999"
+
+
+class _NoCloseConn:
+    """close()를 무시하는 SQLite 연결 래퍼"""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        if name == "close":
+            return lambda: None
+        return getattr(self._conn, name)
+
+    def cursor(self):
+        return self._conn.cursor()
+
+    def commit(self):
+        return self._conn.commit()
+
+
+@pytest.fixture
+def batch_repo(in_memory_db):
+    in_memory_db.execute("""
+        CREATE TABLE IF NOT EXISTS inventory_batches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            item_cd TEXT NOT NULL,
+            item_nm TEXT,
+            mid_cd TEXT,
+            receiving_date TEXT,
+            receiving_id INTEGER,
+            expiration_days INTEGER,
+            expiry_date TEXT,
+            initial_qty INTEGER,
+            remaining_qty INTEGER DEFAULT 0,
+            status TEXT DEFAULT 'active',
+            created_at TEXT,
+            updated_at TEXT,
+            store_id TEXT DEFAULT '99999'
+        )
+    """)
+    in_memory_db.commit()
+
+    repo = InventoryBatchRepository(store_id=STORE_ID)
+    wrapped = _NoCloseConn(in_memory_db)
+    repo._get_conn = lambda: wrapped
+    return repo
+
+
+def _insert_batch(conn, item_cd, remaining_qty, receiving_date, expiry_date="2099-12-31"):
+    now = datetime.now().isoformat()
+    cur = conn.execute(
+        """
+        INSERT INTO inventory_batches
+        (store_id, item_cd, item_nm, mid_cd, receiving_date, expiration_days,
+         expiry_date, initial_qty, remaining_qty, status, created_at, updated_at)
+        VALUES (?, ?, ?, '001', ?, 1, ?, ?, ?, 'active', ?, ?)
+        """,
+        (STORE_ID, item_cd, f"상품_{item_cd}", receiving_date, expiry_date,
+         remaining_qty, remaining_qty, now, now),
+    )
+    conn.commit()
+    return cur.lastrowid
+
+
+def _insert_stock(conn, item_cd, stock_qty, sales_date="2026-02-18"):
+    now = datetime.now().isoformat()
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO daily_sales
+        (store_id, collected_at, sales_date, item_cd, mid_cd,
+         sale_qty, ord_qty, buy_qty, disuse_qty, stock_qty, created_at)
+        VALUES (?, ?, ?, ?, '001', 0, 0, 0, 0, ?, ?)
+        """,
+        (STORE_ID, now, sales_date, item_cd, stock_qty, now),
+    )
+    conn.commit()
+
+
+def _sequential_reference(rows, to_consume):
+    """기존 상품별/배치별 순차 차감 (비교 기준)"""
+    result = {}
+    by_key = {}
+    for batch_id, key, remaining in rows:
+        by_key.setdefault(key, []).append((batch_id, remaining))
+    for key, batches in by_key.items():
+        remain = to_consume.get(key, 0)
+        for batch_id, b_rem in batches:
+            if remain <= 0:
+                break
+            deduct = min(b_rem, remain)
+            result[batch_id] = b_rem - deduct
+            remain -= deduct
+    return result
+
+
+class TestPlanFifoConsumption:
+    def test_basic_fifo(self):
+        rows = [(1, "A", 2), (2, "A", 3), (3, "B", 5)]
+        plan = _plan_fifo_consumption(rows, {"A": 4})
+        assert plan["updates"] == [(1, 0), (2, 1)]
+        assert plan["consumed_qty"] == {"A": 4}
+        assert plan["consumed_batches"] == 1
+        assert plan["totals_after"] == {"A": 1, "B": 5}
+
+    def test_over_consume_caps_at_total(self):
+        plan = _plan_fifo_consumption([(1, "A", 2), (2, "A", 1)], {"A": 10})
+        assert plan["updates"] == [(1, 0), (2, 0)]
+        assert plan["consumed_qty"] == {"A": 3}
+        assert plan["consumed_batches"] == 2
+
+    def test_no_targets(self):
+        plan = _plan_fifo_consumption([(1, "A", 2)], {})
+        assert plan["updates"] == []
+        assert plan["totals_after"] == {"A": 2}
+
+    def test_matches_sequential_random(self):
+        rng = random.Random(7)
+        rows = []
+        batch_id = 0
+        for item in range(200):
+            for _ in range(rng.randint(1, 6)):
+                batch_id += 1
+                rows.append((batch_id, f"I{item:03d}", rng.randint(1, 8)))
+        to_consume = {f"I{i:03d}": rng.randint(0, 30) for i in range(0, 200, 2)}
+
+        plan = _plan_fifo_consumption(rows, to_consume)
+        expected = _sequential_reference(rows, to_consume)
+        # 순차 경로는 차감 0인 배치도 갱신할 수 있어 실제 변경분만 비교
+        original = {bid: rem for bid, _, rem in rows}
+        expected_changed = {bid: v for bid, v in expected.items() if v != original[bid]}
+        assert dict(plan["updates"]) == expected_changed
+
+
+class TestConsumeFifoBulk:
+    def test_multiple_items_single_write(self, batch_repo, in_memory_db):
+        a1 = _insert_batch(in_memory_db, "A", 2, "2026-02-10")
+        a2 = _insert_batch(in_memory_db, "A", 3, "2026-02-12")
+        b1 = _insert_batch(in_memory_db, "B", 4, "2026-02-11")
+
+        result = batch_repo.consume_fifo_bulk({"A": 3, "B": 4, "C": 2})
+
+        assert result == {"items": 2, "consumed_qty": 7, "updated": 3, "consumed": 2}
+        rows = {
+            r[0]: (r[1], r[2]) for r in in_memory_db.execute(
+                "SELECT id, remaining_qty, status FROM inventory_batches")
+        }
+        assert rows[a1] == (0, BATCH_STATUS_CONSUMED)
+        assert rows[a2] == (2, BATCH_STATUS_ACTIVE)
+        assert rows[b1] == (0, BATCH_STATUS_CONSUMED)
+
+    def test_empty(self, batch_repo):
+        assert batch_repo.consume_fifo_bulk({"A": 0}) == {
+            "items": 0, "consumed_qty": 0, "updated": 0, "consumed": 0,
+        }
+
+    def test_sync_with_stock_uses_engine(self, batch_repo, in_memory_db):
+        _insert_batch(in_memory_db, "A", 2, "2026-02-10")
+        _insert_batch(in_memory_db, "A", 3, "2026-02-12")
+        assert batch_repo.sync_with_stock("A", 1, store_id=STORE_ID) == 4
+
+
+class TestExpireWithEngine:
+    def test_expire_marks_consumed_and_expired(self, batch_repo, in_memory_db):
+        # A: 만료 배치 3 + 신규 배치 2, 재고 2 → 초과 3은 만료 배치에서 소비 → consumed
+        a_old = _insert_batch(in_memory_db, "A", 3, "2026-02-10", expiry_date="2026-02-15")
+        a_new = _insert_batch(in_memory_db, "A", 2, "2026-02-14")
+        _insert_stock(in_memory_db, "A", 2)
+        # B: 만료 배치 4 + 신규 배치 3, 재고 5 → 초과 2 소비 → 만료 잔량 2 폐기
+        b_old = _insert_batch(in_memory_db, "B", 4, "2026-02-10", expiry_date="2026-02-15")
+        b_new = _insert_batch(in_memory_db, "B", 3, "2026-02-14")
+        _insert_stock(in_memory_db, "B", 5)
+
+        expired = batch_repo.check_and_expire_batches(
+            target_date="2026-02-15", store_id=STORE_ID
+        )
+
+        by_id = {b["id"]: b for b in expired}
+        assert by_id[a_old]["status"] == BATCH_STATUS_CONSUMED
+        assert by_id[a_old]["remaining_qty"] == 0
+        assert by_id[b_old]["status"] == BATCH_STATUS_EXPIRED
+        assert by_id[b_old]["remaining_qty"] == 2
+
+        db = {
+            r[0]: (r[1], r[2]) for r in in_memory_db.execute(
+                "SELECT id, remaining_qty, status FROM inventory_batches")
+        }
+        assert db[a_old] == (0, BATCH_STATUS_CONSUMED)
+        assert db[a_new] == (2, BATCH_STATUS_ACTIVE)
+        assert db[b_old] == (2, BATCH_STATUS_EXPIRED)
+        assert db[b_new] == (3, BATCH_STATUS_ACTIVE)
+
+    def test_consumption_spills_into_non_expiring(self, batch_repo, in_memory_db):
+        """초과분이 만료 배치보다 크면 다음 배치까지 FIFO 차감 (DB 반영)"""
+        old = _insert_batch(in_memory_db, "C", 2, "2026-02-10", expiry_date="2026-02-15")
+        mid = _insert_batch(in_memory_db, "C", 3, "2026-02-12")
+        new = _insert_batch(in_memory_db, "C", 4, "2026-02-14")
+        _insert_stock(in_memory_db, "C", 3)
+
+        batch_repo.check_and_expire_batches(target_date="2026-02-15", store_id=STORE_ID)
+
+        db = {
+            r[0]: (r[1], r[2]) for r in in_memory_db.execute(
+                "SELECT id, remaining_qty, status FROM inventory_batches")
+        }
+        assert db[old] == (0, BATCH_STATUS_CONSUMED)
+        assert db[mid] == (0, BATCH_STATUS_CONSUMED)
+        assert db[new] == (3, BATCH_STATUS_ACTIVE)
@@ -0,0 +1,363 @@
+"""클라우드 델타 동기화 (cloud-delta-sync) 테스트
+
+- page_delta: 매니페스트/델타 생성, 적용(기준 검증, 원자 교체), 대기 델타 일괄 적용
+  (WAL 미반영 쓰기 감지, 워커 동시 적용 잠금)
+- CloudSyncer delta 모드 ↔ PythonAnywhere 대역 서버 (전체 → 델타 → 변경 없음 → 재동기화,
+  원격 해시 사전 확인 → 같은 실행 전체 업로드)
+- 웹앱 /api/sync/db-state 토큰 인증
+"""
+
+import json
+import sqlite3
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from scripts.pa_standin_server import PythonAnywhereStandInServer
+from scripts.sync_to_cloud import CloudSyncer
+from src.infrastructure.database import page_delta
+from src.infrastructure.database.page_delta import (
+    DELTA_DIR,
+    PageDeltaError,
+    apply_delta,
+    apply_pending_deltas,
+    build_delta,
+    build_manifest,
+    db_state,
+)
+
+
+def _make_db(path, rows=2000):
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE daily_sales (id INTEGER PRIMARY KEY, item_cd TEXT, sale_qty INTEGER)")
+    conn.executemany(
+        "INSERT INTO daily_sales (item_cd, sale_qty) VALUES (?, ?)",
+        [(f"ITEM{i:05d}", i % 7) for i in range(rows)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def _update(path, sql, params=()):
+    conn = sqlite3.connect(str(path))
+    conn.execute(sql, params)
+    conn.commit()
+    conn.close()
+
+
+def _query(path, sql):
+    conn = sqlite3.connect(str(path))
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+def _rows(path):
+    return _query(path, "SELECT * FROM daily_sales ORDER BY id")
+
+
+class TestPageDelta:
+
+    @pytest.mark.unit
+    def test_delta_roundtrip_only_changed_pages(self, tmp_path):
+        local, remote = tmp_path / "local.db", tmp_path / "remote.db"
+        _make_db(local)
+        remote.write_bytes(local.read_bytes())
+        base = build_manifest(local)
+
+        _update(local, "UPDATE daily_sales SET sale_qty = 99 WHERE id = 1500")
+        delta, manifest = build_delta(local, base, "data/stores/46513.db")
+        header, _ = page_delta.read_delta(delta)
+        assert 0 < len(header["pages"]) < len(manifest["hashes"]) / 4
+        assert len(delta) < manifest["size"] / 4
+
+        assert apply_delta(remote, delta) == "applied"
+        assert remote.read_bytes() == local.read_bytes()
+        assert apply_delta(remote, delta) == "already"
+        assert build_delta(local, manifest, "x.db")[0] is None
+
+    @pytest.mark.unit
+    def test_growth_and_base_mismatch(self, tmp_path):
+        local, remote = tmp_path / "local.db", tmp_path / "remote.db"
+        _make_db(local)
+        remote.write_bytes(local.read_bytes())
+        base = build_manifest(local)
+        _update(local, "INSERT INTO daily_sales (item_cd, sale_qty) "
+                       "SELECT item_cd || 'X', sale_qty FROM daily_sales")
+        delta, _ = build_delta(local, base, "remote.db")
+
+        _update(remote, "DELETE FROM daily_sales WHERE id = 1")
+        before = remote.read_bytes()
+        with pytest.raises(PageDeltaError, match="기준 불일치"):
+            apply_delta(remote, delta)
+        assert remote.read_bytes() == before
+
+        with pytest.raises(PageDeltaError, match="페이지 크기"):
+            build_delta(local, dict(base, page_size=1024), "remote.db")
+
+    @pytest.mark.unit
+    def test_apply_pending_deltas_writes_resync_marker(self, tmp_path):
+        root = tmp_path / "remote"
+        (root / "data").mkdir(parents=True)
+        local = tmp_path / "local.db"
+        _make_db(local)
+        (root / "data" / "common.db").write_bytes(local.read_bytes())
+        base = build_manifest(local)
+
+        _update(local, "UPDATE daily_sales SET sale_qty = 1 WHERE id = 10")
+        first, manifest = build_delta(local, base, "data/common.db")
+        _update(local, "UPDATE daily_sales SET sale_qty = 2 WHERE id = 20")
+        second, _ = build_delta(local, manifest, "data/common.db")
+        delta_dir = root / DELTA_DIR
+        delta_dir.mkdir(parents=True)
+        (delta_dir / "00000001_data__common.db.delta").write_bytes(first)
+        (delta_dir / "00000002_data__common.db.delta").write_bytes(second)
+        (delta_dir / "00000003_evil.delta").write_bytes(
+            build_delta(local, base, "../outside.db")[0]
+        )
+
+        summary = apply_pending_deltas(root)
+        assert summary == {"applied": ["data/common.db"] * 2, "resync": ["../outside.db"]}
+        assert (root / "data" / "common.db").read_bytes() == local.read_bytes()
+        assert sorted(p.name for p in delta_dir.iterdir()) == [
+            "..__outside.db.resync", ".apply.lock"
+        ]
+
+    @pytest.mark.unit
+    def test_wal_write_counts_as_divergence(self, tmp_path):
+        """원격 웹앱 쓰기가 WAL 에만 있어도 기준 불일치로 잡고 유실하지 않음"""
+        local, remote = tmp_path / "local.db", tmp_path / "data" / "remote.db"
+        remote.parent.mkdir()
+        _make_db(local)
+        remote.write_bytes(local.read_bytes())
+        base = build_manifest(local)
+        assert db_state(tmp_path, "data/remote.db")["sha256"] == base["sha256"]
+        _update(local, "UPDATE daily_sales SET sale_qty = 5 WHERE id = 3")
+        delta, _ = build_delta(local, base, "data/remote.db")
+
+        webapp = sqlite3.connect(str(remote))
+        webapp.execute("PRAGMA journal_mode=WAL")
+        webapp.execute("PRAGMA wal_autocheckpoint=0")
+        webapp.execute("INSERT INTO daily_sales (item_cd, sale_qty) VALUES ('WEB', 1)")
+        webapp.commit()
+        try:
+            assert db_state(tmp_path, "data/remote.db")["sha256"] != base["sha256"]
+            with pytest.raises(PageDeltaError, match="기준 불일치"):
+                apply_delta(remote, delta)
+        finally:
+            webapp.close()
+        assert _query(remote, "SELECT sale_qty FROM daily_sales WHERE item_cd = 'WEB'") == [(1,)]
+        with pytest.raises(PageDeltaError, match="허용되지 않는 경로"):
+            db_state(tmp_path, "../local.db")
+
+    @pytest.mark.unit
+    def test_concurrent_workers_apply_once(self, tmp_path):
+        """웹앱 워커 여러 개가 동시에 기동해도 델타는 한 번만 적용"""
+        root = tmp_path / "remote"
+        (root / "data").mkdir(parents=True)
+        local = tmp_path / "local.db"
+        _make_db(local, rows=20000)
+        (root / "data" / "common.db").write_bytes(local.read_bytes())
+        manifest = build_manifest(local)
+        delta_dir = root / DELTA_DIR
+        delta_dir.mkdir(parents=True)
+        for seq in range(1, 4):
+            _update(local, "UPDATE daily_sales SET sale_qty = ? WHERE id % 97 = 0", (seq * 10,))
+            delta, manifest = build_delta(local, manifest, "data/common.db")
+            (delta_dir / f"{seq:08d}_data__common.db.delta").write_bytes(delta)
+
+        summaries, errors = [], []
+
+        def worker():
+            try:
+                summaries.append(apply_pending_deltas(root))
+            except Exception as e:  # pragma: no cover - 실패 시 원인 표시
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert sum(len(s["applied"]) for s in summaries) == 3
+        assert all(s["resync"] == [] for s in summaries)
+        assert (root / "data" / "common.db").read_bytes() == local.read_bytes()
+        assert sorted(p.name for p in delta_dir.iterdir()) == [".apply.lock"]
+        assert not list((root / "data").glob("*.delta-tmp*"))
+
+
+class TestDeltaSyncWithStandIn:
+
+    @pytest.fixture
+    def env(self, tmp_path):
+        local_root = tmp_path / "local"
+        (local_root / "data" / "stores").mkdir(parents=True)
+        _make_db(local_root / "data" / "common.db", rows=200)
+        _make_db(local_root / "data" / "stores" / "46513.db", rows=20000)
+
+        server = PythonAnywhereStandInServer(tmp_path / "remote").start()
+        config = {
+            "username": "testuser",
+            "api_token": "test-token-12345",
+            "domain": "testuser.pythonanywhere.com",
+            "remote_base": "/home/testuser/myapp",
+            "api_base": server.api_base,
+            "webapp_base": server.webapp_base,
+            "sync_token": server.sync_token,
+            "sync_mode": "delta",
+            "sync_files": [
+                {"local": "data/common.db", "remote": "data/common.db"},
+                {"local": "data/stores/46513.db", "remote": "data/stores/46513.db"},
+            ],
+        }
+        config_path = tmp_path / "pythonanywhere.json"
+        config_path.write_text(json.dumps(config), encoding="utf-8")
+        with patch("scripts.sync_to_cloud.PROJECT_ROOT", local_root), \
+                patch("scripts.sync_to_cloud.RETRY_DELAYS", [0, 0, 0]):
+            yield local_root, server, config_path
+        server.stop()
+
+    @pytest.mark.unit
+    def test_full_then_delta_then_unchanged(self, env):
+        local_root, server, config_path = env
+        store_db = local_root / "data" / "stores" / "46513.db"
+        remote_store = server.root / "data" / "stores" / "46513.db"
+
+        result = CloudSyncer(config_path).sync_all()
+        assert result["success"] is True
+        assert [r["mode"] for r in result["uploaded"]] == ["full", "full"]
+        assert _rows(remote_store) == _rows(store_db)
+        full_bytes = server.bytes_received
+
+        _update(store_db, "UPDATE daily_sales SET sale_qty = 42 WHERE id = 12345")
+        server.bytes_received = 0
+        result = CloudSyncer(config_path).sync_all()
+        assert result["success"] is True
+        assert [(r["file"], r["mode"]) for r in result["uploaded"]] == [
+            ("data/stores/46513.db", "delta")
+        ]
+        assert [r["file"] for r in result["unchanged"]] == ["data/common.db"]
+        assert server.bytes_received < full_bytes / 20
+        assert server.reloads[-1]["applied"] == ["data/stores/46513.db"]
+        assert _query(remote_store, "SELECT sale_qty FROM daily_sales WHERE id = 12345") == [(42,)]
+        assert not list((server.root / DELTA_DIR).glob("*.delta"))
+
+        reloads = len(server.reloads)
+        result = CloudSyncer(config_path).sync_all()
+        assert result["success"] is True and result["uploaded"] == []
+        assert len(result["unchanged"]) == 2
+        assert result["reload"].get("skipped") is True
+        assert len(server.reloads) == reloads
+
+    @pytest.mark.unit
+    def test_remote_write_detected_before_upload(self, env):
+        """웹앱이 원격 DB 에 쓴 경우 델타를 보내지 않고 같은 실행에서 전체 업로드"""
+        local_root, server, config_path = env
+        common_db = local_root / "data" / "common.db"
+        remote_common = server.root / "data" / "common.db"
+        CloudSyncer(config_path).sync_all()
+
+        _update(remote_common, "INSERT INTO daily_sales (item_cd, sale_qty) VALUES ('AUDIT', 1)")
+        _update(common_db, "UPDATE daily_sales SET sale_qty = 7 WHERE id = 2")
+        result = CloudSyncer(config_path).sync_all()
+        assert result["success"] is True
+        assert [(r["file"], r["mode"]) for r in result["uploaded"]] == [("data/common.db", "full")]
+        assert server.reloads[-1] == {"applied": [], "resync": []}
+        assert _rows(remote_common) == _rows(common_db)
+
+        _update(common_db, "UPDATE daily_sales SET sale_qty = 8 WHERE id = 2")
+        result = CloudSyncer(config_path).sync_all()
+        assert [(r["file"], r["mode"]) for r in result["uploaded"]] == [("data/common.db", "delta")]
+        assert _rows(remote_common) == _rows(common_db)
+
+    @pytest.mark.unit
+    def test_unverifiable_remote_uses_full_upload(self, env):
+        local_root, server, config_path = env
+        CloudSyncer(config_path).sync_all()
+        config = json.loads(config_path.read_text(encoding="utf-8"))
+        config["sync_token"] = "wrong"
+        config_path.write_text(json.dumps(config), encoding="utf-8")
+
+        _update(local_root / "data" / "common.db", "UPDATE daily_sales SET sale_qty = 3 WHERE id = 5")
+        result = CloudSyncer(config_path).sync_all()
+        assert [(r["file"], r["mode"]) for r in result["uploaded"]] == [("data/common.db", "full")]
+        assert [r["file"] for r in result["unchanged"]] == ["data/stores/46513.db"]
+
+    @pytest.mark.unit
+    def test_drift_after_check_triggers_full_resync(self, env):
+        """사전 확인 이후 원격 변경(경합) → 리로드 시 재동기화 표식 → 다음 실행 전체 업로드"""
+        local_root, server, config_path = env
+        store_db = local_root / "data" / "stores" / "46513.db"
+        remote_store = server.root / "data" / "stores" / "46513.db"
+        CloudSyncer(config_path).sync_all()
+
+        syncer = CloudSyncer(config_path)
+        checked = syncer.remote_db_sha256
+
+        def check_then_drift(remote_path):
+            sha = checked(remote_path)
+            if remote_path == "data/stores/46513.db":
+                _update(remote_store, "DELETE FROM daily_sales WHERE id = 1")
+            return sha
+
+        _update(store_db, "UPDATE daily_sales SET sale_qty = 7 WHERE id = 2")
+        with patch.object(syncer, "remote_db_sha256", side_effect=check_then_drift):
+            result = syncer.sync_all()
+        assert result["uploaded"][0]["mode"] == "delta"
+        assert server.reloads[-1]["resync"] == ["data/stores/46513.db"]
+
+        result = CloudSyncer(config_path).sync_all()
+        assert [(r["file"], r["mode"]) for r in result["uploaded"]] == [
+            ("data/stores/46513.db", "full")
+        ]
+        assert _rows(remote_store) == _rows(store_db)
+        assert not list((server.root / DELTA_DIR).glob("*.resync"))
+
+    @pytest.mark.unit
+    def test_full_mode_unchanged(self, env):
+        _, server, config_path = env
+        config = json.loads(config_path.read_text(encoding="utf-8"))
+        config.pop("sync_mode")
+        config_path.write_text(json.dumps(config), encoding="utf-8")
+
+        result = CloudSyncer(config_path).sync_all()
+        assert result["success"] is True
+        assert len(result["uploaded"]) == 2 and "mode" not in result["uploaded"][0]
+        assert (server.root / "data" / "common.db").exists()
+
+
+class TestDbStateEndpoint:
+
+    @pytest.mark.unit
+    def test_token_required(self, tmp_path, monkeypatch):
+        """세션 없이 접근 가능하되 X-Sync-Token 이 CLOUD_SYNC_TOKEN 과 같아야 함"""
+        from flask import Flask
+
+        from src.web.middleware import check_auth_and_store_access
+        from src.web.routes import api_sync
+
+        (tmp_path / "data").mkdir()
+        _make_db(tmp_path / "data" / "common.db", rows=10)
+        monkeypatch.setattr(api_sync, "PROJECT_ROOT", tmp_path)
+        app = Flask(__name__)
+        app.secret_key = "test"
+        app.before_request(check_auth_and_store_access)
+        app.register_blueprint(api_sync.sync_bp, url_prefix="/api/sync")
+        client = app.test_client()
+        url = "/api/sync/db-state?db=data/common.db"
+
+        monkeypatch.delenv("CLOUD_SYNC_TOKEN", raising=False)
+        assert client.get(url).status_code == 404
+
+        monkeypatch.setenv("CLOUD_SYNC_TOKEN", "secret")
+        assert client.get(url).status_code == 401
+        assert client.get(url, headers={"X-Sync-Token": "nope"}).status_code == 401
+        resp = client.get(url, headers={"X-Sync-Token": "secret"})
+        assert resp.status_code == 200
+        assert resp.get_json()["sha256"] == build_manifest(tmp_path / "data" / "common.db")["sha256"]
+        resp = client.get("/api/sync/db-state?db=../x.db", headers={"X-Sync-Token": "secret"})
+        assert resp.status_code == 400
@@ -0,0 +1,187 @@
+"""ConnectionPool (connection-pool) 테스트
+
+- close() 시 풀 반환 → 재대여 시 동일 커넥션 (ATTACH/VIEW 유지)
+- 반환 시 미커밋 트랜잭션 rollback
+- 수명 초과/파일 교체 시 재생성
+- 스레드 분리
+- BaseRepository 투명 사용
+"""
+
+import sqlite3
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.database import connection as conn_mod
+from src.infrastructure.database.base_repository import BaseRepository
+from src.infrastructure.database.connection import (
+    ConnectionPool,
+    DBRouter,
+    PooledConnection,
+)
+
+STORE_ID = "46513"
+
+
+@pytest.fixture
+def pool_env(tmp_path):
+    common = tmp_path / "common.db"
+    store = tmp_path / f"{STORE_ID}.db"
+    c = sqlite3.connect(str(common))
+    c.execute("CREATE TABLE products (item_cd TEXT PRIMARY KEY, item_nm TEXT)")
+    c.execute("INSERT INTO products VALUES ('A', '상품A')")
+    c.commit()
+    c.close()
+    s = sqlite3.connect(str(store))
+    s.execute("CREATE TABLE daily_sales (item_cd TEXT, sale_qty INTEGER)")
+    s.commit()
+    s.close()
+
+    pool = ConnectionPool()
+    with patch.object(DBRouter, "get_common_db_path", return_value=common), \
+         patch.object(DBRouter, "get_store_db_path", return_value=store), \
+         patch.object(conn_mod, "_pool", pool):
+        yield pool, store
+    pool.close_thread_connections()
+
+
+class TestPoolReuse:
+
+    @pytest.mark.unit
+    def test_store_connection_attached_and_reused(self, pool_env):
+        pool, _ = pool_env
+        conn = DBRouter.get_pooled_connection(STORE_ID)
+        assert isinstance(conn, sqlite3.Connection)
+        assert conn.execute("SELECT item_nm FROM products").fetchone()[0] == "상품A"
+        conn.close()
+        assert pool.idle_count() == 1
+
+        again = DBRouter.get_pooled_connection(STORE_ID)
+        assert again is conn
+        assert pool.idle_count() == 0
+        again.close()
+
+    @pytest.mark.unit
+    def test_pragmas_applied_once(self, pool_env):
+        conn = DBRouter.get_pooled_connection(STORE_ID)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 10000
+        conn.close()
+
+    @pytest.mark.unit
+    def test_common_and_store_keys_separate(self, pool_env):
+        pool, _ = pool_env
+        store_conn = DBRouter.get_pooled_connection(STORE_ID)
+        common_conn = DBRouter.get_pooled_connection()
+        assert store_conn is not common_conn
+        store_conn.close()
+        common_conn.close()
+        assert DBRouter.get_pooled_connection() is common_conn
+
+    @pytest.mark.unit
+    def test_double_close_is_noop(self, pool_env):
+        pool, _ = pool_env
+        conn = DBRouter.get_pooled_connection(STORE_ID)
+        conn.close()
+        conn.close()
+        assert pool.idle_count() == 1
+
+    @pytest.mark.unit
+    def test_idle_limit_per_key(self, pool_env):
+        pool, _ = pool_env
+        conns = [DBRouter.get_pooled_connection(STORE_ID) for _ in range(6)]
+        for c in conns:
+            c.close()
+        assert pool.idle_count() == conn_mod.POOL_MAX_IDLE_PER_KEY
+
+
+class TestPoolHygiene:
+
+    @pytest.mark.unit
+    def test_uncommitted_changes_rolled_back(self, pool_env):
+        conn = DBRouter.get_pooled_connection(STORE_ID)
+        conn.execute("INSERT INTO daily_sales VALUES ('A', 1)")
+        conn.close()
+        conn = DBRouter.get_pooled_connection(STORE_ID)
+        assert conn.execute("SELECT COUNT(*) FROM daily_sales").fetchone()[0] == 0
+        conn.close()
+
+    @pytest.mark.unit
+    def test_row_factory_reset(self, pool_env):
+        conn = DBRouter.get_pooled_connection(STORE_ID)
+        conn.row_factory = None
+        conn.close()
+        conn = DBRouter.get_pooled_connection(STORE_ID)
+        assert conn.row_factory is sqlite3.Row
+        conn.close()
+
+    @pytest.mark.unit
+    def test_expired_connection_recycled(self, pool_env):
+        pool, _ = pool_env
+        conn = DBRouter.get_pooled_connection(STORE_ID)
+        conn.close()
+        conn._pool_created_at -= pool.max_age_seconds + 1
+        assert DBRouter.get_pooled_connection(STORE_ID) is not conn
+
+    @pytest.mark.unit
+    def test_replaced_db_file_recycled(self, pool_env):
+        _, store = pool_env
+        conn = DBRouter.get_pooled_connection(STORE_ID)
+        conn.close()
+        conn._pool_file_id = (-1, -1)
+        assert DBRouter.get_pooled_connection(STORE_ID) is not conn
+
+    @pytest.mark.unit
+    def test_other_thread_gets_own_connection(self, pool_env):
+        conn = DBRouter.get_pooled_connection(STORE_ID)
+        conn.close()
+        seen = []
+
+        def worker():
+            c = DBRouter.get_pooled_connection(STORE_ID)
+            seen.append(c is conn)
+            c.close()
+            DBRouter.close_pooled_connections()
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+        assert seen == [False]
+
+    @pytest.mark.unit
+    def test_close_thread_connections(self, pool_env):
+        pool, _ = pool_env
+        conn = DBRouter.get_pooled_connection(STORE_ID)
+        conn.close()
+        assert DBRouter.close_pooled_connections() == 1
+        assert pool.idle_count() == 0
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+class TestRepositoryIntegration:
+
+    @pytest.mark.unit
+    def test_repository_uses_pool(self, pool_env):
+        class _Repo(BaseRepository):
+            db_type = "store"
+
+        repo = _Repo(store_id=STORE_ID)
+        first = repo._get_conn()
+        assert isinstance(first, PooledConnection)
+        first.close()
+        second = repo._get_conn()
+        assert second is first
+        second.close()
+
+    @pytest.mark.unit
+    def test_explicit_db_path_not_pooled(self, pool_env):
+        _, store = pool_env
+
+        class _Repo(BaseRepository):
+            db_type = "store"
+
+        conn = _Repo(db_path=store)._get_conn()
+        assert not isinstance(conn, PooledConnection)
+        conn.close()
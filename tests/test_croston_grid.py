@@ -0,0 +1,138 @@
+"""Croston/TSB 벡터화 (croston-grid) 테스트
+
+- optimize_items ↔ 상품별 _evaluate 그리드 서치 결과 동일성
+- run_optimization 일괄 조회/UPSERT (재최적화 주기 skip, unchanged)
+- CrostonPredictor.predict_batch ↔ predict 결과 동일성
+"""
+
+import math
+import random
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.analysis import croston_optimizer as opt
+from src.prediction.croston_predictor import CrostonPredictor
+
+
+def _intermittent(rng, days):
+    return [float(rng.choice([1, 2, 4])) if rng.random() < 0.2 else 0.0 for _ in range(days)]
+
+
+def _scalar_best(demands):
+    """참조 구현: 상품 1개 × 후보 24개 순차 평가"""
+    train, holdout = demands[:-opt.HOLDOUT_DAYS], demands[-opt.HOLDOUT_DAYS:]
+    best = None
+    for alpha in opt.ALPHA_CANDIDATES:
+        for beta in opt.BETA_CANDIDATES:
+            rmse = opt._evaluate(train, holdout, alpha, beta)
+            if best is None or rmse < best[2]:
+                best = (alpha, beta, rmse)
+    return best
+
+
+class TestOptimizeItems:
+
+    @pytest.mark.unit
+    def test_matches_scalar_grid_search(self):
+        rng = random.Random(7)
+        series = {f"I{i:03d}": _intermittent(rng, rng.randint(37, 90)) for i in range(80)}
+        results = opt.optimize_items(series)
+
+        checked = 0
+        for item_cd, demands in series.items():
+            result = results[item_cd]
+            if result is None:
+                ratio = sum(1 for d in demands if d > 0) / len(demands)
+                assert not opt.MIN_SELL_RATIO <= ratio <= opt.MAX_SELL_RATIO
+                continue
+            alpha, beta, rmse = _scalar_best(demands)
+            assert (result["alpha"], result["beta"]) == (alpha, beta), item_cd
+            assert result["rmse"] == round(rmse, 4)
+            assert result["data_days"] == len(demands)
+            checked += 1
+        assert checked > 60
+
+    @pytest.mark.unit
+    def test_ineligible_items(self):
+        results = opt.optimize_items({
+            "SHORT": [1.0, 0.0] * 10,
+            "DAILY": [1.0] * 60,
+            "EMPTY": [0.0] * 60,
+        })
+        assert results == {"SHORT": None, "DAILY": None, "EMPTY": None}
+        assert opt._optimize_item("DAILY", [1.0] * 60) is None
+
+
+class TestRunOptimization:
+
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "data" / "stores").mkdir(parents=True)
+        conn = sqlite3.connect(str(opt._get_store_db_path("46513")))
+        conn.execute(
+            "CREATE TABLE daily_sales (item_cd TEXT, sales_date TEXT, sale_qty INTEGER)"
+        )
+        rng = random.Random(3)
+        today = datetime.now().date()
+        rows = []
+        for item_cd in ("A", "B", "C"):
+            demands = _intermittent(rng, 60)
+            demands[-1] = demands[-10] = demands[-20] = 2.0
+            for i, qty in enumerate(demands):
+                rows.append((item_cd, (today - timedelta(days=59 - i)).isoformat(), qty))
+        rows += [("DAILY", (today - timedelta(days=i)).isoformat(), 3) for i in range(60)]
+        conn.executemany("INSERT INTO daily_sales VALUES (?, ?, ?)", rows)
+        conn.commit()
+        conn.close()
+        return str(opt._get_store_db_path("46513"))
+
+    @pytest.mark.unit
+    def test_batch_upsert_and_skips(self, store):
+        stats = opt.run_optimization("46513")
+        assert stats == {"total": 4, "optimized": 3, "skipped": 1, "unchanged": 0, "errors": 0}
+
+        conn = sqlite3.connect(store)
+        saved = dict(conn.execute("SELECT item_cd, alpha FROM croston_params").fetchall())
+        assert set(saved) == {"A", "B", "C"}
+
+        # 재최적화 주기 이내 → skip, 주기 경과 + 동일 결과 → unchanged
+        old = (datetime.now() - timedelta(days=opt.REOPTIMIZE_INTERVAL_DAYS + 1)).isoformat()
+        conn.execute("UPDATE croston_params SET optimized_at = ? WHERE item_cd = 'A'", (old,))
+        conn.commit()
+        conn.close()
+        stats = opt.run_optimization("46513")
+        assert stats == {"total": 4, "optimized": 0, "skipped": 3, "unchanged": 1, "errors": 0}
+        assert opt.get_croston_params("46513", "A")[0] == saved["A"]
+
+
+class TestPredictBatch:
+
+    @pytest.mark.unit
+    def test_matches_predict(self):
+        rng = random.Random(11)
+        histories = [
+            [rng.choice([0, 0, 0, 1, 2, 5]) for _ in range(rng.randint(0, 60))]
+            for _ in range(200)
+        ]
+        histories += [[], [0] * 30, [0] * 10 + [3], [4, 0, 0, 0, 2, 0, 1]]
+        alphas = [rng.choice([0.05, 0.15, 0.3]) for _ in histories]
+        betas = [rng.choice([0.05, 0.1, 0.2]) for _ in histories]
+
+        results = CrostonPredictor().predict_batch(histories, alphas, betas)
+        for history, alpha, beta, result in zip(histories, alphas, betas, results):
+            assert result == CrostonPredictor(alpha, beta).predict(history)
+        assert {r.method for r in results} == {"tsb", "fallback"}
+
+    @pytest.mark.unit
+    def test_default_params_and_safety(self):
+        predictor = CrostonPredictor()
+        history = [0, 0, 2, 0, 0, 0, 1, 0, 3, 0, 0]
+        (result,) = predictor.predict_batch([history])
+        forecast, safety = predictor.predict_with_safety(history, order_interval=4)
+        assert result.forecast == forecast
+        assert CrostonPredictor.safety_stock(result, 4) == safety
+        assert predictor.predict_batch([]) == []
+        assert not math.isnan(result.forecast)
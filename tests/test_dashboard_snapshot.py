@@ -0,0 +1,357 @@
+"""홈 대시보드 스냅샷 (dashboard-snapshot) 테스트
+
+- DashboardSnapshotRepository 섹션 UPSERT / ETag (내용 해시) / 다매장 1회 조회
+- 만료 판정 (날짜 변경), 누락·만료 섹션만 계산 (조회는 읽기 전용, 짧은 TTL 메모리 캐시)
+- get_store_comparison 스냅샷 사용, /api/home ETag·304 응답
+- 웹 쓰기 경로 무효화/갱신 (설정 저장, 스크립트 실행)
+"""
+
+import json
+import sqlite3
+import sys
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+
+from src.application.services import dashboard_snapshot_service as snapshot_module
+from src.application.services.dashboard_service import (
+    DashboardService,
+    format_waste_risk_products,
+)
+from src.application.services.dashboard_snapshot_service import (
+    SECTION_COMPARISON,
+    SECTION_STATUS,
+    SECTION_SUMMARY,
+    SECTIONS,
+    DashboardSnapshotService,
+    build_sections,
+    clear_ondemand_cache,
+    invalidate_dashboard_snapshot,
+    is_stale,
+)
+from src.infrastructure.database.repos.dashboard_snapshot_repo import (
+    DashboardSnapshotRepository,
+)
+from src.settings.store_context import StoreContext
+
+
+@pytest.fixture(autouse=True)
+def _clear_ondemand():
+    clear_ondemand_cache()
+    yield
+    clear_ondemand_cache()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    db = tmp_path / "common.db"
+    sqlite3.connect(str(db)).close()
+    return DashboardSnapshotRepository(db_path=db)
+
+
+@pytest.fixture
+def store_db(tmp_path):
+    db_path = str(tmp_path / "store.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE collection_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, sales_date TEXT, collected_at TEXT,
+            total_items INTEGER DEFAULT 0, status TEXT DEFAULT '', store_id TEXT DEFAULT '');
+        CREATE TABLE order_tracking (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, order_date TEXT, item_cd TEXT, item_nm TEXT,
+            mid_cd TEXT DEFAULT '', order_qty INTEGER DEFAULT 0, status TEXT DEFAULT '',
+            remaining_qty INTEGER DEFAULT 0, expiry_time TEXT DEFAULT '',
+            created_at TEXT DEFAULT '', store_id TEXT DEFAULT '');
+        CREATE TABLE inventory_batches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, item_cd TEXT DEFAULT '', item_nm TEXT DEFAULT '',
+            mid_cd TEXT DEFAULT '', expiry_date TEXT DEFAULT '', remaining_qty INTEGER DEFAULT 0,
+            status TEXT DEFAULT 'active', store_id TEXT DEFAULT '');
+        CREATE TABLE daily_sales (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, sales_date TEXT, item_cd TEXT,
+            item_nm TEXT DEFAULT '', mid_cd TEXT DEFAULT '', sale_qty INTEGER DEFAULT 0,
+            stock_qty INTEGER DEFAULT 0, disuse_qty INTEGER DEFAULT 0, store_id TEXT DEFAULT '');
+        CREATE TABLE prediction_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, prediction_date TEXT, store_id TEXT DEFAULT '');
+        CREATE TABLE eval_outcomes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, eval_date TEXT DEFAULT '',
+            order_status TEXT DEFAULT '', created_at TEXT DEFAULT '', store_id TEXT DEFAULT '');
+        CREATE TABLE order_fail_reasons (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, eval_date TEXT DEFAULT '', item_cd TEXT DEFAULT '',
+            item_nm TEXT DEFAULT '', mid_cd TEXT DEFAULT '', stop_reason TEXT DEFAULT '',
+            orderable_status TEXT DEFAULT '', checked_at TEXT DEFAULT '', store_id TEXT DEFAULT '');
+        CREATE TABLE products (item_cd TEXT PRIMARY KEY, item_nm TEXT DEFAULT '');
+    """)
+    today = datetime.now().strftime("%Y-%m-%d")
+    conn.executemany(
+        "INSERT INTO order_tracking (order_date, item_cd, mid_cd, order_qty, status) "
+        "VALUES (?, ?, '001', ?, ?)",
+        [(today, "A", 3, "ordered"), (today, "B", 2, "ordered"), (today, "C", 1, "fail")],
+    )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+class CountingService(DashboardService):
+    """메서드 호출 횟수 기록"""
+
+    def __init__(self, db_path):
+        super().__init__(db_path=db_path)
+        self.calls = {}
+
+    def __getattribute__(self, name):
+        attr = super().__getattribute__(name)
+        if name.startswith("get_") and callable(attr):
+            calls = super().__getattribute__("calls")
+            calls[name] = calls.get(name, 0) + 1
+        return attr
+
+
+class TestRepository:
+
+    @pytest.mark.unit
+    def test_etag_tracks_content(self, repo):
+        first = repo.save_sections("46513", {"summary": {"b": 1, "a": [1, 2]}})
+        again = repo.save_sections("46513", {"summary": {"a": [1, 2], "b": 1}})
+        changed = repo.save_sections("46513", {"summary": {"a": [1, 2], "b": 2}})
+        assert first == again and first != changed
+
+        row = repo.get("46513", "summary")
+        assert json.loads(row["payload"]) == {"a": [1, 2], "b": 2}
+        assert row["etag"] == changed["summary"]
+        assert repo.get("46513", "weekly") is None
+
+    @pytest.mark.unit
+    def test_get_for_stores(self, repo):
+        repo.save_sections("46513", {"comparison": {"today_qty": 1}, "status": {}})
+        repo.save_sections("46704", {"comparison": {"today_qty": 2}})
+        rows = repo.get_for_stores("comparison", ["46513", "46704", "99999"])
+        assert {k: json.loads(v["payload"]) for k, v in rows.items()} == {
+            "46513": {"today_qty": 1}, "46704": {"today_qty": 2},
+        }
+        assert repo.get_for_stores("comparison", []) == {}
+
+    @pytest.mark.unit
+    def test_reads_do_not_create_table_and_delete(self, tmp_path):
+        db = tmp_path / "fresh.db"
+        sqlite3.connect(str(db)).close()
+        repo = DashboardSnapshotRepository(db_path=db)
+        assert repo.get("46513", "summary") is None
+        assert repo.get_for_stores("summary", ["46513"]) == {}
+        assert repo.delete("46513") == 0
+        conn = sqlite3.connect(str(db))
+        assert conn.execute("SELECT name FROM sqlite_master").fetchall() == []
+        conn.close()
+
+        repo.save_sections("46513", {"summary": {}, "status": {}})
+        repo.save_sections("46704", {"summary": {}})
+        assert repo.delete("46513") == 2
+        assert repo.get("46704", "summary") is not None
+        assert repo.delete() == 1
+
+
+class TestStaleness:
+
+    @pytest.mark.unit
+    def test_is_stale(self):
+        now = datetime(2026, 3, 7, 23, 0)
+        assert not is_stale("2026-03-07T11:30:00", now)
+        assert not is_stale("2026-03-07T00:00:00", now)   # 같은 날이면 경과 시간 무관
+        assert is_stale("2026-03-06T23:59:00", datetime(2026, 3, 7, 0, 1))
+        assert is_stale(None, now) and is_stale("garbage", now)
+
+
+class TestSnapshotService:
+
+    @pytest.mark.unit
+    def test_build_sections_shares_queries(self, store_db):
+        svc = CountingService(store_db)
+        data = build_sections(svc)
+        assert set(data) == set(SECTIONS)
+        for method in ("get_last_order", "get_expiry_risk", "get_today_summary",
+                       "get_pipeline_status"):
+            assert svc.calls[method] == 1, method
+        assert data[SECTION_COMPARISON]["today_orders"] == 3
+        assert data[SECTION_SUMMARY]["order_status"] == "failed"
+        assert data[SECTION_STATUS]["last_order"]["success_count"] == 2
+
+    @pytest.mark.unit
+    def test_get_is_read_only(self, repo, store_db):
+        """없거나 만료된 섹션은 계산만 하고 저장하지 않음"""
+        svc = CountingService(store_db)
+        snapshot = DashboardSnapshotService("46513", repo=repo, service=svc)
+
+        row = snapshot.get(SECTION_SUMMARY)
+        assert json.loads(row["payload"])["order_success"] == 2
+        assert repo.get("46513", SECTION_SUMMARY) is None
+        assert svc.calls["get_sales_overview"] == 1
+
+        clear_ondemand_cache()
+        stale = repo.save_sections("46513", {SECTION_SUMMARY: {}}, generated_at="2000-01-01T00:00:00")
+        assert snapshot.get(SECTION_SUMMARY)["etag"] == row["etag"]
+        assert svc.calls["get_sales_overview"] == 2
+        assert repo.get("46513", SECTION_SUMMARY)["etag"] == stale[SECTION_SUMMARY]
+
+        snapshot.refresh([SECTION_SUMMARY])
+        assert snapshot.get(SECTION_SUMMARY)["etag"] == row["etag"]
+        assert svc.calls["get_sales_overview"] == 3
+        assert snapshot.get(SECTION_SUMMARY) == repo.get("46513", SECTION_SUMMARY)
+        assert svc.calls["get_sales_overview"] == 3
+
+    @pytest.mark.unit
+    def test_snapshot_served_all_day(self, repo, store_db):
+        """같은 날 생성된 스냅샷은 경과 시간과 무관하게 SQL 없이 사용"""
+        svc = CountingService(store_db)
+        snapshot = DashboardSnapshotService("46513", repo=repo, service=svc)
+        morning = datetime.now().replace(hour=0, minute=0, second=0).isoformat(timespec="seconds")
+        saved = repo.save_sections("46513", {SECTION_SUMMARY: {"x": 1}}, generated_at=morning)
+        assert snapshot.get(SECTION_SUMMARY)["etag"] == saved[SECTION_SUMMARY]
+        assert svc.calls == {}
+
+    @pytest.mark.unit
+    def test_ondemand_result_cached_until_ttl_or_invalidate(
+        self, repo, store_db, monkeypatch
+    ):
+        """유효 스냅샷이 없으면 계산 결과를 TTL 동안 메모리 캐시 (저장 안 함)"""
+        monkeypatch.setattr(snapshot_module, "DashboardSnapshotRepository", lambda: repo)
+        clock = [1000.0]
+        monkeypatch.setattr(snapshot_module.time, "monotonic", lambda: clock[0])
+        svc = CountingService(store_db)
+        snapshot = DashboardSnapshotService("46513", repo=repo, service=svc)
+
+        first = snapshot.get(SECTION_SUMMARY)
+        assert snapshot.get(SECTION_SUMMARY) == first
+        assert svc.calls["get_sales_overview"] == 1
+        assert repo.get("46513", SECTION_SUMMARY) is None
+
+        clock[0] += snapshot_module.DASHBOARD_ONDEMAND_CACHE_TTL_SEC + 1
+        snapshot.get(SECTION_SUMMARY)
+        assert svc.calls["get_sales_overview"] == 2
+
+        assert invalidate_dashboard_snapshot("46513") is True
+        snapshot.get(SECTION_SUMMARY)
+        assert svc.calls["get_sales_overview"] == 3
+
+    @pytest.mark.unit
+    def test_store_comparison_reads_snapshots(self, repo, store_db, monkeypatch):
+        stores = [StoreContext("46513", "A점"), StoreContext("46704", "B점")]
+        monkeypatch.setattr(StoreContext, "get_all_active", classmethod(lambda cls: stores))
+        monkeypatch.setattr(snapshot_module, "DashboardSnapshotRepository", lambda: repo)
+        monkeypatch.setattr(
+            snapshot_module, "DashboardService",
+            lambda store_id=None: DashboardService(db_path=store_db),
+        )
+        repo.save_sections("46513", {SECTION_COMPARISON: {"today_orders": 9}})
+
+        result = DashboardService().get_store_comparison()
+        assert result[0] == {"store_id": "46513", "store_name": "A점", "today_orders": 9}
+        assert result[1]["store_name"] == "B점" and result[1]["today_orders"] == 3
+        assert repo.get("46704", SECTION_COMPARISON) is None
+
+
+class TestWasteRiskFormat:
+
+    @pytest.mark.unit
+    def test_format(self):
+        now = datetime(2026, 3, 7, 9, 0)
+        items = [
+            {"item_nm": "도시락", "expiry_date": "2026-03-07 10:00", "remaining_qty": 2},
+            {"item_nm": "빵", "expiry_date": "2026-03-08", "remaining_qty": 1},
+        ]
+        assert format_waste_risk_products(items, now) == [
+            {"name": "도시락", "expires_at": "오늘 10:00", "quantity": 2},
+            {"name": "빵", "expires_at": "03/08", "quantity": 1},
+        ]
+
+
+class TestHomeApi:
+
+    @pytest.fixture
+    def client(self, tmp_path, store_db, repo, monkeypatch):
+        from src.web.routes import api_home
+
+        monkeypatch.setattr(
+            api_home, "DashboardSnapshotService",
+            lambda store_id: DashboardSnapshotService(
+                store_id, repo=repo, service=DashboardService(db_path=store_db)
+            ),
+        )
+        app = Flask(__name__)
+        app.config.update(PROJECT_ROOT=str(tmp_path), DB_PATH=store_db)
+        app.register_blueprint(api_home.home_bp, url_prefix="/api/home")
+        return app.test_client()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("query", ["", "?store_id=46513"])
+    def test_status_etag(self, client, repo, query):
+        resp = client.get("/api/home/status" + query)
+        assert resp.status_code == 200
+        data = resp.get_json()
+        assert data["scheduler"] == {"running": False, "pid": None}
+        assert data["pipeline"]["stage"] == "idle"
+        assert data["today_summary"]["order_items"] == 3
+
+        etag = resp.headers["ETag"]
+        again = client.get("/api/home/status" + query, headers={"If-None-Match": etag})
+        assert again.status_code == 304 and not again.data
+        assert repo.get("46513", SECTION_STATUS) is None
+
+
+class TestWebWriteInvalidation:
+
+    @pytest.fixture
+    def repo_patch(self, repo, monkeypatch):
+        monkeypatch.setattr(snapshot_module, "DashboardSnapshotRepository", lambda: repo)
+        repo.save_sections("46513", {SECTION_SUMMARY: {"a": 1}})
+        repo.save_sections("46704", {SECTION_SUMMARY: {"a": 2}})
+        return repo
+
+    @pytest.mark.unit
+    def test_invalidate(self, repo_patch):
+        assert invalidate_dashboard_snapshot("46513") is True
+        assert repo_patch.get("46513", SECTION_SUMMARY) is None
+        assert repo_patch.get("46704", SECTION_SUMMARY) is not None
+        assert invalidate_dashboard_snapshot() is True
+        assert repo_patch.get("46704", SECTION_SUMMARY) is None
+
+    @pytest.mark.unit
+    def test_settings_save_invalidates(self, repo_patch, tmp_path, monkeypatch):
+        from src.web.routes import api_settings
+
+        params = tmp_path / "eval_params.json"
+        params.write_text(json.dumps({"exposure_urgent": {"value": 1.0, "min": 0, "max": 5}}))
+        monkeypatch.setattr(api_settings, "EVAL_PARAMS_PATH", params)
+        monkeypatch.setattr(api_settings, "_log_audit", lambda *a: None)
+        app = Flask(__name__)
+        app.secret_key = "test"
+        app.register_blueprint(api_settings.settings_bp, url_prefix="/api/settings")
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess.update(user_id=1, role="admin")
+
+        resp = client.post("/api/settings/eval-params", json={"key": "nope", "value": 1})
+        assert resp.status_code == 404
+        assert repo_patch.get("46513", SECTION_SUMMARY) is not None
+
+        resp = client.post("/api/settings/eval-params", json={"key": "exposure_urgent", "value": 2})
+        assert resp.status_code == 200
+        assert repo_patch.get_for_stores(SECTION_SUMMARY, ["46513", "46704"]) == {}
+
+    @pytest.mark.unit
+    def test_run_script_refreshes_after_exit(self):
+        import subprocess
+
+        from src.web.routes import api_order
+
+        proc = subprocess.Popen(
+            [sys.executable, "-c", "print('done')"],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+        )
+        output = []
+        with patch.object(api_order, "refresh_dashboard_snapshot") as refresh:
+            api_order._read_output_then_refresh(proc, output, "46513")
+        assert output == ["done\n"]
+        assert proc.returncode == 0
+        refresh.assert_called_once_with("46513")
@@ -0,0 +1,196 @@
+"""DataValidator 일괄 검증 (validation-batch) 테스트
+
+- validate_sales_data: 통계 쿼리 1회 + 3σ 배열 판정 ↔ 단건 detect_* 결과 동일성
+- SalesRepository 저장 후 검증 백그라운드 실행
+"""
+
+import random
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.database.repos import sales_repo
+from src.infrastructure.database.repos.sales_repo import (
+    SalesRepository,
+    wait_for_pending_validations,
+)
+from src.validation.data_validator import DataValidator
+
+STORE = "46513"
+OTHER_STORE = "46704"
+
+
+def _item(i):
+    return f"880100{i:07d}"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "sales.db")
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE daily_sales (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, store_id TEXT, item_cd TEXT,
+            sales_date TEXT, sale_qty INTEGER, collected_at TEXT
+        )
+    """)
+    rng = random.Random(5)
+    today = datetime.now().date()
+    rows = []
+    for i in range(60):
+        for d in range(1, 40):
+            qty = rng.choice([0, 1, 2, 3, 4, 5] if i % 5 else [2, 3, 4])
+            rows.append((STORE, _item(i), (today - timedelta(days=d)).isoformat(), qty, "c1"))
+        rows.append((OTHER_STORE, _item(i), today.isoformat(), 90, "c1"))
+    # 오늘 재수집 (중복) 상품
+    for i in (3, 7, 11):
+        rows.append((STORE, _item(i), today.isoformat(), 2, "c1"))
+        rows.append((STORE, _item(i), today.isoformat(), 2, "c2"))
+    conn.executemany(
+        "INSERT INTO daily_sales (store_id, item_cd, sales_date, sale_qty, collected_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def connect_counter(db_path):
+    calls = []
+
+    def _connect(*args, **kwargs):
+        calls.append(1)
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    with patch("src.validation.data_validator.get_connection", side_effect=_connect):
+        yield calls
+
+
+def _reference(validator, data, sales_date):
+    """단건 조회 기반 기존 검증 순서 (오류/경고 목록)"""
+    errors, warnings = [], []
+    for item in data:
+        item_cd = item["item_cd"]
+        if not validator.validate_item_code(item_cd):
+            errors.append(("INVALID_ITEM_CD", item_cd))
+            continue
+        qty_errors = validator.validate_quantities(item)
+        if qty_errors:
+            errors.extend((e["code"], item_cd) for e in qty_errors)
+            continue
+        if validator.detect_duplicate(sales_date, item_cd):
+            errors.append(("DUPLICATE_COLLECTION", item_cd))
+            continue
+        anomaly = validator.detect_sales_anomaly(item_cd, item["sale_qty"])
+        if anomaly:
+            warnings.append((anomaly["code"], item_cd, anomaly["metadata"]))
+    return errors, warnings
+
+
+class TestValidateSalesData:
+
+    @pytest.mark.unit
+    def test_matches_per_item_checks_with_one_query(self, connect_counter):
+        today = datetime.now().strftime("%Y-%m-%d")
+        data = [{"item_cd": _item(i), "sale_qty": (40 if i % 5 == 0 else i % 6)} for i in range(60)]
+        data += [
+            {"item_cd": "123", "sale_qty": 1},
+            {"item_cd": _item(70), "sale_qty": -1},
+            {"item_cd": _item(71), "sale_qty": 9},   # 이력 없음
+        ]
+        validator = DataValidator(store_id=STORE)
+
+        connect_counter.clear()
+        result = validator.validate_sales_data(data, today)
+        assert len(connect_counter) == 1
+
+        errors, warnings = _reference(validator, data, today)
+        assert [(e.error_code, e.affected_item) for e in result.errors] == errors
+        assert [(w.warning_code, w.affected_item, w.metadata) for w in result.warnings] == warnings
+        assert result.passed_count == len(data) - 2 - 3
+        assert {e[1] for e in errors if e[0] == "DUPLICATE_COLLECTION"} == {
+            _item(3), _item(7), _item(11)
+        }
+        assert len(warnings) >= 10     # i % 5 == 0 상품: 평소 2~4개 → 40개
+
+    @pytest.mark.unit
+    def test_store_isolation(self, connect_counter):
+        today = datetime.now().strftime("%Y-%m-%d")
+        result = DataValidator(store_id=OTHER_STORE).validate_sales_data(
+            [{"item_cd": _item(3), "sale_qty": 90}], today
+        )
+        assert result.errors == [] and result.warnings == []
+
+    @pytest.mark.unit
+    def test_duplicate_rule_disabled(self, connect_counter):
+        today = datetime.now().strftime("%Y-%m-%d")
+        validator = DataValidator(store_id=STORE)
+        validator.rules.rules["duplicate_detection"]["enabled"] = False
+        result = validator.validate_sales_data([{"item_cd": _item(3), "sale_qty": 2}], today)
+        assert result.errors == [] and result.passed_count == 1
+
+
+class TestAsyncPostSaveValidation:
+
+    @pytest.mark.unit
+    def test_runs_in_background_after_save(self, monkeypatch):
+        started, release, done = threading.Event(), threading.Event(), []
+
+        def _run(self, sales_data, sales_date, store_id):
+            started.set()
+            release.wait(5)
+            done.append((len(sales_data), sales_date, store_id))
+
+        monkeypatch.setattr(sales_repo, "SALES_VALIDATION_ASYNC", True)
+        monkeypatch.setattr(SalesRepository, "_run_validation", _run)
+        repo = SalesRepository.__new__(SalesRepository)
+
+        repo._validate_saved_data([{"ITEM_CD": "A"}], "2026-03-07", STORE)
+        assert started.wait(5) and done == []
+        release.set()
+        assert wait_for_pending_validations(timeout=5)
+        assert done == [(1, "2026-03-07", STORE)]
+
+    @pytest.mark.unit
+    def test_sync_mode(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(sales_repo, "SALES_VALIDATION_ASYNC", False)
+        monkeypatch.setattr(
+            SalesRepository, "_run_validation",
+            lambda self, *args: calls.append(threading.current_thread().name),
+        )
+        SalesRepository.__new__(SalesRepository)._validate_saved_data([], "2026-03-07", STORE)
+        assert calls == [threading.current_thread().name]
+
+    @pytest.mark.unit
+    def test_daily_job_waits_for_validations(self, monkeypatch):
+        """수집 잡 종료 시 마지막 수집분의 저장 후 검증 완료 대기"""
+        from src.scheduler import daily_job
+        from src.scheduler.phases import collection
+
+        done = []
+
+        def _slow_validation():
+            threading.Event().wait(0.3)
+            done.append(True)
+
+        def _collect(ctx, job):
+            sales_repo._submit_validation(_slow_validation)
+            ctx["collection_success"] = True
+            return ctx
+
+        monkeypatch.setattr(daily_job, "SalesCollector", lambda store_id: None)
+        monkeypatch.setattr("src.infrastructure.database.schema.init_store_db", lambda sid: None)
+        monkeypatch.setattr(collection, "run_collection_phases", _collect)
+        job = daily_job.DailyCollectionJob.__new__(daily_job.DailyCollectionJob)
+        job.store_id, job.collector = STORE, None
+
+        result = job.run_optimized(run_auto_order=False, collect_only=["sales"])
+        assert result["success"] and done == [True]
@@ -0,0 +1,245 @@
+"""폐기 알림 일괄 조회 (expiry-batch-resolve) 테스트
+
+- ExpiryBatchResolver: 유통기한/배치 잔량/최신 재고 ↔ 기존 단건 SQL 결과 동일성
+- ExpiryChecker: get_food_stock_status / get_items_expiring_at* 쿼리 수가 상품 수와 무관
+"""
+
+import random
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.alert.expiry_checker import ExpiryChecker
+from src.alert.expiry_resolver import ExpiryBatchResolver, date_only_expiry_hour
+
+STORE = "46513"
+TODAY = datetime.now().date()
+
+
+def _d(days_ago):
+    return (TODAY - timedelta(days=days_ago)).isoformat()
+
+
+@pytest.fixture
+def db_paths(tmp_path):
+    store, common = tmp_path / "store.db", tmp_path / "common.db"
+    conn = sqlite3.connect(str(common))
+    conn.execute("CREATE TABLE products (item_cd TEXT PRIMARY KEY, item_nm TEXT, mid_cd TEXT)")
+    conn.execute("CREATE TABLE product_details (item_cd TEXT PRIMARY KEY, item_nm TEXT, "
+                 "expiration_days INTEGER)")
+    conn.commit()
+    conn.close()
+    conn = sqlite3.connect(str(store))
+    conn.execute("""CREATE TABLE daily_sales (
+        id INTEGER PRIMARY KEY, store_id TEXT, sales_date TEXT, item_cd TEXT, mid_cd TEXT,
+        sale_qty INTEGER DEFAULT 0, buy_qty INTEGER DEFAULT 0, stock_qty INTEGER DEFAULT 0)""")
+    conn.execute("""CREATE TABLE inventory_batches (
+        id INTEGER PRIMARY KEY, store_id TEXT, item_cd TEXT, receiving_date TEXT,
+        expiry_date TEXT, delivery_type TEXT, remaining_qty INTEGER DEFAULT 0,
+        status TEXT DEFAULT 'active')""")
+    conn.execute("""CREATE TABLE order_tracking (
+        id INTEGER PRIMARY KEY, store_id TEXT, order_date TEXT, item_cd TEXT,
+        delivery_type TEXT, remaining_qty INTEGER)""")
+    conn.execute("""CREATE TABLE receiving_history (
+        id INTEGER PRIMARY KEY, store_id TEXT, receiving_date TEXT, item_cd TEXT,
+        receiving_qty INTEGER, delivery_type TEXT)""")
+    conn.commit()
+    conn.close()
+    return store, common
+
+
+def _connect(store, common):
+    conn = sqlite3.connect(str(store))
+    conn.execute(f"ATTACH DATABASE '{str(common).replace(chr(92), '/')}' AS common")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _seed(store, common, count, offset=0, seed=3):
+    """푸드 상품 count 개: 판매/재고 이력, 배치(시간 포함/날짜만), 발주추적, 입고"""
+    rng = random.Random(seed + offset)
+    mids = ["001", "002", "003", "004", "005", "012"]
+    products, sales, batches, tracking, receiving = [], [], [], [], []
+    for i in range(offset, offset + count):
+        item_cd = f"88{i:011d}"
+        mid_cd = mids[i % len(mids)]
+        products.append((item_cd, f"상품{i}{rng.choice(['1', '2', ''])}", mid_cd,
+                         rng.choice([None, 1, 2, 3])))
+        days = rng.sample(range(0, 10), 5)
+        if mid_cd == "012":
+            # 빵: 오늘 재고 + 5일 전 발주 (유통 3일 → B방식 만료일 = 오늘)
+            products[-1] = products[-1][:3] + (3,)
+            days = [d for d in days if d not in (0, 5)]
+            sales.append((STORE, _d(0), item_cd, mid_cd, 2, 0, 0))
+            sales.append((STORE, _d(5), item_cd, mid_cd, 0, 2, 0))
+        for days_ago in days:
+            for store_id in (STORE, "99999"):
+                sales.append((store_id, _d(days_ago), item_cd, mid_cd, rng.randint(0, 4),
+                              rng.choice([0, 0, 2]), rng.choice([0, 1, 3])))
+        for _ in range(rng.randint(0, 3)):
+            recv = _d(rng.randint(0, 3))
+            expiry = rng.choice([
+                f"{_d(-1)} {rng.choice([2, 14, 22]):02d}:00:00",
+                f"{_d(0)} 14:00",
+                _d(rng.choice([0, -1])),
+                "bogus",
+                None,
+            ])
+            batches.append((rng.choice([STORE, STORE, "99999"]), item_cd, recv, expiry,
+                            rng.choice(["1차", "2차", None]), rng.randint(0, 2),
+                            rng.choice(["active", "active", "consumed"])))
+        if i % 4 == 0:
+            batches.append((STORE, item_cd, _d(1), f"{_d(0)} 14:00:00", "2차", 1, "active"))
+        if rng.random() < 0.5:
+            tracking.append((STORE, _d(2), item_cd, rng.choice(["1차", "2차"]), 1))
+        receiving.append((STORE, _d(1), item_cd, 1, "2차"))
+        receiving.append((STORE, _d(2), item_cd, 1, "1차"))
+
+    conn = sqlite3.connect(str(common))
+    conn.executemany("INSERT INTO products VALUES (?, ?, ?)", [p[:3] for p in products])
+    conn.executemany("INSERT INTO product_details VALUES (?, ?, ?)",
+                     [(p[0], p[1], p[3]) for p in products])
+    conn.commit()
+    conn.close()
+    conn = sqlite3.connect(str(store))
+    conn.executemany("INSERT INTO daily_sales (store_id, sales_date, item_cd, mid_cd, stock_qty, "
+                     "buy_qty, sale_qty) VALUES (?, ?, ?, ?, ?, ?, ?)", sales)
+    conn.executemany("INSERT INTO inventory_batches (store_id, item_cd, receiving_date, "
+                     "expiry_date, delivery_type, remaining_qty, status) "
+                     "VALUES (?, ?, ?, ?, ?, ?, ?)", batches)
+    conn.executemany("INSERT INTO order_tracking (store_id, order_date, item_cd, delivery_type, "
+                     "remaining_qty) VALUES (?, ?, ?, ?, ?)", tracking)
+    conn.executemany("INSERT INTO receiving_history (store_id, receiving_date, item_cd, "
+                     "receiving_qty, delivery_type) VALUES (?, ?, ?, ?, ?)", receiving)
+    conn.commit()
+    conn.close()
+    return {p[0]: (p[2], p[1]) for p in products}
+
+
+def _reference_expiry(conn, item_cd, mid_cd, item_nm):
+    """기존 _get_actual_expiry_time 단건 조회"""
+    row = conn.execute("""
+        SELECT expiry_date, delivery_type FROM inventory_batches
+        WHERE item_cd = ? AND status = 'active' AND expiry_date IS NOT NULL
+          AND store_id = ?
+        ORDER BY receiving_date DESC LIMIT 1
+    """, (item_cd, STORE)).fetchone()
+    if not row:
+        return None
+    for fmt in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M'):
+        try:
+            return datetime.strptime(row[0], fmt)
+        except ValueError:
+            continue
+    try:
+        exp_date = datetime.strptime(row[0], '%Y-%m-%d')
+    except ValueError:
+        return None
+    tracked = conn.execute(
+        "SELECT delivery_type FROM order_tracking WHERE item_cd = ? "
+        "ORDER BY order_date DESC LIMIT 1", (item_cd,)).fetchone()
+    last_char = item_nm.strip()[-1]
+    del_type = (row[1] or (tracked[0] if tracked else None)
+                or {"1": "1차", "2": "2차"}.get(last_char) or "1차")
+    return exp_date.replace(hour=date_only_expiry_hour(mid_cd, del_type))
+
+
+class TestExpiryBatchResolver:
+
+    @pytest.mark.unit
+    def test_matches_single_item_queries(self, db_paths):
+        store, common = db_paths
+        items = _seed(store, common, 60)
+        items["NO_HISTORY"] = ("001", "없음1")
+        conn = _connect(store, common)
+        resolver = ExpiryBatchResolver(conn, STORE)
+
+        expiry = resolver.expiry_times(items)
+        for item_cd, (mid_cd, item_nm) in items.items():
+            assert expiry.get(item_cd) == _reference_expiry(conn, item_cd, mid_cd, item_nm)
+        assert any(e.minute == 0 and e.hour in (2, 14, 22) for e in expiry.values())
+
+        stock = resolver.latest_stock(items)
+        for item_cd in items:
+            row = conn.execute(
+                "SELECT stock_qty, sales_date FROM daily_sales WHERE item_cd = ? "
+                "AND store_id = ? ORDER BY sales_date DESC LIMIT 1", (item_cd, STORE)).fetchone()
+            assert stock.get(item_cd) == (tuple(row) if row else None)
+
+        keys = [(item_cd, _d(days)) for item_cd in items for days in range(4)]
+        remaining = resolver.batch_remaining(keys)
+        for item_cd, recv in keys:
+            total = conn.execute(
+                "SELECT SUM(remaining_qty) FROM inventory_batches WHERE item_cd = ? "
+                "AND receiving_date = ? AND store_id = ?", (item_cd, recv, STORE)).fetchone()[0]
+            assert remaining.get((item_cd, recv)) == total
+
+        avg = resolver.avg_daily_sales(items, days=7)
+        for item_cd in items:
+            total = conn.execute(
+                "SELECT COALESCE(SUM(sale_qty), 0) FROM daily_sales WHERE item_cd = ? "
+                "AND sales_date >= date('now', '-7 days') AND store_id = ?",
+                (item_cd, STORE)).fetchone()[0]
+            assert avg[item_cd] == total / 7
+        conn.close()
+
+    @pytest.mark.unit
+    def test_query_failure_returns_empty(self, db_paths):
+        store, common = db_paths
+        conn = sqlite3.connect(str(store))
+        conn.execute("DROP TABLE inventory_batches")
+        resolver = ExpiryBatchResolver(conn, STORE)
+        assert resolver.expiry_times({"A": ("001", "a1")}) == {}
+        assert resolver.batch_remaining([("A", _d(0))]) == {}
+        conn.close()
+
+
+def _checker(store, common):
+    checker = ExpiryChecker(store_id=STORE)
+    checker.conn = _connect(store, common)
+    statements = []
+    checker.conn.set_trace_callback(
+        lambda sql: statements.append(sql) if sql.lstrip().upper().startswith("SELECT") else None
+    )
+    return checker, statements
+
+
+class TestExpiryCheckerUsesResolver:
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("call", [
+        lambda checker: checker.get_food_stock_status(),
+        lambda checker: checker.get_items_expiring_at(14),
+        lambda checker: checker._get_receiving_items_expiring_at(14, _d(0)),
+        lambda checker: checker.get_items_expiring_at_legacy(0),
+    ])
+    def test_query_count_independent_of_items(self, db_paths, call):
+        store, common = db_paths
+        _seed(store, common, 12)
+        checker, statements = _checker(store, common)
+        assert call(checker)
+        few = len(statements)
+        checker.close()
+
+        _seed(store, common, 80, offset=100)
+        checker, statements = _checker(store, common)
+        assert call(checker)
+        assert len(statements) == few
+        checker.close()
+
+    @pytest.mark.unit
+    def test_food_stock_status_uses_batch_expiry(self, db_paths):
+        store, common = db_paths
+        items = _seed(store, common, 40)
+        checker, _ = _checker(store, common)
+        status = checker.get_food_stock_status()
+        assert status
+        for entry in status:
+            mid_cd, item_nm = items[entry["item_cd"]]
+            expected = _reference_expiry(checker.conn, entry["item_cd"], mid_cd, item_nm)
+            if expected:
+                assert entry["expiry_time"] == expected
+            assert entry["avg_daily_sales"] == round(
+                checker._get_avg_daily_sales(entry["item_cd"]), 1)
+        checker.close()
@@ -0,0 +1,142 @@
+"""Lag/Rolling calculate_batch 배치 윈도우 (feature-batch-window) 테스트
+
+- 배치 결과 = SKU별 calculate() 결과 (행사 imputation, 0판매일 보간, 결측 lag 포함)
+- daily_sales/promotions 조회는 배치당 1회
+- load_batch 이후 calculate()는 캐시 사용, clear_batch 후 SKU별 조회 복귀
+"""
+
+import random
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.prediction.features.feature_calculator import FeatureCalculator
+from src.prediction.features.lag_features import LagFeatureCalculator
+from src.prediction.features.rolling_features import RollingFeatureCalculator
+
+STORE = "46513"
+TARGET = datetime(2026, 3, 15)
+
+
+@pytest.fixture
+def sales_db(tmp_path):
+    db = tmp_path / "store.db"
+    conn = sqlite3.connect(str(db))
+    conn.execute("""CREATE TABLE daily_sales (
+        store_id TEXT, item_cd TEXT, sales_date TEXT, sale_qty INTEGER)""")
+    conn.execute("""CREATE TABLE promotions (
+        item_cd TEXT, start_date TEXT, end_date TEXT, is_active INTEGER)""")
+    rng = random.Random(7)
+    items = [f"I{i:02d}" for i in range(12)]
+    for n, item_cd in enumerate(items):
+        # 품목별 판매 구간/밀도를 다르게: 최근만, 듬성듬성, 1년 전 포함 등
+        span = rng.choice([3, 10, 40, 120, 400])
+        density = rng.choice([0.3, 0.7, 1.0])
+        for back in range(1, span + 1):
+            if rng.random() < density:
+                day = (TARGET - timedelta(days=back)).strftime("%Y-%m-%d")
+                conn.execute(
+                    "INSERT INTO daily_sales VALUES (?, ?, ?, ?)",
+                    (STORE, item_cd, day, rng.choice([0, 0, 1, 2, 3, 5, 8, 13])),
+                )
+        if n % 3 == 0:
+            start = (TARGET - timedelta(days=rng.randint(5, 30))).strftime("%Y-%m-%d")
+            end = (TARGET - timedelta(days=rng.randint(1, 4))).strftime("%Y-%m-%d")
+            conn.execute("INSERT INTO promotions VALUES (?, ?, ?, 1)", (item_cd, start, end))
+        if n % 4 == 0:  # 비활성 행사는 무시
+            conn.execute(
+                "INSERT INTO promotions VALUES (?, '2026-01-01', '2026-03-31', 0)", (item_cd,)
+            )
+    # 다른 매장 판매는 제외
+    conn.execute("INSERT INTO daily_sales VALUES ('99999', 'I00', '2026-03-14', 99)")
+    conn.commit()
+    conn.close()
+    return str(db), items + ["NONE"]
+
+
+def _count_queries(calc):
+    """_get_connection을 감싸 daily_sales 조회 횟수 기록"""
+    counter = {"sales": 0}
+    original = calc._get_connection
+
+    def traced(*args, **kwargs):
+        conn = original(*args, **kwargs)
+        conn.set_trace_callback(
+            lambda sql: counter.__setitem__(
+                "sales", counter["sales"] + ("FROM daily_sales" in sql)
+            )
+        )
+        return conn
+
+    calc._get_connection = traced
+    return counter
+
+
+class TestParity:
+
+    @pytest.mark.unit
+    def test_lag_batch_matches_per_item(self, sales_db):
+        db, items = sales_db
+        calc = LagFeatureCalculator(db_path=db, store_id=STORE)
+        batched = calc.calculate_batch(items, TARGET)
+        for item_cd in items:
+            assert batched[item_cd] == calc.calculate(item_cd, TARGET), item_cd
+
+    @pytest.mark.unit
+    def test_rolling_batch_matches_per_item(self, sales_db):
+        db, items = sales_db
+        calc = RollingFeatureCalculator(db_path=db, store_id=STORE)
+        batched = calc.calculate_batch(items, TARGET)
+        for item_cd in items:
+            assert batched[item_cd] == calc.calculate(item_cd, TARGET), item_cd
+        assert batched["NONE"].data_days == 0
+
+    @pytest.mark.unit
+    def test_without_promotions_table(self, sales_db):
+        db, items = sales_db
+        conn = sqlite3.connect(db)
+        conn.execute("DROP TABLE promotions")
+        conn.commit()
+        conn.close()
+        lag = LagFeatureCalculator(db_path=db, store_id=STORE)
+        rolling = RollingFeatureCalculator(db_path=db, store_id=STORE)
+        lag_batch = lag.calculate_batch(items, TARGET)
+        rolling_batch = rolling.calculate_batch(items, TARGET)
+        for item_cd in items:
+            assert lag_batch[item_cd] == lag.calculate(item_cd, TARGET)
+            assert rolling_batch[item_cd] == rolling.calculate(item_cd, TARGET)
+
+
+class TestQueries:
+
+    @pytest.mark.unit
+    def test_one_sales_query_per_batch(self, sales_db):
+        db, items = sales_db
+        for cls in (LagFeatureCalculator, RollingFeatureCalculator):
+            calc = cls(db_path=db, store_id=STORE)
+            counter = _count_queries(calc)
+            calc.calculate_batch(items, TARGET)
+            assert counter["sales"] == 1, cls.__name__
+
+    @pytest.mark.unit
+    def test_load_batch_serves_calculate_until_cleared(self, sales_db):
+        db, items = sales_db
+        fc = FeatureCalculator(db_path=db, store_id=STORE)
+        expected = {cd: fc.calculate(cd, TARGET) for cd in items}
+        lag_counter = _count_queries(fc.lag_calculator)
+        rolling_counter = _count_queries(fc.rolling_calculator)
+
+        fc.load_batch(items, TARGET)
+        assert {cd: fc.calculate(cd, TARGET) for cd in items} == expected
+        assert lag_counter["sales"] == 1
+        assert rolling_counter["sales"] == 1
+
+        # 다른 날짜 / 비기본 윈도우 → SKU별 조회
+        fc.rolling_calculator.calculate("I01", TARGET, windows=[28])
+        assert rolling_counter["sales"] == 2
+
+        fc.clear_batch()
+        fc.calculate("I01", TARGET)
+        assert lag_counter["sales"] > 1
+        assert rolling_counter["sales"] == 3
@@ -0,0 +1,357 @@
+"""컬럼형 Feature 행렬 (columnar-feature-matrix) 테스트
+
+- _prepare_feature_matrices == prepare_training_samples + build_features (행 단위 참조 구현)
+- 그룹 모델 옵션 (lag/기온변화/연휴맥락 제외) == build_features 그룹 모델 호출
+- DateFeatureTable 날짜 해석
+- FeatureMatrix 결합
+- 그룹 공유 판매 배열 / 그룹 단위 스트리밍 (lean-training-samples)
+"""
+
+import sqlite3
+import weakref
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.prediction.ml.feature_builder import CATEGORY_GROUPS, MLFeatureBuilder
+from src.prediction.ml.feature_matrix import (
+    DateFeatureTable,
+    FeatureMatrix,
+    GroupSalesArrays,
+    build_group_feature_matrix,
+    build_item_feature_matrix,
+)
+from src.prediction.ml.trainer import MLTrainer
+from tests.ml_training_reference import prepare_training_samples
+
+HOURLY = {
+    "morning_ratio": 0.1, "lunch_ratio": 0.4, "evening_ratio": 0.3,
+    "night_ratio": 0.2, "peak_hour_slot": 1.0, "hour_cv": 0.3,
+}
+
+
+def _make_sales(rng, days: int, end: date, skip_every: int = 0):
+    """품절(재고0+판매0)/미수집(stock None)/결측일이 섞인 일별 판매"""
+    rows = []
+    for i in range(days):
+        if skip_every and i % skip_every == 3:
+            continue  # 날짜 결측 (lag 날짜 조회 검증용)
+        d = (end - timedelta(days=days - 1 - i)).isoformat()
+        roll = rng.random()
+        if roll < 0.15:
+            rows.append({"sales_date": d, "sale_qty": 0, "stock_qty": 0})
+        elif roll < 0.2:
+            rows.append({"sales_date": d, "sale_qty": int(rng.integers(0, 4)), "stock_qty": None})
+        else:
+            rows.append({
+                "sales_date": d,
+                "sale_qty": int(rng.integers(0, 9)),
+                "stock_qty": int(rng.integers(0, 12)),
+            })
+    return rows
+
+
+def _make_weather(rng, start: date, days: int):
+    weather = {}
+    for i in range(days):
+        d = (start + timedelta(days=i)).isoformat()
+        f = {}
+        if rng.random() > 0.2:
+            f["temperature"] = f"{rng.uniform(-5, 32):.1f}"
+        if i % 9 == 0:
+            f["is_holiday"] = "true"
+            f["holiday_period_days"] = "3"
+        if i % 9 == 8:
+            f["is_pre_holiday"] = "1"
+        if i % 9 == 1:
+            f["is_post_holiday"] = "true"
+        f["rain_qty"] = f"{rng.choice([0, 0.5, 5, 30])}"
+        f["weather_cd_nm"] = rng.choice(["맑음", "흐림", "황사", ""])
+        f["pm25"] = f"{rng.integers(0, 100)}"
+        weather[d] = f
+    return weather
+
+
+def _promo_conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE promotions (item_cd TEXT, start_date TEXT, end_date TEXT, is_active INTEGER)")
+    today = date.today()
+    conn.execute(
+        "INSERT INTO promotions VALUES ('A', ?, ?, 1)",
+        ((today - timedelta(days=40)).isoformat(), (today - timedelta(days=20)).isoformat()),
+    )
+    return conn
+
+
+@pytest.fixture
+def trainer():
+    rng = np.random.default_rng(7)
+    today = date.today()
+    histories = {
+        "A": _make_sales(rng, 90, today),            # food_group, 행사 포함
+        "B": _make_sales(rng, 60, today, skip_every=11),  # 날짜 결측
+        "C": _make_sales(rng, 20, today),            # 31일 미만 이력
+        "D": _make_sales(rng, 10, today),            # 14일 미만 → 제외
+    }
+    items = [
+        {"item_cd": "A", "mid_cd": "001"},
+        {"item_cd": "B", "mid_cd": "049"},
+        {"item_cd": "C", "mid_cd": "049"},
+        {"item_cd": "D", "mid_cd": "072"},
+    ]
+    meta = {
+        "A": {"expiration_days": 1, "disuse_rate": 0.2, "margin_rate": 30.0},
+        "B": {"expiration_days": 365, "margin_rate": 25.0},
+    }
+
+    t = MagicMock(spec=MLTrainer)
+    t.store_id = "46513"
+    t.pipeline = MagicMock()
+    t.pipeline.get_active_items.return_value = items
+    t.pipeline.get_item_daily_stats.side_effect = lambda cd, days: histories[cd]
+    t.pipeline.get_batch_daily_stats.side_effect = lambda codes, days: {
+        cd: histories[cd] for cd in codes
+    }
+    t.pipeline.get_items_meta.return_value = meta
+    t.pipeline.get_external_factors.return_value = _make_weather(
+        rng, today - timedelta(days=95), 96
+    )
+    t.pipeline._get_conn.side_effect = _promo_conn
+    for name in ("_prepare_feature_matrices", "_load_item_histories",
+                 "_iter_feature_matrices", "_build_group_feature_matrix"):
+        setattr(t, name, getattr(MLTrainer, name).__get__(t))
+    return t
+
+
+def _reference_matrix(samples):
+    """기존 train_all_groups 행 단위 Feature 생성"""
+    X_list, y_list, dates = [], [], []
+    for s in samples:
+        feat = MLFeatureBuilder.build_features(
+            daily_sales=s.get("daily_sales", []),
+            target_date=s.get("target_date", ""),
+            mid_cd=s.get("mid_cd", ""),
+            stock_qty=s.get("stock_qty", 0),
+            pending_qty=s.get("pending_qty", 0),
+            promo_active=s.get("promo_active", False),
+            expiration_days=s.get("expiration_days", 0),
+            disuse_rate=s.get("disuse_rate", 0.0),
+            margin_rate=s.get("margin_rate", 0.0),
+            temperature=s.get("temperature"),
+            temperature_delta=s.get("temperature_delta"),
+            lag_7=s.get("lag_7"),
+            lag_28=s.get("lag_28"),
+            week_over_week=s.get("week_over_week"),
+            is_holiday=s.get("is_holiday", False),
+            association_score=s.get("association_score", 0.0),
+            holiday_period_days=s.get("holiday_period_days", 0),
+            is_pre_holiday=s.get("is_pre_holiday", False),
+            is_post_holiday=s.get("is_post_holiday", False),
+            receiving_stats=s.get("receiving_stats"),
+            large_cd=s.get("large_cd"),
+            rain_qty=s.get("rain_qty", 0.0),
+            sky_nm=s.get("sky_nm", ""),
+            is_payday=s.get("is_payday", 0),
+            pm25=s.get("pm25", 0.0),
+            hourly_ratios=s.get("hourly_ratios"),
+        )
+        X_list.append(feat)
+        y_list.append(float(s.get("actual_sale_qty", 0)))
+        dates.append(s["target_date"])
+    return np.vstack(X_list), np.array(y_list, dtype=np.float32), dates
+
+
+class TestTrainingParity:
+
+    @pytest.fixture(autouse=True)
+    def _hourly(self):
+        with patch.object(MLFeatureBuilder, "calc_hourly_ratios", return_value=HOURLY), \
+             patch.object(MLFeatureBuilder, "calc_hourly_ratios_batch",
+                          side_effect=lambda store_id, base_dates, days=14: {
+                              cd: HOURLY for cd in base_dates}):
+            yield
+
+    @pytest.mark.parametrize("stockout_filter", [True, False])
+    def test_matrix_matches_row_builder(self, trainer, stockout_filter):
+        from src.prediction.prediction_config import PREDICTION_PARAMS
+
+        cfg = dict(PREDICTION_PARAMS["ml_stockout_filter"], enabled=stockout_filter)
+        with patch.dict(PREDICTION_PARAMS, {"ml_stockout_filter": cfg}):
+            samples = prepare_training_samples(trainer, days=90)
+            matrices = trainer._prepare_feature_matrices(days=90)
+            references = {g: _reference_matrix(s) for g, s in samples.items() if s}
+
+        assert set(matrices) == set(samples)
+        for group, group_samples in samples.items():
+            fm = matrices[group]
+            assert len(fm) == len(group_samples)
+            if not group_samples:
+                continue
+            X_ref, y_ref, dates_ref = references[group]
+            assert list(fm.dates) == dates_ref
+            assert fm.item_codes == [s["item_cd"] for s in group_samples]
+            np.testing.assert_allclose(fm.y, y_ref, rtol=1e-6)
+            for col, name in enumerate(MLFeatureBuilder.FEATURE_NAMES):
+                np.testing.assert_allclose(
+                    fm.X[:, col], X_ref[:, col], rtol=1e-5, atol=1e-6, err_msg=name
+                )
+
+    def test_short_history_excluded(self, trainer):
+        matrices = trainer._prepare_feature_matrices(days=90)
+        assert "D" not in matrices["tobacco_group"].item_codes
+        assert len(matrices["tobacco_group"]) == 0
+
+    def test_single_history_query_per_group(self, trainer):
+        trainer._prepare_feature_matrices(days=90)
+        # 그룹 단위 스트리밍: 상품이 있는 그룹마다 1회 (food / general / tobacco)
+        calls = trainer.pipeline.get_batch_daily_stats.call_args_list
+        assert sorted(call.args[0] for call in calls) == [["A"], ["B", "C"], ["D"]]
+        trainer.pipeline.get_item_daily_stats.assert_not_called()
+
+
+class TestGroupModelOptions:
+
+    def test_matches_group_model_build(self):
+        rng = np.random.default_rng(3)
+        today = date.today()
+        sales = _make_sales(rng, 30, today)
+        weather = _make_weather(rng, today - timedelta(days=40), 41)
+        table = DateFeatureTable(weather, sales[0]["sales_date"], sales[-1]["sales_date"])
+        meta = {"expiration_days": 2, "disuse_rate": 0.1, "margin_rate": 35.0}
+
+        fm = build_item_feature_matrix(
+            sales, table, item_cd="X", meta=meta, hourly_ratios=HOURLY,
+            data_days=30, smallcd_peer_avg=4.0, lifecycle_stage=0.5,
+            with_lags=False, with_temperature_delta=False, with_holiday_context=False,
+        )
+
+        assert len(fm) == len(sales) - 7
+        for row, i in enumerate(range(7, len(sales))):
+            ds = sales[i]["sales_date"]
+            f = weather.get(ds, {})
+            day = int(ds[-2:])
+            ref = MLFeatureBuilder.build_features(
+                daily_sales=sales[:i],
+                target_date=ds,
+                mid_cd="001",
+                stock_qty=sales[i - 1].get("stock_qty", 0) or 0,
+                expiration_days=2,
+                disuse_rate=0.1,
+                margin_rate=35.0,
+                temperature=float(f["temperature"]) if f.get("temperature") else None,
+                is_holiday=f.get("is_holiday", "false").lower() in ("true", "1"),
+                data_days=30,
+                smallcd_peer_avg=4.0,
+                lifecycle_stage=0.5,
+                rain_qty=float(f.get("rain_qty", 0) or 0),
+                sky_nm=f.get("weather_cd_nm", ""),
+                is_payday=1 if day in (10, 11, 12, 25, 26, 27) else 0,
+                pm25=float(f.get("pm25", 0) or 0),
+                hourly_ratios=HOURLY,
+            )
+            np.testing.assert_allclose(fm.X[row], ref, rtol=1e-5, atol=1e-6)
+
+    def test_too_short_history_is_empty(self):
+        sales = [{"sales_date": f"2026-03-0{d}", "sale_qty": 1, "stock_qty": 1} for d in range(1, 8)]
+        table = DateFeatureTable({}, "2026-03-01", "2026-03-07")
+        assert len(build_item_feature_matrix(sales, table)) == 0
+
+
+class TestDateFeatureTable:
+
+    def test_weekday_month_payday(self):
+        table = DateFeatureTable({}, "2026-03-09", "2026-03-15")
+        idx = table.index(np.array(["2026-03-09", "2026-03-13"], dtype="datetime64[D]"))
+        assert list(table.weekday[idx]) == [0, 4]  # 월, 금
+        assert table.is_payday[idx].tolist() == [0.0, 0.0]
+        assert table.is_payday[table.index(np.array(["2026-03-10"], dtype="datetime64[D]"))][0] == 1.0
+        assert table.month_sin[0] == pytest.approx(np.sin(2 * np.pi * 2 / 12))
+
+    def test_temperature_delta_uses_previous_day(self):
+        weather = {
+            "2026-03-08": {"temperature": "10"},
+            "2026-03-09": {"temperature": "16"},
+            "2026-03-10": {"temperature": "bad"},
+            "2026-03-11": {"temperature": "4"},
+        }
+        table = DateFeatureTable(weather, "2026-03-09", "2026-03-11")
+        assert table.temp_delta_norm.tolist() == pytest.approx([6 / 15, 0.0, 0.0])
+        assert table.temp_norm[1] == -2.0
+        assert not table.temp_present[1]
+
+
+class TestFeatureMatrixConcat:
+
+    def test_concat_preserves_order_and_skips_empty(self):
+        width = len(MLFeatureBuilder.FEATURE_NAMES)
+        a = FeatureMatrix(np.ones((2, width), np.float32), np.array([1, 2], np.float32),
+                          np.array(["2026-03-01", "2026-03-02"]), ["A", "A"])
+        b = FeatureMatrix(np.zeros((1, width), np.float32), np.array([3], np.float32),
+                          np.array(["2026-03-01"]), ["B"])
+        merged = FeatureMatrix.concat([a, FeatureMatrix.empty(), b])
+        assert len(merged) == 3
+        assert merged.item_codes == ["A", "A", "B"]
+        assert merged.y.tolist() == [1, 2, 3]
+        assert len(FeatureMatrix.concat([])) == 0
+
+
+class TestLeanTrainingSamples:
+
+    def test_group_arrays_sample_index(self):
+        rng = np.random.default_rng(11)
+        today = date.today()
+        histories = {"A": _make_sales(rng, 40, today), "B": _make_sales(rng, 5, today),
+                     "C": _make_sales(rng, 25, today, skip_every=6)}
+        arrays = GroupSalesArrays.from_histories(histories, ["C", "X", "B", "A"])
+        assert arrays.item_codes == ["C", "B", "A"]
+
+        item_idx, day = arrays.sample_index()
+        expected = [(k, i) for k, cd in enumerate(arrays.item_codes)
+                    for i in range(7, len(histories[cd]))]
+        assert list(zip(item_idx.tolist(), day.tolist())) == expected
+
+        sale, stock, known, dates = arrays.item(2)
+        assert np.shares_memory(sale, arrays.sale)
+        assert sale.tolist() == [float(d["sale_qty"] or 0) for d in histories["A"]]
+        assert known.tolist() == [d["stock_qty"] is not None for d in histories["A"]]
+        assert str(dates[0]) == histories["A"][0]["sales_date"]
+        assert arrays.span() == (histories["A"][0]["sales_date"], histories["A"][-1]["sales_date"])
+
+    def test_group_matrix_matches_item_concat(self):
+        rng = np.random.default_rng(5)
+        today = date.today()
+        codes = ["A", "B", "C", "D"]
+        histories = {cd: _make_sales(rng, n, today, skip_every=s)
+                     for cd, n, s in zip(codes, (60, 6, 33, 45), (0, 0, 7, 0))}
+        table = DateFeatureTable(_make_weather(rng, today - timedelta(days=70), 71),
+                                 (today - timedelta(days=59)).isoformat(), today.isoformat())
+        contexts = [{"meta": {"expiration_days": k + 1, "margin_rate": 20.0 + k},
+                     "hourly_ratios": HOURLY} for k in range(len(codes))]
+
+        arrays = GroupSalesArrays.from_histories(histories, codes)
+        fm = build_group_feature_matrix(arrays, table, contexts)
+        ref = FeatureMatrix.concat(
+            build_item_feature_matrix(histories[cd], table, item_cd=cd, **contexts[k])
+            for k, cd in enumerate(codes)
+        )
+        assert fm.item_codes == ref.item_codes
+        assert list(fm.dates) == list(ref.dates)
+        np.testing.assert_array_equal(fm.X, ref.X)
+        np.testing.assert_array_equal(fm.y, ref.y)
+        assert len(build_group_feature_matrix(
+            GroupSalesArrays.from_histories({}, codes), table, [])) == 0
+
+    def test_iter_streams_one_group_at_a_time(self, trainer):
+        with patch.object(MLFeatureBuilder, "calc_hourly_ratios_batch",
+                          side_effect=lambda store_id, base_dates, days=14: {}):
+            groups = trainer._iter_feature_matrices(days=90)
+            first_group, fm = next(groups)
+            assert first_group == next(iter(CATEGORY_GROUPS)) == "food_group"
+            assert trainer.pipeline.get_batch_daily_stats.call_count == 1
+            ref = weakref.ref(fm)
+            del fm
+            next(groups)
+            assert ref() is None    # 다음 그룹 생성 시 이전 그룹 행렬을 붙잡지 않음
+            assert trainer.pipeline.get_batch_daily_stats.call_count == 2
@@ -208,14 +208,14 @@ class TestHourlySalesDetailRepository:
         conn = repo._get_conn()
         cursor = conn.cursor()
         cursor.execute(
-            "SELECT ssv_response, item_count FROM raw_hourly_sales_detail "
+            "SELECT item_count FROM raw_hourly_sales_detail "
             "WHERE sales_date='2026-03-07' AND hour=12"
         )
         row = cursor.fetchone()
         conn.close()
         assert row is not None
-        assert 'raw_data' in row[0]
-        assert row[1] == 5
+        assert 'raw_data' in repo.get_raw('2026-03-07', 12)
+        assert row[0] == 5
 
     def test_save_raw_upsert(self, repo):
         """raw UPSERT: 동일 날짜+시간 재저장"""
@@ -225,13 +225,13 @@ class TestHourlySalesDetailRepository:
         conn = repo._get_conn()
         cursor = conn.cursor()
         cursor.execute(
-            "SELECT ssv_response, item_count FROM raw_hourly_sales_detail "
+            "SELECT item_count FROM raw_hourly_sales_detail "
             "WHERE sales_date='2026-03-07' AND hour=12"
         )
         row = cursor.fetchone()
         conn.close()
-        assert row[0] == 'second'
-        assert row[1] == 5
+        assert repo.get_raw('2026-03-07', 12) == 'second'
+        assert row[0] == 5
 
     def test_save_detail(self, repo, sample_items):
         """품목별 상세 저장"""
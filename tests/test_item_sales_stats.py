@@ -0,0 +1,310 @@
+"""item_sales_stats 집계 테이블 (item-sales-stats) 테스트
+
+- save_daily_sales 순차/일괄 경로의 증분 갱신 = daily_sales 전체 재구축
+- N일 윈도우 집계 = 기존 CASE WHEN 스캔 쿼리
+- 마지막 판매일 취소 / 집계행 없는 상품 → 해당 상품 재계산
+- verify() 불일치 검출, 리더(PreOrderEvaluator/DemandClassifier/DataProvider) 결과 동일
+"""
+
+import random
+import sqlite3
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.database.repos.item_sales_stats_repo import (
+    RING_DAYS,
+    ItemSalesStatsRepository,
+    build_item_sales_stats,
+    load_item_sales_stats,
+)
+from src.infrastructure.database.repos.sales_repo import SalesRepository
+from src.infrastructure.database.schema import STORE_SCHEMA
+
+STORE_ID = "46513"
+FIXED_NOW = "2026-03-01T00:00:00"
+TODAY = date.today()
+
+_STATS_DDL = next(ddl for ddl in STORE_SCHEMA if "item_sales_stats" in ddl)
+
+_TABLES = [
+    """CREATE TABLE daily_sales (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        store_id TEXT, collected_at TEXT NOT NULL, sales_date TEXT NOT NULL,
+        item_cd TEXT NOT NULL, mid_cd TEXT NOT NULL,
+        sale_qty INTEGER DEFAULT 0, ord_qty INTEGER DEFAULT 0,
+        buy_qty INTEGER DEFAULT 0, disuse_qty INTEGER DEFAULT 0,
+        stock_qty INTEGER DEFAULT 0, created_at TEXT NOT NULL,
+        promo_type TEXT DEFAULT '',
+        UNIQUE(store_id, sales_date, item_cd)
+    )""",
+    """CREATE TABLE products (
+        item_cd TEXT PRIMARY KEY, item_nm TEXT, mid_cd TEXT,
+        created_at TEXT, updated_at TEXT
+    )""",
+    """CREATE TABLE mid_categories (
+        mid_cd TEXT PRIMARY KEY, mid_nm TEXT, created_at TEXT, updated_at TEXT
+    )""",
+    """CREATE TABLE realtime_inventory (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        store_id TEXT, item_cd TEXT NOT NULL, item_nm TEXT,
+        stock_qty INTEGER DEFAULT 0, pending_qty INTEGER DEFAULT 0,
+        order_unit_qty INTEGER DEFAULT 1, is_available INTEGER DEFAULT 1,
+        is_cut_item INTEGER DEFAULT 0,
+        queried_at TEXT NOT NULL, created_at TEXT NOT NULL,
+        UNIQUE(store_id, item_cd)
+    )""",
+    """CREATE TABLE order_tracking (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        store_id TEXT, order_date TEXT, item_cd TEXT, item_nm TEXT, mid_cd TEXT,
+        delivery_type TEXT, order_qty INTEGER, remaining_qty INTEGER,
+        status TEXT, created_at TEXT, updated_at TEXT
+    )""",
+    """CREATE TABLE inventory_batches (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        item_cd TEXT NOT NULL, item_nm TEXT, mid_cd TEXT,
+        receiving_date TEXT NOT NULL, receiving_id INTEGER,
+        expiration_days INTEGER NOT NULL, expiry_date TEXT NOT NULL,
+        initial_qty INTEGER NOT NULL, remaining_qty INTEGER NOT NULL,
+        status TEXT DEFAULT 'active',
+        created_at TEXT NOT NULL, updated_at TEXT NOT NULL,
+        store_id TEXT, delivery_type TEXT DEFAULT NULL
+    )""",
+    "CREATE TABLE product_details (item_cd TEXT PRIMARY KEY, expiration_days INTEGER)",
+]
+
+
+def _make_db(path, with_stats=True):
+    conn = sqlite3.connect(str(path))
+    for ddl in _TABLES + ([_STATS_DDL] if with_stats else []):
+        conn.execute(ddl)
+    conn.commit()
+    conn.close()
+
+
+def _item(item_cd, sale, stock, mid_cd="015"):
+    return {
+        "ITEM_CD": item_cd, "ITEM_NM": f"상품{item_cd}", "MID_CD": mid_cd, "MID_NM": "과자",
+        "SALE_QTY": sale, "ORD_QTY": 0, "BUY_QTY": 0, "DISUSE_QTY": 0, "STOCK_QTY": stock,
+    }
+
+
+def _day(back):
+    return (TODAY - timedelta(days=back)).isoformat()
+
+
+def _save(repo, items, sales_date, bulk=False):
+    with patch.object(SalesRepository, "_now", return_value=FIXED_NOW):
+        return repo.save_daily_sales(
+            items, sales_date, store_id=STORE_ID, collected_at=FIXED_NOW,
+            enable_validation=False, bulk=bulk,
+        )
+
+
+def _history(seed=7, days=120, items=("A", "B", "C", "D")):
+    """(sales_date, [item dict]) 오래된 순 — 결측일/품절/재고 NULL 포함"""
+    rng = random.Random(seed)
+    history = []
+    for back in range(days, -1, -1):
+        rows = [
+            _item(code, rng.choice([0, 0, 1, 2, 5]), rng.choice([0, 3, 8, None]))
+            for code in items if rng.random() > 0.2
+        ]
+        history.append((_day(back), rows))
+    return history
+
+
+@pytest.fixture
+def store_db(tmp_path):
+    db = tmp_path / "store.db"
+    _make_db(db)
+    return db
+
+
+def _stats_snapshot(db):
+    conn = sqlite3.connect(str(db))
+    try:
+        return conn.execute(
+            "SELECT item_cd, first_date, last_date, last_sale_date, record_days, "
+            "sale_ring, stock_ring FROM item_sales_stats ORDER BY item_cd"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+class TestIncremental:
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("bulk", [False, True])
+    def test_incremental_equals_rebuild(self, store_db, bulk):
+        repo = SalesRepository(db_path=store_db)
+        for sales_date, rows in _history():
+            _save(repo, rows, sales_date, bulk=bulk)
+        # 재수집 (과거 일자 갱신 + 중복 행)
+        _save(repo, [_item("A", 9, 1), _item("A", 4, 0), _item("B", 0, 0)], _day(10), bulk=bulk)
+
+        stats_repo = ItemSalesStatsRepository(db_path=store_db)
+        assert stats_repo.verify(STORE_ID) == []
+        incremental = _stats_snapshot(store_db)
+        assert stats_repo.rebuild(STORE_ID) == 4
+        assert _stats_snapshot(store_db) == incremental
+
+    @pytest.mark.unit
+    def test_last_sale_cancel_and_missing_row(self, store_db):
+        repo = SalesRepository(db_path=store_db)
+        _save(repo, [_item("A", 3, 5)], _day(5))
+        _save(repo, [_item("A", 2, 5)], _day(2))
+        stats_repo = ItemSalesStatsRepository(db_path=store_db)
+        assert stats_repo.get_stats(["A"], STORE_ID)["A"].last_sale_date == _day(2)
+
+        # 마지막 판매일의 판매 취소 → 이전 판매일로 되돌림
+        _save(repo, [_item("A", 0, 5)], _day(2))
+        assert stats_repo.get_stats(["A"], STORE_ID)["A"].last_sale_date == _day(5)
+
+        # 집계행 삭제(테이블 도입 전 이력) → 다음 저장 시 상품 재계산
+        conn = sqlite3.connect(str(store_db))
+        conn.execute("DELETE FROM item_sales_stats")
+        conn.commit()
+        conn.close()
+        _save(repo, [_item("A", 1, 0)], _day(1))
+        stats = stats_repo.get_stats(["A"], STORE_ID)["A"]
+        assert (stats.first_date, stats.record_days, stats.data_span_days) == (_day(5), 3, 5)
+        assert stats_repo.verify(STORE_ID) == []
+
+    @pytest.mark.unit
+    def test_without_table_saves_normally(self, tmp_path):
+        db = tmp_path / "legacy.db"
+        _make_db(db, with_stats=False)
+        result = _save(SalesRepository(db_path=db), [_item("A", 1, 1)], _day(1))
+        assert result["total"] == 1
+
+    @pytest.mark.unit
+    def test_verify_reports_drift(self, store_db):
+        repo = SalesRepository(db_path=store_db)
+        for sales_date, rows in _history(days=20):
+            _save(repo, rows, sales_date)
+        conn = sqlite3.connect(str(store_db))
+        conn.execute("UPDATE daily_sales SET sale_qty = sale_qty + 7 WHERE item_cd = 'B'")
+        conn.commit()
+        conn.close()
+
+        stats_repo = ItemSalesStatsRepository(db_path=store_db)
+        mismatches = stats_repo.verify(STORE_ID)
+        assert {m["item_cd"] for m in mismatches} == {"B"}
+        stats_repo.rebuild(STORE_ID)
+        assert stats_repo.verify(STORE_ID) == []
+
+
+class TestWindow:
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("days", [7, 14, 30, 60, 90])
+    def test_window_matches_scan(self, store_db, days):
+        repo = SalesRepository(db_path=store_db)
+        for sales_date, rows in _history(seed=11):
+            _save(repo, rows, sales_date)
+
+        conn = sqlite3.connect(str(store_db))
+        try:
+            stats = load_item_sales_stats(conn, ["A", "B", "C", "D"], STORE_ID)
+            ref = conn.execute("SELECT date('now')").fetchone()[0]
+            for item_cd, item_stats in stats.items():
+                assert item_stats.covers(days, ref)
+                row = conn.execute(
+                    """SELECT COUNT(*), COALESCE(SUM(sale_qty), 0),
+                              SUM(CASE WHEN sale_qty > 0 THEN 1 ELSE 0 END),
+                              SUM(CASE WHEN stock_qty = 0 THEN 1 ELSE 0 END),
+                              SUM(CASE WHEN stock_qty > 0 THEN 1 ELSE 0 END),
+                              SUM(CASE WHEN stock_qty > 0 AND sale_qty > 0 THEN 1 ELSE 0 END)
+                       FROM daily_sales WHERE item_cd = ? AND store_id = ?
+                       AND sales_date >= date('now', '-' || ? || ' days')""",
+                    (item_cd, STORE_ID, days),
+                ).fetchone()
+                assert tuple(item_stats.window(days, ref)) == tuple(v or 0 for v in row)
+        finally:
+            conn.close()
+
+    @pytest.mark.unit
+    def test_covers_only_when_ring_holds_window(self, store_db):
+        conn = sqlite3.connect(str(store_db))
+        conn.executemany(
+            "INSERT INTO daily_sales (store_id, collected_at, sales_date, item_cd, mid_cd, "
+            "sale_qty, stock_qty, created_at) VALUES (?, ?, ?, 'A', '015', 1, 1, ?)",
+            [(STORE_ID, FIXED_NOW, _day(back), FIXED_NOW) for back in (300, 150)],
+        )
+        stats = build_item_sales_stats(conn, STORE_ID)["A"]
+        conn.close()
+        assert stats.ring_start == date.fromisoformat(_day(150 + RING_DAYS - 1))
+        # 마지막 기록 이후 윈도우는 링으로 계산 가능 (기록 없음)
+        assert stats.covers(30, TODAY.isoformat())
+        assert stats.window(30, TODAY.isoformat()).record_days == 0
+        # 링 시작(240일 전) 이전 기록이 윈도우에 걸림 → 호출자는 스캔 폴백
+        assert not stats.covers(260, TODAY.isoformat())
+
+
+class TestReaders:
+
+    @pytest.fixture
+    def filled_db(self, store_db):
+        repo = SalesRepository(db_path=store_db)
+        for sales_date, rows in _history(seed=5, days=70, items=("A", "B", "C")):
+            _save(repo, rows, sales_date)
+        return store_db
+
+    def _connect(self, db):
+        conn = sqlite3.connect(str(db))
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _without_stats(self, db):
+        conn = self._connect(db)
+        conn.execute("DELETE FROM item_sales_stats")
+        conn.commit()
+        return conn
+
+    @pytest.mark.unit
+    def test_pre_order_evaluator_stats_match_scan(self, filled_db):
+        from src.prediction.pre_order_evaluator import PreOrderEvaluator
+
+        evaluator = PreOrderEvaluator.__new__(PreOrderEvaluator)
+        evaluator.store_id = STORE_ID
+        codes = ["A", "B", "C", "Z"]
+
+        conn = self._connect(filled_db)
+        with patch(
+            "src.prediction.pre_order_evaluator.load_item_sales_stats",
+            wraps=load_item_sales_stats,
+        ) as loader:
+            fast = evaluator._batch_load_daily_sales_stats(codes, conn, days=14)
+        conn.close()
+        assert loader.called
+        scanned = evaluator._batch_load_daily_sales_stats(codes, self._without_stats(filled_db), days=14)
+        assert fast == scanned
+        assert fast["Z"] == {"daily_avg": 0.0, "stockout_freq": 0.0, "sell_day_ratio": 0.0}
+
+    @pytest.mark.unit
+    def test_demand_classifier_stats_match_scan(self, filled_db):
+        from src.prediction.demand_classifier import DemandClassifier
+
+        classifier = DemandClassifier.__new__(DemandClassifier)
+        classifier.store_id = STORE_ID
+        codes = ["A", "B", "C", "Z"]
+        with patch("src.infrastructure.database.connection.DBRouter.get_store_connection",
+                   side_effect=lambda _sid: sqlite3.connect(str(filled_db))):
+            fast = classifier._query_sell_stats_batch(codes)
+            self._without_stats(filled_db).close()
+            scanned = classifier._query_sell_stats_batch(codes)
+        assert fast == scanned and set(fast) == {"A", "B", "C"}
+
+    @pytest.mark.unit
+    def test_data_span_days_from_stats(self, filled_db):
+        from src.prediction.data_provider import PredictionDataProvider
+
+        provider = PredictionDataProvider.__new__(PredictionDataProvider)
+        provider.store_id = STORE_ID
+        provider._sales_matrix = None
+        provider._get_connection = lambda: sqlite3.connect(str(filled_db))
+        fast = provider._get_data_span_days("A")
+        self._without_stats(filled_db).close()
+        assert fast == provider._get_data_span_days("A") > 60
@@ -0,0 +1,227 @@
+"""디저트/음료 판단 공용 지표 엔진 (lifecycle-metrics) 테스트
+
+- LifecycleMetricsEngine: 첫 입고일 우선순위, 행사, 기간/주별/월별 집계 ↔ 단건 SQL
+- Decision 서비스 run(): 상품 수와 무관한 DB 연결 수
+"""
+
+import random
+import sqlite3
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.application.services.beverage_decision_service import BeverageDecisionService
+from src.application.services.dessert_decision_service import DessertDecisionService
+from src.application.services.lifecycle_metrics import LifecycleMetricsEngine
+from src.infrastructure.database.connection import DBRouter
+
+REF = date(2026, 3, 4)
+
+
+def _d(days_ago):
+    return (REF - timedelta(days=days_ago)).isoformat()
+
+
+@pytest.fixture
+def dbs(tmp_path):
+    common, store = tmp_path / "common.db", tmp_path / "store.db"
+    conn = sqlite3.connect(common)
+    conn.execute("CREATE TABLE products (item_cd TEXT PRIMARY KEY, item_nm TEXT, "
+                 "mid_cd TEXT, created_at TEXT)")
+    conn.execute("CREATE TABLE product_details (item_cd TEXT PRIMARY KEY, "
+                 "expiration_days INTEGER, small_nm TEXT, sell_price INTEGER, margin_rate REAL)")
+    conn.commit()
+    conn.close()
+    conn = sqlite3.connect(store)
+    conn.execute("""CREATE TABLE daily_sales (
+        id INTEGER PRIMARY KEY, sales_date TEXT, item_cd TEXT, mid_cd TEXT,
+        sale_qty INTEGER, ord_qty INTEGER, buy_qty INTEGER, disuse_qty INTEGER,
+        promo_type TEXT DEFAULT '', UNIQUE(sales_date, item_cd))""")
+    conn.execute("CREATE TABLE detected_new_products (id INTEGER PRIMARY KEY, "
+                 "item_cd TEXT, first_receiving_date TEXT)")
+    conn.execute("CREATE TABLE promotions (id INTEGER PRIMARY KEY, item_cd TEXT, "
+                 "promo_type TEXT, start_date TEXT, end_date TEXT)")
+    conn.commit()
+    conn.close()
+
+    connects = []
+    real_connect = sqlite3.connect
+
+    def _connect(*args, **kwargs):
+        connects.append(args[0])
+        return real_connect(*args, **kwargs)
+
+    with patch.object(DBRouter, "get_store_db_path", lambda store_id: store), \
+            patch.object(DBRouter, "get_common_db_path", lambda: common), \
+            patch("sqlite3.connect", _connect):
+        yield common, store, connects
+
+
+def _exec(path, sql, rows):
+    conn = sqlite3.connect(path)
+    conn.executemany(sql, rows)
+    conn.commit()
+    conn.close()
+
+
+def _sales(store, rows):
+    """rows: (item_cd, days_ago, sale, disuse, ord, buy, promo_type, mid_cd)"""
+    _exec(store, "INSERT INTO daily_sales (item_cd, sales_date, sale_qty, disuse_qty, ord_qty, "
+                 "buy_qty, promo_type, mid_cd) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+          [(r[0], _d(r[1])) + tuple(r[2:]) for r in rows])
+
+
+class TestLifecycleMetricsEngine:
+
+    @pytest.mark.unit
+    def test_first_receiving_priority(self, dbs):
+        common, store, _ = dbs
+        _exec(store, "INSERT INTO detected_new_products (item_cd, first_receiving_date) "
+                     "VALUES (?, ?)",
+              [("DET", "2025-12-01"), ("DET", "2025-11-01"), ("NULLDET", None),
+               ("NULLDET", "2025-10-01")])
+        _sales(store, [
+            ("DET", 10, 1, 0, 0, 0, "", "014"),
+            ("NULLDET", 5, 2, 0, 0, 0, "", "014"),
+            ("BUY", 7, 0, 0, 0, 3, "", "014"),
+            ("OTHERMID", 7, 0, 0, 0, 3, "", "999"),
+        ])
+        _exec(common, "INSERT INTO products (item_cd, created_at) VALUES (?, ?)",
+              [("BULK", "2026-01-25 09:00:00"), ("PROD", "2025-06-01 09:00:00"),
+               ("OTHERMID", "2025-07-01")])
+
+        engine = LifecycleMetricsEngine(
+            "S", ["DET", "NULLDET", "BUY", "OTHERMID", "BULK", "PROD", "NONE"],
+            REF.isoformat(), buy_mid_cd="014", bulk_registration_dates={"2026-01-25"},
+        )
+        assert engine.first_receiving("DET") == ("2025-11-01", "detected_new_products")
+        # NULL 행이 있으면 기존 ORDER BY ASC LIMIT 1 처럼 다음 소스로
+        assert engine.first_receiving("NULLDET") == (_d(5), "daily_sales_sold")
+        assert engine.first_receiving("BUY") == (_d(7), "daily_sales_bought")
+        assert engine.first_receiving("OTHERMID") == ("2025-07-01", "products")
+        assert engine.first_receiving("BULK") == ("2026-01-25", "products_bulk")
+        assert engine.first_receiving("PROD") == ("2025-06-01", "products")
+        assert engine.first_receiving("NONE") == (None, "none")
+
+    @pytest.mark.unit
+    def test_promotions(self, dbs):
+        _, store, _ = dbs
+        today = date.today()
+        _exec(store, "INSERT INTO promotions (item_cd, promo_type, start_date, end_date) "
+                     "VALUES (?, ?, ?, ?)",
+              [("ON", "1+1", (today - timedelta(days=2)).isoformat(), today.isoformat()),
+               ("OFF", "1+1", "2020-01-01", "2020-01-31")])
+        _sales(store, [
+            ("P1", 20, 1, 0, 0, 0, "1+1", "044"),
+            ("P1", 30, 1, 0, 0, 0, "2+1", "044"),
+            ("P1", 25, 1, 0, 0, 0, "1+1", "044"),
+            ("P2", 9, 1, 0, 0, 0, "할인", "044"),
+            ("P2", 12, 1, 0, 0, 0, "1+1", "044"),
+            ("P2", 5, 1, 0, 0, 0, "", "044"),
+        ])
+        engine = LifecycleMetricsEngine("S", ["ON", "OFF", "P1", "P2"], REF.isoformat())
+        assert engine.has_active_promotion("ON")
+        assert not engine.has_active_promotion("OFF")
+        assert engine.last_promotion("P1") == ("1+1", _d(20))
+        assert engine.last_promotion("P2") == ("할인", _d(9))
+        assert engine.last_promotion("ON") is None
+
+    @pytest.mark.unit
+    def test_aggregates_match_per_item_sql(self, dbs):
+        _, store, _ = dbs
+        rng = random.Random(7)
+        items = [f"I{i:02d}" for i in range(12)]
+        rows = []
+        for item in items[:-1]:
+            for days_ago in rng.sample(range(0, 130), 70):
+                rows.append((item, days_ago, rng.choice([0, 1, 3, None]),
+                             rng.choice([0, 1, None]), rng.choice([0, 2]), 0, "", "014"))
+        _sales(store, rows)
+        engine = LifecycleMetricsEngine("S", items, REF.isoformat(), history_days=120)
+
+        conn = sqlite3.connect(store)
+
+        def one(sql, params):
+            return tuple(conn.execute(sql, params).fetchone())
+
+        for item in items:
+            for start, end in ((_d(7), _d(0)), (_d(60), _d(31)), (_d(14), _d(0))):
+                assert engine.period_totals(item, start, end) == one(
+                    "SELECT COALESCE(SUM(sale_qty), 0), COALESCE(SUM(disuse_qty), 0), "
+                    "COALESCE(SUM(ord_qty), 0) FROM daily_sales "
+                    "WHERE item_cd = ? AND sales_date >= ? AND sales_date <= ?",
+                    (item, start, end))
+            for days, count in ((7, 8), (30, 4)):
+                expected = [
+                    one("SELECT COALESCE(SUM(sale_qty), 0), COALESCE(SUM(disuse_qty), 0), "
+                        "COALESCE(SUM(ord_qty), 0) FROM daily_sales "
+                        "WHERE item_cd = ? AND sales_date > ? AND sales_date <= ?",
+                        (item, _d(days * (w + 1)), _d(days * w)))
+                    for w in range(count)
+                ]
+                assert engine.window_totals(item, days, count) == expected
+
+        total, n = one("SELECT COALESCE(SUM(sale_qty), 0), COUNT(DISTINCT item_cd) "
+                       "FROM daily_sales WHERE sales_date >= ? AND sales_date <= ?",
+                       (_d(30), _d(0)))
+        assert engine.average_sale(items, _d(30), _d(0)) == round(total / n, 2)
+        assert items[-1] not in engine.period_sales(_d(30), _d(0))
+        conn.close()
+
+        with pytest.raises(ValueError):
+            engine.period_totals(items[0], _d(121), _d(0))
+
+
+def _service(cls):
+    service = cls.__new__(cls)
+    service.store_id = "S"
+    service.decision_repo = MagicMock()
+    service.decision_repo.save_decisions_batch.side_effect = len
+    service.decision_repo.batch_update_operator_action.return_value = []
+    # 자동확정은 STOP 상품 대상 별도 경로 — 판단 루프 연결 수만 비교
+    service._auto_confirm_zero_sales = lambda results: []
+    service._auto_confirm_high_waste = lambda results: []
+    return service
+
+
+def _seed_category(common, store, mid_cd, small_nm, count, offset):
+    rng = random.Random(offset)
+    codes = [f"88{offset + i:011d}" for i in range(count)]
+    _exec(common, "INSERT INTO products VALUES (?, ?, ?, ?)",
+          [(c, f"상품{c[-4:]}", mid_cd, "2025-06-01") for c in codes])
+    _exec(common, "INSERT INTO product_details VALUES (?, ?, ?, ?, ?)",
+          [(c, 3, small_nm, 2000, 30.0) for c in codes])
+    _sales(store, [
+        (c, d, rng.choice([0, 1, 2]), rng.choice([0, 0, 1]), 2, 1, "", mid_cd)
+        for c in codes for d in range(0, 100, 3)
+    ])
+
+
+class TestDecisionServicesUseEngine:
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("cls,mid_cd,small_nm", [
+        (DessertDecisionService, "014", "냉장디저트"),
+        (BeverageDecisionService, "044", "커피"),
+    ])
+    def test_connections_do_not_grow_with_items(self, dbs, cls, mid_cd, small_nm):
+        common, store, connects = dbs
+        _seed_category(common, store, mid_cd, small_nm, 5, 0)
+
+        service = _service(cls)
+        connects.clear()
+        small = service.run(reference_date=REF.isoformat())
+        few = len(connects)
+
+        _seed_category(common, store, mid_cd, small_nm, 40, 100)
+        service = _service(cls)
+        connects.clear()
+        large = service.run(reference_date=REF.isoformat())
+
+        assert small["total_items"] == 5 and large["total_items"] == 45
+        assert len(connects) == few
+        result = large["results"][0]
+        assert result["first_receiving_source"].value == "daily_sales_sold"
+        assert result["total_sale_qty"] > 0 and result["category_avg_sale_qty"] > 0
+        assert service._metrics is None
@@ -0,0 +1,170 @@
+"""LogIndex (log-index) 테스트
+
+- 바이트 offset 기반 증분 적재 (새 라인만 파싱, 미완결 마지막 줄 재처리)
+- 로테이션 감지 시 이전 파일 꼬리 적재 후 새 파일 처음부터
+- LogParser 인덱스 경로 ↔ 스트리밍 경로 결과 동일성
+"""
+
+import pytest
+
+from src.analysis.log_index import INDEX_FILENAME, LogIndex
+from src.analysis.log_parser import LogParser
+
+
+SAMPLE_LOG = """2026-02-20 23:59:00 | INFO     | __main__ | Previous day log
+2026-02-21 07:00:00 | INFO     | __main__ | ============================================================
+2026-02-21 07:00:01 | INFO     | src.scheduler.daily_job | Optimized flow started
+2026-02-21 07:00:01 | INFO     | src.scheduler.daily_job | Dates: 2026-02-20, 2026-02-21
+2026-02-21 07:00:01 | INFO     | src.scheduler.daily_job | Auto-order: True
+2026-02-21 07:00:02 | INFO     | src.scheduler.daily_job | [Phase 1] Data Collection
+2026-02-21 07:00:05 | INFO     | src.collectors.sales_collector | 수집 완료: 150건
+2026-02-21 07:00:10 | INFO     | src.scheduler.daily_job | DB saved: 150 items
+2026-02-21 07:02:30 | INFO     | src.scheduler.daily_job | [Phase 1.1] Receiving Collection
+2026-02-21 07:02:35 | INFO     | src.collectors.receiving_collector | 입고 수집 완료
+2026-02-21 07:02:50 | INFO     | src.scheduler.daily_job | [Phase 1.15] Waste Slip Collection (전날+당일)
+2026-02-21 07:03:00 | WARNING  | src.collectors.waste_slip_collector | 전표 없음
+2026-02-21 07:03:10 | INFO     | src.scheduler.daily_job | [Phase 2] Auto Order
+2026-02-21 07:03:15 | INFO     | src.order.auto_order | 발주 시작 store=46513
+2026-02-21 07:05:00 | ERROR    | src.order.auto_order | 입력 실패: 발주 불가
+2026-02-21 07:05:05 | ERROR    | src.order.auto_order | 세션 만료
+2026-02-21 07:06:00 | INFO     | src.scheduler.daily_job | [Phase 3] Fail Reason Collection
+2026-02-21 07:06:10 | INFO     | src.scheduler.daily_job | 완료
+2026-02-21 18:00:00 | INFO     | src.scheduler.daily_job | Optimized flow started
+2026-02-21 18:00:01 | INFO     | src.scheduler.daily_job | [Phase 1] Data Collection
+2026-02-21 18:00:10 | INFO     | src.scheduler.daily_job | 수집 완료
+2026-02-22 07:00:00 | INFO     | __main__ | Next day start
+""".strip()
+
+
+def _line(ts, level, module, message):
+    return f"{ts} | {level:<8} | {module} | {message}"
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    (tmp_path / "bgf_auto.log").write_text(SAMPLE_LOG + "\n", encoding="utf-8")
+    return tmp_path
+
+
+def _messages(index, key="main"):
+    return [e.message for e in index.entries(key, limit=1000)]
+
+
+class TestSync:
+
+    @pytest.mark.unit
+    def test_incremental_sync_reads_only_new_lines(self, log_dir):
+        index = LogIndex(log_dir)
+        total = len(SAMPLE_LOG.splitlines())
+        assert index.sync(["main"]) == total
+        state = index.file_state("main")
+        assert state["line_count"] == total
+        assert state["offset"] == (log_dir / "bgf_auto.log").stat().st_size
+        assert (log_dir / INDEX_FILENAME).exists()
+
+        assert index.sync(["main"]) == 0
+        with open(log_dir / "bgf_auto.log", "a", encoding="utf-8") as f:
+            f.write(_line("2026-02-22 07:00:05", "ERROR", "src.order.auto_order", "재시도 실패") + "\n")
+        assert index.sync(["main"]) == 1
+        assert _messages(index)[-1] == "재시도 실패"
+        assert index.file_state("main")["line_count"] == total + 1
+
+    @pytest.mark.unit
+    def test_unterminated_last_line_is_provisional(self, tmp_path):
+        path = tmp_path / "bgf_auto.log"
+        path.write_text(_line("2026-02-21 07:00:00", "INFO", "m", "부분"), encoding="utf-8")
+        index = LogIndex(tmp_path)
+        index.sync(["main"])
+        assert _messages(index) == ["부분"]
+        assert index.file_state("main")["offset"] == 0
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(" 완료\n" + _line("2026-02-21 07:00:01", "INFO", "m", "다음") + "\n")
+        index.sync(["main"])
+        assert _messages(index) == ["부분 완료", "다음"]
+        assert [e.line_number for e in index.entries("main")] == [1, 2]
+
+    @pytest.mark.unit
+    def test_rotation_ingests_tail_then_new_file(self, log_dir):
+        index = LogIndex(log_dir)
+        index.sync(["main"])
+        path = log_dir / "bgf_auto.log"
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(_line("2026-02-22 23:59:00", "INFO", "m", "로테이션 직전") + "\n")
+        path.rename(log_dir / "bgf_auto_2026-02-22.log")
+        path.write_text(_line("2026-02-23 00:00:01", "INFO", "m", "새 파일") + "\n", encoding="utf-8")
+
+        assert index.sync(["main"]) == 2
+        assert _messages(index)[-2:] == ["로테이션 직전", "새 파일"]
+        assert index.file_state("main")["line_count"] == 1
+
+    @pytest.mark.unit
+    def test_retention_relative_to_latest_log(self, log_dir):
+        index = LogIndex(log_dir, retention_days=1)
+        with open(log_dir / "bgf_auto.log", "a", encoding="utf-8") as f:
+            f.write(_line("2026-02-22 12:00:00", "INFO", "m", "최신") + "\n")
+        index.sync(["main"])
+        messages = _messages(index)
+        assert "Previous day log" not in messages
+        assert "Next day start" in messages and "최신" in messages
+
+    @pytest.mark.unit
+    def test_search_short_keyword_and_like_escape(self, log_dir):
+        index = LogIndex(log_dir)
+        index.sync(["main"])
+        assert len(index.search("main", "실패")) == 1          # 3자 미만 → LIKE
+        assert len(index.search("main", "Optimized flow")) == 2
+        assert index.search("main", "100%") == []
+
+
+class TestLogParserParity:
+
+    @pytest.fixture
+    def parsers(self, log_dir):
+        return LogParser(log_dir=log_dir), LogParser(log_dir=log_dir, use_index=False)
+
+    @staticmethod
+    def _keys(entries):
+        return [(e.line_number, e.timestamp, e.level, e.module, e.message) for e in entries]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("kwargs", [
+        {"keyword": "수집"},
+        {"keyword": "세션"},
+        {"keyword": "optimized FLOW"},
+        {"keyword": "Optimized", "case_sensitive": True},
+        {"keyword": "optimized", "case_sensitive": True},
+        {"keyword": r"Phase 1\.\d+", "regex": True},
+        {"keyword": "수집", "start_date": "2026-02-21", "end_date": "2026-02-21"},
+    ])
+    def test_search(self, parsers, kwargs):
+        indexed, streamed = parsers
+        assert self._keys(indexed.search(**kwargs)) == self._keys(streamed.search(**kwargs))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("level", ["ERROR", "WARNING", "INFO"])
+    def test_filter_by_level(self, parsers, level):
+        indexed, streamed = parsers
+        assert self._keys(indexed.filter_by_level(level=level)) == \
+            self._keys(streamed.filter_by_level(level=level))
+
+    @pytest.mark.unit
+    def test_sessions_and_phase_logs(self, parsers):
+        indexed, streamed = parsers
+        a = indexed.list_sessions("2026-02-21")
+        b = streamed.list_sessions("2026-02-21")
+        assert [(s.start_time, s.end_time, s.overall_status, s.total_errors) for s in a] == \
+            [(s.start_time, s.end_time, s.overall_status, s.total_errors) for s in b]
+        assert [[(p.phase_id, p.status) for p in s.phases] for s in a] == \
+            [[(p.phase_id, p.status) for p in s.phases] for s in b]
+
+        for phase_id in ("1", "1.15", "2", "3"):
+            assert self._keys(indexed.get_phase_logs("2026-02-21", phase_id)) == \
+                self._keys(streamed.get_phase_logs("2026-02-21", phase_id))
+
+    @pytest.mark.unit
+    def test_falls_back_to_streaming_on_index_error(self, parsers, monkeypatch):
+        indexed, streamed = parsers
+        monkeypatch.setattr(LogIndex, "sync", lambda self, keys: 1 / 0)
+        assert self._keys(indexed.search("수집")) == self._keys(streamed.search("수집"))
+        assert indexed.use_index is False
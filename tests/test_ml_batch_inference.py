@@ -0,0 +1,153 @@
+"""predict_batch ML 배치 추론 2-pass (ml-batch-inference) 테스트
+
+- 2-pass 결과 = SKU별 predict (predict_dual) 결과
+- 모델(카테고리 그룹/small_cd)당 predict 1회
+- 재개 시 SKU 단위 인스턴스 상태 복원, 일괄 추론 실패 시 SKU별 폴백
+- 실제 _ml_ensemble_steps 블렌딩 경로
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.prediction import improved_predictor as ip
+from src.prediction.improved_predictor import ImprovedPredictor
+from src.prediction.ml.model import MLPredictor
+
+
+class _SumModel:
+    """행 합계 × scale 예측 (호출 횟수 기록)"""
+
+    def __init__(self, scale):
+        self.scale = scale
+        self.calls = 0
+
+    def predict(self, X):
+        self.calls += 1
+        return np.asarray(X).sum(axis=1) * self.scale
+
+
+def _ml(tmp_path):
+    ml = MLPredictor(model_dir=str(tmp_path))
+    ml.models = {"food_group": _SumModel(1.0), "general_group": _SumModel(0.5)}
+    ml.group_models = {"small_001A": _SumModel(2.0), "mid_072": _SumModel(3.0)}
+    ml._loaded = True
+    ml._group_loaded = True
+    return ml
+
+
+ITEMS = {
+    # item_cd: (mid_cd, small_cd, data_days, order_qty)
+    "F1": ("001", "001A", 30, 4),
+    "F2": ("001", "001B", 90, 2),
+    "G1": ("015", None, 45, 3),
+    "T1": ("072", "072X", 10, 1),
+    "Z0": ("015", None, 45, 0),  # ML 대상 아님 (발주량 0)
+}
+
+
+def _fake_steps(self, item_cd, target_date=None, pending_qty=None):
+    """predict.steps 대역: ML 요청 전후로 SKU 단위 인스턴스 상태를 사용"""
+    mid_cd, small_cd, data_days, order_qty = ITEMS[item_cd]
+    self._stage_upstream = {"item": item_cd}
+    ml_pred = None
+    if order_qty > 0:
+        features = np.array([order_qty, data_days / 10.0, len(item_cd)], dtype=float)
+        ml_pred = yield (features, mid_cd, small_cd, data_days)
+    return (item_cd, self._stage_upstream["item"], ml_pred)
+
+
+def _predictor(tmp_path):
+    p = ImprovedPredictor.__new__(ImprovedPredictor)
+    p._ml_predictor = _ml(tmp_path)
+    return p
+
+
+def _sequential(p):
+    return [ip._run_ml_steps(p, _fake_steps(p, cd)) for cd in ITEMS]
+
+
+def _two_pass(p):
+    return ip._predict_items_two_pass(p, list(ITEMS), None, {}, steps_fn=_fake_steps)
+
+
+class TestTwoPass:
+
+    @pytest.mark.unit
+    def test_matches_per_item_predict(self, tmp_path):
+        p = _predictor(tmp_path)
+        sequential = _sequential(p)
+        batched = _two_pass(p)
+        assert batched == sequential
+        assert batched[-1] == ("Z0", "Z0", None)
+        assert all(r[1] == r[0] for r in batched)  # SKU 상태 복원
+
+    @pytest.mark.unit
+    def test_one_predict_call_per_model(self, tmp_path):
+        p = _predictor(tmp_path)
+        _two_pass(p)
+        ml = p._ml_predictor
+        assert ml.models["food_group"].calls == 1
+        assert ml.models["general_group"].calls == 1
+        assert ml.group_models["small_001A"].calls == 1
+        assert ml.group_models["mid_072"].calls == 1
+
+    @pytest.mark.unit
+    def test_batch_failure_falls_back_per_item(self, tmp_path, monkeypatch):
+        p = _predictor(tmp_path)
+        expected = _sequential(p)
+        monkeypatch.setattr(
+            p._ml_predictor, "predict_dual_batch",
+            MagicMock(side_effect=RuntimeError("boom")),
+        )
+        assert _two_pass(p) == expected
+
+    @pytest.mark.unit
+    def test_enabled_only_for_real_predictor(self, tmp_path, monkeypatch):
+        p = _predictor(tmp_path)
+        assert ip._ml_batch_enabled(p) is True
+        monkeypatch.setattr("src.settings.constants.ML_BATCH_INFERENCE_ENABLED", False)
+        assert ip._ml_batch_enabled(p) is False
+        assert ip._ml_batch_enabled(MagicMock(spec=ImprovedPredictor)) is False
+
+
+class TestEnsembleSteps:
+
+    def _make(self):
+        p = ImprovedPredictor.__new__(ImprovedPredictor)
+        p._ml_predictor = MagicMock()
+        p._association_adjuster = None
+        p._promo_adjuster = None
+        p._receiving_stats_cache = {}
+        p._stacking = None
+        p.store_id = "46704"
+        p.db_path = ":memory:"
+        return p
+
+    @pytest.mark.unit
+    @patch("src.prediction.ml.feature_builder.MLFeatureBuilder.build_features")
+    @patch("src.prediction.ml.feature_builder.MLFeatureBuilder.calc_hourly_ratios")
+    @patch("src.prediction.ml.data_pipeline.MLDataPipeline")
+    def test_yield_then_blend_equals_inline(self, _pipeline, _hourly, mock_build):
+        mock_build.return_value = np.ones(5)
+        p = self._make()
+        p._ml_predictor.predict_dual.return_value = 6.0
+        args = ("item1", {"item_nm": "t"}, "001", 3, 90, date(2026, 3, 1), 2, 0, 1.0, None)
+        with patch.object(p, "_get_ml_weight", return_value=0.5), \
+                patch.object(p, "_get_holiday_context", return_value={}), \
+                patch.object(p, "_get_temperature_for_date", return_value=None), \
+                patch.object(p, "_get_temperature_delta", return_value=None), \
+                patch.object(p, "_get_disuse_rate", return_value=0.0), \
+                patch.object(p, "_get_rolling_bias", return_value=1.0), \
+                patch.object(p, "coefficient_adjuster", create=True) as coef:
+            coef._load_payday_windows.return_value = (None, None)
+            inline = p._apply_ml_ensemble(*args)
+
+            steps = ImprovedPredictor._apply_ml_ensemble.steps(p, *args)
+            request = next(steps)
+            assert request[1:] == ("001", None, 90)
+            with pytest.raises(StopIteration) as stop:
+                steps.send(6.0)
+        assert stop.value.value == inline == (4, "ensemble_50")  # 0.5*3 + 0.5*(6+1-2)
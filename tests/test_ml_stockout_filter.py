@@ -6,7 +6,7 @@ Design Reference: ML 학습/추론 시 stock_qty=0 AND sale_qty=0인 날의
 테스트 항목:
 1. 설정 (2)
 2. Feature Builder 보정 (5)
-3. Trainer Y값 보정 (3)
+3. Trainer Y값 보정 (4)
 4. Trainer Lag 피처 보정 (3)
 5. 통합 (2)
 6. 그룹 모델 Y값 보정 (1)
@@ -175,109 +175,93 @@ class TestFeatureBuilderStockout:
 # 3. Trainer Y값 보정
 # ──────────────────────────────────────────────────────────────
 
-class TestTrainerYValueImputation:
-    def _make_trainer_mock(self):
-        """MLTrainer 인스턴스를 mock으로 생성."""
-        from src.prediction.ml.trainer import MLTrainer
-        trainer = MagicMock(spec=MLTrainer)
-        trainer.store_id = "46513"
-        trainer.pipeline = MagicMock()
-        trainer._prepare_training_data = MLTrainer._prepare_training_data.__get__(trainer)
-        return trainer
+def _training_matrix(daily_sales, mid_cd="049", days=30):
+    """MLTrainer 학습 경로(_iter_feature_matrices)로 단일 상품 학습 행렬 생성.
+
+    _fit_group_ensemble이 학습하는 X/y와 같은 행렬을 반환한다.
+    """
+    from src.prediction.ml.feature_builder import MLFeatureBuilder
+    from src.prediction.ml.trainer import MLTrainer
+
+    trainer = MagicMock(spec=MLTrainer)
+    trainer.store_id = "46513"
+    trainer.pipeline = MagicMock()
+    trainer.pipeline.get_active_items.return_value = [
+        {"item_cd": "TEST001", "mid_cd": mid_cd, "data_days": len(daily_sales)}
+    ]
+    trainer.pipeline.get_batch_daily_stats.side_effect = lambda codes, d: {
+        cd: daily_sales for cd in codes
+    }
+    trainer.pipeline.get_items_meta.return_value = {"TEST001": {}}
+    trainer.pipeline.get_external_factors.return_value = {}
+    trainer.pipeline._get_conn.side_effect = Exception("no DB")
+    for name in ("_iter_feature_matrices", "_build_group_feature_matrix",
+                 "_load_item_histories"):
+        setattr(trainer, name, getattr(MLTrainer, name).__get__(trainer))
+
+    with patch.object(MLFeatureBuilder, "calc_hourly_ratios_batch", return_value={}):
+        matrices = [fm for _, fm in trainer._iter_feature_matrices(days=days) if len(fm)]
+    assert len(matrices) == 1
+    return matrices[0]
+
+
+def _row(fm, target_date):
+    """target_date 샘플의 행 인덱스"""
+    dates = list(fm.dates)
+    assert target_date in dates, f"{target_date} 샘플 없음"
+    return dates.index(target_date)
+
+
+def _col(name):
+    from src.prediction.ml.feature_builder import MLFeatureBuilder
+    return MLFeatureBuilder.FEATURE_NAMES.index(name)
 
+
+class TestTrainerYValueImputation:
     def test_training_y_imputed_on_stockout_day(self):
         """품절일의 Y값이 비품절 평균으로 대체."""
-        from src.prediction.ml.trainer import MLTrainer
         from src.prediction.prediction_config import PREDICTION_PARAMS
 
         # 30일 데이터, 마지막 5일 품절
         daily_sales = _make_daily_sales(30, avg_qty=5, stockout_days=[25, 26, 27, 28, 29])
+        assert PREDICTION_PARAMS["ml_stockout_filter"]["enabled"] is True
 
-        trainer = self._make_trainer_mock()
-        trainer.pipeline.get_active_items.return_value = [
-            {"item_cd": "TEST001", "mid_cd": "049", "data_days": 30}
-        ]
-        trainer.pipeline.get_item_daily_stats.return_value = daily_sales
-        trainer.pipeline.get_items_meta.return_value = {"TEST001": {}}
-        trainer.pipeline.get_external_factors.return_value = {}
-        trainer.pipeline._get_conn.side_effect = Exception("no DB")
+        fm = _training_matrix(daily_sales)
 
-        assert PREDICTION_PARAMS["ml_stockout_filter"]["enabled"] is True
+        # 품절일 샘플의 Y가 0이 아니라 비품절 평균(5)이어야 함
+        assert fm.y[_row(fm, daily_sales[29]["sales_date"])] == pytest.approx(5.0), \
+            "품절일 Y값이 0으로 남아있음 (imputation 미적용)"
 
-        group_data = trainer._prepare_training_data(days=30)
+    def test_training_y_not_imputed_when_disabled(self):
+        """설정 비활성화 시 품절일 Y값은 0 유지."""
+        from src.prediction.prediction_config import PREDICTION_PARAMS
 
-        # 품절일 샘플의 actual_sale_qty가 0이 아니라 비품절 평균(~5)이어야 함
-        all_samples = []
-        for samples in group_data.values():
-            all_samples.extend(samples)
+        daily_sales = _make_daily_sales(30, avg_qty=5, stockout_days=[25, 26, 27, 28, 29])
+        cfg = dict(PREDICTION_PARAMS["ml_stockout_filter"], enabled=False)
+        with patch.dict(PREDICTION_PARAMS, {"ml_stockout_filter": cfg}):
+            fm = _training_matrix(daily_sales)
 
-        stockout_samples = [
-            s for s in all_samples
-            if s["target_date"] == daily_sales[29]["sales_date"]
-        ]
-        if stockout_samples:
-            assert stockout_samples[0]["actual_sale_qty"] > 0, \
-                "품절일 Y값이 0으로 남아있음 (imputation 미적용)"
+        assert fm.y[_row(fm, daily_sales[29]["sales_date"])] == 0
 
     def test_training_y_not_imputed_when_stock_positive(self):
         """비품절일의 Y값은 변경 없음."""
-        from src.prediction.ml.trainer import MLTrainer
-
         daily_sales = _make_daily_sales(30, avg_qty=5, stockout_days=[25, 26])
 
-        trainer = self._make_trainer_mock()
-        trainer.pipeline.get_active_items.return_value = [
-            {"item_cd": "TEST001", "mid_cd": "049", "data_days": 30}
-        ]
-        trainer.pipeline.get_item_daily_stats.return_value = daily_sales
-        trainer.pipeline.get_items_meta.return_value = {"TEST001": {}}
-        trainer.pipeline.get_external_factors.return_value = {}
-        trainer.pipeline._get_conn.side_effect = Exception("no DB")
-
-        group_data = trainer._prepare_training_data(days=30)
+        fm = _training_matrix(daily_sales)
 
-        all_samples = []
-        for samples in group_data.values():
-            all_samples.extend(samples)
-
-        # 비품절일(인덱스 10)의 Y값은 원래 값(5) 유지
-        normal_samples = [
-            s for s in all_samples
-            if s["target_date"] == daily_sales[10]["sales_date"]
-        ]
-        if normal_samples:
-            assert normal_samples[0]["actual_sale_qty"] == 5
+        # 비품절일(인덱스 20)의 Y값은 원래 값(5) 유지
+        assert fm.y[_row(fm, daily_sales[20]["sales_date"])] == 5
 
     def test_training_y_not_imputed_below_min_available(self):
         """비품절일 < 3이면 Y값 imputation 포기."""
-        from src.prediction.ml.trainer import MLTrainer
-
         # 30일 중 28일 품절 → 비품절 2일
         stockout_indices = list(range(2, 30))
         daily_sales = _make_daily_sales(30, avg_qty=5, stockout_days=stockout_indices)
 
-        trainer = self._make_trainer_mock()
-        trainer.pipeline.get_active_items.return_value = [
-            {"item_cd": "TEST001", "mid_cd": "049", "data_days": 30}
-        ]
-        trainer.pipeline.get_item_daily_stats.return_value = daily_sales
-        trainer.pipeline.get_items_meta.return_value = {"TEST001": {}}
-        trainer.pipeline.get_external_factors.return_value = {}
-        trainer.pipeline._get_conn.side_effect = Exception("no DB")
-
-        group_data = trainer._prepare_training_data(days=30)
-
-        all_samples = []
-        for samples in group_data.values():
-            all_samples.extend(samples)
+        fm = _training_matrix(daily_sales)
 
         # 비품절일 < 3 → imputation 포기 → 품절일 Y=0 유지
-        stockout_samples = [
-            s for s in all_samples
-            if s["target_date"] == daily_sales[15]["sales_date"]
-        ]
-        if stockout_samples:
-            assert stockout_samples[0]["actual_sale_qty"] == 0
+        assert fm.y[_row(fm, daily_sales[20]["sales_date"])] == 0
 
 
 # ──────────────────────────────────────────────────────────────
@@ -285,80 +269,38 @@ class TestTrainerYValueImputation:
 # ──────────────────────────────────────────────────────────────
 
 class TestTrainerLagImputation:
-    def _make_trainer_with_data(self, daily_sales):
-        """공통 trainer mock 셋업."""
-        from src.prediction.ml.trainer import MLTrainer
-
-        trainer = MagicMock(spec=MLTrainer)
-        trainer.store_id = "46513"
-        trainer.pipeline = MagicMock()
-        trainer._prepare_training_data = MLTrainer._prepare_training_data.__get__(trainer)
-
-        trainer.pipeline.get_active_items.return_value = [
-            {"item_cd": "TEST001", "mid_cd": "049", "data_days": len(daily_sales)}
-        ]
-        trainer.pipeline.get_item_daily_stats.return_value = daily_sales
-        trainer.pipeline.get_items_meta.return_value = {"TEST001": {}}
-        trainer.pipeline.get_external_factors.return_value = {}
-        trainer.pipeline._get_conn.side_effect = Exception("no DB")
-        return trainer
-
     def test_lag7_imputed_when_stockout(self):
         """7일 전이 품절일이면 lag_7이 비품절 평균으로 대체."""
         # 30일 데이터, 인덱스 16만 품절 (= i=23의 7일 전)
         daily_sales = _make_daily_sales(30, avg_qty=5, stockout_days=[16])
-        trainer = self._make_trainer_with_data(daily_sales)
 
-        group_data = trainer._prepare_training_data(days=30)
+        fm = _training_matrix(daily_sales)
 
-        all_samples = []
-        for samples in group_data.values():
-            all_samples.extend(samples)
-
-        # i=23의 lag_7 = daily_sales[16] → 품절일 → 비품절 평균(~5)으로 대체
-        target_date = daily_sales[23]["sales_date"]
-        matching = [s for s in all_samples if s["target_date"] == target_date]
-        if matching:
-            assert matching[0]["lag_7"] is not None
-            assert matching[0]["lag_7"] > 0, "lag_7이 0 (품절 미보정)"
+        # i=23의 lag_7 = daily_sales[16] → 품절일 → 비품절 평균(5) / 일평균(5)
+        row = _row(fm, daily_sales[23]["sales_date"])
+        assert fm.X[row, _col("lag_7")] == pytest.approx(1.0), "lag_7이 0 (품절 미보정)"
 
     def test_lag28_imputed_when_stockout(self):
         """28일 전이 품절일이면 lag_28이 비품절 평균으로 대체."""
         # 35일 데이터, 인덱스 2만 품절 (= i=30의 28일 전)
         daily_sales = _make_daily_sales(35, avg_qty=5, stockout_days=[2])
-        trainer = self._make_trainer_with_data(daily_sales)
-
-        group_data = trainer._prepare_training_data(days=35)
 
-        all_samples = []
-        for samples in group_data.values():
-            all_samples.extend(samples)
+        fm = _training_matrix(daily_sales, days=35)
 
-        target_date = daily_sales[30]["sales_date"]
-        matching = [s for s in all_samples if s["target_date"] == target_date]
-        if matching:
-            assert matching[0]["lag_28"] is not None
-            assert matching[0]["lag_28"] > 0, "lag_28이 0 (품절 미보정)"
+        row = _row(fm, daily_sales[30]["sales_date"])
+        assert fm.X[row, _col("lag_28")] > 0, "lag_28이 0 (품절 미보정)"
 
     def test_wow_imputed_when_stockout_lag(self):
         """wow 계산의 qty_7/qty_14가 품절일이면 보정."""
         # 30일 데이터, 인덱스 13 품절 (= i=20의 7일전)
         daily_sales = _make_daily_sales(30, avg_qty=5, stockout_days=[13])
-        trainer = self._make_trainer_with_data(daily_sales)
-
-        group_data = trainer._prepare_training_data(days=30)
 
-        all_samples = []
-        for samples in group_data.values():
-            all_samples.extend(samples)
+        fm = _training_matrix(daily_sales)
 
-        target_date = daily_sales[20]["sales_date"]
-        matching = [s for s in all_samples if s["target_date"] == target_date]
-        if matching and matching[0]["week_over_week"] is not None:
-            # 품절 보정 시 qty_7 ~= 5, qty_14 = 5 → wow ~= 0
-            # 미보정 시 qty_7 = 0, qty_14 = 5 → wow = -1.0
-            assert matching[0]["week_over_week"] > -0.5, \
-                f"wow={matching[0]['week_over_week']}, 품절 미보정"
+        # 품절 보정 시 qty_7 = 5, qty_14 = 5 → wow = 0
+        # 미보정 시 qty_7 = 0, qty_14 = 5 → wow = -1.0
+        wow = fm.X[_row(fm, daily_sales[20]["sales_date"]), _col("week_over_week")]
+        assert wow == pytest.approx(0.0), f"wow={wow}, 품절 미보정"
 
 
 # ──────────────────────────────────────────────────────────────
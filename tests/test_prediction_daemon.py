@@ -0,0 +1,391 @@
+"""PredictionDaemon (warm-prediction-daemon) 테스트
+
+- TableChangeWatcher: data_version 게이트 + 테이블 지문 변경 감지
+- PredictionCacheManager warm 캐시 재사용/테이블별 무효화
+- WarmStorePredictor: 예측기 재사용, 변경 테이블만 무효화, 날짜/모델 변경 시 재준비,
+  공통 DB 상품 마스터/발주정지 변경 시 전체 무효화
+- HTTP 왕복 (PredictionDaemon ↔ PredictionDaemonClient), 데몬 장애 시 직접 예측 폴백
+"""
+
+import sqlite3
+from datetime import date
+
+import pytest
+
+from src.application.scheduler import prediction_daemon as pd
+from src.prediction.improved_predictor import ImprovedPredictor, PredictionResult
+from src.prediction.prediction_cache import PredictionCacheManager
+
+STORE_ID = "46513"
+
+
+def _make_result(item_cd: str, order_qty: int = 1) -> PredictionResult:
+    return PredictionResult(
+        item_cd=item_cd, item_nm=f"상품{item_cd}", mid_cd="015",
+        target_date="2026-03-22", predicted_qty=1.5, adjusted_qty=1.8,
+        current_stock=2, pending_qty=0, safety_stock=1.2, order_qty=order_qty,
+        confidence="high", data_days=30, weekday_coef=1.05,
+    )
+
+
+@pytest.fixture
+def store_db(tmp_path):
+    path = tmp_path / "store.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute("""CREATE TABLE daily_sales (
+        id INTEGER PRIMARY KEY, store_id TEXT, sales_date TEXT, item_cd TEXT,
+        sale_qty INTEGER, collected_at TEXT)""")
+    conn.execute("""CREATE TABLE promotions (
+        id INTEGER PRIMARY KEY, item_cd TEXT, collected_at TEXT, updated_at TEXT)""")
+    conn.execute("""CREATE TABLE realtime_inventory (
+        id INTEGER PRIMARY KEY, item_cd TEXT, stock_qty INTEGER, queried_at TEXT)""")
+    conn.execute(
+        "INSERT INTO daily_sales VALUES (1, ?, '2026-03-01', 'A', 3, '2026-03-01T07:00')",
+        (STORE_ID,),
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def common_db(tmp_path):
+    path = tmp_path / "common.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute("""CREATE TABLE products (
+        item_cd TEXT PRIMARY KEY, item_nm TEXT, mid_cd TEXT, updated_at TEXT)""")
+    conn.execute("""CREATE TABLE stopped_items (
+        item_cd TEXT PRIMARY KEY, is_active INTEGER, last_detected_at TEXT)""")
+    conn.execute("""CREATE TABLE settings_audit_log (
+        id INTEGER PRIMARY KEY, setting_key TEXT, changed_at TEXT)""")
+    conn.execute("INSERT INTO products VALUES ('A', '상품A', '015', '2026-03-01')")
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _write(path, sql, params=()):
+    conn = sqlite3.connect(str(path))
+    conn.execute(sql, params)
+    conn.commit()
+    conn.close()
+
+
+class _FakeML:
+    def __init__(self):
+        self.sig = ("v1",)
+        self.unloads = 0
+
+    def load_models(self):
+        return True
+
+    def load_group_models(self):
+        return 0
+
+    def model_signature(self):
+        return self.sig
+
+    def unload(self):
+        self.unloads += 1
+
+
+class _FakePredictor:
+    instances = []
+
+    def __init__(self, store_id):
+        self.store_id = store_id
+        self.warm = False
+        self.invalidated = []
+        self.pending = None
+        self.seen_pending = None
+        self._ml_predictor = _FakeML()
+        _FakePredictor.instances.append(self)
+
+    def enable_warm_caches(self):
+        self.warm = True
+
+    def invalidate_warm_caches(self, tables=None):
+        self.invalidated.append(tables)
+        return [f"cache:{t}" for t in (tables or ["all"])]
+
+    def set_pending_cache(self, data):
+        self.pending = dict(data)
+
+    def clear_pending_cache(self):
+        self.pending = None
+
+    def set_stock_cache(self, data):
+        pass
+
+    def clear_stock_cache(self):
+        pass
+
+    def get_order_candidates(self, target_date=None, min_order_qty=1, exclude_items=None):
+        self.seen_pending = self.pending
+        return [_make_result(cd) for cd in ("A", "B", "C") if cd not in (exclude_items or ())]
+
+    def predict_batch(self, item_codes, target_date=None, pending_quantities=None):
+        return [_make_result(cd, 2) for cd in item_codes]
+
+
+@pytest.fixture(autouse=True)
+def _reset_fake():
+    _FakePredictor.instances = []
+
+
+class TestTableChangeWatcher:
+
+    @pytest.mark.unit
+    def test_detects_changed_tables_only(self, store_db):
+        watcher = pd.TableChangeWatcher(str(store_db))
+        try:
+            assert watcher.poll() == []  # 기준점
+            assert watcher.poll() == []  # 변경 없음 (data_version 동일)
+
+            # UPDATE만 (행수/rowid 동일) → 갱신시각으로 감지
+            _write(store_db, "UPDATE daily_sales SET sale_qty = 5, collected_at = '2026-03-01T09:00'")
+            assert watcher.poll() == ["daily_sales"]
+
+            _write(store_db, "INSERT INTO promotions VALUES (1, 'A', '2026-03-01', NULL)")
+            assert watcher.poll() == ["promotions"]
+            assert watcher.poll() == []
+        finally:
+            watcher.close()
+
+    @pytest.mark.unit
+    def test_missing_table_is_ignored(self, store_db):
+        watcher = pd.TableChangeWatcher(str(store_db))
+        try:
+            watcher.poll()
+            _write(store_db, "INSERT INTO realtime_inventory VALUES (1, 'A', 2, '2026-03-01')")
+            # order_tracking / receiving_history 미존재 → 지문 None, 변경으로 보지 않음
+            assert watcher.poll() == ["realtime_inventory"]
+        finally:
+            watcher.close()
+
+
+class TestWarmCacheManager:
+
+    @pytest.mark.unit
+    def test_disabled_always_loads(self):
+        cm = PredictionCacheManager(None, STORE_ID)
+        calls = []
+        for _ in range(2):
+            cm.warm("ot_pending", lambda: calls.append(1) or {"A": 1})
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    def test_reuse_subset_and_reload_superset(self):
+        cm = PredictionCacheManager(None, STORE_ID)
+        cm.enable_warm()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return {"n": len(calls)}
+
+        assert cm.warm("demand_patterns", loader, ["A", "B"]) == {"n": 1}
+        assert cm.warm("demand_patterns", loader, ["A"]) == {"n": 1}
+        assert cm.warm("demand_patterns", loader, ["A", "C"]) == {"n": 2}
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    def test_invalidate_by_dependency(self):
+        cm = PredictionCacheManager(None, STORE_ID)
+        cm.enable_warm()
+        cm.warm("ot_pending", dict)
+        cm.warm("daily_stats", dict, ["A"])
+        cm.warm("receiving_stats", dict)
+        assert sorted(cm.invalidate(["order_tracking"])) == ["ot_pending", "receiving_stats"]
+        assert cm.invalidate(["promotions"]) == []
+        assert cm.invalidate(None) == ["daily_stats"]
+
+
+class TestImprovedPredictorWarm:
+
+    def _predictor(self, tmp_path):
+        from src.prediction.data_provider import PredictionDataProvider
+        p = ImprovedPredictor.__new__(ImprovedPredictor)
+        p.store_id = STORE_ID
+        p.db_path = str(tmp_path / "x.db")
+        p._data = PredictionDataProvider(p.db_path, STORE_ID, use_db_inventory=False)
+        p._bias_cache = {}
+        p._cache = PredictionCacheManager(p._data, STORE_ID, p.db_path)
+        return p
+
+    @pytest.mark.unit
+    def test_loaders_reuse_when_warm(self, tmp_path):
+        p = self._predictor(tmp_path)
+        calls = []
+        p._cache.load_ot_pending = lambda: calls.append(1) or {"A": 1}
+
+        p._load_ot_pending_cache()
+        p._load_ot_pending_cache()
+        assert len(calls) == 2  # 기본: 매번 로드
+
+        p.enable_warm_caches()
+        p._load_ot_pending_cache()
+        p._load_ot_pending_cache()
+        assert len(calls) == 3
+        assert p._ot_pending_cache == {"A": 1}
+
+    @pytest.mark.unit
+    def test_invalidate_clears_table_caches(self, tmp_path):
+        p = self._predictor(tmp_path)
+        p.enable_warm_caches()
+        p._cache.warm("ot_pending", dict)
+        p._cache.warm("batch_caches", lambda: ("matrix", {"A": None}), ["A"])
+        p._data.restore_batch_caches(("matrix", {"A": None}))
+        p._data._promo_cache = {"A": []}
+        p._data.set_stock_cache({"A": 3})
+        p._bias_cache = {"015": 1.1}
+
+        dropped = p.invalidate_warm_caches(["promotions"])
+        assert dropped == ["promo_periods"]
+        assert p._data._promo_cache is None
+        assert p._data.batch_cache_state() == ("matrix", {"A": None})
+
+        dropped = p.invalidate_warm_caches(["daily_sales", "realtime_inventory"])
+        assert "batch_caches" in dropped and "inventory" in dropped
+        assert p._data.batch_cache_state() == (None, None)
+        assert p._data._stock_cache == {}
+        assert p._bias_cache == {}
+        assert "ot_pending" not in dropped
+
+
+class TestWarmStorePredictor:
+
+    @pytest.mark.unit
+    def test_reuses_predictor_and_invalidates_changed_tables(self, store_db):
+        store = pd.WarmStorePredictor(STORE_ID, _FakePredictor, str(store_db))
+        try:
+            first = store.predict_candidates(min_order_qty=0)
+            second = store.predict_candidates(exclude_items={"B"})
+            assert [r.item_cd for r in first] == ["A", "B", "C"]
+            assert [r.item_cd for r in second] == ["A", "C"]
+            assert len(_FakePredictor.instances) == 1
+            predictor = _FakePredictor.instances[0]
+            assert predictor.warm is True
+            assert predictor.invalidated == []
+
+            _write(store_db, "INSERT INTO daily_sales VALUES (2, ?, '2026-03-02', 'B', 1, 'x')",
+                   (STORE_ID,))
+            store.predict_batch(["A"])
+            assert predictor.invalidated == [["daily_sales"]]
+            assert store.status()["last_invalidated"] == ["cache:daily_sales"]
+        finally:
+            store.close()
+
+    @pytest.mark.unit
+    def test_request_caches_do_not_leak(self, store_db):
+        store = pd.WarmStorePredictor(STORE_ID, _FakePredictor, str(store_db))
+        try:
+            store.predict_candidates(pending_cache={"A": 2})
+            predictor = _FakePredictor.instances[0]
+            assert predictor.seen_pending == {"A": 2}
+            assert predictor.pending is None
+        finally:
+            store.close()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("sql", [
+        "UPDATE products SET mid_cd = '016', updated_at = '2026-03-02' WHERE item_cd = 'A'",
+        "INSERT INTO stopped_items VALUES ('A', 1, '2026-03-02')",
+    ])
+    def test_common_master_change_invalidates_all(self, store_db, common_db, sql):
+        store = pd.WarmStorePredictor(STORE_ID, _FakePredictor, str(store_db), str(common_db))
+        try:
+            store.predict_candidates()
+            predictor = _FakePredictor.instances[0]
+
+            _write(common_db, "INSERT INTO settings_audit_log VALUES (1, 'x', 'now')")
+            store.predict_candidates()
+            assert predictor.invalidated == []
+
+            _write(common_db, sql)
+            store.predict_candidates()
+            assert predictor.invalidated == [None]
+        finally:
+            store.close()
+
+    @pytest.mark.unit
+    def test_rebuild_on_date_change_and_model_reload(self, store_db):
+        store = pd.WarmStorePredictor(STORE_ID, _FakePredictor, str(store_db))
+        try:
+            store.predict_candidates()
+            _FakePredictor.instances[0]._ml_predictor.sig = ("v2",)
+            store.predict_candidates()
+            assert _FakePredictor.instances[0]._ml_predictor.unloads == 1
+            assert store.stats["model_reloads"] == 1
+
+            store._built_for = date(2000, 1, 1)
+            store.predict_candidates()
+            assert len(_FakePredictor.instances) == 2
+            assert store.stats["rebuilds"] == 2
+        finally:
+            store.close()
+
+
+class TestDaemonHttp:
+
+    @pytest.fixture
+    def daemon(self, store_db):
+        d = pd.PredictionDaemon(
+            port=0,
+            predictor_factory=_FakePredictor,
+            db_path_resolver=lambda sid: str(store_db),
+        )
+        d.start()
+        yield d
+        d.shutdown()
+
+    @pytest.mark.unit
+    def test_roundtrip(self, daemon):
+        client = pd.PredictionDaemonClient(port=daemon.port, timeout=10)
+        assert client.health() == {"status": "ok", "stores": {}}
+
+        results = client.predict_candidates(STORE_ID, exclude_items={"C"}, pending_cache={"A": 1})
+        assert results == [_make_result("A"), _make_result("B")]
+        batch = client.predict_batch(STORE_ID, ["X"])
+        assert batch == [_make_result("X", 2)]
+
+        assert client.health()["stores"][STORE_ID]["requests"] == 2
+        assert client.invalidate(STORE_ID, ["promotions"]) == {STORE_ID: ["cache:promotions"]}
+
+    @pytest.mark.unit
+    def test_invalid_store_rejected(self, daemon):
+        client = pd.PredictionDaemonClient(port=daemon.port, timeout=10)
+        with pytest.raises(RuntimeError):
+            client.predict_candidates("../etc")
+
+    @pytest.mark.unit
+    def test_probe_caches_absence(self, monkeypatch):
+        monkeypatch.setattr(pd, "_probe_state", {"expires": 0.0, "client": None})
+        probes = []
+        monkeypatch.setattr(
+            pd.PredictionDaemonClient, "is_available", lambda self: probes.append(1) or False
+        )
+        assert pd.get_prediction_daemon_client() is None
+        assert pd.get_prediction_daemon_client() is None
+        assert len(probes) == 1
+
+
+class TestDaemonFallback:
+
+    @pytest.mark.unit
+    def test_auto_order_falls_back_when_daemon_fails(self, monkeypatch):
+        from src.application.scheduler import prediction_pool as pp
+        from src.order.auto_order import AutoOrderSystem
+
+        class _TimedOutClient:
+            def predict_candidates(self, store_id, **kwargs):
+                raise TimeoutError("timed out")
+
+        monkeypatch.setattr(pp, "get_active_prediction_pool", lambda: None)
+        monkeypatch.setattr(pd, "get_prediction_daemon_client", lambda: _TimedOutClient())
+
+        system = AutoOrderSystem.__new__(AutoOrderSystem)
+        system.store_id = STORE_ID
+        system.improved_predictor = _FakePredictor(STORE_ID)
+        candidates = system._predict_order_candidates(None, 1, {"B"})
+        assert [r.item_cd for r in candidates] == ["A", "C"]
@@ -0,0 +1,245 @@
+"""PredictionLogger 일괄 저장 / stage_trace 압축 테스트
+
+- 컬럼 집합 프로세스당 1회 조회, executemany 적재, 구 스키마 호환
+- stage_trace 압축 BLOB ↔ decode_stage_trace (구 JSON 텍스트 포함)
+- 압축 BLOB 은 stage_trace_z 에만 기록, stage_trace(TEXT) 이관 (v81)
+- 일괄 실패 시 건별 재시도
+"""
+
+import json
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.database.schema import STORE_SCHEMA
+from src.prediction import prediction_logger as pl_module
+from src.prediction.prediction_logger import (
+    PredictionLogger,
+    decode_stage_trace,
+    encode_stage_trace,
+)
+
+SNAPSHOT = {
+    "after_rule": 3, "after_rop": 3, "after_promo": 3, "after_ml": 3.0,
+    "after_cap": 3, "after_round": 4, "final": 4, "raw_need_qty": 2.7,
+    "stage_io": [{"stage": "rule", "in": 2.7, "out": 3, "reads": ["stock"]}],
+    "shadow": {}, "base_wma": 2.13, "wma_blended": 2.4, "coef_mul": 1.05,
+    "food_5stage": {"base_wma": 2.13, "rule_floor": 3, "final_cap": 3},
+}
+
+
+def _result(item_cd, mid_cd="001", snapshot=SNAPSHOT, **kw):
+    fields = dict(
+        item_cd=item_cd, mid_cd=mid_cd, target_date="2026-03-08",
+        predicted_qty=2.5, adjusted_qty=2.7, weekday_coef=1.1, confidence="high",
+        current_stock=1, safety_stock=0.5, order_qty=3, model_type="rule",
+        stock_source="realtime", pending_source="ot", is_stock_stale=False,
+        rule_order_qty=3, ml_order_qty=2, ml_weight_used=0.3,
+        association_boost=1.0, snapshot_stages=snapshot,
+    )
+    fields.update(kw)
+    return SimpleNamespace(**fields)
+
+
+def _prediction_logs_ddl():
+    return next(s for s in STORE_SCHEMA if "TABLE IF NOT EXISTS prediction_logs" in s)
+
+
+@pytest.fixture(autouse=True)
+def _clear_column_cache():
+    pl_module._LOG_COLUMNS_CACHE.clear()
+    yield
+    pl_module._LOG_COLUMNS_CACHE.clear()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "store.db")
+    conn = sqlite3.connect(path)
+    conn.execute(_prediction_logs_ddl())
+    conn.commit()
+    conn.close()
+    return path
+
+
+class TestStageTraceCodec:
+
+    @pytest.mark.unit
+    def test_roundtrip_and_size(self):
+        blob = encode_stage_trace(SNAPSHOT)
+        assert isinstance(blob, bytes)
+        assert decode_stage_trace(blob) == SNAPSHOT
+        assert len(blob) < len(json.dumps(SNAPSHOT, ensure_ascii=False)) / 2
+
+    @pytest.mark.unit
+    def test_legacy_json_and_invalid(self):
+        assert decode_stage_trace(json.dumps(SNAPSHOT)) == SNAPSHOT
+        assert decode_stage_trace(None) is None
+        assert decode_stage_trace("") is None
+        assert decode_stage_trace(b"\x01garbage") is None
+        assert decode_stage_trace(b"\x09abc") is None
+
+
+class TestBulkWriter:
+
+    @pytest.mark.unit
+    def test_batch_insert_and_stage_traces(self, db_path):
+        logger = PredictionLogger(db_path, store_id="46513")
+        results = [_result("A"), _result("B", mid_cd="049"), _result("C", snapshot=None)]
+        assert logger.log_predictions_batch(results) == 3
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute(
+            "SELECT item_cd, adjusted_qty, store_id, ml_weight_used, is_stock_stale, "
+            "typeof(stage_trace_z), typeof(stage_trace) FROM prediction_logs ORDER BY item_cd"
+        ).fetchall()
+        conn.close()
+        assert rows == [
+            ("A", 2.7, "46513", 0.3, 0, "blob", "null"),
+            ("B", 2.7, "46513", 0.3, 0, "null", "null"),   # 비푸드 → 적재 안 함
+            ("C", 2.7, "46513", 0.3, 0, "null", "null"),
+        ]
+
+        conn = sqlite3.connect(db_path)
+        date = conn.execute("SELECT prediction_date FROM prediction_logs").fetchone()[0]
+        conn.close()
+        assert logger.get_stage_traces(date) == {"A": SNAPSHOT}
+        assert logger.get_stage_traces(date, ["B"]) == {}
+
+    @pytest.mark.unit
+    def test_columns_resolved_once_per_process(self, db_path, monkeypatch):
+        logger = PredictionLogger(db_path, store_id="46513")
+        logger.log_predictions_batch([_result("A")])
+        assert "stage_trace_z" in pl_module._LOG_COLUMNS_CACHE[db_path]
+
+        monkeypatch.setattr(pl_module.PredictionLogger, "_get_connection",
+                            _wrap_no_pragma(logger._get_connection))
+        logger.log_prediction(_result("B"))
+        assert logger.log_predictions_batch([_result("C"), _result("D")]) == 2
+
+    @pytest.mark.unit
+    def test_legacy_json_rows_still_readable(self, db_path):
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "INSERT INTO prediction_logs (prediction_date, item_cd, target_date, predicted_qty, "
+            "store_id, stage_trace, created_at) "
+            "VALUES ('2026-03-07', 'OLD', '2026-03-08', 1, '46513', ?, '2026-03-07')",
+            (json.dumps(SNAPSHOT),)
+        )
+        conn.commit()
+        conn.close()
+        logger = PredictionLogger(db_path, store_id="46513")
+        assert logger.get_stage_traces("2026-03-07") == {"OLD": SNAPSHOT}
+
+    @pytest.mark.unit
+    def test_legacy_schema(self, tmp_path):
+        path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE prediction_logs (id INTEGER PRIMARY KEY, prediction_date TEXT, "
+            "item_cd TEXT, mid_cd TEXT, target_date TEXT, predicted_qty REAL, "
+            "model_type TEXT, store_id TEXT, created_at TEXT)"
+        )
+        conn.commit()
+        conn.close()
+
+        assert PredictionLogger(path, store_id="46513").log_predictions_batch([_result("A")]) == 1
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT item_cd, predicted_qty FROM prediction_logs").fetchall() == [
+            ("A", 2.7)
+        ]
+        conn.close()
+
+    @pytest.mark.unit
+    def test_failed_row_falls_back_to_per_row(self, db_path):
+        logger = PredictionLogger(db_path, store_id="46513")
+        results = [_result("A"), _result(None), _result("C")]   # item_cd NOT NULL 위반
+        assert logger.log_predictions_batch(results) == 2
+
+        conn = sqlite3.connect(db_path)
+        items = [r[0] for r in conn.execute("SELECT item_cd FROM prediction_logs ORDER BY id")]
+        conn.close()
+        assert items == ["A", "C"]
+
+
+def _wrap_no_pragma(get_connection):
+    """PRAGMA table_info 실행 시 실패하는 커넥션을 돌려주는 _get_connection 대체"""
+
+    class _Conn:
+        def __init__(self, conn):
+            self._conn = conn
+
+        def execute(self, sql, *args):
+            assert "PRAGMA" not in sql, "PRAGMA 재조회"
+            return self._conn.execute(sql, *args)
+
+        def __getattr__(self, name):
+            return getattr(self._conn, name)
+
+    def _patched(self, timeout=30):
+        return _Conn(get_connection(timeout))
+    return _patched
+
+
+class TestStageTraceBlobMigration:
+
+    def _v80_db(self, path):
+        """stage_trace_z 이전 스키마 + stage_trace(TEXT) 에 BLOB/JSON 이 섞인 DB"""
+        ddl = _prediction_logs_ddl().replace(",\n        stage_trace_z BLOB", "")
+        assert "stage_trace_z" not in ddl
+        conn = sqlite3.connect(path)
+        conn.execute(ddl)
+        conn.executemany(
+            "INSERT INTO prediction_logs (prediction_date, item_cd, target_date, predicted_qty, "
+            "store_id, stage_trace, created_at) "
+            "VALUES ('2026-03-07', ?, '2026-03-08', 1, '46513', ?, '2026-03-07')",
+            [("BLOB", encode_stage_trace(SNAPSHOT)), ("JSON", json.dumps(SNAPSHOT)),
+             ("NONE", None)],
+        )
+        conn.commit()
+        conn.close()
+
+    @pytest.mark.unit
+    def test_store_patch_moves_blobs_once(self, tmp_path):
+        from src.infrastructure.database.schema import init_store_db
+
+        path = tmp_path / "store.db"
+        self._v80_db(str(path))
+        init_store_db("46513", db_path=path)
+
+        conn = sqlite3.connect(str(path))
+        rows = conn.execute(
+            "SELECT item_cd, typeof(stage_trace), typeof(stage_trace_z) "
+            "FROM prediction_logs ORDER BY id"
+        ).fetchall()
+        # JSON 텍스트를 기대하는 조회: TEXT 컬럼에 BLOB 이 남지 않음
+        for (value,) in conn.execute(
+            "SELECT stage_trace FROM prediction_logs WHERE stage_trace IS NOT NULL"
+        ):
+            assert json.loads(value) == SNAPSHOT
+        conn.close()
+        assert rows == [("BLOB", "null", "blob"), ("JSON", "text", "null"),
+                        ("NONE", "null", "null")]
+
+        logger = PredictionLogger(str(path), store_id="46513")
+        assert logger.get_stage_traces("2026-03-07") == {"BLOB": SNAPSHOT, "JSON": SNAPSHOT}
+
+    @pytest.mark.unit
+    def test_legacy_migration_v81(self, tmp_path):
+        from src.db.models import SCHEMA_MIGRATIONS
+
+        path = str(tmp_path / "legacy.db")
+        self._v80_db(path)
+        conn = sqlite3.connect(path)
+        for stmt in (s.strip() for s in SCHEMA_MIGRATIONS[81].split(";")):
+            lines = [ln for ln in stmt.split("\n") if ln.strip() and not ln.strip().startswith("--")]
+            if lines:
+                conn.execute(stmt)
+        rows = conn.execute(
+            "SELECT item_cd, typeof(stage_trace), typeof(stage_trace_z) "
+            "FROM prediction_logs ORDER BY id"
+        ).fetchall()
+        conn.close()
+        assert rows == [("BLOB", "null", "blob"), ("JSON", "text", "null"),
+                        ("NONE", "null", "null")]
@@ -0,0 +1,179 @@
+"""PredictionProcessPool (multi-store-process-prediction) 테스트
+
+- PredictionResult 압축 직렬화 왕복
+- 풀 활성화/해제 (MultiStoreRunner.run_parallel 연동)
+- 실제 spawn 워커 예측 ↔ 프로세스 내 예측 동일성, 풀 장애 시 직접 예측 폴백
+"""
+
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.application.scheduler import prediction_pool as pp
+from src.prediction.improved_predictor import ImprovedPredictor, PredictionResult
+
+STORE = "46513"
+
+
+def _make_result(item_cd: str, order_qty: int) -> PredictionResult:
+    return PredictionResult(
+        item_cd=item_cd, item_nm=f"상품{item_cd}", mid_cd="015",
+        target_date="2026-03-22", predicted_qty=1.5, adjusted_qty=1.8,
+        current_stock=2, pending_qty=0, safety_stock=1.2, order_qty=order_qty,
+        confidence="high", data_days=30, weekday_coef=1.05,
+        snapshot_stages={"after_rule": order_qty},
+    )
+
+
+class TestPackUnpack:
+
+    @pytest.mark.unit
+    def test_roundtrip(self):
+        results = [_make_result(f"88{i:011d}", i % 4) for i in range(50)]
+        blob = pp.pack_prediction_results(results)
+        restored = pp.unpack_prediction_results(blob)
+        assert restored == results
+
+    @pytest.mark.unit
+    def test_empty(self):
+        assert pp.unpack_prediction_results(pp.pack_prediction_results([])) == []
+
+    @pytest.mark.unit
+    def test_compact_vs_plain_pickle(self):
+        import pickle
+        results = [_make_result(f"88{i:011d}", 1) for i in range(200)]
+        assert len(pp.pack_prediction_results(results)) < len(pickle.dumps(results))
+
+    @pytest.mark.unit
+    def test_unknown_version_rejected(self):
+        import pickle
+        import zlib
+        blob = zlib.compress(pickle.dumps((999, (), [])))
+        with pytest.raises(ValueError):
+            pp.unpack_prediction_results(blob)
+
+
+class TestActivePool:
+
+    @pytest.mark.unit
+    def test_context_registers_and_clears(self):
+        assert pp.get_active_prediction_pool() is None
+        with pp.PredictionProcessPool(max_workers=1) as pool:
+            assert pp.get_active_prediction_pool() is pool
+        assert pp.get_active_prediction_pool() is None
+
+    @pytest.mark.unit
+    def test_predict_without_start_raises(self):
+        with pytest.raises(RuntimeError):
+            pp.PredictionProcessPool().predict_candidates("46513")
+
+    @pytest.mark.unit
+    def test_runner_activates_pool_only_when_requested(self):
+        from src.application.scheduler.job_scheduler import MultiStoreRunner
+
+        seen = []
+
+        def task(ctx):
+            seen.append(pp.get_active_prediction_pool())
+            return {}
+
+        runner = MultiStoreRunner(max_workers=2, stagger_seconds=0, prediction_processes=1)
+        runner.run_parallel(task_fn=task, task_name="t", use_prediction_pool=True)
+        assert seen and all(p is not None for p in seen)
+        assert pp.get_active_prediction_pool() is None
+
+        seen.clear()
+        runner.run_parallel(task_fn=task, task_name="t")
+        assert seen and all(p is None for p in seen)
+
+    @pytest.mark.unit
+    def test_runner_without_processes_ignores_flag(self):
+        from src.application.scheduler.job_scheduler import MultiStoreRunner
+
+        runner = MultiStoreRunner(max_workers=2, stagger_seconds=0)
+        with patch.object(pp.PredictionProcessPool, "start") as start:
+            runner.run_parallel(task_fn=lambda ctx: {}, task_name="t", use_prediction_pool=True)
+        start.assert_not_called()
+
+
+def _use_data_dir(path: str) -> None:
+    """워커 initializer — DBRouter 데이터 디렉토리를 임시 경로로 전환"""
+    from src.infrastructure.database import connection
+    from src.infrastructure.database.repos import order_analysis_repo
+    connection.DATA_DIR = Path(path)
+    order_analysis_repo.DATA_DIR = Path(path)
+
+
+def _crash_worker() -> None:
+    """워커 initializer — 기동 즉시 실패 (BrokenProcessPool 유발)"""
+    raise RuntimeError("worker init failed")
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """임시 common.db + 매장 DB (최근 28일 판매 이력 3개 상품)"""
+    from src.infrastructure.database import connection
+    from src.infrastructure.database.repos import order_analysis_repo
+    from src.infrastructure.database.schema import init_common_db, init_store_db
+
+    monkeypatch.setattr(connection, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(order_analysis_repo, "DATA_DIR", tmp_path)
+    init_common_db()
+    init_store_db(STORE)
+
+    items = [f"88{i:011d}" for i in range(3)]
+    conn = sqlite3.connect(str(connection.DBRouter.get_common_db_path()))
+    conn.executemany(
+        "INSERT INTO products (item_cd, item_nm, mid_cd, created_at, updated_at) "
+        "VALUES (?, ?, '015', datetime('now'), datetime('now'))",
+        [(item_cd, f"상품{item_cd}") for item_cd in items],
+    )
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(str(connection.DBRouter.get_store_db_path(STORE)))
+    conn.executemany(
+        "INSERT INTO daily_sales (collected_at, created_at, store_id, sales_date, item_cd, "
+        "mid_cd, sale_qty, buy_qty, stock_qty) "
+        "VALUES (datetime('now'), datetime('now'), ?, ?, ?, '015', ?, 0, 1)",
+        [
+            (STORE, (date.today() - timedelta(days=d)).isoformat(), item_cd, 3 + i)
+            for i, item_cd in enumerate(items)
+            for d in range(1, 29)
+        ],
+    )
+    conn.commit()
+    conn.close()
+    return tmp_path
+
+
+class TestRealWorker:
+
+    @pytest.mark.unit
+    def test_worker_prediction_matches_in_process(self, data_dir):
+        expected = ImprovedPredictor(store_id=STORE).get_order_candidates(min_order_qty=0)
+        assert len(expected) == 3
+
+        with pp.PredictionProcessPool(
+            max_workers=1, initializer=_use_data_dir, initargs=(str(data_dir),)
+        ) as pool:
+            results = pool.predict_candidates(STORE, min_order_qty=0)
+        assert results == expected
+
+    @pytest.mark.unit
+    def test_broken_pool_falls_back_to_in_process(self, data_dir):
+        from src.order.auto_order import AutoOrderSystem
+
+        system = AutoOrderSystem.__new__(AutoOrderSystem)
+        system.store_id = STORE
+        system.improved_predictor = ImprovedPredictor(store_id=STORE)
+        expected = system.improved_predictor.get_order_candidates(min_order_qty=0)
+
+        with pp.PredictionProcessPool(max_workers=1, initializer=_crash_worker) as pool:
+            with pytest.raises(Exception):
+                pool.predict_candidates(STORE, min_order_qty=0)
+            candidates = system._predict_order_candidates(None, 0, None)
+        assert candidates == expected
@@ -0,0 +1,130 @@
+"""ProductAttributeStore (product-attribute-store) 테스트
+
+- product_details 일괄 로드 (청크/구 스키마 컬럼 누락)
+- 활성 스토어 → 카테고리 Strategy 유통기한 조회가 DB 대신 스토어 사용
+- 대상 밖 SKU / db_path 지정 시 기존 DB 조회 유지
+- warm 캐시 의존성 (product_details 변경 시 무효화)
+"""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from src.prediction import product_attributes as pa
+from src.prediction.categories import dessert, food, instant_meal, perishable
+from src.prediction.prediction_cache import PredictionCacheManager
+
+
+@pytest.fixture
+def common_conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("""CREATE TABLE product_details (
+        item_cd TEXT PRIMARY KEY, expiration_days INTEGER, order_unit_qty INTEGER,
+        small_cd TEXT, margin_rate REAL, demand_pattern TEXT, orderable_day TEXT)""")
+    conn.executemany(
+        "INSERT INTO product_details VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            ("A", 3, 6, "S1", 30.5, "daily", "월화수"),
+            ("B", 0, None, None, None, "slow", None),
+            ("C", None, 1, "S2", 10.0, None, "일월화수목금토"),
+        ],
+    )
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def active_store(common_conn):
+    store = pa.ProductAttributeStore.load(common_conn, ["A", "B", "C", "Z"])
+    token = pa.activate_attribute_store(store)
+    yield store
+    pa.deactivate_attribute_store(token)
+
+
+class TestLoad:
+
+    @pytest.mark.unit
+    def test_values_and_nulls(self, common_conn):
+        store = pa.ProductAttributeStore.load(common_conn, ["A", "B", "C", "Z"])
+        assert len(store) == 3
+        assert store.row("A") == {
+            "expiration_days": 3, "order_unit_qty": 6, "small_cd": "S1",
+            "margin_rate": 30.5, "demand_pattern": "daily", "orderable_day": "월화수",
+        }
+        assert store.get("B", "order_unit_qty", 1) == 1
+        assert store.get("B", "margin_rate") is None
+        assert store.expiration_days("B") is None  # 0 → 무효
+        assert store.expiration_days("C") is None
+        assert store.row("Z") is None
+        assert "Z" in store  # 조회 완료 (미존재)
+        assert "Q" not in store  # 조회 대상 밖
+
+    @pytest.mark.unit
+    def test_chunked_in_list(self, common_conn, monkeypatch):
+        monkeypatch.setattr(pa, "_IN_CHUNK", 2)
+        store = pa.ProductAttributeStore.load(common_conn, ["A", "B", "C", "A"])
+        assert sorted(store.index) == ["A", "B", "C"]
+
+    @pytest.mark.unit
+    def test_missing_columns_are_null(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE product_details (item_cd TEXT, expiration_days INTEGER)")
+        conn.execute("INSERT INTO product_details VALUES ('A', 2)")
+        store = pa.ProductAttributeStore.load(conn)
+        assert store.expiration_days("A") == 2
+        assert store.get("A", "demand_pattern") is None
+        assert "anything" in store  # 전체 로드
+        conn.close()
+
+
+class TestStrategyLookup:
+
+    @pytest.mark.unit
+    def test_no_db_query_when_active(self, active_store):
+        with patch("src.prediction.categories.food.get_conn") as food_conn, \
+                patch("src.prediction.categories.dessert.get_conn") as dessert_conn, \
+                patch("src.prediction.categories.instant_meal.get_conn") as instant_conn, \
+                patch("src.prediction.categories.perishable.get_conn") as perishable_conn:
+            assert food.get_food_expiration_days("A", "001") == (3, "db")
+            assert food.get_food_expiration_days("B", "004") == (
+                food.FOOD_EXPIRY_FALLBACK["004"], "fallback")
+            assert dessert._get_dessert_expiration_days("A") == (3, "db")
+            assert dessert._get_dessert_expiration_days("Z") == (
+                dessert.DESSERT_EXPIRY_SAFETY_CONFIG["fallback_expiry_days"], "fallback")
+            assert instant_meal._get_expiration_days("A") == (3, "db")
+            assert instant_meal._get_expiration_days("C") == (None, "fallback")
+            assert perishable._get_expiration_days("A", "013") == (3, "db")
+        for mocked in (food_conn, dessert_conn, instant_conn, perishable_conn):
+            mocked.assert_not_called()
+
+    @pytest.mark.unit
+    def test_out_of_scope_and_explicit_db_path_fall_back(self, active_store, tmp_path):
+        db = tmp_path / "p.db"
+        conn = sqlite3.connect(str(db))
+        conn.execute("CREATE TABLE product_details (item_cd TEXT, expiration_days INTEGER)")
+        conn.execute("INSERT INTO product_details VALUES ('A', 9), ('Q', 5)")
+        conn.commit()
+        conn.close()
+
+        # db_path 지정 → 스토어 무시하고 해당 DB 조회
+        assert dessert._get_dessert_expiration_days("A", str(db)) == (9, "db")
+        # 조회 대상 밖 SKU → 기존 DB 조회
+        assert perishable._get_expiration_days("Q", "013", str(db)) == (5, "db")
+
+    @pytest.mark.unit
+    def test_inactive_by_default(self):
+        assert pa.get_active_attribute_store() is None
+        assert pa.lookup_expiration_days("A") is None
+
+
+class TestWarmDependency:
+
+    @pytest.mark.unit
+    def test_product_details_change_drops_attribute_cache(self):
+        cm = PredictionCacheManager(None, "46513")
+        cm.enable_warm()
+        cm.warm("product_attributes", dict, ["A"])
+        cm.warm("ot_pending", dict)
+        dropped = cm.invalidate(["product_details"])
+        assert dropped == ["product_attributes"]
@@ -0,0 +1,154 @@
+"""RawSsvArchive (raw-ssv-archive) 테스트
+
+- 압축/해제 왕복 (zlib+공용 사전, LZMA, 압축 이득 없으면 평문)
+- 내용 해시 중복 제거, 지연 해제
+- HourlySalesDetailRepository raw 저장/조회, 기존 평문 행 이전(compact_raw), DDL 1회 실행
+"""
+
+import sqlite3
+import zlib
+
+import pytest
+
+from src.infrastructure.database.raw_ssv_archive import (
+    CODEC_LZMA,
+    CODEC_PLAIN,
+    CODEC_ZLIB_DICT,
+    RAW_SSV_BLOBS_DDL,
+    RS,
+    US,
+    RawSsvArchive,
+    compress_ssv,
+    decompress_ssv,
+)
+from src.infrastructure.database.repos.hourly_sales_detail_repo import (
+    HourlySalesDetailRepository,
+)
+
+NOW = "2026-03-07T12:00:00"
+
+
+def _ssv(rows=3, seed=0):
+    header = (
+        f"SSV:UTF-8{RS}ErrorCode:string=0{RS}ErrorMsg:string={RS}Dataset:dsList{RS}"
+        f"_RowType_{US}ITEM_CD:string(256){US}ITEM_NM:string(256){US}SALE_QTY:bigdecimal(0)"
+    )
+    body = [f"N{US}88010000{seed:03d}{i:02d}{US}상품{i}{US}{(i * 7 + seed) % 5}" for i in range(rows)]
+    return RS.join([header] + body)
+
+
+@pytest.fixture
+def conn():
+    c = sqlite3.connect(":memory:")
+    c.execute(RAW_SSV_BLOBS_DDL)
+    yield c
+    c.close()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    db = tmp_path / "store.db"
+    sqlite3.connect(str(db)).close()
+    return HourlySalesDetailRepository(db_path=db, store_id="99999")
+
+
+class TestCodec:
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("codec", [CODEC_ZLIB_DICT, CODEC_LZMA])
+    def test_round_trip(self, codec):
+        text = _ssv(rows=200)
+        used, data = compress_ssv(text, codec)
+        assert used == codec and len(data) < len(text.encode("utf-8")) / 3
+        assert decompress_ssv(used, data) == text
+
+    @pytest.mark.unit
+    def test_shared_dictionary_helps_small_responses(self):
+        text = _ssv(rows=1)
+        plain_zlib = zlib.compress(text.encode("utf-8"), 6)
+        _, with_dict = compress_ssv(text)
+        assert len(with_dict) < len(plain_zlib)
+
+    @pytest.mark.unit
+    def test_incompressible_stored_plain(self):
+        used, data = compress_ssv("x")
+        assert (used, data) == (CODEC_PLAIN, b"x")
+        with pytest.raises(ValueError):
+            decompress_ssv("zz", b"")
+
+
+class TestArchive:
+
+    @pytest.mark.unit
+    def test_dedupe_and_lazy_text(self, conn):
+        cursor = conn.cursor()
+        first = RawSsvArchive.put(cursor, _ssv(seed=1), NOW)
+        assert RawSsvArchive.put(cursor, _ssv(seed=1), NOW) == first
+        other = RawSsvArchive.put(cursor, _ssv(seed=2), NOW)
+        assert other != first
+        assert RawSsvArchive.stats(conn)["blobs"] == 2
+
+        ref = RawSsvArchive.get(conn, first)
+        assert ref._text is None
+        assert ref.text == _ssv(seed=1) and ref.raw_size == len(_ssv(seed=1).encode("utf-8"))
+        assert RawSsvArchive.get(conn, "missing") is None
+
+        conn.execute("CREATE TABLE refs (h TEXT)")
+        conn.execute("INSERT INTO refs VALUES (?)", (first,))
+        assert RawSsvArchive.prune(cursor, [("refs", "h")]) == 1
+        assert RawSsvArchive.get(conn, other) is None
+
+
+class TestHourlyRepository:
+
+    @pytest.mark.unit
+    def test_save_raw_dedupes_across_hours(self, repo):
+        for hour in range(6):
+            repo.save_raw("2026-03-07", hour, _ssv(seed=hour % 2), 3)
+        assert repo.get_raw("2026-03-07", 4) == _ssv(seed=0)
+        assert repo.get_raw("2026-03-07", 5) == _ssv(seed=1)
+        assert repo.get_raw("2026-03-07", 9) is None
+
+        conn = repo._get_conn()
+        try:
+            assert RawSsvArchive.stats(conn)["blobs"] == 2
+            assert conn.execute(
+                "SELECT COUNT(*) FROM raw_hourly_sales_detail WHERE ssv_response IS NOT NULL"
+            ).fetchone()[0] == 0
+        finally:
+            conn.close()
+
+    @pytest.mark.unit
+    def test_compact_legacy_rows(self, tmp_path):
+        db = tmp_path / "legacy.db"
+        legacy = sqlite3.connect(str(db))
+        legacy.execute("""CREATE TABLE raw_hourly_sales_detail (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, sales_date TEXT NOT NULL,
+            hour INTEGER NOT NULL, ssv_response TEXT, item_count INTEGER DEFAULT 0,
+            collected_at TEXT NOT NULL, UNIQUE(sales_date, hour))""")
+        legacy.executemany(
+            "INSERT INTO raw_hourly_sales_detail (sales_date, hour, ssv_response, collected_at) "
+            "VALUES ('2026-03-01', ?, ?, ?)",
+            [(hour, _ssv(rows=50, seed=hour % 3), NOW) for hour in range(9)],
+        )
+        legacy.commit()
+        legacy.close()
+
+        repo = HourlySalesDetailRepository(db_path=db, store_id="99999")
+        assert repo.get_raw("2026-03-01", 4) == _ssv(rows=50, seed=1)  # 이전 전 평문 조회
+
+        result = repo.compact_raw()
+        assert result["migrated"] == 9 and result["blobs"] == 3
+        assert result["stored_bytes"] * 5 < result["raw_bytes"]
+        assert repo.get_raw("2026-03-01", 4) == _ssv(rows=50, seed=1)
+        assert repo.compact_raw()["migrated"] == 0
+
+    @pytest.mark.unit
+    def test_ddl_runs_once_per_db(self, repo, monkeypatch):
+        repo.save_raw("2026-03-07", 1, _ssv(), 3)
+        calls = []
+        original = repo._get_conn
+        monkeypatch.setattr(repo, "_get_conn", lambda: calls.append(1) or original())
+        repo.save_raw("2026-03-07", 2, _ssv(), 3)
+        repo.get_collected_hours("2026-03-07")
+        assert len(calls) == 2  # 저장/조회 연결만, ensure_table 연결 없음
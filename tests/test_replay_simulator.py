@@ -0,0 +1,233 @@
+"""ReplaySimulator (bayesian-replay) 테스트
+
+- daily_avg_days별 일평균 = PreOrderEvaluator 공식 (달력일 - 확인 품절일), 캐시 재사용
+- 결정 매트릭스 = PreOrderEvaluator 공용 decide_by_matrix (행 단위 판정과 동일) / 입수 올림 / 안전재고일 → 폐기·품절 방향성
+- 프로세스 풀 병렬 평가 = 순차 평가
+- BayesianParameterOptimizer 목적함수 연동 (데이터 부족 시 감도 추정 폴백),
+  리플레이가 읽지 않는 파라미터는 탐색 공간에서 제외
+"""
+
+import random
+import sqlite3
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.prediction import bayesian_optimizer as bo
+from src.prediction.eval_config import EvalConfig
+from src.prediction.pre_order_evaluator import EvalDecision, decide_by_matrix
+from src.prediction.product_attributes import ProductAttributeStore
+from src.prediction.replay_simulator import (
+    FORCE, REPLAY_EVAL_PARAMS, SKIP, URGENT, ReplayDataset, ReplaySimulator,
+)
+
+STORE = "46513"
+END = datetime(2026, 3, 15)
+
+# item_cd: (mid_cd, 평균 판매, 입수, 유통기한)
+ITEMS = {
+    "D1": ("001", 4, 1, 1),    # 도시락 (ultra_short)
+    "S1": ("004", 3, 1, 2),    # 샌드위치 (short)
+    "B1": ("049", 6, 6, 180),  # 맥주 (입수 6)
+    "R1": ("015", 1, 1, 90),   # 저회전 과자
+}
+
+
+@pytest.fixture
+def store_conn():
+    rng = random.Random(3)
+    conn = sqlite3.connect(":memory:")
+    conn.execute("""CREATE TABLE daily_sales (
+        store_id TEXT, item_cd TEXT, sales_date TEXT, sale_qty INTEGER, stock_qty INTEGER)""")
+    conn.execute("""CREATE TABLE eval_outcomes (
+        store_id TEXT, eval_date TEXT, item_cd TEXT, mid_cd TEXT, current_stock INTEGER,
+        pending_qty INTEGER, actual_sold_qty INTEGER, was_stockout INTEGER, daily_avg REAL)""")
+    for item_cd, (mid_cd, mean, _, _) in ITEMS.items():
+        for back in range(1, 60):
+            day = (END - timedelta(days=back)).strftime("%Y-%m-%d")
+            qty = max(0, int(rng.gauss(mean, 1.5)))
+            stock = 0 if rng.random() < 0.1 else rng.randint(1, 10)
+            conn.execute("INSERT INTO daily_sales VALUES (?, ?, ?, ?, ?)",
+                         (STORE, item_cd, day, qty, stock))
+            if back <= 14:
+                conn.execute(
+                    "INSERT INTO eval_outcomes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (STORE, day, item_cd, mid_cd, rng.randint(0, 6), rng.randint(0, 2),
+                     qty, int(stock == 0), float(mean)),
+                )
+    # 다른 매장 / 미검증 행은 제외
+    conn.execute("INSERT INTO eval_outcomes VALUES ('99999', '2026-03-10', 'D1', '001', 1, 0, 1, 0, 1.0)")
+    conn.execute("INSERT INTO eval_outcomes VALUES (?, '2026-03-14', 'X1', '001', 1, 0, NULL, 0, 1.0)",
+                 (STORE,))
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def dataset(store_conn):
+    attributes = ProductAttributeStore.from_rows(
+        (item_cd, expiry, unit, None, None, None, None)
+        for item_cd, (_, _, unit, expiry) in ITEMS.items()
+    )
+    return ReplayDataset.load(store_conn, STORE, 14, end_date=END, attributes=attributes)
+
+
+@pytest.fixture
+def simulator(dataset):
+    return ReplaySimulator(dataset, EvalConfig())
+
+
+class TestDataset:
+
+    @pytest.mark.unit
+    def test_rows_and_daily_avg_formula(self, store_conn, dataset, simulator):
+        assert len(dataset) == 14 * len(ITEMS)
+        assert dataset.item_codes == sorted(ITEMS)
+
+        # 2026-03-10 B1: 직전 14일 판매합 / (14 - stock_qty=0 일수)
+        rows = store_conn.execute(
+            "SELECT sale_qty, stock_qty FROM daily_sales WHERE item_cd = 'B1' "
+            "AND sales_date >= '2026-02-24' AND sales_date < '2026-03-10'"
+        ).fetchall()
+        available = 14 - sum(1 for _, stock in rows if stock == 0)
+        expected = sum(q for q, _ in rows) / (available if available >= 3 else 14)
+
+        avg, norm = simulator._daily_avg(14)
+        row = [
+            i for i in range(len(dataset))
+            if dataset.item_codes[dataset.row_item[i]] == "B1"
+            and dataset.row_col[i] == (datetime(2026, 3, 10) - (END - timedelta(days=14 + 31))).days
+        ][0]
+        assert avg[row] == pytest.approx(expected)
+        assert 0.0 <= norm.min() and norm.max() == pytest.approx(1.0)
+        assert list(dataset.order_unit[dataset.row_item == dataset.item_codes.index("B1")]) == [6.0] * 14
+
+
+class TestEvaluate:
+
+    @pytest.mark.unit
+    def test_defaults_and_avg_cache(self, simulator):
+        base = simulator.evaluate({})
+        assert simulator.evaluate({"eval.daily_avg_days": 14.0}) == base
+        assert set(simulator._avg_cache) == {14}
+        simulator.evaluate({"eval.daily_avg_days": 21.0})
+        assert set(simulator._avg_cache) == {14, 21}
+        assert base["sample_count"] == 14 * len(ITEMS)
+        assert 0.0 <= base["accuracy_rate"] <= 1.0
+
+    @pytest.mark.unit
+    def test_decision_matrix(self, simulator, dataset):
+        params = dict(simulator.base_params)
+        decision, avg = simulator.decide(params)
+        assert (decision[dataset.stock <= 0] != URGENT).all()
+        assert set(decision[(dataset.stock <= 0) & (avg >= 0.3)]) <= {FORCE}
+
+        # 충분 임계값을 매우 낮추면 저인기 SKIP 증가, 긴급 임계값 상향 → URGENT 증가
+        params.update({"eval.exposure_sufficient": 0.01, "eval.exposure_normal": 0.005,
+                       "eval.exposure_urgent": 0.001})
+        relaxed, _ = simulator.decide(params)
+        assert (relaxed == SKIP).sum() >= (decision == SKIP).sum()
+        params.update({"eval.exposure_urgent": 50.0, "eval.exposure_normal": 60.0})
+        eager, _ = simulator.decide(params)
+        assert (eager == URGENT).sum() >= (decision == URGENT).sum()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("overrides", [
+        {},
+        {"eval.exposure_urgent": 2.5, "eval.exposure_normal": 1.0, "eval.exposure_sufficient": 0.5},
+        {"eval.stockout_freq_threshold": 0.0, "eval.daily_avg_days": 7.0},
+    ])
+    def test_decision_matches_shared_matrix(self, simulator, dataset, overrides):
+        params = dict(simulator.base_params, **overrides)
+        decision, avg = simulator.decide(params)
+        score_level = simulator._popularity_level(
+            np.round(np.clip(
+                (params["eval.weight_daily_avg"] * simulator._daily_avg(
+                    int(params["eval.daily_avg_days"]))[1]
+                 + params["eval.weight_sell_day_ratio"] * simulator.sell_day_ratio
+                 + params["eval.weight_trend"] * simulator.norm_trend)
+                / (params["eval.weight_daily_avg"] + params["eval.weight_sell_day_ratio"]
+                   + params["eval.weight_trend"]), 0.0, 1.0), 4),
+            params,
+        )
+        codes = list(EvalDecision)
+        for i in range(len(dataset)):
+            exposure = ((dataset.stock[i] + dataset.pending[i]) / avg[i]) if avg[i] > 0 else 999.0
+            expected, _ = decide_by_matrix(
+                dataset.stock[i], exposure, ("low", "medium", "high")[score_level[i]],
+                simulator.stockout_freq[i],
+                params["eval.exposure_urgent"], params["eval.exposure_normal"],
+                params["eval.exposure_sufficient"], params["eval.stockout_freq_threshold"],
+                daily_avg=avg[i], mid_cd=dataset.mid_codes[dataset.row_mid[i]],
+                sell_day_ratio=simulator.sell_day_ratio[i],
+            )
+            assert codes[decision[i]] == expected
+
+    @pytest.mark.unit
+    def test_food_safety_days_trade_waste_for_stockout(self, simulator):
+        lean = simulator.evaluate({"food.ultra_short_safety_days": 0.0,
+                                   "food.short_safety_days": 0.0})
+        rich = simulator.evaluate({"food.ultra_short_safety_days": 3.0,
+                                   "food.short_safety_days": 3.0})
+        assert rich["waste_rate"] > lean["waste_rate"]
+        assert rich["stockout_rate"] <= lean["stockout_rate"]
+
+    @pytest.mark.unit
+    def test_process_pool_matches_sequential(self, simulator):
+        candidates = [
+            {"eval.exposure_urgent": 0.5 + 0.2 * i, "food.short_safety_days": 0.3 * i}
+            for i in range(4)
+        ]
+        sequential = simulator.evaluate_many(candidates)
+        with simulator.start_pool(2):
+            assert simulator.workers == 2
+            assert simulator.evaluate_many(candidates) == sequential
+        assert simulator.workers == 1
+
+
+class TestOptimizerObjective:
+
+    @pytest.mark.unit
+    def test_objective_uses_replay(self, simulator):
+        optimizer = bo.BayesianParameterOptimizer(store_id=STORE, config=EvalConfig())
+        optimizer._simulator = simulator
+        names = ["food.ultra_short_safety_days"]
+        expected = optimizer._calculate_objective(simulator.evaluate({names[0]: 2.0}))
+        assert optimizer._objective([2.0], names, {}) == pytest.approx(expected)
+        assert optimizer._objective_many([[2.0], [0.1]], names, {})[0] == pytest.approx(expected)
+
+    @pytest.mark.unit
+    def test_search_space_limited_to_replay_params(self, simulator):
+        optimizer = bo.BayesianParameterOptimizer(store_id=STORE, config=EvalConfig())
+        optimizer._skopt = None
+        optimizer._optuna = object()
+        _, full = optimizer._build_search_space()
+        assert "eval.target_accuracy" in full
+
+        optimizer._simulator = simulator
+        _, names = optimizer._build_search_space()
+        eval_names = {n[len("eval."):] for n in names if n.startswith("eval.")}
+        assert eval_names == REPLAY_EVAL_PARAMS - {"weight_trend"}
+        assert {"eval.target_accuracy", "eval.calibration_decay",
+                "eval.calibration_reversion_rate"}.isdisjoint(names)
+        assert [n for n in names if n.startswith("food.")] == [
+            n for n in full if n.startswith("food.")
+        ]
+
+    @pytest.mark.unit
+    def test_insufficient_rows_fall_back_to_estimate(self, store_conn, tmp_path):
+        db = tmp_path / "store.db"
+        store_conn.execute("ATTACH DATABASE ? AS dst", (str(db),))
+        for table in ("daily_sales", "eval_outcomes"):
+            store_conn.execute(f"CREATE TABLE dst.{table} AS SELECT * FROM {table}")
+        store_conn.commit()
+
+        optimizer = bo.BayesianParameterOptimizer(store_id="00000", config=EvalConfig())
+        with patch.object(bo.BayesianParameterOptimizer, "sales_repo") as repo:
+            repo._get_conn.side_effect = lambda: sqlite3.connect(str(db))
+            assert optimizer._build_replay_simulator() is None  # 해당 매장 검증 행 없음
+            optimizer.store_id = STORE
+            with patch.object(bo, "REPLAY_LOOKBACK_DAYS", 400):
+                assert isinstance(optimizer._build_replay_simulator(), ReplaySimulator)
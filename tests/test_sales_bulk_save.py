@@ -0,0 +1,190 @@
+"""
+save_daily_sales 일괄 저장 경로 테스트 (bulk-daily-sales)
+
+bulk=True 경로가 상품별 순차 upsert 경로와 동일한 DB 상태/통계를 만드는지 검증:
+- daily_sales / products / mid_categories / realtime_inventory
+- 폐기 추적 파이프라인 (order_tracking FIFO, inventory_batches 차감/자동생성)
+- 신규/업데이트 건수
+"""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.database.repos.sales_repo import SalesRepository
+
+FIXED_NOW = "2026-03-01T00:00:00"
+STORE_ID = "46513"
+
+_MASTER_TABLES = [
+    """CREATE TABLE IF NOT EXISTS products (
+        item_cd TEXT PRIMARY KEY, item_nm TEXT, mid_cd TEXT,
+        created_at TEXT, updated_at TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS mid_categories (
+        mid_cd TEXT PRIMARY KEY, mid_nm TEXT, created_at TEXT, updated_at TEXT
+    )""",
+]
+
+_DAILY_SALES_DDL = """CREATE TABLE IF NOT EXISTS daily_sales (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    store_id TEXT, collected_at TEXT NOT NULL, sales_date TEXT NOT NULL,
+    item_cd TEXT NOT NULL, mid_cd TEXT NOT NULL,
+    sale_qty INTEGER DEFAULT 0, ord_qty INTEGER DEFAULT 0,
+    buy_qty INTEGER DEFAULT 0, disuse_qty INTEGER DEFAULT 0,
+    stock_qty INTEGER DEFAULT 0, created_at TEXT NOT NULL,
+    promo_type TEXT DEFAULT '',
+    UNIQUE({unique})
+)"""
+
+_EXTRA_TABLES = [
+    """CREATE TABLE IF NOT EXISTS realtime_inventory (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        store_id TEXT, item_cd TEXT NOT NULL, item_nm TEXT,
+        stock_qty INTEGER DEFAULT 0, pending_qty INTEGER DEFAULT 0,
+        order_unit_qty INTEGER DEFAULT 1, is_available INTEGER DEFAULT 1,
+        is_cut_item INTEGER DEFAULT 0,
+        queried_at TEXT NOT NULL, created_at TEXT NOT NULL,
+        UNIQUE(store_id, item_cd)
+    )""",
+    """CREATE TABLE IF NOT EXISTS order_tracking (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        store_id TEXT, order_date TEXT, item_cd TEXT, item_nm TEXT, mid_cd TEXT,
+        delivery_type TEXT, order_qty INTEGER, remaining_qty INTEGER,
+        status TEXT, created_at TEXT, updated_at TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS inventory_batches (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        item_cd TEXT NOT NULL, item_nm TEXT, mid_cd TEXT,
+        receiving_date TEXT NOT NULL, receiving_id INTEGER,
+        expiration_days INTEGER NOT NULL, expiry_date TEXT NOT NULL,
+        initial_qty INTEGER NOT NULL, remaining_qty INTEGER NOT NULL,
+        status TEXT DEFAULT 'active',
+        created_at TEXT NOT NULL, updated_at TEXT NOT NULL,
+        store_id TEXT, delivery_type TEXT DEFAULT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS product_details (
+        item_cd TEXT PRIMARY KEY, expiration_days INTEGER
+    )""",
+]
+
+
+def _make_db(path, unique="sales_date, item_cd"):
+    conn = sqlite3.connect(str(path))
+    conn.execute(_DAILY_SALES_DDL.format(unique=unique))
+    for ddl in _MASTER_TABLES + _EXTRA_TABLES:
+        conn.execute(ddl)
+    # 001(도시락) 상품: 유통기한 1일 → 입고 증분 시 배치 자동생성
+    conn.execute("INSERT OR REPLACE INTO product_details VALUES ('A001', 1)")
+    conn.execute("INSERT OR REPLACE INTO product_details VALUES ('B001', 30)")
+    conn.executemany(
+        "INSERT INTO order_tracking (store_id, order_date, item_cd, remaining_qty, status) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [(STORE_ID, "2026-02-27", "A001", 3, "arrived"),
+         (STORE_ID, "2026-02-28", "A001", 5, "ordered")],
+    )
+    conn.executemany(
+        "INSERT INTO inventory_batches (store_id, item_cd, receiving_date, expiration_days, "
+        "expiry_date, initial_qty, remaining_qty, status, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, 'active', ?, ?)",
+        [(STORE_ID, "B001", "2026-02-20", 30, "2026-03-22", 4, 4, FIXED_NOW, FIXED_NOW),
+         (STORE_ID, "B001", "2026-02-25", 30, "2026-03-27", 6, 6, FIXED_NOW, FIXED_NOW)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def _item(item_cd, mid_cd, sale, buy, stock, nm=None, mid_nm="중분류"):
+    return {
+        "ITEM_CD": item_cd, "ITEM_NM": nm or f"상품{item_cd}",
+        "MID_CD": mid_cd, "MID_NM": mid_nm,
+        "SALE_QTY": sale, "ORD_QTY": 0, "BUY_QTY": buy,
+        "DISUSE_QTY": 0, "STOCK_QTY": stock,
+    }
+
+
+def _dump(path):
+    conn = sqlite3.connect(str(path))
+    try:
+        return {
+            table: conn.execute(f"SELECT * FROM {table} ORDER BY 1, 2").fetchall()
+            for table in ("daily_sales", "products", "mid_categories",
+                          "realtime_inventory", "order_tracking", "inventory_batches")
+        }
+    finally:
+        conn.close()
+
+
+@pytest.fixture(params=["sales_date, item_cd", "store_id, sales_date, item_cd"])
+def db_pair(tmp_path, request):
+    """(순차 경로 DB, 일괄 경로 DB) — 두 가지 UNIQUE 스키마 모두 검증"""
+    row_db = tmp_path / "row.db"
+    bulk_db = tmp_path / "bulk.db"
+    _make_db(row_db, request.param)
+    _make_db(bulk_db, request.param)
+    return row_db, bulk_db
+
+
+def _save_both(db_pair, data, sales_date):
+    results = []
+    with patch.object(SalesRepository, "_now", return_value=FIXED_NOW):
+        for db_path, bulk in zip(db_pair, (False, True)):
+            repo = SalesRepository(db_path=db_path)
+            results.append(repo.save_daily_sales(
+                data, sales_date, store_id=STORE_ID,
+                collected_at=FIXED_NOW, enable_validation=False, bulk=bulk,
+            ))
+    return results
+
+
+class TestBulkSaveParity:
+    def test_first_save_matches_row_path(self, db_pair):
+        data = [
+            _item("A001", "001", 4, 6, 2),
+            _item("B001", "015", 3, 0, 7),
+            _item("C001", "015", 0, 0, 0),
+            _item("", "015", 1, 0, 0),   # 스킵
+        ]
+        row_stats, bulk_stats = _save_both(db_pair, data, "2026-03-01")
+        assert row_stats == bulk_stats == {"total": 3, "new": 3, "updated": 0}
+        bulk_dump = _dump(db_pair[1])
+        assert _dump(db_pair[0]) == bulk_dump
+        # FR-03: A001 입고 6 → 배치 자동생성, FR-01.5: B001 판매 3 → 배치 FIFO 차감
+        batches = {(r[1], r[4]): r[9] for r in bulk_dump["inventory_batches"]}
+        assert batches[("A001", "2026-03-01")] == 6
+        assert batches[("B001", "2026-02-20")] == 1
+
+    def test_resave_applies_only_increments(self, db_pair):
+        _save_both(db_pair, [_item("A001", "001", 4, 6, 2), _item("B001", "015", 3, 0, 7)],
+                   "2026-03-01")
+        data = [
+            _item("A001", "001", 6, 6, 0, nm="새이름"),   # 판매 +2
+            _item("B001", "015", 3, 2, 9),               # 입고 +2 (배치 중복 체크)
+            _item("D001", "016", 1, 0, 0),               # 신규
+        ]
+        row_stats, bulk_stats = _save_both(db_pair, data, "2026-03-01")
+        assert row_stats == bulk_stats == {"total": 3, "new": 1, "updated": 2}
+        assert _dump(db_pair[0]) == _dump(db_pair[1])
+
+        # FIFO: A001 order_tracking 3+5에서 판매 4 → 6 누적 차감
+        conn = sqlite3.connect(str(db_pair[1]))
+        remaining = [r[0] for r in conn.execute(
+            "SELECT remaining_qty FROM order_tracking WHERE item_cd='A001' ORDER BY order_date")]
+        conn.close()
+        assert remaining == [0, 2]
+
+    def test_duplicate_items_last_value_wins(self, db_pair):
+        data = [
+            _item("A001", "001", 1, 0, 5, mid_nm="구이름"),
+            _item("A001", "001", 2, 0, 5, mid_nm="새이름"),
+        ]
+        row_stats, bulk_stats = _save_both(db_pair, data, "2026-03-02")
+        assert row_stats == bulk_stats == {"total": 2, "new": 1, "updated": 1}
+        row_dump, bulk_dump = _dump(db_pair[0]), _dump(db_pair[1])
+        for table in ("daily_sales", "products", "mid_categories", "order_tracking"):
+            assert row_dump[table] == bulk_dump[table]
+
+    def test_empty_input(self, db_pair):
+        row_stats, bulk_stats = _save_both(db_pair, [], "2026-03-03")
+        assert row_stats == bulk_stats == {"total": 0, "new": 0, "updated": 0}
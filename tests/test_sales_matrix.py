@@ -0,0 +1,293 @@
+"""SalesMatrix (columnar-predict-batch) 테스트
+
+- 매트릭스 조회 결과가 기존 SKU별 SQL 조회와 동일한지 검증
+- PredictionDataProvider 배치 캐시 로드/해제
+- 매트릭스 범위 밖 요청은 DB 폴백
+"""
+
+import sqlite3
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src.prediction.base_predictor import BasePredictor
+from src.prediction.data_provider import PredictionDataProvider
+from src.prediction.sales_matrix import SalesMatrix
+
+STORE_ID = "46513"
+
+
+def _sqlite_today(conn) -> date:
+    return date.fromisoformat(conn.execute("SELECT date('now')").fetchone()[0])
+
+
+@pytest.fixture
+def matrix_db(tmp_path):
+    db_file = tmp_path / "matrix.db"
+    conn = sqlite3.connect(str(db_file))
+    conn.executescript("""
+        CREATE TABLE daily_sales (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            item_cd TEXT NOT NULL,
+            sales_date TEXT NOT NULL,
+            sale_qty INTEGER DEFAULT 0,
+            stock_qty INTEGER,
+            mid_cd TEXT,
+            store_id TEXT DEFAULT '46513',
+            UNIQUE(item_cd, sales_date)
+        );
+        CREATE TABLE products (item_cd TEXT PRIMARY KEY, item_nm TEXT, mid_cd TEXT);
+        CREATE TABLE product_details (
+            item_cd TEXT PRIMARY KEY, expiration_days INTEGER, order_unit_qty INTEGER,
+            sell_price INTEGER, margin_rate REAL, lead_time_days INTEGER,
+            orderable_day TEXT, large_cd TEXT
+        );
+    """)
+    today = _sqlite_today(conn)
+    rows = []
+    # A: 120일 연속 판매 (매트릭스 윈도우보다 긴 이력), 품절/미수집 섞임
+    for i in range(0, 120):
+        d = (today - timedelta(days=i)).isoformat()
+        stock = None if i % 11 == 0 else (0 if i % 5 == 0 else 3)
+        rows.append(("A", d, (i * 7) % 4, stock))
+    # B: 간헐 판매 (3일에 한 번만 레코드)
+    for i in range(1, 40, 3):
+        rows.append(("B", (today - timedelta(days=i)).isoformat(), i % 2, 2))
+    # C: 다른 매장 데이터만 존재
+    conn.executemany(
+        "INSERT INTO daily_sales (item_cd, sales_date, sale_qty, stock_qty) VALUES (?,?,?,?)",
+        rows,
+    )
+    conn.execute(
+        "INSERT INTO daily_sales (item_cd, sales_date, sale_qty, stock_qty, store_id) "
+        "VALUES ('C', ?, 5, 5, '99999')", ((today - timedelta(days=1)).isoformat(),)
+    )
+    conn.executemany("INSERT INTO products VALUES (?,?,?)", [
+        ("A", "상품A", "015"), ("B", "상품B", "032"),
+    ])
+    conn.execute(
+        "INSERT INTO product_details VALUES ('A', 30, 6, 1500, 30.0, 0, NULL, '01')"
+    )
+    conn.commit()
+    conn.close()
+    return str(db_file)
+
+
+def _provider(db_path):
+    return PredictionDataProvider(db_path=db_path, store_id=STORE_ID, use_db_inventory=False)
+
+
+class TestSalesMatrixParity:
+    """매트릭스 조회 == 기존 SQL 조회"""
+
+    @pytest.mark.parametrize("days", [1, 7, 31, 60, 90])
+    def test_sales_history_matches_sql(self, matrix_db, days):
+        sql = _provider(matrix_db)
+        batch = _provider(matrix_db)
+        batch.load_batch_caches(["A", "B", "C", "Z"])
+        for item_cd in ("A", "B", "C", "Z"):
+            assert batch.get_sales_history(item_cd, days) == sql.get_sales_history(item_cd, days)
+
+    def test_data_span_matches_sql(self, matrix_db):
+        sql = _provider(matrix_db)
+        batch = _provider(matrix_db)
+        batch.load_batch_caches(["A", "B", "C", "Z"])
+        for item_cd in ("A", "B", "C", "Z"):
+            assert batch._get_data_span_days(item_cd) == sql._get_data_span_days(item_cd)
+
+    def test_product_info_matches_sql(self, matrix_db):
+        sql = _provider(matrix_db)
+        batch = _provider(matrix_db)
+        batch.load_batch_caches(["A", "B", "Z"])
+        for item_cd in ("A", "B", "Z"):
+            assert batch.get_product_info(item_cd) == sql.get_product_info(item_cd)
+
+    def test_product_info_returns_copy(self, matrix_db):
+        batch = _provider(matrix_db)
+        batch.load_batch_caches(["A"])
+        batch.get_product_info("A")["mid_cd"] = "999"
+        assert batch.get_product_info("A")["mid_cd"] == "015"
+
+    @pytest.mark.parametrize("days", [7, 60])
+    def test_base_predictor_history_and_ratio(self, matrix_db, days):
+        sql = BasePredictor(_provider(matrix_db), None, STORE_ID)
+        batch_data = _provider(matrix_db)
+        batch_data.load_batch_caches(["A", "B"])
+        batch = BasePredictor(batch_data, None, STORE_ID)
+        for item_cd in ("A", "B"):
+            assert batch._get_daily_sales_history(item_cd, days) == \
+                sql._get_daily_sales_history(item_cd, days)
+            assert batch._calculate_available_sell_ratio(item_cd) == \
+                sql._calculate_available_sell_ratio(item_cd)
+
+
+class TestSalesMatrixBounds:
+
+    def test_out_of_window_returns_none(self, matrix_db):
+        conn = sqlite3.connect(matrix_db)
+        matrix = SalesMatrix.load(conn, STORE_ID, ["A"], days=30)
+        conn.close()
+        assert matrix.sales_history("A", 31) is None
+        assert matrix.daily_sales_history("A", 60) is None
+        assert matrix.sales_history("A", 30) is not None
+        assert matrix.sales_history("Z", 7) is None
+
+    def test_provider_falls_back_beyond_window(self, matrix_db):
+        sql = _provider(matrix_db)
+        batch = _provider(matrix_db)
+        batch.load_batch_caches(["A"], days=30)
+        assert batch.get_sales_history("A", 45) == sql.get_sales_history("A", 45)
+
+    def test_vectorized_ratios_shape(self, matrix_db):
+        conn = sqlite3.connect(matrix_db)
+        matrix = SalesMatrix.load(conn, STORE_ID, ["A", "B", "Z"])
+        conn.close()
+        ratios = matrix.available_sell_ratios(7)
+        assert ratios.shape == (3,)
+        assert ratios[2] == 1.0  # 데이터 없음 → 1.0
+
+    def test_clear_batch_caches(self, matrix_db):
+        batch = _provider(matrix_db)
+        batch.load_batch_caches(["A"])
+        assert batch.sales_matrix is not None
+        batch.clear_batch_caches()
+        assert batch.sales_matrix is None
+        assert batch._product_cache is None
+
+
+class _PromoData:
+    """행사 기간만 제공하는 데이터 제공자 스텁"""
+
+    def __init__(self, periods):
+        self.periods = periods
+
+    def get_promo_dates_in_range(self, item_cd, dates):
+        spans = self.periods.get(item_cd, [])
+        return {d for d in dates if any(s <= d <= e for s, e in spans)}
+
+
+def _random_window(seed, n_rows=300, n_days=7):
+    """품절/미수집/음수 재고, 이상치, 0 판매가 섞인 정수 판매 윈도우"""
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, 6, size=(n_rows, 1))
+    sale = np.maximum(base + rng.integers(-2, 3, size=(n_rows, n_days)), 0).astype(float)
+    spikes = rng.random((n_rows, n_days)) < 0.08
+    sale[spikes] += rng.integers(10, 60, size=spikes.sum())
+    sale[rng.random(n_rows) < 0.1] = 0.0
+    stock = rng.choice([np.nan, -1.0, 0.0, 1.0, 3.0, 8.0], size=(n_rows, n_days),
+                       p=[0.12, 0.04, 0.2, 0.2, 0.24, 0.2])
+    stock[rng.random(n_rows) < 0.1] = 0.0  # 윈도우 전체 품절
+    today = date(2026, 3, 10)
+    dates = [(today - timedelta(days=j + 1)).isoformat() for j in range(n_days)]
+    mids = list(rng.choice(["001", "012", "015", "049", "072", "032", None], size=n_rows))
+    codes = [f"I{k:04d}" for k in range(n_rows)]
+    return dates, sale, stock, mids, codes
+
+
+class TestWeightedAverageBatch:
+    """calculate_weighted_averages == 행별 calculate_weighted_average (비트 단위)"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("n_days", [3, 7, 14])
+    @pytest.mark.parametrize("stockout_enabled", [True, False])
+    def test_matches_scalar(self, monkeypatch, n_days, stockout_enabled):
+        from src.prediction import base_predictor as bp
+
+        monkeypatch.setitem(bp.PREDICTION_PARAMS, "stockout_filter",
+                            {**bp.PREDICTION_PARAMS.get("stockout_filter", {}),
+                             "enabled": stockout_enabled})
+        monkeypatch.setitem(bp.PREDICTION_PARAMS, "holiday_wma_correction",
+                            {"enabled": True, "holiday_weight_factor": 0.3})
+        dates, sale, stock, mids, codes = _random_window(n_days, n_days=n_days)
+        holiday = set(dates[1:3])
+        periods = {cd: [(dates[-1], dates[n_days // 2])] for cd in codes[::4]}
+        predictor = BasePredictor(
+            _PromoData(periods), None, STORE_ID,
+            holiday_context_fn=lambda d: {"in_period": d in holiday},
+        )
+
+        averages, days = predictor.calculate_weighted_averages(dates, sale, stock, mids, codes)
+        for k, item_cd in enumerate(codes):
+            history = [
+                (d, int(sale[k, j]), None if np.isnan(stock[k, j]) else int(stock[k, j]))
+                for j, d in enumerate(dates)
+            ]
+            expected = predictor.calculate_weighted_average(
+                history, clean_outliers=True, mid_cd=mids[k], item_cd=item_cd
+            )
+            assert (float(averages[k]), int(days[k])) == expected, item_cd
+
+    @pytest.mark.unit
+    def test_clean_sales_matrix_matches_clean_sales_data(self):
+        from src.prediction.utils.outlier_handler import (
+            clean_sales_data, clean_sales_matrix, get_outlier_config,
+        )
+
+        _, sale, _, mids, _ = _random_window(7, n_days=10)
+        sale[::3, 4] += 0.5  # imputation 결과 같은 실수값
+        multipliers = np.array([get_outlier_config(m or "")["multiplier"] for m in mids])
+        cleaned = clean_sales_matrix(sale, multipliers)
+        for k in range(len(mids)):
+            expected = clean_sales_data(sale[k].tolist(), mid_cd=mids[k]).cleaned_data
+            assert cleaned[k].tolist() == expected
+
+    @pytest.mark.unit
+    def test_load_wma_batch_used_by_compute(self, matrix_db):
+        data = _provider(matrix_db)
+        data.load_batch_caches(["A", "B", "Z"])
+        predictor = BasePredictor(data, None, STORE_ID)
+        predictor.load_wma_batch(["A", "B", "Z"])
+        assert set(predictor._wma_batch) == {"A", "B"}  # Z: 상품 정보 없음 → 개별 계산
+        for item_cd in ("A", "B"):
+            product = data.get_product_info(item_cd)
+            history = data.get_sales_history(item_cd, 7)
+            expected = predictor.calculate_weighted_average(
+                history, clean_outliers=True, mid_cd=product["mid_cd"], item_cd=item_cd
+            )
+            assert predictor._wma_batch[item_cd] == expected + (product["mid_cd"],)
+        predictor.clear_wma_batch()
+        assert predictor._wma_batch == {}
+
+
+class TestDateLevelCoefficients:
+    """날짜·중분류 계수 묶음: predict_batch 중 중분류당 1회, 그 외엔 매번 계산"""
+
+    def _predictor(self):
+        from unittest.mock import MagicMock
+
+        from src.prediction.improved_predictor import ImprovedPredictor
+
+        p = ImprovedPredictor.__new__(ImprovedPredictor)
+        p._coef_memo = {}
+        p._date_coef_memo = None
+        p._food_weekday_cache = {}
+        p._coef = MagicMock()
+        p._coef.get_precipitation_coefficient.return_value = 0.9
+        p._coef.get_sky_condition_coefficient.return_value = 1.0
+        p._coef.get_dust_coefficient.return_value = 1.0
+        p._get_holiday_coefficient = MagicMock(return_value=1.1)
+        p._get_weather_coefficient = MagicMock(return_value=1.05)
+        return p
+
+    @pytest.mark.unit
+    def test_memoized_per_category_in_batch(self, monkeypatch):
+        from datetime import datetime
+
+        from src.prediction import improved_predictor as ip
+
+        calls = []
+        monkeypatch.setattr(ip, "get_weekday_coefficient",
+                            lambda mid, wd: calls.append(mid) or 1.2)
+        p = self._predictor()
+        target = datetime(2026, 3, 11)
+        single = p._date_level_coefficients(target, "2026-03-11", "015", 3, 10.0)
+        p._date_level_coefficients(target, "2026-03-11", "015", 3, 10.0)
+        assert calls == ["015", "015"]  # 배치 밖: 매번 계산
+
+        p._date_coef_memo = {}
+        for mid in ("015", "015", "032", "015"):
+            bundle = p._date_level_coefficients(target, "2026-03-11", mid, 3, 10.0)
+        assert calls == ["015", "015", "015", "032"]
+        assert bundle == single
+        assert single[1] == 1.05 * 0.9 and single[4] == 1.2
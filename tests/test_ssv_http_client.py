@@ -0,0 +1,333 @@
+"""SsvHttpClient + BGF 대역 서버 (ssv-http-client) 테스트
+
+- 캡처 재생: 경로별 응답, body 파라미터 매칭, 미등록 경로 404
+- keep-alive 연결 재사용 / 세션 쿠키 전송 / Set-Cookie 반영
+- 요청별 재시도 (503, 타임아웃), 응답 도착 즉시 on_result 호출
+- 응답 형식 오류 (상태줄/Content-Length/압축/charset) → 요청별 실패 결과 (배치 중단 없음)
+- Direct 페처 배치 조회가 http_client 설정 시 브라우저 없이 동일 결과,
+  HTTP 전량 실패 시 브라우저 JS fetch 폴백
+"""
+
+import socket
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.collectors.bgf_standin_server import (
+    BgfStandInServer,
+    load_capture_fixtures,
+    parse_ssv_params,
+)
+from src.collectors.direct_api_fetcher import DirectApiFetcher
+from src.collectors.direct_popup_fetcher import DirectPopupFetcher
+from src.collectors.direct_sales_fetcher import DirectSalesFetcher
+from src.collectors.ssv_http_client import HttpResult, SsvHttpClient, http_client_for_driver
+from src.collectors.ssv_parser import RS, US
+
+SEARCH_TEMPLATE = f"SSV:utf-8{RS}strItemCd=TEMPLATE{RS}strOrdYmd=20260301{RS}Dataset:dsIn{RS}"
+
+
+def _item_ssv(item_cd: str) -> str:
+    """/stbj030/selSearch 응답 (dsItem 1행)"""
+    return RS.join([
+        "SSV:UTF-8",
+        "ErrorCode:string=0",
+        "Dataset:dsItem",
+        US.join(["_RowType_", "ITEM_CD:string(13)", "ITEM_NM:string(40)",
+                 "NOW_QTY:bigdecimal(5)", "ORD_UNIT_QTY:bigdecimal(5)", "EXPIRE_DAY:bigdecimal(3)"]),
+        US.join(["N", item_cd, f"상품{item_cd[-3:]}", str(int(item_cd[-2:])), "6", "30"]),
+        "",
+    ])
+
+
+class _RawServer:
+    """요청마다 고정 바이트 응답 후 연결을 닫는 TCP 서버 (형식 오류 재현용)"""
+
+    def __init__(self, response: bytes):
+        self.response = response
+        self.requests = 0
+        self._sock = socket.socket()
+        self._sock.bind(("127.0.0.1", 0))
+        self._sock.listen(16)
+        self.base_url = "http://127.0.0.1:%d" % self._sock.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            with conn:
+                data = b""
+                while b"\r\n\r\n" not in data:
+                    chunk = conn.recv(65536)
+                    if not chunk:
+                        break
+                    data += chunk
+                self.requests += 1
+                conn.sendall(self.response)
+
+    def close(self):
+        self._sock.close()
+
+
+@pytest.fixture
+def server():
+    with BgfStandInServer() as srv:
+        srv.route(
+            '/stbj030/selSearch',
+            lambda body: _item_ssv(parse_ssv_params(body)['strItemCd']),
+        )
+        yield srv
+
+
+@pytest.fixture
+def client(server):
+    return SsvHttpClient(
+        server.base_url, cookies={'JSESSIONID': 'abc'}, concurrency=4,
+        timeout_ms=2000, backoff_ms=10,
+    )
+
+
+class TestStandInServer:
+
+    @pytest.mark.unit
+    def test_capture_fixtures_replayed(self, client):
+        fixtures = load_capture_fixtures()
+        assert {'/stmb011/selSearch', '/stmb011/selDetailSearch',
+                '/stbjz00/selItemDetailSearch'} <= set(fixtures)
+
+        result = client.post('/stmb011/selSearch', 'SSV:utf-8')
+        assert result.ok and result.text == fixtures['/stmb011/selSearch'][0][1]
+        assert client.post('/unknown/path', 'x').status == 404
+
+    @pytest.mark.unit
+    def test_body_params_pick_matching_capture(self, tmp_path):
+        (tmp_path / "cap.json").write_text(
+            '{"phase": [{"url": "https://h/a/sel", "method": "POST",'
+            ' "bodyPreview": "SSV:utf-8\\u001estrMidCd=001", "responsePreview": "R001"},'
+            ' {"url": "https://h/a/sel", "method": "POST",'
+            ' "bodyPreview": "SSV:utf-8\\u001estrMidCd=002", "responsePreview": "R002"}]}',
+            encoding='utf-8',
+        )
+        with BgfStandInServer(captures_dir=tmp_path) as srv:
+            c = SsvHttpClient(srv.base_url)
+            assert c.post('/a/sel', f"SSV:utf-8{RS}strMidCd=002").text == "R002"
+            assert c.post('/a/sel', f"SSV:utf-8{RS}strMidCd=001").text == "R001"
+            # 일치 없음 → 순환
+            texts = {c.post('/a/sel', f"strMidCd=999").text for _ in range(2)}
+            assert texts == {"R001", "R002"}
+
+
+class TestClient:
+
+    @pytest.mark.unit
+    def test_keep_alive_pool_and_cookies(self, server, client):
+        streamed = []
+        results = client.post_many(
+            [(i, '/stmb011/selDetailSearch', f"SSV:utf-8{RS}strMidCd={i:03d}") for i in range(40)],
+            on_result=lambda r: streamed.append(r.key),
+        )
+        assert len(results) == 40 and all(r.ok for r in results)
+        assert sorted(streamed) == list(range(40))
+        assert server.request_count == 40
+        assert server.connection_count <= client.concurrency
+        assert server.last_cookies == {'JSESSIONID': 'abc'}
+
+    @pytest.mark.unit
+    def test_retry_on_503(self, server, client):
+        server.inject_failures(2)
+        result = client.post('/stmb011/selSearch', 'x')
+        assert result.ok and result.attempts == 3
+
+        server.inject_failures(1)
+        no_retry = SsvHttpClient(server.base_url, retries=0)
+        result = no_retry.post('/stmb011/selSearch', 'x')
+        assert not result.ok and result.status == 503 and result.error == "HTTP 503"
+
+    @pytest.mark.unit
+    def test_timeout_is_per_request_error(self, server):
+        server.latency_ms = 300
+        slow = SsvHttpClient(server.base_url, timeout_ms=50, retries=1, backoff_ms=1)
+        result = slow.post('/stmb011/selSearch', 'x')
+        assert not result.ok and result.attempts == 2 and result.error
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("response", [
+        b"garbage\r\n\r\n",
+        b"HTTP/1.1 abc OK\r\nContent-Length: 0\r\n\r\n",
+        b"HTTP/1.1 200 OK\r\nContent-Length: abc\r\n\r\n",
+        b"HTTP/1.1 200 OK\r\nContent-Encoding: deflate\r\nContent-Length: 3\r\n\r\nxyz",
+        b"HTTP/1.1 200 OK\r\nContent-Type: text/plain; charset=bogus\r\n"
+        b"Content-Length: 2\r\n\r\nhi",
+    ])
+    def test_malformed_response_is_per_request_error(self, response):
+        raw = _RawServer(response)
+        try:
+            client = SsvHttpClient(raw.base_url, concurrency=2, retries=1, backoff_ms=1)
+            streamed = []
+            results = client.post_many(
+                [(i, '/stbj030/selSearch', 'x') for i in range(3)],
+                on_result=streamed.append,
+            )
+        finally:
+            raw.close()
+        assert sorted(r.key for r in results) == [0, 1, 2] and len(streamed) == 3
+        assert all(not r.ok and r.attempts == 2 for r in results)
+        assert all(r.error.startswith("응답 형식 오류") for r in results)
+        assert raw.requests == 6
+
+    @pytest.mark.unit
+    def test_set_cookie_updates_session(self):
+        client = SsvHttpClient("https://store.bgfretail.com", cookies={'JSESSIONID': 'old'})
+        client._store_cookie("JSESSIONID=new; Path=/; HttpOnly")
+        assert client.cookies == {'JSESSIONID': 'new'}
+        assert client.port == 443 and client.headers['Origin'] == "https://store.bgfretail.com"
+
+    @pytest.mark.unit
+    def test_from_driver_and_setting_gate(self, monkeypatch):
+        driver = MagicMock()
+        driver.current_url = "https://store.bgfretail.com/websrc/deploy/index.html"
+        driver.get_cookies.return_value = [{'name': 'JSESSIONID', 'value': 's1'}]
+        driver.execute_script.return_value = "UA/1.0"
+
+        client = SsvHttpClient.from_driver(driver, concurrency=3)
+        assert client.base_url == "https://store.bgfretail.com"
+        assert client.cookies == {'JSESSIONID': 's1'}
+        assert client.headers['User-Agent'] == "UA/1.0"
+
+        import src.settings.constants as constants
+        monkeypatch.setattr(constants, 'DIRECT_API_HTTP_CLIENT', False)
+        assert http_client_for_driver(driver) is None
+        monkeypatch.setattr(constants, 'DIRECT_API_HTTP_CLIENT', True)
+        assert isinstance(http_client_for_driver(driver), SsvHttpClient)
+
+
+class TestFetchersOverHttp:
+
+    @pytest.mark.unit
+    def test_direct_api_batch_without_browser(self, client):
+        driver = MagicMock()
+        fetcher = DirectApiFetcher(driver, concurrency=4, http_client=client)
+        fetcher.set_request_template(SEARCH_TEMPLATE)
+        codes = [f"88010000000{i:02d}" for i in range(1, 31)]
+
+        results = fetcher.fetch_items_batch(codes, delay_ms=0)
+        assert set(results) == set(codes)
+        assert results[codes[4]]['current_stock'] == 5
+        assert results[codes[4]]['order_unit_qty'] == 6
+        driver.execute_script.assert_not_called()
+
+    @pytest.mark.unit
+    def test_sales_detail_batch_from_captures(self, client):
+        fetcher = DirectSalesFetcher(MagicMock(), http_client=client)
+        fetcher.set_templates(
+            f"SSV:utf-8{RS}strFromYmd={RS}strToYmd={RS}strGubun=0",
+            f"SSV:utf-8{RS}strFromYmd={RS}strToYmd={RS}strMidCd=__MID_CD__",
+        )
+        items = fetcher.fetch_all_categories_detail(
+            "20260301", [{'MID_CD': '001', 'MID_NM': '도시락'}, {'MID_CD': '002', 'MID_NM': '주먹밥'}],
+            delay_ms=0,
+        )
+        assert items and {it['MID_CD'] for it in items} == {'001', '002'}
+        assert all(it['ITEM_CD'] for it in items)
+        fetcher.driver.execute_script.assert_not_called()
+
+    @pytest.mark.unit
+    def test_popup_batch_requests_ord_after_detail(self, server, client):
+        ord_ssv = RS.join([
+            "SSV:UTF-8", "Dataset:dsItemDetailOrd",
+            US.join(["_RowType_", "ITEM_CD:string(13)", "ORD_ADAY:string(7)"]),
+            US.join(["N", "X", "1111111"]), "",
+        ])
+        server.route('/stbjz00/selItemDetailSearch', lambda body: (
+            "" if parse_ssv_params(body)['strItemCd'] == 'BAD' else _item_ssv("88010000000" + "07")
+        ))
+        server.route('/stbjz00/selItemDetailOrd', ord_ssv)
+        fetcher = DirectPopupFetcher(MagicMock(), http_client=client)
+        fetcher.set_templates(SEARCH_TEMPLATE, SEARCH_TEMPLATE)
+
+        results = fetcher.fetch_items_batch(['A1', 'BAD', 'A2'], delay_ms=0)
+        assert set(results) == {'A1', 'A2'}
+        assert results['A1']['ord']['ORD_ADAY'] == "1111111"
+        assert server.request_count == 3 + 2  # 상세 3건 + 성공 2건 ord
+
+
+class _DeadHttpClient:
+    """검증 요청은 성공, 배치 요청은 전량 연결 실패하는 HTTP 클라이언트"""
+
+    def __init__(self, probe_text=""):
+        self.probe_text = probe_text
+
+    def post(self, path, body):
+        return HttpResult(key=path, status=200, text=self.probe_text)
+
+    def post_many(self, requests, on_result=None, delay_ms=0):
+        results = [HttpResult(key=key, error="connection refused") for key, _, _ in requests]
+        for r in results:
+            on_result(r)
+        return results
+
+
+def _js_batch(script, *args):
+    """브라우저 JS fetch 대역: 배치 스크립트면 바코드별 정상 응답"""
+    if "hasItem" in script:
+        return {"status": 200, "ok": True, "len": 500, "hasItem": True, "snippet": ""}
+    return [{"barcode": cd, "ok": True, "status": 200, "text": _item_ssv(cd)} for cd in args[1]]
+
+
+class TestHttpFallbackToJs:
+
+    @pytest.mark.unit
+    def test_direct_api_batch_falls_back_when_all_http_fail(self):
+        driver = MagicMock()
+        driver.execute_script.side_effect = _js_batch
+        codes = [f"88010000000{i:02d}" for i in range(1, 6)]
+        fetcher = DirectApiFetcher(
+            driver, http_client=_DeadHttpClient(_item_ssv(codes[0]) + "x" * 100)
+        )
+        fetcher.set_request_template(SEARCH_TEMPLATE)
+
+        results = fetcher.fetch_items_batch(codes, delay_ms=0)
+        assert set(results) == set(codes)
+        assert fetcher.http_client is None
+        assert driver.execute_script.call_count == 1
+
+    @pytest.mark.unit
+    def test_direct_api_probe_without_response_uses_js(self):
+        raw = _RawServer(b"garbage\r\n\r\n")
+        try:
+            driver = MagicMock()
+            driver.execute_script.side_effect = _js_batch
+            client = SsvHttpClient(raw.base_url, retries=0)
+            fetcher = DirectApiFetcher(driver, http_client=client)
+            fetcher.set_request_template(SEARCH_TEMPLATE)
+            codes = ["8801000000011", "8801000000012"]
+
+            results = fetcher.fetch_items_batch(codes, delay_ms=0)
+        finally:
+            raw.close()
+        assert set(results) == set(codes)
+        assert fetcher.http_client is None and fetcher._request_template
+        assert raw.requests == 1 and driver.execute_script.call_count == 2
+
+    @pytest.mark.unit
+    def test_sales_and_popup_fall_back_to_js(self):
+        sales = DirectSalesFetcher(MagicMock(), http_client=_DeadHttpClient())
+        sales.set_templates(
+            f"SSV:utf-8{RS}strFromYmd={RS}strToYmd={RS}strGubun=0",
+            f"SSV:utf-8{RS}strFromYmd={RS}strToYmd={RS}strMidCd=__MID_CD__",
+        )
+        sales.driver.execute_script.return_value = []
+        sales.fetch_all_categories_detail("20260301", [{'MID_CD': '001', 'MID_NM': ''}], delay_ms=0)
+        assert sales.http_client is None
+        sales.driver.execute_script.assert_called_once()
+
+        popup = DirectPopupFetcher(MagicMock(), http_client=_DeadHttpClient())
+        popup.set_templates(SEARCH_TEMPLATE, SEARCH_TEMPLATE)
+        popup.driver.execute_script.return_value = []
+        popup.fetch_items_batch(['A1'], delay_ms=0)
+        assert popup.http_client is None
+        popup.driver.execute_script.assert_called_once()
@@ -0,0 +1,243 @@
+"""
+단일 패스 SSV 파서 테스트 (single-pass-ssv)
+
+- parse_ssv(): 데이터셋/변수 분리, 타입 접미사, tuple 행
+- 기존 다중 분할 파서와의 결과 동일성
+- Dataset 경계(빈 레코드 없이 연속되는 데이터셋) 처리
+"""
+
+from array import array
+
+from src.collectors.ssv_parser import (
+    RS, US,
+    SsvDataset,
+    find_dataset,
+    parse_ssv,
+)
+from src.collectors.direct_api_fetcher import (
+    extract_item_data,
+    parse_full_ssv_response,
+    parse_ssv_dataset,
+)
+from src.collectors.direct_frame_fetcher import parse_all_datasets
+from src.collectors.direct_sales_fetcher import (
+    parse_sales_detail_response,
+    parse_sales_list_response,
+)
+
+
+# ═══════════════════════════════════════════════════════════════
+# 테스트 SSV 데이터
+# ═══════════════════════════════════════════════════════════════
+
+SELSEARCH_SSV = (
+    f"SSV:UTF-8{RS}"
+    f"ErrorCode:string=0{RS}"
+    f"ErrorMsg:string=SUCCESS{RS}"
+    f"Dataset:dsItem{RS}"
+    f"_RowType_{US}ITEM_CD:STRING(256){US}ITEM_NM:STRING(256){US}"
+    f"NOW_QTY:INT(256){US}ORD_UNIT_QTY:INT(256){US}EXPIRE_DAY:INT(256){RS}"
+    f"N{US}8801001{US}테스트상품{US}10{US}6{US}3{RS}"
+    f"Dataset:dsOrderSale{RS}"
+    f"_RowType_{US}ORD_YMD:STRING(8){US}ITEM_CD:STRING(256){US}ORD_QTY:INT(256){US}"
+    f"BUY_QTY:INT(256){US}SALE_QTY:INT(256){US}DISUSE_QTY:bigdecimal(5){RS}"
+    f"N{US}20260225{US}8801001{US}6{US}6{US}5{US}0{RS}"
+    f"N{US}20260226{US}8801001{US}{US}0{US}3{US}1.0{RS}"
+    f"Dataset:dsWeek{RS}"
+    f"_RowType_{US}ORD_YMD:STRING(8){RS}"
+    f"N{US}20260225{RS}"
+    f"N{US}20260226{RS}"
+    f"Dataset:gdList{RS}"
+    f"_RowType_{US}ITEM_CD:STRING(256){US}MONTH_EVT:STRING(20){US}NEXT_MONTH_EVT:STRING(20){US}"
+    f"CUT_ITEM_YN:STRING(1){US}HQ_MAEGA_SET:STRING(10){US}PROFIT_RATE:STRING(10){RS}"
+    f"N{US}8801001{US}1+1{US}{US}0{US}1500{US}25.5{RS}"
+    f"{RS}"
+)
+
+
+def _legacy_parse_ssv_dataset(ssv_text, dataset_marker):
+    """변경 전 parse_ssv_dataset (마커마다 RS 재분할) - 동일성 비교용"""
+    if not ssv_text:
+        return None
+    records = ssv_text.split(RS)
+    for i, record in enumerate(records):
+        if '_RowType_' in record and dataset_marker in record:
+            columns = [c.split(':')[0] for c in record.split(US)]
+            rows = []
+            for j in range(i + 1, len(records)):
+                row_text = records[j].strip()
+                if not row_text or '_RowType_' in row_text or row_text.startswith('Dataset:'):
+                    break
+                rows.append(row_text.split(US))
+            return {'columns': columns, 'rows': rows}
+    return None
+
+
+# ═══════════════════════════════════════════════════════════════
+# parse_ssv
+# ═══════════════════════════════════════════════════════════════
+
+class TestParseSsv:
+    def test_all_datasets_in_order(self):
+        resp = parse_ssv(SELSEARCH_SSV)
+        assert [ds.name for ds in resp.datasets] == ['dsItem', 'dsOrderSale', 'dsWeek', 'gdList']
+
+    def test_variables(self):
+        resp = parse_ssv(SELSEARCH_SSV)
+        assert resp.variables['ErrorCode'] == '0'
+        assert resp.variables['ErrorMsg'] == 'SUCCESS'
+
+    def test_rows_are_tuples(self):
+        ds = parse_ssv(SELSEARCH_SSV).dataset('dsOrderSale')
+        assert len(ds) == 2
+        assert all(isinstance(r, tuple) for r in ds.rows)
+
+    def test_column_types_from_suffix(self):
+        ds = parse_ssv(SELSEARCH_SSV).dataset('dsOrderSale')
+        assert ds.column_type('ORD_YMD') == 'STRING'
+        assert ds.column_type('ORD_QTY') == 'INT'
+        assert ds.column_type('DISUSE_QTY') == 'BIGDECIMAL'
+        assert ds.column_type('_RowType_') == 'STRING'
+
+    def test_typed_columns(self):
+        ds = parse_ssv(SELSEARCH_SSV).dataset('dsOrderSale')
+        ord_qty = ds.column('ORD_QTY')
+        assert isinstance(ord_qty, array) and ord_qty.typecode == 'q'
+        assert list(ord_qty) == [6, 0]  # 빈값 → 0
+        disuse = ds.column('DISUSE_QTY')
+        assert disuse.typecode == 'd'
+        assert list(disuse) == [0.0, 1.0]
+        assert ds.column('ORD_YMD') == ['20260225', '20260226']
+
+    def test_missing_column(self):
+        ds = parse_ssv(SELSEARCH_SSV).dataset('dsWeek')
+        assert ds.index('NOPE') == -1
+        assert list(ds.ints('NOPE')) == [0, 0]
+        assert ds.strings('NOPE', 'x') == ['x', 'x']
+
+    def test_header_only_dataset_is_truthy(self):
+        ssv = f"Dataset:dsItem{RS}_RowType_{US}ITEM_NM:STRING(256){RS}{RS}"
+        ds = parse_ssv(ssv).dataset('dsItem')
+        assert ds is not None
+        assert bool(ds) is True
+        assert len(ds) == 0
+
+    def test_empty(self):
+        assert not parse_ssv('')
+        assert not parse_ssv(None)
+        assert find_dataset('', 'ITEM_NM') is None
+
+    def test_unnamed_header(self):
+        """Dataset 마커 없이 헤더만 오는 응답도 파싱"""
+        ssv = f"_RowType_{US}A:String{US}B:String{RS}N{US}1{US}2"
+        resp = parse_ssv(ssv)
+        assert resp.datasets[0].name is None
+        assert resp.find('A').rows == [('N', '1', '2')]
+
+    def test_find_exclude(self):
+        resp = parse_ssv(SELSEARCH_SSV)
+        assert resp.find('ORD_YMD').name == 'dsOrderSale'
+        assert resp.find('ORD_YMD', exclude='ORD_QTY').name == 'dsWeek'
+
+    def test_dict_conversion(self):
+        ds = parse_ssv(SELSEARCH_SSV).dataset('dsItem')
+        row = ds.first_dict()
+        assert row['ITEM_NM'] == '테스트상품'
+        assert row['NOW_QTY'] == '10'
+        assert ds.dicts() == [row]
+
+    def test_legacy_access(self):
+        ds = parse_ssv(SELSEARCH_SSV).dataset('dsItem')
+        assert ds['columns'] is ds.columns
+        assert ds['rows'] is ds.rows
+        assert ds.get('nope') is None
+        legacy = SsvDataset.from_legacy({'columns': ['A', 'B'], 'rows': [['1', '2']]})
+        assert legacy.value(0, 'B') == '2'
+
+
+# ═══════════════════════════════════════════════════════════════
+# 기존 파서와의 동일성
+# ═══════════════════════════════════════════════════════════════
+
+class TestLegacyParity:
+    def test_parse_ssv_dataset_matches_legacy(self):
+        for marker in ['ITEM_NM', 'ORD_QTY', 'MONTH_EVT', 'ORD_YMD', 'NOPE']:
+            new = parse_ssv_dataset(SELSEARCH_SSV, marker)
+            old = _legacy_parse_ssv_dataset(SELSEARCH_SSV, marker)
+            if old is None:
+                assert new is None
+                continue
+            assert new['columns'] == old['columns']
+            assert [list(r) for r in new['rows']] == old['rows']
+
+    def test_dataset_boundary_without_blank_record(self):
+        """dsOrderSale 바로 뒤에 Dataset:dsWeek가 와도 행에 섞이지 않음"""
+        ds = parse_ssv_dataset(SELSEARCH_SSV, 'ORD_QTY')
+        assert len(ds['rows']) == 2
+        assert all(not r[0].startswith('Dataset:') for r in ds['rows'])
+
+    def test_parse_all_datasets(self):
+        datasets = parse_all_datasets(SELSEARCH_SSV)
+        assert set(datasets) == {'dsItem', 'dsOrderSale', 'dsWeek', 'gdList'}
+        assert len(datasets['dsWeek']['rows']) == 2
+
+
+# ═══════════════════════════════════════════════════════════════
+# 호출측 (extract_item_data, 매출 파서)
+# ═══════════════════════════════════════════════════════════════
+
+class TestCallers:
+    def test_full_response_single_pass(self):
+        parsed = parse_full_ssv_response(SELSEARCH_SSV)
+        assert set(parsed) == {'dsItem', 'dsOrderSale', 'gdList', 'dsWeek'}
+
+    def test_extract_item_data(self):
+        data = extract_item_data(parse_full_ssv_response(SELSEARCH_SSV), '8801001')
+        assert data['success'] is True
+        assert data['item_nm'] == '테스트상품'
+        assert data['current_stock'] == 10
+        assert data['order_unit_qty'] == 6
+        assert data['expiration_days'] == 3
+        assert data['history'][1] == {
+            'date': '20260226', 'item_cd': '8801001',
+            'ord_qty': 0, 'buy_qty': 0, 'sale_qty': 3, 'disuse_qty': 1,
+        }
+        # dsOrderSale이 먼저 와도 dsWeek를 찾음
+        assert data['week_dates'] == ['20260225', '20260226']
+        assert data['current_month_promo'] == '1+1'
+        assert data['sell_price'] == '1500'
+
+    def test_extract_item_data_legacy_dict(self):
+        """레거시 {'columns', 'rows'} 입력도 처리"""
+        parsed = {
+            'dsItem': {
+                'columns': ['_RowType_', 'ITEM_CD', 'ITEM_NM', 'NOW_QTY'],
+                'rows': [['N', '8801001', '상품', '4']],
+            },
+        }
+        data = extract_item_data(parsed, '8801001')
+        assert data['current_stock'] == 4
+        assert data['order_unit_qty'] is None
+
+    def test_sales_parsers(self):
+        list_ssv = (
+            f"Dataset:dsList{RS}"
+            f"_RowType_{US}MID_CD:STRING(3){US}MID_NM:STRING(20){US}"
+            f"SALE_QTY:INT(10){US}SALE_AMT:INT(10){US}RATE:STRING(10){RS}"
+            f"N{US}001{US}도시락{US}12{US}54000{US}3.2{RS}"
+        )
+        cats = parse_sales_list_response(list_ssv)
+        assert cats == [{'MID_CD': '001', 'MID_NM': '도시락', 'SALE_QTY': 12,
+                         'SALE_AMT': 54000, 'RATE': '3.2'}]
+
+        detail_ssv = (
+            f"Dataset:dsDetail{RS}"
+            f"_RowType_{US}ITEM_CD:STRING(256){US}ITEM_NM:STRING(256){US}"
+            f"SALE_QTY:INT(256){US}ORD_QTY:INT(256){RS}"
+            f"N{US}8801001{US}상품{US}3{US}2{RS}"
+        )
+        items = parse_sales_detail_response(detail_ssv, '001', '도시락')
+        assert items[0]['ITEM_CD'] == '8801001'
+        assert items[0]['SALE_QTY'] == 3
+        assert items[0]['ORD_QTY'] == 2
+        assert items[0]['STOCK_QTY'] == 0